@@ -0,0 +1,136 @@
+#include <chrono>
+#include <iomanip>
+#include <iostream>
+#include <random>
+#include <string>
+
+#include "../include/GMGPolar/gmgpolar.h"
+#include "../include/Residual/ResidualGive/residualGive.h"
+#include "../include/Residual/ResidualTake/residualTake.h"
+#include "../include/Smoother/SmootherTake/smootherTake.h"
+
+/*
+ * Throughput of the grid kernels on a single level, see benchmark/README.md.
+ *
+ * Usage: kernel_benchmark [threads] [repetitions]
+ *
+ * Every kernel is timed on the grids of the Czarny test case with divideBy2 = 1, ..., 4.
+ * The floating point operations and the compulsory memory traffic per node are counted on the interior circle rows,
+ * so the operational intensity and GFLOP/s can be placed in scripts/roofline_model/roofline_model.py.
+ */
+
+namespace
+{
+struct KernelModel {
+    std::string name;
+    // Floating point operations of the interior stencil of one node.
+    double flops_per_node;
+    // Compulsory traffic of one node: the doubles read and written once, with write allocate.
+    double bytes_per_node;
+};
+
+Vector<double> randomVector(const int size, const unsigned int seed)
+{
+    Vector<double> x("x", size);
+    std::mt19937 gen(seed);
+    std::uniform_real_distribution<double> dist(-100.0, 100.0);
+    for (int i = 0; i < size; i++) {
+        x(i) = dist(gen);
+    }
+    return x;
+}
+
+// Average wall time of one call, after one untimed warm-up call.
+template <typename Kernel>
+double secondsPerCall(const int repetitions, const Kernel& kernel)
+{
+    kernel();
+    const auto start = std::chrono::high_resolution_clock::now();
+    for (int i = 0; i < repetitions; i++) {
+        kernel();
+    }
+    const auto end = std::chrono::high_resolution_clock::now();
+    return std::chrono::duration<double>(end - start).count() / repetitions;
+}
+
+void printResult(const KernelModel& model, const PolarGrid& grid, const double seconds)
+{
+    const double nodes = grid.numberOfNodes();
+    std::cout << std::left << std::setw(24) << model.name << std::right << std::setw(7) << grid.nr() << " x "
+              << std::left << std::setw(7) << grid.ntheta() << std::right << std::fixed << std::setprecision(3)
+              << std::setw(12) << seconds * 1e3 << std::setw(12) << seconds * 1e9 / nodes << std::setw(10)
+              << model.flops_per_node * nodes / seconds * 1e-9 << std::setw(10)
+              << model.bytes_per_node * nodes / seconds * 1e-9 << std::setw(8)
+              << model.flops_per_node / model.bytes_per_node << "\n";
+}
+} // namespace
+
+int main(int argc, char* argv[])
+{
+    Kokkos::ScopeGuard kokkos_scope(argc, argv);
+
+    const int threads     = argc > 1 ? std::stoi(argv[1]) : omp_get_max_threads();
+    const int repetitions = argc > 2 ? std::stoi(argv[2]) : 20;
+    omp_set_num_threads(threads);
+
+    const double R0         = 1e-5;
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    const CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    const ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+
+    const bool DirBC_Interior = false;
+
+    // Residual: 8 flops for the spacing coefficients, 4 for beta, 5 for each of the four axial and 4 for each of
+    // the four diagonal neighbors, 1 for rhs - A*x. Traffic: x, rhs, arr, att, art, detDF, coeff_beta and result.
+    const KernelModel residual_give{"ResidualGive", 49.0, 9 * sizeof(double)};
+    const KernelModel residual_take{"ResidualTake", 49.0, 9 * sizeof(double)};
+    // The fused restriction adds about 4 flops per fine node and only writes the coarse residual.
+    const KernelModel restricted_residual_take{"RestrictedResidualTake", 53.0, 7.5 * sizeof(double)};
+    // A_sc^ortho: 4 flops for the spacing coefficients, 4 for each of the two axial and the four diagonal
+    // neighbors, 1 for rhs - A*x, and 5 for the LDL^T substitution. Traffic: x, rhs, arr, att, art and the two
+    // factors read, temp and x written.
+    const KernelModel smoother_take{"SmootherTake", 34.0, 11 * sizeof(double)};
+
+    std::cout << "Threads: " << threads << ", repetitions: " << repetitions << "\n";
+    std::cout << std::left << std::setw(24) << "Kernel" << std::right << std::setw(17) << "Grid" << std::setw(12)
+              << "ms/call" << std::setw(12) << "ns/node" << std::setw(10) << "GFLOP/s" << std::setw(10) << "GB/s"
+              << std::setw(8) << "FLOP/B" << "\n";
+
+    for (int divideBy2 = 1; divideBy2 <= 4; divideBy2++) {
+        const PolarGrid grid(R0, Rmax, 5, -1, alpha_jump, 3, divideBy2);
+        const PolarGrid coarse_grid = coarseningGrid(grid);
+        // "Take" requires cached values
+        const LevelCache level_cache(grid, coefficients, domain_geometry, true, true);
+
+        const int n              = grid.numberOfNodes();
+        const Vector<double> x   = randomVector(n, 42);
+        const Vector<double> rhs = randomVector(n, 69);
+        Vector<double> result("result", n);
+        Vector<double> coarse_result("coarse_result", coarse_grid.numberOfNodes());
+
+        const ResidualGive give(grid, level_cache, domain_geometry, coefficients, DirBC_Interior, threads);
+        printResult(residual_give, grid, secondsPerCall(repetitions, [&] {
+                        give.computeResidual(result, rhs, x);
+                    }));
+
+        const ResidualTake take(grid, level_cache, domain_geometry, coefficients, DirBC_Interior, threads);
+        printResult(residual_take, grid, secondsPerCall(repetitions, [&] {
+                        take.computeResidual(result, rhs, x);
+                    }));
+        printResult(restricted_residual_take, grid, secondsPerCall(repetitions, [&] {
+                        take.computeRestrictedResidual(coarse_grid, coarse_result, rhs, x, false);
+                    }));
+
+        SmootherTake smoother(grid, level_cache, domain_geometry, coefficients, DirBC_Interior, threads);
+        Vector<double> solution("solution", n);
+        Kokkos::deep_copy(solution, x);
+        printResult(smoother_take, grid, secondsPerCall(repetitions, [&] {
+                        smoother.smoothing(solution, rhs, result);
+                    }));
+    }
+    return 0;
+}
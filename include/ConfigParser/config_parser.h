@@ -4,6 +4,7 @@
 #include <string>
 #include <stdexcept>
 #include <memory>
+#include <vector>
 
 #include "../../include/ConfigParser/cmdline.h"
 #include "../../include/common/global_definitions.h"
@@ -27,16 +28,26 @@ public:
     const BoundaryConditions& boundaryConditions() const;
     const SourceTerm& sourceTerm() const;
     const ExactSolution& exactSolution() const;
+    // Test case options (geometry, problem, coefficients, grid) with their command line keys, see writeReport().
+    const std::vector<ReportSetting>& problemSettings() const;
 
     // Control Parameters
     int verbose() const;
     bool paraview() const;
+    ParaviewFormat paraviewFormat() const;
+    // Path of the JSON run report, empty if no report is requested.
+    const std::string& report() const;
     int maxOpenMPThreads() const;
     double threadReductionFactor() const;
+    bool autotuneThreads() const;
+    // Path of the thread tuning cache, empty if the autotuned threads are not cached.
+    const std::string& threadTuningCache() const;
     bool DirBC_Interior() const;
     StencilDistributionMethod stencilDistributionMethod() const;
     bool cacheDensityProfileCoefficients() const;
     bool cacheDomainGeometry() const;
+    bool mixedPrecision() const;
+    bool memoryLean() const;
 
     const PolarGrid& grid() const;
 
@@ -49,10 +60,13 @@ public:
     int preSmoothingSteps() const;
     int postSmoothingSteps() const;
     MultigridCycleType multigridCycle() const;
+    OuterSolverType outerSolver() const;
+    int FGMRES_restart() const;
     int maxIterations() const;
     ResidualNormType residualNormType() const;
     std::optional<double> absoluteTolerance() const;
     std::optional<double> relativeTolerance() const;
+    bool fusedConvergenceCheck() const;
 
 private:
     // Parse command-line arguments to extract problem configuration
@@ -63,17 +77,24 @@ private:
     std::unique_ptr<const BoundaryConditions> boundary_conditions_;
     std::unique_ptr<const SourceTerm> source_term_;
     std::unique_ptr<const ExactSolution> exact_solution_;
+    std::vector<ReportSetting> problem_settings_;
     // General solver output and visualization settings
     int verbose_;
     bool paraview_;
+    ParaviewFormat paraview_format_;
+    std::string report_;
     // Parallelization and threading settings
     int max_omp_threads_;
     double thread_reduction_factor_;
+    bool autotune_threads_;
+    std::string thread_tuning_cache_;
     // Numerical method setup
     bool DirBC_Interior_;
     StencilDistributionMethod stencil_distribution_method_;
     bool cache_density_profile_coefficients_;
     bool cache_domain_geometry_;
+    bool mixed_precision_;
+    bool memory_lean_;
     // Grid configuration
     PolarGrid grid_;
     // Multigrid settings
@@ -85,11 +106,15 @@ private:
     bool FMG_;
     int FMG_iterations_;
     MultigridCycleType FMG_cycle_;
+    // Outer solver settings
+    OuterSolverType outer_solver_;
+    int FGMRES_restart_;
     // Iterative solver controls
     int max_iterations_;
     ResidualNormType residual_norm_type_;
     std::optional<double> absolute_tolerance_;
     std::optional<double> relative_tolerance_;
+    bool fused_convergence_check_;
 
     void selectTestCase(GeometryType geometry_type, ProblemType problem_type, AlphaCoeff alpha_type,
                         BetaCoeff beta_type, double Rmax, double kappa_eps, double delta_e, double alpha_jump);
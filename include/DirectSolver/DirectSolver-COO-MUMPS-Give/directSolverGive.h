@@ -13,11 +13,18 @@ public:
     explicit DirectSolverGive(const PolarGrid& grid, const LevelCache& level_cache,
                               const DomainGeometry& domain_geometry,
                               const DensityProfileCoefficients& density_profile_coefficients, bool DirBC_Interior,
-                              int num_omp_threads);
+                              int num_omp_threads, SetupReader* setup_reader = nullptr);
 
     ~DirectSolverGive() override;
     // Note: The rhs (right-hand side) vector gets overwritten during the solution process.
     void solveInPlace(Vector<double> solution) override;
+    // Solves all columns with one MUMPS call (nrhs = number_of_columns).
+    void solveInPlaceBatch(Vector<double> solution, const int number_of_columns) override;
+
+    void refactorize() override;
+    std::size_t memoryUsage() const override;
+
+    void saveSetup(SetupWriter& writer) override;
 
 private:
     // Solver matrix and MUMPS solver structure
@@ -61,6 +68,10 @@ private:
     // Converts to 1-based indexing.
     void initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
 
+    // Repeats only the numerical factorization for new matrix values with an unchanged sparsity pattern.
+    // Converts to 1-based indexing.
+    void refactorizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
+
     // Adjusts the right-hand side vector for symmetry corrections.
     // This modifies the system from
     //    A * solution = rhs
@@ -73,7 +84,8 @@ private:
     void applySymmetryShiftOuterBoundary(Vector<double> x) const;
 
     // Solves the adjusted system symmetric(matrixA) * solution = rhs using the MUMPS solver.
-    void solveWithMumps(Vector<double> solution);
+    // The first number_of_columns columns of a batch are solved by one call.
+    void solveWithMumps(Vector<double> solution, const int number_of_columns = 1);
 
     // Finalizes the MUMPS solver, releasing any allocated resources.
     void finalizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver);
@@ -5,6 +5,7 @@
 #ifdef GMGPOLAR_USE_MUMPS
 
     #include "dmumps_c.h"
+    #include "smumps_c.h"
     #include "mpi.h"
 
 class DirectSolverTake : public DirectSolver
@@ -13,16 +14,30 @@ public:
     explicit DirectSolverTake(const PolarGrid& grid, const LevelCache& level_cache,
                               const DomainGeometry& domain_geometry,
                               const DensityProfileCoefficients& density_profile_coefficients, bool DirBC_Interior,
-                              int num_omp_threads);
+                              int num_omp_threads, bool single_precision = false,
+                              SetupReader* setup_reader = nullptr);
 
     ~DirectSolverTake() override;
     // Note: The rhs (right-hand side) vector gets overwritten during the solution process.
     void solveInPlace(Vector<double> solution) override;
+    // Solves all columns with one MUMPS call (nrhs = number_of_columns).
+    void solveInPlaceBatch(Vector<double> solution, const int number_of_columns) override;
+    // Solves with smumps if single_precision was passed to the constructor.
+    void solveInPlaceSinglePrecision(Vector<float> solution) override;
+
+    void refactorize() override;
+    std::size_t memoryUsage() const override;
+
+    void saveSetup(SetupWriter& writer) override;
 
 private:
     // Solver matrix and MUMPS solver structure
     SparseMatrixCOO<double> solver_matrix_;
     DMUMPS_STRUC_C mumps_solver_;
+    // Single precision MUMPS instance of the rounded matrix for solveInPlaceSinglePrecision.
+    const bool single_precision_;
+    SparseMatrixCOO<float> solver_matrix_single_precision_;
+    SMUMPS_STRUC_C mumps_solver_single_precision_;
 
     // clang-format off
     const Stencil stencil_interior_      = {
@@ -60,6 +75,15 @@ private:
     // Initializes the MUMPS solver with the specified matrix.
     // Converts to 1-based indexing.
     void initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
+    void initializeMumpsSolver(SMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<float>& solver_matrix);
+
+    // Repeats only the numerical factorization for new matrix values with an unchanged sparsity pattern.
+    // Converts to 1-based indexing.
+    void refactorizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
+    void refactorizeMumpsSolver(SMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<float>& solver_matrix);
+
+    // Rounds the solver matrix (with 0-based indices) to single precision.
+    static SparseMatrixCOO<float> roundSolverMatrix(const SparseMatrixCOO<double>& solver_matrix);
 
     // Adjusts the right-hand side vector for symmetry corrections.
     // This modifies the system from
@@ -68,15 +92,21 @@ private:
     //    symmetric_DBc(A) * solution = rhs - applySymmetryShift(rhs).
     // The correction modifies the rhs to account for the influence of the Dirichlet boundary conditions,
     // ensuring that the solution at the boundary is correctly adjusted and maintains the required symmetry.
-    void applySymmetryShift(Vector<double> rhs) const;
-    void applySymmetryShiftInnerBoundary(Vector<double> x) const;
-    void applySymmetryShiftOuterBoundary(Vector<double> x) const;
+    template <typename T>
+    void applySymmetryShift(Vector<T> rhs) const;
+    template <typename T>
+    void applySymmetryShiftInnerBoundary(Vector<T> x) const;
+    template <typename T>
+    void applySymmetryShiftOuterBoundary(Vector<T> x) const;
 
     // Solves the adjusted system symmetric(matrixA) * solution = rhs using the MUMPS solver.
-    void solveWithMumps(Vector<double> solution);
+    // The first number_of_columns columns of a batch are solved by one call.
+    void solveWithMumps(Vector<double> solution, const int number_of_columns = 1);
+    void solveWithMumps(Vector<float> solution);
 
     // Finalizes the MUMPS solver, releasing any allocated resources.
     void finalizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver);
+    void finalizeMumpsSolver(SMUMPS_STRUC_C& mumps_solver);
 
     // Returns the total number of non-zero elements in the solver matrix.
     int getNonZeroCountSolverMatrix() const;
@@ -9,11 +9,18 @@ public:
     explicit DirectSolverGiveCustomLU(const PolarGrid& grid, const LevelCache& level_cache,
                                       const DomainGeometry& domain_geometry,
                                       const DensityProfileCoefficients& density_profile_coefficients,
-                                      bool DirBC_Interior, int num_omp_threads);
+                                      bool DirBC_Interior, int num_omp_threads,
+                                      SetupReader* setup_reader = nullptr);
 
     ~DirectSolverGiveCustomLU() override;
     // Note: The rhs (right-hand side) vector gets overwritten with the solution.
     void solveInPlace(Vector<double> solution) override;
+    void solveInPlaceBatch(Vector<double> solution, const int number_of_columns) override;
+
+    void refactorize() override;
+    std::size_t memoryUsage() const override;
+
+    void saveSetup(SetupWriter& writer) override;
 
 private:
     // Solver matrix and solver structure
@@ -8,16 +8,28 @@ public:
     explicit DirectSolverTakeCustomLU(const PolarGrid& grid, const LevelCache& level_cache,
                                       const DomainGeometry& domain_geometry,
                                       const DensityProfileCoefficients& density_profile_coefficients,
-                                      bool DirBC_Interior, int num_omp_threads);
+                                      bool DirBC_Interior, int num_omp_threads, bool single_precision = false,
+                                      SetupReader* setup_reader = nullptr);
 
     ~DirectSolverTakeCustomLU() override;
     // Note: The rhs (right-hand side) vector gets overwritten with the solution.
     void solveInPlace(Vector<double> solution) override;
+    void solveInPlaceBatch(Vector<double> solution, const int number_of_columns) override;
+    // Uses the single precision factorization if single_precision was passed to the constructor.
+    void solveInPlaceSinglePrecision(Vector<float> solution) override;
+
+    void refactorize() override;
+    std::size_t memoryUsage() const override;
+
+    void saveSetup(SetupWriter& writer) override;
 
 private:
     // Solver matrix and solver structure
     SparseMatrixCSR<double> solver_matrix_;
     SparseLUSolver<double> lu_solver_;
+    // Factorization of the rounded matrix for solveInPlaceSinglePrecision.
+    const bool single_precision_;
+    SparseLUSolver<float> lu_solver_single_precision_;
 
     // clang-format off
     const Stencil stencil_interior_      = {
@@ -48,6 +60,7 @@ private:
     // clang-format on
 
     SparseMatrixCSR<double> buildSolverMatrix();
+    void factorizeSinglePrecision();
     void buildSolverMatrixCircleSection(const int i_r, SparseMatrixCSR<double>& solver_matrix);
     void buildSolverMatrixRadialSection(const int i_theta, SparseMatrixCSR<double>& solver_matrix);
 
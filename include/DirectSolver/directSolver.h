@@ -12,6 +12,7 @@ class Level;
 #include "../Level/level.h"
 #include "../PolarGrid/polargrid.h"
 #include "../common/global_definitions.h"
+#include "../common/setup_archive.h"
 #include "../LinearAlgebra/vector.h"
 #include "../LinearAlgebra/vector_operations.h"
 #include "../LinearAlgebra/coo_matrix.h"
@@ -31,6 +32,26 @@ public:
     // Note: The rhs (right-hand side) vector gets overwritten during the solution process.
     virtual void solveInPlace(Vector<double> solution) = 0;
 
+    // Solves the first number_of_columns columns of a batch, whose columns are stored one after another,
+    // see GMGPolar::solve for a batch of right-hand sides. By default every column is solved by solveInPlace(),
+    // the derived classes solve all columns with one pass over their factorization.
+    virtual void solveInPlaceBatch(Vector<double> solution, const int number_of_columns);
+
+    // Coarse solve of the single precision correction cycle, see GMGPolar::mixedPrecision().
+    // By default the rhs is solved in a double precision copy. The Take solvers factorize the
+    // system a second time in single precision if this is requested by their constructor.
+    virtual void solveInPlaceSinglePrecision(Vector<float> solution);
+
+    // Rebuilds the system matrix from the level cache and refactorizes it.
+    virtual void refactorize() = 0;
+
+    // Bytes held by the matrices and factorizations of the coarse solver, including the memory MUMPS reports.
+    virtual std::size_t memoryUsage() const = 0;
+
+    // Writes the factorized matrices to a setup file (see GMGPolar::saveSetup).
+    // The derived classes restore them in their constructor if a SetupReader is passed.
+    virtual void saveSetup(SetupWriter& writer) = 0;
+
 protected:
     const PolarGrid& grid_;
     const LevelCache& level_cache_;
@@ -0,0 +1,26 @@
+#pragma once
+
+#include "../../Stencil/assembledStencil.h"
+#include "../ExtrapolatedSmootherTake/extrapolatedSmootherTake.h"
+
+/* ExtrapolatedSmootherTake whose A_sc^ortho u_sc^ortho products use the coefficients of an AssembledStencil. */
+/* The line solvers are the ones of ExtrapolatedSmootherTake. */
+class ExtrapolatedSmootherAssembled : public ExtrapolatedSmootherTake
+{
+public:
+    explicit ExtrapolatedSmootherAssembled(const PolarGrid& grid, const LevelCache& level_cache,
+                                           const DomainGeometry& domain_geometry,
+                                           const DensityProfileCoefficients& density_profile_coefficients,
+                                           bool DirBC_Interior, int num_omp_threads, const AssembledStencil& stencil,
+                                           SetupReader* setup_reader = nullptr);
+    ~ExtrapolatedSmootherAssembled() override = default;
+
+protected:
+    void applyAscOrthoCircleSection(const int i_r, const SmootherColor smoother_color, ConstVector<double> x,
+                                    ConstVector<double> rhs, Vector<double> temp) override;
+    void applyAscOrthoRadialSection(const int i_theta, const SmootherColor smoother_color, ConstVector<double> x,
+                                    ConstVector<double> rhs, Vector<double> temp) override;
+
+private:
+    const AssembledStencil& stencil_;
+};
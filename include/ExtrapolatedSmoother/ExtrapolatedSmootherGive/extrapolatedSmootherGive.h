@@ -13,12 +13,17 @@ public:
     explicit ExtrapolatedSmootherGive(const PolarGrid& grid, const LevelCache& level_cache,
                                       const DomainGeometry& domain_geometry,
                                       const DensityProfileCoefficients& density_profile_coefficients,
-                                      bool DirBC_Interior, int num_omp_threads);
+                                      bool DirBC_Interior, int num_omp_threads, SetupReader* setup_reader = nullptr);
 
     ~ExtrapolatedSmootherGive() override;
 
     void extrapolatedSmoothing(Vector<double> x, ConstVector<double> rhs, Vector<double> temp) override;
 
+    void refactorize() override;
+    std::size_t memoryUsage() const override;
+
+    void saveSetup(SetupWriter& writer) override;
+
 private:
     void extrapolatedSmoothingSequential(Vector<double> x, ConstVector<double> rhs, Vector<double> temp);
     void extrapolatedSmoothingForLoop(Vector<double> x, ConstVector<double> rhs, Vector<double> temp);
@@ -69,6 +74,9 @@ private:
     void buildAscCircleSection(const int i_r);
     void buildAscRadialSection(const int i_theta);
 
+    void loadSetup(SetupReader& reader);
+    void factorizeTridiagonalSolvers();
+
     void applyAscOrthoCircleSection(const int i_r, const SmootherColor smoother_color, ConstVector<double> x,
                                     ConstVector<double> rhs, Vector<double> temp);
     void applyAscOrthoRadialSection(const int i_theta, const SmootherColor smoother_color, ConstVector<double> x,
@@ -80,6 +88,7 @@ private:
 
 #ifdef GMGPOLAR_USE_MUMPS
     void initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
+    void refactorizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
     void finalizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver);
 #endif
 };
@@ -13,12 +13,24 @@ public:
     explicit ExtrapolatedSmootherTake(const PolarGrid& grid, const LevelCache& level_cache,
                                       const DomainGeometry& domain_geometry,
                                       const DensityProfileCoefficients& density_profile_coefficients,
-                                      bool DirBC_Interior, int num_omp_threads);
+                                      bool DirBC_Interior, int num_omp_threads, SetupReader* setup_reader = nullptr);
 
     ~ExtrapolatedSmootherTake() override;
 
     void extrapolatedSmoothing(Vector<double> x, ConstVector<double> rhs, Vector<double> temp) override;
 
+    void refactorize() override;
+    std::size_t memoryUsage() const override;
+
+    void saveSetup(SetupWriter& writer) override;
+
+protected:
+    // temp = rhs - A_sc^ortho u_sc^ortho on a circle or radial line, overridden by ExtrapolatedSmootherAssembled.
+    virtual void applyAscOrthoCircleSection(const int i_r, const SmootherColor smoother_color, ConstVector<double> x,
+                                            ConstVector<double> rhs, Vector<double> temp);
+    virtual void applyAscOrthoRadialSection(const int i_theta, const SmootherColor smoother_color,
+                                            ConstVector<double> x, ConstVector<double> rhs, Vector<double> temp);
+
 private:
     // The A_sc matrix on i_r = 0 is defined through the COO/CSR matrix
     // 'inner_boundary_circle_matrix_' due to the across-origin treatment.
@@ -66,10 +78,8 @@ private:
     void buildAscCircleSection(const int i_r);
     void buildAscRadialSection(const int i_theta);
 
-    void applyAscOrthoCircleSection(const int i_r, const SmootherColor smoother_color, ConstVector<double> x,
-                                    ConstVector<double> rhs, Vector<double> temp);
-    void applyAscOrthoRadialSection(const int i_theta, const SmootherColor smoother_color, ConstVector<double> x,
-                                    ConstVector<double> rhs, Vector<double> temp);
+    void loadSetup(SetupReader& reader);
+    void factorizeTridiagonalSolvers();
 
     void solveCircleSection(const int i_r, Vector<double> x, Vector<double> temp, Vector<double> solver_storage_1,
                             Vector<double> solver_storage_2);
@@ -77,6 +87,7 @@ private:
 
 #ifdef GMGPOLAR_USE_MUMPS
     void initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
+    void refactorizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
     void finalizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver);
 #endif
 };
@@ -20,6 +20,7 @@ class Level;
 #include "../Level/level.h"
 #include "../Stencil/stencil.h"
 #include "../common/global_definitions.h"
+#include "../common/setup_archive.h"
 
 class ExtrapolatedSmoother
 {
@@ -32,11 +33,27 @@ public:
 
     virtual void extrapolatedSmoothing(Vector<double> x, ConstVector<double> rhs, Vector<double> temp) = 0;
 
+    // Sets the number of OpenMP threads used by subsequent applications (see GMGPolar::autotuneThreads).
+    void numOmpThreads(int num_omp_threads)
+    {
+        num_omp_threads_ = num_omp_threads;
+    }
+
+    // Rebuilds the smoother matrices from the level cache and refactorizes them.
+    virtual void refactorize() = 0;
+
+    // Bytes held by the matrices and factorizations of the smoother, including the memory MUMPS reports.
+    virtual std::size_t memoryUsage() const = 0;
+
+    // Writes the factorized matrices to a setup file (see GMGPolar::saveSetup).
+    // The derived classes restore them in their constructor if a SetupReader is passed.
+    virtual void saveSetup(SetupWriter& writer) = 0;
+
 protected:
     const PolarGrid& grid_;
     const LevelCache& level_cache_;
     const DomainGeometry& domain_geometry_;
     const DensityProfileCoefficients& density_profile_coefficients_;
     const bool DirBC_Interior_;
-    const int num_omp_threads_;
+    int num_omp_threads_;
 };
@@ -22,6 +22,8 @@ class LevelCache;
 #include "../LinearAlgebra/vector_operations.h"
 #include "../PolarGrid/polargrid.h"
 #include "../common/global_definitions.h"
+#include "../common/memory_report.h"
+#include "../common/profiler.h"
 #include "test_cases.h"
 
 class GMGPolar
@@ -51,6 +53,10 @@ public:
     bool paraview() const;
     void paraview(bool paraview);
 
+    // File format of the ParaView output: ASCII, binary or compressed unstructured grids, or a structured grid.
+    ParaviewFormat paraviewFormat() const;
+    void paraviewFormat(ParaviewFormat paraview_format);
+
     /* ---------------------------------------------------------------------- */
     /* Parallelization & threading                                            */
     /* ---------------------------------------------------------------------- */
@@ -62,6 +68,19 @@ public:
     double threadReductionFactor() const;
     void threadReductionFactor(double thread_reduction_factor);
 
+    // Choose the number of threads of every level during the setup by timing its smoothers and residual
+    // for maxOpenMPThreads, maxOpenMPThreads/2, ..., 1 threads. Replaces the threadReductionFactor rule.
+    bool autotuneThreads() const;
+    void autotuneThreads(bool autotune_threads);
+
+    // File caching the autotuned thread counts, keyed by the level grid size, the settings and the hardware.
+    // Levels found in the file are not timed again, newly tuned levels are added to it. Empty disables the cache.
+    const std::string& threadTuningCache() const;
+    void threadTuningCache(const std::string& thread_tuning_cache);
+
+    // Number of threads of every level, available after setup().
+    const std::vector<int>& threadsPerLevel() const;
+
     /* ---------------------------------------------------------------------- */
     /* Numerical method options                                               */
     /* ---------------------------------------------------------------------- */
@@ -83,6 +102,24 @@ public:
     bool cacheDomainGeometry() const;
     void cacheDomainGeometry(bool cache_domain_geometry);
 
+    // Store the line smoother factorizations of the coarse levels in single precision.
+    // The coarse levels only compute error corrections, while residuals and solution updates
+    // on the finest level remain in double precision, so the final accuracy is unaffected.
+    // With the Take stencil distribution, no extrapolation and without memoryLean() the whole correction
+    // cycle below the finest level runs on single precision vectors, including the coarse direct solver.
+    // The stencil coefficients and the level cache stay in double precision.
+    bool mixedPrecision() const;
+    void mixedPrecision(bool mixed_precision);
+
+    // Reduce the memory footprint of the level hierarchy at the cost of some speed.
+    // The coarse levels, and with the Give stencil distribution also the finest level, evaluate the density
+    // profile coefficients and the domain geometry on the fly. With the Take and Assembled stencil distributions
+    // the coarse levels switch to Give, since these operators require the level cache.
+    // Without FMG the coarse levels share the storage of their solution vectors, which the multigrid cycles only
+    // use as temporary storage, and without extrapolation this storage is the residual of the finest level.
+    bool memoryLean() const;
+    void memoryLean(bool memory_lean);
+
     /* ---------------------------------------------------------------------- */
     /* Multigrid controls                                                     */
     /* ---------------------------------------------------------------------- */
@@ -112,6 +149,18 @@ public:
     MultigridCycleType FMG_cycle() const;
     void FMG_cycle(MultigridCycleType FMG_cycle);
 
+    /* ---------------------------------------------------------------------- */
+    /* Outer Krylov acceleration                                              */
+    /* ---------------------------------------------------------------------- */
+    // Outer solver: stationary multigrid iteration, or PCG/FGMRES preconditioned by one multigrid cycle.
+    // Krylov acceleration requires ExtrapolationType::NONE.
+    OuterSolverType outerSolver() const;
+    void outerSolver(OuterSolverType outer_solver);
+
+    // Restart length m of FGMRES(m).
+    int FGMRES_restart() const;
+    void FGMRES_restart(int FGMRES_restart);
+
     /* ---------------------------------------------------------------------- */
     /* Iterative solver termination                                           */
     /* ---------------------------------------------------------------------- */
@@ -131,12 +180,37 @@ public:
     std::optional<double> relativeTolerance() const;
     void relativeTolerance(std::optional<double> tol);
 
+    // Take the residual norm for the convergence check from the residual which each multigrid cycle
+    // computes after presmoothing, instead of recomputing the residual before every cycle.
+    // These norms belong to the presmoothed iterate before the coarse grid correction of the previous cycle,
+    // so the criterion is slightly conservative and may take one additional cycle. residualNorms() records them,
+    // but its last entry is the residual norm of the returned solution, which is computed once the criterion is met
+    // or after the last iteration. Only applies to the stationary multigrid iteration.
+    bool fusedConvergenceCheck() const;
+    void fusedConvergenceCheck(bool fused_convergence_check);
+
     /* ---------------------------------------------------------------------- */
     /* Setup & Solve                                                          */
     /* ---------------------------------------------------------------------- */
     // Finalize solver setup (allocate data, build operators, etc.).
     void setup();
 
+    // Replace the density profile coefficients alpha and beta after setup().
+    // Grids and allocations are kept, only the cached coefficients are refreshed and
+    // the smoothers and the coarse direct solver are refactorized in place.
+    // The coefficients object must outlive the solver. If the level caches store radial profiles,
+    // the new coefficients have to be angle independent as well.
+    void updateDensityProfileCoefficients(const DensityProfileCoefficients& density_profile_coefficients);
+
+    // Store the complete setup state (grids, level caches, smoother and coarse solver factorizations)
+    // in a versioned binary file. With MUMPS, its factorizations are stored in separate files next to it.
+    void saveSetup(const std::string& path) const;
+
+    // Replace setup() by restoring a state written by saveSetup(). The file is memory-mapped.
+    // The solver has to be constructed with the same finest grid and configured with the same
+    // numerical and multigrid options, otherwise a std::runtime_error is thrown.
+    void loadSetup(const std::string& path);
+
     // If an exact solution is provided, the solver will compute the exact error at each iteration.
     void setSolution(const ExactSolution* exact_solution);
 
@@ -144,6 +218,24 @@ public:
     // Multiple solves with different inputs are supported.
     void solve(const BoundaryConditions& boundary_conditions, const SourceTerm& source_term);
 
+    // Solve system starting from a caller-provided approximation on the finest grid (warm start).
+    // Replaces the zero/FMG initial approximation, passing solution() continues from the previous solve.
+    // The relative residual is then measured against ||rhs|| instead of ||r_0||.
+    void solve(const BoundaryConditions& boundary_conditions, const SourceTerm& source_term,
+               ConstVector<double> initial_guess);
+
+    // Solve a batch of k systems that share the operator but differ in their right-hand side.
+    // The level hierarchy, LevelCache and smoother/coarse solver factorizations are reused for every column.
+    // Either one boundary condition is given for all source terms, or exactly one per source term.
+    // The solution of the i-th right-hand side is available through solution(i) afterwards.
+    // Without extrapolation, FMG, Krylov solver, the single precision correction of mixedPrecision(), exact solution
+    // and ParaView output, the V-, W- or F-cycle iteration runs on all columns at once: smoothing, residual and grid
+    // transfers evaluate the stencil of a line once for all columns and the coarse grid is solved for all columns
+    // in one call of the direct solver. Otherwise, in particular with implicit extrapolation or FMG, the columns
+    // are solved one after another. residualNorms() is only recorded in the latter case.
+    void solve(const std::vector<const BoundaryConditions*>& boundary_conditions,
+               const std::vector<const SourceTerm*>& source_terms);
+
     /* ---------------------------------------------------------------------- */
     /* Solution & Grid Access                                                 */
     /* ---------------------------------------------------------------------- */
@@ -151,6 +243,11 @@ public:
     Vector<double> solution();
     ConstVector<double> solution() const;
 
+    // Return a reference to the i-th column of the last batched solve.
+    int numberOfRightHandSides() const;
+    Vector<double> solution(int rhs_index);
+    ConstVector<double> solution(int rhs_index) const;
+
     // Return the underlying cartesian mesh used for discretization.
     const PolarGrid& grid() const;
 
@@ -162,14 +259,35 @@ public:
 
     // Number of iterations taken by last solve.
     int numberOfIterations() const;
+    // Number of iterations taken by each column of the last batched solve.
+    const std::vector<int>& batchNumberOfIterations() const;
 
     // Mean residual reduction factor per iteration.
     double meanResidualReductionFactor() const;
 
+    // Residual norm history of the last solve (only recorded if a tolerance is set or a Krylov solver is used).
+    const std::vector<double>& residualNorms() const;
+
     // Error norms (only available if exact solution was set).
     std::optional<double> exactErrorWeightedEuclidean() const;
     std::optional<double> exactErrorInfinity() const;
 
+    // Wall time, call count and thread count per level and operation of the last solve
+    // (smoothing, residual, grid transfers, direct solve, norms). Batched solves are accumulated over all columns.
+    const Profiler& profiler() const;
+    // Write the per-level profile of the last solve as JSON.
+    void writeProfileJSON(const std::string& path) const;
+
+    // Bytes held per level by the vectors, the level cache arrays, the smoothers and the coarse solver,
+    // and the process high-water marks of the last setup and solve.
+    MemoryReport memoryReport() const;
+
+    // Write settings, level hierarchy, residual and error history, timings and peak memory usage
+    // of the last setup and solve as JSON. The solver does not know how the geometry and the coefficients
+    // were chosen, 'problem' is written as the "problem" section, e.g. ConfigParser::problemSettings().
+    void writeReport(const std::string& path, const std::vector<ReportSetting>& problem = {}) const;
+    void writeReport(std::ostream& stream, const std::vector<ReportSetting>& problem = {}) const;
+
     /* ---------------------------------------------------------------------- */
     /* Timing Statistics                                                      */
     /* ---------------------------------------------------------------------- */
@@ -190,14 +308,21 @@ public:
     double timeAvgMGCPostSmoothing() const;
     double timeAvgMGCResidual() const;
     double timeAvgMGCDirectSolver() const;
+    double timeAvgMGCKrylov() const;
 
 private:
+    friend class SolveContext;
+
+    // Copies the settings of a solver after setup() and shares its grids, level caches and operators.
+    // Only the per-solve vectors and statistics are allocated anew, see SolveContext.
+    explicit GMGPolar(const GMGPolar& setup_solver);
+
     /* ------------------------------------ */
     /* Grid Configuration & Input Functions */
     /* ------------------------------------ */
     const PolarGrid& grid_;
     const DomainGeometry& domain_geometry_;
-    const DensityProfileCoefficients& density_profile_coefficients_;
+    const DensityProfileCoefficients* density_profile_coefficients_;
     const ExactSolution* exact_solution_; // Optional exact solution for validation
 
     /* ------------------ */
@@ -206,14 +331,19 @@ private:
     // General solver output and visualization settings
     int verbose_;
     bool paraview_;
+    ParaviewFormat paraview_format_;
     // Parallelization and threading settings
     int max_omp_threads_;
     double thread_reduction_factor_;
+    bool autotune_threads_;
+    std::string thread_tuning_cache_;
     // Numerical method setup
     bool DirBC_Interior_;
     StencilDistributionMethod stencil_distribution_method_;
     bool cache_density_profile_coefficients_;
     bool cache_domain_geometry_;
+    bool mixed_precision_;
+    bool memory_lean_;
     // Multigrid settings
     ExtrapolationType extrapolation_;
     int max_levels_;
@@ -224,11 +354,15 @@ private:
     bool FMG_;
     int FMG_iterations_;
     MultigridCycleType FMG_cycle_;
+    // Outer solver settings
+    OuterSolverType outer_solver_;
+    int FGMRES_restart_;
     // Convergence settings
     int max_iterations_;
     ResidualNormType residual_norm_type_;
     std::optional<double> absolute_tolerance_;
     std::optional<double> relative_tolerance_;
+    bool fused_convergence_check_;
 
     /* ---------------- */
     /* Multigrid levels */
@@ -236,16 +370,36 @@ private:
     std::vector<Level> levels_;
     std::vector<int> threads_per_level_;
 
+    /* ------------------------------------------------------------------ */
+    /* Column-major storage of the finest level solutions of a batched solve */
+    int number_of_rhs_;
+    Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace> batch_solutions_;
+    std::vector<int> batch_number_of_iterations_;
+
     /* ---------------------- */
     /* Interpolation operator */
     std::unique_ptr<Interpolation> interpolation_;
 
+    /* ------------------------------------------------------------------------------ */
+    /* Per-level operation timings. Mutable, since the const grid transfers record too */
+    mutable Profiler profiler_;
+
+    /* -------------------------------------------------------------- */
+    /* Work vectors of the outer Krylov solver, allocated on first use */
+    std::vector<Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace>> krylov_vectors_;
+
     /* ------------------------------------------------------------------------- */
     /* Chooses if full grid smoothing is active on level 0 for extrapolation > 0 */
     bool full_grid_smoothing_ = false;
 
     /* -------------------- */
     /* Convergence criteria */
+    // Measure the relative residual against ||rhs|| when starting from a nonzero approximation (FMG or warm start).
+    bool relative_to_rhs_norm_ = false;
+    // Set while the multigrid iteration runs with the fused convergence check. The cycle on level 0 then
+    // stores the norm of its (extrapolated) residual in cycle_residual_norm_.
+    bool record_cycle_residual_norm_ = false;
+    double cycle_residual_norm_      = 0.0;
     int number_of_iterations_;
     std::vector<double> residual_norms_;
     double mean_residual_reduction_factor_;
@@ -266,17 +420,54 @@ private:
     /* --------------- */
     /* Setup Functions */
     int chooseNumberOfLevels(const PolarGrid& finest_grid);
+    void initializeThreadsPerLevel();
+    // Requires initialized operators, see autotune_threads.cpp.
+    void autotuneThreadsPerLevel();
+    // Operators are restored from the setup file if a SetupReader is given.
+    void initializeOperators(const int level_depth, SetupReader* setup_reader = nullptr);
+    // Per-level choices of the memory-lean mode, see memoryLean().
+    bool cachesDensityProfileCoefficients(const int level_depth) const;
+    bool cachesDomainGeometry(const int level_depth) const;
+    StencilDistributionMethod levelStencilDistributionMethod(const int level_depth) const;
+    // Whether the level caches store radial profiles, see LevelCache::radialProfiles().
+    bool usesRadialProfiles() const;
+    bool sharesSolutionStorage(const int level_depth) const;
+    Vector<double> sharedSolutionStorage();
+    // Whether the levels below the finest one use single precision vectors, see mixedPrecision().
+    bool usesSinglePrecisionCycle() const;
+    void saveSetupConfiguration(SetupWriter& writer) const;
+    void checkSetupConfiguration(SetupReader& reader);
     void build_rhs_f(const Level& level, Vector<double> rhs_f, const BoundaryConditions& boundary_conditions,
                      const SourceTerm& source_term);
     void discretize_rhs_f(const Level& level, Vector<double> rhs_f);
 
     /* --------------- */
     /* Solve Functions */
-    void initializeSolution();
+    // A null initial_guess selects the default zero/FMG initial approximation.
+    void solveSystem(const BoundaryConditions& boundary_conditions, const SourceTerm& source_term,
+                     const ConstVector<double>* initial_guess);
+    // Multigrid iteration on all columns of a batch at once, see the batched solve().
+    void solveBatch(const std::vector<const BoundaryConditions*>& boundary_conditions,
+                    const std::vector<const SourceTerm*>& source_terms);
+    void initializeSolution(const ConstVector<double>* initial_guess);
     double residualNorm(const ResidualNormType& norm_type, const Level& level, ConstVector<double> residual) const;
     void evaluateExactError(Level& level, const ExactSolution& exact_solution);
     void updateResidualNorms(Level& level, int iteration, double& initial_residual_norm, double& current_residual_norm,
                              double& current_relative_residual_norm);
+    // Norm of the (extrapolated) residual of the current solution on level, stored in level.residual().
+    double iterateResidualNorm(Level& level);
+    void recordResidualNorm(const Level& level, double residual_norm, double& initial_residual_norm,
+                            double& current_residual_norm, double& current_relative_residual_norm);
+
+    /* ----------------------------------------------- */
+    /* Multigrid-preconditioned outer Krylov solvers */
+    void allocateKrylovVectors(int number_of_vectors);
+    void applyOperator(const Level& level, Vector<double> result, ConstVector<double> x);
+    void applyMultigridPreconditioner(Vector<double> result, Vector<double> rhs);
+    void preconditionedConjugateGradient(double& initial_residual_norm, double& current_residual_norm,
+                                         double& current_relative_residual_norm);
+    void flexibleGMRES(double& initial_residual_norm, double& current_residual_norm,
+                       double& current_relative_residual_norm);
 
     /* ----------------- */
     /* Print information */
@@ -296,21 +487,61 @@ private:
                                                  Vector<double> residual);
     void implicitlyExtrapolatedMultigrid_F_Cycle(const int level_depth, Vector<double> solution, Vector<double> rhs,
                                                  Vector<double> residual);
+    void batchedMultigridCycle(const int level_depth, const MultigridCycleType cycle, Vector<double> solution,
+                               Vector<double> rhs, Vector<double> residual, const int number_of_columns);
+    // Cycle on the finest level whose coarse grid correction is computed in single precision,
+    // see usesSinglePrecisionCycle(). The recursion below the finest level follows 'cycle'.
+    void mixedPrecisionMultigridCycle(const MultigridCycleType cycle, Vector<double> solution, Vector<double> rhs,
+                                      Vector<double> residual);
+    void singlePrecisionMultigridCycle(const int level_depth, const MultigridCycleType cycle, Vector<float> solution,
+                                       Vector<float> rhs, Vector<float> residual);
+    // Solves for the error of level_depth >= 1 in its single precision vectors, see the cycle file.
+    void singlePrecisionCorrection(const int level_depth, const MultigridCycleType cycle);
 
     /* ----------------------- */
     /* Interpolation functions */
     void prolongation(const int current_level, Vector<double> result, ConstVector<double> x) const;
+    void prolongationAdd(const int current_level, Vector<double> result, ConstVector<double> x) const;
+    void prolongationAdd(const int current_level, Vector<double> result, ConstVector<float> x) const;
+    void prolongationAdd(const int current_level, Vector<float> result, ConstVector<float> x) const;
     void restriction(const int current_level, Vector<double> result, ConstVector<double> x) const;
+    void restriction(const int current_level, Vector<float> result, ConstVector<double> x) const;
+    // Transfers of the first number_of_columns columns of the batch vectors, see batchedMultigridCycle.
+    void prolongationAddBatch(const int current_level, Vector<double> result, ConstVector<double> x,
+                              const int number_of_columns) const;
+    void restrictionBatch(const int current_level, Vector<double> result, ConstVector<double> x,
+                          const int number_of_columns) const;
     void injection(const int current_level, Vector<double> result, ConstVector<double> x) const;
     void extrapolatedProlongation(const int current_level, Vector<double> result, ConstVector<double> x) const;
+    void extrapolatedProlongationAdd(const int current_level, Vector<double> result, ConstVector<double> x) const;
     void extrapolatedRestriction(const int current_level, Vector<double> result, ConstVector<double> x) const;
     void FMGInterpolation(const int current_level, Vector<double> result, ConstVector<double> x) const;
+    // result = R * (rhs - A*x) on the next level. The fine residual is computed into 'residual' only if
+    // store_residual is set or the level has no fused residual and restriction.
+    void restrictedResidual(const int current_level, Vector<double> result, ConstVector<double> rhs,
+                            ConstVector<double> x, Vector<double> residual, const bool store_residual) const;
+    // Same for the single precision rhs of level 1, the residual of the finest level stays in double precision.
+    void restrictedResidual(const int current_level, Vector<float> result, ConstVector<double> rhs,
+                            ConstVector<double> x, Vector<double> residual, const bool store_residual) const;
+    // Always fused, the single precision cycle requires the Take residual.
+    void restrictedResidual(const int current_level, Vector<float> result, ConstVector<float> rhs,
+                            ConstVector<float> x) const;
+    void extrapolatedRestrictedResidual(const int current_level, Vector<double> result, ConstVector<double> rhs,
+                                        ConstVector<double> x, Vector<double> residual,
+                                        const bool store_residual) const;
 
     /* ------------- */
     /* Visualization */
     void writeToVTK(const std::filesystem::path& file_path, const PolarGrid& grid);
     void writeToVTK(const std::filesystem::path& file_path, const Level& level, ConstVector<double> grid_function);
 
+    /* ------------------------------------------------------------------------ */
+    /* Resident set size at the start and high-water mark at the end of a phase */
+    long setup_resident_set_size_ = -1;
+    long setup_high_water_mark_   = -1;
+    long solve_resident_set_size_ = -1;
+    long solve_high_water_mark_   = -1;
+
     /* ------------------------------ */
     /* Timing statistics for GMGPolar */
     void resetAllTimings();
@@ -331,6 +562,7 @@ private:
 
     void resetAvgMultigridCycleTimings();
     double t_avg_MGC_total_;
+    double t_avg_MGC_krylov_;
     double t_avg_MGC_preSmoothing_;
     double t_avg_MGC_postSmoothing_;
     double t_avg_MGC_residual_;
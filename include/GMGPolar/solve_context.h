@@ -0,0 +1,51 @@
+#pragma once
+
+#include "gmgpolar.h"
+
+/*
+ * Workspace for solves which share the setup of a GMGPolar solver.
+ *
+ * A context owns the rhs, solution, residual and error correction vectors of every level as well as the
+ * statistics of its last solve. The grids, level caches and the factorized smoothers and coarse solvers are
+ * shared with the solver it was created from, so N contexts need roughly the memory of one setup plus N sets
+ * of vectors. Solves on different contexts, and on the solver itself, may run concurrently.
+ *
+ * The settings are copied when the context is created. The shared operators stay alive as long as a context
+ * uses them. Create new contexts after setup(), loadSetup() or updateDensityProfileCoefficients() of the solver,
+ * and do not call these while contexts of the previous setup are solving.
+ * With MUMPS, the solves of its factorizations are serialized.
+ */
+class SolveContext
+{
+public:
+    // Requires a previous call to solver.setup() or solver.loadSetup().
+    explicit SolveContext(const GMGPolar& solver);
+
+    // If an exact solution is provided, the context computes the exact error at each iteration.
+    void setSolution(const ExactSolution* exact_solution);
+
+    // Same as the corresponding GMGPolar::solve overloads.
+    void solve(const BoundaryConditions& boundary_conditions, const SourceTerm& source_term);
+    void solve(const BoundaryConditions& boundary_conditions, const SourceTerm& source_term,
+               ConstVector<double> initial_guess);
+    void solve(const std::vector<const BoundaryConditions*>& boundary_conditions,
+               const std::vector<const SourceTerm*>& source_terms);
+
+    Vector<double> solution();
+    ConstVector<double> solution() const;
+    int numberOfRightHandSides() const;
+    Vector<double> solution(int rhs_index);
+    ConstVector<double> solution(int rhs_index) const;
+
+    int numberOfIterations() const;
+    const std::vector<int>& batchNumberOfIterations() const;
+    double meanResidualReductionFactor() const;
+    const std::vector<double>& residualNorms() const;
+    std::optional<double> exactErrorWeightedEuclidean() const;
+    std::optional<double> exactErrorInfinity() const;
+    const Profiler& profiler() const;
+    double timeSolveTotal() const;
+
+private:
+    GMGPolar solver_;
+};
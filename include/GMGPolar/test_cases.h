@@ -16,6 +16,7 @@
 #include "../include/InputFunctions/DomainGeometry/culhamGeometry.h"
 #include "../include/InputFunctions/DomainGeometry/czarnyGeometry.h"
 #include "../include/InputFunctions/DomainGeometry/shafranovGeometry.h"
+#include "../include/InputFunctions/DomainGeometry/tabulatedGeometry.h"
 
 /* --------------- */
 /* Exact Solutions */
@@ -60,6 +61,7 @@
 #include "../include/InputFunctions/DensityProfileCoefficients/zoniGyroCoefficients.h"
 #include "../include/InputFunctions/DensityProfileCoefficients/zoniShiftedCoefficients.h"
 #include "../include/InputFunctions/DensityProfileCoefficients/zoniShiftedGyroCoefficients.h"
+#include "../include/InputFunctions/DensityProfileCoefficients/tabulatedDensityProfileCoefficients.h"
 
 /* ------------------------- */
 /* Source Terms: CartesianR2 */
@@ -4,7 +4,7 @@
 
 #include "../densityProfileCoefficients.h"
 
-class PoissonCoefficients : public DensityProfileCoefficients
+class PoissonCoefficients : public AngleIndependentDensityProfileCoefficients<PoissonCoefficients>
 {
 public:
     PoissonCoefficients() = default;
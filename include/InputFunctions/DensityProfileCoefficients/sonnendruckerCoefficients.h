@@ -4,7 +4,7 @@
 
 #include "../densityProfileCoefficients.h"
 
-class SonnendruckerCoefficients : public DensityProfileCoefficients
+class SonnendruckerCoefficients : public AngleIndependentDensityProfileCoefficients<SonnendruckerCoefficients>
 {
 public:
     SonnendruckerCoefficients() = default;
@@ -4,7 +4,7 @@
 
 #include "../densityProfileCoefficients.h"
 
-class SonnendruckerGyroCoefficients : public DensityProfileCoefficients
+class SonnendruckerGyroCoefficients : public AngleIndependentDensityProfileCoefficients<SonnendruckerGyroCoefficients>
 {
 public:
     SonnendruckerGyroCoefficients() = default;
@@ -0,0 +1,32 @@
+#pragma once
+
+#include <memory>
+#include <string>
+
+#include "../densityProfileCoefficients.h"
+#include "../tabulatedTable.h"
+
+class TabulatedDensityProfileCoefficients : public DensityProfileCoefficients
+{
+public:
+    // The table at 'path' holds the two fields alpha and beta, see TabulatedTable for the file layout.
+    // Tables with a single angle only depend on r.
+    explicit TabulatedDensityProfileCoefficients(const std::string& path, const double& alpha_jump);
+    virtual ~TabulatedDensityProfileCoefficients() = default;
+
+    double alpha(const double& r, const double& theta) const override;
+    double beta(const double& r, const double& theta) const override;
+
+    void evaluateCircle(const double r, const int count, const double* theta, double* alpha,
+                        double* beta) const override;
+    void evaluateRadialLine(const int count, const double* r, const double theta, double* alpha,
+                            double* beta) const override;
+
+    double getAlphaJump() const override;
+
+    bool isAngleIndependent() const override;
+
+private:
+    std::shared_ptr<const TabulatedTable> table_;
+    const double alpha_jump_;
+};
@@ -4,7 +4,7 @@
 
 #include "../densityProfileCoefficients.h"
 
-class ZoniCoefficients : public DensityProfileCoefficients
+class ZoniCoefficients : public AngleIndependentDensityProfileCoefficients<ZoniCoefficients>
 {
 public:
     ZoniCoefficients() = default;
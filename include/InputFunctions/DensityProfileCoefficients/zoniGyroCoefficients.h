@@ -4,7 +4,7 @@
 
 #include "../densityProfileCoefficients.h"
 
-class ZoniGyroCoefficients : public DensityProfileCoefficients
+class ZoniGyroCoefficients : public AngleIndependentDensityProfileCoefficients<ZoniGyroCoefficients>
 {
 public:
     ZoniGyroCoefficients() = default;
@@ -4,7 +4,7 @@
 
 #include "../densityProfileCoefficients.h"
 
-class ZoniShiftedCoefficients : public DensityProfileCoefficients
+class ZoniShiftedCoefficients : public AngleIndependentDensityProfileCoefficients<ZoniShiftedCoefficients>
 {
 public:
     ZoniShiftedCoefficients() = default;
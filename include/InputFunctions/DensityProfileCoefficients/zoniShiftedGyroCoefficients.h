@@ -4,7 +4,7 @@
 
 #include "../densityProfileCoefficients.h"
 
-class ZoniShiftedGyroCoefficients : public DensityProfileCoefficients
+class ZoniShiftedGyroCoefficients : public AngleIndependentDensityProfileCoefficients<ZoniShiftedGyroCoefficients>
 {
 public:
     ZoniShiftedGyroCoefficients() = default;
@@ -32,3 +32,15 @@ inline double CircularGeometry::dFx_dt(const double& r, const double& theta, con
 inline double CircularGeometry::dFy_dt(const double& r, const double& theta, const double& sin_theta, const double& cos_theta) const {
     return (r/Rmax) * cos_theta;
 }
+
+inline bool CircularGeometry::isAngleIndependent() const {
+    return true;
+}
+
+inline void CircularGeometry::evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta, const double* cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const {
+    evaluateCircleWith(*this, r, count, theta, sin_theta, cos_theta, Fx, Fy, dFx_dr, dFy_dr, dFx_dt, dFy_dt);
+}
+
+inline void CircularGeometry::evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta, const double cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const {
+    evaluateRadialLineWith(*this, count, r, theta, sin_theta, cos_theta, Fx, Fy, dFx_dr, dFy_dr, dFx_dt, dFy_dt);
+}
@@ -4,14 +4,19 @@
 #include <memory>
 #include <array>
 #include <cstdint>
+#include <vector>
+#include <algorithm>
 
 #include "../domainGeometry.h"
 
 class CulhamGeometry : public DomainGeometry
 {
 public:
+    // The radial profiles of the equilibrium are tabulated as piecewise cubic polynomials on 'profile_intervals'
+    // uniform intervals of [0, Rmax]. profile_intervals = 0 evaluates the reference interpolation of the ODE solution
+    // instead, which is considerably more expensive per call.
     CulhamGeometry();
-    explicit CulhamGeometry(const double& Rmax);
+    explicit CulhamGeometry(const double& Rmax, const int profile_intervals = 1000);
 
     virtual ~CulhamGeometry() = default;
 
@@ -26,10 +31,36 @@ public:
     double dFy_dt(const double& r, const double& theta, const double& sin_theta,
                   const double& cos_theta) const override;
 
+    void evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta,
+                        const double* cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr,
+                        double* dFx_dt, double* dFy_dt) const override;
+    void evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta,
+                            const double cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr,
+                            double* dFx_dt, double* dFy_dt) const override;
+
+    // Largest deviation of the tabulated profiles from the reference interpolation, sampled at the nodes of the
+    // ODE solution and the midpoints in between. Zero if the profiles are not tabulated.
+    double profileTableError() const;
+
 private:
-    const double Rmax = 1.3;
+    const double Rmax           = 1.3;
+    const int profile_intervals = 1000;
 
     void initializeGeometry();
+    void initializeProfileTable();
+
+    // Delta, E, T and P at the normalized radius rr, respectively their derivatives with respect to rr.
+    struct RadialProfiles {
+        double Delta, E, T, P;
+    };
+    RadialProfiles profiles(double rr) const;
+    RadialProfiles profileDerivatives(double rr) const;
+    RadialProfiles referenceProfiles(double rr) const;
+    RadialProfiles referenceProfileDerivatives(double rr) const;
+
+    // Per interval the Hermite coefficients of Delta, E, T, P followed by those of their derivatives.
+    static constexpr int coefficients_per_interval = 32;
+    std::vector<double> profile_table;
 
     double my_sum(std::array<double, 1001>& f, int64_t start_idx, int64_t end_idx) const;
     double q(double rr) const;
@@ -5,42 +5,109 @@
 // In earlier versions denoted by 'x'
 inline double CulhamGeometry::Fx(const double& r, const double& theta, const double& sin_theta, const double& cos_theta) const {
     const double cos_two_theta = 1.0 - sin_theta * sin_theta;
-    return (r/Rmax) * cos_theta + Delta((r/Rmax)) - E((r/Rmax)) * cos_theta - P((r/Rmax)) * cos_theta + T((r/Rmax)) * cos_two_theta + 5.0;
+    const RadialProfiles p = profiles(r/Rmax);
+    return (r/Rmax) * cos_theta + p.Delta - p.E * cos_theta - p.P * cos_theta + p.T * cos_two_theta + 5.0;
 }
 
 // In earlier versions denoted by 'y'
 inline double CulhamGeometry::Fy(const double& r, const double& theta, const double& sin_theta, const double& cos_theta) const {
     const double sin_two_theta = 2.0 * sin_theta * cos_theta;
-    return (r/Rmax) * sin_theta - E((r/Rmax)) * sin_theta - P((r/Rmax)) * sin_theta - T((r/Rmax)) * sin_two_theta;
+    const RadialProfiles p = profiles(r/Rmax);
+    return (r/Rmax) * sin_theta - p.E * sin_theta - p.P * sin_theta - p.T * sin_two_theta;
 }
 
 
 // In earlier versions denoted by 'Jrr'
 inline double CulhamGeometry::dFx_dr(const double& r, const double& theta, const double& sin_theta, const double& cos_theta) const {
     const double cos_two_theta = 1.0 - sin_theta * sin_theta;
-    return (Delta_prime((r/Rmax)) - E_prime((r/Rmax)) * cos_theta + T_prime((r/Rmax)) * cos_two_theta - dP((r/Rmax)) * cos_theta + cos_theta)/Rmax;
+    const RadialProfiles dp = profileDerivatives(r/Rmax);
+    return (dp.Delta - dp.E * cos_theta + dp.T * cos_two_theta - dp.P * cos_theta + cos_theta)/Rmax;
 }
 
 // In earlier versions denoted by 'Jtr'
 inline double CulhamGeometry::dFy_dr(const double& r, const double& theta, const double& sin_theta, const double& cos_theta) const {
     const double sin_two_theta = 2.0 * sin_theta * cos_theta;
-    return ((-E_prime((r/Rmax))) * sin_theta - T_prime((r/Rmax)) * sin_two_theta - dP((r/Rmax)) * sin_theta + sin_theta)/Rmax;
+    const RadialProfiles dp = profileDerivatives(r/Rmax);
+    return ((-dp.E) * sin_theta - dp.T * sin_two_theta - dp.P * sin_theta + sin_theta)/Rmax;
 }
 
 // In earlier versions denoted by 'Jrt'
 inline double CulhamGeometry::dFx_dt(const double& r, const double& theta, const double& sin_theta, const double& cos_theta) const {
     const double sin_two_theta = 2.0 * sin_theta * cos_theta;
-    return (-(r/Rmax)) * sin_theta + E((r/Rmax)) * sin_theta + P((r/Rmax)) * sin_theta - 2.0 * T((r/Rmax)) * sin_two_theta;
+    const RadialProfiles p = profiles(r/Rmax);
+    return (-(r/Rmax)) * sin_theta + p.E * sin_theta + p.P * sin_theta - 2.0 * p.T * sin_two_theta;
 }
 
 // In earlier versions denoted by 'Jtt'
 inline double CulhamGeometry::dFy_dt(const double& r, const double& theta, const double& sin_theta, const double& cos_theta) const {
     const double cos_two_theta = 1.0 - sin_theta * sin_theta;
-    return (r/Rmax) * cos_theta - E((r/Rmax)) * cos_theta - P((r/Rmax)) * cos_theta - 2.0 * T((r/Rmax)) * cos_two_theta;
+    const RadialProfiles p = profiles(r/Rmax);
+    return (r/Rmax) * cos_theta - p.E * cos_theta - p.P * cos_theta - 2.0 * p.T * cos_two_theta;
 }
 
 
 
+// On a circle the radial profiles Delta, E, T, P and their derivatives are evaluated once instead of per node.
+inline void CulhamGeometry::evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta, const double* cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const {
+    const double rr            = r / Rmax;
+    const RadialProfiles p     = profiles(rr);
+    const RadialProfiles dp    = profileDerivatives(rr);
+    const double Delta_r       = p.Delta;
+    const double E_r           = p.E;
+    const double T_r           = p.T;
+    const double P_r           = p.P;
+    const double Delta_prime_r = dp.Delta;
+    const double E_prime_r     = dp.E;
+    const double T_prime_r     = dp.T;
+    const double dP_r          = dp.P;
+
+    #pragma omp simd
+    for (int i = 0; i < count; i++) {
+        const double cos_two_theta = 1.0 - sin_theta[i] * sin_theta[i];
+        const double sin_two_theta = 2.0 * sin_theta[i] * cos_theta[i];
+        if (Fx) Fx[i] = rr * cos_theta[i] + Delta_r - E_r * cos_theta[i] - P_r * cos_theta[i] + T_r * cos_two_theta + 5.0;
+        if (Fy) Fy[i] = rr * sin_theta[i] - E_r * sin_theta[i] - P_r * sin_theta[i] - T_r * sin_two_theta;
+        dFx_dr[i] = (Delta_prime_r - E_prime_r * cos_theta[i] + T_prime_r * cos_two_theta - dP_r * cos_theta[i] + cos_theta[i])/Rmax;
+        dFy_dr[i] = ((-E_prime_r) * sin_theta[i] - T_prime_r * sin_two_theta - dP_r * sin_theta[i] + sin_theta[i])/Rmax;
+        dFx_dt[i] = (-rr) * sin_theta[i] + E_r * sin_theta[i] + P_r * sin_theta[i] - 2.0 * T_r * sin_two_theta;
+        dFy_dt[i] = rr * cos_theta[i] - E_r * cos_theta[i] - P_r * cos_theta[i] - 2.0 * T_r * cos_two_theta;
+    }
+}
+
+// Along a radial line the profiles are looked up per node, only the virtual calls are saved.
+inline void CulhamGeometry::evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta, const double cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const {
+    evaluateRadialLineWith(*this, count, r, theta, sin_theta, cos_theta, Fx, Fy, dFx_dr, dFy_dr, dFx_dt, dFy_dt);
+}
+
+// One interval lookup and four Horner evaluations per call.
+inline CulhamGeometry::RadialProfiles CulhamGeometry::profiles(double rr) const {
+    if (profile_table.empty()) return referenceProfiles(rr);
+    const double x = rr * profile_intervals;
+    const int k = std::min(std::max(static_cast<int>(x), 0), profile_intervals - 1);
+    const double t = x - k;
+    const double* c = &profile_table[static_cast<size_t>(k) * coefficients_per_interval];
+    return {c[0] + t * (c[1] + t * (c[2] + t * c[3])), c[4] + t * (c[5] + t * (c[6] + t * c[7])),
+            c[8] + t * (c[9] + t * (c[10] + t * c[11])), c[12] + t * (c[13] + t * (c[14] + t * c[15]))};
+}
+
+inline CulhamGeometry::RadialProfiles CulhamGeometry::profileDerivatives(double rr) const {
+    if (profile_table.empty()) return referenceProfileDerivatives(rr);
+    const double x = rr * profile_intervals;
+    const int k = std::min(std::max(static_cast<int>(x), 0), profile_intervals - 1);
+    const double t = x - k;
+    const double* c = &profile_table[static_cast<size_t>(k) * coefficients_per_interval + 16];
+    return {c[0] + t * (c[1] + t * (c[2] + t * c[3])), c[4] + t * (c[5] + t * (c[6] + t * c[7])),
+            c[8] + t * (c[9] + t * (c[10] + t * c[11])), c[12] + t * (c[13] + t * (c[14] + t * c[15]))};
+}
+
+inline CulhamGeometry::RadialProfiles CulhamGeometry::referenceProfiles(double rr) const {
+    return {Delta(rr), E(rr), T(rr), P(rr)};
+}
+
+inline CulhamGeometry::RadialProfiles CulhamGeometry::referenceProfileDerivatives(double rr) const {
+    return {Delta_prime(rr), E_prime(rr), T_prime(rr), dP(rr)};
+}
+
 inline double CulhamGeometry::my_sum(std::array<double, 1001>& f, int64_t start_idx, int64_t end_idx) const
 {
     int64_t i;
@@ -26,6 +26,13 @@ public:
     double dFy_dt(const double& r, const double& theta, const double& sin_theta,
                   const double& cos_theta) const override;
 
+    void evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta,
+                        const double* cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr,
+                        double* dFx_dt, double* dFy_dt) const override;
+    void evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta,
+                            const double cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr,
+                            double* dFx_dt, double* dFy_dt) const override;
+
 private:
     const double Rmax                         = 1.3;
     const double inverse_aspect_ratio_epsilon = 0.3;
@@ -33,6 +40,9 @@ private:
 
     void initializeGeometry();
     double factor_xi;
+
+    void evaluateJacobian(const double& r, const double& sin_theta, const double& cos_theta, double& dFx_dr,
+                          double& dFy_dr, double& dFx_dt, double& dFy_dt) const;
 };
 
 #include "czarnyGeometry.inl"
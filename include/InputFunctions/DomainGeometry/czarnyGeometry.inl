@@ -33,3 +33,38 @@ inline double CzarnyGeometry::dFy_dt(const double& r, const double& theta, const
     double temp = sqrt(inverse_aspect_ratio_epsilon * (2.0 * (r/Rmax) * cos_theta + inverse_aspect_ratio_epsilon) + 1.0);
     return (ellipticity_e * factor_xi * (r/Rmax) * cos_theta) / (2.0 - temp) - (ellipticity_e * factor_xi * inverse_aspect_ratio_epsilon * (r/Rmax) * (r/Rmax) * sin_theta * sin_theta) / (temp * (2.0 - temp) * (2.0 - temp));
 }
+
+// The Jacobian entries of a node share the square root, which the pointwise functions evaluate separately.
+inline void CzarnyGeometry::evaluateJacobian(const double& r, const double& sin_theta, const double& cos_theta, double& dFx_dr, double& dFy_dr, double& dFx_dt, double& dFy_dt) const {
+    const double temp = sqrt(inverse_aspect_ratio_epsilon * (2.0 * (r/Rmax) * cos_theta + inverse_aspect_ratio_epsilon) + 1.0);
+    dFx_dr = - (cos_theta) / (Rmax * temp);
+    dFy_dr = (ellipticity_e * factor_xi * sin_theta) / (Rmax * (2.0 - temp)) + (ellipticity_e * factor_xi * inverse_aspect_ratio_epsilon * r * sin_theta * cos_theta) / (Rmax * Rmax * temp * (2.0 - temp) * (2.0 - temp));
+    dFx_dt = ((r/Rmax) * sin_theta) / temp;
+    dFy_dt = (ellipticity_e * factor_xi * (r/Rmax) * cos_theta) / (2.0 - temp) - (ellipticity_e * factor_xi * inverse_aspect_ratio_epsilon * (r/Rmax) * (r/Rmax) * sin_theta * sin_theta) / (temp * (2.0 - temp) * (2.0 - temp));
+}
+
+inline void CzarnyGeometry::evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta, const double* cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const {
+    if (Fx) {
+        #pragma omp simd
+        for (int i = 0; i < count; i++) Fx[i] = CzarnyGeometry::Fx(r, theta[i], sin_theta[i], cos_theta[i]);
+    }
+    if (Fy) {
+        #pragma omp simd
+        for (int i = 0; i < count; i++) Fy[i] = CzarnyGeometry::Fy(r, theta[i], sin_theta[i], cos_theta[i]);
+    }
+    #pragma omp simd
+    for (int i = 0; i < count; i++) evaluateJacobian(r, sin_theta[i], cos_theta[i], dFx_dr[i], dFy_dr[i], dFx_dt[i], dFy_dt[i]);
+}
+
+inline void CzarnyGeometry::evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta, const double cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const {
+    if (Fx) {
+        #pragma omp simd
+        for (int i = 0; i < count; i++) Fx[i] = CzarnyGeometry::Fx(r[i], theta, sin_theta, cos_theta);
+    }
+    if (Fy) {
+        #pragma omp simd
+        for (int i = 0; i < count; i++) Fy[i] = CzarnyGeometry::Fy(r[i], theta, sin_theta, cos_theta);
+    }
+    #pragma omp simd
+    for (int i = 0; i < count; i++) evaluateJacobian(r[i], sin_theta, cos_theta, dFx_dr[i], dFy_dr[i], dFx_dt[i], dFy_dt[i]);
+}
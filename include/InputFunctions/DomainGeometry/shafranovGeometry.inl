@@ -32,4 +32,12 @@ inline double ShafranovGeometry::dFx_dt(const double& r, const double& theta, co
 // In earlier versions denoted by 'Jtt'
 inline double ShafranovGeometry::dFy_dt(const double& r, const double& theta, const double& sin_theta, const double& cos_theta) const {
     return ((elongation_kappa + 1.0) * r * cos_theta) / Rmax;
-}
\ No newline at end of file
+}
+
+inline void ShafranovGeometry::evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta, const double* cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const {
+    evaluateCircleWith(*this, r, count, theta, sin_theta, cos_theta, Fx, Fy, dFx_dr, dFy_dr, dFx_dt, dFy_dt);
+}
+
+inline void ShafranovGeometry::evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta, const double cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const {
+    evaluateRadialLineWith(*this, count, r, theta, sin_theta, cos_theta, Fx, Fy, dFx_dr, dFy_dr, dFx_dt, dFy_dt);
+}
@@ -0,0 +1,49 @@
+#pragma once
+
+#include <memory>
+#include <string>
+
+#include "../domainGeometry.h"
+#include "../tabulatedTable.h"
+
+/* Mapping (Fx, Fy) tabulated on a polar grid, e.g. R and Z of an equilibrium code. */
+
+class TabulatedGeometry : public DomainGeometry
+{
+public:
+    // The table at 'path' holds the two fields Fx and Fy, see TabulatedTable for the file layout.
+    // The file is mapped into memory and read in place.
+    explicit TabulatedGeometry(const std::string& path);
+
+    virtual ~TabulatedGeometry() = default;
+
+    double Fx(const double& r, const double& theta, const double& sin_theta, const double& cos_theta) const override;
+    double Fy(const double& r, const double& theta, const double& sin_theta, const double& cos_theta) const override;
+    double dFx_dr(const double& r, const double& theta, const double& sin_theta,
+                  const double& cos_theta) const override;
+    double dFy_dr(const double& r, const double& theta, const double& sin_theta,
+                  const double& cos_theta) const override;
+    double dFx_dt(const double& r, const double& theta, const double& sin_theta,
+                  const double& cos_theta) const override;
+    double dFy_dt(const double& r, const double& theta, const double& sin_theta,
+                  const double& cos_theta) const override;
+
+    void evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta,
+                        const double* cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr,
+                        double* dFx_dt, double* dFy_dt) const override;
+    void evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta,
+                            const double cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr,
+                            double* dFx_dt, double* dFy_dt) const override;
+
+    const TabulatedTable& table() const
+    {
+        return *table_;
+    }
+
+private:
+    // Shared, copies of the geometry use the same mapping.
+    std::shared_ptr<const TabulatedTable> table_;
+
+    void evaluate(const TabulatedTable::Stencil& radial, const TabulatedTable::Stencil& angular, double* Fx,
+                  double* Fy, double& dFx_dr, double& dFy_dr, double& dFx_dt, double& dFy_dt) const;
+};
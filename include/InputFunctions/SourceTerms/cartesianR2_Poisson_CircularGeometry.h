@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_Poisson_CircularGeometry : public SourceTerm
+class CartesianR2_Poisson_CircularGeometry : public BatchedSourceTerm<CartesianR2_Poisson_CircularGeometry>
 {
 public:
     CartesianR2_Poisson_CircularGeometry() = default;
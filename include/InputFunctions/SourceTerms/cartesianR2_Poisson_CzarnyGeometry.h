@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_Poisson_CzarnyGeometry : public SourceTerm
+class CartesianR2_Poisson_CzarnyGeometry : public BatchedSourceTerm<CartesianR2_Poisson_CzarnyGeometry>
 {
 public:
     CartesianR2_Poisson_CzarnyGeometry() = default;
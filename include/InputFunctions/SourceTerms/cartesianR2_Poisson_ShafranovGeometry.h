@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_Poisson_ShafranovGeometry : public SourceTerm
+class CartesianR2_Poisson_ShafranovGeometry : public BatchedSourceTerm<CartesianR2_Poisson_ShafranovGeometry>
 {
 public:
     CartesianR2_Poisson_ShafranovGeometry() = default;
@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_SonnendruckerGyro_CircularGeometry : public SourceTerm
+class CartesianR2_SonnendruckerGyro_CircularGeometry
+    : public BatchedSourceTerm<CartesianR2_SonnendruckerGyro_CircularGeometry>
 {
 public:
     CartesianR2_SonnendruckerGyro_CircularGeometry() = default;
@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_SonnendruckerGyro_CzarnyGeometry : public SourceTerm
+class CartesianR2_SonnendruckerGyro_CzarnyGeometry
+    : public BatchedSourceTerm<CartesianR2_SonnendruckerGyro_CzarnyGeometry>
 {
 public:
     CartesianR2_SonnendruckerGyro_CzarnyGeometry() = default;
@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_SonnendruckerGyro_ShafranovGeometry : public SourceTerm
+class CartesianR2_SonnendruckerGyro_ShafranovGeometry
+    : public BatchedSourceTerm<CartesianR2_SonnendruckerGyro_ShafranovGeometry>
 {
 public:
     CartesianR2_SonnendruckerGyro_ShafranovGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_Sonnendrucker_CircularGeometry : public SourceTerm
+class CartesianR2_Sonnendrucker_CircularGeometry : public BatchedSourceTerm<CartesianR2_Sonnendrucker_CircularGeometry>
 {
 public:
     CartesianR2_Sonnendrucker_CircularGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_Sonnendrucker_CzarnyGeometry : public SourceTerm
+class CartesianR2_Sonnendrucker_CzarnyGeometry : public BatchedSourceTerm<CartesianR2_Sonnendrucker_CzarnyGeometry>
 {
 public:
     CartesianR2_Sonnendrucker_CzarnyGeometry() = default;
@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_Sonnendrucker_ShafranovGeometry : public SourceTerm
+class CartesianR2_Sonnendrucker_ShafranovGeometry
+    : public BatchedSourceTerm<CartesianR2_Sonnendrucker_ShafranovGeometry>
 {
 public:
     CartesianR2_Sonnendrucker_ShafranovGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_ZoniGyro_CircularGeometry : public SourceTerm
+class CartesianR2_ZoniGyro_CircularGeometry : public BatchedSourceTerm<CartesianR2_ZoniGyro_CircularGeometry>
 {
 public:
     CartesianR2_ZoniGyro_CircularGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_ZoniGyro_CzarnyGeometry : public SourceTerm
+class CartesianR2_ZoniGyro_CzarnyGeometry : public BatchedSourceTerm<CartesianR2_ZoniGyro_CzarnyGeometry>
 {
 public:
     CartesianR2_ZoniGyro_CzarnyGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_ZoniGyro_ShafranovGeometry : public SourceTerm
+class CartesianR2_ZoniGyro_ShafranovGeometry : public BatchedSourceTerm<CartesianR2_ZoniGyro_ShafranovGeometry>
 {
 public:
     CartesianR2_ZoniGyro_ShafranovGeometry() = default;
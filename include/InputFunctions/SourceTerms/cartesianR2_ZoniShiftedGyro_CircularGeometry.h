@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_ZoniShiftedGyro_CircularGeometry : public SourceTerm
+class CartesianR2_ZoniShiftedGyro_CircularGeometry
+    : public BatchedSourceTerm<CartesianR2_ZoniShiftedGyro_CircularGeometry>
 {
 public:
     CartesianR2_ZoniShiftedGyro_CircularGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_ZoniShiftedGyro_CzarnyGeometry : public SourceTerm
+class CartesianR2_ZoniShiftedGyro_CzarnyGeometry : public BatchedSourceTerm<CartesianR2_ZoniShiftedGyro_CzarnyGeometry>
 {
 public:
     CartesianR2_ZoniShiftedGyro_CzarnyGeometry() = default;
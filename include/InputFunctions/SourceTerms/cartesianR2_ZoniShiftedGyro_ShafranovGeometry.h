@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_ZoniShiftedGyro_ShafranovGeometry : public SourceTerm
+class CartesianR2_ZoniShiftedGyro_ShafranovGeometry
+    : public BatchedSourceTerm<CartesianR2_ZoniShiftedGyro_ShafranovGeometry>
 {
 public:
     CartesianR2_ZoniShiftedGyro_ShafranovGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_ZoniShifted_CircularGeometry : public SourceTerm
+class CartesianR2_ZoniShifted_CircularGeometry : public BatchedSourceTerm<CartesianR2_ZoniShifted_CircularGeometry>
 {
 public:
     CartesianR2_ZoniShifted_CircularGeometry() = default;
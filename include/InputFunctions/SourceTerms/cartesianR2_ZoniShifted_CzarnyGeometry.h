@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_ZoniShifted_CzarnyGeometry : public SourceTerm
+class CartesianR2_ZoniShifted_CzarnyGeometry : public BatchedSourceTerm<CartesianR2_ZoniShifted_CzarnyGeometry>
 {
 public:
     CartesianR2_ZoniShifted_CzarnyGeometry() = default;
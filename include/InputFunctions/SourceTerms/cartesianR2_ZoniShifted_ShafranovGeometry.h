@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_ZoniShifted_ShafranovGeometry : public SourceTerm
+class CartesianR2_ZoniShifted_ShafranovGeometry : public BatchedSourceTerm<CartesianR2_ZoniShifted_ShafranovGeometry>
 {
 public:
     CartesianR2_ZoniShifted_ShafranovGeometry() = default;
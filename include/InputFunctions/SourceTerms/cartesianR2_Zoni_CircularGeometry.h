@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_Zoni_CircularGeometry : public SourceTerm
+class CartesianR2_Zoni_CircularGeometry : public BatchedSourceTerm<CartesianR2_Zoni_CircularGeometry>
 {
 public:
     CartesianR2_Zoni_CircularGeometry() = default;
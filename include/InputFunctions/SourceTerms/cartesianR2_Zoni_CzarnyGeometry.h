@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_Zoni_CzarnyGeometry : public SourceTerm
+class CartesianR2_Zoni_CzarnyGeometry : public BatchedSourceTerm<CartesianR2_Zoni_CzarnyGeometry>
 {
 public:
     CartesianR2_Zoni_CzarnyGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR2_Zoni_ShafranovGeometry : public SourceTerm
+class CartesianR2_Zoni_ShafranovGeometry : public BatchedSourceTerm<CartesianR2_Zoni_ShafranovGeometry>
 {
 public:
     CartesianR2_Zoni_ShafranovGeometry() = default;
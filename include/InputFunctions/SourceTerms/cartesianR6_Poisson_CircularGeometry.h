@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_Poisson_CircularGeometry : public SourceTerm
+class CartesianR6_Poisson_CircularGeometry : public BatchedSourceTerm<CartesianR6_Poisson_CircularGeometry>
 {
 public:
     CartesianR6_Poisson_CircularGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_Poisson_CzarnyGeometry : public SourceTerm
+class CartesianR6_Poisson_CzarnyGeometry : public BatchedSourceTerm<CartesianR6_Poisson_CzarnyGeometry>
 {
 public:
     CartesianR6_Poisson_CzarnyGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_Poisson_ShafranovGeometry : public SourceTerm
+class CartesianR6_Poisson_ShafranovGeometry : public BatchedSourceTerm<CartesianR6_Poisson_ShafranovGeometry>
 {
 public:
     CartesianR6_Poisson_ShafranovGeometry() = default;
@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_SonnendruckerGyro_CzarnyGeometry : public SourceTerm
+class CartesianR6_SonnendruckerGyro_CzarnyGeometry
+    : public BatchedSourceTerm<CartesianR6_SonnendruckerGyro_CzarnyGeometry>
 {
 public:
     CartesianR6_SonnendruckerGyro_CzarnyGeometry() = default;
@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_SonnendruckerGyro_ShafranovGeometry : public SourceTerm
+class CartesianR6_SonnendruckerGyro_ShafranovGeometry
+    : public BatchedSourceTerm<CartesianR6_SonnendruckerGyro_ShafranovGeometry>
 {
 public:
     CartesianR6_SonnendruckerGyro_ShafranovGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_Sonnendrucker_CircularGeometry : public SourceTerm
+class CartesianR6_Sonnendrucker_CircularGeometry : public BatchedSourceTerm<CartesianR6_Sonnendrucker_CircularGeometry>
 {
 public:
     CartesianR6_Sonnendrucker_CircularGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_Sonnendrucker_CzarnyGeometry : public SourceTerm
+class CartesianR6_Sonnendrucker_CzarnyGeometry : public BatchedSourceTerm<CartesianR6_Sonnendrucker_CzarnyGeometry>
 {
 public:
     CartesianR6_Sonnendrucker_CzarnyGeometry() = default;
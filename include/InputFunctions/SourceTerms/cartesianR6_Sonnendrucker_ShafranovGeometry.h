@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_Sonnendrucker_ShafranovGeometry : public SourceTerm
+class CartesianR6_Sonnendrucker_ShafranovGeometry
+    : public BatchedSourceTerm<CartesianR6_Sonnendrucker_ShafranovGeometry>
 {
 public:
     CartesianR6_Sonnendrucker_ShafranovGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_ZoniGyro_CircularGeometry : public SourceTerm
+class CartesianR6_ZoniGyro_CircularGeometry : public BatchedSourceTerm<CartesianR6_ZoniGyro_CircularGeometry>
 {
 public:
     CartesianR6_ZoniGyro_CircularGeometry() = default;
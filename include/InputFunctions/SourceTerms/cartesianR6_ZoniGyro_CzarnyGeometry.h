@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_ZoniGyro_CzarnyGeometry : public SourceTerm
+class CartesianR6_ZoniGyro_CzarnyGeometry : public BatchedSourceTerm<CartesianR6_ZoniGyro_CzarnyGeometry>
 {
 public:
     CartesianR6_ZoniGyro_CzarnyGeometry() = default;
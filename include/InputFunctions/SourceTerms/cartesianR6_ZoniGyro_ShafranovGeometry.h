@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_ZoniGyro_ShafranovGeometry : public SourceTerm
+class CartesianR6_ZoniGyro_ShafranovGeometry : public BatchedSourceTerm<CartesianR6_ZoniGyro_ShafranovGeometry>
 {
 public:
     CartesianR6_ZoniGyro_ShafranovGeometry() = default;
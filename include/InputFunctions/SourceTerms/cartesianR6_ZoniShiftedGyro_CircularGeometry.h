@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_ZoniShiftedGyro_CircularGeometry : public SourceTerm
+class CartesianR6_ZoniShiftedGyro_CircularGeometry
+    : public BatchedSourceTerm<CartesianR6_ZoniShiftedGyro_CircularGeometry>
 {
 public:
     CartesianR6_ZoniShiftedGyro_CircularGeometry() = default;
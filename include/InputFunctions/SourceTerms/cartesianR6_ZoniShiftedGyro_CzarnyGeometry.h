@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_ZoniShiftedGyro_CzarnyGeometry : public SourceTerm
+class CartesianR6_ZoniShiftedGyro_CzarnyGeometry : public BatchedSourceTerm<CartesianR6_ZoniShiftedGyro_CzarnyGeometry>
 {
 public:
     CartesianR6_ZoniShiftedGyro_CzarnyGeometry() = default;
@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_ZoniShiftedGyro_ShafranovGeometry : public SourceTerm
+class CartesianR6_ZoniShiftedGyro_ShafranovGeometry
+    : public BatchedSourceTerm<CartesianR6_ZoniShiftedGyro_ShafranovGeometry>
 {
 public:
     CartesianR6_ZoniShiftedGyro_ShafranovGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_ZoniShifted_CircularGeometry : public SourceTerm
+class CartesianR6_ZoniShifted_CircularGeometry : public BatchedSourceTerm<CartesianR6_ZoniShifted_CircularGeometry>
 {
 public:
     CartesianR6_ZoniShifted_CircularGeometry() = default;
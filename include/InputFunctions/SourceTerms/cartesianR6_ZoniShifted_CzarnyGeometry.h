@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_ZoniShifted_CzarnyGeometry : public SourceTerm
+class CartesianR6_ZoniShifted_CzarnyGeometry : public BatchedSourceTerm<CartesianR6_ZoniShifted_CzarnyGeometry>
 {
 public:
     CartesianR6_ZoniShifted_CzarnyGeometry() = default;
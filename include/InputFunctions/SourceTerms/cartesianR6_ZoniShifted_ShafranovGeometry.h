@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_ZoniShifted_ShafranovGeometry : public SourceTerm
+class CartesianR6_ZoniShifted_ShafranovGeometry : public BatchedSourceTerm<CartesianR6_ZoniShifted_ShafranovGeometry>
 {
 public:
     CartesianR6_ZoniShifted_ShafranovGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_Zoni_CircularGeometry : public SourceTerm
+class CartesianR6_Zoni_CircularGeometry : public BatchedSourceTerm<CartesianR6_Zoni_CircularGeometry>
 {
 public:
     CartesianR6_Zoni_CircularGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_Zoni_CzarnyGeometry : public SourceTerm
+class CartesianR6_Zoni_CzarnyGeometry : public BatchedSourceTerm<CartesianR6_Zoni_CzarnyGeometry>
 {
 public:
     CartesianR6_Zoni_CzarnyGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class CartesianR6_Zoni_ShafranovGeometry : public SourceTerm
+class CartesianR6_Zoni_ShafranovGeometry : public BatchedSourceTerm<CartesianR6_Zoni_ShafranovGeometry>
 {
 public:
     CartesianR6_Zoni_ShafranovGeometry() = default;
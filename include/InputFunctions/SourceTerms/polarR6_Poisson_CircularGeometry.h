@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_Poisson_CircularGeometry : public SourceTerm
+class PolarR6_Poisson_CircularGeometry : public BatchedSourceTerm<PolarR6_Poisson_CircularGeometry>
 {
 public:
     PolarR6_Poisson_CircularGeometry() = default;
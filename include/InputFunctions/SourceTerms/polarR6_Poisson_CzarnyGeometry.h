@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_Poisson_CzarnyGeometry : public SourceTerm
+class PolarR6_Poisson_CzarnyGeometry : public BatchedSourceTerm<PolarR6_Poisson_CzarnyGeometry>
 {
 public:
     PolarR6_Poisson_CzarnyGeometry() = default;
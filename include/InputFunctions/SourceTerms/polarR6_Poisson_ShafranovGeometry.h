@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_Poisson_ShafranovGeometry : public SourceTerm
+class PolarR6_Poisson_ShafranovGeometry : public BatchedSourceTerm<PolarR6_Poisson_ShafranovGeometry>
 {
 public:
     PolarR6_Poisson_ShafranovGeometry() = default;
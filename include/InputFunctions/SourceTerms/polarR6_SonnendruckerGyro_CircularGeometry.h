@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_SonnendruckerGyro_CircularGeometry : public SourceTerm
+class PolarR6_SonnendruckerGyro_CircularGeometry : public BatchedSourceTerm<PolarR6_SonnendruckerGyro_CircularGeometry>
 {
 public:
     PolarR6_SonnendruckerGyro_CircularGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_SonnendruckerGyro_CzarnyGeometry : public SourceTerm
+class PolarR6_SonnendruckerGyro_CzarnyGeometry : public BatchedSourceTerm<PolarR6_SonnendruckerGyro_CzarnyGeometry>
 {
 public:
     PolarR6_SonnendruckerGyro_CzarnyGeometry() = default;
@@ -4,7 +4,8 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_SonnendruckerGyro_ShafranovGeometry : public SourceTerm
+class PolarR6_SonnendruckerGyro_ShafranovGeometry
+    : public BatchedSourceTerm<PolarR6_SonnendruckerGyro_ShafranovGeometry>
 {
 public:
     PolarR6_SonnendruckerGyro_ShafranovGeometry() = default;
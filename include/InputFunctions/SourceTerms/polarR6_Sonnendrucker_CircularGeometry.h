@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_Sonnendrucker_CircularGeometry : public SourceTerm
+class PolarR6_Sonnendrucker_CircularGeometry : public BatchedSourceTerm<PolarR6_Sonnendrucker_CircularGeometry>
 {
 public:
     PolarR6_Sonnendrucker_CircularGeometry() = default;
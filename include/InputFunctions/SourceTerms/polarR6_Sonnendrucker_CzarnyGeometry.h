@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_Sonnendrucker_CzarnyGeometry : public SourceTerm
+class PolarR6_Sonnendrucker_CzarnyGeometry : public BatchedSourceTerm<PolarR6_Sonnendrucker_CzarnyGeometry>
 {
 public:
     PolarR6_Sonnendrucker_CzarnyGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_Sonnendrucker_ShafranovGeometry : public SourceTerm
+class PolarR6_Sonnendrucker_ShafranovGeometry : public BatchedSourceTerm<PolarR6_Sonnendrucker_ShafranovGeometry>
 {
 public:
     PolarR6_Sonnendrucker_ShafranovGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_ZoniGyro_CircularGeometry : public SourceTerm
+class PolarR6_ZoniGyro_CircularGeometry : public BatchedSourceTerm<PolarR6_ZoniGyro_CircularGeometry>
 {
 public:
     PolarR6_ZoniGyro_CircularGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_ZoniGyro_CzarnyGeometry : public SourceTerm
+class PolarR6_ZoniGyro_CzarnyGeometry : public BatchedSourceTerm<PolarR6_ZoniGyro_CzarnyGeometry>
 {
 public:
     PolarR6_ZoniGyro_CzarnyGeometry() = default;
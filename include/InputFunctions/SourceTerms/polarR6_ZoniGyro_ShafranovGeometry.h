@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_ZoniGyro_ShafranovGeometry : public SourceTerm
+class PolarR6_ZoniGyro_ShafranovGeometry : public BatchedSourceTerm<PolarR6_ZoniGyro_ShafranovGeometry>
 {
 public:
     PolarR6_ZoniGyro_ShafranovGeometry() = default;
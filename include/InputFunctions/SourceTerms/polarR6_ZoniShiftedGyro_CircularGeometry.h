@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_ZoniShiftedGyro_CircularGeometry : public SourceTerm
+class PolarR6_ZoniShiftedGyro_CircularGeometry : public BatchedSourceTerm<PolarR6_ZoniShiftedGyro_CircularGeometry>
 {
 public:
     PolarR6_ZoniShiftedGyro_CircularGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_ZoniShiftedGyro_CulhamGeometry : public SourceTerm
+class PolarR6_ZoniShiftedGyro_CulhamGeometry : public BatchedSourceTerm<PolarR6_ZoniShiftedGyro_CulhamGeometry>
 {
 public:
     PolarR6_ZoniShiftedGyro_CulhamGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_ZoniShiftedGyro_CzarnyGeometry : public SourceTerm
+class PolarR6_ZoniShiftedGyro_CzarnyGeometry : public BatchedSourceTerm<PolarR6_ZoniShiftedGyro_CzarnyGeometry>
 {
 public:
     PolarR6_ZoniShiftedGyro_CzarnyGeometry() = default;
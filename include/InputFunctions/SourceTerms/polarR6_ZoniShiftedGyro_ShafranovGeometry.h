@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_ZoniShiftedGyro_ShafranovGeometry : public SourceTerm
+class PolarR6_ZoniShiftedGyro_ShafranovGeometry : public BatchedSourceTerm<PolarR6_ZoniShiftedGyro_ShafranovGeometry>
 {
 public:
     PolarR6_ZoniShiftedGyro_ShafranovGeometry() = default;
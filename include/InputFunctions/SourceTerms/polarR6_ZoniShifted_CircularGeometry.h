@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_ZoniShifted_CircularGeometry : public SourceTerm
+class PolarR6_ZoniShifted_CircularGeometry : public BatchedSourceTerm<PolarR6_ZoniShifted_CircularGeometry>
 {
 public:
     PolarR6_ZoniShifted_CircularGeometry() = default;
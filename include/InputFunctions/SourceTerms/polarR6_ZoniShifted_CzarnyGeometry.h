@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_ZoniShifted_CzarnyGeometry : public SourceTerm
+class PolarR6_ZoniShifted_CzarnyGeometry : public BatchedSourceTerm<PolarR6_ZoniShifted_CzarnyGeometry>
 {
 public:
     PolarR6_ZoniShifted_CzarnyGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_ZoniShifted_ShafranovGeometry : public SourceTerm
+class PolarR6_ZoniShifted_ShafranovGeometry : public BatchedSourceTerm<PolarR6_ZoniShifted_ShafranovGeometry>
 {
 public:
     PolarR6_ZoniShifted_ShafranovGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_Zoni_CircularGeometry : public SourceTerm
+class PolarR6_Zoni_CircularGeometry : public BatchedSourceTerm<PolarR6_Zoni_CircularGeometry>
 {
 public:
     PolarR6_Zoni_CircularGeometry() = default;
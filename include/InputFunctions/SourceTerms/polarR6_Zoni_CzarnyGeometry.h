@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_Zoni_CzarnyGeometry : public SourceTerm
+class PolarR6_Zoni_CzarnyGeometry : public BatchedSourceTerm<PolarR6_Zoni_CzarnyGeometry>
 {
 public:
     PolarR6_Zoni_CzarnyGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class PolarR6_Zoni_ShafranovGeometry : public SourceTerm
+class PolarR6_Zoni_ShafranovGeometry : public BatchedSourceTerm<PolarR6_Zoni_ShafranovGeometry>
 {
 public:
     PolarR6_Zoni_ShafranovGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class Refined_ZoniShiftedGyro_CircularGeometry : public SourceTerm
+class Refined_ZoniShiftedGyro_CircularGeometry : public BatchedSourceTerm<Refined_ZoniShiftedGyro_CircularGeometry>
 {
 public:
     Refined_ZoniShiftedGyro_CircularGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class Refined_ZoniShiftedGyro_CulhamGeometry : public SourceTerm
+class Refined_ZoniShiftedGyro_CulhamGeometry : public BatchedSourceTerm<Refined_ZoniShiftedGyro_CulhamGeometry>
 {
 public:
     Refined_ZoniShiftedGyro_CulhamGeometry() = default;
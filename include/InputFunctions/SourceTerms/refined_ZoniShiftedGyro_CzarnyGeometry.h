@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class Refined_ZoniShiftedGyro_CzarnyGeometry : public SourceTerm
+class Refined_ZoniShiftedGyro_CzarnyGeometry : public BatchedSourceTerm<Refined_ZoniShiftedGyro_CzarnyGeometry>
 {
 public:
     Refined_ZoniShiftedGyro_CzarnyGeometry() = default;
@@ -4,7 +4,7 @@
 
 #include "../sourceTerm.h"
 
-class Refined_ZoniShiftedGyro_ShafranovGeometry : public SourceTerm
+class Refined_ZoniShiftedGyro_ShafranovGeometry : public BatchedSourceTerm<Refined_ZoniShiftedGyro_ShafranovGeometry>
 {
 public:
     Refined_ZoniShiftedGyro_ShafranovGeometry() = default;
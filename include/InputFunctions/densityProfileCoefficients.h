@@ -1,5 +1,7 @@
 #pragma once
 
+#include <algorithm>
+
 class DensityProfileCoefficients
 {
 public:
@@ -9,6 +11,89 @@ public:
     virtual double alpha(const double& r, const double& theta) const = 0;
     virtual double beta(const double& r, const double& theta) const  = 0;
 
+    // Batched evaluation of alpha and beta at 'count' nodes of the circle with radius r, respectively of the radial
+    // line with angle theta. alpha or beta may be nullptr if only one of them is needed.
+    virtual void evaluateCircle(const double r, const int count, const double* theta, double* alpha,
+                                double* beta) const;
+    virtual void evaluateRadialLine(const int count, const double* r, const double theta, double* alpha,
+                                    double* beta) const;
+
     // Only used in custom mesh generation -> refinement_radius
     virtual double getAlphaJump() const = 0;
-};
\ No newline at end of file
+
+    // True if alpha and beta only depend on r.
+    virtual bool isAngleIndependent() const
+    {
+        return false;
+    }
+};
+
+inline void DensityProfileCoefficients::evaluateCircle(const double r, const int count, const double* theta,
+                                                       double* alpha, double* beta) const
+{
+    for (int i = 0; i < count; i++) {
+        if (alpha)
+            alpha[i] = this->alpha(r, theta[i]);
+        if (beta)
+            beta[i] = this->beta(r, theta[i]);
+    }
+}
+
+inline void DensityProfileCoefficients::evaluateRadialLine(const int count, const double* r, const double theta,
+                                                           double* alpha, double* beta) const
+{
+    for (int i = 0; i < count; i++) {
+        if (alpha)
+            alpha[i] = this->alpha(r[i], theta);
+        if (beta)
+            beta[i] = this->beta(r[i], theta);
+    }
+}
+
+// Coefficients alpha and beta which only depend on r. They are evaluated once per circle and by loops over the
+// pointwise alpha and beta of Derived along radial lines. The qualified calls bypass the virtual dispatch,
+// so the generated expressions can be inlined and vectorized.
+template <class Derived>
+class AngleIndependentDensityProfileCoefficients : public DensityProfileCoefficients
+{
+public:
+    void evaluateCircle(const double r, const int count, const double* theta, double* alpha,
+                        double* beta) const override;
+    void evaluateRadialLine(const int count, const double* r, const double theta, double* alpha,
+                            double* beta) const override;
+
+    bool isAngleIndependent() const override
+    {
+        return true;
+    }
+};
+
+template <class Derived>
+inline void AngleIndependentDensityProfileCoefficients<Derived>::evaluateCircle(const double r, const int count,
+                                                                                const double* theta, double* alpha,
+                                                                                double* beta) const
+{
+    const Derived& coefficients = static_cast<const Derived&>(*this);
+    if (alpha)
+        std::fill_n(alpha, count, coefficients.Derived::alpha(r, 0.0));
+    if (beta)
+        std::fill_n(beta, count, coefficients.Derived::beta(r, 0.0));
+}
+
+template <class Derived>
+inline void AngleIndependentDensityProfileCoefficients<Derived>::evaluateRadialLine(const int count, const double* r,
+                                                                                    const double theta, double* alpha,
+                                                                                    double* beta) const
+{
+    const Derived& coefficients = static_cast<const Derived&>(*this);
+    if (alpha) {
+#pragma omp simd
+        for (int i = 0; i < count; i++)
+            alpha[i] = coefficients.Derived::alpha(r[i], theta);
+    }
+    if (beta) {
+#pragma omp simd
+        for (int i = 0; i < count; i++)
+            beta[i] = coefficients.Derived::beta(r[i], theta);
+    }
+}
@@ -32,4 +32,116 @@ public:
                           const double& cos_theta) const = 0;
     virtual double dFy_dt(const double& r, const double& theta, const double& sin_theta,
                           const double& cos_theta) const = 0;
+
+    // Batched evaluation of Fx, Fy and the Jacobian entries at 'count' nodes of the circle with radius r,
+    // respectively of the radial line with angle theta. Fx and Fy may be nullptr if only the Jacobian is needed.
+    // The default implementations call the functions above per node. Geometries should override them to avoid
+    // the virtual calls per node and to hoist the terms which are constant along the line.
+    virtual void evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta,
+                                const double* cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr,
+                                double* dFx_dt, double* dFy_dt) const;
+    virtual void evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta,
+                                    const double cos_theta, double* Fx, double* Fy, double* dFx_dr, double* dFy_dr,
+                                    double* dFx_dt, double* dFy_dt) const;
+
+    // True if the metric terms of the mapping only depend on r, e.g. for concentric circles.
+    // LevelCache then stores them as radial profiles, see LevelCache::radialProfiles().
+    virtual bool isAngleIndependent() const
+    {
+        return false;
+    }
+
+protected:
+    // Batched evaluation by the pointwise functions of 'Geometry'. The qualified calls bypass the virtual
+    // dispatch, so for inline pointwise functions the loops can be vectorized.
+    template <typename Geometry>
+    static void evaluateCircleWith(const Geometry& geometry, const double r, const int count, const double* theta,
+                                   const double* sin_theta, const double* cos_theta, double* Fx, double* Fy,
+                                   double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt);
+    template <typename Geometry>
+    static void evaluateRadialLineWith(const Geometry& geometry, const int count, const double* r, const double theta,
+                                       const double sin_theta, const double cos_theta, double* Fx, double* Fy,
+                                       double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt);
 };
+
+inline void DomainGeometry::evaluateCircle(const double r, const int count, const double* theta,
+                                           const double* sin_theta, const double* cos_theta, double* Fx, double* Fy,
+                                           double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const
+{
+    for (int i = 0; i < count; i++) {
+        if (Fx)
+            Fx[i] = this->Fx(r, theta[i], sin_theta[i], cos_theta[i]);
+        if (Fy)
+            Fy[i] = this->Fy(r, theta[i], sin_theta[i], cos_theta[i]);
+        dFx_dr[i] = this->dFx_dr(r, theta[i], sin_theta[i], cos_theta[i]);
+        dFy_dr[i] = this->dFy_dr(r, theta[i], sin_theta[i], cos_theta[i]);
+        dFx_dt[i] = this->dFx_dt(r, theta[i], sin_theta[i], cos_theta[i]);
+        dFy_dt[i] = this->dFy_dt(r, theta[i], sin_theta[i], cos_theta[i]);
+    }
+}
+
+inline void DomainGeometry::evaluateRadialLine(const int count, const double* r, const double theta,
+                                               const double sin_theta, const double cos_theta, double* Fx, double* Fy,
+                                               double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const
+{
+    for (int i = 0; i < count; i++) {
+        if (Fx)
+            Fx[i] = this->Fx(r[i], theta, sin_theta, cos_theta);
+        if (Fy)
+            Fy[i] = this->Fy(r[i], theta, sin_theta, cos_theta);
+        dFx_dr[i] = this->dFx_dr(r[i], theta, sin_theta, cos_theta);
+        dFy_dr[i] = this->dFy_dr(r[i], theta, sin_theta, cos_theta);
+        dFx_dt[i] = this->dFx_dt(r[i], theta, sin_theta, cos_theta);
+        dFy_dt[i] = this->dFy_dt(r[i], theta, sin_theta, cos_theta);
+    }
+}
+
+template <typename Geometry>
+inline void DomainGeometry::evaluateCircleWith(const Geometry& geometry, const double r, const int count,
+                                               const double* theta, const double* sin_theta, const double* cos_theta,
+                                               double* Fx, double* Fy, double* dFx_dr, double* dFy_dr, double* dFx_dt,
+                                               double* dFy_dt)
+{
+    if (Fx) {
+#pragma omp simd
+        for (int i = 0; i < count; i++)
+            Fx[i] = geometry.Geometry::Fx(r, theta[i], sin_theta[i], cos_theta[i]);
+    }
+    if (Fy) {
+#pragma omp simd
+        for (int i = 0; i < count; i++)
+            Fy[i] = geometry.Geometry::Fy(r, theta[i], sin_theta[i], cos_theta[i]);
+    }
+#pragma omp simd
+    for (int i = 0; i < count; i++) {
+        dFx_dr[i] = geometry.Geometry::dFx_dr(r, theta[i], sin_theta[i], cos_theta[i]);
+        dFy_dr[i] = geometry.Geometry::dFy_dr(r, theta[i], sin_theta[i], cos_theta[i]);
+        dFx_dt[i] = geometry.Geometry::dFx_dt(r, theta[i], sin_theta[i], cos_theta[i]);
+        dFy_dt[i] = geometry.Geometry::dFy_dt(r, theta[i], sin_theta[i], cos_theta[i]);
+    }
+}
+
+template <typename Geometry>
+inline void DomainGeometry::evaluateRadialLineWith(const Geometry& geometry, const int count, const double* r,
+                                                   const double theta, const double sin_theta, const double cos_theta,
+                                                   double* Fx, double* Fy, double* dFx_dr, double* dFy_dr,
+                                                   double* dFx_dt, double* dFy_dt)
+{
+    if (Fx) {
+#pragma omp simd
+        for (int i = 0; i < count; i++)
+            Fx[i] = geometry.Geometry::Fx(r[i], theta, sin_theta, cos_theta);
+    }
+    if (Fy) {
+#pragma omp simd
+        for (int i = 0; i < count; i++)
+            Fy[i] = geometry.Geometry::Fy(r[i], theta, sin_theta, cos_theta);
+    }
+#pragma omp simd
+    for (int i = 0; i < count; i++) {
+        dFx_dr[i] = geometry.Geometry::dFx_dr(r[i], theta, sin_theta, cos_theta);
+        dFy_dr[i] = geometry.Geometry::dFy_dr(r[i], theta, sin_theta, cos_theta);
+        dFx_dt[i] = geometry.Geometry::dFx_dt(r[i], theta, sin_theta, cos_theta);
+        dFy_dt[i] = geometry.Geometry::dFy_dt(r[i], theta, sin_theta, cos_theta);
+    }
+}
@@ -8,4 +8,63 @@ public:
 
     virtual double rhs_f(const double& r, const double& theta, const double& sin_theta,
                          const double& cos_theta) const = 0;
-};
\ No newline at end of file
+
+    // Batched evaluation of rhs_f at 'count' nodes of the circle with radius r, respectively of the radial line
+    // with angle theta.
+    virtual void evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta,
+                                const double* cos_theta, double* rhs_f) const;
+    virtual void evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta,
+                                    const double cos_theta, double* rhs_f) const;
+};
+
+inline void SourceTerm::evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta,
+                                       const double* cos_theta, double* rhs_f) const
+{
+    for (int i = 0; i < count; i++) {
+        rhs_f[i] = this->rhs_f(r, theta[i], sin_theta[i], cos_theta[i]);
+    }
+}
+
+inline void SourceTerm::evaluateRadialLine(const int count, const double* r, const double theta,
+                                           const double sin_theta, const double cos_theta, double* rhs_f) const
+{
+    for (int i = 0; i < count; i++) {
+        rhs_f[i] = this->rhs_f(r[i], theta, sin_theta, cos_theta);
+    }
+}
+
+// Source term whose batched evaluation loops over the pointwise rhs_f of Derived. The qualified call bypasses the
+// virtual dispatch, so the generated expressions can be inlined and vectorized.
+template <class Derived>
+class BatchedSourceTerm : public SourceTerm
+{
+public:
+    void evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta,
+                        const double* cos_theta, double* rhs_f) const override;
+    void evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta,
+                            const double cos_theta, double* rhs_f) const override;
+};
+
+template <class Derived>
+inline void BatchedSourceTerm<Derived>::evaluateCircle(const double r, const int count, const double* theta,
+                                                       const double* sin_theta, const double* cos_theta,
+                                                       double* rhs_f) const
+{
+    const Derived& source = static_cast<const Derived&>(*this);
+#pragma omp simd
+    for (int i = 0; i < count; i++) {
+        rhs_f[i] = source.Derived::rhs_f(r, theta[i], sin_theta[i], cos_theta[i]);
+    }
+}
+
+template <class Derived>
+inline void BatchedSourceTerm<Derived>::evaluateRadialLine(const int count, const double* r, const double theta,
+                                                           const double sin_theta, const double cos_theta,
+                                                           double* rhs_f) const
+{
+    const Derived& source = static_cast<const Derived&>(*this);
+#pragma omp simd
+    for (int i = 0; i < count; i++) {
+        rhs_f[i] = source.Derived::rhs_f(r[i], theta, sin_theta, cos_theta);
+    }
+}
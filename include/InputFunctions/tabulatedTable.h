@@ -0,0 +1,243 @@
+#pragma once
+
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <cstring>
+#include <fstream>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+/**
+ * @class TabulatedTable
+ * @brief Read-only memory mapping of fields tabulated on a polar (r, θ) grid.
+ *
+ * Binary layout in native byte order:
+ *
+ *     char[8]  "GMGPTAB1"
+ *     int32    nr, ntheta, fields, 0
+ *     double   r[nr]                        strictly increasing radii
+ *     double   values[fields][nr][ntheta]   at theta_j = 2π j / ntheta
+ *
+ * Between the nodes the fields are interpolated by cubic Hermite polynomials whose slopes are the central
+ * differences of the neighbouring nodes (Catmull-Rom splines), periodic in θ and one-sided at the first and last
+ * radius. They only need the tabulated values, so the table is used in place without copies or precomputed spline
+ * coefficients. A table with ntheta = 1 only depends on r.
+ */
+class TabulatedTable
+{
+public:
+    explicit TabulatedTable(const std::string& path);
+    ~TabulatedTable();
+
+    TabulatedTable(const TabulatedTable&)            = delete;
+    TabulatedTable& operator=(const TabulatedTable&) = delete;
+
+    // Writes a table in the layout above, 'values' holds fields * nr * ntheta entries.
+    static void write(const std::string& path, const std::vector<double>& radii, const int ntheta, const int fields,
+                      const std::vector<double>& values);
+
+    int nr() const
+    {
+        return nr_;
+    }
+    int ntheta() const
+    {
+        return ntheta_;
+    }
+    int fields() const
+    {
+        return fields_;
+    }
+    const double* radii() const
+    {
+        return radii_;
+    }
+
+    // Interpolation weights of the four table nodes around r, respectively theta, and of their derivatives.
+    // Nodes outside of the table have weight zero.
+    struct Stencil {
+        int index[4];
+        double weight[4];
+        double derivative[4];
+    };
+    Stencil radialStencil(const double r) const;
+    Stencil angularStencil(const double theta) const;
+
+    double value(const int field, const Stencil& radial, const Stencil& angular) const;
+    void interpolate(const int field, const Stencil& radial, const Stencil& angular, double& value, double& d_dr,
+                     double& d_dtheta) const;
+
+private:
+    void* mapping_ = nullptr;
+    size_t size_   = 0;
+
+    int nr_;
+    int ntheta_;
+    int fields_;
+    const double* radii_;
+    const double* values_;
+
+    static constexpr char magic_[8] = {'G', 'M', 'G', 'P', 'T', 'A', 'B', '1'};
+    static constexpr size_t header_size_ = 8 + 4 * sizeof(int32_t);
+};
+
+inline TabulatedTable::TabulatedTable(const std::string& path)
+{
+    const int file = open(path.c_str(), O_RDONLY);
+    if (file < 0)
+        throw std::runtime_error("TabulatedTable: Cannot open '" + path + "'.");
+    struct stat status;
+    if (fstat(file, &status) != 0 || static_cast<size_t>(status.st_size) < header_size_) {
+        close(file);
+        throw std::runtime_error("TabulatedTable: '" + path + "' is not a table.");
+    }
+    size_    = static_cast<size_t>(status.st_size);
+    mapping_ = mmap(nullptr, size_, PROT_READ, MAP_PRIVATE, file, 0);
+    close(file);
+    if (mapping_ == MAP_FAILED) {
+        mapping_ = nullptr;
+        throw std::runtime_error("TabulatedTable: Cannot map '" + path + "'.");
+    }
+
+    const char* bytes = static_cast<const char*>(mapping_);
+    int32_t dimensions[4];
+    std::memcpy(dimensions, bytes + 8, sizeof(dimensions));
+    nr_     = dimensions[0];
+    ntheta_ = dimensions[1];
+    fields_ = dimensions[2];
+
+    const bool valid_header = std::memcmp(bytes, magic_, 8) == 0 && nr_ >= 2 && ntheta_ >= 1 && fields_ >= 1;
+    const size_t expected =
+        header_size_ + sizeof(double) * (static_cast<size_t>(nr_) + static_cast<size_t>(fields_) * nr_ * ntheta_);
+    if (!valid_header || size_ != expected) {
+        munmap(mapping_, size_);
+        mapping_ = nullptr;
+        throw std::runtime_error("TabulatedTable: '" + path + "' has an invalid header or size.");
+    }
+    radii_  = reinterpret_cast<const double*>(bytes + header_size_);
+    values_ = radii_ + nr_;
+
+    for (int i = 1; i < nr_; i++) {
+        if (!(radii_[i] > radii_[i - 1])) {
+            munmap(mapping_, size_);
+            mapping_ = nullptr;
+            throw std::runtime_error("TabulatedTable: The radii of '" + path + "' are not increasing.");
+        }
+    }
+}
+
+inline TabulatedTable::~TabulatedTable()
+{
+    if (mapping_)
+        munmap(mapping_, size_);
+}
+
+inline void TabulatedTable::write(const std::string& path, const std::vector<double>& radii, const int ntheta,
+                                  const int fields, const std::vector<double>& values)
+{
+    if (values.size() != static_cast<size_t>(fields) * radii.size() * ntheta)
+        throw std::runtime_error("TabulatedTable: The number of values does not match the dimensions.");
+    std::ofstream file(path, std::ios::binary);
+    if (!file)
+        throw std::runtime_error("TabulatedTable: Cannot write '" + path + "'.");
+    const int32_t dimensions[4] = {static_cast<int32_t>(radii.size()), ntheta, fields, 0};
+    file.write(magic_, 8);
+    file.write(reinterpret_cast<const char*>(dimensions), sizeof(dimensions));
+    file.write(reinterpret_cast<const char*>(radii.data()), sizeof(double) * radii.size());
+    file.write(reinterpret_cast<const char*>(values.data()), sizeof(double) * values.size());
+}
+
+inline TabulatedTable::Stencil TabulatedTable::radialStencil(const double r) const
+{
+    // Outside of the table the polynomial of the first respectively last interval is continued.
+    const int i = std::clamp(static_cast<int>(std::upper_bound(radii_, radii_ + nr_, r) - radii_) - 1, 0, nr_ - 2);
+    const double h = radii_[i + 1] - radii_[i];
+    const double t = (r - radii_[i]) / h;
+
+    const double h00 = (2.0 * t - 3.0) * t * t + 1.0, dh00 = (6.0 * t - 6.0) * t / h;
+    const double h10 = ((t - 2.0) * t + 1.0) * t, dh10 = ((3.0 * t - 4.0) * t + 1.0) / h;
+    const double h01 = (3.0 - 2.0 * t) * t * t, dh01 = (6.0 - 6.0 * t) * t / h;
+    const double h11 = (t - 1.0) * t * t, dh11 = (3.0 * t - 2.0) * t / h;
+
+    Stencil stencil = {{std::max(i - 1, 0), i, i + 1, std::min(i + 2, nr_ - 1)}, {0.0, h00, h01, 0.0},
+                       {0.0, dh00, dh01, 0.0}};
+    // Slope at r_i times h.
+    const double s0 = i > 0 ? h / (radii_[i + 1] - radii_[i - 1]) : 1.0;
+    stencil.weight[2] += s0 * h10;
+    stencil.derivative[2] += s0 * dh10;
+    stencil.weight[i > 0 ? 0 : 1] -= s0 * h10;
+    stencil.derivative[i > 0 ? 0 : 1] -= s0 * dh10;
+    // Slope at r_{i+1} times h.
+    const double s1 = i + 2 < nr_ ? h / (radii_[i + 2] - radii_[i]) : 1.0;
+    stencil.weight[i + 2 < nr_ ? 3 : 2] += s1 * h11;
+    stencil.derivative[i + 2 < nr_ ? 3 : 2] += s1 * dh11;
+    stencil.weight[1] -= s1 * h11;
+    stencil.derivative[1] -= s1 * dh11;
+    return stencil;
+}
+
+inline TabulatedTable::Stencil TabulatedTable::angularStencil(const double theta) const
+{
+    if (ntheta_ == 1)
+        return {{0, 0, 0, 0}, {0.0, 1.0, 0.0, 0.0}, {0.0, 0.0, 0.0, 0.0}};
+
+    const double h = 2.0 * M_PI / ntheta_;
+    const double x = theta / h;
+    const double j = std::floor(x);
+    const double t = x - j;
+    const int j0   = static_cast<int>(j - ntheta_ * std::floor(j / ntheta_));
+
+    // Catmull-Rom weights of the nodes j - 1, ..., j + 2.
+    const double t2 = t * t, t3 = t2 * t;
+    Stencil stencil;
+    for (int k = 0; k < 4; k++)
+        stencil.index[k] = (j0 + k - 1 + ntheta_) % ntheta_;
+    stencil.weight[0]     = 0.5 * (-t3 + 2.0 * t2 - t);
+    stencil.weight[1]     = 0.5 * (3.0 * t3 - 5.0 * t2 + 2.0);
+    stencil.weight[2]     = 0.5 * (-3.0 * t3 + 4.0 * t2 + t);
+    stencil.weight[3]     = 0.5 * (t3 - t2);
+    stencil.derivative[0] = 0.5 * (-3.0 * t2 + 4.0 * t - 1.0) / h;
+    stencil.derivative[1] = 0.5 * (9.0 * t2 - 10.0 * t) / h;
+    stencil.derivative[2] = 0.5 * (-9.0 * t2 + 8.0 * t + 1.0) / h;
+    stencil.derivative[3] = 0.5 * (3.0 * t2 - 2.0 * t) / h;
+    return stencil;
+}
+
+inline double TabulatedTable::value(const int field, const Stencil& radial, const Stencil& angular) const
+{
+    const double* values = values_ + static_cast<size_t>(field) * nr_ * ntheta_;
+    double result        = 0.0;
+    for (int a = 0; a < 4; a++) {
+        const double* row = values + static_cast<size_t>(radial.index[a]) * ntheta_;
+        double row_value  = 0.0;
+        for (int b = 0; b < 4; b++)
+            row_value += angular.weight[b] * row[angular.index[b]];
+        result += radial.weight[a] * row_value;
+    }
+    return result;
+}
+
+inline void TabulatedTable::interpolate(const int field, const Stencil& radial, const Stencil& angular,
+                                        double& value, double& d_dr, double& d_dtheta) const
+{
+    const double* values = values_ + static_cast<size_t>(field) * nr_ * ntheta_;
+    value = d_dr = d_dtheta = 0.0;
+    for (int a = 0; a < 4; a++) {
+        const double* row = values + static_cast<size_t>(radial.index[a]) * ntheta_;
+        double row_value = 0.0, row_derivative = 0.0;
+        for (int b = 0; b < 4; b++) {
+            row_value += angular.weight[b] * row[angular.index[b]];
+            row_derivative += angular.derivative[b] * row[angular.index[b]];
+        }
+        value += radial.weight[a] * row_value;
+        d_dr += radial.derivative[a] * row_value;
+        d_dtheta += radial.weight[a] * row_derivative;
+    }
+}
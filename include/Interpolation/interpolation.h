@@ -13,6 +13,7 @@
 #include "../LinearAlgebra/vector_operations.h"
 
 #include "../common/global_definitions.h"
+#include "../common/parallel.h"
 
 class Interpolation
 {
@@ -32,12 +33,32 @@ public:
                                         ConstVector<double> x) const;
     void applyExtrapolatedProlongation(const Level& fromLevel, const Level& toLevel, Vector<double> result,
                                        ConstVector<double> x) const;
+    /* result += P * x, e.g. to add the coarse grid correction to the solution. */
+    void applyProlongationAdd(const Level& fromLevel, const Level& toLevel, Vector<double> result,
+                              ConstVector<double> x) const;
+    // Single precision corrections of the mixed precision cycle, see GMGPolar::mixedPrecision().
+    void applyProlongationAdd(const Level& fromLevel, const Level& toLevel, Vector<double> result,
+                              ConstVector<float> x) const;
+    void applyProlongationAdd(const Level& fromLevel, const Level& toLevel, Vector<float> result,
+                              ConstVector<float> x) const;
+    // applyProlongationAdd for the first number_of_columns columns of a batch, whose columns are stored one after
+    // another. Every line of the fine grid is interpolated for all columns before the next line.
+    void applyProlongationAddBatch(const Level& fromLevel, const Level& toLevel, Vector<double> result,
+                                   ConstVector<double> x, const int number_of_columns) const;
+    void applyExtrapolatedProlongationAdd(const Level& fromLevel, const Level& toLevel, Vector<double> result,
+                                          ConstVector<double> x) const;
 
     /* Scaled full weighting (FW) restriction operator. */
     void applyRestriction0(const Level& fromLevel, const Level& toLevel, Vector<double> result,
                            ConstVector<double> x) const;
     void applyRestriction(const Level& fromLevel, const Level& toLevel, Vector<double> result,
                           ConstVector<double> x) const;
+    // Restricts the residual of the finest level to the rhs of the single precision cycle.
+    void applyRestriction(const Level& fromLevel, const Level& toLevel, Vector<float> result,
+                          ConstVector<double> x) const;
+    // applyRestriction for the first number_of_columns columns of a batch, see applyProlongationAddBatch.
+    void applyRestrictionBatch(const Level& fromLevel, const Level& toLevel, Vector<double> result,
+                               ConstVector<double> x, const int number_of_columns) const;
     void applyExtrapolatedRestriction0(const Level& fromLevel, const Level& toLevel, Vector<double> result,
                                        ConstVector<double> x) const;
     void applyExtrapolatedRestriction(const Level& fromLevel, const Level& toLevel, Vector<double> result,
@@ -0,0 +1,116 @@
+#pragma once
+
+#include "../PolarGrid/polargrid.h"
+
+/*
+ * Restriction stencils of a single coarse node.
+ *
+ * 'fine(i_r, i_theta)' returns the fine grid value at the given (wrapped) fine node. Interpolation passes
+ * a stored vector, ResidualTake::computeRestrictedResidual passes residuals it evaluates line by line,
+ * so both produce bitwise identical coarse values.
+ * The first and last circle of both the circle and the radial section are checked for the domain boundary.
+ */
+
+inline bool isInteriorRestrictionNode(const PolarGrid& coarseGrid, const int i_r_coarse)
+{
+    const int coarseNumberSmootherCircles = coarseGrid.numberSmootherCircles();
+    if (i_r_coarse < coarseNumberSmootherCircles)
+        return 0 < i_r_coarse && i_r_coarse < coarseNumberSmootherCircles - 1;
+    return coarseNumberSmootherCircles < i_r_coarse && i_r_coarse < coarseGrid.nr() - 1;
+}
+
+// Scaled full weighting (FW) restriction, see restriction.cpp.
+template <typename FineValues>
+inline double restrictNode(const PolarGrid& fineGrid, const PolarGrid& coarseGrid, const int i_r_coarse,
+                           const int i_theta_coarse, const FineValues& fine)
+{
+    const int i_r     = i_r_coarse * 2;
+    const int i_theta = i_theta_coarse * 2;
+
+    const int i_theta_M2 = fineGrid.wrapThetaIndex(i_theta - 2);
+    const int i_theta_M1 = fineGrid.wrapThetaIndex(i_theta - 1);
+    const int i_theta_P1 = fineGrid.wrapThetaIndex(i_theta + 1);
+
+    const double k1 = fineGrid.angularSpacing(i_theta_M2);
+    const double k2 = fineGrid.angularSpacing(i_theta_M1);
+    const double k3 = fineGrid.angularSpacing(i_theta);
+    const double k4 = fineGrid.angularSpacing(i_theta_P1);
+
+    if (isInteriorRestrictionNode(coarseGrid, i_r_coarse)) {
+        const double h1 = fineGrid.radialSpacing(i_r - 2);
+        const double h2 = fineGrid.radialSpacing(i_r - 1);
+        const double h3 = fineGrid.radialSpacing(i_r);
+        const double h4 = fineGrid.radialSpacing(i_r + 1);
+
+        return
+            // Center
+            fine(i_r, i_theta) +
+            // Left, Right, Bottom, Top
+            h2 * fine(i_r - 1, i_theta) / (h1 + h2) + h3 * fine(i_r + 1, i_theta) / (h3 + h4) +
+            k2 * fine(i_r, i_theta_M1) / (k1 + k2) + k3 * fine(i_r, i_theta_P1) / (k3 + k4) +
+            // Bottom Left, Bottom Right, Top Left, Top Right
+            h2 * k2 * fine(i_r - 1, i_theta_M1) / ((h1 + h2) * (k1 + k2)) +
+            h3 * k2 * fine(i_r + 1, i_theta_M1) / ((h3 + h4) * (k1 + k2)) +
+            h2 * k3 * fine(i_r - 1, i_theta_P1) / ((h1 + h2) * (k3 + k4)) +
+            h3 * k3 * fine(i_r + 1, i_theta_P1) / ((h3 + h4) * (k3 + k4));
+    }
+
+    /* First and Last Circle have to be checked for domain boundary */
+    // Center, Bottom, Top
+    double value =
+        fine(i_r, i_theta) + k2 * fine(i_r, i_theta_M1) / (k1 + k2) + k3 * fine(i_r, i_theta_P1) / (k3 + k4);
+
+    if (i_r_coarse > 0) {
+        const double h1 = fineGrid.radialSpacing(i_r - 2);
+        const double h2 = fineGrid.radialSpacing(i_r - 1);
+        // Left, Bottom Left, Top Left
+        value += h2 * fine(i_r - 1, i_theta) / (h1 + h2) +
+                 h2 * k2 * fine(i_r - 1, i_theta_M1) / ((h1 + h2) * (k1 + k2)) +
+                 h2 * k3 * fine(i_r - 1, i_theta_P1) / ((h1 + h2) * (k3 + k4));
+    }
+    if (i_r_coarse < coarseGrid.nr() - 1) {
+        const double h3 = fineGrid.radialSpacing(i_r);
+        const double h4 = fineGrid.radialSpacing(i_r + 1);
+        // Right, Bottom Right, Top Right
+        value += h3 * fine(i_r + 1, i_theta) / (h3 + h4) +
+                 h3 * k2 * fine(i_r + 1, i_theta_M1) / ((h3 + h4) * (k1 + k2)) +
+                 h3 * k3 * fine(i_r + 1, i_theta_P1) / ((h3 + h4) * (k3 + k4));
+    }
+    return value;
+}
+
+// Extrapolated restriction, see extrapolated_restriction.cpp.
+template <typename FineValues>
+inline double extrapolatedRestrictNode(const PolarGrid& fineGrid, const PolarGrid& coarseGrid, const int i_r_coarse,
+                                       const int i_theta_coarse, const FineValues& fine)
+{
+    const int i_r     = i_r_coarse * 2;
+    const int i_theta = i_theta_coarse * 2;
+
+    const int i_theta_M1 = fineGrid.wrapThetaIndex(i_theta - 1);
+    const int i_theta_P1 = fineGrid.wrapThetaIndex(i_theta + 1);
+
+    if (isInteriorRestrictionNode(coarseGrid, i_r_coarse)) {
+        return
+            // Center
+            fine(i_r, i_theta) +
+            // Left, Right, Bottom, Top
+            0.5 * fine(i_r - 1, i_theta) + 0.5 * fine(i_r + 1, i_theta) + 0.5 * fine(i_r, i_theta_M1) +
+            0.5 * fine(i_r, i_theta_P1) +
+            // Bottom Right, Top Left
+            0.5 * fine(i_r + 1, i_theta_M1) + 0.5 * fine(i_r - 1, i_theta_P1);
+    }
+
+    /* First and Last Circle have to be checked for domain boundary */
+    // Center, Bottom, Top
+    double value = fine(i_r, i_theta) + 0.5 * fine(i_r, i_theta_M1) + 0.5 * fine(i_r, i_theta_P1);
+    if (i_r_coarse > 0) {
+        // Left, Top Left
+        value += 0.5 * fine(i_r - 1, i_theta) + 0.5 * fine(i_r - 1, i_theta_P1);
+    }
+    if (i_r_coarse < coarseGrid.nr() - 1) {
+        // Right, Bottom Right
+        value += 0.5 * fine(i_r + 1, i_theta) + 0.5 * fine(i_r + 1, i_theta_M1);
+    }
+    return value;
+}
@@ -5,7 +5,9 @@ class DirectSolver;
 class Residual;
 class Smoother;
 class ExtrapolatedSmoother;
+class AssembledStencil;
 
+#include <cassert>
 #include <memory>
 #include <omp.h>
 #include <vector>
@@ -23,6 +25,9 @@ class ExtrapolatedSmoother;
 #include "../Smoother/smoother.h"
 
 #include "../common/geometry_helper.h"
+#include "../common/memory_report.h"
+#include "../common/profiler.h"
+#include "../common/setup_archive.h"
 
 // The `Level` class represents a single level of a multigrid method.
 // In multigrid solvers, the computational domain is divided into different levels, where each level corresponds to a grid with a different resolution.
@@ -42,9 +47,19 @@ class Level
 public:
     // ----------- //
     // Constructor //
+    // If a profiler is given, the smoothing, residual and direct solver calls are recorded in it.
+    // If a shared solution is given, the solution vector is a view of its leading entries instead of an own
+    // allocation, see GMGPolar::memoryLean().
     explicit Level(const int level_depth, std::unique_ptr<const PolarGrid> grid,
-                   std::unique_ptr<const LevelCache> level_cache, const ExtrapolationType extrapolation,
-                   const bool FMG);
+                   std::unique_ptr<LevelCache> level_cache, const ExtrapolationType extrapolation,
+                   const bool FMG, Profiler* profiler = nullptr, Vector<double> shared_solution = Vector<double>());
+    // Workspace copy: shares the grid, the level cache and the operators of setup_level,
+    // but allocates its own rhs, solution, residual and error correction vectors.
+    explicit Level(const Level& setup_level, Profiler* profiler, Vector<double> shared_solution = Vector<double>());
+
+    Level(Level&&)                 = default;
+    Level(const Level&)            = delete;
+    Level& operator=(const Level&) = delete;
 
     // ---------------- //
     // Getter Functions //
@@ -61,60 +76,167 @@ public:
     Vector<double> error_correction();
     ConstVector<double> error_correction() const;
 
+    // ------------- //
+    // Batched Solve //
+    // Column-major rhs, solution and residual of number_of_columns systems, see GMGPolar::solve for a batch of
+    // right-hand sides. The vectors are allocated on first use and kept until the number of columns changes.
+    void allocateBatch(const int number_of_columns);
+    int batchColumns() const;
+    Vector<double> batchRhs();
+    Vector<double> batchSolution();
+    Vector<double> batchResidual();
+
+    // --------------------------- //
+    // Single Precision Correction //
+    // Solution, rhs and residual of the single precision correction cycle, see GMGPolar::mixedPrecision().
+    // The vectors are allocated by allocateSinglePrecision() and are empty otherwise.
+    void allocateSinglePrecision();
+    Vector<float> singlePrecisionSolution();
+    Vector<float> singlePrecisionRhs();
+    Vector<float> singlePrecisionResidual();
+    // True if the residual and the smoother of this level support single precision vectors.
+    bool hasSinglePrecision() const;
+
     // -------------- //
     // Apply Residual //
     void initializeResidual(const DomainGeometry& domain_geometry,
                             const DensityProfileCoefficients& density_profile_coefficients, const bool DirBC_Interior,
                             const int num_omp_threads, const StencilDistributionMethod stencil_distribution_method);
     void computeResidual(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x) const;
+    // Residuals of the first number_of_columns columns of a batch, see Residual::computeResidualBatch.
+    void computeResidualBatch(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x,
+                              const int number_of_columns) const;
+    // Restricts the residual to next_level without storing it, see Residual::computeRestrictedResidual.
+    bool hasRestrictedResidual() const;
+    void computeRestrictedResidual(const Level& next_level, Vector<double> result, ConstVector<double> rhs,
+                                   ConstVector<double> x, const bool extrapolated) const;
+    // Fused residual and restriction to the float rhs of next_level, see
+    // Residual::computeRestrictedResidualSinglePrecision.
+    void computeRestrictedResidualSinglePrecision(const Level& next_level, Vector<float> result,
+                                                  ConstVector<double> rhs, ConstVector<double> x) const;
+    void computeRestrictedResidualSinglePrecision(const Level& next_level, Vector<float> result,
+                                                  ConstVector<float> rhs, ConstVector<float> x) const;
 
     // ------------------- //
     // Solve coarse System //
     void initializeDirectSolver(const DomainGeometry& domain_geometry,
                                 const DensityProfileCoefficients& density_profile_coefficients,
                                 const bool DirBC_Interior, const int num_omp_threads,
-                                const StencilDistributionMethod stencil_distribution_method);
+                                const StencilDistributionMethod stencil_distribution_method,
+                                const bool single_precision = false, SetupReader* setup_reader = nullptr);
     // Note: The rhs (right-hand side) vector gets overwritten by the solution.
     void directSolveInPlace(Vector<double> x) const;
+    // Coarse solve of the first number_of_columns columns of a batch, see DirectSolver::solveInPlaceBatch.
+    void directSolveInPlaceBatch(Vector<double> x, const int number_of_columns) const;
+    // Solves with the single precision factorization if the direct solver was initialized with single_precision.
+    void directSolveInPlaceSinglePrecision(Vector<float> x) const;
 
     // --------------- //
     // Apply Smoothing //
     void initializeSmoothing(const DomainGeometry& domain_geometry,
                              const DensityProfileCoefficients& density_profile_coefficients, const bool DirBC_Interior,
-                             const int num_omp_threads, const StencilDistributionMethod stencil_distribution_method);
+                             const int num_omp_threads, const StencilDistributionMethod stencil_distribution_method,
+                             const bool single_precision_factors = false, SetupReader* setup_reader = nullptr);
     void smoothing(Vector<double> x, ConstVector<double> rhs, Vector<double> temp) const;
+    // Smoothing of the first number_of_columns columns of a batch, see Smoother::smoothingBatch.
+    void smoothingBatch(Vector<double> x, ConstVector<double> rhs, Vector<double> temp,
+                        const int number_of_columns) const;
+    void smoothingSinglePrecision(Vector<float> x, ConstVector<float> rhs, Vector<float> temp) const;
 
     // ---------------------------- //
     // Apply Extrapolated Smoothing //
     void initializeExtrapolatedSmoothing(const DomainGeometry& domain_geometry,
                                          const DensityProfileCoefficients& density_profile_coefficients,
                                          const bool DirBC_Interior, const int num_omp_threads,
-                                         const StencilDistributionMethod stencil_distribution_method);
+                                         const StencilDistributionMethod stencil_distribution_method,
+                                         SetupReader* setup_reader = nullptr);
     void extrapolatedSmoothing(Vector<double> x, ConstVector<double> rhs, Vector<double> temp) const;
 
+    bool hasSmoother() const;
+    bool hasExtrapolatedSmoother() const;
+
+    // ------------------------ //
+    // Number of OpenMP threads //
+    // Changes the thread count of the initialized residual and smoothers.
+    // The direct solver only uses its thread count during the setup.
+    void numOmpThreads(const int num_omp_threads);
+
+    // ----------------- //
+    // Memory Accounting //
+    // Bytes held by the vectors, the level cache and the initialized operators.
+    LevelMemory memoryUsage() const;
+
+    // ----------------------------------- //
+    // Update Density Profile Coefficients //
+    // Refreshes the level cache and refactorizes the initialized smoothers and direct solver.
+    // Grids, vectors and operator objects are kept.
+    // The finest level evaluates the new coefficients, coarser levels inject them from the previous level.
+    void updateDensityProfileCoefficients(const DensityProfileCoefficients& density_profile_coefficients);
+    void updateDensityProfileCoefficients(const Level& previous_level);
+
+    // ----------------- //
+    // Setup Persistence //
+    // Writes the level cache and the factorizations of the initialized smoothers and direct solver.
+    // The operators are restored by passing a SetupReader to the initialize functions above,
+    // the level cache by the corresponding LevelCache constructor.
+    void saveSetup(SetupWriter& writer) const;
+
 private:
     const int level_depth_;
-    std::unique_ptr<const PolarGrid> grid_;
-    std::unique_ptr<const LevelCache> level_cache_;
-
-    std::unique_ptr<DirectSolver> op_directSolver_;
-    std::unique_ptr<Residual> op_residual_;
-    std::unique_ptr<Smoother> op_smoother_;
-    std::unique_ptr<ExtrapolatedSmoother> op_extrapolated_smoother_;
+    // Shared between a level and its workspace copies, see the second constructor.
+    std::shared_ptr<const PolarGrid> grid_;
+    std::shared_ptr<LevelCache> level_cache_;
+    Profiler* profiler_;
+
+    std::shared_ptr<DirectSolver> op_directSolver_;
+    std::shared_ptr<Residual> op_residual_;
+    std::shared_ptr<Smoother> op_smoother_;
+    std::shared_ptr<ExtrapolatedSmoother> op_extrapolated_smoother_;
+    // Coefficients shared by the operators of the assembled stencil distribution methods.
+    std::shared_ptr<AssembledStencil> assembled_stencil_;
+
+    // Assembles the stencil on first use, all assembled operators of a level have to use the same storage.
+    const AssembledStencil& assembledStencil(const bool DirBC_Interior, const int num_omp_threads,
+                                             const StencilDistributionMethod stencil_distribution_method);
+    void refactorizeOperators();
 
     Vector<double> rhs_;
+    bool shares_solution_;
     Vector<double> solution_;
     Vector<double> residual_;
     Vector<double> error_correction_;
+
+    int batch_columns_ = 0;
+    Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace> batch_rhs_;
+    Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace> batch_solution_;
+    Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace> batch_residual_;
+
+    Kokkos::View<float*, Kokkos::LayoutRight, Kokkos::HostSpace> single_precision_solution_;
+    Kokkos::View<float*, Kokkos::LayoutRight, Kokkos::HostSpace> single_precision_rhs_;
+    Kokkos::View<float*, Kokkos::LayoutRight, Kokkos::HostSpace> single_precision_residual_;
 };
 
 class LevelCache
 {
 public:
+    // 'radial_profiles' requires an angle independent domain geometry and density profile, see radialProfiles().
     explicit LevelCache(const PolarGrid& grid, const DensityProfileCoefficients& density_profile_coefficients,
                         const DomainGeometry& domain_geometry, const bool cache_density_profile_coefficients,
-                        const bool cache_domain_geometry);
+                        const bool cache_domain_geometry, const bool radial_profiles = false);
     explicit LevelCache(const Level& previous_level, const PolarGrid& current_grid);
+    // Restores the cached values written by 'saveSetup' instead of evaluating them.
+    // The arrays are not copied, they refer to the memory-mapped setup file.
+    explicit LevelCache(const PolarGrid& grid, const DensityProfileCoefficients& density_profile_coefficients,
+                        const DomainGeometry& domain_geometry, const bool cache_density_profile_coefficients,
+                        const bool cache_domain_geometry, const bool radial_profiles, SetupReader& setup_reader);
+
+    void saveSetup(SetupWriter& writer) const;
+
+    // Recompute the cached values after the density profile coefficients have changed.
+    // The finest level evaluates the new coefficients, coarser levels inject them from the previous level.
+    void updateDensityProfileCoefficients(const PolarGrid& grid,
+                                          const DensityProfileCoefficients& density_profile_coefficients);
+    void updateDensityProfileCoefficients(const Level& previous_level, const PolarGrid& current_grid);
 
     const DomainGeometry& domainGeometry() const;
     const DensityProfileCoefficients& densityProfileCoefficients() const;
@@ -132,6 +254,11 @@ public:
     ConstVector<double> art() const;
     ConstVector<double> detDF() const;
 
+    // If the domain geometry and the density profile coefficients do not depend on theta, coeff_beta, arr, att,
+    // art and detDF only hold one value per circle, indexed by i_r. coeff_alpha is folded into arr, att and art.
+    // Both cache flags are false in this case, so only obtainValues() may be used to access the values.
+    bool radialProfiles() const;
+
     inline void obtainValues(const int i_r, const int i_theta, const int global_index, const double& r,
                              const double& theta, double& sin_theta, double& cos_theta, double& coeff_beta, double& arr,
                              double& att, double& art, double& detDF) const
@@ -139,17 +266,26 @@ public:
         sin_theta = sin_theta_[i_theta];
         cos_theta = cos_theta_[i_theta];
 
+        if (radial_profiles_) {
+            coeff_beta = coeff_beta_[i_r];
+            arr        = arr_[i_r];
+            att        = att_[i_r];
+            art        = art_[i_r];
+            detDF      = detDF_[i_r];
+            return;
+        }
+
         if (cache_density_profile_coefficients_)
             coeff_beta = coeff_beta_[global_index];
         else
-            coeff_beta = density_profile_coefficients_.beta(r, theta);
+            coeff_beta = density_profile_coefficients_->beta(r, theta);
 
         double coeff_alpha;
         if (!cache_domain_geometry_) {
             if (cache_density_profile_coefficients_)
                 coeff_alpha = coeff_alpha_[global_index];
             else
-                coeff_alpha = density_profile_coefficients_.alpha(r, theta);
+                coeff_alpha = density_profile_coefficients_->alpha(r, theta);
         }
 
         if (cache_domain_geometry_) {
@@ -166,7 +302,7 @@ public:
 
 private:
     const DomainGeometry& domain_geometry_;
-    const DensityProfileCoefficients& density_profile_coefficients_;
+    const DensityProfileCoefficients* density_profile_coefficients_;
 
     Vector<double> sin_theta_;
     Vector<double> cos_theta_;
@@ -180,4 +316,56 @@ private:
     Vector<double> att_;
     Vector<double> art_;
     Vector<double> detDF_;
+
+    bool radial_profiles_; // coeff_beta, arr, att, art, detDF per i_r
+
+    // Memory-mapped setup file holding the arrays above if they were restored from it, see SetupReader::mapArray().
+    std::shared_ptr<const void> setup_mapping_;
+
+    void computeCachedValues(const PolarGrid& grid);
+    void injectCachedValues(const Level& previous_level, const PolarGrid& current_grid);
+};
+
+// Values of LevelCache::obtainValues() along a circle or a radial line. If the domain geometry or the density
+// profile coefficients are evaluated on the fly, they are computed for the whole line on construction by batched
+// calls. Otherwise obtainValues() reads them from the level cache.
+class LevelCacheLine
+{
+public:
+    // The nodes i_theta = 0, ..., ntheta - 1 of the circle i_r.
+    static LevelCacheLine circle(const LevelCache& level_cache, const PolarGrid& grid, const int i_r);
+    // The nodes i_r = i_r_start, ..., nr - 1 of the radial line i_theta.
+    static LevelCacheLine radialLine(const LevelCache& level_cache, const PolarGrid& grid, const int i_theta,
+                                     const int i_r_start);
+
+    inline void obtainValues(const int i_r, const int i_theta, const int global_index, const double& r,
+                             const double& theta, double& sin_theta, double& cos_theta, double& coeff_beta, double& arr,
+                             double& att, double& art, double& detDF) const
+    {
+        if (count_ == 0) {
+            level_cache_.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr,
+                                      att, art, detDF);
+            return;
+        }
+        const int k = circle_ ? i_theta : i_r - i_r_start_;
+        assert(0 <= k && k < count_);
+        sin_theta  = sin_theta_[i_theta];
+        cos_theta  = cos_theta_[i_theta];
+        coeff_beta = values_[k];
+        arr        = values_[count_ + k];
+        att        = values_[2 * count_ + k];
+        art        = values_[3 * count_ + k];
+        detDF      = values_[4 * count_ + k];
+    }
+
+private:
+    LevelCacheLine(const LevelCache& level_cache, const bool circle, const int i_r_start, const int count);
+
+    const LevelCache& level_cache_;
+    const double* sin_theta_;
+    const double* cos_theta_;
+    bool circle_;
+    int i_r_start_;
+    int count_; // 0 if the values are read from the level cache
+    std::vector<double> values_; // coeff_beta, arr, att, art, detDF and coeff_alpha of the line, 'count_' each
 };
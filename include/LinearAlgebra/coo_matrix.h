@@ -34,6 +34,8 @@ public:
     int rows() const;
     int columns() const;
     int non_zero_size() const;
+    // Bytes held by the row index, column index and value arrays.
+    std::size_t memoryUsage() const;
 
     const int& row_index(int nz_index) const;
     int& row_index(int nz_index);
@@ -338,4 +340,17 @@ template <typename T>
 T* SparseMatrixCOO<T>::values_data() const
 {
     return values_.get();
-}
\ No newline at end of file
+}
+
+template <typename T>
+std::size_t SparseMatrixCOO<T>::memoryUsage() const
+{
+    std::size_t bytes = 0;
+    if (row_indices_)
+        bytes += nnz_ * sizeof(int);
+    if (column_indices_)
+        bytes += nnz_ * sizeof(int);
+    if (values_)
+        bytes += nnz_ * sizeof(T);
+    return bytes;
+}
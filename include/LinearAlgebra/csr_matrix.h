@@ -44,6 +44,8 @@ public:
     int rows() const;
     int columns() const;
     int non_zero_size() const;
+    // Bytes held by the value, column index and row start arrays.
+    std::size_t memoryUsage() const;
 
     int row_nz_size(int row) const;
 
@@ -321,4 +323,17 @@ template <typename T>
 int* SparseMatrixCSR<T>::row_start_indices_data() const
 {
     return row_start_indices_.get();
-}
\ No newline at end of file
+}
+
+template <typename T>
+std::size_t SparseMatrixCSR<T>::memoryUsage() const
+{
+    std::size_t bytes = 0;
+    if (values_)
+        bytes += nnz_ * sizeof(T);
+    if (column_indices_)
+        bytes += nnz_ * sizeof(int);
+    if (row_start_indices_)
+        bytes += (rows_ + 1) * sizeof(int);
+    return bytes;
+}
@@ -15,6 +15,8 @@
 #include <fstream>
 #include <iostream>
 
+#include "../common/setup_archive.h"
+
 template <typename T>
 class DiagonalSolver
 {
@@ -36,6 +38,13 @@ public:
 
     void solveInPlace(T* sol_rhs) const;
 
+    // Bytes held by the diagonal.
+    std::size_t memoryUsage() const;
+
+    // Write/read the diagonal to/from a setup file.
+    void save(SetupWriter& writer) const;
+    void load(SetupReader& reader);
+
     template <typename U>
     friend std::ostream& operator<<(std::ostream& stream, const DiagonalSolver<U>& solver);
 
@@ -162,4 +171,29 @@ void DiagonalSolver<T>::solveInPlace(T* sol_rhs) const
     for (int i = 0; i < matrix_dimension_; i++) {
         sol_rhs[i] /= diagonal(i);
     }
-}
\ No newline at end of file
+}
+
+// ----------------- //
+// Setup Persistence //
+// ----------------- //
+
+template <typename T>
+void DiagonalSolver<T>::save(SetupWriter& writer) const
+{
+    writer.writeValue(matrix_dimension_);
+    writer.writeArray(diagonal_values_.get(), matrix_dimension_);
+}
+
+template <typename T>
+std::size_t DiagonalSolver<T>::memoryUsage() const
+{
+    return diagonal_values_ ? matrix_dimension_ * sizeof(T) : 0;
+}
+
+template <typename T>
+void DiagonalSolver<T>::load(SetupReader& reader)
+{
+    matrix_dimension_ = reader.readValue<int>();
+    diagonal_values_  = std::make_unique<T[]>(matrix_dimension_);
+    reader.readArray(diagonal_values_.get(), matrix_dimension_);
+}
@@ -7,6 +7,7 @@
 #include <cmath>
 #include <stack>
 
+#include "../common/setup_archive.h"
 #include "csr_matrix.h"
 #include "vector.h"
 
@@ -62,6 +63,38 @@ public:
     void solveInPlace(Vector<T> b) const;
     void solveInPlace(T* b) const;
 
+    /**
+     * @brief Solve the system for several right-hand sides in place.
+     *
+     * The factors are traversed once for all right-hand sides. Every column
+     * receives the same operations as solveInPlace(), so the results match.
+     *
+     * @param b Right-hand sides, column c starts at b + c * leading_dimension
+     *        (modified in place to contain the solutions).
+     * @param number_of_columns Number of right-hand sides.
+     * @param leading_dimension Distance between the starts of two columns.
+     */
+    void solveInPlace(T* b, const int number_of_columns, const std::size_t leading_dimension) const;
+
+    /**
+     * @brief Bytes held by the L and U factors and the RCM permutation.
+     */
+    std::size_t memoryUsage() const;
+
+    /**
+     * @brief Write the factorization to a setup file.
+     *
+     * @param writer Setup file in which the factors and the RCM permutation are stored.
+     */
+    void save(SetupWriter& writer) const;
+
+    /**
+     * @brief Restore a factorization previously written by save().
+     *
+     * @param reader Setup file positioned at the data written by save().
+     */
+    void load(SetupReader& reader);
+
 private:
     // LU decomposition data structures
     std::vector<T> L_values, U_values; // Non-zero values for L and U
@@ -77,6 +110,7 @@ private:
     // Core methods
     void factorize(const SparseMatrixCSR<T>& A);
     void solveInPlacePermuted(T* b) const;
+    void solveInPlacePermuted(T* b, const int number_of_columns) const;
 
     // Reordering and permutation utilities
     std::vector<int> computeRCM(const SparseMatrixCSR<T>& A) const;
@@ -128,6 +162,15 @@ SparseLUSolver<T>::SparseLUSolver(const SparseMatrixCSR<T>& A, T tolerance_abs,
  * Solves Ax = b for Vector<T> type
  * @param b - Right-hand side vector (overwritten with solution)
  */
+template <typename T>
+std::size_t SparseLUSolver<T>::memoryUsage() const
+{
+    return (L_values.capacity() + U_values.capacity() + U_diag.capacity()) * sizeof(T) +
+           (L_col_idx.capacity() + U_col_idx.capacity() + L_row_ptr.capacity() + U_row_ptr.capacity() +
+            perm.capacity() + perm_inv.capacity()) *
+               sizeof(int);
+}
+
 template <typename T>
 void SparseLUSolver<T>::solveInPlace(Vector<T> b) const
 {
@@ -161,6 +204,82 @@ void SparseLUSolver<T>::solveInPlace(T* b) const
     }
 }
 
+/**
+ * Solves AX = B for number_of_columns right-hand sides
+ * @param b - Right-hand sides, column c starts at b + c * leading_dimension (overwritten with the solutions)
+ * @param number_of_columns - Number of right-hand sides
+ * @param leading_dimension - Distance between the starts of two columns
+ */
+template <typename T>
+void SparseLUSolver<T>::solveInPlace(T* b, const int number_of_columns, const std::size_t leading_dimension) const
+{
+    assert(factorized_);
+    const int n = perm.size();
+    if (n == 0 || number_of_columns == 0)
+        return;
+
+    // Permute RHS row by row, the entries of all columns of a row are stored next to each other.
+    std::vector<T> b_perm(static_cast<std::size_t>(n) * number_of_columns);
+    for (int i = 0; i < n; i++) {
+        for (int column = 0; column < number_of_columns; column++) {
+            b_perm[static_cast<std::size_t>(i) * number_of_columns + column] = b[column * leading_dimension + perm[i]];
+        }
+    }
+
+    // Solve permuted system
+    solveInPlacePermuted(b_perm.data(), number_of_columns);
+
+    // Unpermute solution
+    for (int i = 0; i < n; i++) {
+        const T* b_perm_row = b_perm.data() + static_cast<std::size_t>(perm_inv[i]) * number_of_columns;
+        for (int column = 0; column < number_of_columns; column++) {
+            b[column * leading_dimension + i] = b_perm_row[column];
+        }
+    }
+}
+
+/**
+ * Writes the L and U factors together with the RCM permutation
+ * @param writer - Setup file
+ */
+template <typename T>
+void SparseLUSolver<T>::save(SetupWriter& writer) const
+{
+    writer.writeValue(factorized_);
+    writer.writeValue(tolerance_abs_);
+    writer.writeValue(tolerance_rel_);
+    writer.writeVector(L_values);
+    writer.writeVector(L_col_idx);
+    writer.writeVector(L_row_ptr);
+    writer.writeVector(U_values);
+    writer.writeVector(U_col_idx);
+    writer.writeVector(U_row_ptr);
+    writer.writeVector(U_diag);
+    writer.writeVector(perm);
+    writer.writeVector(perm_inv);
+}
+
+/**
+ * Restores the factorization written by save()
+ * @param reader - Setup file
+ */
+template <typename T>
+void SparseLUSolver<T>::load(SetupReader& reader)
+{
+    factorized_    = reader.readValue<bool>();
+    tolerance_abs_ = reader.readValue<T>();
+    tolerance_rel_ = reader.readValue<T>();
+    L_values       = reader.readVector<T>();
+    L_col_idx      = reader.readVector<int>();
+    L_row_ptr      = reader.readVector<int>();
+    U_values       = reader.readVector<T>();
+    U_col_idx      = reader.readVector<int>();
+    U_row_ptr      = reader.readVector<int>();
+    U_diag         = reader.readVector<T>();
+    perm           = reader.readVector<int>();
+    perm_inv       = reader.readVector<int>();
+}
+
 /**
  * Performs forward/backward substitution on permuted system
  * @param b - Permuted right-hand side vector (overwritten with solution)
@@ -189,6 +308,47 @@ void SparseLUSolver<T>::solveInPlacePermuted(T* b) const
     }
 }
 
+/**
+ * Performs forward/backward substitution on number_of_columns permuted systems
+ * @param b - Permuted right-hand sides, row i of column c at b[i * number_of_columns + c] (overwritten with solution)
+ * @param number_of_columns - Number of right-hand sides
+ */
+template <typename T>
+void SparseLUSolver<T>::solveInPlacePermuted(T* b, const int number_of_columns) const
+{
+    const int n = L_row_ptr.size() - 1;
+
+    // Forward substitution: L * Y = B
+    for (int i = 0; i < n; i++) {
+        T* b_row = b + static_cast<std::size_t>(i) * number_of_columns;
+        for (int idx = L_row_ptr[i]; idx < L_row_ptr[i + 1]; idx++) {
+            const T value  = L_values[idx];
+            const T* b_col = b + static_cast<std::size_t>(L_col_idx[idx]) * number_of_columns;
+            for (int column = 0; column < number_of_columns; column++) {
+                b_row[column] -= value * b_col[column];
+            }
+        }
+    }
+
+    // Backward substitution: U * X = Y
+    for (int i = n - 1; i >= 0; i--) {
+        T* b_row = b + static_cast<std::size_t>(i) * number_of_columns;
+        for (int idx = U_row_ptr[i]; idx < U_row_ptr[i + 1]; idx++) {
+            const int col = U_col_idx[idx];
+            if (col != i) { // Skip diagonal (handled separately)
+                const T value  = U_values[idx];
+                const T* b_col = b + static_cast<std::size_t>(col) * number_of_columns;
+                for (int column = 0; column < number_of_columns; column++) {
+                    b_row[column] -= value * b_col[column];
+                }
+            }
+        }
+        for (int column = 0; column < number_of_columns; column++) {
+            b_row[column] /= U_diag[i]; // Divide by diagonal element
+        }
+    }
+}
+
 /**
  * Computes Reverse Cuthill-McKee (RCM) ordering for bandwidth reduction
  * @param A - Input sparse matrix
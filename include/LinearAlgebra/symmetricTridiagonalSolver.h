@@ -9,10 +9,12 @@
 #include <optional>
 #include <sstream>
 #include <tuple>
+#include <type_traits>
 #include <unistd.h>
 #include <vector>
 
 #include "../common/equals.h"
+#include "../common/setup_archive.h"
 
 /*
  * SymmetricTridiagonalSolver is a class for solving symmetric tridiagonal systems of linear equations.
@@ -25,6 +27,12 @@
  * - Handling both cyclic and non-cyclic boundary conditions.
  * - Storing the matrix's main diagonal, sub-diagonal, and an optional cyclic corner element.
  * - Peforming the Cholesky-Decomposition in-place.
+ * - Optionally storing the computed factors in single precision (`single_precision_factors`).
+ *   The factorization itself is still carried out in the working precision `T`, only the
+ *   resulting L and D factors are rounded to float. The substitution steps operate on
+ *   vectors of type `T`, so this halves the memory traffic of the factors while keeping
+ *   the arithmetic in `T`. This is intended for line solves used inside a smoother, where
+ *   the outer iteration corrects the rounding error of the factors.
  * 
  * The primary method for solving the system is `solveInPlace`, which computes the solution to the system 
  * in place, updating the provided solution vector (`sol_rhs`) using intermediate storage (`temp1`, `temp2`).
@@ -71,8 +79,26 @@ public:
     const T& cyclic_corner_element() const;
     T& cyclic_corner_element();
 
+    // Has to be set before the first solve, since the factorization is performed lazily.
+    void single_precision_factors(bool value);
+    bool single_precision_factors() const;
+
+    // Computes the L * D * L^T factors, which is otherwise done by the first solve.
+    // Once factorized, solves only read the solver and may run concurrently.
+    void factorize();
+
     // Unified Solve method
-    void solveInPlace(T* sol_rhs, T* temp1, T* temp2 = nullptr);
+    // The vectors may be stored in a different precision than the matrix, e.g. float vectors in the
+    // single precision correction cycle (see GMGPolar::mixedPrecision()).
+    template <typename V>
+    void solveInPlace(V* sol_rhs, V* temp1, V* temp2 = nullptr);
+
+    // Bytes held by the diagonals or, after rounding, by their single precision factors.
+    std::size_t memoryUsage() const;
+
+    // Write/read the matrix, or its factors if it has already been factorized, to/from a setup file.
+    void save(SetupWriter& writer) const;
+    void load(SetupReader& reader);
 
     template <typename U>
     friend std::ostream& operator<<(std::ostream& stream, const SymmetricTridiagonalSolver<U>& solver);
@@ -87,13 +113,30 @@ private:
     bool factorized_ = false;
     T gamma_         = 0.0; // Used in Shermann-Morrison factorization A = B + u*v^T
 
+    // Rounded L and D factors, only allocated if 'single_precision_factors_' is set.
+    // The factors in working precision are released once they have been rounded.
+    bool single_precision_factors_ = false;
+    std::unique_ptr<float[]> main_diagonal_factors_float_;
+    std::unique_ptr<float[]> sub_diagonal_factors_float_;
+
     // Solve methods:
     // The notation 'u' and 'scratch' is directly taken from the implementation
     // of the Thomas Algorithm listed on wikipedia.
     // Note that the 'scratch' vector is unused, as we moved from the
     // Thomas Algorithm to the faster Cholesky Decomposition.
-    void solveSymmetricTridiagonal(T* x, T* scratch);
-    void solveSymmetricCyclicTridiagonal(T* x, T* u, T* scratch);
+    template <typename V>
+    void solveSymmetricTridiagonal(V* x, V* scratch);
+    template <typename V>
+    void solveSymmetricCyclicTridiagonal(V* x, V* u, V* scratch);
+
+    void roundFactorsToSinglePrecision();
+    void copyValues(const SymmetricTridiagonalSolver& other);
+
+    // Forward substitution, diagonal scaling and backward substitution with the L * D * L^T factors.
+    template <typename F, typename V>
+    void substitute(const F* main_diagonal_factors, const F* sub_diagonal_factors, V* x) const;
+    template <typename F, typename V>
+    void substituteCyclic(const F* main_diagonal_factors, const F* sub_diagonal_factors, V* x, V* u) const;
 };
 
 template <typename U>
@@ -102,10 +145,14 @@ std::ostream& operator<<(std::ostream& stream, const SymmetricTridiagonalSolver<
     stream << "Symmetric Tridiagonal Matrix (Dimension: " << solver.matrix_dimension_ << ")\n";
 
     if (solver.factorized_) {
+        const bool rounded = solver.single_precision_factors_;
         // Print the L, D decomposition if factorized
         stream << "L Factor (Sub Diagonal Elements): [";
         for (int i = 0; i < solver.matrix_dimension_ - 1; ++i) {
-            stream << solver.sub_diagonal(i);
+            if (rounded)
+                stream << solver.sub_diagonal_factors_float_[i];
+            else
+                stream << solver.sub_diagonal(i);
             if (i != solver.matrix_dimension_ - 2)
                 stream << ", ";
         }
@@ -113,7 +160,10 @@ std::ostream& operator<<(std::ostream& stream, const SymmetricTridiagonalSolver<
 
         stream << "D Factor (Diagonal Elements): [";
         for (int i = 0; i < solver.matrix_dimension_; ++i) {
-            stream << solver.main_diagonal(i);
+            if (rounded)
+                stream << solver.main_diagonal_factors_float_[i];
+            else
+                stream << solver.main_diagonal(i);
             if (i != solver.matrix_dimension_ - 1)
                 stream << ", ";
         }
@@ -163,15 +213,10 @@ SymmetricTridiagonalSolver<T>::SymmetricTridiagonalSolver()
 template <typename T>
 SymmetricTridiagonalSolver<T>::SymmetricTridiagonalSolver(const SymmetricTridiagonalSolver& other)
     : matrix_dimension_(other.matrix_dimension_)
-    , main_diagonal_values_(std::make_unique<T[]>(matrix_dimension_))
-    , sub_diagonal_values_(std::make_unique<T[]>(matrix_dimension_ - 1))
     , cyclic_corner_element_(other.cyclic_corner_element_)
     , is_cyclic_(other.is_cyclic_)
 {
-    std::copy(other.main_diagonal_values_.get(), other.main_diagonal_values_.get() + matrix_dimension_,
-              main_diagonal_values_.get());
-    std::copy(other.sub_diagonal_values_.get(), other.sub_diagonal_values_.get() + matrix_dimension_ - 1,
-              sub_diagonal_values_.get());
+    copyValues(other);
 }
 
 // copy assignment
@@ -182,18 +227,10 @@ SymmetricTridiagonalSolver<T>& SymmetricTridiagonalSolver<T>::operator=(const Sy
         // Self-assignment, no work needed
         return *this;
     }
-    // Only allocate new memory if the sizes are different
-    if (matrix_dimension_ != other.matrix_dimension_) {
-        matrix_dimension_     = other.matrix_dimension_;
-        main_diagonal_values_ = std::make_unique<T[]>(matrix_dimension_);
-        sub_diagonal_values_  = std::make_unique<T[]>(matrix_dimension_ - 1);
-    }
+    matrix_dimension_      = other.matrix_dimension_;
     cyclic_corner_element_ = other.cyclic_corner_element_;
     is_cyclic_             = other.is_cyclic_;
-    std::copy(other.main_diagonal_values_.get(), other.main_diagonal_values_.get() + matrix_dimension_,
-              main_diagonal_values_.get());
-    std::copy(other.sub_diagonal_values_.get(), other.sub_diagonal_values_.get() + matrix_dimension_ - 1,
-              sub_diagonal_values_.get());
+    copyValues(other);
     return *this;
 }
 
@@ -205,24 +242,38 @@ SymmetricTridiagonalSolver<T>::SymmetricTridiagonalSolver(SymmetricTridiagonalSo
     , sub_diagonal_values_(std::move(other.sub_diagonal_values_))
     , cyclic_corner_element_(other.cyclic_corner_element_)
     , is_cyclic_(other.is_cyclic_)
+    , factorized_(other.factorized_)
+    , gamma_(other.gamma_)
+    , single_precision_factors_(other.single_precision_factors_)
+    , main_diagonal_factors_float_(std::move(other.main_diagonal_factors_float_))
+    , sub_diagonal_factors_float_(std::move(other.sub_diagonal_factors_float_))
 {
-    other.matrix_dimension_      = 0;
-    other.cyclic_corner_element_ = 0.0;
-    other.is_cyclic_             = true;
+    other.matrix_dimension_         = 0;
+    other.cyclic_corner_element_    = 0.0;
+    other.is_cyclic_                = true;
+    other.factorized_               = false;
+    other.single_precision_factors_ = false;
 }
 
 // move assignment
 template <typename T>
 SymmetricTridiagonalSolver<T>& SymmetricTridiagonalSolver<T>::operator=(SymmetricTridiagonalSolver&& other) noexcept
 {
-    matrix_dimension_            = other.matrix_dimension_;
-    main_diagonal_values_        = std::move(other.main_diagonal_values_);
-    sub_diagonal_values_         = std::move(other.sub_diagonal_values_);
-    cyclic_corner_element_       = other.cyclic_corner_element_;
-    is_cyclic_                   = other.is_cyclic_;
-    other.matrix_dimension_      = 0;
-    other.cyclic_corner_element_ = 0.0;
-    other.is_cyclic_             = true;
+    matrix_dimension_               = other.matrix_dimension_;
+    main_diagonal_values_           = std::move(other.main_diagonal_values_);
+    sub_diagonal_values_            = std::move(other.sub_diagonal_values_);
+    cyclic_corner_element_          = other.cyclic_corner_element_;
+    is_cyclic_                      = other.is_cyclic_;
+    factorized_                     = other.factorized_;
+    gamma_                          = other.gamma_;
+    single_precision_factors_       = other.single_precision_factors_;
+    main_diagonal_factors_float_    = std::move(other.main_diagonal_factors_float_);
+    sub_diagonal_factors_float_     = std::move(other.sub_diagonal_factors_float_);
+    other.matrix_dimension_         = 0;
+    other.cyclic_corner_element_    = 0.0;
+    other.is_cyclic_                = true;
+    other.factorized_               = false;
+    other.single_precision_factors_ = false;
     return *this;
 }
 
@@ -250,6 +301,18 @@ bool SymmetricTridiagonalSolver<T>::is_cyclic() const
     return is_cyclic_;
 }
 
+template <typename T>
+void SymmetricTridiagonalSolver<T>::single_precision_factors(bool value)
+{
+    assert(!factorized_);
+    single_precision_factors_ = value;
+}
+template <typename T>
+bool SymmetricTridiagonalSolver<T>::single_precision_factors() const
+{
+    return single_precision_factors_;
+}
+
 template <typename T>
 int SymmetricTridiagonalSolver<T>::rows() const
 {
@@ -307,7 +370,129 @@ T& SymmetricTridiagonalSolver<T>::cyclic_corner_element()
 }
 
 template <typename T>
-void SymmetricTridiagonalSolver<T>::solveInPlace(T* sol_rhs, T* temp1, T* temp2)
+void SymmetricTridiagonalSolver<T>::copyValues(const SymmetricTridiagonalSolver& other)
+{
+    factorized_               = other.factorized_;
+    gamma_                    = other.gamma_;
+    single_precision_factors_ = other.single_precision_factors_;
+
+    auto copy_array = [](const auto& source, auto& destination, const int size) {
+        using value_type = std::remove_reference_t<decltype(source[0])>;
+        if (!source) {
+            destination.reset();
+            return;
+        }
+        destination = std::make_unique<std::remove_const_t<value_type>[]>(size);
+        std::copy(source.get(), source.get() + size, destination.get());
+    };
+    copy_array(other.main_diagonal_values_, main_diagonal_values_, matrix_dimension_);
+    copy_array(other.sub_diagonal_values_, sub_diagonal_values_, matrix_dimension_ - 1);
+    copy_array(other.main_diagonal_factors_float_, main_diagonal_factors_float_, matrix_dimension_);
+    copy_array(other.sub_diagonal_factors_float_, sub_diagonal_factors_float_, matrix_dimension_ - 1);
+}
+
+template <typename T>
+void SymmetricTridiagonalSolver<T>::save(SetupWriter& writer) const
+{
+    writer.writeValue(matrix_dimension_);
+    writer.writeValue(cyclic_corner_element_);
+    writer.writeValue(is_cyclic_);
+    writer.writeValue(factorized_);
+    writer.writeValue(gamma_);
+    writer.writeValue(single_precision_factors_);
+
+    auto save_array = [&writer](const auto& values, const int size) {
+        writer.writeValue(static_cast<bool>(values));
+        if (values)
+            writer.writeArray(values.get(), size);
+    };
+    save_array(main_diagonal_values_, matrix_dimension_);
+    save_array(sub_diagonal_values_, matrix_dimension_ - 1);
+    save_array(main_diagonal_factors_float_, matrix_dimension_);
+    save_array(sub_diagonal_factors_float_, matrix_dimension_ - 1);
+}
+
+template <typename T>
+void SymmetricTridiagonalSolver<T>::load(SetupReader& reader)
+{
+    matrix_dimension_         = reader.readValue<int>();
+    cyclic_corner_element_    = reader.readValue<T>();
+    is_cyclic_                = reader.readValue<bool>();
+    factorized_               = reader.readValue<bool>();
+    gamma_                    = reader.readValue<T>();
+    single_precision_factors_ = reader.readValue<bool>();
+
+    auto load_array = [&reader](auto& values, const int size) {
+        using value_type = std::remove_reference_t<decltype(values[0])>;
+        values.reset();
+        if (reader.readValue<bool>()) {
+            values = std::make_unique<value_type[]>(size);
+            reader.readArray(values.get(), size);
+        }
+    };
+    load_array(main_diagonal_values_, matrix_dimension_);
+    load_array(sub_diagonal_values_, matrix_dimension_ - 1);
+    load_array(main_diagonal_factors_float_, matrix_dimension_);
+    load_array(sub_diagonal_factors_float_, matrix_dimension_ - 1);
+}
+
+template <typename T>
+void SymmetricTridiagonalSolver<T>::roundFactorsToSinglePrecision()
+{
+    assert(factorized_);
+    main_diagonal_factors_float_ = std::make_unique<float[]>(matrix_dimension_);
+    sub_diagonal_factors_float_  = std::make_unique<float[]>(matrix_dimension_ - 1);
+    for (int i = 0; i < matrix_dimension_; i++) {
+        main_diagonal_factors_float_[i] = static_cast<float>(main_diagonal_values_[i]);
+    }
+    for (int i = 0; i < matrix_dimension_ - 1; i++) {
+        sub_diagonal_factors_float_[i] = static_cast<float>(sub_diagonal_values_[i]);
+    }
+    main_diagonal_values_.reset();
+    sub_diagonal_values_.reset();
+}
+
+template <typename T>
+std::size_t SymmetricTridiagonalSolver<T>::memoryUsage() const
+{
+    std::size_t bytes = 0;
+    if (main_diagonal_values_)
+        bytes += matrix_dimension_ * sizeof(T);
+    if (sub_diagonal_values_)
+        bytes += (matrix_dimension_ - 1) * sizeof(T);
+    if (main_diagonal_factors_float_)
+        bytes += matrix_dimension_ * sizeof(float);
+    if (sub_diagonal_factors_float_)
+        bytes += (matrix_dimension_ - 1) * sizeof(float);
+    return bytes;
+}
+
+template <typename T>
+void SymmetricTridiagonalSolver<T>::factorize()
+{
+    if (factorized_ || matrix_dimension_ < 2)
+        return;
+
+    if (is_cyclic_) {
+        // Shermann-Morrison Adjustment
+        gamma_ = -main_diagonal(0);
+        main_diagonal(0) -= gamma_;
+        main_diagonal(matrix_dimension_ - 1) -= cyclic_corner_element() * cyclic_corner_element() / gamma_;
+    }
+
+    for (int i = 1; i < matrix_dimension_; i++) {
+        assert(!equals(main_diagonal(i - 1), 0.0));
+        sub_diagonal(i - 1) /= main_diagonal(i - 1);
+        main_diagonal(i) -= sub_diagonal(i - 1) * sub_diagonal(i - 1) * main_diagonal(i - 1);
+    }
+    factorized_ = true;
+    if (single_precision_factors_)
+        roundFactorsToSinglePrecision();
+}
+
+template <typename T>
+template <typename V>
+void SymmetricTridiagonalSolver<T>::solveInPlace(V* sol_rhs, V* temp1, V* temp2)
 {
     assert(matrix_dimension_ >= 2);
     assert(sol_rhs != nullptr);
@@ -329,7 +514,8 @@ void SymmetricTridiagonalSolver<T>::solveInPlace(T* sol_rhs, T* temp1, T* temp2)
  */
 
 template <typename T>
-void SymmetricTridiagonalSolver<T>::solveSymmetricTridiagonal(T* x, T* scratch)
+template <typename V>
+void SymmetricTridiagonalSolver<T>::solveSymmetricTridiagonal(V* x, V* scratch)
 {
     /* ---------------------------------------------------------- */
     /* Based on Cholesky Decomposition: A = L * D * L^T
@@ -344,27 +530,13 @@ void SymmetricTridiagonalSolver<T>::solveSymmetricTridiagonal(T* x, T* scratch)
     * ---------------------------------------------------------- */
 
     // Cholesky Decomposition
-    if (!factorized_) {
-        for (int i = 1; i < matrix_dimension_; i++) {
-            assert(!equals(main_diagonal(i - 1), 0.0));
-            sub_diagonal(i - 1) /= main_diagonal(i - 1);
-            main_diagonal(i) -= sub_diagonal(i - 1) * sub_diagonal(i - 1) * main_diagonal(i - 1);
-        }
-        factorized_ = true;
-    }
-    // Forward Substitution
-    for (int i = 1; i < matrix_dimension_; i++) {
-        x[i] -= sub_diagonal(i - 1) * x[i - 1];
-    }
-    // Diagonal Scaling
-    for (int i = 0; i < matrix_dimension_; i++) {
-        assert(!equals(main_diagonal(i), 0.0));
-        x[i] /= main_diagonal(i);
-    }
-    // Backward Substitution
-    for (int i = matrix_dimension_ - 2; i >= 0; i--) {
-        x[i] -= sub_diagonal(i) * x[i + 1];
-    }
+    if (!factorized_)
+        factorize();
+
+    if (single_precision_factors_)
+        substitute(main_diagonal_factors_float_.get(), sub_diagonal_factors_float_.get(), x);
+    else
+        substitute(main_diagonal_values_.get(), sub_diagonal_values_.get(), x);
 
     /* --------------------------------------------------------------- */
     /* Thomas Algorithm: An alternative approach for solving 
@@ -412,7 +584,8 @@ void SymmetricTridiagonalSolver<T>::solveSymmetricTridiagonal(T* x, T* scratch)
  */
 
 template <typename T>
-void SymmetricTridiagonalSolver<T>::solveSymmetricCyclicTridiagonal(T* x, T* u, T* scratch)
+template <typename V>
+void SymmetricTridiagonalSolver<T>::solveSymmetricCyclicTridiagonal(V* x, V* u, V* scratch)
 {
     /* ---------------------------------------------------------- */
     /* Cholesky Decomposition: A = L * D * L^T 
@@ -424,45 +597,13 @@ void SymmetricTridiagonalSolver<T>::solveSymmetricCyclicTridiagonal(T* x, T* u,
      * ---------------------------------------------------------- */
 
     // Cholesky Decomposition
-    if (!factorized_) {
-        // Shermann-Morrison Adjustment
-        gamma_ = -main_diagonal(0);
-        main_diagonal(0) -= gamma_;
-        main_diagonal(matrix_dimension_ - 1) -= cyclic_corner_element() * cyclic_corner_element() / gamma_;
-
-        for (int i = 1; i < matrix_dimension_; i++) {
-            sub_diagonal(i - 1) /= main_diagonal(i - 1);
-            main_diagonal(i) -= sub_diagonal(i - 1) * sub_diagonal(i - 1) * main_diagonal(i - 1);
-        }
-        factorized_ = true;
-    }
-    // Forward Substitution
-    u[0] = gamma_;
-    for (int i = 1; i < matrix_dimension_; i++) {
-        x[i] -= sub_diagonal(i - 1) * x[i - 1];
-        if (i < matrix_dimension_ - 1)
-            u[i] = 0.0 - sub_diagonal(i - 1) * u[i - 1];
-        else
-            u[i] = cyclic_corner_element() - sub_diagonal(i - 1) * u[i - 1];
-    }
-    // Diagonal Scaling
-    for (int i = 0; i < matrix_dimension_; i++) {
-        x[i] /= main_diagonal(i);
-        u[i] /= main_diagonal(i);
-    }
-    // Backward Substitution
-    for (int i = matrix_dimension_ - 2; i >= 0; i--) {
-        x[i] -= sub_diagonal(i) * x[i + 1];
-        u[i] -= sub_diagonal(i) * u[i + 1];
-    }
-    // Shermann-Morrison Reonstruction
-    const double dot_product_x_v = x[0] + cyclic_corner_element() / gamma_ * x[matrix_dimension_ - 1];
-    const double dot_product_u_v = u[0] + cyclic_corner_element() / gamma_ * u[matrix_dimension_ - 1];
-    const double factor          = dot_product_x_v / (1.0 + dot_product_u_v);
+    if (!factorized_)
+        factorize();
 
-    for (int i = 0; i < matrix_dimension_; i++) {
-        x[i] -= factor * u[i];
-    }
+    if (single_precision_factors_)
+        substituteCyclic(main_diagonal_factors_float_.get(), sub_diagonal_factors_float_.get(), x, u);
+    else
+        substituteCyclic(main_diagonal_values_.get(), sub_diagonal_values_.get(), x, u);
 
     /* --------------------------------------------------------------- */
     /* Thomas Algorithm: An alternative approach for solving 
@@ -510,3 +651,57 @@ void SymmetricTridiagonalSolver<T>::solveSymmetricCyclicTridiagonal(T* x, T* u,
     //     x[i] -= factor * u[i];
     // }
 }
+
+template <typename T>
+template <typename F, typename V>
+void SymmetricTridiagonalSolver<T>::substitute(const F* main_diagonal_factors, const F* sub_diagonal_factors,
+                                               V* x) const
+{
+    // Forward Substitution
+    for (int i = 1; i < matrix_dimension_; i++) {
+        x[i] -= sub_diagonal_factors[i - 1] * x[i - 1];
+    }
+    // Diagonal Scaling
+    for (int i = 0; i < matrix_dimension_; i++) {
+        assert(!equals(static_cast<double>(main_diagonal_factors[i]), 0.0));
+        x[i] /= main_diagonal_factors[i];
+    }
+    // Backward Substitution
+    for (int i = matrix_dimension_ - 2; i >= 0; i--) {
+        x[i] -= sub_diagonal_factors[i] * x[i + 1];
+    }
+}
+
+template <typename T>
+template <typename F, typename V>
+void SymmetricTridiagonalSolver<T>::substituteCyclic(const F* main_diagonal_factors, const F* sub_diagonal_factors,
+                                                     V* x, V* u) const
+{
+    // Forward Substitution
+    u[0] = gamma_;
+    for (int i = 1; i < matrix_dimension_; i++) {
+        x[i] -= sub_diagonal_factors[i - 1] * x[i - 1];
+        if (i < matrix_dimension_ - 1)
+            u[i] = 0.0 - sub_diagonal_factors[i - 1] * u[i - 1];
+        else
+            u[i] = cyclic_corner_element_ - sub_diagonal_factors[i - 1] * u[i - 1];
+    }
+    // Diagonal Scaling
+    for (int i = 0; i < matrix_dimension_; i++) {
+        x[i] /= main_diagonal_factors[i];
+        u[i] /= main_diagonal_factors[i];
+    }
+    // Backward Substitution
+    for (int i = matrix_dimension_ - 2; i >= 0; i--) {
+        x[i] -= sub_diagonal_factors[i] * x[i + 1];
+        u[i] -= sub_diagonal_factors[i] * u[i + 1];
+    }
+    // Shermann-Morrison Reonstruction
+    const double dot_product_x_v = x[0] + cyclic_corner_element_ / gamma_ * x[matrix_dimension_ - 1];
+    const double dot_product_u_v = u[0] + cyclic_corner_element_ / gamma_ * u[matrix_dimension_ - 1];
+    const double factor          = dot_product_x_v / (1.0 + dot_product_u_v);
+
+    for (int i = 0; i < matrix_dimension_; i++) {
+        x[i] -= factor * u[i];
+    }
+}
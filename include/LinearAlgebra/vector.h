@@ -12,4 +12,12 @@
 template <typename T>
 using Vector = Kokkos::View<T*, Kokkos::LayoutRight, Kokkos::HostSpace> const;
 template <typename T>
-using ConstVector = Kokkos::View<const T*, Kokkos::LayoutRight, Kokkos::HostSpace> const;
\ No newline at end of file
+using ConstVector = Kokkos::View<const T*, Kokkos::LayoutRight, Kokkos::HostSpace> const;
+// Column 'column' of a batch of vectors of length 'size', which are stored one after another.
+template <typename T>
+Kokkos::View<T*, Kokkos::LayoutRight, Kokkos::HostSpace>
+batchColumn(Kokkos::View<T*, Kokkos::LayoutRight, Kokkos::HostSpace> batch, const int column, const std::size_t size)
+{
+    assert((column + 1) * size <= batch.size());
+    return Kokkos::subview(batch, Kokkos::make_pair(column * size, (column + 1) * size));
+}
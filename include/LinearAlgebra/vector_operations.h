@@ -5,6 +5,7 @@
 #include <stdexcept>
 
 #include "../common/equals.h"
+#include "../common/parallel.h"
 #include "vector.h"
 #include <Kokkos_Core.hpp>
 
@@ -27,11 +28,8 @@ bool equals(ConstVector<T> lhs, ConstVector<T> rhs)
 template <typename T>
 void assign(Vector<T> lhs, const T& value)
 {
-    std::size_t n = lhs.size();
-#pragma omp parallel for if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
-        lhs(i) = value;
-    }
+    const std::size_t n = lhs.size();
+    parallelFor(0, n, vectorOperationThreads(n), [&](int i) { lhs(i) = value; });
 }
 
 template <typename T>
@@ -40,11 +38,8 @@ void add(Vector<T> result, ConstVector<T> x)
     if (result.size() != x.size()) {
         throw std::invalid_argument("Vectors must be of the same size.");
     }
-    std::size_t n = result.size();
-#pragma omp parallel for if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
-        result(i) += x(i);
-    }
+    const std::size_t n = result.size();
+    parallelFor(0, n, vectorOperationThreads(n), [&](int i) { result(i) += x(i); });
 }
 
 template <typename T>
@@ -53,11 +48,8 @@ void subtract(Vector<T> result, ConstVector<T> x)
     if (result.size() != x.size()) {
         throw std::invalid_argument("Vectors must be of the same size.");
     }
-    std::size_t n = result.size();
-#pragma omp parallel for if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
-        result(i) -= x(i);
-    }
+    const std::size_t n = result.size();
+    parallelFor(0, n, vectorOperationThreads(n), [&](int i) { result(i) -= x(i); });
 }
 
 template <typename T>
@@ -66,21 +58,15 @@ void linear_combination(Vector<T> x, const T& alpha, ConstVector<T> y, const T&
     if (x.size() != y.size()) {
         throw std::invalid_argument("Vectors must be of the same size.");
     }
-    std::size_t n = x.size();
-#pragma omp parallel for if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
-        x(i) = alpha * x(i) + beta * y(i);
-    }
+    const std::size_t n = x.size();
+    parallelFor(0, n, vectorOperationThreads(n), [&](int i) { x(i) = alpha * x(i) + beta * y(i); });
 }
 
 template <typename T>
 void multiply(Vector<T> x, const T& alpha)
 {
-    std::size_t n = x.size();
-#pragma omp parallel for if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
-        x(i) *= alpha;
-    }
+    const std::size_t n = x.size();
+    parallelFor(0, n, vectorOperationThreads(n), [&](int i) { x(i) *= alpha; });
 }
 
 template <typename T>
@@ -90,37 +76,22 @@ T dot_product(ConstVector<T> lhs, ConstVector<T> rhs)
         throw std::invalid_argument("Vectors must be of the same size.");
     }
 
-    T result      = 0.0;
-    std::size_t n = lhs.size();
-#pragma omp parallel for reduction(+ : result) if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
-        result += lhs(i) * rhs(i);
-    }
-    return result;
+    const std::size_t n = lhs.size();
+    return parallelSum<T>(0, n, vectorOperationThreads(n), [&](int i, T& sum) { sum += lhs(i) * rhs(i); });
 }
 
 template <typename T>
 T l1_norm(ConstVector<T> x)
 {
-    T result      = 0.0;
-    std::size_t n = x.size();
-#pragma omp parallel for reduction(+ : result) if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
-        result += std::abs(x(i));
-    }
-    return result;
+    const std::size_t n = x.size();
+    return parallelSum<T>(0, n, vectorOperationThreads(n), [&](int i, T& sum) { sum += std::abs(x(i)); });
 }
 
 template <typename T>
 T l2_norm_squared(ConstVector<T> x)
 {
-    T result      = 0.0;
-    std::size_t n = x.size();
-#pragma omp parallel for reduction(+ : result) if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
-        result += x(i) * x(i);
-    }
-    return result;
+    const std::size_t n = x.size();
+    return parallelSum<T>(0, n, vectorOperationThreads(n), [&](int i, T& sum) { sum += x(i) * x(i); });
 }
 
 template <typename T>
@@ -128,39 +99,32 @@ T l2_norm(ConstVector<T> x)
 {
     const std::size_t n = x.size();
     // 1) find the largest absolute value
-    T scale = 0.0;
-#pragma omp parallel for reduction(max : scale) if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
+    const T scale = parallelMax<T>(0, n, vectorOperationThreads(n), [&](int i, T& max) {
         T abs_val = std::abs(x(i));
-        if (abs_val > scale) {
-            scale = abs_val;
+        if (abs_val > max) {
+            max = abs_val;
         }
-    }
+    });
     if (equals(scale, T{0})) {
         return T{0};
     }
     // 2) accumulate sum of squares of scaled entries
-    T sum = 0.0;
-#pragma omp parallel for reduction(+ : sum) if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
+    const T sum_of_squares = parallelSum<T>(0, n, vectorOperationThreads(n), [&](int i, T& sum) {
         T value = x(i) / scale;
         sum += value * value;
-    }
+    });
     // 3) rescale
-    return scale * std::sqrt(sum);
+    return scale * std::sqrt(sum_of_squares);
 }
 
 template <typename T>
 T infinity_norm(ConstVector<T> x)
 {
-    T result      = 0.0;
-    std::size_t n = x.size();
-#pragma omp parallel for reduction(max : result) if (n > 10'000)
-    for (std::size_t i = 0; i < n; ++i) {
+    const std::size_t n = x.size();
+    return parallelMax<T>(0, n, vectorOperationThreads(n), [&](int i, T& max) {
         T abs_value = std::abs(x(i));
-        if (abs_value > result) {
-            result = abs_value;
+        if (abs_value > max) {
+            max = abs_value;
         }
-    }
-    return result;
+    });
 }
@@ -0,0 +1,23 @@
+#pragma once
+
+#include "../../Stencil/assembledStencil.h"
+#include "../residual.h"
+
+class ResidualAssembled : public Residual
+{
+public:
+    explicit ResidualAssembled(const PolarGrid& grid, const LevelCache& level_cache,
+                               const DomainGeometry& domain_geometry,
+                               const DensityProfileCoefficients& density_profile_coefficients,
+                               const bool DirBC_Interior, const int num_omp_threads,
+                               const AssembledStencil& stencil);
+    ~ResidualAssembled() override = default;
+
+    void computeResidual(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x) const override;
+
+private:
+    const AssembledStencil& stencil_;
+
+    void applyNode(const int i_r, const int i_theta, Vector<double> result, ConstVector<double> rhs,
+                   ConstVector<double> x) const;
+};
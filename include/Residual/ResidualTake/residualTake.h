@@ -11,9 +11,36 @@ public:
     ~ResidualTake() override = default;
 
     void computeResidual(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x) const override;
+    void computeResidualBatch(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x,
+                              const int number_of_columns) const override;
+
+    bool hasRestrictedResidual() const override
+    {
+        return true;
+    }
+    void computeRestrictedResidual(const PolarGrid& coarse_grid, Vector<double> result, ConstVector<double> rhs,
+                                   ConstVector<double> x, const bool extrapolated) const override;
+
+    bool hasSinglePrecision() const override
+    {
+        return true;
+    }
+    void computeRestrictedResidualSinglePrecision(const PolarGrid& coarse_grid, Vector<float> result,
+                                                  ConstVector<double> rhs, ConstVector<double> x) const override;
+    void computeRestrictedResidualSinglePrecision(const PolarGrid& coarse_grid, Vector<float> result,
+                                                  ConstVector<float> rhs, ConstVector<float> x) const override;
 
 private:
     void applyCircleSection(const int i_r, Vector<double> result, ConstVector<double> rhs, ConstVector<double> x) const;
+    template <typename X>
+    void applyInteriorCircleRow(const int i_r, double* row, ConstVector<X> rhs, ConstVector<X> x,
+                                const LineLanes& lanes = LineLanes()) const;
     void applyRadialSection(const int i_theta, Vector<double> result, ConstVector<double> rhs,
                             ConstVector<double> x) const;
+    // result = R * (rhs - A*x) for double and single precision vectors, see computeRestrictedResidual.
+    template <typename R, typename X>
+    void restrictedResidual(const PolarGrid& coarse_grid, Vector<R> result, ConstVector<X> rhs, ConstVector<X> x,
+                            const bool extrapolated) const;
+    void applyBatchNode(const int i_r, const int i_theta, double* result, const double* rhs, const double* x,
+                        const int number_of_columns) const;
 };
\ No newline at end of file
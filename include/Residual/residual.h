@@ -5,6 +5,7 @@ class Level;
 
 #include <chrono>
 #include <iostream>
+#include <stdexcept>
 #include <vector>
 
 #include "../PolarGrid/polargrid.h"
@@ -17,6 +18,7 @@ class Level;
 #include "../LinearAlgebra/vector.h"
 #include "../LinearAlgebra/vector_operations.h"
 #include "../common/global_definitions.h"
+#include "../common/parallel.h"
 
 class Residual
 {
@@ -28,6 +30,55 @@ public:
 
     virtual void computeResidual(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x) const = 0;
 
+    // Fused residual and restriction: result = R * (rhs - A*x) on coarse_grid without storing the fine residual.
+    // R is the full weighting restriction, or the extrapolated restriction if extrapolated is set.
+    virtual bool hasRestrictedResidual() const
+    {
+        return false;
+    }
+    virtual void computeRestrictedResidual(const PolarGrid& coarse_grid, Vector<double> result,
+                                           ConstVector<double> rhs, ConstVector<double> x,
+                                           const bool extrapolated) const
+    {
+        throw std::runtime_error("This residual does not support the fused restriction.");
+    }
+
+    // Residuals of number_of_columns systems with this operator, see GMGPolar::solve for a batch of right-hand
+    // sides. The columns of result, rhs and x are stored one after another. By default every column is computed
+    // by computeResidual, derived classes may evaluate the stencil once for all columns.
+    virtual void computeResidualBatch(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x,
+                                      const int number_of_columns) const
+    {
+        const std::size_t n = grid_.numberOfNodes();
+        for (int column = 0; column < number_of_columns; column++) {
+            computeResidual(batchColumn(result, column, n), batchColumn(rhs, column, n), batchColumn(x, column, n));
+        }
+    }
+
+    // Fused residual and restriction with single precision vectors for the correction cycle of
+    // GMGPolar::mixedPrecision(). The stencil is still evaluated in double precision. On the finest level
+    // the double precision rhs and x are read and the float rhs of the coarse level is written.
+    virtual bool hasSinglePrecision() const
+    {
+        return false;
+    }
+    virtual void computeRestrictedResidualSinglePrecision(const PolarGrid& coarse_grid, Vector<float> result,
+                                                          ConstVector<double> rhs, ConstVector<double> x) const
+    {
+        throw std::runtime_error("This residual does not support single precision vectors.");
+    }
+    virtual void computeRestrictedResidualSinglePrecision(const PolarGrid& coarse_grid, Vector<float> result,
+                                                          ConstVector<float> rhs, ConstVector<float> x) const
+    {
+        throw std::runtime_error("This residual does not support single precision vectors.");
+    }
+
+    // Sets the number of OpenMP threads used by subsequent applications (see GMGPolar::autotuneThreads).
+    void numOmpThreads(int num_omp_threads)
+    {
+        num_omp_threads_ = num_omp_threads;
+    }
+
 protected:
     /* ------------------- */
     /* Constructor members */
@@ -36,5 +87,5 @@ protected:
     const DomainGeometry& domain_geometry_;
     const DensityProfileCoefficients& density_profile_coefficients_;
     const bool DirBC_Interior_;
-    const int num_omp_threads_;
+    int num_omp_threads_;
 };
@@ -0,0 +1,32 @@
+#pragma once
+
+#include "../../Stencil/assembledStencil.h"
+#include "../SmootherTake/smootherTake.h"
+
+/* SmootherTake whose A_sc^ortho u_sc^ortho products use the coefficients of an AssembledStencil. */
+/* The line solvers are the ones of SmootherTake. */
+class SmootherAssembled : public SmootherTake
+{
+public:
+    explicit SmootherAssembled(const PolarGrid& grid, const LevelCache& level_cache,
+                               const DomainGeometry& domain_geometry,
+                               const DensityProfileCoefficients& density_profile_coefficients, bool DirBC_Interior,
+                               int num_omp_threads, const AssembledStencil& stencil,
+                               bool single_precision_factors = false, SetupReader* setup_reader = nullptr);
+    ~SmootherAssembled() override = default;
+
+    // The assembled coefficients are only applied to double precision vectors.
+    bool hasSinglePrecision() const override
+    {
+        return false;
+    }
+
+protected:
+    void applyAscOrthoCircleSection(const int i_r, const SmootherColor smoother_color, ConstVector<double> x,
+                                    ConstVector<double> rhs, Vector<double> temp, const LineLanes& lanes) override;
+    void applyAscOrthoRadialSection(const int i_theta, const SmootherColor smoother_color, ConstVector<double> x,
+                                    ConstVector<double> rhs, Vector<double> temp) override;
+
+private:
+    const AssembledStencil& stencil_;
+};
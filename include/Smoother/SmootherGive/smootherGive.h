@@ -12,11 +12,17 @@ class SmootherGive : public Smoother
 public:
     explicit SmootherGive(const PolarGrid& grid, const LevelCache& level_cache, const DomainGeometry& domain_geometry,
                           const DensityProfileCoefficients& density_profile_coefficients, bool DirBC_Interior,
-                          int num_omp_threads);
+                          int num_omp_threads, bool single_precision_factors = false,
+                          SetupReader* setup_reader = nullptr);
     ~SmootherGive() override;
 
     void smoothing(Vector<double> x, ConstVector<double> rhs, Vector<double> temp) override;
 
+    void refactorize() override;
+    std::size_t memoryUsage() const override;
+
+    void saveSetup(SetupWriter& writer) override;
+
 private:
     void smoothingSequential(Vector<double> x, ConstVector<double> rhs, Vector<double> temp);
     void smoothingForLoop(Vector<double> x, ConstVector<double> rhs, Vector<double> temp);
@@ -36,6 +42,7 @@ private:
 #endif
     std::vector<SymmetricTridiagonalSolver<double>> circle_tridiagonal_solver_;
     std::vector<SymmetricTridiagonalSolver<double>> radial_tridiagonal_solver_;
+    const bool single_precision_factors_;
 
     // clang-format off
     const Stencil stencil_DB_ = {
@@ -83,6 +90,9 @@ private:
     void buildAscCircleSection(const int i_r);
     void buildAscRadialSection(const int i_theta);
 
+    void loadSetup(SetupReader& reader);
+    void factorizeTridiagonalSolvers();
+
     void applyAscOrthoCircleSection(const int i_r, const SmootherColor smoother_color, ConstVector<double> x,
                                     ConstVector<double> rhs, Vector<double> temp);
     void applyAscOrthoRadialSection(const int i_theta, const SmootherColor smoother_color, ConstVector<double> x,
@@ -94,6 +104,7 @@ private:
 
 #ifdef GMGPOLAR_USE_MUMPS
     void initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
+    void refactorizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
     void finalizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver);
 #endif
 };
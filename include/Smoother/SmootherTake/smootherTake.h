@@ -12,10 +12,33 @@ class SmootherTake : public Smoother
 public:
     explicit SmootherTake(const PolarGrid& grid, const LevelCache& level_cache, const DomainGeometry& domain_geometry,
                           const DensityProfileCoefficients& density_profile_coefficients, bool DirBC_Interior,
-                          int num_omp_threads);
+                          int num_omp_threads, bool single_precision_factors = false,
+                          SetupReader* setup_reader = nullptr);
     ~SmootherTake() override;
 
     void smoothing(Vector<double> x, ConstVector<double> rhs, Vector<double> temp) override;
+    void smoothingBatch(Vector<double> x, ConstVector<double> rhs, Vector<double> temp,
+                        const int number_of_columns) override;
+
+    // The line solves use the single precision factors if they are enabled, see single_precision_factors.
+    bool hasSinglePrecision() const override
+    {
+        return true;
+    }
+    void smoothingSinglePrecision(Vector<float> x, ConstVector<float> rhs, Vector<float> temp) override;
+
+    void refactorize() override;
+    std::size_t memoryUsage() const override;
+
+    void saveSetup(SetupWriter& writer) override;
+
+protected:
+    // temp = rhs - A_sc^ortho u_sc^ortho on a circle or radial line, overridden by SmootherAssembled.
+    // The nodes of a circle are vectorized over the lanes of the calling thread.
+    virtual void applyAscOrthoCircleSection(const int i_r, const SmootherColor smoother_color, ConstVector<double> x,
+                                            ConstVector<double> rhs, Vector<double> temp, const LineLanes& lanes);
+    virtual void applyAscOrthoRadialSection(const int i_theta, const SmootherColor smoother_color,
+                                            ConstVector<double> x, ConstVector<double> rhs, Vector<double> temp);
 
 private:
     // The A_sc matrix on i_r = 0 is defined through the COO/CSR matrix
@@ -33,6 +56,7 @@ private:
 #endif
     std::vector<SymmetricTridiagonalSolver<double>> circle_tridiagonal_solver_;
     std::vector<SymmetricTridiagonalSolver<double>> radial_tridiagonal_solver_;
+    const bool single_precision_factors_;
 
     // clang-format off
     const Stencil stencil_DB_ = {
@@ -80,17 +104,37 @@ private:
     void buildAscCircleSection(const int i_r);
     void buildAscRadialSection(const int i_theta);
 
-    void applyAscOrthoCircleSection(const int i_r, const SmootherColor smoother_color, ConstVector<double> x,
-                                    ConstVector<double> rhs, Vector<double> temp);
-    void applyAscOrthoRadialSection(const int i_theta, const SmootherColor smoother_color, ConstVector<double> x,
-                                    ConstVector<double> rhs, Vector<double> temp);
+    void loadSetup(SetupReader& reader);
+    void factorizeTridiagonalSolvers();
+
+    // The Take stencil of applyAscOrthoCircleSection/applyAscOrthoRadialSection for double and float vectors.
+    template <typename T>
+    void applyAscOrthoCircleTake(const int i_r, const SmootherColor smoother_color, ConstVector<T> x,
+                                 ConstVector<T> rhs, Vector<T> temp, const LineLanes& lanes);
+    template <typename T>
+    void applyAscOrthoRadialTake(const int i_theta, const SmootherColor smoother_color, ConstVector<T> x,
+                                 ConstVector<T> rhs, Vector<T> temp);
+    template <typename T>
+    void applyAscOrthoInteriorCircleRow(const int i_r, ConstVector<T> x, ConstVector<T> rhs, Vector<T> temp,
+                                        const LineLanes& lanes);
+
+    // Shared implementation of smoothing and smoothingSinglePrecision.
+    template <typename T>
+    void smoothingLines(Vector<T> x, ConstVector<T> rhs, Vector<T> temp);
 
-    void solveCircleSection(const int i_r, Vector<double> x, Vector<double> temp, Vector<double> solver_storage_1,
-                            Vector<double> solver_storage_2);
-    void solveRadialSection(const int i_theta, Vector<double> x, Vector<double> temp, Vector<double> solver_storage);
+    void solveInnerBoundaryCircle(double* circle, const int number_of_columns);
+    // Solves the line for the first number_of_columns columns of a batch, whose columns are stored one after another.
+    // The solver storages are the work arrays of the tridiagonal solver, see parallelForColorsWithScratch.
+    template <typename T>
+    void solveCircleSection(const int i_r, Vector<T> x, Vector<T> temp, T* solver_storage_1, T* solver_storage_2,
+                            const int number_of_columns = 1);
+    template <typename T>
+    void solveRadialSection(const int i_theta, Vector<T> x, Vector<T> temp, T* solver_storage,
+                            const int number_of_columns = 1);
 
 #ifdef GMGPOLAR_USE_MUMPS
     void initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
+    void refactorizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix);
     void finalizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver);
 #endif
 };
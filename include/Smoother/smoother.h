@@ -5,6 +5,7 @@ class Level;
 
 #include <chrono>
 #include <iostream>
+#include <stdexcept>
 #include <vector>
 
 #include "../InputFunctions/boundaryConditions.h"
@@ -21,6 +22,8 @@ class Level;
 #include "../PolarGrid/polargrid.h"
 #include "../Stencil/stencil.h"
 #include "../common/global_definitions.h"
+#include "../common/parallel.h"
+#include "../common/setup_archive.h"
 
 class Smoother
 {
@@ -32,11 +35,48 @@ public:
 
     virtual void smoothing(Vector<double> x, ConstVector<double> rhs, Vector<double> temp) = 0;
 
+    // Smoothing of number_of_columns systems with this operator, whose columns are stored one after another.
+    // By default every column is smoothed by smoothing(), derived classes may reuse the line data for all columns.
+    virtual void smoothingBatch(Vector<double> x, ConstVector<double> rhs, Vector<double> temp,
+                                const int number_of_columns)
+    {
+        const std::size_t n = grid_.numberOfNodes();
+        for (int column = 0; column < number_of_columns; column++) {
+            smoothing(batchColumn(x, column, n), batchColumn(rhs, column, n), batchColumn(temp, column, n));
+        }
+    }
+
+    // Smoothing with single precision vectors in the correction cycle of GMGPolar::mixedPrecision().
+    virtual bool hasSinglePrecision() const
+    {
+        return false;
+    }
+    virtual void smoothingSinglePrecision(Vector<float> x, ConstVector<float> rhs, Vector<float> temp)
+    {
+        throw std::runtime_error("This smoother does not support single precision vectors.");
+    }
+
+    // Sets the number of OpenMP threads used by subsequent applications (see GMGPolar::autotuneThreads).
+    void numOmpThreads(int num_omp_threads)
+    {
+        num_omp_threads_ = num_omp_threads;
+    }
+
+    // Rebuilds the smoother matrices from the level cache and refactorizes them.
+    virtual void refactorize() = 0;
+
+    // Bytes held by the matrices and factorizations of the smoother, including the memory MUMPS reports.
+    virtual std::size_t memoryUsage() const = 0;
+
+    // Writes the factorized matrices to a setup file (see GMGPolar::saveSetup).
+    // The derived classes restore them in their constructor if a SetupReader is passed.
+    virtual void saveSetup(SetupWriter& writer) = 0;
+
 protected:
     const PolarGrid& grid_;
     const LevelCache& level_cache_;
     const DomainGeometry& domain_geometry_;
     const DensityProfileCoefficients& density_profile_coefficients_;
     const bool DirBC_Interior_;
-    const int num_omp_threads_;
+    int num_omp_threads_;
 };
@@ -0,0 +1,174 @@
+#pragma once
+
+#include <initializer_list>
+
+#include "../Level/level.h"
+#include "../LinearAlgebra/vector.h"
+#include "../PolarGrid/polargrid.h"
+#include "../common/parallel.h"
+#include "stencil.h"
+
+/**
+ * @brief Assembled 9-point stencil of the operator A (see StencilDistributionMethod::CPU_ASSEMBLED).
+ *
+ * The Take operators rebuild the stencil coefficients from the cached arr, att, art, detDF and beta
+ * in every application. This class evaluates them once, so the residual and the Asc-ortho parts of
+ * the smoothers reduce to multiply-adds of stored coefficients with the neighboring values.
+ *
+ * The full storage keeps all 9 coefficients of a node. The symmetric storage only keeps Center, Right,
+ * Top, TopRight and BottomRight. Left, Bottom, BottomLeft and TopLeft are the Right, Top, TopRight
+ * and BottomRight coefficients of the corresponding neighbor, since A is symmetric apart from the rows
+ * of the Dirichlet boundary nodes. The across-origin coupling of the innermost circle is stored
+ * separately, because its symmetry would require symmetrically distributed angles.
+ *
+ * The rows of Dirichlet boundary nodes are identity rows. coefficient() returns their entries,
+ * apply() must not be called for them.
+ */
+
+// Bit mask of stencil positions, used as template argument of AssembledStencil::apply.
+constexpr unsigned stencilPositions(std::initializer_list<StencilPosition> positions)
+{
+    unsigned mask = 0;
+    for (const StencilPosition position : positions)
+        mask |= 1u << static_cast<int>(position);
+    return mask;
+}
+
+constexpr unsigned ALL_STENCIL_POSITIONS = (1u << 9) - 1;
+
+class AssembledStencil
+{
+public:
+    explicit AssembledStencil(const PolarGrid& grid, const LevelCache& level_cache, const bool DirBC_Interior,
+                              const bool symmetric, const int num_omp_threads);
+
+    // Recomputes the coefficients from the level cache, e.g. after the density profile coefficients changed.
+    void assemble();
+
+    bool symmetric() const;
+    // Bytes held by the stored coefficients.
+    std::size_t memoryUsage() const;
+
+    // Entry of A in the row of (i_r, i_theta) and the column of its neighbor at 'position'.
+    // On the innermost circle of the across-origin discretization 'Left' is the node across the origin.
+    double coefficient(const int i_r, const int i_theta, const StencilPosition position) const;
+
+    // Row of a Dirichlet boundary node: rhs - A*x reduces to rhs - x.
+    bool isDirichletRow(const int i_r) const
+    {
+        return (i_r == 0 && DirBC_Interior_) || i_r == grid_.nr() - 1;
+    }
+
+    // Sum of coefficient(i_r, i_theta, position) * x[neighbor at position] over the positions in the mask.
+    template <unsigned Positions>
+    double apply(const int i_r, const int i_theta, ConstVector<double> x) const;
+
+private:
+    const PolarGrid& grid_;
+    const LevelCache& level_cache_;
+    const bool DirBC_Interior_;
+    const bool symmetric_;
+    const int num_omp_threads_;
+
+    // Coefficient 'slot' of all nodes is stored contiguously at values_[slot * numberOfNodes() + node index].
+    Vector<double> values_;
+    // Across-origin coupling of the innermost circle in the symmetric storage.
+    Vector<double> across_origin_;
+
+    // Coefficients kept by the symmetric storage.
+    enum SymmetricSlot
+    {
+        SYMMETRIC_CENTER       = 0,
+        SYMMETRIC_RIGHT        = 1,
+        SYMMETRIC_TOP          = 2,
+        SYMMETRIC_TOP_RIGHT    = 3,
+        SYMMETRIC_BOTTOM_RIGHT = 4,
+        NUMBER_OF_SYMMETRIC_SLOTS
+    };
+
+    double stored(const int slot, const int index) const
+    {
+        return values_[slot * grid_.numberOfNodes() + index];
+    }
+
+    void assembleNode(const int i_r, const int i_theta);
+};
+
+template <unsigned Positions>
+inline double AssembledStencil::apply(const int i_r, const int i_theta, ConstVector<double> x) const
+{
+    assert(!isDirichletRow(i_r));
+
+    constexpr auto contains = [](const StencilPosition position) {
+        return (Positions & (1u << static_cast<int>(position))) != 0;
+    };
+
+    const int i_theta_M1 = grid_.wrapThetaIndex(i_theta - 1);
+    const int i_theta_P1 = grid_.wrapThetaIndex(i_theta + 1);
+
+    const int center = grid_.index(i_r, i_theta);
+    const int bottom = grid_.index(i_r, i_theta_M1);
+    const int top    = grid_.index(i_r, i_theta_P1);
+    // The innermost circle of the across-origin discretization has no nodes to its left,
+    // 'left' is the node across the origin there.
+    const int left         = i_r > 0 ? grid_.index(i_r - 1, i_theta) : grid_.index(0, i_theta + grid_.ntheta() / 2);
+    const int bottom_left  = i_r > 0 ? grid_.index(i_r - 1, i_theta_M1) : -1;
+    const int top_left     = i_r > 0 ? grid_.index(i_r - 1, i_theta_P1) : -1;
+    const int bottom_right = grid_.index(i_r + 1, i_theta_M1);
+    const int right        = grid_.index(i_r + 1, i_theta);
+    const int top_right    = grid_.index(i_r + 1, i_theta_P1);
+
+    double sum = 0.0;
+    if (!symmetric_) {
+        auto entry = [this, center](const StencilPosition position) {
+            return stored(static_cast<int>(position), center);
+        };
+        if constexpr (contains(StencilPosition::Center))
+            sum += entry(StencilPosition::Center) * x[center];
+        if constexpr (contains(StencilPosition::Left))
+            sum += entry(StencilPosition::Left) * x[left];
+        if constexpr (contains(StencilPosition::Right))
+            sum += entry(StencilPosition::Right) * x[right];
+        if constexpr (contains(StencilPosition::Bottom))
+            sum += entry(StencilPosition::Bottom) * x[bottom];
+        if constexpr (contains(StencilPosition::Top))
+            sum += entry(StencilPosition::Top) * x[top];
+        if constexpr (contains(StencilPosition::BottomLeft)) {
+            if (i_r > 0)
+                sum += entry(StencilPosition::BottomLeft) * x[bottom_left];
+        }
+        if constexpr (contains(StencilPosition::BottomRight))
+            sum += entry(StencilPosition::BottomRight) * x[bottom_right];
+        if constexpr (contains(StencilPosition::TopLeft)) {
+            if (i_r > 0)
+                sum += entry(StencilPosition::TopLeft) * x[top_left];
+        }
+        if constexpr (contains(StencilPosition::TopRight))
+            sum += entry(StencilPosition::TopRight) * x[top_right];
+        return sum;
+    }
+
+    if constexpr (contains(StencilPosition::Center))
+        sum += stored(SYMMETRIC_CENTER, center) * x[center];
+    if constexpr (contains(StencilPosition::Left))
+        sum += (i_r > 0 ? stored(SYMMETRIC_RIGHT, left) : across_origin_[i_theta]) * x[left];
+    if constexpr (contains(StencilPosition::Right))
+        sum += stored(SYMMETRIC_RIGHT, center) * x[right];
+    if constexpr (contains(StencilPosition::Bottom))
+        sum += stored(SYMMETRIC_TOP, bottom) * x[bottom];
+    if constexpr (contains(StencilPosition::Top))
+        sum += stored(SYMMETRIC_TOP, center) * x[top];
+    if constexpr (contains(StencilPosition::BottomLeft)) {
+        if (i_r > 0)
+            sum += stored(SYMMETRIC_TOP_RIGHT, bottom_left) * x[bottom_left];
+    }
+    if constexpr (contains(StencilPosition::BottomRight))
+        sum += stored(SYMMETRIC_BOTTOM_RIGHT, center) * x[bottom_right];
+    if constexpr (contains(StencilPosition::TopLeft)) {
+        if (i_r > 0)
+            sum += stored(SYMMETRIC_BOTTOM_RIGHT, top_left) * x[top_left];
+    }
+    if constexpr (contains(StencilPosition::TopRight))
+        sum += stored(SYMMETRIC_TOP_RIGHT, center) * x[top_right];
+    return sum;
+}
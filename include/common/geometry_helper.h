@@ -5,18 +5,11 @@
 
 #include <cmath>
 
-inline void compute_jacobian_elements(const DomainGeometry& domain_geometry, const double& r, const double& theta,
-                                      const double& sin_theta, const double& cos_theta, const double& coeff_alpha,
-                                      double& arr, double& att, double& art, double& detDF)
+/* Computes arr, att, art and detDF from the entries of the Jacobian matrix of the transformation mapping. */
+inline void compute_metric_from_jacobian(const double Jrr, const double Jtr, const double Jrt, const double Jtt,
+                                         const double& coeff_alpha, double& arr, double& att, double& art,
+                                         double& detDF)
 {
-    /* Calculate the elements of the Jacobian matrix for the transformation mapping */
-    /* The Jacobian matrix is: */
-    /* [Jrr, Jrt] */
-    /* [Jtr, Jtt] */
-    const double Jrr = domain_geometry.dFx_dr(r, theta, sin_theta, cos_theta);
-    const double Jtr = domain_geometry.dFy_dr(r, theta, sin_theta, cos_theta);
-    const double Jrt = domain_geometry.dFx_dt(r, theta, sin_theta, cos_theta);
-    const double Jtt = domain_geometry.dFy_dt(r, theta, sin_theta, cos_theta);
     /* Compute the determinant of the Jacobian matrix */
     detDF = Jrr * Jtt - Jrt * Jtr;
     /* Compute the elements of the symmetric matrix: */
@@ -32,3 +25,48 @@ inline void compute_jacobian_elements(const DomainGeometry& domain_geometry, con
     /*  [Jtt, -Jrt]      */
     /*  [-Jtr, Jrr]      */
 }
+
+inline void compute_jacobian_elements(const DomainGeometry& domain_geometry, const double& r, const double& theta,
+                                      const double& sin_theta, const double& cos_theta, const double& coeff_alpha,
+                                      double& arr, double& att, double& art, double& detDF)
+{
+    /* Calculate the elements of the Jacobian matrix for the transformation mapping */
+    /* The Jacobian matrix is: */
+    /* [Jrr, Jrt] */
+    /* [Jtr, Jtt] */
+    const double Jrr = domain_geometry.dFx_dr(r, theta, sin_theta, cos_theta);
+    const double Jtr = domain_geometry.dFy_dr(r, theta, sin_theta, cos_theta);
+    const double Jrt = domain_geometry.dFx_dt(r, theta, sin_theta, cos_theta);
+    const double Jtt = domain_geometry.dFy_dt(r, theta, sin_theta, cos_theta);
+    compute_metric_from_jacobian(Jrr, Jtr, Jrt, Jtt, coeff_alpha, arr, att, art, detDF);
+}
+
+/* compute_jacobian_elements for 'count' nodes of a circle. The Jacobian entries are evaluated by one batched call */
+/* of the domain geometry into the output arrays (Jrr -> arr, Jtr -> att, Jrt -> art, Jtt -> detDF) and are */
+/* converted in place afterwards. */
+inline void compute_jacobian_elements_circle(const DomainGeometry& domain_geometry, const double r, const int count,
+                                             const double* theta, const double* sin_theta, const double* cos_theta,
+                                             const double* coeff_alpha, double* arr, double* att, double* art,
+                                             double* detDF)
+{
+    domain_geometry.evaluateCircle(r, count, theta, sin_theta, cos_theta, nullptr, nullptr, arr, att, art, detDF);
+#pragma omp simd
+    for (int i = 0; i < count; i++) {
+        compute_metric_from_jacobian(arr[i], att[i], art[i], detDF[i], coeff_alpha[i], arr[i], att[i], art[i],
+                                     detDF[i]);
+    }
+}
+
+/* compute_jacobian_elements for 'count' nodes of a radial line, see compute_jacobian_elements_circle. */
+inline void compute_jacobian_elements_radial_line(const DomainGeometry& domain_geometry, const int count,
+                                                  const double* r, const double theta, const double sin_theta,
+                                                  const double cos_theta, const double* coeff_alpha, double* arr,
+                                                  double* att, double* art, double* detDF)
+{
+    domain_geometry.evaluateRadialLine(count, r, theta, sin_theta, cos_theta, nullptr, nullptr, arr, att, art, detDF);
+#pragma omp simd
+    for (int i = 0; i < count; i++) {
+        compute_metric_from_jacobian(arr[i], att[i], art[i], detDF[i], coeff_alpha[i], arr[i], att[i], art[i],
+                                     detDF[i]);
+    }
+}
@@ -1,15 +1,28 @@
 #pragma once
 
+#include <string>
+#include <utility>
+#include <variant>
+
 /* ---------------------------------- */
 /* GMGPolar - Enumeration Definitions */
 /* ---------------------------------- */
 
 enum class StencilDistributionMethod
 {
-    CPU_TAKE = 0,
-    CPU_GIVE = 1
+    CPU_TAKE                = 0,
+    CPU_GIVE                = 1,
+    CPU_ASSEMBLED           = 2, // Take on the 9 stencil coefficients of every node, assembled during the setup
+    CPU_ASSEMBLED_SYMMETRIC = 3 // CPU_ASSEMBLED storing 5 coefficients per node, the others follow by symmetry
 };
 
+// Whether the operators apply the coefficients of an AssembledStencil instead of evaluating them.
+inline bool usesAssembledStencil(const StencilDistributionMethod stencil_distribution_method)
+{
+    return stencil_distribution_method == StencilDistributionMethod::CPU_ASSEMBLED ||
+           stencil_distribution_method == StencilDistributionMethod::CPU_ASSEMBLED_SYMMETRIC;
+}
+
 /* Multigrid Cycle Types */
 enum class MultigridCycleType
 {
@@ -34,6 +47,36 @@ enum class ExtrapolationType
     COMBINED                     = 3,
 };
 
+/* Outer Solver Types */
+enum class OuterSolverType
+{
+    MULTIGRID_ITERATION = 0, // Stationary multigrid iteration
+    PCG                 = 1, // Multigrid-preconditioned (flexible) conjugate gradient
+    FGMRES              = 2 // Multigrid-preconditioned flexible GMRES(m)
+};
+
+/* ParaView Output Formats */
+enum class ParaviewFormat
+{
+    ASCII      = 0, // Unstructured grid (.vtu) with inline text data
+    BINARY     = 1, // Unstructured grid (.vtu) with appended raw binary data
+    COMPRESSED = 2, // Unstructured grid (.vtu) with appended zlib compressed data
+    STRUCTURED = 3 // Structured grid (.vts) without connectivity, zlib compressed if available, raw binary otherwise
+};
+
+/* Operations recorded per level by the Profiler */
+enum class ProfiledOperation
+{
+    SMOOTHING              = 0,
+    EXTRAPOLATED_SMOOTHING = 1,
+    RESIDUAL               = 2,
+    RESTRICTION            = 3,
+    PROLONGATION           = 4,
+    INJECTION              = 5,
+    DIRECT_SOLVE           = 6,
+    NORM                   = 7
+};
+
 /* Smoother Colors */
 enum class SmootherColor
 {
@@ -79,6 +122,9 @@ enum class BetaCoeff
     ALPHA_INVERSE = 1
 };
 
+/* Entry of the "problem" section of the JSON run report: command line key and value */
+using ReportSetting = std::pair<std::string, std::variant<int, double, std::string>>;
+
 /* ---------------------------- */
 /* Mumps - Constant Definitions */
 /* ---------------------------- */
@@ -0,0 +1,129 @@
+#pragma once
+
+#include <cstddef>
+#include <fstream>
+#include <ostream>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <sys/resource.h>
+#include <unistd.h>
+
+#include "global_definitions.h"
+
+#ifdef GMGPOLAR_USE_MUMPS
+    #include "dmumps_c.h"
+    #include "smumps_c.h"
+#endif
+
+/*
+ * Memory accounting of the multigrid hierarchy, see GMGPolar::memoryReport().
+ *
+ * The byte counts are the sizes of the allocations held by each level. The process high-water mark
+ * is sampled when the setup and the solve phase end. Since it is never reset, the solve mark also
+ * covers the setup. The difference to the resident set size at the start of the solve is the growth
+ * caused by the solve.
+ */
+
+struct LevelMemory {
+    std::size_t vectors = 0; // rhs, solution (unless shared), residual and error correction
+    std::vector<std::pair<std::string, std::size_t>> level_cache; // Bytes per cached array
+    std::size_t smoother              = 0;
+    std::size_t extrapolated_smoother = 0;
+    std::size_t direct_solver         = 0;
+    std::size_t assembled_stencil     = 0; // Stencil coefficients of the assembled stencil distribution methods
+
+    std::size_t levelCache() const
+    {
+        std::size_t bytes = 0;
+        for (const auto& array : level_cache)
+            bytes += array.second;
+        return bytes;
+    }
+
+    std::size_t total() const
+    {
+        return vectors + levelCache() + smoother + extrapolated_smoother + direct_solver + assembled_stencil;
+    }
+};
+
+struct MemoryReport {
+    std::vector<LevelMemory> levels;
+
+    // Resident set size at the start and high-water mark at the end of the last setup and solve in bytes.
+    // -1 if the phase did not run or the value is not available on this platform.
+    long setup_resident_set_size = -1;
+    long setup_high_water_mark   = -1;
+    long solve_resident_set_size = -1;
+    long solve_high_water_mark   = -1;
+
+    std::size_t total() const
+    {
+        std::size_t bytes = 0;
+        for (const LevelMemory& level : levels)
+            bytes += level.total();
+        return bytes;
+    }
+
+    void writeJSON(std::ostream& stream) const
+    {
+        stream << "{\n  \"totalBytes\": " << total() << ",\n";
+        stream << "  \"setupResidentSetSize\": " << setup_resident_set_size << ",\n";
+        stream << "  \"setupHighWaterMark\": " << setup_high_water_mark << ",\n";
+        stream << "  \"solveResidentSetSize\": " << solve_resident_set_size << ",\n";
+        stream << "  \"solveHighWaterMark\": " << solve_high_water_mark << ",\n";
+        stream << "  \"levels\": [";
+        for (std::size_t level_depth = 0; level_depth < levels.size(); level_depth++) {
+            const LevelMemory& level = levels[level_depth];
+            stream << (level_depth > 0 ? "," : "") << "\n    {\"level\": " << level_depth
+                   << ", \"vectors\": " << level.vectors << ", \"levelCache\": {";
+            for (std::size_t i = 0; i < level.level_cache.size(); i++) {
+                stream << (i > 0 ? ", " : "") << "\"" << level.level_cache[i].first
+                       << "\": " << level.level_cache[i].second;
+            }
+            stream << "}, \"smoother\": " << level.smoother
+                   << ", \"extrapolatedSmoother\": " << level.extrapolated_smoother
+                   << ", \"directSolver\": " << level.direct_solver
+                   << ", \"assembledStencil\": " << level.assembled_stencil << ", \"total\": " << level.total() << "}";
+        }
+        stream << (levels.empty() ? "]" : "\n  ]") << "\n}\n";
+    }
+};
+
+// Current resident set size of the process in bytes, -1 if not available.
+inline long residentSetSize()
+{
+    std::ifstream statm("/proc/self/statm");
+    long total_pages, resident_pages;
+    if (!(statm >> total_pages >> resident_pages))
+        return -1;
+    return resident_pages * sysconf(_SC_PAGESIZE);
+}
+
+// Peak resident set size of the process in bytes, -1 if not available.
+inline long peakResidentSetSize()
+{
+    struct rusage usage;
+    if (getrusage(RUSAGE_SELF, &usage) != 0)
+        return -1;
+#ifdef __APPLE__
+    return static_cast<long>(usage.ru_maxrss); // ru_maxrss is given in bytes on macOS
+#else
+    return static_cast<long>(usage.ru_maxrss) * 1024; // and in kilobytes on Linux
+#endif
+}
+
+#ifdef GMGPOLAR_USE_MUMPS
+// Memory MUMPS used for the factorization in bytes, summed over all processes (INFOG(22), given in MB).
+inline std::size_t mumpsMemoryUsage(const DMUMPS_STRUC_C& mumps_solver)
+{
+    const int megabytes = mumps_solver.INFOG(22);
+    return megabytes > 0 ? static_cast<std::size_t>(megabytes) * 1000000 : 0;
+}
+inline std::size_t mumpsMemoryUsage(const SMUMPS_STRUC_C& mumps_solver)
+{
+    const int megabytes = mumps_solver.INFOG(22);
+    return megabytes > 0 ? static_cast<std::size_t>(megabytes) * 1000000 : 0;
+}
+#endif
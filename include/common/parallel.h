@@ -0,0 +1,246 @@
+#pragma once
+
+#include <algorithm>
+#include <map>
+#include <mutex>
+#include <omp.h>
+#include <vector>
+
+#include <Kokkos_Core.hpp>
+
+/*
+ * Parallel loops of the grid kernels.
+ *
+ * The kernels iterate over circles, radial lines or vector entries and call these helpers with the
+ * thread count of their level. By default the helpers are OpenMP work-sharing loops with that thread count.
+ * With GMGPOLAR_USE_KOKKOS_KERNELS (CMake option of the same name) they launch Kokkos::parallel_for and
+ * Kokkos::parallel_reduce on the default host execution space, so OpenMP, Threads or Serial is chosen when
+ * Kokkos is built. The thread count of the level selects a partition of the Kokkos thread pool, see
+ * hostExecutionSpace(). Kokkos only splits the pool of the OpenMP backend, the partitions of the Threads and
+ * Serial backends share the whole pool, so these backends use the Kokkos thread count on every level.
+ * A thread count of 1 always runs the loop in the calling thread.
+ */
+
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+using HostExecutionSpace = Kokkos::DefaultHostExecutionSpace;
+
+// Instance of the host execution space with num_threads threads of the Kokkos thread pool.
+// The partitions are created on first use and released when Kokkos is finalized.
+inline HostExecutionSpace hostExecutionSpace(const int num_threads)
+{
+    const int concurrency = HostExecutionSpace().concurrency();
+    if (num_threads >= concurrency) {
+        return HostExecutionSpace();
+    }
+
+    static std::mutex mutex;
+    static std::map<int, HostExecutionSpace>* partitions = nullptr;
+    std::lock_guard<std::mutex> lock(mutex);
+    if (partitions == nullptr) {
+        partitions = new std::map<int, HostExecutionSpace>();
+        Kokkos::push_finalize_hook([] {
+            std::lock_guard<std::mutex> finalize_lock(mutex);
+            delete partitions;
+            partitions = nullptr;
+        });
+    }
+    auto partition = partitions->find(num_threads);
+    if (partition == partitions->end()) {
+        const std::vector<int> weights = {num_threads, concurrency - num_threads};
+        const HostExecutionSpace space = Kokkos::Experimental::partition_space(HostExecutionSpace(), weights)[0];
+        partition                      = partitions->emplace(num_threads, space).first;
+    }
+    return partition->second;
+}
+#endif
+
+// Calls functor(i) for every begin <= i < end.
+template <typename Functor>
+inline void parallelFor(const int begin, const int end, const int num_threads, const Functor& functor)
+{
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+    if (num_threads > 1) {
+        const HostExecutionSpace space = hostExecutionSpace(num_threads);
+        Kokkos::parallel_for("GMGPolar::parallelFor", Kokkos::RangePolicy<HostExecutionSpace>(space, begin, end),
+                             functor);
+        space.fence();
+        return;
+    }
+    for (int i = begin; i < end; i++) {
+        functor(i);
+    }
+#else
+#pragma omp parallel for num_threads(num_threads) if (num_threads > 1)
+    for (int i = begin; i < end; i++) {
+        functor(i);
+    }
+#endif
+}
+
+// Returns the sum of the contributions functor(i, sum) adds for every begin <= i < end.
+template <typename T, typename Functor>
+inline T parallelSum(const int begin, const int end, const int num_threads, const Functor& functor)
+{
+    T result = 0;
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+    if (num_threads > 1) {
+        const HostExecutionSpace space = hostExecutionSpace(num_threads);
+        Kokkos::parallel_reduce("GMGPolar::parallelSum", Kokkos::RangePolicy<HostExecutionSpace>(space, begin, end),
+                                functor, result);
+        return result;
+    }
+    for (int i = begin; i < end; i++) {
+        functor(i, result);
+    }
+#else
+#pragma omp parallel for reduction(+ : result) num_threads(num_threads) if (num_threads > 1)
+    for (int i = begin; i < end; i++) {
+        functor(i, result);
+    }
+#endif
+    return result;
+}
+
+// Returns the maximum of the nonnegative values functor(i, max) proposes for every begin <= i < end, 0 if empty.
+template <typename T, typename Functor>
+inline T parallelMax(const int begin, const int end, const int num_threads, const Functor& functor)
+{
+    T result = 0;
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+    if (num_threads > 1) {
+        const HostExecutionSpace space = hostExecutionSpace(num_threads);
+        Kokkos::parallel_reduce("GMGPolar::parallelMax", Kokkos::RangePolicy<HostExecutionSpace>(space, begin, end),
+                                functor, Kokkos::Max<T>(result));
+        return std::max(result, T{0});
+    }
+    for (int i = begin; i < end; i++) {
+        functor(i, result);
+    }
+#else
+#pragma omp parallel for reduction(max : result) num_threads(num_threads) if (num_threads > 1)
+    for (int i = begin; i < end; i++) {
+        functor(i, result);
+    }
+#endif
+    return result;
+}
+
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+using HostTeamMember = Kokkos::TeamPolicy<HostExecutionSpace>::member_type;
+#endif
+
+// The vector lanes of the thread which processes a line in parallelForColorsWithScratch().
+class LineLanes
+{
+public:
+    LineLanes() = default;
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+    explicit LineLanes(const HostTeamMember& team)
+        : team_(&team)
+    {
+    }
+#endif
+
+    // Calls functor(i) for every begin <= i < end, e.g. the nodes of a line.
+    template <typename Functor>
+    void vectorFor(const int begin, const int end, const Functor& functor) const
+    {
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+        if (team_ != nullptr) {
+            Kokkos::parallel_for(Kokkos::ThreadVectorRange(*team_, begin, end), functor);
+            return;
+        }
+#endif
+#pragma omp simd
+        for (int i = begin; i < end; i++) {
+            functor(i);
+        }
+    }
+
+private:
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+    const HostTeamMember* team_ = nullptr;
+#endif
+};
+
+// Calls functor(color, i, scratch, lanes) for every 0 <= color < sizes.size() and every 0 <= i < sizes[color].
+// The colors run one after another, the iterations of a color are independent, e.g. the black circles of the
+// line smoothers. scratch points to scratch_size values of type T that are private to the calling thread, e.g. the
+// work arrays of the tridiagonal solves, and lanes vectorizes the nodes of the line.
+// OpenMP runs all colors in one parallel region with a work-sharing loop and a barrier per color.
+// With Kokkos every color is a TeamPolicy launch on the same execution space instance. The teams have the
+// Kokkos::AUTO team size and split their block of iterations with TeamThreadRange, every thread with the scratch in
+// its level 0 thread scratch memory. lanes runs the node loops with ThreadVectorRange.
+template <typename T, typename Functor>
+inline void parallelForColorsWithScratch(const std::vector<int>& sizes, const int num_threads,
+                                         const std::size_t scratch_size, const Functor& functor)
+{
+    const int num_colors = static_cast<int>(sizes.size());
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+    using TeamPolicy  = Kokkos::TeamPolicy<HostExecutionSpace>;
+    using ScratchView =
+        Kokkos::View<T*, HostExecutionSpace::scratch_memory_space, Kokkos::MemoryTraits<Kokkos::Unmanaged>>;
+    if (num_threads > 1) {
+        const HostExecutionSpace space  = hostExecutionSpace(num_threads);
+        const std::size_t scratch_bytes = ScratchView::shmem_size(scratch_size);
+        const int team_size             = TeamPolicy(space, 1, Kokkos::AUTO).team_size();
+        for (int color = 0; color < num_colors; color++) {
+            const int size = sizes[color];
+            if (size <= 0) {
+                continue;
+            }
+            const int league_size   = (size + team_size - 1) / team_size;
+            const TeamPolicy policy = TeamPolicy(space, league_size, Kokkos::AUTO)
+                                          .set_scratch_size(0, Kokkos::PerThread(scratch_bytes));
+            Kokkos::parallel_for(
+                "GMGPolar::parallelForColorsWithScratch", policy, [&](const HostTeamMember& team) {
+                    const int first = team.league_rank() * team_size;
+                    const int last  = std::min(first + team_size, size);
+                    ScratchView scratch(team.thread_scratch(0), scratch_size);
+                    const LineLanes lanes(team);
+                    Kokkos::parallel_for(Kokkos::TeamThreadRange(team, first, last), [&](const int i) {
+                        functor(color, i, scratch.data(), lanes);
+                    });
+                });
+        }
+        space.fence();
+        return;
+    }
+    std::vector<T> scratch(scratch_size);
+    const LineLanes lanes;
+    for (int color = 0; color < num_colors; color++) {
+        for (int i = 0; i < sizes[color]; i++) {
+            functor(color, i, scratch.data(), lanes);
+        }
+    }
+#else
+#pragma omp parallel num_threads(num_threads) if (num_threads > 1)
+    {
+        std::vector<T> scratch(scratch_size);
+        const LineLanes lanes;
+        for (int color = 0; color < num_colors; color++) {
+#pragma omp for
+            for (int i = 0; i < sizes[color]; i++) {
+                functor(color, i, scratch.data(), lanes);
+            }
+        }
+    }
+#endif
+}
+
+// Calls functor(color, i) for every 0 <= color < sizes.size() and every 0 <= i < sizes[color],
+// the colors one after another, see parallelForColorsWithScratch().
+template <typename Functor>
+inline void parallelForColors(const std::vector<int>& sizes, const int num_threads, const Functor& functor)
+{
+    parallelForColorsWithScratch<char>(sizes, num_threads, 0,
+                                       [&](const int color, const int i, char*, const LineLanes&) {
+                                           functor(color, i);
+                                       });
+}
+
+// Thread count of the vector operations, which only run in parallel for long vectors.
+inline int vectorOperationThreads(const std::size_t size)
+{
+    return size > 10'000 ? omp_get_max_threads() : 1;
+}
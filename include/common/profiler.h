@@ -0,0 +1,181 @@
+#pragma once
+
+#include <algorithm>
+#include <array>
+#include <chrono>
+#include <iomanip>
+#include <ostream>
+#include <vector>
+
+#include "global_definitions.h"
+
+/*
+ * Per-level profiler of the solve phase.
+ *
+ * Records wall time, call count and thread count for every (level, operation) pair.
+ * Level::smoothing/extrapolatedSmoothing/computeResidual/directSolveInPlace record themselves,
+ * the grid transfers and residual norms are recorded by GMGPolar.
+ * Grid transfers are attributed to their destination level, since they run with its thread count.
+ * A fused residual and restriction (Level::computeRestrictedResidual) is recorded as a residual of the fine level.
+ */
+
+struct ProfileEntry {
+    double time = 0.0;
+    long calls  = 0;
+    int threads = 0; // Maximum number of threads used by a single call
+};
+
+class Profiler
+{
+public:
+    static constexpr int NUMBER_OF_OPERATIONS = 8;
+
+    // Clears all records. The thread counts are used for every call that does not specify its own.
+    void reset(const std::vector<int>& threads_per_level)
+    {
+        threads_per_level_ = threads_per_level;
+        entries_.assign(threads_per_level.size(), {});
+    }
+
+    int numberOfLevels() const
+    {
+        return entries_.size();
+    }
+
+    int threads(int level_depth) const
+    {
+        return threads_per_level_[level_depth];
+    }
+
+    const ProfileEntry& entry(int level_depth, ProfiledOperation operation) const
+    {
+        return entries_[level_depth][static_cast<int>(operation)];
+    }
+
+    void record(int level_depth, ProfiledOperation operation, int threads, double time)
+    {
+        if (level_depth < 0 || level_depth >= numberOfLevels())
+            return;
+        ProfileEntry& entry = entries_[level_depth][static_cast<int>(operation)];
+        entry.time += time;
+        entry.calls++;
+        entry.threads = std::max(entry.threads, threads);
+    }
+
+    // Adds the records of another profile with the same number of levels, e.g. of the columns of a batched solve.
+    void accumulate(const Profiler& other)
+    {
+        if (entries_.empty())
+            reset(other.threads_per_level_);
+        for (int level_depth = 0; level_depth < std::min(numberOfLevels(), other.numberOfLevels()); level_depth++) {
+            for (int operation = 0; operation < NUMBER_OF_OPERATIONS; operation++) {
+                const ProfileEntry& source = other.entries_[level_depth][operation];
+                ProfileEntry& target       = entries_[level_depth][operation];
+                target.time += source.time;
+                target.calls += source.calls;
+                target.threads = std::max(target.threads, source.threads);
+            }
+        }
+    }
+
+    static const char* operationName(ProfiledOperation operation)
+    {
+        switch (operation) {
+        case ProfiledOperation::SMOOTHING:
+            return "smoothing";
+        case ProfiledOperation::EXTRAPOLATED_SMOOTHING:
+            return "extrapolated_smoothing";
+        case ProfiledOperation::RESIDUAL:
+            return "residual";
+        case ProfiledOperation::RESTRICTION:
+            return "restriction";
+        case ProfiledOperation::PROLONGATION:
+            return "prolongation";
+        case ProfiledOperation::INJECTION:
+            return "injection";
+        case ProfiledOperation::DIRECT_SOLVE:
+            return "direct_solve";
+        case ProfiledOperation::NORM:
+            return "norm";
+        default:
+            return "unknown";
+        }
+    }
+
+    // Writes {"levels": [{"level": 0, "threads": 4, "operations": {"smoothing": {...}, ...}}, ...]}.
+    // Operations which were never called are omitted.
+    void writeJSON(std::ostream& stream) const
+    {
+        const auto flags     = stream.flags();
+        const auto precision = stream.precision();
+        stream << std::setprecision(9);
+
+        stream << "{\n  \"levels\": [";
+        for (int level_depth = 0; level_depth < numberOfLevels(); level_depth++) {
+            stream << (level_depth > 0 ? "," : "") << "\n    {\n";
+            stream << "      \"level\": " << level_depth << ",\n";
+            stream << "      \"threads\": " << threads_per_level_[level_depth] << ",\n";
+            stream << "      \"operations\": {";
+            bool first = true;
+            for (int operation = 0; operation < NUMBER_OF_OPERATIONS; operation++) {
+                const ProfileEntry& entry = entries_[level_depth][operation];
+                if (entry.calls == 0)
+                    continue;
+                stream << (first ? "" : ",") << "\n        \""
+                       << operationName(static_cast<ProfiledOperation>(operation)) << "\": {\"time\": " << entry.time
+                       << ", \"calls\": " << entry.calls << ", \"threads\": " << entry.threads << "}";
+                first = false;
+            }
+            stream << (first ? "}" : "\n      }") << "\n    }";
+        }
+        stream << (numberOfLevels() > 0 ? "\n  ]" : "]") << "\n}\n";
+
+        stream.flags(flags);
+        stream.precision(precision);
+    }
+
+private:
+    std::vector<int> threads_per_level_;
+    std::vector<std::array<ProfileEntry, NUMBER_OF_OPERATIONS>> entries_;
+};
+
+// Records the lifetime of the scope. A null profiler disables the measurement.
+class ProfileScope
+{
+public:
+    ProfileScope(Profiler* profiler, int level_depth, ProfiledOperation operation)
+        : ProfileScope(profiler, level_depth, operation,
+                       profiler != nullptr && level_depth >= 0 && level_depth < profiler->numberOfLevels()
+                           ? profiler->threads(level_depth)
+                           : 0)
+    {
+    }
+
+    ProfileScope(Profiler* profiler, int level_depth, ProfiledOperation operation, int threads)
+        : profiler_(profiler)
+        , level_depth_(level_depth)
+        , operation_(operation)
+        , threads_(threads)
+    {
+        if (profiler_ != nullptr)
+            start_ = std::chrono::high_resolution_clock::now();
+    }
+
+    ~ProfileScope()
+    {
+        if (profiler_ != nullptr) {
+            auto end = std::chrono::high_resolution_clock::now();
+            profiler_->record(level_depth_, operation_, threads_, std::chrono::duration<double>(end - start_).count());
+        }
+    }
+
+    ProfileScope(const ProfileScope&)            = delete;
+    ProfileScope& operator=(const ProfileScope&) = delete;
+
+private:
+    Profiler* profiler_;
+    int level_depth_;
+    ProfiledOperation operation_;
+    int threads_;
+    std::chrono::high_resolution_clock::time_point start_;
+};
@@ -0,0 +1,323 @@
+#pragma once
+
+#include <cstdint>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <vector>
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include "global_definitions.h"
+
+#ifdef GMGPOLAR_USE_MUMPS
+    #include "dmumps_c.h"
+    #include "mpi.h"
+#endif
+
+/*
+ * Binary file format of GMGPolar::saveSetup() and GMGPolar::loadSetup().
+ *
+ * The file starts with a magic string and a format version followed by a sequence of sections.
+ * Every section starts with a short tag, so that a file which does not match the
+ * solver configuration is rejected with a meaningful error instead of being misread.
+ * Values and arrays are stored in native byte order. Every entry is padded to 8 bytes, which keeps
+ * the arrays aligned inside the memory-mapped file and allows them to be copied in a single memcpy.
+ * Arrays store their length and element size in front of the data.
+ *
+ * Arrays of the level cache are not copied when the setup is loaded: They are wrapped as unmanaged Views of the
+ * memory-mapped file (SetupReader::mapArray()), and the LevelCache keeps the mapping alive. The mapping is private,
+ * so a later update of the coefficients copies the written pages instead of changing the file. The factors of the
+ * smoothers and of the coarse solver are owned by the solvers (std::unique_ptr, std::vector) and are still copied.
+ *
+ * Increase 'SETUP_ARCHIVE_VERSION' whenever the layout of a section changes.
+ *
+ * MUMPS instances are written with JOB_SAVE_INTERNAL_DATA into separate files next to the setup file.
+ * The setup file only stores their prefix, so both have to be moved together.
+ */
+
+inline constexpr char SETUP_ARCHIVE_MAGIC[8]         = {'G', 'M', 'G', 'P', 'S', 'E', 'T', 'U'};
+inline constexpr std::uint64_t SETUP_ARCHIVE_VERSION = 4;
+inline constexpr std::size_t SETUP_ARCHIVE_ALIGNMENT = 8;
+
+class SetupWriter
+{
+public:
+    explicit SetupWriter(const std::string& path)
+        : path_(path)
+        , stream_(path, std::ios::binary | std::ios::trunc)
+    {
+        if (!stream_)
+            throw std::runtime_error("Failed to open setup file '" + path + "' for writing.");
+        writeBytes(SETUP_ARCHIVE_MAGIC, sizeof(SETUP_ARCHIVE_MAGIC));
+        writeValue(SETUP_ARCHIVE_VERSION);
+    }
+
+    const std::string& path() const
+    {
+        return path_;
+    }
+
+    void writeTag(const char* tag)
+    {
+        char buffer[SETUP_ARCHIVE_ALIGNMENT] = {};
+        std::strncpy(buffer, tag, SETUP_ARCHIVE_ALIGNMENT);
+        writeBytes(buffer, SETUP_ARCHIVE_ALIGNMENT);
+    }
+
+    template <typename T>
+    void writeValue(const T& value)
+    {
+        static_assert(std::is_trivially_copyable_v<T>);
+        writeBytes(&value, sizeof(T));
+    }
+
+    template <typename T>
+    void writeArray(const T* data, std::size_t size)
+    {
+        static_assert(std::is_trivially_copyable_v<T>);
+        writeValue(static_cast<std::uint64_t>(size));
+        writeValue(static_cast<std::uint64_t>(sizeof(T)));
+        if (size > 0)
+            writeBytes(data, size * sizeof(T));
+    }
+
+    template <typename T>
+    void writeVector(const std::vector<T>& values)
+    {
+        writeArray(values.data(), values.size());
+    }
+
+    void writeString(const std::string& value)
+    {
+        writeArray(value.data(), value.size());
+    }
+
+    // Unique file prefix for data which is stored outside of the setup file (e.g. MUMPS instances).
+    std::string nextExternalPrefix()
+    {
+        return std::filesystem::path(path_).filename().string() + ".part" + std::to_string(external_files_++);
+    }
+
+    void close()
+    {
+        stream_.close();
+        if (!stream_)
+            throw std::runtime_error("Failed to write setup file '" + path_ + "'.");
+    }
+
+private:
+    std::string path_;
+    std::ofstream stream_;
+    int external_files_ = 0;
+
+    void writeBytes(const void* data, std::size_t bytes)
+    {
+        static const char padding[SETUP_ARCHIVE_ALIGNMENT] = {};
+        stream_.write(static_cast<const char*>(data), bytes);
+        const std::size_t remainder = bytes % SETUP_ARCHIVE_ALIGNMENT;
+        if (remainder != 0)
+            stream_.write(padding, SETUP_ARCHIVE_ALIGNMENT - remainder);
+        if (!stream_)
+            throw std::runtime_error("Failed to write setup file '" + path_ + "'.");
+    }
+};
+
+class SetupReader
+{
+public:
+    // The file is memory-mapped copy-on-write, values are copied directly out of the mapping
+    // or wrapped without copying them by mapArray().
+    explicit SetupReader(const std::string& path)
+        : path_(path)
+    {
+        const int file_descriptor = ::open(path.c_str(), O_RDONLY);
+        if (file_descriptor < 0)
+            throw std::runtime_error("Failed to open setup file '" + path + "'.");
+
+        struct stat file_status;
+        if (::fstat(file_descriptor, &file_status) != 0 || file_status.st_size == 0) {
+            ::close(file_descriptor);
+            throw std::runtime_error("Setup file '" + path + "' is empty or unreadable.");
+        }
+        size_ = static_cast<std::size_t>(file_status.st_size);
+
+        void* mapping = ::mmap(nullptr, size_, PROT_READ | PROT_WRITE, MAP_PRIVATE, file_descriptor, 0);
+        ::close(file_descriptor);
+        if (mapping == MAP_FAILED)
+            throw std::runtime_error("Failed to memory-map setup file '" + path + "'.");
+        const std::size_t size = size_;
+        mapping_ = std::shared_ptr<char>(static_cast<char*>(mapping), [size](char* data) { ::munmap(data, size); });
+        data_    = mapping_.get();
+        ::madvise(mapping, size_, MADV_SEQUENTIAL);
+
+        if (size_ < sizeof(SETUP_ARCHIVE_MAGIC) ||
+            std::memcmp(data_, SETUP_ARCHIVE_MAGIC, sizeof(SETUP_ARCHIVE_MAGIC)) != 0) {
+            throw std::runtime_error("File '" + path + "' is not a GMGPolar setup file.");
+        }
+        offset_ = sizeof(SETUP_ARCHIVE_MAGIC);
+
+        const auto version = readValue<std::uint64_t>();
+        if (version != SETUP_ARCHIVE_VERSION) {
+            throw std::runtime_error("Setup file '" + path + "' has format version " + std::to_string(version) +
+                                     ", expected version " + std::to_string(SETUP_ARCHIVE_VERSION) + ".");
+        }
+    }
+
+    SetupReader(const SetupReader&)            = delete;
+    SetupReader& operator=(const SetupReader&) = delete;
+
+    const std::string& path() const
+    {
+        return path_;
+    }
+
+    void readTag(const char* tag)
+    {
+        char expected[SETUP_ARCHIVE_ALIGNMENT] = {};
+        std::strncpy(expected, tag, SETUP_ARCHIVE_ALIGNMENT);
+        if (std::memcmp(consume(SETUP_ARCHIVE_ALIGNMENT), expected, SETUP_ARCHIVE_ALIGNMENT) != 0)
+            throw std::runtime_error("Setup file '" + path_ + "' is corrupted or does not match the solver " +
+                                     "configuration: Expected section '" + tag + "'.");
+    }
+
+    template <typename T>
+    T readValue()
+    {
+        static_assert(std::is_trivially_copyable_v<T>);
+        T value;
+        std::memcpy(&value, consume(sizeof(T)), sizeof(T));
+        return value;
+    }
+
+    // Reads an array whose size is already known, e.g. because it is defined by the grid.
+    template <typename T>
+    void readArray(T* data, std::size_t size)
+    {
+        if (readArraySize<T>() != size)
+            throw std::runtime_error("Setup file '" + path_ + "' does not match the solver configuration: " +
+                                     "Unexpected array size.");
+        if (size > 0)
+            std::memcpy(data, consume(size * sizeof(T)), size * sizeof(T));
+    }
+
+    template <typename T>
+    std::vector<T> readVector()
+    {
+        std::vector<T> values(readArraySize<T>());
+        if (!values.empty())
+            std::memcpy(values.data(), consume(values.size() * sizeof(T)), values.size() * sizeof(T));
+        return values;
+    }
+
+    // Returns the next array inside the mapping instead of copying it. The array stays valid as long as
+    // a copy of mapping() exists. Writes only change the private copy of the mapped pages.
+    template <typename T>
+    T* mapArray(std::size_t size)
+    {
+        if (readArraySize<T>() != size)
+            throw std::runtime_error("Setup file '" + path_ + "' does not match the solver configuration: " +
+                                     "Unexpected array size.");
+        return size > 0 ? reinterpret_cast<T*>(consume(size * sizeof(T))) : nullptr;
+    }
+
+    std::shared_ptr<const void> mapping() const
+    {
+        return mapping_;
+    }
+
+    std::string readString()
+    {
+        std::vector<char> characters = readVector<char>();
+        return std::string(characters.begin(), characters.end());
+    }
+
+    // Directory in which data stored outside of the setup file is located.
+    std::string externalDirectory() const
+    {
+        return std::filesystem::absolute(path_).parent_path().string();
+    }
+
+private:
+    std::string path_;
+    std::shared_ptr<char> mapping_;
+    char* data_         = nullptr;
+    std::size_t size_   = 0;
+    std::size_t offset_ = 0;
+
+    template <typename T>
+    std::size_t readArraySize()
+    {
+        const auto size         = readValue<std::uint64_t>();
+        const auto element_size = readValue<std::uint64_t>();
+        if (element_size != sizeof(T))
+            throw std::runtime_error("Setup file '" + path_ + "' does not match the solver configuration: " +
+                                     "Unexpected element size.");
+        return static_cast<std::size_t>(size);
+    }
+
+    char* consume(std::size_t bytes)
+    {
+        const std::size_t padded_bytes = (bytes + SETUP_ARCHIVE_ALIGNMENT - 1) / SETUP_ARCHIVE_ALIGNMENT *
+                                         SETUP_ARCHIVE_ALIGNMENT;
+        if (offset_ + padded_bytes > size_)
+            throw std::runtime_error("Setup file '" + path_ + "' is truncated.");
+        char* position = data_ + offset_;
+        offset_ += padded_bytes;
+        return position;
+    }
+};
+
+#ifdef GMGPOLAR_USE_MUMPS
+// Stores a factorized MUMPS instance with JOB_SAVE_INTERNAL_DATA next to the setup file.
+inline void saveMumpsSolver(SetupWriter& writer, DMUMPS_STRUC_C& mumps_solver)
+{
+    const std::string directory = std::filesystem::absolute(writer.path()).parent_path().string();
+    const std::string prefix    = writer.nextExternalPrefix();
+
+    writer.writeTag("MUMPS");
+    writer.writeValue(mumps_solver.sym);
+    writer.writeValue(mumps_solver.par);
+    writer.writeString(prefix);
+
+    std::snprintf(mumps_solver.save_dir, sizeof(mumps_solver.save_dir), "%s", directory.c_str());
+    std::snprintf(mumps_solver.save_prefix, sizeof(mumps_solver.save_prefix), "%s", prefix.c_str());
+    mumps_solver.job = JOB_SAVE_INTERNAL_DATA;
+    dmumps_c(&mumps_solver);
+    if (mumps_solver.INFOG(1) < 0)
+        throw std::runtime_error("MUMPS failed to save its internal data (INFOG(1) = " +
+                                 std::to_string(mumps_solver.INFOG(1)) + ").");
+}
+
+// Initializes a MUMPS instance and restores the factorization saved by 'saveMumpsSolver'.
+// The control parameters are part of the saved data.
+inline void restoreMumpsSolver(SetupReader& reader, DMUMPS_STRUC_C& mumps_solver)
+{
+    reader.readTag("MUMPS");
+    const auto sym           = reader.readValue<decltype(mumps_solver.sym)>();
+    const auto par           = reader.readValue<decltype(mumps_solver.par)>();
+    const std::string prefix = reader.readString();
+
+    mumps_solver.job          = JOB_INIT;
+    mumps_solver.par          = par;
+    mumps_solver.sym          = sym;
+    mumps_solver.comm_fortran = USE_COMM_WORLD;
+    dmumps_c(&mumps_solver);
+
+    const std::string directory = reader.externalDirectory();
+    std::snprintf(mumps_solver.save_dir, sizeof(mumps_solver.save_dir), "%s", directory.c_str());
+    std::snprintf(mumps_solver.save_prefix, sizeof(mumps_solver.save_prefix), "%s", prefix.c_str());
+    mumps_solver.job = JOB_RESTORE_INTERNAL_DATA;
+    dmumps_c(&mumps_solver);
+    if (mumps_solver.INFOG(1) < 0)
+        throw std::runtime_error("MUMPS failed to restore its internal data (INFOG(1) = " +
+                                 std::to_string(mumps_solver.INFOG(1)) + ").");
+}
+#endif
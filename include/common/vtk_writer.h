@@ -0,0 +1,225 @@
+#pragma once
+
+#include <algorithm>
+#include <bit>
+#include <charconv>
+#include <cstdint>
+#include <filesystem>
+#include <fstream>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <vector>
+
+#include "parallel.h"
+
+#ifdef GMGPOLAR_USE_ZLIB
+    #include <zlib.h>
+#endif
+
+/*
+ * Writer of VTK XML files, see GMGPolar::writeToVTK().
+ *
+ * ASCII arrays are written inline as text. Binary arrays are written to the appended data section at
+ * the end of the file. With RAW encoding every array is preceded by its size in bytes. With ZLIB encoding
+ * the array is split into blocks of VTK_COMPRESSION_BLOCK_SIZE bytes, which are compressed independently
+ * and preceded by the header of the vtkZLibDataCompressor: the number of blocks, the block size,
+ * the size of a partial last block (0 if the last block is full) and the compressed size of every block.
+ * All header entries are UInt64. The text of ASCII arrays and the compressed blocks are encoded in parallel.
+ */
+
+enum class VTKEncoding
+{
+    ASCII = 0,
+    RAW   = 1,
+    ZLIB  = 2 // Requires GMGPolar to be built with zlib (GMGPOLAR_USE_ZLIB)
+};
+
+inline constexpr std::size_t VTK_COMPRESSION_BLOCK_SIZE = std::size_t{1} << 20;
+
+// Number of tuples formatted per task of an ASCII array.
+inline constexpr std::size_t VTK_ASCII_CHUNK_SIZE = std::size_t{1} << 14;
+
+class VTKWriter
+{
+public:
+    // 'type' is the dataset type of the file, e.g. "UnstructuredGrid" or "StructuredGrid".
+    VTKWriter(const std::filesystem::path& path, const std::string& type, const VTKEncoding encoding,
+              const int num_threads)
+        : path_(path)
+        , stream_(path, std::ios::binary | std::ios::trunc)
+        , encoding_(encoding)
+        , num_threads_(num_threads)
+    {
+#ifndef GMGPOLAR_USE_ZLIB
+        if (encoding == VTKEncoding::ZLIB)
+            throw std::runtime_error("Compressed VTK output requires GMGPolar to be built with zlib.");
+#endif
+        if (!stream_)
+            throw std::runtime_error("Failed to open file '" + path.string() + "'");
+        stream_ << "<?xml version=\"1.0\"?>\n"
+                << "<VTKFile type=\"" << type << "\" version=\"1.0\" byte_order=\""
+                << (std::endian::native == std::endian::little ? "LittleEndian" : "BigEndian")
+                << "\" header_type=\"UInt64\"";
+        if (encoding == VTKEncoding::ZLIB)
+            stream_ << " compressor=\"vtkZLibDataCompressor\"";
+        stream_ << ">\n";
+    }
+
+    VTKWriter(const VTKWriter&)            = delete;
+    VTKWriter& operator=(const VTKWriter&) = delete;
+
+    // Opens respectively closes the XML element 'tag'. The attributes are written verbatim.
+    void openElement(const std::string& tag, const std::string& attributes = "")
+    {
+        stream_ << "<" << tag << (attributes.empty() ? "" : " ") << attributes << ">\n";
+    }
+    void closeElement(const std::string& tag)
+    {
+        stream_ << "</" << tag << ">\n";
+    }
+
+    // Writes a DataArray of 'count' tuples with 'components' entries each.
+    // Binary data is only read by finish(), so 'data' has to stay valid until then.
+    template <typename T>
+    void dataArray(const std::string& name, const int components, const T* data, const std::size_t count)
+    {
+        const std::size_t size = components * count;
+        stream_ << "<DataArray type=\"" << typeName<T>() << "\" Name=\"" << name << "\" NumberOfComponents=\""
+                << components << "\" format=\"" << (encoding_ == VTKEncoding::ASCII ? "ascii" : "appended") << "\"";
+
+        if (encoding_ == VTKEncoding::ASCII) {
+            stream_ << ">\n";
+            writeASCII(data, components, count);
+            stream_ << "</DataArray>\n";
+            return;
+        }
+
+        stream_ << " offset=\"" << appended_size_ << "\"/>\n";
+        AppendedArray array{reinterpret_cast<const char*>(data), sizeof(T) * size, {}};
+        if (encoding_ == VTKEncoding::ZLIB)
+            array.encoded = compress(array.data, array.size);
+        appended_size_ += encoding_ == VTKEncoding::RAW ? sizeof(std::uint64_t) + array.size : array.encoded.size();
+        appended_.push_back(std::move(array));
+    }
+
+    // Writes the appended data and closes the file.
+    void finish()
+    {
+        if (!appended_.empty()) {
+            stream_ << "<AppendedData encoding=\"raw\">\n_";
+            for (const AppendedArray& array : appended_) {
+                if (encoding_ == VTKEncoding::RAW) {
+                    const std::uint64_t size = array.size;
+                    stream_.write(reinterpret_cast<const char*>(&size), sizeof(size));
+                    stream_.write(array.data, array.size);
+                }
+                else {
+                    stream_.write(array.encoded.data(), array.encoded.size());
+                }
+            }
+            stream_ << "\n</AppendedData>\n";
+        }
+        stream_ << "</VTKFile>\n";
+        stream_.close();
+        if (!stream_)
+            throw std::runtime_error("Failed to write file '" + path_.string() + "'");
+    }
+
+private:
+    struct AppendedArray {
+        const char* data;
+        std::size_t size;
+        std::vector<char> encoded; // Header and compressed blocks with ZLIB encoding
+    };
+
+    std::filesystem::path path_;
+    std::ofstream stream_;
+    VTKEncoding encoding_;
+    int num_threads_;
+    std::vector<AppendedArray> appended_;
+    std::uint64_t appended_size_ = 0;
+
+    template <typename T>
+    static constexpr const char* typeName()
+    {
+        if constexpr (std::is_same_v<T, double>)
+            return "Float64";
+        else if constexpr (std::is_same_v<T, float>)
+            return "Float32";
+        else if constexpr (std::is_same_v<T, std::int32_t>)
+            return "Int32";
+        else if constexpr (std::is_same_v<T, std::int64_t>)
+            return "Int64";
+        else {
+            static_assert(std::is_same_v<T, std::uint8_t>, "Unsupported VTK data type.");
+            return "UInt8";
+        }
+    }
+
+    // Formats the array in chunks of VTK_ASCII_CHUNK_SIZE tuples, one tuple per line.
+    // At most a few chunks per thread are kept in memory before they are written.
+    template <typename T>
+    void writeASCII(const T* data, const int components, const std::size_t count)
+    {
+        const int chunks = static_cast<int>((count + VTK_ASCII_CHUNK_SIZE - 1) / VTK_ASCII_CHUNK_SIZE);
+        const int chunks_per_round = 4 * std::max(num_threads_, 1);
+        std::vector<std::string> text(chunks_per_round);
+
+        for (int first = 0; first < chunks; first += chunks_per_round) {
+            const int last = std::min(first + chunks_per_round, chunks);
+            parallelFor(first, last, num_threads_, [&](int chunk) {
+                std::string& out        = text[chunk - first];
+                const std::size_t begin = chunk * VTK_ASCII_CHUNK_SIZE;
+                const std::size_t end   = std::min(begin + VTK_ASCII_CHUNK_SIZE, count);
+                out.clear();
+                char buffer[32];
+                for (std::size_t tuple = begin; tuple < end; tuple++) {
+                    for (int c = 0; c < components; c++) {
+                        const T value = data[tuple * components + c];
+                        std::to_chars_result result;
+                        if constexpr (std::is_same_v<T, std::uint8_t>)
+                            result = std::to_chars(buffer, buffer + sizeof(buffer), static_cast<int>(value));
+                        else
+                            result = std::to_chars(buffer, buffer + sizeof(buffer), value);
+                        out.append(buffer, result.ptr);
+                        out.push_back(c + 1 < components ? ' ' : '\n');
+                    }
+                }
+            });
+            for (int chunk = first; chunk < last; chunk++)
+                stream_ << text[chunk - first];
+        }
+    }
+
+    std::vector<char> compress(const char* data, const std::size_t size) const
+    {
+        std::vector<char> encoded;
+#ifdef GMGPOLAR_USE_ZLIB
+        const std::size_t blocks = (size + VTK_COMPRESSION_BLOCK_SIZE - 1) / VTK_COMPRESSION_BLOCK_SIZE;
+        std::vector<std::vector<Bytef>> compressed(blocks);
+        // The fastest compression level, since writing the output of large grids is limited by the compression.
+        const int failures = parallelSum<int>(0, static_cast<int>(blocks), num_threads_, [&](int block, int& failed) {
+            const std::size_t begin = block * VTK_COMPRESSION_BLOCK_SIZE;
+            const uLong length      = static_cast<uLong>(std::min(VTK_COMPRESSION_BLOCK_SIZE, size - begin));
+            uLongf compressed_size  = compressBound(length);
+            compressed[block].resize(compressed_size);
+            if (compress2(compressed[block].data(), &compressed_size, reinterpret_cast<const Bytef*>(data + begin),
+                          length, Z_BEST_SPEED) != Z_OK)
+                failed += 1;
+            compressed[block].resize(compressed_size);
+        });
+        if (failures > 0)
+            throw std::runtime_error("Failed to compress VTK data array.");
+
+        std::vector<std::uint64_t> header = {blocks, VTK_COMPRESSION_BLOCK_SIZE, size % VTK_COMPRESSION_BLOCK_SIZE};
+        for (const std::vector<Bytef>& block : compressed)
+            header.push_back(block.size());
+        const char* header_bytes = reinterpret_cast<const char*>(header.data());
+        encoded.assign(header_bytes, header_bytes + sizeof(std::uint64_t) * header.size());
+        for (const std::vector<Bytef>& block : compressed)
+            encoded.insert(encoded.end(), block.begin(), block.end());
+#endif
+        return encoded;
+    }
+};
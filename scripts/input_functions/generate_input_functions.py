@@ -0,0 +1,496 @@
+"""Generates the manufactured solutions in src/InputFunctions.
+
+For every combination of exact solution, density profile coefficients and domain geometry the source term
+
+    f = -div(alpha * grad(u)) + beta * u
+
+is derived symbolically in the mapped coordinates (s, theta) with s = r / Rmax. The expressions are reduced by common
+subexpression elimination and small integer powers are replaced by products, before the SourceTerm, ExactSolution and
+BoundaryConditions classes are written as C++.
+
+    python3 generate_input_functions.py                 # regenerate all sources
+    python3 generate_input_functions.py --check         # compare against the sources on disk, write nothing
+    python3 generate_input_functions.py --only CartesianR6_ZoniShiftedGyro_CzarnyGeometry
+
+--check compiles the implementations on disk and the generated ones side by side and compares them at sample points.
+New combinations only need an entry in SOLUTIONS, COEFFICIENTS or GEOMETRIES. Headers are written if they do not exist
+yet; the new sources still have to be added to the CMakeLists.txt files and to include/InputFunctions/*.h.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import sympy as sp
+from sympy.printing.c import C99CodePrinter
+from sympy.printing.precedence import PRECEDENCE
+
+REPOSITORY = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+COLUMN_LIMIT = 120
+
+r, s, theta = sp.symbols("r s theta", real=True)
+sin_theta, cos_theta = sp.symbols("sin_theta cos_theta", real=True)
+
+Rmax = sp.Symbol("Rmax", positive=True)
+inverse_aspect_ratio_epsilon = sp.Symbol("inverse_aspect_ratio_epsilon", positive=True)
+ellipticity_e = sp.Symbol("ellipticity_e", positive=True)
+factor_xi = sp.Symbol("factor_xi", positive=True)
+elongation_kappa = sp.Symbol("elongation_kappa", real=True)
+shift_delta = sp.Symbol("shift_delta", real=True)
+
+
+# ------------------------------------------------------------------------------------------------------------------- #
+# Problem definitions                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------- #
+
+
+class Geometry:
+    def __init__(self, name, parameters, Fx, Fy, defaults, factor_xi=False):
+        self.name = name
+        self.parameters = parameters  # constructor arguments after Rmax
+        self.Fx = Fx
+        self.Fy = Fy
+        self.defaults = defaults  # default member values and the arguments used by --check
+        self.factor_xi = factor_xi
+
+
+def _czarny():
+    temp = sp.sqrt(1 + inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2 * s * sp.cos(theta)))
+    Fx = (1 - temp) / inverse_aspect_ratio_epsilon
+    Fy = ellipticity_e * factor_xi * s * sp.sin(theta) / (2 - temp)
+    return Fx, Fy
+
+
+GEOMETRIES = {
+    "Circular": Geometry("CircularGeometry", [], s * sp.cos(theta), s * sp.sin(theta), {"Rmax": "1.3"}),
+    "Shafranov": Geometry(
+        "ShafranovGeometry",
+        ["elongation_kappa", "shift_delta"],
+        (1 - elongation_kappa) * s * sp.cos(theta) - shift_delta * s**2,
+        (1 + elongation_kappa) * s * sp.sin(theta),
+        {"Rmax": "1.3", "elongation_kappa": "0.3", "shift_delta": "0.2"},
+    ),
+    "Czarny": Geometry(
+        "CzarnyGeometry",
+        ["inverse_aspect_ratio_epsilon", "ellipticity_e"],
+        *_czarny(),
+        {"Rmax": "1.3", "inverse_aspect_ratio_epsilon": "0.3", "ellipticity_e": "1.4"},
+        factor_xi=True,
+    ),
+}
+
+# alpha and beta as in src/InputFunctions/DensityProfileCoefficients.
+_sonnendrucker_alpha = sp.Float("0.452961672473868") - sp.Float("0.348432055749129") * sp.atan(
+    sp.Float("14.4444444444444") * s - sp.Float("11.1111111111111")
+)
+COEFFICIENTS = {
+    "Poisson": (sp.Integer(1), sp.Integer(0)),
+    "Sonnendrucker": (_sonnendrucker_alpha, sp.Integer(0)),
+    "SonnendruckerGyro": (_sonnendrucker_alpha, 1 / _sonnendrucker_alpha),
+    "Zoni": (sp.exp(-sp.tanh(10 * s - 5)), sp.Integer(0)),
+    "ZoniGyro": (sp.exp(-sp.tanh(10 * s - 5)), sp.exp(sp.tanh(10 * s - 5))),
+    "ZoniShifted": (sp.exp(-sp.tanh(20 * s - 14)), sp.Integer(0)),
+    "ZoniShiftedGyro": (sp.exp(-sp.tanh(20 * s - 14)), sp.exp(sp.tanh(20 * s - 14))),
+}
+
+
+def _cartesian_wave(geometry):
+    return sp.sin(2 * sp.pi * geometry.Fy) * sp.cos(2 * sp.pi * geometry.Fx)
+
+
+SOLUTIONS = {
+    "CartesianR2": lambda geometry: (1 - s**2) * _cartesian_wave(geometry),
+    "CartesianR6": lambda geometry: sp.Rational(4096, 10000) * (s - 1) ** 6 * (s + 1) ** 6 * _cartesian_wave(geometry),
+    "PolarR6": lambda geometry: sp.Rational(4096, 10000) * s**6 * (s - 1) ** 6 * sp.cos(11 * theta),
+}
+
+
+def source_term(solution, coefficients, geometry):
+    """f = -div(alpha * grad(u)) + beta * u in the coordinates (s, theta) of the mapping (Fx, Fy)."""
+    alpha, beta = COEFFICIENTS[coefficients]
+    u = SOLUTIONS[solution](geometry)
+
+    Fx_s, Fx_t = sp.diff(geometry.Fx, s), sp.diff(geometry.Fx, theta)
+    Fy_s, Fy_t = sp.diff(geometry.Fy, s), sp.diff(geometry.Fy, theta)
+    detDF = Fx_s * Fy_t - Fx_t * Fy_s
+    # alpha * |det DF| * (DF^T DF)^{-1} = alpha / det DF * adj(DF^T DF)
+    g_ss = Fx_t**2 + Fy_t**2
+    g_st = -(Fx_s * Fx_t + Fy_s * Fy_t)
+    g_tt = Fx_s**2 + Fy_s**2
+
+    u_s, u_t = sp.diff(u, s), sp.diff(u, theta)
+    flux_s = alpha / detDF * (g_ss * u_s + g_st * u_t)
+    flux_t = alpha / detDF * (g_st * u_s + g_tt * u_t)
+    return -(sp.diff(flux_s, s) + sp.diff(flux_t, theta)) / detDF + beta * u
+
+
+# ------------------------------------------------------------------------------------------------------------------- #
+# Code generation                                                                                                     #
+# ------------------------------------------------------------------------------------------------------------------- #
+
+
+class Printer(C99CodePrinter):
+    """Prints unqualified <cmath> calls, double literals and small powers as products and square roots."""
+
+    def _print_Integer(self, expr):
+        return f"{int(expr)}.0"
+
+    def _print_Rational(self, expr):
+        return self._print_Float(sp.Float(expr, 17))
+
+    def _print_Float(self, expr):
+        text = repr(float(expr))
+        return text if ("." in text or "e" in text) else text + ".0"
+
+    def _print_Pi(self, expr):
+        return "M_PI"
+
+    def _print_Mul(self, expr):
+        return _spaced(super()._print_Mul(expr))
+
+    def _print_Pow(self, expr):
+        base, exponent = expr.as_base_exp()
+        factor = self.parenthesize(base, PRECEDENCE["Mul"], strict=True)
+        if exponent.is_Integer and 2 <= abs(exponent) <= MAX_PRODUCT:
+            power = " * ".join([factor] * abs(int(exponent)))
+        elif exponent.is_Rational and exponent.q == 2 and abs(exponent) <= MAX_PRODUCT:
+            power = " * ".join([factor] * (abs(exponent.p) // 2) + [f"sqrt({self._print(base)})"])
+        elif exponent == -1:
+            power = factor
+        else:
+            return f"pow({self._print(base)}, {self._print(exponent)})"
+        return power if exponent > 0 else f"1.0 / ({power})" if " * " in power else f"1.0 / {power}"
+
+    def parenthesize(self, item, level, strict=False):
+        # Powers are printed as products or quotients, which do not bind tighter than the surrounding product.
+        if isinstance(item, sp.Pow) and not self._print_Pow(item).startswith(("pow(", "sqrt(")):
+            return f"({self._print(item)})"
+        if item.is_Rational and item > 0:
+            return self._print(item)
+        return super().parenthesize(item, level, strict)
+
+
+PRINTER = Printer()
+MAX_PRODUCT = 4
+
+
+def _spaced(text):
+    """Spaces around '*' and '/' on the top level, as clang-format writes them."""
+    return re.sub(r"(?<=[^ (])([*/])(?=[^ ])", r" \1 ", text)
+
+
+def _wrap(head, text, indent):
+    """Breaks 'head + text' after binary operators so that no line exceeds the column limit."""
+    lines, line = [], head
+    for token in re.split(r"(?<= [-+*/]) ", text):
+        if len(line) + len(token) + 1 > COLUMN_LIMIT and line.strip():
+            lines.append(line)
+            line = " " * indent + token
+        else:
+            line += ("" if line == head else " ") + token
+    lines.append(line)
+    return "\n".join(lines)
+
+
+def _reduce_powers(temporaries, result):
+    """Moves the compound bases of integer powers into temporaries, so the powers can be written as products."""
+    reduced, symbols = [], sp.numbered_symbols("p")
+
+    def extract(expression):
+        powers = [power for power in expression.atoms(sp.Pow) if power.exp.is_Integer and abs(power.exp) > 1]
+        # atoms() is a set, the canonical key breaks ties so that the output does not depend on the hash seed.
+        for power in sorted(powers, key=lambda power: (sp.count_ops(power), sp.default_sort_key(power))):
+            base, exponent = power.base, int(power.exp)
+            if not base.is_Atom:
+                symbol = next(symbols)
+                reduced.append((symbol, base))
+                base = symbol
+            if abs(exponent) > MAX_PRODUCT and exponent % 2 == 0:
+                symbol = next(symbols)
+                reduced.append((symbol, base**2))
+                base, exponent = symbol, exponent // 2
+            expression = expression.xreplace({power: base**exponent})
+        return expression
+
+    for symbol, value in temporaries:
+        reduced.append((symbol, extract(value)))
+    return reduced, extract(result)
+
+
+def function_body(expression):
+    """Statements of the function body: the subexpressions of 'expression' and the return statement."""
+    expression = expression.subs({sp.sin(theta): sin_theta, sp.cos(theta): cos_theta})
+    temporaries, (result,) = sp.cse(expression, symbols=sp.numbered_symbols("t"), optimizations="basic")
+    temporaries, result = _reduce_powers(temporaries, result)
+
+    definitions = [(sp.Symbol("s"), r / Rmax)] if expression.has(s) else []
+    definitions += temporaries
+    width = max([len(str(symbol)) for symbol, _ in definitions] + [1])
+    lines = []
+    for symbol, value in definitions:
+        head = f"    const double {str(symbol).ljust(width)} = "
+        lines.append(_wrap(head, PRINTER.doprint(value) + ";", len(head)))
+    lines.append(_wrap("    return ", PRINTER.doprint(result) + ";", len("    return ")))
+    return "\n".join(lines)
+
+
+def _signature(prefix, parameters, suffix):
+    """Declaration 'prefix(parameters)suffix' broken like clang-format does it."""
+    aligned, line = [], prefix
+    for index, parameter in enumerate(parameters):
+        token = parameter + ("," if index < len(parameters) - 1 else suffix)
+        if line != prefix and len(line) + 1 + len(token) > COLUMN_LIMIT:
+            aligned.append(line)
+            line = " " * len(prefix) + token
+        else:
+            line += ("" if line == prefix else " ") + token
+    aligned.append(line)
+    if all(len(text) <= COLUMN_LIMIT for text in aligned):
+        return "\n".join(aligned)
+    # The parameters do not fit behind the opening parenthesis.
+    return prefix + "\n" + _signature("    ", parameters, suffix).replace("    ", "    ", 1)
+
+
+def _constructor(class_name, geometry):
+    members = ["Rmax"] + geometry.parameters
+    signature = _signature(f"{class_name}::{class_name}(", [f"const double& {member}" for member in members], ")")
+    initializers = "\n".join(
+        ("    : " if index == 0 else "    , ") + f"{member}({member})" for index, member in enumerate(members)
+    )
+    text = f"{signature}\n{initializers}\n{{\n"
+    if geometry.factor_xi:
+        text += "    initializeGeometry();\n"
+    return text + "}\n"
+
+
+def _initialize_geometry(class_name, geometry):
+    if not geometry.factor_xi:
+        return ""
+    return (
+        f"void {class_name}::initializeGeometry()\n{{\n"
+        "    factor_xi = 1.0 / sqrt(1.0 - inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon / 4.0);\n"
+        "}\n\n"
+    )
+
+
+POINT = ["const double& r", "const double& theta", "const double& sin_theta", "const double& cos_theta"]
+GENERATED = "// Generated by scripts/input_functions/generate_input_functions.py, do not edit.\n"
+
+
+def source_term_cpp(solution, coefficients, geometry_key):
+    geometry = GEOMETRIES[geometry_key]
+    class_name = f"{solution}_{coefficients}_{geometry.name}"
+    body = function_body(source_term(solution, coefficients, geometry))
+    circle = _signature(
+        f"void {class_name}::evaluateCircle(",
+        ["const double r", "const int count", "const double* theta", "const double* sin_theta",
+         "const double* cos_theta", "double* rhs_f"],
+        ") const",
+    )
+    radial_line = _signature(
+        f"void {class_name}::evaluateRadialLine(",
+        ["const int count", "const double* r", "const double theta", "const double sin_theta",
+         "const double cos_theta", "double* rhs_f"],
+        ") const",
+    )
+    return class_name, (
+        f"{GENERATED}"
+        f'#include "../include/InputFunctions/SourceTerms/{_file_name(class_name)}.h"\n\n'
+        f"{_initialize_geometry(class_name, geometry)}"
+        f"{_constructor(class_name, geometry)}\n"
+        f"{_signature(f'double {class_name}::rhs_f(', POINT, ') const')}\n{{\n{body}\n}}\n\n"
+        f"{circle}\n{{\n    evaluateCircleWith(*this, r, count, theta, sin_theta, cos_theta, rhs_f);\n}}\n\n"
+        f"{radial_line}\n{{\n    evaluateRadialLineWith(*this, count, r, theta, sin_theta, cos_theta, rhs_f);\n}}\n"
+    )
+
+
+def exact_solution_cpp(solution, geometry_key):
+    geometry = GEOMETRIES[geometry_key]
+    class_name = f"{solution}_{geometry.name}"
+    body = function_body(SOLUTIONS[solution](geometry))
+    return class_name, (
+        f"{GENERATED}"
+        f'#include "../include/InputFunctions/ExactSolution/{_file_name(class_name)}.h"\n\n'
+        f"{_initialize_geometry(class_name, geometry)}"
+        f"{_constructor(class_name, geometry)}\n"
+        f"{_signature(f'double {class_name}::exact_solution(', POINT, ') const')}\n{{\n{body}\n}}\n"
+    )
+
+
+def boundary_conditions_cpp(solution, geometry_key):
+    geometry = GEOMETRIES[geometry_key]
+    class_name = f"{solution}_Boundary_{geometry.name}"
+    body = function_body(SOLUTIONS[solution](geometry))
+    return class_name, (
+        f"{GENERATED}"
+        f'#include "../include/InputFunctions/BoundaryConditions/{_file_name(class_name)}.h"\n\n'
+        f"{_initialize_geometry(class_name, geometry)}"
+        f"{_constructor(class_name, geometry)}\n"
+        f"{_signature(f'double {class_name}::u_D(', POINT, ') const')}\n{{\n{body}\n}}\n\n"
+        f"{_signature(f'double {class_name}::u_D_Interior(', POINT, ') const')}\n{{\n{body}\n}}\n"
+    )
+
+
+def _file_name(class_name):
+    return class_name[0].lower() + class_name[1:]
+
+
+def _header(kind, class_name, geometry):
+    base, base_header, functions = {
+        "SourceTerms": ("SourceTerm", "sourceTerm.h", [
+            "    double rhs_f(const double& r, const double& theta, const double& sin_theta, "
+            "const double& cos_theta) const override;",
+            "    void evaluateCircle(const double r, const int count, const double* theta, const double* sin_theta,\n"
+            "                        const double* cos_theta, double* rhs_f) const override;",
+            "    void evaluateRadialLine(const int count, const double* r, const double theta, const double sin_theta,\n"
+            "                            const double cos_theta, double* rhs_f) const override;",
+        ]),
+        "ExactSolution": ("ExactSolution", "exactSolution.h", [
+            _signature("    double exact_solution(", POINT, ") const override;"),
+        ]),
+        "BoundaryConditions": ("BoundaryConditions", "boundaryConditions.h", [
+            _signature("    double u_D(", POINT, ") const override;"),
+            _signature("    double u_D_Interior(", POINT, ") const override;"),
+        ]),
+    }[kind]
+    members = ["Rmax"] + geometry.parameters
+    width = max(len(member) for member in members)
+    private = "\n".join(f"    const double {member.ljust(width)} = {geometry.defaults[member]};" for member in members)
+    if geometry.factor_xi:
+        private += "\n\n    void initializeGeometry();\n    double factor_xi;"
+    constructor = _signature(f"    explicit {class_name}(", [f"const double& {member}" for member in members], ");")
+    return (
+        f"#pragma once\n\n#include <cmath>\n\n#include \"../{base_header}\"\n\n"
+        f"class {class_name} : public {base}\n{{\npublic:\n"
+        f"    {class_name}() = default;\n{constructor}\n    virtual ~{class_name}() = default;\n\n"
+        + "\n".join(functions)
+        + f"\n\nprivate:\n{private}\n}};\n"
+    )
+
+
+def sources(only=None):
+    """All generated classes as (kind, class name, geometry, C++ source)."""
+    jobs = []
+    for geometry_key, geometry in GEOMETRIES.items():
+        for solution in SOLUTIONS:
+            jobs.append(("ExactSolution", lambda g=geometry_key, u=solution: exact_solution_cpp(u, g), geometry))
+            jobs.append(("BoundaryConditions", lambda g=geometry_key, u=solution: boundary_conditions_cpp(u, g),
+                         geometry))
+            for coefficients in COEFFICIENTS:
+                jobs.append(("SourceTerms", lambda g=geometry_key, u=solution, c=coefficients: source_term_cpp(u, c, g),
+                             geometry))
+    for kind, generate, geometry in jobs:
+        class_name, text = generate()
+        if only is None or class_name in only:
+            yield kind, class_name, geometry, text
+
+
+# ------------------------------------------------------------------------------------------------------------------- #
+# Parity check                                                                                                        #
+# ------------------------------------------------------------------------------------------------------------------- #
+
+_FUNCTION = {"SourceTerms": "rhs_f", "ExactSolution": "exact_solution", "BoundaryConditions": "u_D"}
+
+
+def _wrapper(kind, class_name, geometry, suffix):
+    arguments = ", ".join(geometry.defaults[member] for member in ["Rmax"] + geometry.parameters)
+    return (
+        f'\nextern "C" double evaluate_{suffix}(double r, double theta)\n{{\n'
+        f"    static const {class_name} function({arguments});\n"
+        f"    return function.{_FUNCTION[kind]}(r, theta, sin(theta), cos(theta));\n}}\n"
+    )
+
+
+def check(generated, compiler):
+    """Compiles the implementation on disk and the generated one of every class and compares them."""
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+
+        def compare(item):
+            kind, class_name, geometry, text = item
+            base = os.path.join(directory, class_name)
+            current_source = os.path.join(REPOSITORY, "src", "InputFunctions", kind, _file_name(class_name) + ".cpp")
+            with open(current_source) as file:
+                current = file.read()
+            # Both versions are linked into one program, so the generated class is renamed.
+            renamed = f"#define {class_name} {class_name}_Generated\n" + text.replace(
+                "#include \"../include/", f"#include \"{REPOSITORY}/include/"
+            )
+            current = current.replace("#include \"../include/", f"#include \"{REPOSITORY}/include/")
+            with open(base + "_current.cpp", "w") as file:
+                file.write(current + _wrapper(kind, class_name, geometry, "current"))
+            with open(base + "_generated.cpp", "w") as file:
+                file.write(renamed + _wrapper(kind, class_name + "_Generated", geometry, "generated"))
+            with open(base + "_main.cpp", "w") as file:
+                file.write(_CHECK_MAIN)
+            command = [compiler, "-std=c++20", "-O1", "-o", base, base + "_current.cpp", base + "_generated.cpp",
+                       base + "_main.cpp"]
+            build = subprocess.run(command, capture_output=True, text=True)
+            if build.returncode != 0:
+                return class_name, build.stderr
+            run = subprocess.run([base], capture_output=True, text=True)
+            return class_name, None if run.returncode == 0 else run.stdout
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for class_name, error in pool.map(compare, generated):
+                print(f"{'ok    ' if error is None else 'FAILED'} {class_name}")
+                if error is not None:
+                    print(error)
+                    failures += 1
+    return failures
+
+
+_CHECK_MAIN = """#include <cmath>
+#include <cstdio>
+
+extern "C" double evaluate_current(double r, double theta);
+extern "C" double evaluate_generated(double r, double theta);
+
+int main()
+{
+    const double Rmax = 1.3;
+    double max_value = 0.0, max_difference = 0.0;
+    for (int i = 0; i <= 40; i++) {
+        for (int j = 0; j < 64; j++) {
+            const double r     = Rmax * (1e-4 + (1.0 - 1e-4) * i / 40.0);
+            const double theta = 2.0 * M_PI * j / 64.0 + 0.01;
+            const double a = evaluate_current(r, theta), b = evaluate_generated(r, theta);
+            max_value      = std::fmax(max_value, std::fabs(a));
+            max_difference = std::fmax(max_difference, std::fabs(a - b));
+        }
+    }
+    std::printf("max |f| = %.3e, max difference = %.3e\\n", max_value, max_difference);
+    return max_difference <= 1e-10 * std::fmax(1.0, max_value) ? 0 : 1;
+}
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="compare against the sources on disk, write nothing")
+    parser.add_argument("--only", nargs="+", help="class names to generate")
+    parser.add_argument("--compiler", default=os.environ.get("CXX", "g++"))
+    arguments = parser.parse_args()
+
+    generated = list(sources(set(arguments.only) if arguments.only else None))
+    if arguments.check:
+        sys.exit(1 if check(generated, arguments.compiler) else 0)
+
+    for kind, class_name, geometry, text in generated:
+        source = os.path.join(REPOSITORY, "src", "InputFunctions", kind, _file_name(class_name) + ".cpp")
+        header = os.path.join(REPOSITORY, "include", "InputFunctions", kind, _file_name(class_name) + ".h")
+        with open(source, "w") as file:
+            file.write(text)
+        if not os.path.exists(header):
+            with open(header, "w") as file:
+                file.write(_header(kind, class_name, geometry))
+            print(f"new class {class_name}: add it to the CMakeLists.txt and include/InputFunctions/*.h")
+        print(f"wrote {os.path.relpath(source, REPOSITORY)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,70 @@
 import pandas as pd
 import numpy as np
+import glob
+import json
 import os
 import sys
 
 # This file has been written and used to read the results for
 # Leleux, Schwarz, Kühn, Kruse, Rüde - Complexity analysis and scalability of a matrix-free extrapolated geometric multigrid (2023)
+#
+# Convergence and timings are read from the JSON reports of the runs (gmgpolar --report <file>.json),
+# one report per number of cores named <job>-C<cores>.json. The LIKWID region results are still read
+# from the job output (<job>.out), since they are written by likwid-perfctr and not by GMGPolar.
+
+# Timing columns of the csv files and the corresponding timings of the report.
+# Averages per multigrid cycle are multiplied with the number of iterations.
+report_timings = {
+    'Total setup': ['setupTotal'],
+    'Factorization of coarse operator Ac': ['setupDirectSolver'],
+    'Factorizing smoothing operators A_sc': ['setupSmoother'],
+    'Total multigrid cycle': ['solveMultigridIterations'],
+    'Complete smoothing': ['avgMGCPreSmoothing', 'avgMGCPostSmoothing'],
+    'Computing residual': ['avgMGCResidual'],
+    'Solve coarse system': ['avgMGCDirectSolver'],
+    'Computing residual on finest level': ['checkConvergence'],
+    'Computing final error': ['checkExactError'],
+    'Total execution time': ['setupTotal', 'solveTotal'],
+}
+
+
+def read_report(filename):
+    with open(filename) as f:
+        return json.load(f)
+
+
+def read_likwid_regions(filename, search_terms_likwid):
+    # Returns {(benchmark, cores): {region: value}} of all LIKWID outputs in the job output.
+    results = {}
+    if not os.path.isfile(filename):
+        return results
+    with open(filename) as f:
+        lines = f.readlines()
+    i = 0
+    while i < len(lines) - 2:
+        if 'Group 1: ' not in lines[i] or 'Region' not in lines[i]:
+            i += 1
+            continue
+        benchmark_line = lines[i].split()
+        region = benchmark_line[1].replace(',', '')
+        benchmark = benchmark_line[-1]
+        if benchmark not in search_terms_likwid:
+            sys.exit('Error. Unknown LIKWID group ' + benchmark + '.')
+        # number of LIKWID outputs gives number of used cores
+        cores = str.count(lines[i + 2], 'HWThread')
+        search_postfix = ' STAT' if cores > 1 else ''
+        while search_terms_likwid[benchmark] + search_postfix not in lines[i]:
+            i += 1
+            if i > len(lines) - 1:
+                sys.exit('End of file reached without finding output.')
+        results.setdefault((benchmark, cores), {})[region] = float(lines[i].split('|')[2].split()[0])
+        i += 1
+    return results
+
+
 def main(problem=6, divideBy2=7, mod_pk=1):
 
-    file_prefix = 'caro-paper' 
+    file_prefix = 'caro-paper'
     if file_prefix != '':
         file_prefix = file_prefix + '-'
     file_postfix = ''
@@ -20,7 +77,6 @@ def main(problem=6, divideBy2=7, mod_pk=1):
     nodes = 1
     ranks = 1
     maxCores = 64# 128
-    cores_used = [] # will be filled automatically
 
     path_to_perf_files_rel = os.path.join('..', os.path.join('..', 'scaling_output')) # relative from read_output call
     path_to_perf_files = os.path.join(os.path.dirname(__file__), os.path.join(path_to_perf_files_rel))
@@ -33,7 +89,7 @@ def main(problem=6, divideBy2=7, mod_pk=1):
 
     cols_time = []
     cols_time += ['Total setup', 'Building system matrix A and RHS', 'Factorization of coarse operator Ac',
-                  'Building intergrid operators (e.g. projections)', 'Building smoothing operators A_sc', 
+                  'Building intergrid operators (e.g. projections)', 'Building smoothing operators A_sc',
                   'Factorizing smoothing operators A_sc']
     cols_time += ['Total multigrid cycle', 'Complete smoothing', 'Computing residual',
                   'Applying restriction', 'Solve coarse system', 'Applying prolongation (+ coarse grid correction)']
@@ -43,176 +99,72 @@ def main(problem=6, divideBy2=7, mod_pk=1):
     cols_time += ['Total execution time']
 
     cols = cols_problem + cols_cluster + cols_convergence + cols_time
-    cols_dtypes = {col: 'int' for col in cols_problem + cols_cluster}
-    cols_dtypes.update(
-        {col: 'double' for col in cols_convergence + cols_time})
 
     filename_input = 'p' + str(problem) + '-r' + str(nr_exp) + '-dbt' + str(divideBy2) + '-mpk' + str(mod_pk) + '-s' + str(
         smoother) + '-e' + str(extrapolation) + '--N' + str(nodes) + '-R' + str(ranks) + '-maxC' + str(maxCores)
+    job = os.path.join(path_to_perf_files, file_prefix + filename_input + file_postfix)
 
-    err = 0
-    regions = {} # Attention: We assume all benchmarks in one file to be run with the same regions (output)!
     search_terms_likwid = {}
     search_terms_likwid['FLOPS_DP'] = 'DP [MFLOP/s]'
-    search_terms_likwid['MEM_DP'] = 'Memory bandwidth [MBytes/s]'    
-    benchmarks = []
+    search_terms_likwid['MEM_DP'] = 'Memory bandwidth [MBytes/s]'
 
     try: # allow deletion of empty error files
-        with open(os.path.join(path_to_perf_files, file_prefix + filename_input + file_postfix + '.err')) as f:
-            line = f.readline()
-            while line and err == 0:
-                line = f.readline()
+        with open(job + '.err') as f:
+            for line in f:
                 if ' error' in line:
-                    err = 1
                     print('Error in job script.\n')
                     print(line)
+                    return
     except FileNotFoundError:
-        err = 0 # no error file = no error
-
-    if err == 0:
-        with open(os.path.join(path_to_perf_files, file_prefix + filename_input + file_postfix + '.out')) as f:
-
-            lines = f.readlines()
-            i = 0
-            while i < len(lines)-1:
-
-                # search for next program execution
-                if '--> Iteration' in lines[i]:
-                    while '--> Iteration' in lines[i] and '--> Iteration' in lines[i+1]:
-                        i = i+1
-                        if i > len(lines)-1:
-                            sys.exit(
-                                'End of file reached without finding output.')
-                    # iteration scheme ended:
-                    # split on empty spaces and take number of iterations in third place
-                    its = int(lines[i].split()[2][:-1])
-                    while '-norm' not in lines[i]:
-                        i = i+1
-                        if i > len(lines)-1:
-                            sys.exit(
-                                'End of file reached without finding output.')
-                    norm2 = -1
-                    if '2-norm' in lines[i]:
-                        norm2 = float(lines[i].split()[-1])
-                    else:
-                        sys.exit('Error. 2-Norm information not available.')
-                    norminf = -1
-                    if 'inf-norm' in lines[i+1]:
-                        norminf = float(lines[i+1].split()[-1])
-                    else:
-                        sys.exit('Error. Inf-Norm information not available.')
-
-                    while 'Total setup' not in lines[i]:
-                        i = i+1
-                        if i > len(lines)-1:
-                            sys.exit(
-                                'End of file reached without finding timing output.')
-                    # global time print out, split line by line of information and add to dataframe
-                    time_dict = dict()
-                    while 'Total execution time' not in lines[i-1]:
-                        timings = lines[i].split(':') # here we split the timers based on empty spaces
-                        # convert timing to floating point
-                        if len(timings) > 1:
-                            time_dict[timings[0].replace('\t', '')] = float(timings[1])
-                        i = i+1
-                        if i > len(lines)-1:
-                            sys.exit(
-                                'End of file reached without finding output.')
-
-                    multi_region_run = True
-                    while multi_region_run: # iterate over potentially multiple LIKWID regions
-                    
-                        while 'Group 1: ' not in lines[i]: # iterate until LIKWID output
-                            i = i+1
-                            if 'Number of OpenMP threads:' in lines[i] or (i == len(lines)-1):
-                                multi_region_run = False
-                                break
-                            elif i > len(lines)-1:
-                                sys.exit(
-                                    'End of file reached without finding output.')
-                        if not multi_region_run:
-                            break
-                        benchmark_line = lines[i].split()
-                        if 'Region' in lines[i]:
-                            rg = benchmark_line[1].replace(',', '')
-                            regions[rg] = 0
-                        else:   
-                            multi_region_run = False
-                        benchmark = benchmark_line[-1]
-
-                        # save dataframe for previous benchmark (if there was) and create dataframe for current (new) benchmark
-                        if benchmark not in benchmarks:
-                            if len(benchmarks) > 0:
-                                perf_results_df.to_csv(
-                                    os.path.join(path_to_perf_files, 
-                                                 file_prefix + filename_input + file_postfix + '_' + benchmarks[-1] + '.csv'),
-                                    index=False)
-
-                            benchmarks.append(benchmark)
-                            # create empty data frame from column set
-                            perf_results_df = pd.DataFrame(columns=cols)
-                            # set data types for new data frame as defined above
-                            for k, v in cols_dtypes.items():
-                                perf_results_df[k] = perf_results_df[k].astype(v)
-
-                        # number of LIKWID outputs gives number of used cores
-                        cores = str.count(lines[i+2], 'HWThread')
-
-                        cores_used.append(cores)
-
-                        search_postfix = ''
-                        if cores > 1:
-                            search_postfix = ' STAT'
-
-                        while all([val + search_postfix not in lines[i] for val in search_terms_likwid.values()]):
-                            i = i+1
-                            if i > len(lines)-1:
-                                sys.exit(
-                                    'End of file reached without finding output.')
-
-                        # extract benchmark result
-                        regions[rg] = float(lines[i].split('|')[2].split()[0])
-
-                    # with the number of used cores determined, check if
-                    # line for this result is already present
-                    row_setting_avail = (
-                        perf_results_df[cols_problem[0]] == problem) & (
-                        perf_results_df[cols_problem[1]] == nr_exp) & (
-                        perf_results_df[cols_problem[2]] == divideBy2) & (
-                        perf_results_df[cols_problem[3]] == mod_pk) & (
-                        perf_results_df[cols_cluster[0]] == nodes) & (
-                        perf_results_df[cols_cluster[1]] == ranks) & (
-                        perf_results_df[cols_cluster[2]] == cores)
-
-                    if row_setting_avail.values.sum() <= 1:  # add new line
-                        # add to all rows fix identifiers for:
-                        #   problem, exponent in r, modified coordinates, extrapolation
-                        #   number of nodes and ranks of the job
-                        # as well as variable numbers for other columns
-                        benchmark_unit = search_terms_likwid[benchmarks[-1]].split('[')[1][:-1]
-                        perf_results_df.loc[len(perf_results_df.index),
-                                            cols_problem + cols_cluster +
-                                            cols_convergence + [reg + ' (' + benchmark_unit + ')' for reg in regions.keys()]] = [
-                            problem, nr_exp, divideBy2, mod_pk, extrapolation,
-                            nodes, ranks, cores, its, norm2, norminf] + list(regions.values())
-                        # add timings
-                        for time_col, time_val in time_dict.items():
-                            perf_results_df.loc[len(
-                                perf_results_df.index)-1, time_col] = time_val
-                    elif row_setting_avail.values.sum() > 1:  # error
-                        sys.exit(
-                            'Error. More than two lines corresponds to criterion.'
-                            '\n\tTwo benchmarks for the exact same setting in output. Please check output file.')
-
-                i += 1
-            # end while
-
-            # save file of last benchmark
-            perf_results_df.to_csv(
-                os.path.join(path_to_perf_files, 
-                                file_prefix + filename_input + file_postfix + '_' + benchmarks[-1] + '.csv'),
-                index=False)
-        # close file
+        pass # no error file = no error
+
+    report_files = sorted(glob.glob(job + '-C*.json'))
+    if len(report_files) == 0:
+        sys.exit('Error. No report found for ' + job + '.')
+    likwid_results = read_likwid_regions(job + '.out', search_terms_likwid)
+
+    rows = []
+    for report_file in report_files:
+        report = read_report(report_file)
+        settings = report['settings']
+        convergence = report['convergence']
+        timings = report['timings']
+
+        its = convergence['iterations']
+        errors_2 = convergence['exactErrorsWeightedEuclidean']
+        errors_inf = convergence['exactErrorsInfinity']
+        row = {
+            'Problem': problem, 'rExp': report['problem'].get('nr_exp', nr_exp),
+            'divB2': report['problem'].get('divideBy2', divideBy2), 'ModPK': mod_pk,
+            'Extrapolation': settings['extrapolation'],
+            'Nodes': nodes, 'Ranks': ranks, 'Cores': settings['maxOpenMPThreads'],
+            'its': its,
+            '2-norm of error': errors_2[-1] if len(errors_2) > 0 else np.nan,
+            'inf-norm of error': errors_inf[-1] if len(errors_inf) > 0 else np.nan,
+        }
+        for col, keys in report_timings.items():
+            scale = its if keys[0].startswith('avgMGC') else 1
+            row[col] = scale * sum(timings[key] for key in keys)
+        rows.append(row)
+
+    # Two reports for the exact same setting are an error.
+    perf_results_df = pd.DataFrame(rows, columns=cols)
+    if perf_results_df['Cores'].nunique() != len(perf_results_df.index):
+        sys.exit('Error. More than two lines corresponds to criterion.'
+                 '\n\tTwo benchmarks for the exact same setting in output. Please check output file.')
+    perf_results_df = perf_results_df.sort_values('Cores').reset_index(drop=True)
+
+    # one csv file per LIKWID benchmark, with the LIKWID region results of the run with the same number of cores
+    benchmarks = sorted({benchmark for benchmark, _ in likwid_results.keys()})
+    if len(benchmarks) == 0:
+        perf_results_df.to_csv(job + '.csv', index=False)
+    for benchmark in benchmarks:
+        benchmark_unit = search_terms_likwid[benchmark].split('[')[1][:-1]
+        benchmark_df = perf_results_df.copy()
+        for index, cores in benchmark_df['Cores'].items():
+            for region, value in likwid_results.get((benchmark, cores), {}).items():
+                benchmark_df.loc[index, region + ' (' + benchmark_unit + ')'] = value
+        benchmark_df.to_csv(job + '_' + benchmark + '.csv', index=False)
 
 
 if __name__ == "__main__":
@@ -221,5 +173,5 @@ if __name__ == "__main__":
     main(problem=6, divideBy2=7, mod_pk=2)
     main(problem=7, divideBy2=7, mod_pk=1)
     main(problem=7, divideBy2=7, mod_pk=2)
-    # large case strong scaling 
-    main(problem=7, divideBy2=8, mod_pk=1)
\ No newline at end of file
+    # large case strong scaling
+    main(problem=7, divideBy2=8, mod_pk=1)
@@ -1,3 +1,4 @@
+import json
 import re
 import matplotlib.pyplot as plt
 
@@ -5,9 +6,12 @@ import matplotlib.pyplot as plt
 ### Input test configuration ###
 ### ------------------------ ###
 
+# Every run writes the LIKWID output <PINNING>_MEM_DP_<cores>.txt and the JSON report <PINNING>_MEM_DP_<cores>.json
+# of gmgpolar (--report), see start_likwid_benchmark.sh. The grid, the geometry and the runtimes are read from the
+# reports, the hardware counters from the LIKWID output.
 folder = "../example_data/data_give_1537x2048"
-nr = 1537
-ntheta = 2048
+
+geometry_names = {0: 'Circular', 1: 'Shafranov', 2: 'Czarny', 3: 'Culham'}
 
 ### Define the number of sockets and socket size ###
 sockets = 4
@@ -107,6 +111,14 @@ def parse_data_from_file(filename, num_cores):
 
     return matrix
 
+### ------------------------ ###
+### Extract data from report ###
+### ------------------------ ###
+
+def read_report(filename):
+    with open(filename, 'r') as file:
+        return json.load(file)
+
 ### --------- ###
 ### Plot data ###
 ### --------- ###
@@ -116,6 +128,14 @@ def main():
     ## Load Data ##
     ## --------- ##
 
+    compact_reports = [read_report(folder + '/COMPACT_MEM_DP_%d.json' % num_cores) for num_cores in core_list]
+    spread_reports = [read_report(folder + '/SPREAD_MEM_DP_%d.json' % num_cores) for num_cores in core_list]
+
+    finest_level = compact_reports[0]['levels'][0]
+    nr = finest_level['nr']
+    ntheta = finest_level['ntheta']
+    geometry = geometry_names[compact_reports[0]['problem']['geometry']]
+
     compact_data = []
     for num_cores in core_list:
         filename_compact_mem = folder + '/COMPACT_MEM_DP_%d.txt' % num_cores
@@ -142,10 +162,10 @@ def main():
     ## Plot: Runtime ##
     ## ------------- ##
 
-    setup_compact = [sublist[1][1] for sublist in compact_data]
-    setup_spread = [sublist[1][1] for sublist in spread_data]
-    solve_compact = [sublist[1][2] for sublist in compact_data]
-    solve_spread = [sublist[1][2] for sublist in spread_data]
+    setup_compact = [report['timings']['setupTotal'] for report in compact_reports]
+    setup_spread = [report['timings']['setupTotal'] for report in spread_reports]
+    solve_compact = [report['timings']['solveTotal'] for report in compact_reports]
+    solve_spread = [report['timings']['solveTotal'] for report in spread_reports]
 
     plt.figure(figsize=(10, 6))
 
@@ -170,7 +190,7 @@ def main():
     plt.yscale('log')
     plt.xlabel('Number of threads')
     plt.ylabel('Execution time [s]')
-    plt.title(f'Parallel Performance - Czarny Geometry ({nr} x {ntheta})')
+    plt.title(f'Parallel Performance - {geometry} Geometry ({nr} x {ntheta})')
     plt.legend()
     plt.grid(True, which="both", ls="--")
 
@@ -209,7 +229,7 @@ def main():
     plt.yscale('log')
     plt.xlabel('Number of threads')
     plt.ylabel('Cycles per Instruction')
-    plt.title(f'Cycles per Instruction - Czarny Geometry ({nr} x {ntheta})')
+    plt.title(f'Cycles per Instruction - {geometry} Geometry ({nr} x {ntheta})')
     plt.legend()
     plt.grid(True, which="both", ls="--")
 
@@ -248,7 +268,7 @@ def main():
     plt.yscale('log')
     plt.xlabel('Number of threads')
     plt.ylabel('DP [MFLOP/s]')
-    plt.title(f'DP [MFLOP/s] - Czarny Geometry ({nr} x {ntheta})')
+    plt.title(f'DP [MFLOP/s] - {geometry} Geometry ({nr} x {ntheta})')
     plt.legend()
     plt.grid(True, which="both", ls="--")
 
@@ -287,7 +307,7 @@ def main():
     plt.yscale('log')
     plt.xlabel('Number of threads')
     plt.ylabel('Memory bandwidth [MBytes/s]')
-    plt.title(f'Memory bandwidth [MBytes/s] - Czarny Geometry ({nr} x {ntheta})')
+    plt.title(f'Memory bandwidth [MBytes/s] - {geometry} Geometry ({nr} x {ntheta})')
     plt.legend()
     plt.grid(True, which="both", ls="--")
 
@@ -321,7 +341,7 @@ def main():
     plt.yscale('log')
     plt.xlabel('Number of threads')
     plt.ylabel('Memory data volume [GBytes]')
-    plt.title(f'Memory data volume [GBytes] - Czarny Geometry ({nr} x {ntheta})')
+    plt.title(f'Memory data volume [GBytes] - {geometry} Geometry ({nr} x {ntheta})')
     plt.legend()
     plt.grid(True, which="both", ls="--")
 
@@ -357,7 +377,7 @@ def main():
     plt.yscale('log')
     plt.xlabel('Number of threads')
     plt.ylabel('Operational intensity')
-    plt.title(f'Operational intensity - Czarny Geometry ({nr} x {ntheta})')
+    plt.title(f'Operational intensity - {geometry} Geometry ({nr} x {ntheta})')
 
     plt.legend()
     plt.grid(True, which="both", ls="--")
@@ -173,7 +173,7 @@ echo "    let mminus1=m-1" >> run_COMPACT_FLOPS_DP_likwid.sh
 echo '    output_file="data/COMPACT_FLOPS_DP_${m}.txt"' >> run_COMPACT_FLOPS_DP_likwid.sh
 echo "    # for testing that pin works correctly, potentially use likwid-pin beforehand" >> run_COMPACT_FLOPS_DP_likwid.sh
 echo "    # srun --cpus-per-task=$((cores)) likwid-pin -C E:N:\$m ./../../build/gmgpolar --verbose $verbose --paraview $paraview --maxOpenMPThreads \$m --threadReductionFactor $threadReductionFactor --stencilDistributionMethod $stencilDistributionMethod --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients --cacheDomainGeometry $cacheDomainGeometry --R0 $R0 --Rmax $Rmax --nr_exp $nr_exp --ntheta_exp $ntheta_exp --anisotropic_factor $anisotropic_factor --divideBy2 $divideBy2 --DirBC_Interior $DirBC_Interior --geometry $geometry --kappa_eps $kappa_eps --delta_e $delta_e --problem $problem --alpha_coeff $alpha_coeff --alpha_jump $alpha_jump --beta_coeff $beta_coeff --FMG $FMG --FMG_iterations $FMG_iterations --FMG_cycle $FMG_cycle --extrapolation $extrapolation --maxLevels $maxLevels --preSmoothingSteps $preSmoothingSteps --postSmoothingSteps $postSmoothingSteps --multigridCycle $multigridCycle --maxIterations $maxIterations --residualNormType $residualNormType --absoluteTolerance $absoluteTolerance --relativeTolerance $relativeTolerance" >> run_COMPACT_FLOPS_DP_likwid.sh
-echo "    srun --cpus-per-task=$((cores)) likwid-perfctr -f -m -C E:N:\$m -g FLOPS_DP -o \$output_file ./../../build/gmgpolar --verbose $verbose --paraview $paraview --maxOpenMPThreads \$m --threadReductionFactor $threadReductionFactor --stencilDistributionMethod $stencilDistributionMethod --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients --cacheDomainGeometry $cacheDomainGeometry --R0 $R0 --Rmax $Rmax --nr_exp $nr_exp --ntheta_exp $ntheta_exp --anisotropic_factor $anisotropic_factor --divideBy2 $divideBy2 --DirBC_Interior $DirBC_Interior --geometry $geometry --kappa_eps $kappa_eps --delta_e $delta_e --problem $problem --alpha_coeff $alpha_coeff --alpha_jump $alpha_jump --beta_coeff $beta_coeff --FMG $FMG --FMG_iterations $FMG_iterations --FMG_cycle $FMG_cycle --extrapolation $extrapolation --maxLevels $maxLevels --preSmoothingSteps $preSmoothingSteps --postSmoothingSteps $postSmoothingSteps --multigridCycle $multigridCycle --maxIterations $maxIterations --residualNormType $residualNormType --absoluteTolerance $absoluteTolerance --relativeTolerance $relativeTolerance" >> run_COMPACT_FLOPS_DP_likwid.sh
+echo "    srun --cpus-per-task=$((cores)) likwid-perfctr -f -m -C E:N:\$m -g FLOPS_DP -o \$output_file ./../../build/gmgpolar --report \${output_file%.txt}.json --verbose $verbose --paraview $paraview --maxOpenMPThreads \$m --threadReductionFactor $threadReductionFactor --stencilDistributionMethod $stencilDistributionMethod --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients --cacheDomainGeometry $cacheDomainGeometry --R0 $R0 --Rmax $Rmax --nr_exp $nr_exp --ntheta_exp $ntheta_exp --anisotropic_factor $anisotropic_factor --divideBy2 $divideBy2 --DirBC_Interior $DirBC_Interior --geometry $geometry --kappa_eps $kappa_eps --delta_e $delta_e --problem $problem --alpha_coeff $alpha_coeff --alpha_jump $alpha_jump --beta_coeff $beta_coeff --FMG $FMG --FMG_iterations $FMG_iterations --FMG_cycle $FMG_cycle --extrapolation $extrapolation --maxLevels $maxLevels --preSmoothingSteps $preSmoothingSteps --postSmoothingSteps $postSmoothingSteps --multigridCycle $multigridCycle --maxIterations $maxIterations --residualNormType $residualNormType --absoluteTolerance $absoluteTolerance --relativeTolerance $relativeTolerance" >> run_COMPACT_FLOPS_DP_likwid.sh
 echo "done;" >> run_COMPACT_FLOPS_DP_likwid.sh
 ### ----------------------------------------- ###
 
@@ -206,7 +206,7 @@ echo "    let mminus1=m-1" >> run_COMPACT_MEM_DP_likwid.sh
 echo '    output_file="data/COMPACT_MEM_DP_${m}.txt"' >> run_COMPACT_MEM_DP_likwid.sh
 echo "    # for testing that pin works correctly, potentially use likwid-pin beforehand" >> run_COMPACT_MEM_DP_likwid.sh
 echo "    # srun --cpus-per-task=$((cores)) likwid-pin -C E:N:\$m ./../../build/gmgpolar --verbose $verbose --paraview $paraview --maxOpenMPThreads \$m --threadReductionFactor $threadReductionFactor --stencilDistributionMethod $stencilDistributionMethod --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients --cacheDomainGeometry $cacheDomainGeometry --R0 $R0 --Rmax $Rmax --nr_exp $nr_exp --ntheta_exp $ntheta_exp --anisotropic_factor $anisotropic_factor --divideBy2 $divideBy2 --DirBC_Interior $DirBC_Interior --geometry $geometry --kappa_eps $kappa_eps --delta_e $delta_e --problem $problem --alpha_coeff $alpha_coeff --alpha_jump $alpha_jump --beta_coeff $beta_coeff --FMG $FMG --FMG_iterations $FMG_iterations --FMG_cycle $FMG_cycle --extrapolation $extrapolation --maxLevels $maxLevels --preSmoothingSteps $preSmoothingSteps --postSmoothingSteps $postSmoothingSteps --multigridCycle $multigridCycle --maxIterations $maxIterations --residualNormType $residualNormType --absoluteTolerance $absoluteTolerance --relativeTolerance $relativeTolerance" >> run_COMPACT_MEM_DP_likwid.sh
-echo "    srun --cpus-per-task=$((cores)) likwid-perfctr -f -m -C E:N:\$m -g MEM_DP -o \$output_file ./../../build/gmgpolar --verbose $verbose --paraview $paraview --maxOpenMPThreads \$m --threadReductionFactor $threadReductionFactor --stencilDistributionMethod $stencilDistributionMethod --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients --cacheDomainGeometry $cacheDomainGeometry --R0 $R0 --Rmax $Rmax --nr_exp $nr_exp --ntheta_exp $ntheta_exp --anisotropic_factor $anisotropic_factor --divideBy2 $divideBy2 --DirBC_Interior $DirBC_Interior --geometry $geometry --kappa_eps $kappa_eps --delta_e $delta_e --problem $problem --alpha_coeff $alpha_coeff --alpha_jump $alpha_jump --beta_coeff $beta_coeff --FMG $FMG --FMG_iterations $FMG_iterations --FMG_cycle $FMG_cycle --extrapolation $extrapolation --maxLevels $maxLevels --preSmoothingSteps $preSmoothingSteps --postSmoothingSteps $postSmoothingSteps --multigridCycle $multigridCycle --maxIterations $maxIterations --residualNormType $residualNormType --absoluteTolerance $absoluteTolerance --relativeTolerance $relativeTolerance" >> run_COMPACT_MEM_DP_likwid.sh
+echo "    srun --cpus-per-task=$((cores)) likwid-perfctr -f -m -C E:N:\$m -g MEM_DP -o \$output_file ./../../build/gmgpolar --report \${output_file%.txt}.json --verbose $verbose --paraview $paraview --maxOpenMPThreads \$m --threadReductionFactor $threadReductionFactor --stencilDistributionMethod $stencilDistributionMethod --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients --cacheDomainGeometry $cacheDomainGeometry --R0 $R0 --Rmax $Rmax --nr_exp $nr_exp --ntheta_exp $ntheta_exp --anisotropic_factor $anisotropic_factor --divideBy2 $divideBy2 --DirBC_Interior $DirBC_Interior --geometry $geometry --kappa_eps $kappa_eps --delta_e $delta_e --problem $problem --alpha_coeff $alpha_coeff --alpha_jump $alpha_jump --beta_coeff $beta_coeff --FMG $FMG --FMG_iterations $FMG_iterations --FMG_cycle $FMG_cycle --extrapolation $extrapolation --maxLevels $maxLevels --preSmoothingSteps $preSmoothingSteps --postSmoothingSteps $postSmoothingSteps --multigridCycle $multigridCycle --maxIterations $maxIterations --residualNormType $residualNormType --absoluteTolerance $absoluteTolerance --relativeTolerance $relativeTolerance" >> run_COMPACT_MEM_DP_likwid.sh
 echo "done;" >> run_COMPACT_MEM_DP_likwid.sh
 ### --------------------------------------- ###
 
@@ -250,7 +250,7 @@ for m in ${core_list[@]}; do
     core_set=$(IFS=,; echo "${list[*]}")
 
     output_file="data/SPREAD_FLOPS_DP_${m}.txt"
-    echo "srun --cpus-per-task=$((cores)) likwid-perfctr -f -m -C N:$core_set -g FLOPS_DP -o $output_file ./../../build/gmgpolar --verbose $verbose --paraview $paraview --maxOpenMPThreads $m --threadReductionFactor $threadReductionFactor --stencilDistributionMethod $stencilDistributionMethod --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients --cacheDomainGeometry $cacheDomainGeometry --R0 $R0 --Rmax $Rmax --nr_exp $nr_exp --ntheta_exp $ntheta_exp --anisotropic_factor $anisotropic_factor --divideBy2 $divideBy2 --DirBC_Interior $DirBC_Interior --geometry $geometry --kappa_eps $kappa_eps --delta_e $delta_e --problem $problem --alpha_coeff $alpha_coeff --alpha_jump $alpha_jump --beta_coeff $beta_coeff --FMG $FMG --FMG_iterations $FMG_iterations --FMG_cycle $FMG_cycle --extrapolation $extrapolation --maxLevels $maxLevels --preSmoothingSteps $preSmoothingSteps --postSmoothingSteps $postSmoothingSteps --multigridCycle $multigridCycle --maxIterations $maxIterations --residualNormType $residualNormType --absoluteTolerance $absoluteTolerance --relativeTolerance $relativeTolerance" >> run_SPREAD_FLOPS_DP_likwid.sh
+    echo "srun --cpus-per-task=$((cores)) likwid-perfctr -f -m -C N:$core_set -g FLOPS_DP -o $output_file ./../../build/gmgpolar --report ${output_file%.txt}.json --verbose $verbose --paraview $paraview --maxOpenMPThreads $m --threadReductionFactor $threadReductionFactor --stencilDistributionMethod $stencilDistributionMethod --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients --cacheDomainGeometry $cacheDomainGeometry --R0 $R0 --Rmax $Rmax --nr_exp $nr_exp --ntheta_exp $ntheta_exp --anisotropic_factor $anisotropic_factor --divideBy2 $divideBy2 --DirBC_Interior $DirBC_Interior --geometry $geometry --kappa_eps $kappa_eps --delta_e $delta_e --problem $problem --alpha_coeff $alpha_coeff --alpha_jump $alpha_jump --beta_coeff $beta_coeff --FMG $FMG --FMG_iterations $FMG_iterations --FMG_cycle $FMG_cycle --extrapolation $extrapolation --maxLevels $maxLevels --preSmoothingSteps $preSmoothingSteps --postSmoothingSteps $postSmoothingSteps --multigridCycle $multigridCycle --maxIterations $maxIterations --residualNormType $residualNormType --absoluteTolerance $absoluteTolerance --relativeTolerance $relativeTolerance" >> run_SPREAD_FLOPS_DP_likwid.sh
 done
 ### --------------------------------- ###
 
@@ -293,7 +293,7 @@ for m in ${core_list[@]}; do
     core_set=$(IFS=,; echo "${list[*]}")
 
     output_file="data/SPREAD_MEM_DP_${m}.txt"
-    echo "srun --cpus-per-task=$((cores)) likwid-perfctr -f -m -C N:$core_set -g MEM_DP -o $output_file ./../../build/gmgpolar --verbose $verbose --paraview $paraview --maxOpenMPThreads $m --threadReductionFactor $threadReductionFactor --stencilDistributionMethod $stencilDistributionMethod --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients --cacheDomainGeometry $cacheDomainGeometry --R0 $R0 --Rmax $Rmax --nr_exp $nr_exp --ntheta_exp $ntheta_exp --anisotropic_factor $anisotropic_factor --divideBy2 $divideBy2 --DirBC_Interior $DirBC_Interior --geometry $geometry --kappa_eps $kappa_eps --delta_e $delta_e --problem $problem --alpha_coeff $alpha_coeff --alpha_jump $alpha_jump --beta_coeff $beta_coeff --FMG $FMG --FMG_iterations $FMG_iterations --FMG_cycle $FMG_cycle --extrapolation $extrapolation --maxLevels $maxLevels --preSmoothingSteps $preSmoothingSteps --postSmoothingSteps $postSmoothingSteps --multigridCycle $multigridCycle --maxIterations $maxIterations --residualNormType $residualNormType --absoluteTolerance $absoluteTolerance --relativeTolerance $relativeTolerance" >> run_SPREAD_MEM_DP_likwid.sh
+    echo "srun --cpus-per-task=$((cores)) likwid-perfctr -f -m -C N:$core_set -g MEM_DP -o $output_file ./../../build/gmgpolar --report ${output_file%.txt}.json --verbose $verbose --paraview $paraview --maxOpenMPThreads $m --threadReductionFactor $threadReductionFactor --stencilDistributionMethod $stencilDistributionMethod --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients --cacheDomainGeometry $cacheDomainGeometry --R0 $R0 --Rmax $Rmax --nr_exp $nr_exp --ntheta_exp $ntheta_exp --anisotropic_factor $anisotropic_factor --divideBy2 $divideBy2 --DirBC_Interior $DirBC_Interior --geometry $geometry --kappa_eps $kappa_eps --delta_e $delta_e --problem $problem --alpha_coeff $alpha_coeff --alpha_jump $alpha_jump --beta_coeff $beta_coeff --FMG $FMG --FMG_iterations $FMG_iterations --FMG_cycle $FMG_cycle --extrapolation $extrapolation --maxLevels $maxLevels --preSmoothingSteps $preSmoothingSteps --postSmoothingSteps $postSmoothingSteps --multigridCycle $multigridCycle --maxIterations $maxIterations --residualNormType $residualNormType --absoluteTolerance $absoluteTolerance --relativeTolerance $relativeTolerance" >> run_SPREAD_MEM_DP_likwid.sh
 done
 ### ------------------------------- ###
 
@@ -13,28 +13,48 @@ verbose=1
 # 0 - Do not use Paraview 
 # 1 - Enable Paraview to visualize the grid, solution and error
 paraview=0
+# ParaView file format:
+# 0 - ASCII unstructured grid (.vtu)
+# 1 - Binary unstructured grid (.vtu)
+# 2 - Compressed unstructured grid (.vtu), requires zlib
+# 3 - Structured grid (.vts), compressed if zlib is available
+paraviewFormat=1
 
 # OpenMP settings:
 # Maximum number of threads OpenMP can use for parallel execution
 maxOpenMPThreads=32
 # Factor to reduce the number of threads OpenMP uses (e.g., 1.0 means no reduction)
 threadReductionFactor=1.0
+# Time candidate thread counts on every level during the setup and use the fastest (0/1)
+autotuneThreads=0
+# File caching the autotuned thread counts (empty: no cache)
+threadTuningCache=""
 
 # Stencil distribution method:
 # 0 - CPU "Take": Each node independently applies the stencil
 # 1 - CPU "Give": The stencil operation is distributed across adjacent neighboring nodes
+# 2 - CPU "Assembled": "Take" on stencil coefficients assembled once during the setup (more memory, fewer flops)
+# 3 - CPU "Assembled" with symmetric storage: 5 instead of 9 coefficients per node
 stencilDistributionMethod=1
 # Caching behavior:
 # 0 - Recompute values on each iteration: Uses less memory but results in slower execution.
 # 1 - Reuse cached values: Consumes more memory but significantly improves performance.
 cacheDensityProfileCoefficients=1
 cacheDomainGeometry=0
-# Note: In the "Take" approach (stencilDistributionMethod=0), 
+# Precision of the smoother factorizations:
+# 0 - Double precision
+# 1 - Single precision factors on the coarse levels, finest level stays in double precision (reduces memory traffic)
+mixedPrecision=0
+# Memory footprint of the coarse levels:
+# 0 - Coarse levels use the same caching as the finest level
+# 1 - Coarse levels evaluate coefficients on the fly and share their solution storage (lower memory, slightly slower)
+memoryLean=0
+# Note: In the "Take" and "Assembled" approaches (stencilDistributionMethod=0,2,3), 
 # caching is required for optimal performance, 
 # so both density profile coefficients and domain geometry need to be cached.
-if [[ $stencilDistributionMethod -eq 0 ]]; then
+if [[ $stencilDistributionMethod -eq 0 || $stencilDistributionMethod -ge 2 ]]; then
   if [[ $cacheDensityProfileCoefficients -ne 1 || $cacheDomainGeometry -ne 1 ]]; then
-    echo "Error: Caching must be enabled (set to 1) for both density profile coefficients and domain geometry in 'Take' approach (stencilDistributionMethod=0)."
+    echo "Error: Caching must be enabled (set to 1) for both density profile coefficients and domain geometry in 'Take' and 'Assembled' approaches (stencilDistributionMethod=0,2,3)."
     exit 1
   fi
 fi
@@ -85,11 +105,22 @@ postSmoothingSteps=1
 # 2: F-Cycle
 multigridCycle=0
 
+# Outer solver:
+# 0: Stationary multigrid iteration
+# 1: Conjugate gradient preconditioned by one multigrid cycle (requires extrapolation=0)
+# 2: Flexible GMRES preconditioned by one multigrid cycle (requires extrapolation=0)
+outerSolver=0
+FGMRES_restart=30
+
 # Convergence criteria:
 maxIterations=150
 residualNormType=0 # L2-Norm(0) = 0, Weighted L2-Norm(1), Infinity-Norm(2)
 absoluteTolerance=1e-8
 relativeTolerance=1e-8
+# Convergence check:
+# 0 - Compute the residual before every iteration
+# 1 - Reuse the residual computed inside the multigrid cycle (saves one operator application per iteration)
+fusedConvergenceCheck=0
 
 # Define additional geometry parameters
 kappa_eps=0.0
@@ -120,11 +151,16 @@ fi
 "$GMGPOLAR_EXEC" \
     --verbose $verbose \
     --paraview $paraview \
+    --paraviewFormat $paraviewFormat \
     --maxOpenMPThreads $maxOpenMPThreads \
     --threadReductionFactor $threadReductionFactor \
+    --autotuneThreads $autotuneThreads \
+    --threadTuningCache "$threadTuningCache" \
     --stencilDistributionMethod $stencilDistributionMethod \
     --cacheDensityProfileCoefficients $cacheDensityProfileCoefficients \
     --cacheDomainGeometry $cacheDomainGeometry \
+    --mixedPrecision $mixedPrecision \
+    --memoryLean $memoryLean \
     --R0 $R0 \
     --Rmax $Rmax \
     --nr_exp $nr_exp \
@@ -147,7 +183,10 @@ fi
     --preSmoothingSteps $preSmoothingSteps \
     --postSmoothingSteps $postSmoothingSteps \
     --multigridCycle $multigridCycle \
+    --outerSolver $outerSolver \
+    --FGMRES_restart $FGMRES_restart \
     --maxIterations $maxIterations \
     --residualNormType $residualNormType \
     --absoluteTolerance $absoluteTolerance \
-    --relativeTolerance $relativeTolerance
+    --relativeTolerance $relativeTolerance \
+    --fusedConvergenceCheck $fusedConvergenceCheck
@@ -28,18 +28,20 @@ threadReductionFactor=1.0
 # Implementation strategy:
 # 0 - CPU "Take": Each node independently applies the stencil
 # 1 - CPU "Give": The stencil operation is distributed across adjacent neighboring nodes
+# 2 - CPU "Assembled": "Take" on stencil coefficients assembled once during the setup (more memory, fewer flops)
+# 3 - CPU "Assembled" with symmetric storage: 5 instead of 9 coefficients per node
 stencilDistributionMethod=0
 # Caching behavior:
 # 0 - Recompute values on each iteration: Uses less memory but results in slower execution.
 # 1 - Reuse cached values: Consumes more memory but significantly improves performance.
 cacheDensityProfileCoefficients=1
 cacheDomainGeometry=1
-# Note: In the "Take" approach (stencilDistributionMethod=0), 
+# Note: In the "Take" and "Assembled" approaches (stencilDistributionMethod=0,2,3), 
 # caching is required for optimal performance, 
 # so both density profile coefficients and domain geometry need to be cached.
-if [[ $stencilDistributionMethod -eq 0 ]]; then
+if [[ $stencilDistributionMethod -eq 0 || $stencilDistributionMethod -ge 2 ]]; then
   if [[ $cacheDensityProfileCoefficients -ne 1 || $cacheDomainGeometry -ne 1 ]]; then
-    echo "Error: Caching must be enabled (set to 1) for both density profile coefficients and domain geometry in 'Take' approach (stencilDistributionMethod=0)."
+    echo "Error: Caching must be enabled (set to 1) for both density profile coefficients and domain geometry in 'Take' and 'Assembled' approaches (stencilDistributionMethod=0,2,3)."
     exit 1
   fi
 fi
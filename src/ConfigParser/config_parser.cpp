@@ -5,15 +5,27 @@ ConfigParser::ConfigParser()
     // Initialize command-line options for general parameters
     parser_.add<int>("verbose", '\0', "Verbosity level.", OPTIONAL, 1);
     parser_.add<int>("paraview", '\0', "Generate ParaView output (0/1).", OPTIONAL, 0);
+    parser_.add<int>("paraviewFormat", '\0', "ParaView format (0=ASCII,1=Binary,2=Compressed,3=Structured).",
+                     OPTIONAL, 0, cmdline::oneof(0, 1, 2, 3));
+    parser_.add<std::string>("report", '\0', "Write a JSON report of the run to this file.", OPTIONAL, "");
     parser_.add<int>("maxOpenMPThreads", '\0', "Max OpenMP threads.", OPTIONAL, 1);
     parser_.add<double>("threadReductionFactor", '\0', "Thread reduction factor.", OPTIONAL, 1.0);
-    parser_.add<int>("DirBC_Interior", '\0', "Interior BC type (0=Across-origin, 1=Dirichlet).", OPTIONAL, 0,
+    parser_.add<int>("autotuneThreads", '\0', "Autotune the threads per level during the setup (0/1).", OPTIONAL, 0,
                      cmdline::oneof(0, 1));
-    parser_.add<int>("stencilDistributionMethod", '\0', "Stencil distribution (0=CPU_Take,1=CPU_Give)", OPTIONAL, 0,
+    parser_.add<std::string>("threadTuningCache", '\0', "File caching the autotuned threads per level.", OPTIONAL,
+                             "");
+    parser_.add<int>("DirBC_Interior", '\0', "Interior BC type (0=Across-origin, 1=Dirichlet).", OPTIONAL, 0,
                      cmdline::oneof(0, 1));
+    parser_.add<int>("stencilDistributionMethod", '\0',
+                     "Stencil distribution (0=CPU_Take,1=CPU_Give,2=CPU_Assembled,3=CPU_Assembled_Symmetric)",
+                     OPTIONAL, 0, cmdline::oneof(0, 1, 2, 3));
     parser_.add<int>("cacheDensityProfileCoefficients", '\0', "Cache density coefficients (0/1).", OPTIONAL, 1,
                      cmdline::oneof(0, 1));
     parser_.add<int>("cacheDomainGeometry", '\0', "Cache domain geometry (0/1).", OPTIONAL, 1, cmdline::oneof(0, 1));
+    parser_.add<int>("mixedPrecision", '\0', "Single precision smoother factorizations (0/1).", OPTIONAL, 0,
+                     cmdline::oneof(0, 1));
+    parser_.add<int>("memoryLean", '\0', "Reduce the memory footprint of the level hierarchy (0/1).", OPTIONAL, 0,
+                     cmdline::oneof(0, 1));
 
     // Initialize command-line options for grid parameters
     parser_.add<double>("R0", 'r', "Interior radius of the disk.", OPTIONAL, 1e-5);
@@ -33,6 +45,9 @@ ConfigParser::ConfigParser()
     parser_.add<int>("FMG", '\0', "Use Full Multigrid (0/1).", OPTIONAL, 0, cmdline::oneof(0, 1));
     parser_.add<int>("FMG_iterations", '\0', "FMG iterations.", OPTIONAL, 2);
     parser_.add<int>("FMG_cycle", '\0', "FMG cycle type (0=V,1=W,2=F).", OPTIONAL, 0, cmdline::oneof(0, 1, 2));
+    parser_.add<int>("outerSolver", '\0', "Outer solver (0=Multigrid,1=PCG,2=FGMRES).", OPTIONAL, 0,
+                     cmdline::oneof(0, 1, 2));
+    parser_.add<int>("FGMRES_restart", '\0', "FGMRES restart length.", OPTIONAL, 30);
     parser_.add<int>("maxIterations", '\0', "Max solver iterations.", OPTIONAL, 150);
     parser_.add<int>("residualNormType", '\0', "Residual norm (0=Euclidean,1=Weighted,2=Infinity)", OPTIONAL, 0,
                      cmdline::oneof(0, 1, 2));
@@ -40,10 +55,15 @@ ConfigParser::ConfigParser()
                         "Absolute tolerance. Negative values disable the convergence criteria.", OPTIONAL, 1e-8);
     parser_.add<double>("relativeTolerance", '\0',
                         "Relative tolerance. Negative values disable the convergence criteria.", OPTIONAL, 1e-8);
+    parser_.add<int>("fusedConvergenceCheck", '\0', "Reuse the residual of the multigrid cycle for convergence (0/1).",
+                     OPTIONAL, 0, cmdline::oneof(0, 1));
 
     // Initialize command-line options for geometry parameters
     parser_.add<int>("geometry", '\0', "Geometry type (0=Circular,1=Shafranov,2=Czarny,3=Culham)", OPTIONAL, 0,
                      cmdline::oneof(0, 1, 2, 3));
+    parser_.add<std::string>("geometryTable", '\0', "Tabulated geometry replacing the analytic one.", OPTIONAL, "");
+    parser_.add<std::string>("coefficientsTable", '\0', "Tabulated alpha and beta replacing the analytic ones.",
+                             OPTIONAL, "");
     parser_.add<double>("alpha_jump", '\0', "Radius for density decay.", OPTIONAL, 0.0);
     parser_.add<double>("kappa_eps", 'k', "Elongation parameter.", OPTIONAL, 0.0);
     parser_.add<double>("delta_e", 'd', "Radial displacement.", OPTIONAL, 0.0);
@@ -74,12 +94,17 @@ bool ConfigParser::parse(int argc, char* argv[])
     // Parse general parameters from command-line arguments
     verbose_                 = parser_.get<int>("verbose");
     paraview_                = parser_.get<int>("paraview") != 0;
+    report_                  = parser_.get<std::string>("report");
     max_omp_threads_         = parser_.get<int>("maxOpenMPThreads");
     thread_reduction_factor_ = parser_.get<double>("threadReductionFactor");
+    autotune_threads_        = parser_.get<int>("autotuneThreads") != 0;
+    thread_tuning_cache_     = parser_.get<std::string>("threadTuningCache");
     DirBC_Interior_          = parser_.get<int>("DirBC_Interior") != 0;
     const int methodValue    = parser_.get<int>("stencilDistributionMethod");
     if (methodValue == static_cast<int>(StencilDistributionMethod::CPU_TAKE) ||
-        methodValue == static_cast<int>(StencilDistributionMethod::CPU_GIVE)) {
+        methodValue == static_cast<int>(StencilDistributionMethod::CPU_GIVE) ||
+        methodValue == static_cast<int>(StencilDistributionMethod::CPU_ASSEMBLED) ||
+        methodValue == static_cast<int>(StencilDistributionMethod::CPU_ASSEMBLED_SYMMETRIC)) {
         stencil_distribution_method_ = static_cast<StencilDistributionMethod>(methodValue);
     }
     else {
@@ -87,6 +112,19 @@ bool ConfigParser::parse(int argc, char* argv[])
     }
     cache_density_profile_coefficients_ = parser_.get<int>("cacheDensityProfileCoefficients") != 0;
     cache_domain_geometry_              = parser_.get<int>("cacheDomainGeometry") != 0;
+    mixed_precision_                    = parser_.get<int>("mixedPrecision") != 0;
+    memory_lean_                        = parser_.get<int>("memoryLean") != 0;
+
+    const int paraviewFormatValue = parser_.get<int>("paraviewFormat");
+    if (paraviewFormatValue == static_cast<int>(ParaviewFormat::ASCII) ||
+        paraviewFormatValue == static_cast<int>(ParaviewFormat::BINARY) ||
+        paraviewFormatValue == static_cast<int>(ParaviewFormat::COMPRESSED) ||
+        paraviewFormatValue == static_cast<int>(ParaviewFormat::STRUCTURED)) {
+        paraview_format_ = static_cast<ParaviewFormat>(paraviewFormatValue);
+    }
+    else {
+        throw std::runtime_error("Invalid ParaView format.");
+    }
 
     // Parse grid parameters from command-line arguments
     double R0              = parser_.get<double>("R0");
@@ -130,6 +168,19 @@ bool ConfigParser::parse(int argc, char* argv[])
     else {
         throw std::runtime_error("Invalid multigrid cycle type.");
     }
+    const int outerSolverValue = parser_.get<int>("outerSolver");
+    if (outerSolverValue == static_cast<int>(OuterSolverType::MULTIGRID_ITERATION) ||
+        outerSolverValue == static_cast<int>(OuterSolverType::PCG) ||
+        outerSolverValue == static_cast<int>(OuterSolverType::FGMRES)) {
+        outer_solver_ = static_cast<OuterSolverType>(outerSolverValue);
+    }
+    else {
+        throw std::runtime_error("Invalid outer solver type.");
+    }
+    FGMRES_restart_ = parser_.get<int>("FGMRES_restart");
+    if (FGMRES_restart_ < 1) {
+        throw std::runtime_error("Invalid FGMRES restart length.");
+    }
     max_iterations_     = parser_.get<int>("maxIterations");
     const int normValue = parser_.get<int>("residualNormType");
     if (normValue == static_cast<int>(ResidualNormType::EUCLIDEAN) ||
@@ -145,6 +196,8 @@ bool ConfigParser::parse(int argc, char* argv[])
     double relTol       = parser_.get<double>("relativeTolerance");
     relative_tolerance_ = (relTol >= 0) ? std::optional<double>(relTol) : std::nullopt;
 
+    fused_convergence_check_ = parser_.get<int>("fusedConvergenceCheck") != 0;
+
     const int geometry_value = parser_.get<int>("geometry");
     GeometryType geometry_type;
     if (geometry_value == static_cast<int>(GeometryType::CIRCULAR) ||
@@ -197,6 +250,35 @@ bool ConfigParser::parse(int argc, char* argv[])
 
     selectTestCase(geometry_type, problem_type, alpha_type, beta_type, Rmax, kappa_eps, delta_e, alpha_jump);
 
+    problem_settings_ = {{"geometry", geometry_value},
+                         {"geometryTable", parser_.get<std::string>("geometryTable")},
+                         {"problem", problem_value},
+                         {"alpha_coeff", alpha_value},
+                         {"beta_coeff", beta_value},
+                         {"coefficientsTable", parser_.get<std::string>("coefficientsTable")},
+                         {"R0", R0},
+                         {"Rmax", Rmax},
+                         {"kappa_eps", kappa_eps},
+                         {"delta_e", delta_e},
+                         {"alpha_jump", alpha_jump},
+                         {"refinement_radius", refinement_radius},
+                         {"nr_exp", static_cast<int>(nr_exp)},
+                         {"ntheta_exp", ntheta_exp},
+                         {"anisotropic_factor", anisotropic_factor},
+                         {"divideBy2", divideBy2}};
+
+    // Tables of an equilibrium code replace the analytic geometry and coefficients. The manufactured solution of
+    // 'geometry' and 'alpha_coeff' is kept, so the exact error is only meaningful if the tables tabulate these.
+    const std::string geometry_table = parser_.get<std::string>("geometryTable");
+    if (!geometry_table.empty()) {
+        domain_geometry_ = std::make_unique<TabulatedGeometry>(geometry_table);
+    }
+    const std::string coefficients_table = parser_.get<std::string>("coefficientsTable");
+    if (!coefficients_table.empty()) {
+        density_profile_coefficients_ = std::make_unique<TabulatedDensityProfileCoefficients>(coefficients_table,
+                                                                                              alpha_jump);
+    }
+
     if (verbose_ && argc != 0) {
         std::cout << "------------------------------\n";
         std::cout << "------ Problem Settings ------\n";
@@ -214,6 +296,9 @@ bool ConfigParser::parse(int argc, char* argv[])
         else if (typeid(*domain_geometry_) == typeid(CulhamGeometry)) {
             std::cout << "Culham (Domain geometry)\n";
         }
+        else if (typeid(*domain_geometry_) == typeid(TabulatedGeometry)) {
+            std::cout << "Tabulated (Domain geometry)\n";
+        }
         else {
             std::cout << "Unknown domain geometry\n";
         }
@@ -267,6 +352,9 @@ bool ConfigParser::parse(int argc, char* argv[])
         else if (typeid(*density_profile_coefficients_) == typeid(ZoniShiftedGyroCoefficients)) {
             std::cout << "α = Zoni-Shifted, β = 1/α  (Profile coefficients)\n";
         }
+        else if (typeid(*density_profile_coefficients_) == typeid(TabulatedDensityProfileCoefficients)) {
+            std::cout << "α, β tabulated (Profile coefficients)\n";
+        }
         else {
             std::cout << "Unknown profile coefficients\n";
         }
@@ -290,6 +378,14 @@ bool ConfigParser::paraview() const
 {
     return paraview_;
 }
+ParaviewFormat ConfigParser::paraviewFormat() const
+{
+    return paraview_format_;
+}
+const std::string& ConfigParser::report() const
+{
+    return report_;
+}
 
 int ConfigParser::maxOpenMPThreads() const
 {
@@ -299,6 +395,14 @@ double ConfigParser::threadReductionFactor() const
 {
     return thread_reduction_factor_;
 }
+bool ConfigParser::autotuneThreads() const
+{
+    return autotune_threads_;
+}
+const std::string& ConfigParser::threadTuningCache() const
+{
+    return thread_tuning_cache_;
+}
 
 bool ConfigParser::DirBC_Interior() const
 {
@@ -317,6 +421,14 @@ bool ConfigParser::cacheDomainGeometry() const
 {
     return cache_domain_geometry_;
 }
+bool ConfigParser::mixedPrecision() const
+{
+    return mixed_precision_;
+}
+bool ConfigParser::memoryLean() const
+{
+    return memory_lean_;
+}
 
 const PolarGrid& ConfigParser::grid() const
 {
@@ -356,6 +468,14 @@ MultigridCycleType ConfigParser::multigridCycle() const
 {
     return multigrid_cycle_;
 }
+OuterSolverType ConfigParser::outerSolver() const
+{
+    return outer_solver_;
+}
+int ConfigParser::FGMRES_restart() const
+{
+    return FGMRES_restart_;
+}
 int ConfigParser::maxIterations() const
 {
     return max_iterations_;
@@ -372,6 +492,10 @@ std::optional<double> ConfigParser::relativeTolerance() const
 {
     return relative_tolerance_;
 }
+bool ConfigParser::fusedConvergenceCheck() const
+{
+    return fused_convergence_check_;
+}
 
 const DomainGeometry& ConfigParser::domainGeometry() const
 {
@@ -397,3 +521,8 @@ const ExactSolution& ConfigParser::exactSolution() const
 {
     return *exact_solution_.get();
 }
+
+const std::vector<ReportSetting>& ConfigParser::problemSettings() const
+{
+    return problem_settings_;
+}
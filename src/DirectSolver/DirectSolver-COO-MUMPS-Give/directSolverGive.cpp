@@ -5,11 +5,16 @@
 DirectSolverGive::DirectSolverGive(const PolarGrid& grid, const LevelCache& level_cache,
                                    const DomainGeometry& domain_geometry,
                                    const DensityProfileCoefficients& density_profile_coefficients, bool DirBC_Interior,
-                                   int num_omp_threads)
+                                   int num_omp_threads, SetupReader* setup_reader)
     : DirectSolver(grid, level_cache, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads)
 {
-    solver_matrix_ = buildSolverMatrix();
-    initializeMumpsSolver(mumps_solver_, solver_matrix_);
+    if (setup_reader) {
+        restoreMumpsSolver(*setup_reader, mumps_solver_);
+    }
+    else {
+        solver_matrix_ = buildSolverMatrix();
+        initializeMumpsSolver(mumps_solver_, solver_matrix_);
+    }
 }
 
 void DirectSolverGive::solveInPlace(Vector<double> solution)
@@ -24,6 +29,31 @@ void DirectSolverGive::solveInPlace(Vector<double> solution)
     solveWithMumps(solution);
 }
 
+void DirectSolverGive::solveInPlaceBatch(Vector<double> solution, const int number_of_columns)
+{
+    const std::size_t n = grid_.numberOfNodes();
+    for (int column = 0; column < number_of_columns; column++) {
+        applySymmetryShift(batchColumn(solution, column, n));
+    }
+    solveWithMumps(solution, number_of_columns);
+}
+
+void DirectSolverGive::refactorize()
+{
+    solver_matrix_ = buildSolverMatrix();
+    refactorizeMumpsSolver(mumps_solver_, solver_matrix_);
+}
+
+std::size_t DirectSolverGive::memoryUsage() const
+{
+    return solver_matrix_.memoryUsage() + mumpsMemoryUsage(mumps_solver_);
+}
+
+void DirectSolverGive::saveSetup(SetupWriter& writer)
+{
+    saveMumpsSolver(writer, mumps_solver_);
+}
+
 DirectSolverGive::~DirectSolverGive()
 {
     finalizeMumpsSolver(mumps_solver_);
@@ -102,16 +102,46 @@ void DirectSolverGive::initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, Spars
     }
 }
 
-void DirectSolverGive::solveWithMumps(Vector<double> result_rhs)
+void DirectSolverGive::refactorizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix)
 {
-    mumps_solver_.job    = JOB_COMPUTE_SOLUTION;
-    mumps_solver_.nrhs   = 1;
-    mumps_solver_.nz_rhs = result_rhs.size();
-    mumps_solver_.rhs    = result_rhs.data();
-    mumps_solver_.lrhs   = result_rhs.size();
-    dmumps_c(&mumps_solver_);
-    if (mumps_solver_.info[0] != 0) {
-        std::cerr << "Error solving the direct system: " << mumps_solver_.info[0] << std::endl;
+    /* The sparsity pattern is unchanged, so the analysis from 'initializeMumpsSolver' is reused */
+    /* and only the numerical factorization is repeated. */
+    for (int i = 0; i < solver_matrix.non_zero_size(); i++) {
+        solver_matrix.row_index(i) += 1;
+        solver_matrix.col_index(i) += 1;
+    }
+
+    mumps_solver.job = JOB_FACTORIZATION_PHASE;
+    assert(mumps_solver.n == solver_matrix.rows());
+    assert(mumps_solver.nz == solver_matrix.non_zero_size());
+    mumps_solver.irn = solver_matrix.row_indices_data();
+    mumps_solver.jcn = solver_matrix.column_indices_data();
+    mumps_solver.a   = solver_matrix.values_data();
+    dmumps_c(&mumps_solver);
+
+    if (mumps_solver.sym == SYM_POSITIVE_DEFINITE && mumps_solver.INFOG(12) != 0) {
+        std::cout
+            << "Warning: DirectSolver matrix is not positive definite: Negative pivots in the factorization phase."
+            << std::endl;
+    }
+}
+
+void DirectSolverGive::solveWithMumps(Vector<double> result_rhs, const int number_of_columns)
+{
+    const int n = grid_.numberOfNodes();
+    assert(result_rhs.size() >= static_cast<std::size_t>(number_of_columns) * n);
+    // MUMPS keeps the right-hand side in the shared solver instance, see SolveContext.
+#pragma omp critical(gmgpolar_mumps_solve)
+    {
+        mumps_solver_.job    = JOB_COMPUTE_SOLUTION;
+        mumps_solver_.nrhs   = number_of_columns; // rhs vectors
+        mumps_solver_.nz_rhs = number_of_columns * n; // non-zeros in rhs
+        mumps_solver_.rhs    = result_rhs.data();
+        mumps_solver_.lrhs   = n; // leading dimension
+        dmumps_c(&mumps_solver_);
+        if (mumps_solver_.info[0] != 0) {
+            std::cerr << "Error solving the direct system: " << mumps_solver_.info[0] << std::endl;
+        }
     }
 }
 
@@ -6,7 +6,8 @@
 /* Boundary Symmetry Shift */
 /* ----------------------- */
 
-void DirectSolverTake::applySymmetryShiftInnerBoundary(Vector<double> x) const
+template <typename T>
+void DirectSolverTake::applySymmetryShiftInnerBoundary(Vector<T> x) const
 {
     assert(DirBC_Interior_);
 
@@ -43,7 +44,8 @@ void DirectSolverTake::applySymmetryShiftInnerBoundary(Vector<double> x) const
     }
 }
 
-void DirectSolverTake::applySymmetryShiftOuterBoundary(Vector<double> x) const
+template <typename T>
+void DirectSolverTake::applySymmetryShiftOuterBoundary(Vector<T> x) const
 {
     assert(level_cache_.cacheDensityProfileCoefficients());
     assert(level_cache_.cacheDomainGeometry());
@@ -78,7 +80,8 @@ void DirectSolverTake::applySymmetryShiftOuterBoundary(Vector<double> x) const
     }
 }
 
-void DirectSolverTake::applySymmetryShift(Vector<double> x) const
+template <typename T>
+void DirectSolverTake::applySymmetryShift(Vector<T> x) const
 {
     assert(x.size() == grid_.numberOfNodes());
     assert(grid_.nr() >= 4);
@@ -108,4 +111,8 @@ void DirectSolverTake::applySymmetryShift(Vector<double> x) const
     }
 }
 
+// The double precision solve and the single precision solve of the mixed precision cycle.
+template void DirectSolverTake::applySymmetryShift(Vector<double> x) const;
+template void DirectSolverTake::applySymmetryShift(Vector<float> x) const;
+
 #endif
@@ -5,11 +5,24 @@
 DirectSolverTake::DirectSolverTake(const PolarGrid& grid, const LevelCache& level_cache,
                                    const DomainGeometry& domain_geometry,
                                    const DensityProfileCoefficients& density_profile_coefficients, bool DirBC_Interior,
-                                   int num_omp_threads)
+                                   int num_omp_threads, bool single_precision, SetupReader* setup_reader)
     : DirectSolver(grid, level_cache, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads)
+    , single_precision_(single_precision)
 {
-    solver_matrix_ = buildSolverMatrix();
-    initializeMumpsSolver(mumps_solver_, solver_matrix_);
+    if (setup_reader) {
+        restoreMumpsSolver(*setup_reader, mumps_solver_);
+        // The setup file only holds the double precision factorization.
+        if (single_precision_)
+            solver_matrix_single_precision_ = roundSolverMatrix(buildSolverMatrix());
+    }
+    else {
+        solver_matrix_ = buildSolverMatrix();
+        if (single_precision_)
+            solver_matrix_single_precision_ = roundSolverMatrix(solver_matrix_);
+        initializeMumpsSolver(mumps_solver_, solver_matrix_);
+    }
+    if (single_precision_)
+        initializeMumpsSolver(mumps_solver_single_precision_, solver_matrix_single_precision_);
 }
 
 void DirectSolverTake::solveInPlace(Vector<double> solution)
@@ -24,9 +37,65 @@ void DirectSolverTake::solveInPlace(Vector<double> solution)
     solveWithMumps(solution);
 }
 
+void DirectSolverTake::solveInPlaceBatch(Vector<double> solution, const int number_of_columns)
+{
+    const std::size_t n = grid_.numberOfNodes();
+    for (int column = 0; column < number_of_columns; column++) {
+        applySymmetryShift(batchColumn(solution, column, n));
+    }
+    solveWithMumps(solution, number_of_columns);
+}
+
+void DirectSolverTake::solveInPlaceSinglePrecision(Vector<float> solution)
+{
+    if (!single_precision_) {
+        DirectSolver::solveInPlaceSinglePrecision(solution);
+        return;
+    }
+    applySymmetryShift(solution);
+    solveWithMumps(solution);
+}
+
+void DirectSolverTake::refactorize()
+{
+    solver_matrix_ = buildSolverMatrix();
+    if (single_precision_) {
+        solver_matrix_single_precision_ = roundSolverMatrix(solver_matrix_);
+        refactorizeMumpsSolver(mumps_solver_single_precision_, solver_matrix_single_precision_);
+    }
+    refactorizeMumpsSolver(mumps_solver_, solver_matrix_);
+}
+
+SparseMatrixCOO<float> DirectSolverTake::roundSolverMatrix(const SparseMatrixCOO<double>& solver_matrix)
+{
+    SparseMatrixCOO<float> rounded(solver_matrix.rows(), solver_matrix.columns(), solver_matrix.non_zero_size());
+    rounded.is_symmetric(solver_matrix.is_symmetric());
+    for (int i = 0; i < solver_matrix.non_zero_size(); i++) {
+        rounded.row_index(i) = solver_matrix.row_index(i);
+        rounded.col_index(i) = solver_matrix.col_index(i);
+        rounded.value(i)     = static_cast<float>(solver_matrix.value(i));
+    }
+    return rounded;
+}
+
+std::size_t DirectSolverTake::memoryUsage() const
+{
+    std::size_t bytes = solver_matrix_.memoryUsage() + mumpsMemoryUsage(mumps_solver_);
+    if (single_precision_)
+        bytes += solver_matrix_single_precision_.memoryUsage() + mumpsMemoryUsage(mumps_solver_single_precision_);
+    return bytes;
+}
+
+void DirectSolverTake::saveSetup(SetupWriter& writer)
+{
+    saveMumpsSolver(writer, mumps_solver_);
+}
+
 DirectSolverTake::~DirectSolverTake()
 {
     finalizeMumpsSolver(mumps_solver_);
+    if (single_precision_)
+        finalizeMumpsSolver(mumps_solver_single_precision_);
 }
 
 #endif
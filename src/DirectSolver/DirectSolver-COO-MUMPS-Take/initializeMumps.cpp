@@ -2,7 +2,20 @@
 
 #ifdef GMGPOLAR_USE_MUMPS
 
-void DirectSolverTake::initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix)
+namespace
+{
+// The double and single precision MUMPS instances share their settings, only the entry point differs.
+void callMumps(DMUMPS_STRUC_C& mumps_solver)
+{
+    dmumps_c(&mumps_solver);
+}
+void callMumps(SMUMPS_STRUC_C& mumps_solver)
+{
+    smumps_c(&mumps_solver);
+}
+
+template <typename MumpsStruct, typename T>
+void initializeMumps(MumpsStruct& mumps_solver, SparseMatrixCOO<T>& solver_matrix)
 {
     /* 
      * MUMPS (a parallel direct solver) uses 1-based indexing, 
@@ -20,7 +33,7 @@ void DirectSolverTake::initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, Spars
     /* Therefore we use SYM_POSITIVE_DEFINITE instead of SYM_GENERAL_SYMMETRIC. */
     mumps_solver.sym          = (solver_matrix.is_symmetric() ? SYM_POSITIVE_DEFINITE : SYM_UNSYMMETRIC);
     mumps_solver.comm_fortran = USE_COMM_WORLD;
-    dmumps_c(&mumps_solver);
+    callMumps(mumps_solver);
 
     mumps_solver.ICNTL(1) = 0; // Output stream for error messages.
     mumps_solver.ICNTL(2) = 0; // Output stream for diagnostic printing and statistics local to each MPI process.
@@ -93,7 +106,32 @@ void DirectSolverTake::initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, Spars
     mumps_solver.irn = solver_matrix.row_indices_data();
     mumps_solver.jcn = solver_matrix.column_indices_data();
     mumps_solver.a   = solver_matrix.values_data();
-    dmumps_c(&mumps_solver);
+    callMumps(mumps_solver);
+
+    if (mumps_solver.sym == SYM_POSITIVE_DEFINITE && mumps_solver.INFOG(12) != 0) {
+        std::cout
+            << "Warning: DirectSolver matrix is not positive definite: Negative pivots in the factorization phase."
+            << std::endl;
+    }
+}
+
+template <typename MumpsStruct, typename T>
+void refactorizeMumps(MumpsStruct& mumps_solver, SparseMatrixCOO<T>& solver_matrix)
+{
+    /* The sparsity pattern is unchanged, so the analysis from 'initializeMumpsSolver' is reused */
+    /* and only the numerical factorization is repeated. */
+    for (int i = 0; i < solver_matrix.non_zero_size(); i++) {
+        solver_matrix.row_index(i) += 1;
+        solver_matrix.col_index(i) += 1;
+    }
+
+    mumps_solver.job = JOB_FACTORIZATION_PHASE;
+    assert(mumps_solver.n == solver_matrix.rows());
+    assert(mumps_solver.nz == solver_matrix.non_zero_size());
+    mumps_solver.irn = solver_matrix.row_indices_data();
+    mumps_solver.jcn = solver_matrix.column_indices_data();
+    mumps_solver.a   = solver_matrix.values_data();
+    callMumps(mumps_solver);
 
     if (mumps_solver.sym == SYM_POSITIVE_DEFINITE && mumps_solver.INFOG(12) != 0) {
         std::cout
@@ -101,17 +139,44 @@ void DirectSolverTake::initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, Spars
             << std::endl;
     }
 }
+} // namespace
+
+void DirectSolverTake::initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix)
+{
+    initializeMumps(mumps_solver, solver_matrix);
+}
+
+void DirectSolverTake::initializeMumpsSolver(SMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<float>& solver_matrix)
+{
+    initializeMumps(mumps_solver, solver_matrix);
+}
+
+void DirectSolverTake::refactorizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix)
+{
+    refactorizeMumps(mumps_solver, solver_matrix);
+}
+
+void DirectSolverTake::refactorizeMumpsSolver(SMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<float>& solver_matrix)
+{
+    refactorizeMumps(mumps_solver, solver_matrix);
+}
 
-void DirectSolverTake::solveWithMumps(Vector<double> result_rhs)
+void DirectSolverTake::solveWithMumps(Vector<double> result_rhs, const int number_of_columns)
 {
-    mumps_solver_.job    = JOB_COMPUTE_SOLUTION;
-    mumps_solver_.nrhs   = 1;
-    mumps_solver_.nz_rhs = result_rhs.size();
-    mumps_solver_.rhs    = result_rhs.data();
-    mumps_solver_.lrhs   = result_rhs.size();
-    dmumps_c(&mumps_solver_);
-    if (mumps_solver_.info[0] != 0) {
-        std::cerr << "Error solving the direct system: " << mumps_solver_.info[0] << std::endl;
+    const int n = grid_.numberOfNodes();
+    assert(result_rhs.size() >= static_cast<std::size_t>(number_of_columns) * n);
+    // MUMPS keeps the right-hand side in the shared solver instance, see SolveContext.
+#pragma omp critical(gmgpolar_mumps_solve)
+    {
+        mumps_solver_.job    = JOB_COMPUTE_SOLUTION;
+        mumps_solver_.nrhs   = number_of_columns; // rhs vectors
+        mumps_solver_.nz_rhs = number_of_columns * n; // non-zeros in rhs
+        mumps_solver_.rhs    = result_rhs.data();
+        mumps_solver_.lrhs   = n; // leading dimension
+        dmumps_c(&mumps_solver_);
+        if (mumps_solver_.info[0] != 0) {
+            std::cerr << "Error solving the direct system: " << mumps_solver_.info[0] << std::endl;
+        }
     }
 }
 
@@ -121,4 +186,27 @@ void DirectSolverTake::finalizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver)
     dmumps_c(&mumps_solver);
 }
 
+void DirectSolverTake::solveWithMumps(Vector<float> result_rhs)
+{
+    // MUMPS keeps the right-hand side in the shared solver instance, see SolveContext.
+#pragma omp critical(gmgpolar_mumps_solve)
+    {
+        mumps_solver_single_precision_.job    = JOB_COMPUTE_SOLUTION;
+        mumps_solver_single_precision_.nrhs   = 1;
+        mumps_solver_single_precision_.nz_rhs = result_rhs.size();
+        mumps_solver_single_precision_.rhs    = result_rhs.data();
+        mumps_solver_single_precision_.lrhs   = result_rhs.size();
+        smumps_c(&mumps_solver_single_precision_);
+        if (mumps_solver_single_precision_.info[0] != 0) {
+            std::cerr << "Error solving the direct system: " << mumps_solver_single_precision_.info[0] << std::endl;
+        }
+    }
+}
+
+void DirectSolverTake::finalizeMumpsSolver(SMUMPS_STRUC_C& mumps_solver)
+{
+    mumps_solver.job = JOB_END;
+    smumps_c(&mumps_solver);
+}
+
 #endif
@@ -3,11 +3,17 @@
 DirectSolverGiveCustomLU::DirectSolverGiveCustomLU(const PolarGrid& grid, const LevelCache& level_cache,
                                                    const DomainGeometry& domain_geometry,
                                                    const DensityProfileCoefficients& density_profile_coefficients,
-                                                   bool DirBC_Interior, int num_omp_threads)
+                                                   bool DirBC_Interior, int num_omp_threads,
+                                                   SetupReader* setup_reader)
     : DirectSolver(grid, level_cache, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads)
 {
-    solver_matrix_ = buildSolverMatrix();
-    lu_solver_     = SparseLUSolver<double>(solver_matrix_);
+    if (setup_reader) {
+        lu_solver_.load(*setup_reader);
+    }
+    else {
+        solver_matrix_ = buildSolverMatrix();
+        lu_solver_     = SparseLUSolver<double>(solver_matrix_);
+    }
 }
 
 void DirectSolverGiveCustomLU::solveInPlace(Vector<double> solution)
@@ -15,6 +21,28 @@ void DirectSolverGiveCustomLU::solveInPlace(Vector<double> solution)
     lu_solver_.solveInPlace(solution);
 }
 
+void DirectSolverGiveCustomLU::solveInPlaceBatch(Vector<double> solution, const int number_of_columns)
+{
+    assert(solution.size() >= number_of_columns * grid_.numberOfNodes());
+    lu_solver_.solveInPlace(solution.data(), number_of_columns, grid_.numberOfNodes());
+}
+
+void DirectSolverGiveCustomLU::refactorize()
+{
+    solver_matrix_ = buildSolverMatrix();
+    lu_solver_     = SparseLUSolver<double>(solver_matrix_);
+}
+
+std::size_t DirectSolverGiveCustomLU::memoryUsage() const
+{
+    return solver_matrix_.memoryUsage() + lu_solver_.memoryUsage();
+}
+
+void DirectSolverGiveCustomLU::saveSetup(SetupWriter& writer)
+{
+    lu_solver_.save(writer);
+}
+
 DirectSolverGiveCustomLU::~DirectSolverGiveCustomLU()
 {
 }
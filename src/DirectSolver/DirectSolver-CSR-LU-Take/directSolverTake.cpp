@@ -3,11 +3,20 @@
 DirectSolverTakeCustomLU::DirectSolverTakeCustomLU(const PolarGrid& grid, const LevelCache& level_cache,
                                                    const DomainGeometry& domain_geometry,
                                                    const DensityProfileCoefficients& density_profile_coefficients,
-                                                   bool DirBC_Interior, int num_omp_threads)
+                                                   bool DirBC_Interior, int num_omp_threads, bool single_precision,
+                                                   SetupReader* setup_reader)
     : DirectSolver(grid, level_cache, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads)
+    , single_precision_(single_precision)
 {
-    solver_matrix_ = buildSolverMatrix();
-    lu_solver_     = SparseLUSolver<double>(solver_matrix_);
+    if (setup_reader) {
+        lu_solver_.load(*setup_reader);
+    }
+    else {
+        solver_matrix_ = buildSolverMatrix();
+        lu_solver_     = SparseLUSolver<double>(solver_matrix_);
+    }
+    if (single_precision_)
+        factorizeSinglePrecision();
 }
 
 void DirectSolverTakeCustomLU::solveInPlace(Vector<double> solution)
@@ -15,6 +24,57 @@ void DirectSolverTakeCustomLU::solveInPlace(Vector<double> solution)
     lu_solver_.solveInPlace(solution);
 }
 
+void DirectSolverTakeCustomLU::solveInPlaceBatch(Vector<double> solution, const int number_of_columns)
+{
+    assert(solution.size() >= number_of_columns * grid_.numberOfNodes());
+    lu_solver_.solveInPlace(solution.data(), number_of_columns, grid_.numberOfNodes());
+}
+
+void DirectSolverTakeCustomLU::solveInPlaceSinglePrecision(Vector<float> solution)
+{
+    if (!single_precision_) {
+        DirectSolver::solveInPlaceSinglePrecision(solution);
+        return;
+    }
+    lu_solver_single_precision_.solveInPlace(solution);
+}
+
+void DirectSolverTakeCustomLU::refactorize()
+{
+    solver_matrix_ = buildSolverMatrix();
+    lu_solver_     = SparseLUSolver<double>(solver_matrix_);
+    if (single_precision_)
+        factorizeSinglePrecision();
+}
+
+// Factorizes the matrix rounded to single precision. The matrix is rebuilt if the
+// double precision factors were restored from a setup file, which doesn't store it.
+void DirectSolverTakeCustomLU::factorizeSinglePrecision()
+{
+    if (solver_matrix_.rows() == 0)
+        solver_matrix_ = buildSolverMatrix();
+
+    const int rows = solver_matrix_.rows();
+    const int nnz  = solver_matrix_.non_zero_size();
+    const std::vector<float> values(solver_matrix_.values_data(), solver_matrix_.values_data() + nnz);
+    const std::vector<int> column_indices(solver_matrix_.column_indices_data(),
+                                          solver_matrix_.column_indices_data() + nnz);
+    const std::vector<int> row_start_indices(solver_matrix_.row_start_indices_data(),
+                                             solver_matrix_.row_start_indices_data() + rows + 1);
+    lu_solver_single_precision_ = SparseLUSolver<float>(
+        SparseMatrixCSR<float>(rows, solver_matrix_.columns(), values, column_indices, row_start_indices));
+}
+
+std::size_t DirectSolverTakeCustomLU::memoryUsage() const
+{
+    return solver_matrix_.memoryUsage() + lu_solver_.memoryUsage() + lu_solver_single_precision_.memoryUsage();
+}
+
+void DirectSolverTakeCustomLU::saveSetup(SetupWriter& writer)
+{
+    lu_solver_.save(writer);
+}
+
 DirectSolverTakeCustomLU::~DirectSolverTakeCustomLU()
 {
 }
@@ -10,4 +10,23 @@ DirectSolver::DirectSolver(const PolarGrid& grid, const LevelCache& level_cache,
     , DirBC_Interior_(DirBC_Interior)
     , num_omp_threads_(num_omp_threads)
 {
-}
\ No newline at end of file
+}
+void DirectSolver::solveInPlaceBatch(Vector<double> solution, const int number_of_columns)
+{
+    const std::size_t n = grid_.numberOfNodes();
+    for (int column = 0; column < number_of_columns; column++) {
+        solveInPlace(batchColumn(solution, column, n));
+    }
+}
+
+void DirectSolver::solveInPlaceSinglePrecision(Vector<float> solution)
+{
+    Vector<double> solution_double("solution_double", solution.size());
+    for (std::size_t index = 0; index < solution.size(); index++) {
+        solution_double[index] = solution[index];
+    }
+    solveInPlace(solution_double);
+    for (std::size_t index = 0; index < solution.size(); index++) {
+        solution[index] = solution_double[index];
+    }
+}
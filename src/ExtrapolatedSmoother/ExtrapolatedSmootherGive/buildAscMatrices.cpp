@@ -1228,15 +1228,15 @@
 
 void ExtrapolatedSmootherGive::buildAscCircleSection(const int i_r)
 {
-    const double r = grid_.radius(i_r);
+    const double r            = grid_.radius(i_r);
+    const LevelCacheLine line = LevelCacheLine::circle(level_cache_, grid_, i_r);
     for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta++) {
         const int global_index = grid_.index(i_r, i_theta);
         const double theta     = grid_.theta(i_theta);
 
         double sin_theta, cos_theta;
         double coeff_beta, arr, att, art, detDF;
-        level_cache_.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art,
-                                  detDF);
+        line.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
 
         // Build Asc at the current node
         NODE_BUILD_SMOOTHER_GIVE(i_r, i_theta, grid_, DirBC_Interior_, inner_boundary_circle_matrix_,
@@ -1247,15 +1247,15 @@ void ExtrapolatedSmootherGive::buildAscCircleSection(const int i_r)
 
 void ExtrapolatedSmootherGive::buildAscRadialSection(const int i_theta)
 {
-    const double theta = grid_.theta(i_theta);
+    const double theta        = grid_.theta(i_theta);
+    const LevelCacheLine line = LevelCacheLine::radialLine(level_cache_, grid_, i_theta, grid_.numberSmootherCircles());
     for (int i_r = grid_.numberSmootherCircles(); i_r < grid_.nr(); i_r++) {
         const int global_index = grid_.index(i_r, i_theta);
         const double r         = grid_.radius(i_r);
 
         double sin_theta, cos_theta;
         double coeff_beta, arr, att, art, detDF;
-        level_cache_.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art,
-                                  detDF);
+        line.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
 
         // Build Asc at the current node
         NODE_BUILD_SMOOTHER_GIVE(i_r, i_theta, grid_, DirBC_Interior_, inner_boundary_circle_matrix_,
@@ -820,43 +820,16 @@ void ExtrapolatedSmootherGive::applyAscOrthoCircleSection(const int i_r, const S
 {
     assert(i_r >= 0 && i_r < grid_.numberSmootherCircles() + 1);
 
-    const auto& sin_theta_cache = level_cache_.sin_theta();
-    const auto& cos_theta_cache = level_cache_.cos_theta();
-
     const double r = grid_.radius(i_r);
 
+    const LevelCacheLine line = LevelCacheLine::circle(level_cache_, grid_, i_r);
     for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta++) {
         const double theta = grid_.theta(i_theta);
         const int index    = grid_.index(i_r, i_theta);
 
-        const double sin_theta = sin_theta_cache[i_theta];
-        const double cos_theta = cos_theta_cache[i_theta];
-
-        double coeff_beta;
-        if (level_cache_.cacheDensityProfileCoefficients())
-            coeff_beta = level_cache_.coeff_beta()[index];
-        else
-            coeff_beta = density_profile_coefficients_.beta(r, theta);
-
-        double coeff_alpha;
-        if (!level_cache_.cacheDomainGeometry()) {
-            if (level_cache_.cacheDensityProfileCoefficients())
-                coeff_alpha = level_cache_.coeff_alpha()[index];
-            else
-                coeff_alpha = density_profile_coefficients_.alpha(r, theta);
-        }
-
-        double arr, att, art, detDF;
-        if (level_cache_.cacheDomainGeometry()) {
-            arr   = level_cache_.arr()[index];
-            att   = level_cache_.att()[index];
-            art   = level_cache_.art()[index];
-            detDF = level_cache_.detDF()[index];
-        }
-        else {
-            compute_jacobian_elements(domain_geometry_, r, theta, sin_theta, cos_theta, coeff_alpha, arr, att, art,
-                                      detDF);
-        }
+        double sin_theta, cos_theta;
+        double coeff_beta, arr, att, art, detDF;
+        line.obtainValues(i_r, i_theta, index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
 
         // Apply Asc Ortho at the current node
         NODE_APPLY_ASC_ORTHO_CIRCLE_GIVE(i_r, i_theta, r, theta, sin_theta, cos_theta, grid_, DirBC_Interior_,
@@ -868,43 +841,18 @@ void ExtrapolatedSmootherGive::applyAscOrthoRadialSection(const int i_theta, con
                                                           ConstVector<double> x, ConstVector<double> rhs,
                                                           Vector<double> temp)
 {
-    const auto& sin_theta_cache = level_cache_.sin_theta();
-    const auto& cos_theta_cache = level_cache_.cos_theta();
-
-    const double theta     = grid_.theta(i_theta);
-    const double sin_theta = sin_theta_cache[i_theta];
-    const double cos_theta = cos_theta_cache[i_theta];
+    const double theta = grid_.theta(i_theta);
 
     /* !!! i_r = grid_.numberSmootherCircles()-1 !!! */
+    const LevelCacheLine line =
+        LevelCacheLine::radialLine(level_cache_, grid_, i_theta, grid_.numberSmootherCircles() - 1);
     for (int i_r = grid_.numberSmootherCircles() - 1; i_r < grid_.nr(); i_r++) {
         const double r  = grid_.radius(i_r);
         const int index = grid_.index(i_r, i_theta);
 
-        double coeff_beta;
-        if (level_cache_.cacheDensityProfileCoefficients())
-            coeff_beta = level_cache_.coeff_beta()[index];
-        else
-            coeff_beta = density_profile_coefficients_.beta(r, theta);
-
-        double coeff_alpha;
-        if (!level_cache_.cacheDomainGeometry()) {
-            if (level_cache_.cacheDensityProfileCoefficients())
-                coeff_alpha = level_cache_.coeff_alpha()[index];
-            else
-                coeff_alpha = density_profile_coefficients_.alpha(r, theta);
-        }
-
-        double arr, att, art, detDF;
-        if (level_cache_.cacheDomainGeometry()) {
-            arr   = level_cache_.arr()[index];
-            att   = level_cache_.att()[index];
-            art   = level_cache_.art()[index];
-            detDF = level_cache_.detDF()[index];
-        }
-        else {
-            compute_jacobian_elements(domain_geometry_, r, theta, sin_theta, cos_theta, coeff_alpha, arr, att, art,
-                                      detDF);
-        }
+        double sin_theta, cos_theta;
+        double coeff_beta, arr, att, art, detDF;
+        line.obtainValues(i_r, i_theta, index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
 
         // Apply Asc Ortho at the current node
         NODE_APPLY_ASC_ORTHO_RADIAL_GIVE(i_r, i_theta, r, theta, sin_theta, cos_theta, grid_, DirBC_Interior_,
@@ -919,14 +867,18 @@ void ExtrapolatedSmootherGive::solveCircleSection(const int i_r, Vector<double>
     const int end   = start + grid_.ntheta();
     if (i_r == 0) {
 #ifdef GMGPOLAR_USE_MUMPS
-        inner_boundary_mumps_solver_.job    = JOB_COMPUTE_SOLUTION;
-        inner_boundary_mumps_solver_.nrhs   = 1; // single rhs vector
-        inner_boundary_mumps_solver_.nz_rhs = grid_.ntheta(); // non-zeros in rhs
-        inner_boundary_mumps_solver_.rhs    = temp.data() + start;
-        inner_boundary_mumps_solver_.lrhs   = grid_.ntheta(); // leading dimension of rhs
-        dmumps_c(&inner_boundary_mumps_solver_);
-        if (inner_boundary_mumps_solver_.info[0] != 0) {
-            std::cerr << "Error solving the system: " << inner_boundary_mumps_solver_.info[0] << std::endl;
+        // MUMPS keeps the right-hand side in the shared solver instance, see SolveContext.
+#pragma omp critical(gmgpolar_mumps_solve)
+        {
+            inner_boundary_mumps_solver_.job    = JOB_COMPUTE_SOLUTION;
+            inner_boundary_mumps_solver_.nrhs   = 1; // single rhs vector
+            inner_boundary_mumps_solver_.nz_rhs = grid_.ntheta(); // non-zeros in rhs
+            inner_boundary_mumps_solver_.rhs    = temp.data() + start;
+            inner_boundary_mumps_solver_.lrhs   = grid_.ntheta(); // leading dimension of rhs
+            dmumps_c(&inner_boundary_mumps_solver_);
+            if (inner_boundary_mumps_solver_.info[0] != 0) {
+                std::cerr << "Error solving the system: " << inner_boundary_mumps_solver_.info[0] << std::endl;
+            }
         }
 #else
         inner_boundary_lu_solver_.solveInPlace(temp.data());
@@ -3,16 +3,114 @@
 ExtrapolatedSmootherTake::ExtrapolatedSmootherTake(const PolarGrid& grid, const LevelCache& level_cache,
                                                    const DomainGeometry& domain_geometry,
                                                    const DensityProfileCoefficients& density_profile_coefficients,
-                                                   const bool DirBC_Interior, const int num_omp_threads)
+                                                   const bool DirBC_Interior, const int num_omp_threads,
+                                                   SetupReader* setup_reader)
     : ExtrapolatedSmoother(grid, level_cache, domain_geometry, density_profile_coefficients, DirBC_Interior,
                            num_omp_threads)
+{
+    if (setup_reader) {
+        loadSetup(*setup_reader);
+    }
+    else {
+        buildAscMatrices();
+#ifdef GMGPOLAR_USE_MUMPS
+        initializeMumpsSolver(inner_boundary_mumps_solver_, inner_boundary_circle_matrix_);
+#else
+        inner_boundary_lu_solver_ = SparseLUSolver<double>(inner_boundary_circle_matrix_);
+#endif
+    }
+    factorizeTridiagonalSolvers();
+}
+
+void ExtrapolatedSmootherTake::refactorize()
 {
     buildAscMatrices();
 #ifdef GMGPOLAR_USE_MUMPS
-    initializeMumpsSolver(inner_boundary_mumps_solver_, inner_boundary_circle_matrix_);
+    refactorizeMumpsSolver(inner_boundary_mumps_solver_, inner_boundary_circle_matrix_);
 #else
     inner_boundary_lu_solver_ = SparseLUSolver<double>(inner_boundary_circle_matrix_);
 #endif
+    factorizeTridiagonalSolvers();
+}
+
+std::size_t ExtrapolatedSmootherTake::memoryUsage() const
+{
+    std::size_t bytes = inner_boundary_circle_matrix_.memoryUsage();
+#ifdef GMGPOLAR_USE_MUMPS
+    bytes += mumpsMemoryUsage(inner_boundary_mumps_solver_);
+#else
+    bytes += inner_boundary_lu_solver_.memoryUsage();
+#endif
+    for (const auto& solver : circle_diagonal_solver_)
+        bytes += solver.memoryUsage();
+    for (const auto& solver : radial_diagonal_solver_)
+        bytes += solver.memoryUsage();
+    for (const auto& solver : circle_tridiagonal_solver_)
+        bytes += solver.memoryUsage();
+    for (const auto& solver : radial_tridiagonal_solver_)
+        bytes += solver.memoryUsage();
+    return bytes;
+}
+
+// Factorizing ahead of the first smoothing keeps the smoother read-only during the solve,
+// so that several SolveContexts can share it.
+void ExtrapolatedSmootherTake::factorizeTridiagonalSolvers()
+{
+#pragma omp parallel num_threads(num_omp_threads_)
+    {
+#pragma omp for nowait
+        for (std::size_t i = 0; i < circle_tridiagonal_solver_.size(); i++) {
+            circle_tridiagonal_solver_[i].factorize();
+        }
+#pragma omp for nowait
+        for (std::size_t i = 0; i < radial_tridiagonal_solver_.size(); i++) {
+            radial_tridiagonal_solver_[i].factorize();
+        }
+    }
+}
+
+void ExtrapolatedSmootherTake::saveSetup(SetupWriter& writer)
+{
+    writer.writeTag("EXTRSMTH");
+#ifdef GMGPOLAR_USE_MUMPS
+    saveMumpsSolver(writer, inner_boundary_mumps_solver_);
+#else
+    inner_boundary_lu_solver_.save(writer);
+#endif
+    writer.writeValue(circle_diagonal_solver_.size());
+    for (const auto& solver : circle_diagonal_solver_)
+        solver.save(writer);
+    writer.writeValue(radial_diagonal_solver_.size());
+    for (const auto& solver : radial_diagonal_solver_)
+        solver.save(writer);
+    writer.writeValue(circle_tridiagonal_solver_.size());
+    for (const auto& solver : circle_tridiagonal_solver_)
+        solver.save(writer);
+    writer.writeValue(radial_tridiagonal_solver_.size());
+    for (const auto& solver : radial_tridiagonal_solver_)
+        solver.save(writer);
+}
+
+void ExtrapolatedSmootherTake::loadSetup(SetupReader& reader)
+{
+    reader.readTag("EXTRSMTH");
+#ifdef GMGPOLAR_USE_MUMPS
+    restoreMumpsSolver(reader, inner_boundary_mumps_solver_);
+#else
+    inner_boundary_lu_solver_.load(reader);
+#endif
+    circle_diagonal_solver_.resize(reader.readValue<std::size_t>());
+    for (auto& solver : circle_diagonal_solver_)
+        solver.load(reader);
+    radial_diagonal_solver_.resize(reader.readValue<std::size_t>());
+    for (auto& solver : radial_diagonal_solver_)
+        solver.load(reader);
+    circle_tridiagonal_solver_.resize(reader.readValue<std::size_t>());
+    for (auto& solver : circle_tridiagonal_solver_)
+        solver.load(reader);
+    radial_tridiagonal_solver_.resize(reader.readValue<std::size_t>());
+    for (auto& solver : radial_tridiagonal_solver_)
+        solver.load(reader);
 }
 
 ExtrapolatedSmootherTake::~ExtrapolatedSmootherTake()
@@ -498,14 +498,18 @@ void ExtrapolatedSmootherTake::solveCircleSection(const int i_r, Vector<double>
     const int end   = start + grid_.ntheta();
     if (i_r == 0) {
 #ifdef GMGPOLAR_USE_MUMPS
-        inner_boundary_mumps_solver_.job    = JOB_COMPUTE_SOLUTION;
-        inner_boundary_mumps_solver_.nrhs   = 1; // single rhs vector
-        inner_boundary_mumps_solver_.nz_rhs = grid_.ntheta(); // non-zeros in rhs
-        inner_boundary_mumps_solver_.rhs    = temp.data() + start;
-        inner_boundary_mumps_solver_.lrhs   = grid_.ntheta(); // leading dimension of rhs
-        dmumps_c(&inner_boundary_mumps_solver_);
-        if (inner_boundary_mumps_solver_.info[0] != 0) {
-            std::cerr << "Error solving the system: " << inner_boundary_mumps_solver_.info[0] << std::endl;
+        // MUMPS keeps the right-hand side in the shared solver instance, see SolveContext.
+#pragma omp critical(gmgpolar_mumps_solve)
+        {
+            inner_boundary_mumps_solver_.job    = JOB_COMPUTE_SOLUTION;
+            inner_boundary_mumps_solver_.nrhs   = 1; // single rhs vector
+            inner_boundary_mumps_solver_.nz_rhs = grid_.ntheta(); // non-zeros in rhs
+            inner_boundary_mumps_solver_.rhs    = temp.data() + start;
+            inner_boundary_mumps_solver_.lrhs   = grid_.ntheta(); // leading dimension of rhs
+            dmumps_c(&inner_boundary_mumps_solver_);
+            if (inner_boundary_mumps_solver_.info[0] != 0) {
+                std::cerr << "Error solving the system: " << inner_boundary_mumps_solver_.info[0] << std::endl;
+            }
         }
 #else
         inner_boundary_lu_solver_.solveInPlace(temp.data() + start);
@@ -0,0 +1,115 @@
+#include "../../../include/GMGPolar/gmgpolar.h"
+
+/* multigrid_V_Cycle, multigrid_W_Cycle or multigrid_F_Cycle for the first number_of_columns columns of a batch, */
+/* see GMGPolar::solve for a batch of right-hand sides. Smoothing, the residual, the grid transfers and the */
+/* coarse solve run on all columns at once. solution, rhs and residual are the batch vectors of the level. */
+void GMGPolar::batchedMultigridCycle(const int level_depth, const MultigridCycleType cycle, Vector<double> solution,
+                                     Vector<double> rhs, Vector<double> residual, const int number_of_columns)
+{
+    assert(0 <= level_depth && level_depth < number_of_levels_ - 1);
+
+    std::chrono::high_resolution_clock::time_point start_MGC;
+    if (level_depth == 0) {
+        start_MGC = std::chrono::high_resolution_clock::now();
+    }
+
+    Level& level      = levels_[level_depth];
+    Level& next_level = levels_[level_depth + 1];
+
+    const std::size_t next_n = next_level.grid().numberOfNodes();
+
+    auto start_MGC_preSmoothing = std::chrono::high_resolution_clock::now();
+
+    /* ------------ */
+    /* Presmoothing */
+    for (int i = 0; i < pre_smoothing_steps_; i++) {
+        level.smoothingBatch(solution, rhs, residual, number_of_columns);
+    }
+
+    auto end_MGC_preSmoothing = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_preSmoothing_ += std::chrono::duration<double>(end_MGC_preSmoothing - start_MGC_preSmoothing).count();
+
+    /* ---------------------- */
+    /* Coarse grid correction */
+    /* ---------------------- */
+
+    auto start_MGC_residual = std::chrono::high_resolution_clock::now();
+
+    /* Compute the residual and restrict it. */
+    /* The direct solver solves in place of the restricted residual, the recursive cycle uses it as its rhs. */
+    const bool coarsest                = level_depth + 1 == number_of_levels_ - 1;
+    Vector<double> restricted_residual = coarsest ? next_level.batchSolution() : next_level.batchRhs();
+    level.computeResidualBatch(residual, rhs, solution, number_of_columns);
+    restrictionBatch(level_depth, restricted_residual, residual, number_of_columns);
+
+    auto end_MGC_residual = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_residual_ += std::chrono::duration<double>(end_MGC_residual - start_MGC_residual).count();
+
+    /* -------------------------- */
+    /* Solve A * error = residual */
+    if (coarsest) {
+        /* --------------------- */
+        /* Using a direct solver */
+        /* --------------------- */
+
+        /* Step 1: Solve for the error in place */
+        auto start_MGC_directSolver = std::chrono::high_resolution_clock::now();
+
+        next_level.directSolveInPlaceBatch(next_level.batchSolution(), number_of_columns);
+
+        auto end_MGC_directSolver = std::chrono::high_resolution_clock::now();
+        t_avg_MGC_directSolver_ += std::chrono::duration<double>(end_MGC_directSolver - start_MGC_directSolver).count();
+    }
+    else {
+        /* ------------------------------------------ */
+        /* By recursively calling the multigrid cycle */
+        /* ------------------------------------------ */
+
+        /* Step 1: Set starting error to zero. */
+        Vector<double> error =
+            Kokkos::subview(next_level.batchSolution(), Kokkos::make_pair(std::size_t{0}, number_of_columns * next_n));
+        assign(error, 0.0);
+
+        /* Step 2: Solve for the error by recursively calling the multigrid cycle. */
+        Vector<double> next_solution = next_level.batchSolution();
+        Vector<double> next_rhs      = next_level.batchRhs();
+        Vector<double> next_residual = next_level.batchResidual();
+        switch (cycle) {
+        case MultigridCycleType::V_CYCLE:
+            batchedMultigridCycle(level_depth + 1, MultigridCycleType::V_CYCLE, next_solution, next_rhs, next_residual,
+                                  number_of_columns);
+            break;
+        case MultigridCycleType::W_CYCLE:
+            batchedMultigridCycle(level_depth + 1, MultigridCycleType::W_CYCLE, next_solution, next_rhs, next_residual,
+                                  number_of_columns);
+            batchedMultigridCycle(level_depth + 1, MultigridCycleType::W_CYCLE, next_solution, next_rhs, next_residual,
+                                  number_of_columns);
+            break;
+        case MultigridCycleType::F_CYCLE:
+            batchedMultigridCycle(level_depth + 1, MultigridCycleType::F_CYCLE, next_solution, next_rhs, next_residual,
+                                  number_of_columns);
+            batchedMultigridCycle(level_depth + 1, MultigridCycleType::V_CYCLE, next_solution, next_rhs, next_residual,
+                                  number_of_columns);
+            break;
+        }
+    }
+
+    /* Interpolate the correction and compute the corrected approximation: u = u + P * error */
+    prolongationAddBatch(level_depth + 1, solution, next_level.batchSolution(), number_of_columns);
+
+    auto start_MGC_postSmoothing = std::chrono::high_resolution_clock::now();
+
+    /* ------------- */
+    /* Postsmoothing */
+    for (int i = 0; i < post_smoothing_steps_; i++) {
+        level.smoothingBatch(solution, rhs, residual, number_of_columns);
+    }
+
+    auto end_MGC_postSmoothing = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_postSmoothing_ += std::chrono::duration<double>(end_MGC_postSmoothing - start_MGC_postSmoothing).count();
+
+    if (level_depth == 0) {
+        auto end_MGC = std::chrono::high_resolution_clock::now();
+        t_avg_MGC_total_ += std::chrono::duration<double>(end_MGC - start_MGC).count();
+    }
+}
@@ -44,8 +44,8 @@ void GMGPolar::implicitlyExtrapolatedMultigrid_F_Cycle(const int level_depth, Ve
         auto start_MGC_residual = std::chrono::high_resolution_clock::now();
 
         // P_ex^T (f_l - A_l*u_l)
-        level.computeResidual(residual, rhs, solution);
-        extrapolatedRestriction(level_depth, next_level.residual(), residual);
+        extrapolatedRestrictedResidual(level_depth, next_level.residual(), rhs, solution, residual,
+                                       level_depth == 0 && record_cycle_residual_norm_);
 
         // f_{l-1} - A_{l-1}* Inject(u_l)
         injection(level_depth, next_level.solution(), solution);
@@ -55,6 +55,12 @@ void GMGPolar::implicitlyExtrapolatedMultigrid_F_Cycle(const int level_depth, Ve
         linear_combination(next_level.residual(), 4.0 / 3.0, ConstVector<double>(next_level.error_correction()),
                            -1.0 / 3.0);
 
+        // The restricted residual is complete, so the extrapolated fine residual may overwrite 'residual'.
+        if (level_depth == 0 && record_cycle_residual_norm_) {
+            extrapolatedResidual(level_depth, residual, next_level.error_correction());
+            cycle_residual_norm_ = residualNorm(residual_norm_type_, level, residual);
+        }
+
         auto end_MGC_residual = std::chrono::high_resolution_clock::now();
         t_avg_MGC_residual_ += std::chrono::duration<double>(end_MGC_residual - start_MGC_residual).count();
 
@@ -75,8 +81,8 @@ void GMGPolar::implicitlyExtrapolatedMultigrid_F_Cycle(const int level_depth, Ve
         auto start_MGC_residual = std::chrono::high_resolution_clock::now();
 
         // P_ex^T (f_l - A_l*u_l)
-        level.computeResidual(residual, rhs, solution);
-        extrapolatedRestriction(level_depth, next_level.error_correction(), residual);
+        extrapolatedRestrictedResidual(level_depth, next_level.error_correction(), rhs, solution, residual,
+                                       level_depth == 0 && record_cycle_residual_norm_);
 
         // f_{l-1} - A_{l-1}* Inject(u_l)
         injection(level_depth, next_level.solution(), solution);
@@ -86,6 +92,12 @@ void GMGPolar::implicitlyExtrapolatedMultigrid_F_Cycle(const int level_depth, Ve
         linear_combination(next_level.error_correction(), 4.0 / 3.0, ConstVector<double>(next_level.residual()),
                            -1.0 / 3.0);
 
+        // The restricted residual is complete, so the extrapolated fine residual may overwrite 'residual'.
+        if (level_depth == 0 && record_cycle_residual_norm_) {
+            extrapolatedResidual(level_depth, residual, next_level.residual());
+            cycle_residual_norm_ = residualNorm(residual_norm_type_, level, residual);
+        }
+
         auto end_MGC_residual = std::chrono::high_resolution_clock::now();
         t_avg_MGC_residual_ += std::chrono::duration<double>(end_MGC_residual - start_MGC_residual).count();
 
@@ -97,11 +109,8 @@ void GMGPolar::implicitlyExtrapolatedMultigrid_F_Cycle(const int level_depth, Ve
         multigrid_V_Cycle(level_depth + 1, next_level.residual(), next_level.error_correction(), next_level.solution());
     }
 
-    /* Interpolate the correction */
-    extrapolatedProlongation(level_depth + 1, residual, next_level.residual());
-
-    /* Compute the corrected approximation: u = u + error */
-    add(solution, ConstVector<double>(residual));
+    /* Interpolate the correction and compute the corrected approximation: u = u + P * error */
+    extrapolatedProlongationAdd(level_depth + 1, solution, next_level.residual());
 
     auto start_MGC_postSmoothing = std::chrono::high_resolution_clock::now();
 
@@ -0,0 +1,164 @@
+#include "../../../include/GMGPolar/gmgpolar.h"
+
+/* The coarse grid correction of the mixed precision cycle, see GMGPolar::mixedPrecision(). */
+/* The finest level smooths, computes its residual and adds the correction in double precision. */
+/* All coarser levels solve for the error with the single precision vectors of the levels: */
+/* singlePrecisionRhs() holds the rhs, singlePrecisionResidual() the error and singlePrecisionSolution() */
+/* serves as temporary storage, in the same roles as error_correction(), residual() and solution() */
+/* in the double precision cycles. */
+
+void GMGPolar::mixedPrecisionMultigridCycle(const MultigridCycleType cycle, Vector<double> solution,
+                                            Vector<double> rhs, Vector<double> residual)
+{
+    assert(usesSinglePrecisionCycle() && number_of_levels_ > 1);
+
+    auto start_MGC = std::chrono::high_resolution_clock::now();
+
+    Level& level      = levels_[0];
+    Level& next_level = levels_[1];
+
+    auto start_MGC_preSmoothing = std::chrono::high_resolution_clock::now();
+
+    /* ------------ */
+    /* Presmoothing */
+    for (int i = 0; i < pre_smoothing_steps_; i++) {
+        level.smoothing(solution, rhs, residual);
+    }
+
+    auto end_MGC_preSmoothing = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_preSmoothing_ += std::chrono::duration<double>(end_MGC_preSmoothing - start_MGC_preSmoothing).count();
+
+    /* ---------------------- */
+    /* Coarse grid correction */
+    /* ---------------------- */
+
+    auto start_MGC_residual = std::chrono::high_resolution_clock::now();
+
+    /* Compute the residual in double precision and round its restriction. */
+    const bool store_residual = record_cycle_residual_norm_;
+    Vector<float> restricted_residual =
+        number_of_levels_ == 2 ? next_level.singlePrecisionResidual() : next_level.singlePrecisionRhs();
+    restrictedResidual(0, restricted_residual, rhs, solution, residual, store_residual);
+    if (store_residual)
+        cycle_residual_norm_ = residualNorm(residual_norm_type_, level, residual);
+
+    auto end_MGC_residual = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_residual_ += std::chrono::duration<double>(end_MGC_residual - start_MGC_residual).count();
+
+    /* Solve A * error = residual in single precision */
+    singlePrecisionCorrection(1, cycle);
+
+    /* Interpolate the correction and compute the corrected approximation: u = u + P * error */
+    prolongationAdd(1, solution, next_level.singlePrecisionResidual());
+
+    auto start_MGC_postSmoothing = std::chrono::high_resolution_clock::now();
+
+    /* ------------- */
+    /* Postsmoothing */
+    for (int i = 0; i < post_smoothing_steps_; i++) {
+        level.smoothing(solution, rhs, residual);
+    }
+
+    auto end_MGC_postSmoothing = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_postSmoothing_ += std::chrono::duration<double>(end_MGC_postSmoothing - start_MGC_postSmoothing).count();
+
+    auto end_MGC = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_total_ += std::chrono::duration<double>(end_MGC - start_MGC).count();
+}
+
+void GMGPolar::singlePrecisionMultigridCycle(const int level_depth, const MultigridCycleType cycle,
+                                             Vector<float> solution, Vector<float> rhs, Vector<float> residual)
+{
+    assert(1 <= level_depth && level_depth < number_of_levels_ - 1);
+
+    Level& level      = levels_[level_depth];
+    Level& next_level = levels_[level_depth + 1];
+
+    auto start_MGC_preSmoothing = std::chrono::high_resolution_clock::now();
+
+    /* ------------ */
+    /* Presmoothing */
+    for (int i = 0; i < pre_smoothing_steps_; i++) {
+        level.smoothingSinglePrecision(solution, rhs, residual);
+    }
+
+    auto end_MGC_preSmoothing = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_preSmoothing_ += std::chrono::duration<double>(end_MGC_preSmoothing - start_MGC_preSmoothing).count();
+
+    /* ---------------------- */
+    /* Coarse grid correction */
+    /* ---------------------- */
+
+    auto start_MGC_residual = std::chrono::high_resolution_clock::now();
+
+    Vector<float> restricted_residual = level_depth + 1 == number_of_levels_ - 1
+                                            ? next_level.singlePrecisionResidual()
+                                            : next_level.singlePrecisionRhs();
+    restrictedResidual(level_depth, restricted_residual, rhs, solution);
+
+    auto end_MGC_residual = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_residual_ += std::chrono::duration<double>(end_MGC_residual - start_MGC_residual).count();
+
+    /* Solve A * error = residual */
+    singlePrecisionCorrection(level_depth + 1, cycle);
+
+    /* Interpolate the correction and compute the corrected approximation: u = u + P * error */
+    prolongationAdd(level_depth + 1, solution, next_level.singlePrecisionResidual());
+
+    auto start_MGC_postSmoothing = std::chrono::high_resolution_clock::now();
+
+    /* ------------- */
+    /* Postsmoothing */
+    for (int i = 0; i < post_smoothing_steps_; i++) {
+        level.smoothingSinglePrecision(solution, rhs, residual);
+    }
+
+    auto end_MGC_postSmoothing = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_postSmoothing_ += std::chrono::duration<double>(end_MGC_postSmoothing - start_MGC_postSmoothing).count();
+}
+
+void GMGPolar::singlePrecisionCorrection(const int level_depth, const MultigridCycleType cycle)
+{
+    assert(1 <= level_depth && level_depth < number_of_levels_);
+    Level& level = levels_[level_depth];
+
+    if (level_depth == number_of_levels_ - 1) {
+        /* --------------------- */
+        /* Using a direct solver */
+        /* --------------------- */
+        auto start_MGC_directSolver = std::chrono::high_resolution_clock::now();
+
+        level.directSolveInPlaceSinglePrecision(level.singlePrecisionResidual());
+
+        auto end_MGC_directSolver = std::chrono::high_resolution_clock::now();
+        t_avg_MGC_directSolver_ += std::chrono::duration<double>(end_MGC_directSolver - start_MGC_directSolver).count();
+        return;
+    }
+
+    /* ------------------------------------------ */
+    /* By recursively calling the multigrid cycle */
+    /* ------------------------------------------ */
+
+    /* Step 1: Set starting error to zero. */
+    assign(level.singlePrecisionResidual(), 0.0f);
+
+    /* Step 2: Solve for the error by recursively calling the multigrid cycle. */
+    Vector<float> error = level.singlePrecisionResidual();
+    Vector<float> rhs   = level.singlePrecisionRhs();
+    Vector<float> temp  = level.singlePrecisionSolution();
+    switch (cycle) {
+    case MultigridCycleType::V_CYCLE:
+        singlePrecisionMultigridCycle(level_depth, MultigridCycleType::V_CYCLE, error, rhs, temp);
+        break;
+    case MultigridCycleType::W_CYCLE:
+        singlePrecisionMultigridCycle(level_depth, MultigridCycleType::W_CYCLE, error, rhs, temp);
+        singlePrecisionMultigridCycle(level_depth, MultigridCycleType::W_CYCLE, error, rhs, temp);
+        break;
+    case MultigridCycleType::F_CYCLE:
+        singlePrecisionMultigridCycle(level_depth, MultigridCycleType::F_CYCLE, error, rhs, temp);
+        singlePrecisionMultigridCycle(level_depth, MultigridCycleType::V_CYCLE, error, rhs, temp);
+        break;
+    default:
+        throw std::invalid_argument("Unknown MultigridCycleType");
+    }
+}
@@ -5,6 +5,11 @@ void GMGPolar::multigrid_F_Cycle(const int level_depth, Vector<double> solution,
 {
     assert(0 <= level_depth && level_depth < number_of_levels_ - 1);
 
+    if (level_depth == 0 && usesSinglePrecisionCycle()) {
+        mixedPrecisionMultigridCycle(MultigridCycleType::F_CYCLE, solution, rhs, residual);
+        return;
+    }
+
     std::chrono::high_resolution_clock::time_point start_MGC;
     if (level_depth == 0) {
         start_MGC = std::chrono::high_resolution_clock::now();
@@ -30,8 +35,14 @@ void GMGPolar::multigrid_F_Cycle(const int level_depth, Vector<double> solution,
 
     auto start_MGC_residual = std::chrono::high_resolution_clock::now();
 
-    /* Compute the residual */
-    level.computeResidual(residual, rhs, solution);
+    /* Compute the residual and restrict it. */
+    /* The direct solver solves in place of the restricted residual, the recursive cycle uses it as its rhs. */
+    const bool store_residual = level_depth == 0 && record_cycle_residual_norm_;
+    Vector<double> restricted_residual =
+        level_depth + 1 == number_of_levels_ - 1 ? next_level.residual() : next_level.error_correction();
+    restrictedResidual(level_depth, restricted_residual, rhs, solution, residual, store_residual);
+    if (store_residual)
+        cycle_residual_norm_ = residualNorm(residual_norm_type_, level, residual);
 
     auto end_MGC_residual = std::chrono::high_resolution_clock::now();
     t_avg_MGC_residual_ += std::chrono::duration<double>(end_MGC_residual - start_MGC_residual).count();
@@ -43,10 +54,7 @@ void GMGPolar::multigrid_F_Cycle(const int level_depth, Vector<double> solution,
         /* Using a direct solver */
         /* --------------------- */
 
-        /* Step 1: Restrict the residual */
-        restriction(level_depth, next_level.residual(), residual);
-
-        /* Step 2: Solve for the error in place */
+        /* Step 1: Solve for the error in place */
         auto start_MGC_directSolver = std::chrono::high_resolution_clock::now();
 
         next_level.directSolveInPlace(next_level.residual());
@@ -59,22 +67,16 @@ void GMGPolar::multigrid_F_Cycle(const int level_depth, Vector<double> solution,
         /* By recursively calling the multigrid cycle */
         /* ------------------------------------------ */
 
-        /* Step 1: Restrict the residual. */
-        restriction(level_depth, next_level.error_correction(), residual);
-
-        /* Step 2: Set starting error to zero. */
+        /* Step 1: Set starting error to zero. */
         assign(next_level.residual(), 0.0);
 
-        /* Step 3: Solve for the error by recursively calling the multigrid cycle. */
+        /* Step 2: Solve for the error by recursively calling the multigrid cycle. */
         multigrid_F_Cycle(level_depth + 1, next_level.residual(), next_level.error_correction(), next_level.solution());
         multigrid_V_Cycle(level_depth + 1, next_level.residual(), next_level.error_correction(), next_level.solution());
     }
 
-    /* Interpolate the correction */
-    prolongation(level_depth + 1, residual, next_level.residual());
-
-    /* Compute the corrected approximation: u = u + error */
-    add(solution, ConstVector<double>(residual));
+    /* Interpolate the correction and compute the corrected approximation: u = u + P * error */
+    prolongationAdd(level_depth + 1, solution, next_level.residual());
 
     auto start_MGC_postSmoothing = std::chrono::high_resolution_clock::now();
 
@@ -0,0 +1,168 @@
+#include "../../include/GMGPolar/gmgpolar.h"
+
+#include <cctype>
+#include <fstream>
+#include <limits>
+#include <map>
+#include <sstream>
+#include <typeinfo>
+
+// =============================================================================
+//   Autotuning of the Threads per Level
+// =============================================================================
+// Every level times its smoothers and its residual for maxOpenMPThreads, maxOpenMPThreads/2, ..., 1 threads
+// and keeps the fastest count. The grid transfers to the level use the same count.
+//
+// The cache file stores one tuned level per line:
+//   <hardware> <maxOpenMPThreads> <domainGeometry> <densityProfileCoefficients> <stencilDistributionMethod>
+//   <cacheDensityProfileCoefficients> <cacheDomainGeometry> <radialProfiles> <singlePrecision> <smoothers>
+//   <nr> <ntheta> <threads>
+// where the geometry and coefficients are identified by their type, the stencil distribution method and the
+// caching are the ones of the level (see levelStencilDistributionMethod), <singlePrecision> is 1 for the levels
+// of the single precision correction and <smoothers> is 1 for the smoother, 2 for the extrapolated smoother
+// and 3 for both.
+// Entries of other machines and settings are kept, so one file can serve several runs.
+
+namespace
+{
+// Processor model and number of processors, without whitespace.
+std::string hardwareIdentifier()
+{
+    std::string model = "unknown";
+    std::ifstream cpuinfo("/proc/cpuinfo");
+    std::string line;
+    while (std::getline(cpuinfo, line)) {
+        if (line.rfind("model name", 0) == 0 && line.find(':') != std::string::npos) {
+            model = line.substr(line.find(':') + 1);
+            break;
+        }
+    }
+
+    std::string identifier;
+    for (char c : model) {
+        if (!std::isspace(static_cast<unsigned char>(c)))
+            identifier += c;
+        else if (!identifier.empty() && identifier.back() != '_')
+            identifier += '_';
+    }
+    if (!identifier.empty() && identifier.back() == '_')
+        identifier.pop_back();
+    return identifier + "_" + std::to_string(omp_get_num_procs()) + "procs";
+}
+
+// Minimum wall time of three calls after a warm-up call.
+template <typename Kernel>
+double minimumTime(Kernel&& kernel)
+{
+    kernel();
+    double minimum_time = std::numeric_limits<double>::max();
+    for (int repetition = 0; repetition < 3; repetition++) {
+        auto start = std::chrono::high_resolution_clock::now();
+        kernel();
+        auto end     = std::chrono::high_resolution_clock::now();
+        minimum_time = std::min(minimum_time, std::chrono::duration<double>(end - start).count());
+    }
+    return minimum_time;
+}
+
+int fastestNumberOfThreads(Level& level, const int max_omp_threads, const bool single_precision)
+{
+    const int n = level.grid().numberOfNodes();
+    Vector<double> x("autotune_x", n);
+    Vector<double> rhs("autotune_rhs", n);
+    Vector<double> temp("autotune_temp", n);
+    assign(x, 1.0);
+    assign(rhs, 1.0);
+
+    // Ties go to the smaller thread count.
+    std::vector<int> candidates;
+    for (int threads = max_omp_threads; threads >= 1; threads /= 2) {
+        candidates.insert(candidates.begin(), threads);
+    }
+
+    int fastest_threads  = 1;
+    double fastest_time = std::numeric_limits<double>::max();
+    for (int threads : candidates) {
+        level.numOmpThreads(threads);
+        double time = minimumTime([&]() { level.computeResidual(temp, rhs, x); });
+        if (level.hasSmoother() && single_precision)
+            time += minimumTime([&]() {
+                level.smoothingSinglePrecision(level.singlePrecisionSolution(), level.singlePrecisionRhs(),
+                                               level.singlePrecisionResidual());
+            });
+        else if (level.hasSmoother())
+            time += minimumTime([&]() { level.smoothing(x, rhs, temp); });
+        if (level.hasExtrapolatedSmoother())
+            time += minimumTime([&]() { level.extrapolatedSmoothing(x, rhs, temp); });
+        if (time < fastest_time) {
+            fastest_time    = time;
+            fastest_threads = threads;
+        }
+    }
+    return fastest_threads;
+}
+} // namespace
+
+void GMGPolar::autotuneThreadsPerLevel()
+{
+    std::map<std::string, int> tuned_threads;
+    if (!thread_tuning_cache_.empty()) {
+        std::ifstream file(thread_tuning_cache_);
+        std::string line;
+        while (std::getline(file, line)) {
+            if (line.empty())
+                continue;
+            const std::size_t separator = line.find_last_of(' ');
+            std::istringstream value(separator != std::string::npos ? line.substr(separator + 1) : "");
+            int threads;
+            if (!(value >> threads) || threads < 1)
+                throw std::runtime_error("Thread tuning cache '" + thread_tuning_cache_ + "' is corrupted.");
+            tuned_threads[line.substr(0, separator)] = threads;
+        }
+    }
+
+    const std::string settings = hardwareIdentifier() + " " + std::to_string(max_omp_threads_) + " " +
+                                 typeid(domain_geometry_).name() + " " +
+                                 typeid(*density_profile_coefficients_).name();
+
+    bool cache_modified = false;
+    for (int level_depth = 0; level_depth < number_of_levels_; level_depth++) {
+        Level& level                = levels_[level_depth];
+        const bool single_precision = usesSinglePrecisionCycle() && level_depth > 0;
+        const std::string key =
+            settings + " " + std::to_string(static_cast<int>(levelStencilDistributionMethod(level_depth))) + " " +
+            std::to_string(cachesDensityProfileCoefficients(level_depth)) + " " +
+            std::to_string(cachesDomainGeometry(level_depth)) + " " + std::to_string(usesRadialProfiles()) + " " +
+            std::to_string(single_precision) + " " +
+            std::to_string(level.hasSmoother() + 2 * level.hasExtrapolatedSmoother()) + " " +
+            std::to_string(level.grid().nr()) + " " + std::to_string(level.grid().ntheta());
+
+        auto cached = tuned_threads.find(key);
+        if (cached != tuned_threads.end()) {
+            threads_per_level_[level_depth] = std::min(cached->second, max_omp_threads_);
+        }
+        else {
+            threads_per_level_[level_depth] = fastestNumberOfThreads(level, max_omp_threads_, single_precision);
+            tuned_threads[key]              = threads_per_level_[level_depth];
+            cache_modified                  = true;
+        }
+        level.numOmpThreads(threads_per_level_[level_depth]);
+    }
+
+    if (cache_modified && !thread_tuning_cache_.empty()) {
+        std::ofstream file(thread_tuning_cache_);
+        for (const auto& [key, threads] : tuned_threads) {
+            file << key << " " << threads << "\n";
+        }
+        if (!file)
+            throw std::runtime_error("Failed to write thread tuning cache '" + thread_tuning_cache_ + "'.");
+    }
+
+    if (verbose_ > 0) {
+        std::cout << "Autotuned threads per level:";
+        for (int threads : threads_per_level_) {
+            std::cout << " " << threads;
+        }
+        std::cout << "\n";
+    }
+}
@@ -1,5 +1,7 @@
 #include "../../include/GMGPolar/gmgpolar.h"
 
+#include <fstream>
+
 /* ---------------------------------------------------------------------- */
 /* Constructor & Initialization                                           */
 /* ---------------------------------------------------------------------- */
@@ -7,19 +9,24 @@ GMGPolar::GMGPolar(const PolarGrid& grid, const DomainGeometry& domain_geometry,
                    const DensityProfileCoefficients& density_profile_coefficients)
     : grid_(grid)
     , domain_geometry_(domain_geometry)
-    , density_profile_coefficients_(density_profile_coefficients)
+    , density_profile_coefficients_(&density_profile_coefficients)
     , exact_solution_(nullptr)
     // General solver output and visualization settings
     , verbose_(0)
     , paraview_(false)
+    , paraview_format_(ParaviewFormat::ASCII)
     // Parallelization and threading settings
     , max_omp_threads_(omp_get_max_threads())
     , thread_reduction_factor_(1.0)
+    , autotune_threads_(false)
+    , thread_tuning_cache_("")
     // Numerical method setup
     , DirBC_Interior_(true)
     , stencil_distribution_method_(StencilDistributionMethod::CPU_GIVE)
     , cache_density_profile_coefficients_(true)
     , cache_domain_geometry_(false)
+    , mixed_precision_(false)
+    , memory_lean_(false)
     // Multigrid settings
     , extrapolation_(ExtrapolationType::IMPLICIT_EXTRAPOLATION)
     , max_levels_(-1)
@@ -30,13 +37,18 @@ GMGPolar::GMGPolar(const PolarGrid& grid, const DomainGeometry& domain_geometry,
     , FMG_(false)
     , FMG_iterations_(3)
     , FMG_cycle_(MultigridCycleType::F_CYCLE)
+    // Outer solver settings
+    , outer_solver_(OuterSolverType::MULTIGRID_ITERATION)
+    , FGMRES_restart_(30)
     // Convergence settings
     , max_iterations_(300)
     , residual_norm_type_(ResidualNormType::WEIGHTED_EUCLIDEAN)
     , absolute_tolerance_(1e-8)
     , relative_tolerance_(1e-8)
+    , fused_convergence_check_(false)
     // Level management and internal solver data
     , number_of_levels_(0)
+    , number_of_rhs_(0)
     , interpolation_(nullptr)
     , full_grid_smoothing_(false)
     , number_of_iterations_(0)
@@ -47,6 +59,74 @@ GMGPolar::GMGPolar(const PolarGrid& grid, const DomainGeometry& domain_geometry,
     LIKWID_REGISTER("Solve");
 }
 
+GMGPolar::GMGPolar(const GMGPolar& setup_solver)
+    : grid_(setup_solver.grid_)
+    , domain_geometry_(setup_solver.domain_geometry_)
+    , density_profile_coefficients_(setup_solver.density_profile_coefficients_)
+    , exact_solution_(nullptr)
+    // General solver output and visualization settings
+    , verbose_(setup_solver.verbose_)
+    , paraview_(setup_solver.paraview_)
+    , paraview_format_(setup_solver.paraview_format_)
+    // Parallelization and threading settings
+    , max_omp_threads_(setup_solver.max_omp_threads_)
+    , thread_reduction_factor_(setup_solver.thread_reduction_factor_)
+    , autotune_threads_(setup_solver.autotune_threads_)
+    , thread_tuning_cache_(setup_solver.thread_tuning_cache_)
+    // Numerical method setup
+    , DirBC_Interior_(setup_solver.DirBC_Interior_)
+    , stencil_distribution_method_(setup_solver.stencil_distribution_method_)
+    , cache_density_profile_coefficients_(setup_solver.cache_density_profile_coefficients_)
+    , cache_domain_geometry_(setup_solver.cache_domain_geometry_)
+    , mixed_precision_(setup_solver.mixed_precision_)
+    , memory_lean_(setup_solver.memory_lean_)
+    // Multigrid settings
+    , extrapolation_(setup_solver.extrapolation_)
+    , max_levels_(setup_solver.max_levels_)
+    , pre_smoothing_steps_(setup_solver.pre_smoothing_steps_)
+    , post_smoothing_steps_(setup_solver.post_smoothing_steps_)
+    , multigrid_cycle_(setup_solver.multigrid_cycle_)
+    // FMG settings
+    , FMG_(setup_solver.FMG_)
+    , FMG_iterations_(setup_solver.FMG_iterations_)
+    , FMG_cycle_(setup_solver.FMG_cycle_)
+    // Outer solver settings
+    , outer_solver_(setup_solver.outer_solver_)
+    , FGMRES_restart_(setup_solver.FGMRES_restart_)
+    // Convergence settings
+    , max_iterations_(setup_solver.max_iterations_)
+    , residual_norm_type_(setup_solver.residual_norm_type_)
+    , absolute_tolerance_(setup_solver.absolute_tolerance_)
+    , relative_tolerance_(setup_solver.relative_tolerance_)
+    , fused_convergence_check_(setup_solver.fused_convergence_check_)
+    // Level management and internal solver data
+    , number_of_levels_(setup_solver.number_of_levels_)
+    , threads_per_level_(setup_solver.threads_per_level_)
+    , number_of_rhs_(0)
+    , interpolation_(nullptr)
+    , full_grid_smoothing_(setup_solver.full_grid_smoothing_)
+    , number_of_iterations_(0)
+    , mean_residual_reduction_factor_(1.0)
+{
+    if (setup_solver.levels_.empty())
+        throw std::runtime_error("Sharing the setup of a solver requires a previous call to setup().");
+
+    resetAllTimings();
+    t_setup_total_        = setup_solver.t_setup_total_;
+    t_setup_createLevels_ = setup_solver.t_setup_createLevels_;
+    t_setup_smoother_     = setup_solver.t_setup_smoother_;
+    t_setup_directSolver_ = setup_solver.t_setup_directSolver_;
+
+    levels_.reserve(number_of_levels_);
+    for (const Level& level : setup_solver.levels_) {
+        if (sharesSolutionStorage(level.level_depth()))
+            levels_.emplace_back(level, &profiler_, sharedSolutionStorage());
+        else
+            levels_.emplace_back(level, &profiler_);
+    }
+    interpolation_ = std::make_unique<Interpolation>(threads_per_level_, DirBC_Interior_);
+}
+
 void GMGPolar::setSolution(const ExactSolution* exact_solution)
 {
     exact_solution_ = exact_solution;
@@ -73,6 +153,15 @@ void GMGPolar::paraview(bool paraview)
     paraview_ = paraview;
 }
 
+ParaviewFormat GMGPolar::paraviewFormat() const
+{
+    return paraview_format_;
+}
+void GMGPolar::paraviewFormat(ParaviewFormat paraview_format)
+{
+    paraview_format_ = paraview_format;
+}
+
 /* ---------------------------------------------------------------------- */
 /* Parallelization & threading                                            */
 /* ---------------------------------------------------------------------- */
@@ -94,6 +183,29 @@ void GMGPolar::threadReductionFactor(double thread_reduction_factor)
     thread_reduction_factor_ = thread_reduction_factor;
 }
 
+bool GMGPolar::autotuneThreads() const
+{
+    return autotune_threads_;
+}
+void GMGPolar::autotuneThreads(bool autotune_threads)
+{
+    autotune_threads_ = autotune_threads;
+}
+
+const std::string& GMGPolar::threadTuningCache() const
+{
+    return thread_tuning_cache_;
+}
+void GMGPolar::threadTuningCache(const std::string& thread_tuning_cache)
+{
+    thread_tuning_cache_ = thread_tuning_cache;
+}
+
+const std::vector<int>& GMGPolar::threadsPerLevel() const
+{
+    return threads_per_level_;
+}
+
 /* ---------------------------------------------------------------------- */
 /* Numerical method options                                               */
 /* ---------------------------------------------------------------------- */
@@ -133,6 +245,24 @@ void GMGPolar::cacheDomainGeometry(bool cache_domain_geometry)
     cache_domain_geometry_ = cache_domain_geometry;
 }
 
+bool GMGPolar::mixedPrecision() const
+{
+    return mixed_precision_;
+}
+void GMGPolar::mixedPrecision(bool mixed_precision)
+{
+    mixed_precision_ = mixed_precision;
+}
+
+bool GMGPolar::memoryLean() const
+{
+    return memory_lean_;
+}
+void GMGPolar::memoryLean(bool memory_lean)
+{
+    memory_lean_ = memory_lean;
+}
+
 /* ---------------------------------------------------------------------- */
 /* Multigrid controls                                                     */
 /* ---------------------------------------------------------------------- */
@@ -208,6 +338,29 @@ void GMGPolar::FMG_cycle(MultigridCycleType FMG_cycle)
     FMG_cycle_ = FMG_cycle;
 }
 
+/* ---------------------------------------------------------------------- */
+/* Outer Krylov acceleration                                              */
+/* ---------------------------------------------------------------------- */
+OuterSolverType GMGPolar::outerSolver() const
+{
+    return outer_solver_;
+}
+void GMGPolar::outerSolver(OuterSolverType outer_solver)
+{
+    outer_solver_ = outer_solver;
+}
+
+int GMGPolar::FGMRES_restart() const
+{
+    return FGMRES_restart_;
+}
+void GMGPolar::FGMRES_restart(int FGMRES_restart)
+{
+    if (FGMRES_restart < 1)
+        throw std::invalid_argument("FGMRES restart length must be at least 1.");
+    FGMRES_restart_ = FGMRES_restart;
+}
+
 /* ---------------------------------------------------------------------- */
 /* Iterative solver termination                                           */
 /* ---------------------------------------------------------------------- */
@@ -248,6 +401,15 @@ void GMGPolar::relativeTolerance(std::optional<double> tol)
     relative_tolerance_ = tol.has_value() && tol.value() >= 0.0 ? tol : std::nullopt;
 }
 
+bool GMGPolar::fusedConvergenceCheck() const
+{
+    return fused_convergence_check_;
+}
+void GMGPolar::fusedConvergenceCheck(bool fused_convergence_check)
+{
+    fused_convergence_check_ = fused_convergence_check;
+}
+
 /* ---------------------------------------------------------------------- */
 /* Solution & Grid Access                                                 */
 /* ---------------------------------------------------------------------- */
@@ -262,6 +424,23 @@ ConstVector<double> GMGPolar::solution() const
     return levels_[level_depth].solution();
 }
 
+int GMGPolar::numberOfRightHandSides() const
+{
+    return number_of_rhs_;
+}
+Vector<double> GMGPolar::solution(int rhs_index)
+{
+    if (rhs_index < 0 || rhs_index >= number_of_rhs_)
+        throw std::out_of_range("Right-hand side index out of range.");
+    return batchColumn(batch_solutions_, rhs_index, grid_.numberOfNodes());
+}
+ConstVector<double> GMGPolar::solution(int rhs_index) const
+{
+    if (rhs_index < 0 || rhs_index >= number_of_rhs_)
+        throw std::out_of_range("Right-hand side index out of range.");
+    return batchColumn(batch_solutions_, rhs_index, grid_.numberOfNodes());
+}
+
 const PolarGrid& GMGPolar::grid() const
 {
     return grid_;
@@ -338,6 +517,10 @@ double GMGPolar::timeAvgMGCDirectSolver() const
 {
     return t_avg_MGC_directSolver_;
 }
+double GMGPolar::timeAvgMGCKrylov() const
+{
+    return t_avg_MGC_krylov_;
+}
 
 /* ---------------------------------------------------------------------- */
 /* Reset timings                                                          */
@@ -375,6 +558,7 @@ void GMGPolar::resetAvgMultigridCycleTimings()
     t_avg_MGC_postSmoothing_ = 0.0;
     t_avg_MGC_residual_      = 0.0;
     t_avg_MGC_directSolver_  = 0.0;
+    t_avg_MGC_krylov_        = 0.0;
 }
 
 /* ---------------------------------------------------------------------- */
@@ -402,11 +586,23 @@ void GMGPolar::printTimings() const
     std::cout << "    PostSmoothing: " << t_avg_MGC_postSmoothing_ << " seconds" << std::endl;
     std::cout << "    Residual: " << t_avg_MGC_residual_ << " seconds" << std::endl;
     std::cout << "    DirectSolve: " << t_avg_MGC_directSolver_ << " seconds" << std::endl;
+    if (outer_solver_ != OuterSolverType::MULTIGRID_ITERATION) {
+        std::cout << "    Krylov Update: " << t_avg_MGC_krylov_ << " seconds" << std::endl;
+    }
     std::cout << "    Other Computations: "
               << std::max(t_avg_MGC_total_ - t_avg_MGC_preSmoothing_ - t_avg_MGC_postSmoothing_ - t_avg_MGC_residual_ -
-                              t_avg_MGC_directSolver_,
+                              t_avg_MGC_directSolver_ - t_avg_MGC_krylov_,
                           0.0)
               << " seconds" << std::endl;
+
+    if (outer_solver_ != OuterSolverType::MULTIGRID_ITERATION && !residual_norms_.empty()) {
+        std::cout << "\nResidual History (" << (outer_solver_ == OuterSolverType::PCG ? "PCG" : "FGMRES") << "):";
+        for (std::size_t i = 0; i < residual_norms_.size(); i++) {
+            std::cout << (i % 5 == 0 ? "\n    " : " ") << std::scientific << std::setprecision(2)
+                      << residual_norms_[i];
+        }
+        std::cout << std::defaultfloat << std::setprecision(6) << std::endl;
+    }
 }
 
 // Number of iterations taken by last solve.
@@ -414,6 +610,10 @@ int GMGPolar::numberOfIterations() const
 {
     return number_of_iterations_;
 }
+const std::vector<int>& GMGPolar::batchNumberOfIterations() const
+{
+    return batch_number_of_iterations_;
+}
 
 // Mean residual reduction factor per iteration.
 double GMGPolar::meanResidualReductionFactor() const
@@ -421,6 +621,11 @@ double GMGPolar::meanResidualReductionFactor() const
     return mean_residual_reduction_factor_;
 }
 
+const std::vector<double>& GMGPolar::residualNorms() const
+{
+    return residual_norms_;
+}
+
 // Error norms (only available if exact solution was set).
 std::optional<double> GMGPolar::exactErrorWeightedEuclidean() const
 {
@@ -436,3 +641,16 @@ std::optional<double> GMGPolar::exactErrorInfinity() const
     }
     return std::nullopt;
 }
+
+const Profiler& GMGPolar::profiler() const
+{
+    return profiler_;
+}
+
+void GMGPolar::writeProfileJSON(const std::string& path) const
+{
+    std::ofstream file(path);
+    if (!file)
+        throw std::runtime_error("Failed to open profile file '" + path + "' for writing.");
+    profiler_.writeJSON(file);
+}
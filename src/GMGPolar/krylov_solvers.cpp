@@ -0,0 +1,326 @@
+#include "../../include/GMGPolar/gmgpolar.h"
+
+#include <chrono>
+
+// =============================================================================
+//   Multigrid-preconditioned Krylov Solvers
+// =============================================================================
+// The outer Krylov solvers work on the finest level without extrapolation.
+// One multigrid cycle with zero initial guess acts as the preconditioner and
+// the operator is applied matrix-free through Level::computeResidual.
+
+void GMGPolar::allocateKrylovVectors(int number_of_vectors)
+{
+    const int n = levels_[0].grid().numberOfNodes();
+    if (krylov_vectors_.size() < static_cast<std::size_t>(number_of_vectors)) {
+        krylov_vectors_.resize(number_of_vectors);
+    }
+    for (int i = 0; i < number_of_vectors; i++) {
+        if (krylov_vectors_[i].size() != static_cast<std::size_t>(n)) {
+            krylov_vectors_[i] = Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace>("krylov", n);
+        }
+    }
+}
+
+// result = A * x, evaluated as -(0 - A * x). Requires krylov_vectors_[0] to hold zeros.
+void GMGPolar::applyOperator(const Level& level, Vector<double> result, ConstVector<double> x)
+{
+    auto start_MGC_residual = std::chrono::high_resolution_clock::now();
+
+    level.computeResidual(result, krylov_vectors_[0], x);
+    multiply(result, -1.0);
+
+    auto end_MGC_residual = std::chrono::high_resolution_clock::now();
+    t_avg_MGC_residual_ += std::chrono::duration<double>(end_MGC_residual - start_MGC_residual).count();
+}
+
+// result = M^{-1} * rhs, where M^{-1} is one multigrid cycle started from zero.
+void GMGPolar::applyMultigridPreconditioner(Vector<double> result, Vector<double> rhs)
+{
+    Level& level = levels_[0];
+    assign(result, 0.0);
+
+    switch (multigrid_cycle_) {
+    case MultigridCycleType::V_CYCLE:
+        multigrid_V_Cycle(level.level_depth(), result, rhs, level.residual());
+        break;
+    case MultigridCycleType::W_CYCLE:
+        multigrid_W_Cycle(level.level_depth(), result, rhs, level.residual());
+        break;
+    case MultigridCycleType::F_CYCLE:
+        multigrid_F_Cycle(level.level_depth(), result, rhs, level.residual());
+        break;
+    default:
+        throw std::invalid_argument("Unknown MultigridCycleType");
+    }
+}
+
+// =============================================================================
+//   Flexible Preconditioned Conjugate Gradient
+// =============================================================================
+// The multigrid cycle is not a symmetric preconditioner (fixed smoothing order),
+// hence the Polak-Ribiere form of beta is used which tolerates this.
+
+void GMGPolar::preconditionedConjugateGradient(double& initial_residual_norm, double& current_residual_norm,
+                                               double& current_relative_residual_norm)
+{
+    Level& level = levels_[0];
+
+    allocateKrylovVectors(6);
+    assign<double>(krylov_vectors_[0], 0.0);
+    Vector<double> x      = level.solution();
+    Vector<double> r      = krylov_vectors_[1];
+    Vector<double> z      = krylov_vectors_[2];
+    Vector<double> p      = krylov_vectors_[3];
+    Vector<double> q      = krylov_vectors_[4];
+    Vector<double> r_prev = krylov_vectors_[5];
+
+    level.computeResidual(r, level.rhs(), x);
+    double rz_prev = 1.0;
+
+    while (true) {
+        /* ---------------------------------------------- */
+        /* Test solution against exact solution if given. */
+        /* ---------------------------------------------- */
+        auto start_check_exact_error = std::chrono::high_resolution_clock::now();
+
+        if (exact_solution_ != nullptr)
+            evaluateExactError(level, *exact_solution_);
+
+        auto end_check_exact_error = std::chrono::high_resolution_clock::now();
+        t_check_exact_error_ += std::chrono::duration<double>(end_check_exact_error - start_check_exact_error).count();
+
+        /* ---------------------------- */
+        /* Compute convergence criteria */
+        /* ---------------------------- */
+        auto start_check_convergence = std::chrono::high_resolution_clock::now();
+
+        recordResidualNorm(level, residualNorm(residual_norm_type_, level, r), initial_residual_norm,
+                           current_residual_norm, current_relative_residual_norm);
+
+        auto end_check_convergence = std::chrono::high_resolution_clock::now();
+        t_check_convergence_ += std::chrono::duration<double>(end_check_convergence - start_check_convergence).count();
+
+        printIterationInfo(number_of_iterations_, current_residual_norm, current_relative_residual_norm,
+                           exact_solution_);
+
+        if (converged(current_residual_norm, current_relative_residual_norm) ||
+            number_of_iterations_ >= max_iterations_)
+            break;
+
+        /* ------------- */
+        /* PCG iteration */
+        /* ------------- */
+        auto start_solve_multigrid_iterations = std::chrono::high_resolution_clock::now();
+
+        applyMultigridPreconditioner(z, r);
+
+        auto start_krylov = std::chrono::high_resolution_clock::now();
+        const double rz   = dot_product<double>(r, z);
+        if (number_of_iterations_ == 0) {
+            Kokkos::deep_copy(p, z);
+        }
+        else {
+            const double beta = (rz - dot_product<double>(z, r_prev)) / rz_prev;
+            linear_combination<double>(p, beta, z, 1.0);
+        }
+        auto end_krylov = std::chrono::high_resolution_clock::now();
+        t_avg_MGC_krylov_ += std::chrono::duration<double>(end_krylov - start_krylov).count();
+
+        applyOperator(level, q, p);
+
+        start_krylov       = std::chrono::high_resolution_clock::now();
+        const double alpha = rz / dot_product<double>(p, q);
+        linear_combination<double>(x, 1.0, p, alpha);
+        Kokkos::deep_copy(r_prev, r);
+        linear_combination<double>(r, 1.0, q, -alpha);
+        rz_prev    = rz;
+        end_krylov = std::chrono::high_resolution_clock::now();
+        t_avg_MGC_krylov_ += std::chrono::duration<double>(end_krylov - start_krylov).count();
+
+        number_of_iterations_++;
+
+        auto end_solve_multigrid_iterations = std::chrono::high_resolution_clock::now();
+        t_solve_multigrid_iterations_ +=
+            std::chrono::duration<double>(end_solve_multigrid_iterations - start_solve_multigrid_iterations).count();
+    }
+}
+
+// =============================================================================
+//   Flexible GMRES(m)
+// =============================================================================
+// Right-preconditioned with the preconditioned directions Z_j stored explicitly,
+// so the preconditioner may change between iterations. Between restarts the
+// Euclidean residual norm is known from the Givens-rotated least squares problem.
+// For the infinity norm this estimate is used as an upper bound.
+
+void GMGPolar::flexibleGMRES(double& initial_residual_norm, double& current_residual_norm,
+                             double& current_relative_residual_norm)
+{
+    Level& level = levels_[0];
+    const int m  = FGMRES_restart_;
+    const int n  = level.grid().numberOfNodes();
+
+    // Layout: [0] zeros, [1] w, [2] x_j, [3, 3 + m] basis V_0..V_m, [4 + m, 3 + 2m] directions Z_0..Z_{m-1}
+    allocateKrylovVectors(4 + 2 * m);
+    assign<double>(krylov_vectors_[0], 0.0);
+    Vector<double> x   = level.solution();
+    Vector<double> w   = krylov_vectors_[1];
+    Vector<double> x_j = krylov_vectors_[2];
+    auto V             = [&](int i) -> Vector<double> { return krylov_vectors_[3 + i]; };
+    auto Z             = [&](int i) -> Vector<double> { return krylov_vectors_[4 + m + i]; };
+
+    // Hessenberg matrix H(i,j) = H[i * m + j], Givens rotations and rhs of the least squares problem.
+    std::vector<double> H((m + 1) * m), cs(m), sn(m), g(m + 1), y(m);
+
+    auto solveLeastSquares = [&](int k) {
+        for (int i = k - 1; i >= 0; i--) {
+            double sum = g[i];
+            for (int l = i + 1; l < k; l++) {
+                sum -= H[i * m + l] * y[l];
+            }
+            y[i] = sum / H[i * m + i];
+        }
+    };
+
+    auto estimatedResidualNorm = [&](double euclidean_norm) {
+        switch (residual_norm_type_) {
+        case ResidualNormType::EUCLIDEAN:
+            return euclidean_norm;
+        case ResidualNormType::WEIGHTED_EUCLIDEAN:
+            return euclidean_norm / std::sqrt(n);
+        case ResidualNormType::INFINITY_NORM:
+            return euclidean_norm;
+        default:
+            throw std::invalid_argument("Unknown ResidualNormType");
+        }
+    };
+
+    bool finished = false;
+    while (!finished) {
+        /* ------------------------------------------ */
+        /* (Re)start with the true residual r = b - Ax */
+        /* ------------------------------------------ */
+        level.computeResidual(V(0), level.rhs(), x);
+        const double beta                = l2_norm<double>(V(0));
+        const double true_residual_norm = residualNorm(residual_norm_type_, level, V(0));
+        std::fill(g.begin(), g.end(), 0.0);
+        g[0] = beta;
+
+        int j          = 0;
+        bool breakdown = false;
+        while (true) {
+            /* ---------------------------------------------- */
+            /* Test solution against exact solution if given. */
+            /* ---------------------------------------------- */
+            auto start_check_exact_error = std::chrono::high_resolution_clock::now();
+
+            if (exact_solution_ != nullptr) {
+                if (j == 0) {
+                    evaluateExactError(level, *exact_solution_);
+                }
+                else {
+                    solveLeastSquares(j);
+                    Kokkos::deep_copy(x_j, x);
+                    for (int i = 0; i < j; i++) {
+                        linear_combination<double>(x_j, 1.0, Z(i), y[i]);
+                    }
+                    exact_errors_.push_back(computeExactError(level, x_j, level.residual(), *exact_solution_));
+                }
+            }
+
+            auto end_check_exact_error = std::chrono::high_resolution_clock::now();
+            t_check_exact_error_ +=
+                std::chrono::duration<double>(end_check_exact_error - start_check_exact_error).count();
+
+            /* ---------------------------- */
+            /* Compute convergence criteria */
+            /* ---------------------------- */
+            const double residual_norm = (j == 0) ? true_residual_norm : estimatedResidualNorm(std::abs(g[j]));
+            recordResidualNorm(level, residual_norm, initial_residual_norm, current_residual_norm,
+                               current_relative_residual_norm);
+
+            printIterationInfo(number_of_iterations_, current_residual_norm, current_relative_residual_norm,
+                               exact_solution_);
+
+            if (converged(current_residual_norm, current_relative_residual_norm) ||
+                number_of_iterations_ >= max_iterations_ || breakdown || beta == 0.0) {
+                finished = true;
+                break;
+            }
+
+            /* ---------------- */
+            /* FGMRES iteration */
+            /* ---------------- */
+            auto start_solve_multigrid_iterations = std::chrono::high_resolution_clock::now();
+
+            if (j == 0) {
+                multiply<double>(V(0), 1.0 / beta);
+            }
+
+            applyMultigridPreconditioner(Z(j), V(j));
+            applyOperator(level, w, Z(j));
+
+            auto start_krylov = std::chrono::high_resolution_clock::now();
+
+            // Modified Gram-Schmidt orthogonalization
+            for (int i = 0; i <= j; i++) {
+                H[i * m + j] = dot_product<double>(w, V(i));
+                linear_combination<double>(w, 1.0, V(i), -H[i * m + j]);
+            }
+            const double h_next = l2_norm<double>(w);
+            H[(j + 1) * m + j]  = h_next;
+            if (h_next > 0.0) {
+                Kokkos::deep_copy(V(j + 1), w);
+                multiply<double>(V(j + 1), 1.0 / h_next);
+            }
+            else {
+                breakdown = true; // The Krylov space contains the exact solution.
+            }
+
+            // Apply previous rotations and compute the new one
+            for (int i = 0; i < j; i++) {
+                const double temp  = cs[i] * H[i * m + j] + sn[i] * H[(i + 1) * m + j];
+                H[(i + 1) * m + j] = -sn[i] * H[i * m + j] + cs[i] * H[(i + 1) * m + j];
+                H[i * m + j]       = temp;
+            }
+            const double denominator = std::hypot(H[j * m + j], H[(j + 1) * m + j]);
+            cs[j]                    = H[j * m + j] / denominator;
+            sn[j]                    = H[(j + 1) * m + j] / denominator;
+            H[j * m + j]             = denominator;
+            H[(j + 1) * m + j]       = 0.0;
+            g[j + 1]                 = -sn[j] * g[j];
+            g[j]                     = cs[j] * g[j];
+
+            auto end_krylov = std::chrono::high_resolution_clock::now();
+            t_avg_MGC_krylov_ += std::chrono::duration<double>(end_krylov - start_krylov).count();
+
+            j++;
+            number_of_iterations_++;
+
+            auto end_solve_multigrid_iterations = std::chrono::high_resolution_clock::now();
+            t_solve_multigrid_iterations_ +=
+                std::chrono::duration<double>(end_solve_multigrid_iterations - start_solve_multigrid_iterations)
+                    .count();
+
+            if (j == m)
+                break; // Restart
+        }
+
+        /* ---------------------------------------- */
+        /* Update the approximation x = x + Z_j y_j */
+        /* ---------------------------------------- */
+        if (j > 0) {
+            auto start_krylov = std::chrono::high_resolution_clock::now();
+
+            solveLeastSquares(j);
+            for (int i = 0; i < j; i++) {
+                linear_combination<double>(x, 1.0, Z(i), y[i]);
+            }
+
+            auto end_krylov = std::chrono::high_resolution_clock::now();
+            t_avg_MGC_krylov_ += std::chrono::duration<double>(end_krylov - start_krylov).count();
+            t_solve_multigrid_iterations_ += std::chrono::duration<double>(end_krylov - start_krylov).count();
+        }
+    }
+}
@@ -6,24 +6,91 @@ void GMGPolar::prolongation(const int current_level, Vector<double> result, Cons
     if (!interpolation_)
         throw std::runtime_error("Interpolation not initialized.");
 
+    ProfileScope profile(&profiler_, current_level - 1, ProfiledOperation::PROLONGATION);
     interpolation_->applyProlongation(levels_[current_level], levels_[current_level - 1], result, x);
 }
 
+void GMGPolar::prolongationAdd(const int current_level, Vector<double> result, ConstVector<double> x) const
+{
+    assert(current_level < number_of_levels_ && 1 <= current_level);
+    if (!interpolation_)
+        throw std::runtime_error("Interpolation not initialized.");
+
+    ProfileScope profile(&profiler_, current_level - 1, ProfiledOperation::PROLONGATION);
+    interpolation_->applyProlongationAdd(levels_[current_level], levels_[current_level - 1], result, x);
+}
+
+void GMGPolar::prolongationAdd(const int current_level, Vector<double> result, ConstVector<float> x) const
+{
+    assert(current_level < number_of_levels_ && 1 <= current_level);
+    if (!interpolation_)
+        throw std::runtime_error("Interpolation not initialized.");
+
+    ProfileScope profile(&profiler_, current_level - 1, ProfiledOperation::PROLONGATION);
+    interpolation_->applyProlongationAdd(levels_[current_level], levels_[current_level - 1], result, x);
+}
+
+void GMGPolar::prolongationAdd(const int current_level, Vector<float> result, ConstVector<float> x) const
+{
+    assert(current_level < number_of_levels_ && 1 <= current_level);
+    if (!interpolation_)
+        throw std::runtime_error("Interpolation not initialized.");
+
+    ProfileScope profile(&profiler_, current_level - 1, ProfiledOperation::PROLONGATION);
+    interpolation_->applyProlongationAdd(levels_[current_level], levels_[current_level - 1], result, x);
+}
+
+void GMGPolar::prolongationAddBatch(const int current_level, Vector<double> result, ConstVector<double> x,
+                                    const int number_of_columns) const
+{
+    assert(current_level < number_of_levels_ && 1 <= current_level);
+    if (!interpolation_)
+        throw std::runtime_error("Interpolation not initialized.");
+
+    ProfileScope profile(&profiler_, current_level - 1, ProfiledOperation::PROLONGATION);
+    interpolation_->applyProlongationAddBatch(levels_[current_level], levels_[current_level - 1], result, x,
+                                              number_of_columns);
+}
+
 void GMGPolar::restriction(const int current_level, Vector<double> result, ConstVector<double> x) const
 {
     assert(current_level < number_of_levels_ - 1 && 0 <= current_level);
     if (!interpolation_)
         throw std::runtime_error("Interpolation not initialized.");
 
+    ProfileScope profile(&profiler_, current_level + 1, ProfiledOperation::RESTRICTION);
     interpolation_->applyRestriction(levels_[current_level], levels_[current_level + 1], result, x);
 }
 
+void GMGPolar::restriction(const int current_level, Vector<float> result, ConstVector<double> x) const
+{
+    assert(current_level < number_of_levels_ - 1 && 0 <= current_level);
+    if (!interpolation_)
+        throw std::runtime_error("Interpolation not initialized.");
+
+    ProfileScope profile(&profiler_, current_level + 1, ProfiledOperation::RESTRICTION);
+    interpolation_->applyRestriction(levels_[current_level], levels_[current_level + 1], result, x);
+}
+
+void GMGPolar::restrictionBatch(const int current_level, Vector<double> result, ConstVector<double> x,
+                                const int number_of_columns) const
+{
+    assert(current_level < number_of_levels_ - 1 && 0 <= current_level);
+    if (!interpolation_)
+        throw std::runtime_error("Interpolation not initialized.");
+
+    ProfileScope profile(&profiler_, current_level + 1, ProfiledOperation::RESTRICTION);
+    interpolation_->applyRestrictionBatch(levels_[current_level], levels_[current_level + 1], result, x,
+                                          number_of_columns);
+}
+
 void GMGPolar::injection(const int current_level, Vector<double> result, ConstVector<double> x) const
 {
     assert(current_level < number_of_levels_ - 1 && 0 <= current_level);
     if (!interpolation_)
         throw std::runtime_error("Interpolation not initialized.");
 
+    ProfileScope profile(&profiler_, current_level + 1, ProfiledOperation::INJECTION);
     interpolation_->applyInjection(levels_[current_level], levels_[current_level + 1], result, x);
 }
 
@@ -33,15 +100,27 @@ void GMGPolar::extrapolatedProlongation(const int current_level, Vector<double>
     if (!interpolation_)
         throw std::runtime_error("Interpolation not initialized.");
 
+    ProfileScope profile(&profiler_, current_level - 1, ProfiledOperation::PROLONGATION);
     interpolation_->applyExtrapolatedProlongation(levels_[current_level], levels_[current_level - 1], result, x);
 }
 
+void GMGPolar::extrapolatedProlongationAdd(const int current_level, Vector<double> result, ConstVector<double> x) const
+{
+    assert(current_level < number_of_levels_ && 1 <= current_level);
+    if (!interpolation_)
+        throw std::runtime_error("Interpolation not initialized.");
+
+    ProfileScope profile(&profiler_, current_level - 1, ProfiledOperation::PROLONGATION);
+    interpolation_->applyExtrapolatedProlongationAdd(levels_[current_level], levels_[current_level - 1], result, x);
+}
+
 void GMGPolar::extrapolatedRestriction(const int current_level, Vector<double> result, ConstVector<double> x) const
 {
     assert(current_level < number_of_levels_ - 1 && 0 <= current_level);
     if (!interpolation_)
         throw std::runtime_error("Interpolation not initialized.");
 
+    ProfileScope profile(&profiler_, current_level + 1, ProfiledOperation::RESTRICTION);
     interpolation_->applyExtrapolatedRestriction(levels_[current_level], levels_[current_level + 1], result, x);
 }
 
@@ -51,5 +130,55 @@ void GMGPolar::FMGInterpolation(const int current_level, Vector<double> result,
     if (!interpolation_)
         throw std::runtime_error("Interpolation not initialized.");
 
+    ProfileScope profile(&profiler_, current_level - 1, ProfiledOperation::PROLONGATION);
     interpolation_->applyFMGInterpolation(levels_[current_level], levels_[current_level - 1], result, x);
-}
\ No newline at end of file
+}
+void GMGPolar::restrictedResidual(const int current_level, Vector<double> result, ConstVector<double> rhs,
+                                  ConstVector<double> x, Vector<double> residual, const bool store_residual) const
+{
+    assert(current_level < number_of_levels_ - 1 && 0 <= current_level);
+    const Level& level = levels_[current_level];
+
+    if (!store_residual && level.hasRestrictedResidual()) {
+        level.computeRestrictedResidual(levels_[current_level + 1], result, rhs, x, false);
+        return;
+    }
+    level.computeResidual(residual, rhs, x);
+    restriction(current_level, result, residual);
+}
+
+void GMGPolar::restrictedResidual(const int current_level, Vector<float> result, ConstVector<double> rhs,
+                                  ConstVector<double> x, Vector<double> residual, const bool store_residual) const
+{
+    assert(current_level < number_of_levels_ - 1 && 0 <= current_level);
+    const Level& level = levels_[current_level];
+
+    if (!store_residual && level.hasSinglePrecision()) {
+        level.computeRestrictedResidualSinglePrecision(levels_[current_level + 1], result, rhs, x);
+        return;
+    }
+    level.computeResidual(residual, rhs, x);
+    restriction(current_level, result, residual);
+}
+
+void GMGPolar::restrictedResidual(const int current_level, Vector<float> result, ConstVector<float> rhs,
+                                  ConstVector<float> x) const
+{
+    assert(current_level < number_of_levels_ - 1 && 0 <= current_level);
+    levels_[current_level].computeRestrictedResidualSinglePrecision(levels_[current_level + 1], result, rhs, x);
+}
+
+void GMGPolar::extrapolatedRestrictedResidual(const int current_level, Vector<double> result, ConstVector<double> rhs,
+                                              ConstVector<double> x, Vector<double> residual,
+                                              const bool store_residual) const
+{
+    assert(current_level < number_of_levels_ - 1 && 0 <= current_level);
+    const Level& level = levels_[current_level];
+
+    if (!store_residual && level.hasRestrictedResidual()) {
+        level.computeRestrictedResidual(levels_[current_level + 1], result, rhs, x, true);
+        return;
+    }
+    level.computeResidual(residual, rhs, x);
+    extrapolatedRestriction(current_level, result, residual);
+}
@@ -0,0 +1,15 @@
+#include "../../include/GMGPolar/gmgpolar.h"
+
+MemoryReport GMGPolar::memoryReport() const
+{
+    MemoryReport report;
+    report.levels.reserve(levels_.size());
+    for (const Level& level : levels_) {
+        report.levels.push_back(level.memoryUsage());
+    }
+    report.setup_resident_set_size = setup_resident_set_size_;
+    report.setup_high_water_mark   = setup_high_water_mark_;
+    report.solve_resident_set_size = solve_resident_set_size_;
+    report.solve_high_water_mark   = solve_high_water_mark_;
+    return report;
+}
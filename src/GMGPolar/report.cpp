@@ -0,0 +1,220 @@
+#include "../../include/GMGPolar/gmgpolar.h"
+
+#include <cmath>
+#include <fstream>
+#include <iomanip>
+#include <limits>
+#include <variant>
+
+// =============================================================================
+//   Machine-readable Run Report
+// =============================================================================
+// The keys of the "problem" and "settings" sections match the command line options of the gmgpolar executable
+// and enumerations are written with their numeric command line values.
+
+namespace
+{
+void writeNumber(std::ostream& stream, double value)
+{
+    // JSON has no representation for inf/nan.
+    if (std::isfinite(value))
+        stream << value;
+    else
+        stream << "null";
+}
+
+void writeNumber(std::ostream& stream, const std::optional<double>& value)
+{
+    if (value.has_value())
+        writeNumber(stream, value.value());
+    else
+        stream << "null";
+}
+
+template <typename T>
+void writeField(std::ostream& stream, const std::string& indent, const char* key, const T& value, bool last = false)
+{
+    stream << indent << "\"" << key << "\": ";
+    if constexpr (std::is_same_v<T, bool>)
+        stream << (value ? "true" : "false");
+    else if constexpr (std::is_floating_point_v<T> || std::is_same_v<T, std::optional<double>>)
+        writeNumber(stream, value);
+    else
+        stream << value;
+    stream << (last ? "\n" : ",\n");
+}
+
+void writeString(std::ostream& stream, const std::string& value)
+{
+    stream << "\"";
+    for (const char c : value) {
+        if (c == '"' || c == '\\')
+            stream << '\\' << c;
+        else if (static_cast<unsigned char>(c) < 0x20)
+            stream << "\\u" << std::hex << std::setw(4) << std::setfill('0') << static_cast<int>(c) << std::dec
+                   << std::setfill(' ');
+        else
+            stream << c;
+    }
+    stream << "\"";
+}
+} // namespace
+
+void GMGPolar::writeReport(const std::string& path, const std::vector<ReportSetting>& problem) const
+{
+    std::ofstream file(path);
+    if (!file)
+        throw std::runtime_error("Failed to open report file '" + path + "' for writing.");
+    writeReport(file, problem);
+    if (!file)
+        throw std::runtime_error("Failed to write report file '" + path + "'.");
+}
+
+void GMGPolar::writeReport(std::ostream& stream, const std::vector<ReportSetting>& problem) const
+{
+    const auto flags     = stream.flags();
+    const auto precision = stream.precision();
+    stream << std::setprecision(std::numeric_limits<double>::max_digits10);
+
+    const std::string indent = "    ";
+
+    stream << "{\n";
+
+    /* ------- */
+    /* Problem */
+    stream << "  \"problem\": {";
+    for (std::size_t i = 0; i < problem.size(); i++) {
+        stream << (i > 0 ? ",\n" : "\n") << indent;
+        writeString(stream, problem[i].first);
+        stream << ": ";
+        std::visit(
+            [&](const auto& value) {
+                using T = std::decay_t<decltype(value)>;
+                if constexpr (std::is_same_v<T, std::string>)
+                    writeString(stream, value);
+                else if constexpr (std::is_same_v<T, double>)
+                    writeNumber(stream, value);
+                else
+                    stream << value;
+            },
+            problem[i].second);
+    }
+    stream << (problem.empty() ? "},\n" : "\n  },\n");
+
+    /* -------- */
+    /* Settings */
+    stream << "  \"settings\": {\n";
+#ifdef GMGPOLAR_USE_MUMPS
+    writeField(stream, indent, "MUMPS", true);
+#else
+    writeField(stream, indent, "MUMPS", false);
+#endif
+#ifdef GMGPOLAR_USE_LIKWID
+    writeField(stream, indent, "LIKWID", true);
+#else
+    writeField(stream, indent, "LIKWID", false);
+#endif
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+    writeField(stream, indent, "KokkosKernels", true);
+#else
+    writeField(stream, indent, "KokkosKernels", false);
+#endif
+    writeField(stream, indent, "maxOpenMPThreads", max_omp_threads_);
+    writeField(stream, indent, "threadReductionFactor", thread_reduction_factor_);
+    writeField(stream, indent, "autotuneThreads", autotune_threads_);
+    writeField(stream, indent, "DirBC_Interior", DirBC_Interior_);
+    writeField(stream, indent, "stencilDistributionMethod", static_cast<int>(stencil_distribution_method_));
+    writeField(stream, indent, "cacheDensityProfileCoefficients", cache_density_profile_coefficients_);
+    writeField(stream, indent, "cacheDomainGeometry", cache_domain_geometry_);
+    writeField(stream, indent, "radialProfiles", usesRadialProfiles());
+    writeField(stream, indent, "mixedPrecision", mixed_precision_);
+    writeField(stream, indent, "memoryLean", memory_lean_);
+    writeField(stream, indent, "extrapolation", static_cast<int>(extrapolation_));
+    writeField(stream, indent, "maxLevels", max_levels_);
+    writeField(stream, indent, "preSmoothingSteps", pre_smoothing_steps_);
+    writeField(stream, indent, "postSmoothingSteps", post_smoothing_steps_);
+    writeField(stream, indent, "multigridCycle", static_cast<int>(multigrid_cycle_));
+    writeField(stream, indent, "FMG", FMG_);
+    writeField(stream, indent, "FMG_iterations", FMG_iterations_);
+    writeField(stream, indent, "FMG_cycle", static_cast<int>(FMG_cycle_));
+    writeField(stream, indent, "outerSolver", static_cast<int>(outer_solver_));
+    writeField(stream, indent, "FGMRES_restart", FGMRES_restart_);
+    writeField(stream, indent, "maxIterations", max_iterations_);
+    writeField(stream, indent, "residualNormType", static_cast<int>(residual_norm_type_));
+    writeField(stream, indent, "absoluteTolerance", absolute_tolerance_);
+    writeField(stream, indent, "relativeTolerance", relative_tolerance_);
+    writeField(stream, indent, "fusedConvergenceCheck", fused_convergence_check_, true);
+    stream << "  },\n";
+
+    /* ---------------- */
+    /* Multigrid levels */
+    stream << "  \"levels\": [";
+    for (std::size_t level_depth = 0; level_depth < levels_.size(); level_depth++) {
+        const PolarGrid& level_grid = levels_[level_depth].grid();
+        stream << (level_depth > 0 ? "," : "") << "\n    {\"level\": " << level_depth << ", \"nr\": " << level_grid.nr()
+               << ", \"ntheta\": " << level_grid.ntheta() << ", \"numberOfNodes\": " << level_grid.numberOfNodes()
+               << ", \"threads\": " << threads_per_level_[level_depth] << "}";
+    }
+    stream << (levels_.empty() ? "],\n" : "\n  ],\n");
+
+    /* ----------- */
+    /* Convergence */
+    stream << "  \"convergence\": {\n";
+    writeField(stream, indent, "iterations", number_of_iterations_);
+    writeField(stream, indent, "meanResidualReductionFactor", mean_residual_reduction_factor_);
+    stream << indent << "\"residualNorms\": [";
+    for (std::size_t i = 0; i < residual_norms_.size(); i++) {
+        stream << (i > 0 ? ", " : "");
+        writeNumber(stream, residual_norms_[i]);
+    }
+    stream << "],\n";
+    stream << indent << "\"exactErrorsWeightedEuclidean\": [";
+    for (std::size_t i = 0; i < exact_errors_.size(); i++) {
+        stream << (i > 0 ? ", " : "");
+        writeNumber(stream, exact_errors_[i].first);
+    }
+    stream << "],\n";
+    stream << indent << "\"exactErrorsInfinity\": [";
+    for (std::size_t i = 0; i < exact_errors_.size(); i++) {
+        stream << (i > 0 ? ", " : "");
+        writeNumber(stream, exact_errors_[i].second);
+    }
+    stream << "]\n";
+    stream << "  },\n";
+
+    /* ------- */
+    /* Timings */
+    // t_setup_rhs_ is neither included in t_setup_total_ and t_solve_total_.
+    stream << "  \"timings\": {\n";
+    writeField(stream, indent, "setupTotal", t_setup_total_);
+    writeField(stream, indent, "setupCreateLevels", t_setup_createLevels_);
+    writeField(stream, indent, "setupSmoother", t_setup_smoother_);
+    writeField(stream, indent, "setupDirectSolver", t_setup_directSolver_);
+    writeField(stream, indent, "setupRHS", t_setup_rhs_);
+    writeField(stream, indent, "solveTotal", t_solve_total_);
+    writeField(stream, indent, "solveInitialApproximation", t_solve_initial_approximation_);
+    writeField(stream, indent, "solveMultigridIterations", t_solve_multigrid_iterations_);
+    writeField(stream, indent, "checkConvergence", t_check_convergence_);
+    writeField(stream, indent, "checkExactError", t_check_exact_error_);
+    writeField(stream, indent, "avgMGCTotal", t_avg_MGC_total_);
+    writeField(stream, indent, "avgMGCPreSmoothing", t_avg_MGC_preSmoothing_);
+    writeField(stream, indent, "avgMGCPostSmoothing", t_avg_MGC_postSmoothing_);
+    writeField(stream, indent, "avgMGCResidual", t_avg_MGC_residual_);
+    writeField(stream, indent, "avgMGCDirectSolver", t_avg_MGC_directSolver_);
+    writeField(stream, indent, "avgMGCKrylov", t_avg_MGC_krylov_, true);
+    stream << "  },\n";
+
+    /* ------ */
+    /* Memory */
+    stream << "  \"memory\": {\n";
+    writeField(stream, indent, "hierarchyBytes", memoryReport().total());
+    writeField(stream, indent, "setupHighWaterMark", setup_high_water_mark_);
+    writeField(stream, indent, "solveHighWaterMark", solve_high_water_mark_);
+    writeField(stream, indent, "peakResidentSetSize", peakResidentSetSize(), true);
+    stream << "  }\n";
+
+    stream << "}\n";
+
+    stream.flags(flags);
+    stream.precision(precision);
+}
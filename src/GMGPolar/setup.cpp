@@ -6,13 +6,15 @@ void GMGPolar::setup()
     auto start_setup = std::chrono::high_resolution_clock::now();
 
     resetSetupPhaseTimings();
+    setup_resident_set_size_ = residentSetSize();
 
     auto start_setup_createLevels = std::chrono::high_resolution_clock::now();
 
-    if (stencil_distribution_method_ == StencilDistributionMethod::CPU_TAKE) {
+    if (stencil_distribution_method_ == StencilDistributionMethod::CPU_TAKE ||
+        usesAssembledStencil(stencil_distribution_method_)) {
         if (!cache_density_profile_coefficients_ || !cache_domain_geometry_) {
             throw std::runtime_error("Error: Caching must be enabled for both density profile coefficients and domain "
-                                     "geometry in 'Take' implementation strategy.");
+                                     "geometry in 'Take' and 'Assembled' implementation strategies.");
         }
     }
 
@@ -56,14 +58,33 @@ void GMGPolar::setup()
     levels_.reserve(number_of_levels_);
 
     int level_depth        = 0;
-    auto finest_levelCache = std::make_unique<LevelCache>(*finest_grid, density_profile_coefficients_, domain_geometry_,
-                                                          cache_density_profile_coefficients_, cache_domain_geometry_);
-    levels_.emplace_back(level_depth, std::move(finest_grid), std::move(finest_levelCache), extrapolation_, FMG_);
+    auto finest_levelCache =
+        std::make_unique<LevelCache>(*finest_grid, *density_profile_coefficients_, domain_geometry_,
+                                     cachesDensityProfileCoefficients(level_depth), cachesDomainGeometry(level_depth),
+                                     usesRadialProfiles());
+    levels_.emplace_back(level_depth, std::move(finest_grid), std::move(finest_levelCache), extrapolation_, FMG_,
+                         &profiler_);
 
     for (level_depth = 1; level_depth < number_of_levels_; level_depth++) {
-        auto current_grid       = std::make_unique<PolarGrid>(coarseningGrid(levels_[level_depth - 1].grid()));
-        auto current_levelCache = std::make_unique<LevelCache>(levels_[level_depth - 1], *current_grid);
-        levels_.emplace_back(level_depth, std::move(current_grid), std::move(current_levelCache), extrapolation_, FMG_);
+        auto current_grid = std::make_unique<PolarGrid>(coarseningGrid(levels_[level_depth - 1].grid()));
+        std::unique_ptr<LevelCache> current_levelCache;
+        if (cachesDensityProfileCoefficients(level_depth) == cachesDensityProfileCoefficients(level_depth - 1) &&
+            cachesDomainGeometry(level_depth) == cachesDomainGeometry(level_depth - 1)) {
+            current_levelCache = std::make_unique<LevelCache>(levels_[level_depth - 1], *current_grid);
+        }
+        else {
+            current_levelCache = std::make_unique<LevelCache>(
+                *current_grid, *density_profile_coefficients_, domain_geometry_,
+                cachesDensityProfileCoefficients(level_depth), cachesDomainGeometry(level_depth), usesRadialProfiles());
+        }
+        if (sharesSolutionStorage(level_depth)) {
+            levels_.emplace_back(level_depth, std::move(current_grid), std::move(current_levelCache), extrapolation_,
+                                 FMG_, &profiler_, sharedSolutionStorage());
+        }
+        else {
+            levels_.emplace_back(level_depth, std::move(current_grid), std::move(current_levelCache), extrapolation_,
+                                 FMG_, &profiler_);
+        }
     }
 
     auto end_setup_createLevels = std::chrono::high_resolution_clock::now();
@@ -75,13 +96,7 @@ void GMGPolar::setup()
     // ----------------------------------------------------------- //
     // Initializing the optimal number of threads for OpenMP tasks //
     // ----------------------------------------------------------- //
-    threads_per_level_.resize(number_of_levels_, max_omp_threads_);
-    for (int level_depth = 0; level_depth < number_of_levels_; level_depth++) {
-        threads_per_level_[level_depth] = std::max(
-            1,
-            std::min(max_omp_threads_,
-                     static_cast<int>(std::floor(max_omp_threads_ * std::pow(thread_reduction_factor_, level_depth)))));
-    }
+    initializeThreadsPerLevel();
 
     interpolation_ = std::make_unique<Interpolation>(threads_per_level_, DirBC_Interior_);
 
@@ -91,87 +106,210 @@ void GMGPolar::setup()
     // -------------------------------------------------------
     // Initializing various operators based on the level index
     for (int level_depth = 0; level_depth < number_of_levels_; level_depth++) {
-        // ---------------------- //
-        // Level 0 (finest Level) //
-        // ---------------------- //
-        if (level_depth == 0) {
-            auto start_setup_smoother = std::chrono::high_resolution_clock::now();
-            switch (extrapolation_) {
-            case ExtrapolationType::NONE:
-                full_grid_smoothing_ = true;
-                levels_[level_depth].initializeSmoothing(domain_geometry_, density_profile_coefficients_,
-                                                         DirBC_Interior_, threads_per_level_[level_depth],
-                                                         stencil_distribution_method_);
-                break;
-            case ExtrapolationType::IMPLICIT_EXTRAPOLATION:
-                full_grid_smoothing_ = false;
-                levels_[level_depth].initializeExtrapolatedSmoothing(domain_geometry_, density_profile_coefficients_,
-                                                                     DirBC_Interior_, threads_per_level_[level_depth],
-                                                                     stencil_distribution_method_);
-                break;
-            case ExtrapolationType::IMPLICIT_FULL_GRID_SMOOTHING:
-                full_grid_smoothing_ = true;
-                levels_[level_depth].initializeSmoothing(domain_geometry_, density_profile_coefficients_,
-                                                         DirBC_Interior_, threads_per_level_[level_depth],
-                                                         stencil_distribution_method_);
-                break;
-            case ExtrapolationType::COMBINED:
-                full_grid_smoothing_ = true;
-                levels_[level_depth].initializeSmoothing(domain_geometry_, density_profile_coefficients_,
-                                                         DirBC_Interior_, threads_per_level_[level_depth],
-                                                         stencil_distribution_method_);
-                levels_[level_depth].initializeExtrapolatedSmoothing(domain_geometry_, density_profile_coefficients_,
-                                                                     DirBC_Interior_, threads_per_level_[level_depth],
-                                                                     stencil_distribution_method_);
-                break;
-            default:
-                full_grid_smoothing_ = false;
-                levels_[level_depth].initializeSmoothing(domain_geometry_, density_profile_coefficients_,
-                                                         DirBC_Interior_, threads_per_level_[level_depth],
-                                                         stencil_distribution_method_);
-                levels_[level_depth].initializeExtrapolatedSmoothing(domain_geometry_, density_profile_coefficients_,
-                                                                     DirBC_Interior_, threads_per_level_[level_depth],
-                                                                     stencil_distribution_method_);
-                break;
-            }
-            auto end_setup_smoother = std::chrono::high_resolution_clock::now();
-            t_setup_smoother_ += std::chrono::duration<double>(end_setup_smoother - start_setup_smoother).count();
-            levels_[level_depth].initializeResidual(domain_geometry_, density_profile_coefficients_, DirBC_Interior_,
-                                                    threads_per_level_[level_depth], stencil_distribution_method_);
-        }
-        // -------------------------- //
-        // Level n-1 (coarsest Level) //
-        // -------------------------- //
-        else if (level_depth == number_of_levels_ - 1) {
-            auto start_setup_directSolver = std::chrono::high_resolution_clock::now();
-            levels_[level_depth].initializeDirectSolver(domain_geometry_, density_profile_coefficients_,
-                                                        DirBC_Interior_, threads_per_level_[level_depth],
-                                                        stencil_distribution_method_);
-            auto end_setup_directSolver = std::chrono::high_resolution_clock::now();
-            t_setup_directSolver_ +=
-                std::chrono::duration<double>(end_setup_directSolver - start_setup_directSolver).count();
-            levels_[level_depth].initializeResidual(domain_geometry_, density_profile_coefficients_, DirBC_Interior_,
-                                                    threads_per_level_[level_depth], stencil_distribution_method_);
-        }
-        // ------------------- //
-        // Intermediate levels //
-        // ------------------- //
-        else {
-            auto start_setup_smoother = std::chrono::high_resolution_clock::now();
-            levels_[level_depth].initializeSmoothing(domain_geometry_, density_profile_coefficients_, DirBC_Interior_,
-                                                     threads_per_level_[level_depth], stencil_distribution_method_);
-            auto end_setup_smoother = std::chrono::high_resolution_clock::now();
-            t_setup_smoother_ += std::chrono::duration<double>(end_setup_smoother - start_setup_smoother).count();
-            levels_[level_depth].initializeResidual(domain_geometry_, density_profile_coefficients_, DirBC_Interior_,
-                                                    threads_per_level_[level_depth], stencil_distribution_method_);
-        }
+        initializeOperators(level_depth);
+    }
+
+    if (autotune_threads_)
+        autotuneThreadsPerLevel();
+
+    auto end_setup = std::chrono::high_resolution_clock::now();
+    t_setup_total_ = std::chrono::duration<double>(end_setup - start_setup).count();
+    setup_high_water_mark_ = peakResidentSetSize();
+    LIKWID_STOP("Setup");
+}
+
+void GMGPolar::updateDensityProfileCoefficients(const DensityProfileCoefficients& density_profile_coefficients)
+{
+    if (levels_.empty())
+        throw std::runtime_error("updateDensityProfileCoefficients() requires a previous call to setup().");
+
+    LIKWID_START("Setup");
+    auto start_setup = std::chrono::high_resolution_clock::now();
+
+    resetSetupPhaseTimings();
+    setup_resident_set_size_ = residentSetSize();
+
+    density_profile_coefficients_ = &density_profile_coefficients;
+
+    // Coarser levels inject their cached values from the next finer level, so the update has to go top-down.
+    levels_[0].updateDensityProfileCoefficients(*density_profile_coefficients_);
+    for (int level_depth = 1; level_depth < number_of_levels_; level_depth++) {
+        levels_[level_depth].updateDensityProfileCoefficients(levels_[level_depth - 1]);
     }
 
     auto end_setup = std::chrono::high_resolution_clock::now();
     t_setup_total_ = std::chrono::duration<double>(end_setup - start_setup).count();
+    setup_high_water_mark_ = peakResidentSetSize();
     LIKWID_STOP("Setup");
 }
 
+void GMGPolar::initializeThreadsPerLevel()
+{
+    threads_per_level_.resize(number_of_levels_, max_omp_threads_);
+    for (int level_depth = 0; level_depth < number_of_levels_; level_depth++) {
+        threads_per_level_[level_depth] = std::max(
+            1,
+            std::min(max_omp_threads_,
+                     static_cast<int>(std::floor(max_omp_threads_ * std::pow(thread_reduction_factor_, level_depth)))));
+    }
+}
+
+void GMGPolar::initializeOperators(const int level_depth, SetupReader* setup_reader)
+{
+    // ---------------------- //
+    // Level 0 (finest Level) //
+    // ---------------------- //
+    if (level_depth == 0) {
+        // The finest level always keeps double precision smoother factors, see mixedPrecision().
+        auto start_setup_smoother = std::chrono::high_resolution_clock::now();
+        switch (extrapolation_) {
+        case ExtrapolationType::NONE:
+            full_grid_smoothing_ = true;
+            levels_[level_depth].initializeSmoothing(domain_geometry_, *density_profile_coefficients_,
+                                                     DirBC_Interior_, threads_per_level_[level_depth],
+                                                     stencil_distribution_method_, false, setup_reader);
+            break;
+        case ExtrapolationType::IMPLICIT_EXTRAPOLATION:
+            full_grid_smoothing_ = false;
+            levels_[level_depth].initializeExtrapolatedSmoothing(domain_geometry_, *density_profile_coefficients_,
+                                                                 DirBC_Interior_, threads_per_level_[level_depth],
+                                                                 stencil_distribution_method_, setup_reader);
+            break;
+        case ExtrapolationType::IMPLICIT_FULL_GRID_SMOOTHING:
+            full_grid_smoothing_ = true;
+            levels_[level_depth].initializeSmoothing(domain_geometry_, *density_profile_coefficients_,
+                                                     DirBC_Interior_, threads_per_level_[level_depth],
+                                                     stencil_distribution_method_, false, setup_reader);
+            break;
+        case ExtrapolationType::COMBINED:
+            full_grid_smoothing_ = true;
+            levels_[level_depth].initializeSmoothing(domain_geometry_, *density_profile_coefficients_,
+                                                     DirBC_Interior_, threads_per_level_[level_depth],
+                                                     stencil_distribution_method_, false, setup_reader);
+            levels_[level_depth].initializeExtrapolatedSmoothing(domain_geometry_, *density_profile_coefficients_,
+                                                                 DirBC_Interior_, threads_per_level_[level_depth],
+                                                                 stencil_distribution_method_, setup_reader);
+            break;
+        default:
+            full_grid_smoothing_ = false;
+            levels_[level_depth].initializeSmoothing(domain_geometry_, *density_profile_coefficients_,
+                                                     DirBC_Interior_, threads_per_level_[level_depth],
+                                                     stencil_distribution_method_, false, setup_reader);
+            levels_[level_depth].initializeExtrapolatedSmoothing(domain_geometry_, *density_profile_coefficients_,
+                                                                 DirBC_Interior_, threads_per_level_[level_depth],
+                                                                 stencil_distribution_method_, setup_reader);
+            break;
+        }
+        auto end_setup_smoother = std::chrono::high_resolution_clock::now();
+        t_setup_smoother_ += std::chrono::duration<double>(end_setup_smoother - start_setup_smoother).count();
+        levels_[level_depth].initializeResidual(domain_geometry_, *density_profile_coefficients_, DirBC_Interior_,
+                                                threads_per_level_[level_depth], stencil_distribution_method_);
+    }
+    // -------------------------- //
+    // Level n-1 (coarsest Level) //
+    // -------------------------- //
+    else if (level_depth == number_of_levels_ - 1) {
+        const StencilDistributionMethod stencil_distribution_method = levelStencilDistributionMethod(level_depth);
+        auto start_setup_directSolver = std::chrono::high_resolution_clock::now();
+        levels_[level_depth].initializeDirectSolver(domain_geometry_, *density_profile_coefficients_,
+                                                    DirBC_Interior_, threads_per_level_[level_depth],
+                                                    stencil_distribution_method, usesSinglePrecisionCycle(),
+                                                    setup_reader);
+        auto end_setup_directSolver = std::chrono::high_resolution_clock::now();
+        t_setup_directSolver_ +=
+            std::chrono::duration<double>(end_setup_directSolver - start_setup_directSolver).count();
+        levels_[level_depth].initializeResidual(domain_geometry_, *density_profile_coefficients_, DirBC_Interior_,
+                                                threads_per_level_[level_depth], stencil_distribution_method);
+    }
+    // ------------------- //
+    // Intermediate levels //
+    // ------------------- //
+    else {
+        const StencilDistributionMethod stencil_distribution_method = levelStencilDistributionMethod(level_depth);
+        auto start_setup_smoother = std::chrono::high_resolution_clock::now();
+        // Coarse levels only compute error corrections, so their smoothers may use rounded factors.
+        levels_[level_depth].initializeSmoothing(domain_geometry_, *density_profile_coefficients_, DirBC_Interior_,
+                                                 threads_per_level_[level_depth], stencil_distribution_method,
+                                                 mixed_precision_, setup_reader);
+        auto end_setup_smoother = std::chrono::high_resolution_clock::now();
+        t_setup_smoother_ += std::chrono::duration<double>(end_setup_smoother - start_setup_smoother).count();
+        levels_[level_depth].initializeResidual(domain_geometry_, *density_profile_coefficients_, DirBC_Interior_,
+                                                threads_per_level_[level_depth], stencil_distribution_method);
+        if (usesSinglePrecisionCycle() && !levels_[level_depth].hasSinglePrecision())
+            throw std::runtime_error("The operators of the coarse levels do not support single precision vectors.");
+    }
+
+    if (level_depth > 0 && usesSinglePrecisionCycle())
+        levels_[level_depth].allocateSinglePrecision();
+}
+
+// ------------------ //
+// Memory-lean levels //
+// ------------------ //
+// The Give operators evaluate uncached values on the fly, so the memory-lean mode only keeps the level cache of
+// the finest level for the Take and Assembled operators.
+static bool evaluatesOnTheFly(const bool memory_lean, const int level_depth,
+                              const StencilDistributionMethod stencil_distribution_method)
+{
+    return memory_lean && (level_depth > 0 || stencil_distribution_method == StencilDistributionMethod::CPU_GIVE);
+}
+
+bool GMGPolar::cachesDensityProfileCoefficients(const int level_depth) const
+{
+    return cache_density_profile_coefficients_ &&
+           !evaluatesOnTheFly(memory_lean_, level_depth, stencil_distribution_method_);
+}
+
+bool GMGPolar::cachesDomainGeometry(const int level_depth) const
+{
+    return cache_domain_geometry_ && !evaluatesOnTheFly(memory_lean_, level_depth, stencil_distribution_method_);
+}
+
+StencilDistributionMethod GMGPolar::levelStencilDistributionMethod(const int level_depth) const
+{
+    // The Take and Assembled operators read the cached values and cannot evaluate them on the fly.
+    if ((stencil_distribution_method_ == StencilDistributionMethod::CPU_TAKE ||
+         usesAssembledStencil(stencil_distribution_method_)) &&
+        !(cachesDensityProfileCoefficients(level_depth) && cachesDomainGeometry(level_depth))) {
+        return StencilDistributionMethod::CPU_GIVE;
+    }
+    return stencil_distribution_method_;
+}
+
+// For concentric circles with radially varying coefficients the Give operators only need one value of arr,
+// att, art, detDF and beta per circle. The Take and Assembled operators index the level cache by node.
+bool GMGPolar::usesRadialProfiles() const
+{
+    return stencil_distribution_method_ == StencilDistributionMethod::CPU_GIVE &&
+           domain_geometry_.isAngleIndependent() && density_profile_coefficients_->isAngleIndependent();
+}
+
+// Inside the multigrid cycles the solution vector of a coarse level only holds temporaries of its smoother and
+// residual, which are dead while the coarser levels are visited, so all coarse levels use the leading entries of
+// one vector. The residual of the finest level is dead during the coarse grid correction as well. Without
+// extrapolation it provides this storage, the extrapolated cycles still need it next to the injected solution of
+// level 1, which then owns the storage. The finest level and FMG, which keeps an approximation on every level,
+// need their own solution vectors. The error and rhs of a coarse level, kept in residual() and
+// error_correction(), are live while all coarser levels are visited and cannot be shared.
+bool GMGPolar::sharesSolutionStorage(const int level_depth) const
+{
+    return memory_lean_ && !FMG_ && level_depth > (extrapolation_ == ExtrapolationType::NONE ? 0 : 1);
+}
+
+// Storage of the shared solution vectors for the level after levels_.back(), see sharesSolutionStorage().
+Vector<double> GMGPolar::sharedSolutionStorage()
+{
+    return extrapolation_ == ExtrapolationType::NONE ? levels_.front().residual() : levels_.back().solution();
+}
+
+// The single precision correction cycle requires the Take operators on all coarse levels, which memoryLean()
+// replaces by Give. The implicitly extrapolated cycles keep the double precision correction.
+bool GMGPolar::usesSinglePrecisionCycle() const
+{
+    return mixed_precision_ && extrapolation_ == ExtrapolationType::NONE &&
+           stencil_distribution_method_ == StencilDistributionMethod::CPU_TAKE && !memory_lean_;
+}
+
 int GMGPolar::chooseNumberOfLevels(const PolarGrid& finestGrid)
 {
     const int minRadialNodes      = 5;
@@ -234,9 +372,15 @@ void GMGPolar::printSettings() const
 #endif
 
 #ifdef GMGPOLAR_USE_LIKWID
-    std::cout << "Likwid: ON\n";
+    std::cout << "Likwid: ON, ";
+#else
+    std::cout << "Likwid: OFF, ";
+#endif
+
+#ifdef GMGPOLAR_USE_KOKKOS_KERNELS
+    std::cout << "Kokkos kernels: ON\n";
 #else
-    std::cout << "Likwid: OFF\n";
+    std::cout << "Kokkos kernels: OFF\n";
 #endif
 
     std::cout << "------------------------------\n";
@@ -255,14 +399,36 @@ void GMGPolar::printSettings() const
     if (stencil_distribution_method_ == StencilDistributionMethod::CPU_TAKE) {
         std::cout << "A-Take (Stencil Distribution)\n";
     }
+    else if (stencil_distribution_method_ == StencilDistributionMethod::CPU_ASSEMBLED) {
+        std::cout << "A-Assembled (Stencil Distribution)\n";
+    }
+    else if (stencil_distribution_method_ == StencilDistributionMethod::CPU_ASSEMBLED_SYMMETRIC) {
+        std::cout << "A-Assembled-Symmetric (Stencil Distribution)\n";
+    }
     else {
         std::cout << "A-Give (Stencil Distribution)\n";
     }
 
-    std::cout << "Domain geometry mode:" << " " << (cache_domain_geometry_ ? "Precomputed" : "On-the-fly") << "\n";
+    if (usesRadialProfiles()) {
+        std::cout << "Domain geometry mode: Radial profiles\n";
+        std::cout << "Density profile mode: Radial profiles\n";
+    }
+    else {
+        std::cout << "Domain geometry mode:" << " " << (cache_domain_geometry_ ? "Precomputed" : "On-the-fly") << "\n";
 
-    std::cout << "Density profile mode:" << " " << (cache_density_profile_coefficients_ ? "Precomputed" : "On-the-fly")
-              << "\n";
+        std::cout << "Density profile mode:" << " "
+                  << (cache_density_profile_coefficients_ ? "Precomputed" : "On-the-fly") << "\n";
+    }
+
+    std::cout << "Smoother factorization:" << " "
+              << (mixed_precision_ ? "Single precision (coarse levels)" : "Double precision") << "\n";
+    if (usesSinglePrecisionCycle())
+        std::cout << "Coarse grid correction: Single precision vectors\n";
+
+    if (memory_lean_)
+        std::cout << "Memory-lean levels: On-the-fly evaluation"
+                  << (stencil_distribution_method_ == StencilDistributionMethod::CPU_GIVE ? "" : " (coarse levels)")
+                  << (FMG_ ? "" : ", shared solution storage") << "\n";
 
     std::cout << "------------------------------\n";
     std::cout << "---------- PolarGrid ---------\n";
@@ -369,4 +535,19 @@ void GMGPolar::printSettings() const
     else {
         std::cout << "Full-Multigrid: Disabled\n";
     }
+
+    switch (outer_solver_) {
+    case OuterSolverType::MULTIGRID_ITERATION:
+        std::cout << "Outer Solver: Multigrid Iteration\n";
+        break;
+    case OuterSolverType::PCG:
+        std::cout << "Outer Solver: Multigrid-preconditioned CG\n";
+        break;
+    case OuterSolverType::FGMRES:
+        std::cout << "Outer Solver: Multigrid-preconditioned FGMRES(" << FGMRES_restart_ << ")\n";
+        break;
+    default:
+        std::cout << "Unknown Outer Solver\n";
+        break;
+    }
 }
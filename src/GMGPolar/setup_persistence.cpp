@@ -0,0 +1,185 @@
+#include "../../include/GMGPolar/gmgpolar.h"
+
+#include <typeinfo>
+
+namespace
+{
+// Values of the density profile coefficients and the domain geometry at the (r, theta) pairs in 'points'.
+std::vector<double> fingerprintValues(const DomainGeometry& domain_geometry,
+                                      const DensityProfileCoefficients& density_profile_coefficients,
+                                      const std::vector<double>& points)
+{
+    std::vector<double> values;
+    for (std::size_t i = 0; i + 1 < points.size(); i += 2) {
+        const double r     = points[i];
+        const double theta = points[i + 1];
+        values.push_back(density_profile_coefficients.alpha(r, theta));
+        values.push_back(density_profile_coefficients.beta(r, theta));
+        values.push_back(domain_geometry.Fx(r, theta, std::sin(theta), std::cos(theta)));
+        values.push_back(domain_geometry.Fy(r, theta, std::sin(theta), std::cos(theta)));
+    }
+    return values;
+}
+} // namespace
+
+void GMGPolar::saveSetup(const std::string& path) const
+{
+    if (levels_.empty())
+        throw std::runtime_error("saveSetup() requires a previous call to setup().");
+
+    SetupWriter writer(path);
+    saveSetupConfiguration(writer);
+    for (const Level& level : levels_) {
+        level.saveSetup(writer);
+    }
+    writer.writeTag("END");
+    writer.close();
+}
+
+void GMGPolar::loadSetup(const std::string& path)
+{
+    LIKWID_START("Setup");
+    auto start_setup = std::chrono::high_resolution_clock::now();
+
+    resetSetupPhaseTimings();
+    setup_resident_set_size_ = residentSetSize();
+
+    SetupReader setup_reader(path);
+    checkSetupConfiguration(setup_reader);
+
+    // The file stores every level directly followed by its smoothers/coarse solver.
+    levels_.clear();
+    levels_.reserve(number_of_levels_);
+
+    initializeThreadsPerLevel();
+
+    for (int level_depth = 0; level_depth < number_of_levels_; level_depth++) {
+        auto start_setup_createLevels = std::chrono::high_resolution_clock::now();
+
+        setup_reader.readTag("LEVEL");
+        if (setup_reader.readValue<int>() != level_depth)
+            throw std::runtime_error("Setup file '" + path + "' is corrupted: Levels are out of order.");
+        const std::vector<double> radii  = setup_reader.readVector<double>();
+        const std::vector<double> angles = setup_reader.readVector<double>();
+        const double splitting_radius    = setup_reader.readValue<double>();
+        auto current_grid                = std::make_unique<PolarGrid>(radii, angles, splitting_radius);
+
+        if (level_depth == 0 && (current_grid->radii() != grid_.radii() || current_grid->angles() != grid_.angles()))
+            throw std::runtime_error("Setup file '" + path + "' was saved for a different finest grid.");
+
+        auto current_levelCache = std::make_unique<LevelCache>(
+            *current_grid, *density_profile_coefficients_, domain_geometry_,
+            cachesDensityProfileCoefficients(level_depth), cachesDomainGeometry(level_depth), usesRadialProfiles(),
+            setup_reader);
+        if (sharesSolutionStorage(level_depth)) {
+            levels_.emplace_back(level_depth, std::move(current_grid), std::move(current_levelCache), extrapolation_,
+                                 FMG_, &profiler_, sharedSolutionStorage());
+        }
+        else {
+            levels_.emplace_back(level_depth, std::move(current_grid), std::move(current_levelCache), extrapolation_,
+                                 FMG_, &profiler_);
+        }
+
+        auto end_setup_createLevels = std::chrono::high_resolution_clock::now();
+        t_setup_createLevels_ +=
+            std::chrono::duration<double>(end_setup_createLevels - start_setup_createLevels).count();
+
+        initializeOperators(level_depth, &setup_reader);
+    }
+    setup_reader.readTag("END");
+
+    if (autotune_threads_)
+        autotuneThreadsPerLevel();
+
+    if (paraview_) {
+        writeToVTK("output_finest_grid", levels_.front().grid());
+        writeToVTK("output_coarsest_grid", levels_.back().grid());
+    }
+
+    interpolation_ = std::make_unique<Interpolation>(threads_per_level_, DirBC_Interior_);
+
+    if (verbose_ > 0)
+        printSettings();
+
+    auto end_setup = std::chrono::high_resolution_clock::now();
+    t_setup_total_ = std::chrono::duration<double>(end_setup - start_setup).count();
+    setup_high_water_mark_ = peakResidentSetSize();
+    LIKWID_STOP("Setup");
+}
+
+// Options which determine the stored state. Options which only affect the solve phase
+// (cycle type, tolerances, threads, ...) may differ between saving and loading.
+void GMGPolar::saveSetupConfiguration(SetupWriter& writer) const
+{
+    writer.writeTag("CONFIG");
+#ifdef GMGPOLAR_USE_MUMPS
+    writer.writeValue(true);
+#else
+    writer.writeValue(false);
+#endif
+    writer.writeValue(number_of_levels_);
+    writer.writeValue(DirBC_Interior_);
+    writer.writeValue(static_cast<int>(stencil_distribution_method_));
+    writer.writeValue(static_cast<int>(extrapolation_));
+    writer.writeValue(cache_density_profile_coefficients_);
+    writer.writeValue(cache_domain_geometry_);
+    writer.writeValue(mixed_precision_);
+    writer.writeValue(memory_lean_);
+    writer.writeValue(usesRadialProfiles());
+
+    // The cached coefficients and the stencils depend on the input functions. Their types and their values at
+    // a few sample points of the finest grid identify them. The points are stored with the values, so the check
+    // does not depend on the grid of the loading solver.
+    writer.writeTag("PROBLEM");
+    writer.writeString(typeid(domain_geometry_).name());
+    writer.writeString(typeid(*density_profile_coefficients_).name());
+    std::vector<double> points;
+    for (const int i_r : {0, grid_.nr() / 2, grid_.nr() - 1}) {
+        for (const int i_theta : {0, grid_.ntheta() / 3, 2 * grid_.ntheta() / 3}) {
+            points.push_back(grid_.radius(i_r));
+            points.push_back(grid_.theta(i_theta));
+        }
+    }
+    writer.writeVector(points);
+    writer.writeVector(fingerprintValues(domain_geometry_, *density_profile_coefficients_, points));
+}
+
+void GMGPolar::checkSetupConfiguration(SetupReader& reader)
+{
+    reader.readTag("CONFIG");
+
+    auto check = [&reader](bool matches, const std::string& option) {
+        if (!matches)
+            throw std::runtime_error("Setup file '" + reader.path() + "' does not match the solver configuration: " +
+                                     option + " differs.");
+    };
+
+#ifdef GMGPOLAR_USE_MUMPS
+    check(reader.readValue<bool>() == true, "MUMPS");
+#else
+    check(reader.readValue<bool>() == false, "MUMPS");
+#endif
+    number_of_levels_ = chooseNumberOfLevels(grid_);
+    check(reader.readValue<int>() == number_of_levels_, "Number of levels");
+    check(reader.readValue<bool>() == DirBC_Interior_, "DirBC_Interior");
+    check(reader.readValue<int>() == static_cast<int>(stencil_distribution_method_), "Stencil distribution method");
+    check(reader.readValue<int>() == static_cast<int>(extrapolation_), "Extrapolation");
+    check(reader.readValue<bool>() == cache_density_profile_coefficients_, "cacheDensityProfileCoefficients");
+    check(reader.readValue<bool>() == cache_domain_geometry_, "cacheDomainGeometry");
+    check(reader.readValue<bool>() == mixed_precision_, "mixedPrecision");
+    check(reader.readValue<bool>() == memory_lean_, "memoryLean");
+    check(reader.readValue<bool>() == usesRadialProfiles(), "Radial profiles");
+
+    reader.readTag("PROBLEM");
+    check(reader.readString() == typeid(domain_geometry_).name(), "Domain geometry type");
+    check(reader.readString() == typeid(*density_profile_coefficients_).name(), "Density profile coefficients type");
+    const std::vector<double> points       = reader.readVector<double>();
+    const std::vector<double> saved_values = reader.readVector<double>();
+    const std::vector<double> values = fingerprintValues(domain_geometry_, *density_profile_coefficients_, points);
+    // A different build may round the evaluation differently.
+    bool matches = saved_values.size() == values.size();
+    for (std::size_t i = 0; matches && i < values.size(); i++) {
+        matches = std::abs(saved_values[i] - values[i]) <= 1e-12 * std::max(1.0, std::abs(values[i]));
+    }
+    check(matches, "Domain geometry or density profile coefficients");
+}
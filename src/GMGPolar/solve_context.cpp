@@ -0,0 +1,80 @@
+#include "../../include/GMGPolar/solve_context.h"
+
+SolveContext::SolveContext(const GMGPolar& solver)
+    : solver_(solver)
+{
+}
+
+void SolveContext::setSolution(const ExactSolution* exact_solution)
+{
+    solver_.setSolution(exact_solution);
+}
+
+void SolveContext::solve(const BoundaryConditions& boundary_conditions, const SourceTerm& source_term)
+{
+    solver_.solve(boundary_conditions, source_term);
+}
+void SolveContext::solve(const BoundaryConditions& boundary_conditions, const SourceTerm& source_term,
+                         ConstVector<double> initial_guess)
+{
+    solver_.solve(boundary_conditions, source_term, initial_guess);
+}
+void SolveContext::solve(const std::vector<const BoundaryConditions*>& boundary_conditions,
+                         const std::vector<const SourceTerm*>& source_terms)
+{
+    solver_.solve(boundary_conditions, source_terms);
+}
+
+Vector<double> SolveContext::solution()
+{
+    return solver_.solution();
+}
+ConstVector<double> SolveContext::solution() const
+{
+    return solver_.solution();
+}
+int SolveContext::numberOfRightHandSides() const
+{
+    return solver_.numberOfRightHandSides();
+}
+Vector<double> SolveContext::solution(int rhs_index)
+{
+    return solver_.solution(rhs_index);
+}
+ConstVector<double> SolveContext::solution(int rhs_index) const
+{
+    return solver_.solution(rhs_index);
+}
+
+int SolveContext::numberOfIterations() const
+{
+    return solver_.numberOfIterations();
+}
+const std::vector<int>& SolveContext::batchNumberOfIterations() const
+{
+    return solver_.batchNumberOfIterations();
+}
+double SolveContext::meanResidualReductionFactor() const
+{
+    return solver_.meanResidualReductionFactor();
+}
+const std::vector<double>& SolveContext::residualNorms() const
+{
+    return solver_.residualNorms();
+}
+std::optional<double> SolveContext::exactErrorWeightedEuclidean() const
+{
+    return solver_.exactErrorWeightedEuclidean();
+}
+std::optional<double> SolveContext::exactErrorInfinity() const
+{
+    return solver_.exactErrorInfinity();
+}
+const Profiler& SolveContext::profiler() const
+{
+    return solver_.profiler();
+}
+double SolveContext::timeSolveTotal() const
+{
+    return solver_.timeSolveTotal();
+}
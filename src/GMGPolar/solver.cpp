@@ -8,6 +8,25 @@
 
 void GMGPolar::solve(const BoundaryConditions& boundary_conditions, const SourceTerm& source_term)
 {
+    solveSystem(boundary_conditions, source_term, nullptr);
+}
+
+void GMGPolar::solve(const BoundaryConditions& boundary_conditions, const SourceTerm& source_term,
+                     ConstVector<double> initial_guess)
+{
+    if (initial_guess.size() != static_cast<std::size_t>(grid_.numberOfNodes()))
+        throw std::invalid_argument("Initial guess does not match the number of grid nodes.");
+    solveSystem(boundary_conditions, source_term, &initial_guess);
+}
+
+void GMGPolar::solveSystem(const BoundaryConditions& boundary_conditions, const SourceTerm& source_term,
+                           const ConstVector<double>* initial_guess)
+{
+    if (outer_solver_ != OuterSolverType::MULTIGRID_ITERATION && extrapolation_ != ExtrapolationType::NONE)
+        throw std::invalid_argument("Krylov outer solvers require ExtrapolationType::NONE.");
+
+    solve_resident_set_size_ = residentSetSize();
+
     auto start_setup_rhs = std::chrono::high_resolution_clock::now();
 
     /* ------------------------------------- */
@@ -37,15 +56,19 @@ void GMGPolar::solve(const BoundaryConditions& boundary_conditions, const Source
     LIKWID_START("Solve");
     auto start_solve = std::chrono::high_resolution_clock::now();
 
-    // Clear solve-phase timings
+    // Clear solve-phase timings and the convergence history of a previous solve
     resetSolvePhaseTimings();
+    profiler_.reset(threads_per_level_);
+    residual_norms_.clear();
+    exact_errors_.clear();
 
     /* ---------------------------- */
     /* Initialize starting solution */
     /* ---------------------------- */
     auto start_initial_approximation = std::chrono::high_resolution_clock::now();
 
-    initializeSolution();
+    initializeSolution(initial_guess);
+    relative_to_rhs_norm_ = FMG_ || initial_guess != nullptr;
 
     auto end_initial_approximation = std::chrono::high_resolution_clock::now();
     t_solve_initial_approximation_ =
@@ -66,80 +89,102 @@ void GMGPolar::solve(const BoundaryConditions& boundary_conditions, const Source
 
     printIterationHeader(exact_solution_);
 
-    while (number_of_iterations_ < max_iterations_) {
-        /* ---------------------------------------------- */
-        /* Test solution against exact solution if given. */
-        /* ---------------------------------------------- */
-        LIKWID_STOP("Solver");
-        auto start_check_exact_error = std::chrono::high_resolution_clock::now();
-
-        if (exact_solution_ != nullptr)
-            evaluateExactError(level, *exact_solution_);
-
-        auto end_check_exact_error = std::chrono::high_resolution_clock::now();
-        t_check_exact_error_ += std::chrono::duration<double>(end_check_exact_error - start_check_exact_error).count();
-        LIKWID_START("Solver");
-
-        /* ---------------------------- */
-        /* Compute convergence criteria */
-        /* ---------------------------- */
-        auto start_check_convergence = std::chrono::high_resolution_clock::now();
-
-        if (absolute_tolerance_.has_value() || relative_tolerance_.has_value()) {
-            updateResidualNorms(level, number_of_iterations_, initial_residual_norm, current_residual_norm,
-                                current_relative_residual_norm);
-        }
+    switch (outer_solver_) {
+    case OuterSolverType::PCG:
+        preconditionedConjugateGradient(initial_residual_norm, current_residual_norm, current_relative_residual_norm);
+        break;
+    case OuterSolverType::FGMRES:
+        flexibleGMRES(initial_residual_norm, current_residual_norm, current_relative_residual_norm);
+        break;
+    default:
+        record_cycle_residual_norm_ =
+            fused_convergence_check_ && (absolute_tolerance_.has_value() || relative_tolerance_.has_value());
+
+        while (number_of_iterations_ < max_iterations_) {
+            /* ---------------------------------------------- */
+            /* Test solution against exact solution if given. */
+            /* ---------------------------------------------- */
+            LIKWID_STOP("Solver");
+            auto start_check_exact_error = std::chrono::high_resolution_clock::now();
+
+            if (exact_solution_ != nullptr)
+                evaluateExactError(level, *exact_solution_);
+
+            auto end_check_exact_error = std::chrono::high_resolution_clock::now();
+            t_check_exact_error_ += std::chrono::duration<double>(end_check_exact_error - start_check_exact_error).count();
+            LIKWID_START("Solver");
+
+            /* ---------------------------- */
+            /* Compute convergence criteria */
+            /* ---------------------------- */
+            auto start_check_convergence = std::chrono::high_resolution_clock::now();
+
+            if (absolute_tolerance_.has_value() || relative_tolerance_.has_value()) {
+                updateResidualNorms(level, number_of_iterations_, initial_residual_norm, current_residual_norm,
+                                    current_relative_residual_norm);
+            }
 
-        auto end_check_convergence = std::chrono::high_resolution_clock::now();
-        t_check_convergence_ += std::chrono::duration<double>(end_check_convergence - start_check_convergence).count();
+            auto end_check_convergence = std::chrono::high_resolution_clock::now();
+            t_check_convergence_ += std::chrono::duration<double>(end_check_convergence - start_check_convergence).count();
 
-        printIterationInfo(number_of_iterations_, current_residual_norm, current_relative_residual_norm,
-                           exact_solution_);
+            printIterationInfo(number_of_iterations_, current_residual_norm, current_relative_residual_norm,
+                               exact_solution_);
 
-        if (converged(current_residual_norm, current_relative_residual_norm))
-            break;
+            if (converged(current_residual_norm, current_relative_residual_norm))
+                break;
 
-        /* ----------------------- */
-        /* Perform Multigrid Cycle */
-        /* ----------------------- */
-        auto start_solve_multigrid_iterations = std::chrono::high_resolution_clock::now();
+            /* ----------------------- */
+            /* Perform Multigrid Cycle */
+            /* ----------------------- */
+            auto start_solve_multigrid_iterations = std::chrono::high_resolution_clock::now();
 
-        switch (multigrid_cycle_) {
-        case MultigridCycleType::V_CYCLE:
-            if (extrapolation_ == ExtrapolationType::NONE) {
-                multigrid_V_Cycle(level.level_depth(), level.solution(), level.rhs(), level.residual());
-            }
-            else {
-                implicitlyExtrapolatedMultigrid_V_Cycle(level.level_depth(), level.solution(), level.rhs(),
-                                                        level.residual());
-            }
-            break;
-        case MultigridCycleType::W_CYCLE:
-            if (extrapolation_ == ExtrapolationType::NONE) {
-                multigrid_W_Cycle(level.level_depth(), level.solution(), level.rhs(), level.residual());
-            }
-            else {
-                implicitlyExtrapolatedMultigrid_W_Cycle(level.level_depth(), level.solution(), level.rhs(),
-                                                        level.residual());
-            }
-            break;
-        case MultigridCycleType::F_CYCLE:
-            if (extrapolation_ == ExtrapolationType::NONE) {
-                multigrid_F_Cycle(level.level_depth(), level.solution(), level.rhs(), level.residual());
-            }
-            else {
-                implicitlyExtrapolatedMultigrid_F_Cycle(level.level_depth(), level.solution(), level.rhs(),
-                                                        level.residual());
+            switch (multigrid_cycle_) {
+            case MultigridCycleType::V_CYCLE:
+                if (extrapolation_ == ExtrapolationType::NONE) {
+                    multigrid_V_Cycle(level.level_depth(), level.solution(), level.rhs(), level.residual());
+                }
+                else {
+                    implicitlyExtrapolatedMultigrid_V_Cycle(level.level_depth(), level.solution(), level.rhs(),
+                                                            level.residual());
+                }
+                break;
+            case MultigridCycleType::W_CYCLE:
+                if (extrapolation_ == ExtrapolationType::NONE) {
+                    multigrid_W_Cycle(level.level_depth(), level.solution(), level.rhs(), level.residual());
+                }
+                else {
+                    implicitlyExtrapolatedMultigrid_W_Cycle(level.level_depth(), level.solution(), level.rhs(),
+                                                            level.residual());
+                }
+                break;
+            case MultigridCycleType::F_CYCLE:
+                if (extrapolation_ == ExtrapolationType::NONE) {
+                    multigrid_F_Cycle(level.level_depth(), level.solution(), level.rhs(), level.residual());
+                }
+                else {
+                    implicitlyExtrapolatedMultigrid_F_Cycle(level.level_depth(), level.solution(), level.rhs(),
+                                                            level.residual());
+                }
+                break;
+            default:
+                throw std::invalid_argument("Unknown MultigridCycleType");
             }
-            break;
-        default:
-            throw std::invalid_argument("Unknown MultigridCycleType");
-        }
-        number_of_iterations_++;
+            number_of_iterations_++;
 
-        auto end_solve_multigrid_iterations = std::chrono::high_resolution_clock::now();
-        t_solve_multigrid_iterations_ +=
-            std::chrono::duration<double>(end_solve_multigrid_iterations - start_solve_multigrid_iterations).count();
+            auto end_solve_multigrid_iterations = std::chrono::high_resolution_clock::now();
+            t_solve_multigrid_iterations_ +=
+                std::chrono::duration<double>(end_solve_multigrid_iterations - start_solve_multigrid_iterations).count();
+        }
+        if (record_cycle_residual_norm_ && number_of_iterations_ == max_iterations_ && number_of_iterations_ > 0) {
+            // The fused norms belong to earlier iterates, so the final norm is the residual of the returned solution.
+            auto start_check_convergence = std::chrono::high_resolution_clock::now();
+            recordResidualNorm(level, iterateResidualNorm(level), initial_residual_norm, current_residual_norm,
+                               current_relative_residual_norm);
+            auto end_check_convergence = std::chrono::high_resolution_clock::now();
+            t_check_convergence_ += std::chrono::duration<double>(end_check_convergence - start_check_convergence).count();
+        }
+        record_cycle_residual_norm_ = false;
+        break;
     }
 
     /* ---------------------- */
@@ -154,6 +199,7 @@ void GMGPolar::solve(const BoundaryConditions& boundary_conditions, const Source
         t_avg_MGC_postSmoothing_ /= number_of_iterations_;
         t_avg_MGC_residual_ /= number_of_iterations_;
         t_avg_MGC_directSolver_ /= number_of_iterations_;
+        t_avg_MGC_krylov_ /= number_of_iterations_;
 
         /* -------------------------------- */
         /* Compute the reduction factor rho */
@@ -170,6 +216,7 @@ void GMGPolar::solve(const BoundaryConditions& boundary_conditions, const Source
 
     auto end_solve = std::chrono::high_resolution_clock::now();
     t_solve_total_ = std::chrono::duration<double>(end_solve - start_solve).count() - t_check_exact_error_;
+    solve_high_water_mark_ = peakResidentSetSize();
     LIKWID_STOP("Solve");
 
     if (paraview_) {
@@ -181,13 +228,222 @@ void GMGPolar::solve(const BoundaryConditions& boundary_conditions, const Source
     }
 }
 
+// =============================================================================
+//   Batched Solver Routine
+// =============================================================================
+
+void GMGPolar::solve(const std::vector<const BoundaryConditions*>& boundary_conditions,
+                     const std::vector<const SourceTerm*>& source_terms)
+{
+    const int number_of_rhs = static_cast<int>(source_terms.size());
+    if (number_of_rhs == 0)
+        throw std::invalid_argument("Batched solve requires at least one source term.");
+    if (boundary_conditions.size() != 1 && boundary_conditions.size() != source_terms.size())
+        throw std::invalid_argument("Batched solve requires one boundary condition or one per source term.");
+    for (std::size_t i = 0; i < boundary_conditions.size(); i++) {
+        if (boundary_conditions[i] == nullptr)
+            throw std::invalid_argument("Batched solve received a null boundary condition.");
+    }
+    for (std::size_t i = 0; i < source_terms.size(); i++) {
+        if (source_terms[i] == nullptr)
+            throw std::invalid_argument("Batched solve received a null source term.");
+    }
+
+    // Column-major storage: column i holds solution(i) in [i*n, (i+1)*n).
+    const std::size_t batch_size = static_cast<std::size_t>(number_of_rhs) * grid_.numberOfNodes();
+    if (batch_solutions_.size() != batch_size) {
+        batch_solutions_ = Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace>("batch_solutions", batch_size);
+    }
+    number_of_rhs_ = number_of_rhs;
+    batch_number_of_iterations_.assign(number_of_rhs, 0);
+
+    // The plain V-, W- and F-cycle iterations run on all columns at once. Extrapolation, FMG, the single precision
+    // correction of mixedPrecision() and the Krylov solvers, as well as the exact error and the ParaView output,
+    // solve the columns one after another.
+    if (outer_solver_ == OuterSolverType::MULTIGRID_ITERATION && extrapolation_ == ExtrapolationType::NONE && !FMG_ &&
+        !usesSinglePrecisionCycle() && exact_solution_ == nullptr && !paraview_) {
+        solveBatch(boundary_conditions, source_terms);
+        return;
+    }
+
+    // The operators, LevelCache and factorizations built in setup() are shared by all columns.
+    // Only the rhs-dependent work is repeated, the timings below are accumulated over the batch.
+    double batch_setup_rhs             = 0.0;
+    double batch_solve_total           = 0.0;
+    double batch_initial_approximation = 0.0;
+    double batch_multigrid_iterations  = 0.0;
+    double batch_check_convergence     = 0.0;
+    double batch_check_exact_error     = 0.0;
+    Profiler batch_profiler;
+
+    for (int rhs_index = 0; rhs_index < number_of_rhs; rhs_index++) {
+        const BoundaryConditions* bc =
+            boundary_conditions.size() == 1 ? boundary_conditions[0] : boundary_conditions[rhs_index];
+
+        solve(*bc, *source_terms[rhs_index]);
+
+        Kokkos::deep_copy(solution(rhs_index), levels_[0].solution());
+        batch_number_of_iterations_[rhs_index] = number_of_iterations_;
+
+        batch_setup_rhs += t_setup_rhs_;
+        batch_solve_total += t_solve_total_;
+        batch_initial_approximation += t_solve_initial_approximation_;
+        batch_multigrid_iterations += t_solve_multigrid_iterations_;
+        batch_check_convergence += t_check_convergence_;
+        batch_check_exact_error += t_check_exact_error_;
+        batch_profiler.accumulate(profiler_);
+    }
+
+    t_setup_rhs_                   = batch_setup_rhs;
+    t_solve_total_                 = batch_solve_total;
+    t_solve_initial_approximation_ = batch_initial_approximation;
+    t_solve_multigrid_iterations_  = batch_multigrid_iterations;
+    t_check_convergence_           = batch_check_convergence;
+    t_check_exact_error_           = batch_check_exact_error;
+    profiler_                      = batch_profiler;
+}
+
+// The columns are kept in the batch vectors of the levels. Every multigrid cycle smooths and computes the residual
+// of all active columns at once, see batchedMultigridCycle. A converged column is copied to batch_solutions_
+// and replaced by the last active column, so the active columns always lead the batch vectors.
+void GMGPolar::solveBatch(const std::vector<const BoundaryConditions*>& boundary_conditions,
+                          const std::vector<const SourceTerm*>& source_terms)
+{
+    const int number_of_rhs = number_of_rhs_;
+    Level& level            = levels_[0];
+    const std::size_t n     = level.grid().numberOfNodes();
+
+    solve_resident_set_size_ = residentSetSize();
+
+    auto start_setup_rhs = std::chrono::high_resolution_clock::now();
+
+    for (Level& current_level : levels_) {
+        current_level.allocateBatch(number_of_rhs);
+    }
+    Vector<double> batch_solution = level.batchSolution();
+    Vector<double> batch_rhs      = level.batchRhs();
+    Vector<double> batch_residual = level.batchResidual();
+
+    for (int column = 0; column < number_of_rhs; column++) {
+        const BoundaryConditions& bc = boundary_conditions.size() == 1 ? *boundary_conditions[0]
+                                                                       : *boundary_conditions[column];
+        build_rhs_f(level, batchColumn(batch_rhs, column, n), bc, *source_terms[column]);
+        discretize_rhs_f(level, batchColumn(batch_rhs, column, n));
+    }
+
+    auto end_setup_rhs = std::chrono::high_resolution_clock::now();
+    t_setup_rhs_       = std::chrono::duration<double>(end_setup_rhs - start_setup_rhs).count();
+
+    LIKWID_START("Solve");
+    auto start_solve = std::chrono::high_resolution_clock::now();
+
+    resetSolvePhaseTimings();
+    profiler_.reset(threads_per_level_);
+    residual_norms_.clear();
+    exact_errors_.clear();
+
+    auto start_initial_approximation = std::chrono::high_resolution_clock::now();
+
+    assign(batch_solution, 0.0);
+    relative_to_rhs_norm_ = false;
+
+    auto end_initial_approximation = std::chrono::high_resolution_clock::now();
+    t_solve_initial_approximation_ =
+        std::chrono::duration<double>(end_initial_approximation - start_initial_approximation).count();
+
+    resetAvgMultigridCycleTimings();
+
+    // rhs_index[column] is the right-hand side held by a column of the batch vectors.
+    std::vector<int> rhs_index(number_of_rhs);
+    std::vector<double> initial_residual_norms(number_of_rhs, 1.0);
+    for (int column = 0; column < number_of_rhs; column++) {
+        rhs_index[column] = column;
+    }
+    int active_columns = number_of_rhs;
+
+    auto finishColumn = [&](const int column) {
+        Kokkos::deep_copy(solution(rhs_index[column]), batchColumn(batch_solution, column, n));
+        batch_number_of_iterations_[rhs_index[column]] = number_of_iterations_;
+
+        const int last = active_columns - 1;
+        if (column != last) {
+            Kokkos::deep_copy(batchColumn(batch_solution, column, n), batchColumn(batch_solution, last, n));
+            Kokkos::deep_copy(batchColumn(batch_rhs, column, n), batchColumn(batch_rhs, last, n));
+            rhs_index[column]              = rhs_index[last];
+            initial_residual_norms[column] = initial_residual_norms[last];
+        }
+        active_columns--;
+    };
+
+    const bool check_convergence = absolute_tolerance_.has_value() || relative_tolerance_.has_value();
+    number_of_iterations_        = 0;
+
+    while (number_of_iterations_ < max_iterations_) {
+        /* ---------------------------- */
+        /* Compute convergence criteria */
+        /* ---------------------------- */
+        if (check_convergence) {
+            auto start_check_convergence = std::chrono::high_resolution_clock::now();
+
+            level.computeResidualBatch(batch_residual, batch_rhs, batch_solution, active_columns);
+            // Backwards, so every column moved into a finished one has already been checked.
+            for (int column = active_columns - 1; column >= 0; column--) {
+                const double residual_norm =
+                    residualNorm(residual_norm_type_, level, batchColumn(batch_residual, column, n));
+                if (number_of_iterations_ == 0)
+                    initial_residual_norms[column] = residual_norm;
+                if (converged(residual_norm, residual_norm / initial_residual_norms[column]))
+                    finishColumn(column);
+            }
+
+            auto end_check_convergence = std::chrono::high_resolution_clock::now();
+            t_check_convergence_ +=
+                std::chrono::duration<double>(end_check_convergence - start_check_convergence).count();
+        }
+        if (active_columns == 0)
+            break;
+
+        /* ----------------------- */
+        /* Perform Multigrid Cycle */
+        /* ----------------------- */
+        auto start_solve_multigrid_iterations = std::chrono::high_resolution_clock::now();
+
+        batchedMultigridCycle(0, multigrid_cycle_, batch_solution, batch_rhs, batch_residual, active_columns);
+        number_of_iterations_++;
+
+        auto end_solve_multigrid_iterations = std::chrono::high_resolution_clock::now();
+        t_solve_multigrid_iterations_ +=
+            std::chrono::duration<double>(end_solve_multigrid_iterations - start_solve_multigrid_iterations).count();
+    }
+    while (active_columns > 0) {
+        finishColumn(active_columns - 1);
+    }
+
+    if (number_of_iterations_ > 0) {
+        t_avg_MGC_total_ = t_solve_multigrid_iterations_ / number_of_iterations_;
+        t_avg_MGC_preSmoothing_ /= number_of_iterations_;
+        t_avg_MGC_postSmoothing_ /= number_of_iterations_;
+        t_avg_MGC_residual_ /= number_of_iterations_;
+        t_avg_MGC_directSolver_ /= number_of_iterations_;
+    }
+
+    auto end_solve = std::chrono::high_resolution_clock::now();
+    t_solve_total_ = std::chrono::duration<double>(end_solve - start_solve).count();
+    solve_high_water_mark_ = peakResidentSetSize();
+    LIKWID_STOP("Solve");
+}
+
 // =============================================================================
 //   Solution Initialization
 // =============================================================================
 
-void GMGPolar::initializeSolution()
+void GMGPolar::initializeSolution(const ConstVector<double>* initial_guess)
 {
-    if (!FMG_) {
+    if (initial_guess != nullptr) {
+        Level& level = levels_[0];
+        Kokkos::deep_copy(level.solution(), *initial_guess); // Warm start from the given approximation
+    }
+    else if (!FMG_) {
         int start_level_depth = 0;
         Level& level          = levels_[start_level_depth];
         assign(level.solution(), 0.0); // Assign zero initial guess if not using FMG
@@ -268,6 +524,9 @@ void GMGPolar::initializeSolution()
 
 double GMGPolar::residualNorm(const ResidualNormType& norm_type, const Level& level, ConstVector<double> residual) const
 {
+    // The norms only run in parallel for more than 10'000 entries.
+    ProfileScope profile(&profiler_, level.level_depth(), ProfiledOperation::NORM,
+                         residual.size() > 10'000 ? omp_get_max_threads() : 1);
     switch (norm_type) {
     case ResidualNormType::EUCLIDEAN:
         return l2_norm(residual);
@@ -283,21 +542,23 @@ double GMGPolar::residualNorm(const ResidualNormType& norm_type, const Level& le
 void GMGPolar::updateResidualNorms(Level& level, int iteration, double& initial_residual_norm,
                                    double& current_residual_norm, double& current_relative_residual_norm)
 {
-    level.computeResidual(level.residual(), level.rhs(), level.solution());
-    if (extrapolation_ != ExtrapolationType::NONE) {
-        Level& next_level = levels_[level.level_depth() + 1];
-        injection(level.level_depth(), next_level.solution(), level.solution());
-        next_level.computeResidual(next_level.residual(), next_level.rhs(), next_level.solution());
-        extrapolatedResidual(level.level_depth(), level.residual(), next_level.residual());
+    if (record_cycle_residual_norm_ && iteration > 0) {
+        // Fused convergence check: The previous multigrid cycle already stored the norm of its residual before the
+        // coarse grid correction, which belongs to the presmoothed previous iterate. Once this norm meets the
+        // tolerance, it is replaced by the residual norm of the current iterate, so the iteration only stops on
+        // the residual of the solution it returns.
+        recordResidualNorm(level, cycle_residual_norm_, initial_residual_norm, current_residual_norm,
+                           current_relative_residual_norm);
+        if (converged(current_residual_norm, current_relative_residual_norm)) {
+            residual_norms_.pop_back();
+            recordResidualNorm(level, iterateResidualNorm(level), initial_residual_norm, current_residual_norm,
+                               current_relative_residual_norm);
+        }
     }
-
-    current_residual_norm = residualNorm(residual_norm_type_, level, level.residual());
-    residual_norms_.push_back(current_residual_norm);
-
-    if (number_of_iterations_ == 0) {
-        initial_residual_norm = !FMG_ ? current_residual_norm : residualNorm(residual_norm_type_, level, level.rhs());
+    else {
+        recordResidualNorm(level, iterateResidualNorm(level), initial_residual_norm, current_residual_norm,
+                           current_relative_residual_norm);
     }
-    current_relative_residual_norm = current_residual_norm / initial_residual_norm;
 
     // Combined Smoothing: If small residual reduction, turn off full grid smoothing.
     if (number_of_iterations_ > 0) {
@@ -313,6 +574,31 @@ void GMGPolar::updateResidualNorms(Level& level, int iteration, double& initial_
     }
 }
 
+double GMGPolar::iterateResidualNorm(Level& level)
+{
+    level.computeResidual(level.residual(), level.rhs(), level.solution());
+    if (extrapolation_ != ExtrapolationType::NONE) {
+        Level& next_level = levels_[level.level_depth() + 1];
+        injection(level.level_depth(), next_level.solution(), level.solution());
+        next_level.computeResidual(next_level.residual(), next_level.rhs(), next_level.solution());
+        extrapolatedResidual(level.level_depth(), level.residual(), next_level.residual());
+    }
+    return residualNorm(residual_norm_type_, level, level.residual());
+}
+
+void GMGPolar::recordResidualNorm(const Level& level, double residual_norm, double& initial_residual_norm,
+                                  double& current_residual_norm, double& current_relative_residual_norm)
+{
+    current_residual_norm = residual_norm;
+    residual_norms_.push_back(current_residual_norm);
+
+    if (number_of_iterations_ == 0) {
+        initial_residual_norm =
+            !relative_to_rhs_norm_ ? current_residual_norm : residualNorm(residual_norm_type_, level, level.rhs());
+    }
+    current_relative_residual_norm = current_residual_norm / initial_residual_norm;
+}
+
 void GMGPolar::extrapolatedResidual(const int current_level, Vector<double> residual,
                                     ConstVector<double> residual_next_level)
 {
@@ -450,7 +736,7 @@ void GMGPolar::printIterationHeader(const ExactSolution* exact_solution)
     std::cout << std::setw(3 + table_spacing) << "it";
     if (absolute_tolerance_.has_value() || relative_tolerance_.has_value()) {
         std::cout << std::setw(9 + table_spacing) << "||r_k||";
-        if (!FMG_)
+        if (!relative_to_rhs_norm_)
             std::cout << std::setw(15 + table_spacing) << "||r_k||/||r_0||";
         else
             std::cout << std::setw(15 + table_spacing) << "||r_k||/||rhs||";
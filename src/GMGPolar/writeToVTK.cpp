@@ -1,64 +1,122 @@
 #include "../../include/GMGPolar/gmgpolar.h"
 
-void GMGPolar::writeToVTK(const std::filesystem::path& file_path, const PolarGrid& grid)
-{
-    const auto filename = file_path.stem().string() + ".vtu";
-
-    std::ofstream file(file_path.parent_path() / filename);
-    if (!file.is_open()) {
-        throw std::runtime_error("Failed to open file '" + (file_path.parent_path() / filename).string() + "'");
-    }
+#include "../../include/common/vtk_writer.h"
 
-    file << "<?xml version=\"1.0\"?>\n"
-         << "<VTKFile type=\"UnstructuredGrid\" version=\"0.1\" byte_order=\"LittleEndian\">\n"
-         << "<UnstructuredGrid>\n"
-         << "<Piece NumberOfPoints=\"" << grid.numberOfNodes() << "\" NumberOfCells=\""
-         << (grid.nr() - 1) * grid.ntheta() << "\">\n";
-
-    // Write points
-    file << "<Points>\n"
-         << "<DataArray type=\"Float64\" NumberOfComponents=\"3\" format=\"ascii\">\n";
-    int i_r, i_theta;
-    double r, theta;
-    for (int index = 0; index < grid.numberOfNodes(); index++) {
-        grid.multiIndex(index, i_r, i_theta);
-        r                = grid.radius(i_r);
-        theta            = grid.theta(i_theta);
-        double sin_theta = std::sin(theta);
-        double cos_theta = std::cos(theta);
-        file << domain_geometry_.Fx(r, theta, sin_theta, cos_theta) << " "
-             << domain_geometry_.Fy(r, theta, sin_theta, cos_theta) << " " << 0 << "\n";
+namespace
+{
+// Writes the mapped grid and optionally a grid function to 'file_path' with the extension of the format.
+// The points and the cells are computed into buffers in parallel before they are encoded.
+// The unstructured grid keeps the node indices of the PolarGrid and stores the quadrilaterals explicitly.
+// The structured grid orders the points circle by circle, the first angle is repeated at the end of every
+// circle to close the annulus, and VTK derives the cells from the extent.
+void writeGridToVTK(const std::filesystem::path& file_path, const ParaviewFormat format, const int num_threads,
+                    const PolarGrid& grid, const DomainGeometry& domain_geometry, const double* sin_theta,
+                    const double* cos_theta, const double* grid_function)
+{
+    const bool structured = format == ParaviewFormat::STRUCTURED;
+
+    VTKEncoding encoding = VTKEncoding::ASCII;
+    if (format == ParaviewFormat::BINARY)
+        encoding = VTKEncoding::RAW;
+    else if (format == ParaviewFormat::COMPRESSED)
+        encoding = VTKEncoding::ZLIB;
+    else if (structured) {
+#ifdef GMGPOLAR_USE_ZLIB
+        encoding = VTKEncoding::ZLIB;
+#else
+        encoding = VTKEncoding::RAW;
+#endif
     }
-    file << "</DataArray>\n"
-         << "</Points>\n";
 
-    // Write cells
-    file << "<Cells>\n";
-    file << "<DataArray type=\"Int32\" Name=\"connectivity\" format=\"ascii\">\n";
-    for (int i_r = 0; i_r < grid.nr() - 1; i_r++) {
-        for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
-            file << grid.index(i_r, i_theta) << " " << grid.index(i_r + 1, i_theta) << " "
-                 << grid.index(i_r + 1, i_theta + 1) << " " << grid.index(i_r, i_theta + 1) << "\n";
+    const int nr                       = grid.nr();
+    const int ntheta                   = grid.ntheta();
+    const int circle_points            = structured ? ntheta + 1 : ntheta;
+    const std::size_t number_of_points = static_cast<std::size_t>(nr) * circle_points;
+    const std::size_t number_of_cells  = static_cast<std::size_t>(nr - 1) * ntheta;
+
+    // Points (Fx, Fy, 0) and, for the structured grid, the grid function in the order of the points.
+    std::vector<double> points(3 * number_of_points);
+    std::vector<double> point_values(structured && grid_function ? number_of_points : 0);
+    parallelFor(0, nr, num_threads, [&](int i_r) {
+        const double r = grid.radius(i_r);
+        for (int i_theta = 0; i_theta < circle_points; i_theta++) {
+            const int j             = i_theta < ntheta ? i_theta : 0;
+            const double theta      = grid.theta(j);
+            const int node          = grid.index(i_r, j);
+            const std::size_t point = structured ? static_cast<std::size_t>(i_r) * circle_points + i_theta : node;
+            points[3 * point]       = domain_geometry.Fx(r, theta, sin_theta[j], cos_theta[j]);
+            points[3 * point + 1]   = domain_geometry.Fy(r, theta, sin_theta[j], cos_theta[j]);
+            points[3 * point + 2]   = 0.0;
+            if (!point_values.empty())
+                point_values[point] = grid_function[node];
         }
+    });
+
+    const std::string type = structured ? "StructuredGrid" : "UnstructuredGrid";
+    const auto filename    = file_path.stem().string() + (structured ? ".vts" : ".vtu");
+    VTKWriter writer(file_path.parent_path() / filename, type, encoding, num_threads);
+
+    // Cells of the unstructured grid, declared here since binary arrays are only written by finish().
+    std::vector<std::int32_t> connectivity, offsets;
+    std::vector<std::uint8_t> types;
+
+    if (structured) {
+        const std::string extent = "0 " + std::to_string(ntheta) + " 0 " + std::to_string(nr - 1) + " 0 0";
+        writer.openElement(type, "WholeExtent=\"" + extent + "\"");
+        writer.openElement("Piece", "Extent=\"" + extent + "\"");
+        writer.openElement("Points");
+        writer.dataArray("Points", 3, points.data(), number_of_points);
+        writer.closeElement("Points");
     }
-    file << "</DataArray>\n";
-
-    file << "<DataArray type=\"Int32\" Name=\"offsets\" format=\"ascii\">\n";
-    for (int i = 0; i < (grid.nr() - 1) * grid.ntheta(); i++) {
-        file << 4 * (i + 1) << " ";
+    else {
+        writer.openElement(type);
+        writer.openElement("Piece", "NumberOfPoints=\"" + std::to_string(number_of_points) + "\" NumberOfCells=\"" +
+                                        std::to_string(number_of_cells) + "\"");
+        writer.openElement("Points");
+        writer.dataArray("Points", 3, points.data(), number_of_points);
+        writer.closeElement("Points");
+
+        connectivity.resize(4 * number_of_cells);
+        offsets.resize(number_of_cells);
+        types.assign(number_of_cells, 9); // VTK_QUAD
+        parallelFor(0, nr - 1, num_threads, [&](int i_r) {
+            for (int i_theta = 0; i_theta < ntheta; i_theta++) {
+                const std::size_t cell     = static_cast<std::size_t>(i_r) * ntheta + i_theta;
+                connectivity[4 * cell]     = grid.index(i_r, i_theta);
+                connectivity[4 * cell + 1] = grid.index(i_r + 1, i_theta);
+                connectivity[4 * cell + 2] = grid.index(i_r + 1, i_theta + 1);
+                connectivity[4 * cell + 3] = grid.index(i_r, i_theta + 1);
+                offsets[cell]              = static_cast<std::int32_t>(4 * (cell + 1));
+            }
+        });
+        writer.openElement("Cells");
+        writer.dataArray("connectivity", 1, connectivity.data(), connectivity.size());
+        writer.dataArray("offsets", 1, offsets.data(), offsets.size());
+        writer.dataArray("types", 1, types.data(), types.size());
+        writer.closeElement("Cells");
     }
-    file << "</DataArray>\n";
 
-    file << "<DataArray type=\"UInt8\" Name=\"types\" format=\"ascii\">\n";
-    for (int i = 0; i < (grid.nr() - 1) * grid.ntheta(); i++) {
-        file << "9 "; // VTK_QUAD
+    if (grid_function) {
+        writer.openElement("PointData", "Scalars=\"FunctionValues\"");
+        writer.dataArray("FunctionValues", 1, structured ? point_values.data() : grid_function, number_of_points);
+        writer.closeElement("PointData");
     }
-    file << "</DataArray>\n";
 
-    file << "</Cells>\n"
-         << "</Piece>\n"
-         << "</UnstructuredGrid>\n"
-         << "</VTKFile>\n";
+    writer.closeElement("Piece");
+    writer.closeElement(type);
+    writer.finish();
+}
+} // namespace
+
+void GMGPolar::writeToVTK(const std::filesystem::path& file_path, const PolarGrid& grid)
+{
+    std::vector<double> sin_theta(grid.ntheta()), cos_theta(grid.ntheta());
+    for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+        sin_theta[i_theta] = std::sin(grid.theta(i_theta));
+        cos_theta[i_theta] = std::cos(grid.theta(i_theta));
+    }
+    writeGridToVTK(file_path, paraview_format_, max_omp_threads_, grid, domain_geometry_, sin_theta.data(),
+                   cos_theta.data(), nullptr);
 }
 
 void GMGPolar::writeToVTK(const std::filesystem::path& file_path, const Level& level, ConstVector<double> grid_function)
@@ -68,77 +126,6 @@ void GMGPolar::writeToVTK(const std::filesystem::path& file_path, const Level& l
 
     assert(grid.numberOfNodes() == grid_function.size());
 
-    ConstVector<double> sin_theta_cache = level_cache.sin_theta();
-    ConstVector<double> cos_theta_cache = level_cache.cos_theta();
-
-    const auto filename = file_path.stem().string() + ".vtu";
-
-    std::ofstream file(file_path.parent_path() / filename);
-    if (!file.is_open())
-        throw std::runtime_error("Failed to open file '" + (file_path.parent_path() / filename).string() + "'");
-
-    file << "<?xml version=\"1.0\"?>\n"
-         << "<VTKFile type=\"UnstructuredGrid\" version=\"0.1\" byte_order=\"LittleEndian\">\n"
-         << "<UnstructuredGrid>\n"
-         << "<Piece NumberOfPoints=\"" << grid.numberOfNodes() << "\" NumberOfCells=\""
-         << (grid.nr() - 1) * grid.ntheta() << "\">\n";
-
-    // Write points
-    file << "<Points>\n"
-         << "<DataArray type=\"Float64\" NumberOfComponents=\"3\" format=\"ascii\">\n";
-    int i_r, i_theta;
-    double r, theta;
-    double sin_theta, cos_theta;
-    for (int index = 0; index < grid.numberOfNodes(); index++) {
-        grid.multiIndex(index, i_r, i_theta);
-        r         = grid.radius(i_r);
-        theta     = grid.theta(i_theta);
-        sin_theta = sin_theta_cache[i_theta];
-        cos_theta = cos_theta_cache[i_theta];
-        file << domain_geometry_.Fx(r, theta, sin_theta, cos_theta) << " "
-             << domain_geometry_.Fy(r, theta, sin_theta, cos_theta) << " " << 0 << "\n";
-    }
-
-    file << "</DataArray>\n"
-         << "</Points>\n";
-    file << "<Cells>\n";
-
-    // Connectivity
-    file << "<DataArray type=\"Int32\" Name=\"connectivity\" format=\"ascii\">\n";
-    for (int i_r = 0; i_r < grid.nr() - 1; i_r++) {
-        for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
-            file << grid.index(i_r, i_theta) << " " << grid.index(i_r + 1, i_theta) << " "
-                 << grid.index(i_r + 1, i_theta + 1) << " " << grid.index(i_r, i_theta + 1) << "\n";
-        }
-    }
-
-    file << "</DataArray>\n";
-
-    file << "<DataArray type=\"Int32\" Name=\"offsets\" format=\"ascii\">\n";
-    for (int i = 0; i < (grid.nr() - 1) * grid.ntheta(); i++) {
-        file << 4 * (i + 1) << " ";
-    }
-
-    file << "</DataArray>\n";
-    // Cell types
-    file << "<DataArray type=\"UInt8\" Name=\"types\" format=\"ascii\">\n";
-    for (int i = 0; i < (grid.nr() - 1) * grid.ntheta(); ++i) {
-        file << "9 "; // VTK_QUAD
-    }
-
-    file << "</DataArray>\n";
-    file << "</Cells>\n";
-    file << "<PointData Scalars=\"FunctionValues\">\n";
-
-    file << "<DataArray type=\"Float32\" Name=\"FunctionValues\" format=\"ascii\">";
-
-    for (int i = 0; i < grid.numberOfNodes(); i++) {
-        file << grid_function[i] << "\n";
-    }
-
-    file << "</DataArray>\n"
-         << "</PointData>\n"
-         << "</Piece>\n"
-         << "</UnstructuredGrid>\n"
-         << "</VTKFile>\n";
+    writeGridToVTK(file_path, paraview_format_, max_omp_threads_, grid, domain_geometry_,
+                   level_cache.sin_theta().data(), level_cache.cos_theta().data(), grid_function.data());
 }
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/BoundaryConditions/cartesianR2_Boundary_CircularGeometry.h"
 
 CartesianR2_Boundary_CircularGeometry::CartesianR2_Boundary_CircularGeometry(const double& Rmax)
@@ -8,13 +9,15 @@ CartesianR2_Boundary_CircularGeometry::CartesianR2_Boundary_CircularGeometry(con
 double CartesianR2_Boundary_CircularGeometry::u_D(const double& r, const double& theta, const double& sin_theta,
                                                   const double& cos_theta) const
 {
-    return (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-           cos(2.0 * M_PI * (r / Rmax) * cos_theta);
+    const double s  = r / Rmax;
+    const double t0 = 2.0 * M_PI * s;
+    return -(s * s - 1.0) * sin(sin_theta * t0) * cos(cos_theta * t0);
 }
 
 double CartesianR2_Boundary_CircularGeometry::u_D_Interior(const double& r, const double& theta,
                                                            const double& sin_theta, const double& cos_theta) const
 {
-    return (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-           cos(2.0 * M_PI * (r / Rmax) * cos_theta);
-}
\ No newline at end of file
+    const double s  = r / Rmax;
+    const double t0 = 2.0 * M_PI * s;
+    return -(s * s - 1.0) * sin(sin_theta * t0) * cos(cos_theta * t0);
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/BoundaryConditions/cartesianR2_Boundary_CzarnyGeometry.h"
 
 void CartesianR2_Boundary_CzarnyGeometry::initializeGeometry()
@@ -18,19 +19,19 @@ CartesianR2_Boundary_CzarnyGeometry::CartesianR2_Boundary_CzarnyGeometry(const d
 double CartesianR2_Boundary_CzarnyGeometry::u_D(const double& r, const double& theta, const double& sin_theta,
                                                 const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (2.0 * (r / Rmax) * cos_theta + inverse_aspect_ratio_epsilon) + 1.0);
-    return (1.0 - (r / Rmax) * (r / Rmax)) *
-           sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / (2.0 - temp)) *
-           cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon);
+    const double s  = r / Rmax;
+    const double t0 = 2.0 * s;
+    const double t1 = sqrt(inverse_aspect_ratio_epsilon * (cos_theta * t0 + inverse_aspect_ratio_epsilon) + 1.0);
+    return (s * s - 1.0) * sin(M_PI * ellipticity_e * factor_xi * sin_theta * t0 / (t1 - 2.0)) * cos(2.0 * M_PI * (t1 -
+           1.0) / inverse_aspect_ratio_epsilon);
 }
 
 double CartesianR2_Boundary_CzarnyGeometry::u_D_Interior(const double& r, const double& theta, const double& sin_theta,
                                                          const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (2.0 * (r / Rmax) * cos_theta + inverse_aspect_ratio_epsilon) + 1.0);
-    return (1.0 - (r / Rmax) * (r / Rmax)) *
-           sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / (2.0 - temp)) *
-           cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon);
+    const double s  = r / Rmax;
+    const double t0 = 2.0 * s;
+    const double t1 = sqrt(inverse_aspect_ratio_epsilon * (cos_theta * t0 + inverse_aspect_ratio_epsilon) + 1.0);
+    return (s * s - 1.0) * sin(M_PI * ellipticity_e * factor_xi * sin_theta * t0 / (t1 - 2.0)) * cos(2.0 * M_PI * (t1 -
+           1.0) / inverse_aspect_ratio_epsilon);
 }
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/BoundaryConditions/cartesianR6_Boundary_ShafranovGeometry.h"
 
 CartesianR6_Boundary_ShafranovGeometry::CartesianR6_Boundary_ShafranovGeometry(const double& Rmax,
@@ -12,17 +13,25 @@ CartesianR6_Boundary_ShafranovGeometry::CartesianR6_Boundary_ShafranovGeometry(c
 double CartesianR6_Boundary_ShafranovGeometry::u_D(const double& r, const double& theta, const double& sin_theta,
                                                    const double& cos_theta) const
 {
-    return 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-           sin(M_PI * (2.0 * elongation_kappa * (r / Rmax) * sin_theta + 2.0 * (r / Rmax) * sin_theta)) *
-           cos(M_PI * ((-2.0) * shift_delta * ((r / Rmax) * (r / Rmax)) -
-                       2.0 * elongation_kappa * (r / Rmax) * cos_theta + 2.0 * (r / Rmax) * cos_theta));
+    const double s  = r / Rmax;
+    const double t0 = 2.0 * M_PI * s;
+    const double p0 = s - 1.0;
+    const double p1 = p0 * p0;
+    const double p2 = s + 1.0;
+    const double p3 = p2 * p2;
+    return 0.4096 * (p1 * p1 * p1) * (p3 * p3 * p3) * sin(sin_theta * t0 * (elongation_kappa + 1.0)) * cos(t0 *
+           (cos_theta * (elongation_kappa - 1.0) + s * shift_delta));
 }
 
 double CartesianR6_Boundary_ShafranovGeometry::u_D_Interior(const double& r, const double& theta,
                                                             const double& sin_theta, const double& cos_theta) const
 {
-    return 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-           sin(M_PI * (2.0 * elongation_kappa * (r / Rmax) * sin_theta + 2.0 * (r / Rmax) * sin_theta)) *
-           cos(M_PI * ((-2.0) * shift_delta * ((r / Rmax) * (r / Rmax)) -
-                       2.0 * elongation_kappa * (r / Rmax) * cos_theta + 2.0 * (r / Rmax) * cos_theta));
+    const double s  = r / Rmax;
+    const double t0 = 2.0 * M_PI * s;
+    const double p0 = s - 1.0;
+    const double p1 = p0 * p0;
+    const double p2 = s + 1.0;
+    const double p3 = p2 * p2;
+    return 0.4096 * (p1 * p1 * p1) * (p3 * p3 * p3) * sin(sin_theta * t0 * (elongation_kappa + 1.0)) * cos(t0 *
+           (cos_theta * (elongation_kappa - 1.0) + s * shift_delta));
 }
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/BoundaryConditions/polarR6_Boundary_ShafranovGeometry.h"
 
 PolarR6_Boundary_ShafranovGeometry::PolarR6_Boundary_ShafranovGeometry(const double& Rmax,
@@ -12,11 +13,19 @@ PolarR6_Boundary_ShafranovGeometry::PolarR6_Boundary_ShafranovGeometry(const dou
 double PolarR6_Boundary_ShafranovGeometry::u_D(const double& r, const double& theta, const double& sin_theta,
                                                const double& cos_theta) const
 {
-    return 0.4096 * pow((r / Rmax), 6.0) * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta);
+    const double s  = r / Rmax;
+    const double p0 = s * s;
+    const double p1 = s - 1.0;
+    const double p2 = p1 * p1;
+    return 0.4096 * (p0 * p0 * p0) * (p2 * p2 * p2) * cos(11.0 * theta);
 }
 
 double PolarR6_Boundary_ShafranovGeometry::u_D_Interior(const double& r, const double& theta, const double& sin_theta,
                                                         const double& cos_theta) const
 {
-    return 0.4096 * pow((r / Rmax), 6.0) * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta);
-}
\ No newline at end of file
+    const double s  = r / Rmax;
+    const double p0 = s * s;
+    const double p1 = s - 1.0;
+    const double p2 = p1 * p1;
+    return 0.4096 * (p0 * p0 * p0) * (p2 * p2 * p2) * cos(11.0 * theta);
+}
@@ -0,0 +1,65 @@
+#include "../include/InputFunctions/DensityProfileCoefficients/tabulatedDensityProfileCoefficients.h"
+
+TabulatedDensityProfileCoefficients::TabulatedDensityProfileCoefficients(const std::string& path,
+                                                                         const double& alpha_jump)
+    : table_(std::make_shared<const TabulatedTable>(path))
+    , alpha_jump_(alpha_jump)
+{
+    if (table_->fields() != 2)
+        throw std::runtime_error("TabulatedDensityProfileCoefficients: The table '" + path +
+                                 "' must hold the two fields alpha and beta.");
+}
+
+double TabulatedDensityProfileCoefficients::alpha(const double& r, const double& theta) const
+{
+    return table_->value(0, table_->radialStencil(r), table_->angularStencil(theta));
+}
+
+double TabulatedDensityProfileCoefficients::beta(const double& r, const double& theta) const
+{
+    return table_->value(1, table_->radialStencil(r), table_->angularStencil(theta));
+}
+
+double TabulatedDensityProfileCoefficients::getAlphaJump() const
+{
+    return alpha_jump_;
+}
+
+bool TabulatedDensityProfileCoefficients::isAngleIndependent() const
+{
+    return table_->ntheta() == 1;
+}
+
+void TabulatedDensityProfileCoefficients::evaluateCircle(const double r, const int count, const double* theta,
+                                                         double* alpha, double* beta) const
+{
+    const TabulatedTable::Stencil radial = table_->radialStencil(r);
+    if (isAngleIndependent()) {
+        const TabulatedTable::Stencil angular = table_->angularStencil(0.0);
+        if (alpha)
+            std::fill_n(alpha, count, table_->value(0, radial, angular));
+        if (beta)
+            std::fill_n(beta, count, table_->value(1, radial, angular));
+        return;
+    }
+    for (int i = 0; i < count; i++) {
+        const TabulatedTable::Stencil angular = table_->angularStencil(theta[i]);
+        if (alpha)
+            alpha[i] = table_->value(0, radial, angular);
+        if (beta)
+            beta[i] = table_->value(1, radial, angular);
+    }
+}
+
+void TabulatedDensityProfileCoefficients::evaluateRadialLine(const int count, const double* r, const double theta,
+                                                             double* alpha, double* beta) const
+{
+    const TabulatedTable::Stencil angular = table_->angularStencil(theta);
+    for (int i = 0; i < count; i++) {
+        const TabulatedTable::Stencil radial = table_->radialStencil(r[i]);
+        if (alpha)
+            alpha[i] = table_->value(0, radial, angular);
+        if (beta)
+            beta[i] = table_->value(1, radial, angular);
+    }
+}
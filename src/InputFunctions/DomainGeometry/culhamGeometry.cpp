@@ -1,14 +1,22 @@
 #include "../include/InputFunctions/DomainGeometry/culhamGeometry.h"
 
-CulhamGeometry::CulhamGeometry(const double& Rmax)
+#include <algorithm>
+#include <stdexcept>
+
+CulhamGeometry::CulhamGeometry(const double& Rmax, const int profile_intervals)
     : Rmax(Rmax)
+    , profile_intervals(profile_intervals)
 {
+    if (profile_intervals != 0 && profile_intervals < 4)
+        throw std::runtime_error("CulhamGeometry: profile_intervals must be 0 or at least 4.");
     initializeGeometry();
+    initializeProfileTable();
 }
 
 CulhamGeometry::CulhamGeometry()
 {
     initializeGeometry();
+    initializeProfileTable();
 }
 
 void CulhamGeometry::initializeGeometry()
@@ -106,3 +114,74 @@ void CulhamGeometry::initializeGeometry()
         Delta_array[i_0001] -= current_Delta_a;
     }
 }
+
+void CulhamGeometry::initializeProfileTable()
+{
+    const int n = profile_intervals;
+    if (n == 0)
+        return;
+    const double h = 1.0 / n;
+
+    // Samples of the eight profiles at the nodes. P and dP are set to zero at the origin itself,
+    // the table follows their limit instead.
+    std::vector<std::array<double, 8>> values(n + 1);
+    for (int k = 0; k <= n; k++) {
+        const double rr                 = std::max(k * h, 1e-12);
+        const RadialProfiles profile    = referenceProfiles(rr);
+        const RadialProfiles derivative = referenceProfileDerivatives(rr);
+        values[k]                       = {profile.Delta,    profile.E,    profile.T,    profile.P,
+                                           derivative.Delta, derivative.E, derivative.T, derivative.P};
+    }
+
+    // Slopes at the nodes by fourth order finite differences, one-sided at the ends.
+    std::vector<std::array<double, 8>> slopes(n + 1);
+    for (int j = 0; j < 8; j++) {
+        auto f = [&](const int k) {
+            return values[k][j];
+        };
+        slopes[0][j] = (-25.0 * f(0) + 48.0 * f(1) - 36.0 * f(2) + 16.0 * f(3) - 3.0 * f(4)) / 12.0;
+        slopes[1][j] = (-3.0 * f(0) - 10.0 * f(1) + 18.0 * f(2) - 6.0 * f(3) + f(4)) / 12.0;
+        for (int k = 2; k <= n - 2; k++)
+            slopes[k][j] = (f(k - 2) - 8.0 * f(k - 1) + 8.0 * f(k + 1) - f(k + 2)) / 12.0;
+        slopes[n - 1][j] = (3.0 * f(n) + 10.0 * f(n - 1) - 18.0 * f(n - 2) + 6.0 * f(n - 3) - f(n - 4)) / 12.0;
+        slopes[n][j]     = (25.0 * f(n) - 48.0 * f(n - 1) + 36.0 * f(n - 2) - 16.0 * f(n - 3) + 3.0 * f(n - 4)) / 12.0;
+    }
+
+    // Cubic Hermite polynomials in the local coordinate t in [0, 1] of each interval. The ODE solution starts
+    // from prescribed values, it is not smooth in the first step and the first interval is kept linear.
+    profile_table.resize(static_cast<size_t>(n) * coefficients_per_interval);
+    for (int k = 0; k < n; k++) {
+        double* coefficients = &profile_table[static_cast<size_t>(k) * coefficients_per_interval];
+        for (int j = 0; j < 8; j++) {
+            const double f0 = values[k][j], f1 = values[k + 1][j];
+            const double d0 = k == 0 ? f1 - f0 : slopes[k][j];
+            const double d1 = k == 0 ? f1 - f0 : slopes[k + 1][j];
+            coefficients[4 * j + 0] = f0;
+            coefficients[4 * j + 1] = d0;
+            coefficients[4 * j + 2] = 3.0 * (f1 - f0) - 2.0 * d0 - d1;
+            coefficients[4 * j + 3] = 2.0 * (f0 - f1) + d0 + d1;
+        }
+    }
+}
+
+double CulhamGeometry::profileTableError() const
+{
+    if (profile_table.empty())
+        return 0.0;
+    double error = 0.0;
+    for (int k = 1; k <= 2000; k++) {
+        const double rr                           = k / 2000.0;
+        const RadialProfiles profile              = profiles(rr);
+        const RadialProfiles derivative           = profileDerivatives(rr);
+        const RadialProfiles reference            = referenceProfiles(rr);
+        const RadialProfiles reference_derivative = referenceProfileDerivatives(rr);
+        for (const double difference : {profile.Delta - reference.Delta, profile.E - reference.E,
+                                        profile.T - reference.T, profile.P - reference.P,
+                                        derivative.Delta - reference_derivative.Delta,
+                                        derivative.E - reference_derivative.E, derivative.T - reference_derivative.T,
+                                        derivative.P - reference_derivative.P}) {
+            error = std::max(error, std::abs(difference));
+        }
+    }
+    return error;
+}
@@ -0,0 +1,88 @@
+#include "../include/InputFunctions/DomainGeometry/tabulatedGeometry.h"
+
+TabulatedGeometry::TabulatedGeometry(const std::string& path)
+    : table_(std::make_shared<const TabulatedTable>(path))
+{
+    if (table_->fields() != 2)
+        throw std::runtime_error("TabulatedGeometry: The table '" + path + "' must hold the two fields Fx and Fy.");
+}
+
+double TabulatedGeometry::Fx(const double& r, const double& theta, const double& sin_theta,
+                             const double& cos_theta) const
+{
+    return table_->value(0, table_->radialStencil(r), table_->angularStencil(theta));
+}
+
+double TabulatedGeometry::Fy(const double& r, const double& theta, const double& sin_theta,
+                             const double& cos_theta) const
+{
+    return table_->value(1, table_->radialStencil(r), table_->angularStencil(theta));
+}
+
+double TabulatedGeometry::dFx_dr(const double& r, const double& theta, const double& sin_theta,
+                                 const double& cos_theta) const
+{
+    double value, d_dr, d_dtheta;
+    table_->interpolate(0, table_->radialStencil(r), table_->angularStencil(theta), value, d_dr, d_dtheta);
+    return d_dr;
+}
+
+double TabulatedGeometry::dFy_dr(const double& r, const double& theta, const double& sin_theta,
+                                 const double& cos_theta) const
+{
+    double value, d_dr, d_dtheta;
+    table_->interpolate(1, table_->radialStencil(r), table_->angularStencil(theta), value, d_dr, d_dtheta);
+    return d_dr;
+}
+
+double TabulatedGeometry::dFx_dt(const double& r, const double& theta, const double& sin_theta,
+                                 const double& cos_theta) const
+{
+    double value, d_dr, d_dtheta;
+    table_->interpolate(0, table_->radialStencil(r), table_->angularStencil(theta), value, d_dr, d_dtheta);
+    return d_dtheta;
+}
+
+double TabulatedGeometry::dFy_dt(const double& r, const double& theta, const double& sin_theta,
+                                 const double& cos_theta) const
+{
+    double value, d_dr, d_dtheta;
+    table_->interpolate(1, table_->radialStencil(r), table_->angularStencil(theta), value, d_dr, d_dtheta);
+    return d_dtheta;
+}
+
+void TabulatedGeometry::evaluate(const TabulatedTable::Stencil& radial, const TabulatedTable::Stencil& angular,
+                                 double* Fx, double* Fy, double& dFx_dr, double& dFy_dr, double& dFx_dt,
+                                 double& dFy_dt) const
+{
+    double Fx_value, Fy_value;
+    table_->interpolate(0, radial, angular, Fx_value, dFx_dr, dFx_dt);
+    table_->interpolate(1, radial, angular, Fy_value, dFy_dr, dFy_dt);
+    if (Fx)
+        *Fx = Fx_value;
+    if (Fy)
+        *Fy = Fy_value;
+}
+
+// The radial stencil, including the search of the interval, is computed once per circle.
+void TabulatedGeometry::evaluateCircle(const double r, const int count, const double* theta,
+                                       const double* sin_theta, const double* cos_theta, double* Fx, double* Fy,
+                                       double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const
+{
+    const TabulatedTable::Stencil radial = table_->radialStencil(r);
+    for (int i = 0; i < count; i++) {
+        evaluate(radial, table_->angularStencil(theta[i]), Fx ? Fx + i : nullptr, Fy ? Fy + i : nullptr, dFx_dr[i],
+                 dFy_dr[i], dFx_dt[i], dFy_dt[i]);
+    }
+}
+
+void TabulatedGeometry::evaluateRadialLine(const int count, const double* r, const double theta,
+                                           const double sin_theta, const double cos_theta, double* Fx, double* Fy,
+                                           double* dFx_dr, double* dFy_dr, double* dFx_dt, double* dFy_dt) const
+{
+    const TabulatedTable::Stencil angular = table_->angularStencil(theta);
+    for (int i = 0; i < count; i++) {
+        evaluate(table_->radialStencil(r[i]), angular, Fx ? Fx + i : nullptr, Fy ? Fy + i : nullptr, dFx_dr[i],
+                 dFy_dr[i], dFx_dt[i], dFy_dt[i]);
+    }
+}
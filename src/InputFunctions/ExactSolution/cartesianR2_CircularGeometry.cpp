@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/ExactSolution/cartesianR2_CircularGeometry.h"
 
 CartesianR2_CircularGeometry::CartesianR2_CircularGeometry(const double& Rmax)
@@ -8,6 +9,7 @@ CartesianR2_CircularGeometry::CartesianR2_CircularGeometry(const double& Rmax)
 double CartesianR2_CircularGeometry::exact_solution(const double& r, const double& theta, const double& sin_theta,
                                                     const double& cos_theta) const
 {
-    return (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-           cos(2.0 * M_PI * (r / Rmax) * cos_theta);
-}
\ No newline at end of file
+    const double s  = r / Rmax;
+    const double t0 = 2.0 * M_PI * s;
+    return -(s * s - 1.0) * sin(sin_theta * t0) * cos(cos_theta * t0);
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/ExactSolution/cartesianR2_ShafranovGeometry.h"
 
 CartesianR2_ShafranovGeometry::CartesianR2_ShafranovGeometry(const double& Rmax, const double& elongation_kappa,
@@ -11,8 +12,8 @@ CartesianR2_ShafranovGeometry::CartesianR2_ShafranovGeometry(const double& Rmax,
 double CartesianR2_ShafranovGeometry::exact_solution(const double& r, const double& theta, const double& sin_theta,
                                                      const double& cos_theta) const
 {
-    return (1.0 - (r / Rmax) * (r / Rmax)) *
-           sin(M_PI * (2.0 * elongation_kappa * (r / Rmax) * sin_theta + 2.0 * (r / Rmax) * sin_theta)) *
-           cos(M_PI * ((-2.0) * shift_delta * ((r / Rmax) * (r / Rmax)) -
-                       2.0 * elongation_kappa * (r / Rmax) * cos_theta + 2.0 * (r / Rmax) * cos_theta));
-}
\ No newline at end of file
+    const double s  = r / Rmax;
+    const double t0 = 2.0 * M_PI * s;
+    return -(s * s - 1.0) * sin(sin_theta * t0 * (elongation_kappa + 1.0)) * cos(t0 * (cos_theta * (elongation_kappa -
+           1.0) + s * shift_delta));
+}
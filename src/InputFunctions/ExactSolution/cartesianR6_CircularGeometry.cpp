@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/ExactSolution/cartesianR6_CircularGeometry.h"
 
 CartesianR6_CircularGeometry::CartesianR6_CircularGeometry(const double& Rmax)
@@ -8,6 +9,11 @@ CartesianR6_CircularGeometry::CartesianR6_CircularGeometry(const double& Rmax)
 double CartesianR6_CircularGeometry::exact_solution(const double& r, const double& theta, const double& sin_theta,
                                                     const double& cos_theta) const
 {
-    return 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-           sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta);
-}
\ No newline at end of file
+    const double s  = r / Rmax;
+    const double t0 = 2.0 * M_PI * s;
+    const double p0 = s - 1.0;
+    const double p1 = p0 * p0;
+    const double p2 = s + 1.0;
+    const double p3 = p2 * p2;
+    return 0.4096 * (p1 * p1 * p1) * (p3 * p3 * p3) * sin(sin_theta * t0) * cos(cos_theta * t0);
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/ExactSolution/cartesianR6_CzarnyGeometry.h"
 
 void CartesianR6_CzarnyGeometry::initializeGeometry()
@@ -17,9 +18,13 @@ CartesianR6_CzarnyGeometry::CartesianR6_CzarnyGeometry(const double& Rmax, const
 double CartesianR6_CzarnyGeometry::exact_solution(const double& r, const double& theta, const double& sin_theta,
                                                   const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (2.0 * (r / Rmax) * cos_theta + inverse_aspect_ratio_epsilon) + 1.0);
-    return 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-           sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / (2.0 - temp)) *
-           cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon);
+    const double s  = r / Rmax;
+    const double t0 = 2.0 * s;
+    const double t1 = sqrt(inverse_aspect_ratio_epsilon * (cos_theta * t0 + inverse_aspect_ratio_epsilon) + 1.0);
+    const double p0 = s - 1.0;
+    const double p1 = p0 * p0;
+    const double p2 = s + 1.0;
+    const double p3 = p2 * p2;
+    return -0.4096 * (p1 * p1 * p1) * (p3 * p3 * p3) * sin(M_PI * ellipticity_e * factor_xi * sin_theta * t0 / (t1 -
+           2.0)) * cos(2.0 * M_PI * (t1 - 1.0) / inverse_aspect_ratio_epsilon);
 }
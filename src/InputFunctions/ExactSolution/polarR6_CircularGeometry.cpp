@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/ExactSolution/polarR6_CircularGeometry.h"
 
 PolarR6_CircularGeometry::PolarR6_CircularGeometry(const double& Rmax)
@@ -8,5 +9,9 @@ PolarR6_CircularGeometry::PolarR6_CircularGeometry(const double& Rmax)
 double PolarR6_CircularGeometry::exact_solution(const double& r, const double& theta, const double& sin_theta,
                                                 const double& cos_theta) const
 {
-    return 0.4096 * pow((r / Rmax), 6.0) * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta);
+    const double s  = r / Rmax;
+    const double p0 = s * s;
+    const double p1 = s - 1.0;
+    const double p2 = p1 * p1;
+    return 0.4096 * (p0 * p0 * p0) * (p2 * p2 * p2) * cos(11.0 * theta);
 }
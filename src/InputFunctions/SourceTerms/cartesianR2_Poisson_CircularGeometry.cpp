@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_Poisson_CircularGeometry.h"
 
 CartesianR2_Poisson_CircularGeometry::CartesianR2_Poisson_CircularGeometry(const double& Rmax)
@@ -8,13 +9,31 @@ CartesianR2_Poisson_CircularGeometry::CartesianR2_Poisson_CircularGeometry(const
 double CartesianR2_Poisson_CircularGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                    const double& cos_theta) const
 {
-    return 8.0 * M_PI * (r / Rmax) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-               cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-           8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-               sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-           8.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow(sin_theta, 2.0) *
-               sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-           8.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-               pow(cos_theta, 2.0) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-           4.0 * sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta);
+    const double s   = r / Rmax;
+    const double t0  = cos_theta * cos_theta;
+    const double t1  = sin_theta * sin_theta;
+    const double t2  = M_PI * s;
+    const double t3  = 2.0 * t2;
+    const double t4  = sin_theta * t3;
+    const double t5  = sin(t4);
+    const double t6  = cos_theta * t3;
+    const double t7  = cos(t6);
+    const double t8  = t5 * t7;
+    const double t9  = s * t8;
+    const double t10 = cos_theta * sin(t6);
+    const double t11 = t10 * t5;
+    const double t12 = 1.0 - (s * s);
+    const double t13 = M_PI * t12;
+    const double t14 = cos(t4);
+    const double t15 = sin_theta * t14;
+    const double t16 = t15 * t7;
+    const double t17 = 4.0 * t2;
+    const double t18 = t10 * t15;
+    const double t19 = 2.0 * t0;
+    const double t20 = M_PI * t9;
+    const double t21 = 2.0 * t1;
+    const double t22 = (M_PI * M_PI) * t12;
+    const double t23 = t22 * t8;
+    return -2.0 * (-s * (-t11 * t17 + t16 * t17 + 4.0 * t18 * t22 + t19 * t23 + t21 * t23 + t8) + M_PI * sin_theta *
+           t12 * t14 * t7 - t11 * t13 - t13 * (-t11 + t16 - t17 * t18 + t19 * t20 + t20 * t21) - t9) / (s * (t0 + t1));
 }
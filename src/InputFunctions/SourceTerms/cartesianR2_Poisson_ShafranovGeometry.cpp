@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_Poisson_ShafranovGeometry.h"
 
 CartesianR2_Poisson_ShafranovGeometry::CartesianR2_Poisson_ShafranovGeometry(const double& Rmax,
@@ -12,462 +13,71 @@ CartesianR2_Poisson_ShafranovGeometry::CartesianR2_Poisson_ShafranovGeometry(con
 double CartesianR2_Poisson_ShafranovGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                     const double& cos_theta) const
 {
-    return (-(2.0 * shift_delta * (r / Rmax) * (elongation_kappa - 1.0) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  sin_theta /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 * (r / Rmax) *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  (2.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   2.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((elongation_kappa + 1.0), 2.0) *
-                       sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       (2.0 * elongation_kappa + 2.0) * pow(sin_theta, 2.0) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) +
-              1.0 * (r / Rmax) *
-                  (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                   2.0 * elongation_kappa + 1.0) *
-                  (4.0 * M_PI * shift_delta * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   4.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.0 * (r / Rmax) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.0 * M_PI * (r / Rmax) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((elongation_kappa + 1.0), 2.0) *
-                       pow(sin_theta, 2.0) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   2.0 * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                            2.0 * cos_theta))) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 * (r / Rmax) *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       sin_theta +
-                   2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0)) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)) +
-              1.0 * (r / Rmax) *
-                  ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       sin_theta +
-                   2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0)) *
-                  ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                   2.0 * elongation_kappa + 1.0) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)) +
-              1.0 *
-                  (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                   pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                  ((-4.0) * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow((elongation_kappa + 1.0), 2.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * pow(cos_theta, 2.0) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow((2.0 * elongation_kappa - 2.0), 2.0) * pow(sin_theta, 2.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   2.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) +
-              1.0 *
-                  (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                   pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  (4.0 * elongation_kappa *
-                       (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                       sin_theta * cos_theta -
-                   1.0 / 2.0 *
-                       (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                        (2.0 * elongation_kappa - 2.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                            sin_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0) +
-                   1.0 / 2.0 *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        2.0 * (elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                        2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)) +
-              1.0 *
-                  (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                   (2.0 * elongation_kappa - 2.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  (2.0 * M_PI * ((r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   2.0 * M_PI * ((r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow((elongation_kappa + 1.0), 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       (2.0 * elongation_kappa + 2.0) * pow(sin_theta, 2.0) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 *
-                  (pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                   (elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                   pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta)) *
-                  ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) +
-              1.0 *
-                  ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                   2.0 * elongation_kappa + 1.0) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  (4.0 * elongation_kappa *
-                       (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                       sin_theta * cos_theta -
-                   1.0 / 2.0 *
-                       (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                        (2.0 * elongation_kappa - 2.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                            sin_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0) +
-                   1.0 / 2.0 *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        2.0 * (elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                        2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)))) /
-           ((r / Rmax) *
-            sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                  pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) -
-                 pow(((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                     2.0)));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = elongation_kappa + 1.0;
+    const double t1  = t0 * t0;
+    const double t2  = sin_theta * sin_theta;
+    const double t3  = elongation_kappa - 1.0;
+    const double t4  = s * shift_delta;
+    const double t5  = 2.0 * t4;
+    const double t6  = cos_theta * t3;
+    const double t7  = t5 + t6;
+    const double t8  = cos_theta * t7 + t2 * t3;
+    const double t9  = cos_theta * t1;
+    const double t10 = 2.0 * M_PI;
+    const double t11 = s * s;
+    const double t12 = t11 - 1.0;
+    const double t13 = s * t10;
+    const double t14 = t13 * (t4 + t6);
+    const double t15 = sin_theta * t0 * t13;
+    const double t16 = t0 * cos(t15);
+    const double t17 = cos_theta * t16;
+    const double t18 = sin(t15);
+    const double t19 = sin_theta * t18;
+    const double t20 = t12 * (t17 * cos(t14) + t19 * t3 * sin(t14));
+    const double t21 = -t3;
+    const double t22 = cos_theta * t21;
+    const double t23 = t22 - t5;
+    const double t24 = t21 * t23;
+    const double t25 = -t24 + t9;
+    const double t26 = M_PI * t20;
+    const double t27 = (cos_theta * cos_theta) * t1;
+    const double t28 = t2 * (t3 * t3) + t27;
+    const double t29 = t13 * (t22 - t4);
+    const double t30 = cos(t29);
+    const double t31 = t18 * t30;
+    const double t32 = s * t31;
+    const double t33 = sin_theta * t16;
+    const double t34 = t30 * t33;
+    const double t35 = -t12;
+    const double t36 = M_PI * t35;
+    const double t37 = sin(t29);
+    const double t38 = t18 * t37;
+    const double t39 = t23 * t38;
+    const double t40 = t32 - t34 * t36 + t36 * t39;
+    const double t41 = t28 * t40;
+    const double t42 = t1 * t2;
+    const double t43 = t2 * (t21 * t21);
+    const double t44 = t10 * t32;
+    const double t45 = 4.0 * M_PI * s;
+    const double t46 = M_PI * (t42 + t7 * t7);
+    const double t47 = 1.0 / t8;
+    const double t48 = sin_theta * t25;
+    const double t49 = t2 * t21;
+    const double t50 = cos_theta * t23;
+    const double t51 = t10 * t35;
+    const double t52 = M_PI * M_PI;
+    const double t53 = 2.0 * t31 * t35 * t52;
+    const double t54 = t35 * t37;
+    const double t55 = t17 * t30;
+    const double t56 = 2.0 * t11;
+    const double t57 = t19 * t21;
+    const double t58 = sin_theta * t32 * t51;
+    const double t59 = t13 * t16 * t54;
+    return -2.0 * (-s * t28 * (-shift_delta * t38 * t51 + (t23 * t23) * t53 + 4.0 * t23 * t33 * t52 * t54 + t31 + t34 *
+           t45 - t39 * t45 + t42 * t53) - sin_theta * t10 * t20 * (-t3 * t7 + t9) + sin_theta * t26 * (t21 * t5 + t25) +
+           sin_theta * t47 * t5 * (-t20 * t46 + t40 * t48) + t10 * t48 * (-t24 * t58 - t35 * t55 + t37 * t56 * t57 -
+           t49 * t59 + t50 * t59 - t54 * t57 + t55 * t56 + t58 * t9) - t35 * t46 * (-t22 * t33 * t37 * t45 - t22 * t38 +
+           t27 * t44 + t34 + t43 * t44) + t40 * (-t22 * t23 + t27 - t42 + t43) - 2.0 * t41 + t47 * (t26 * t48 - t41) *
+           (-cos_theta * t5 + t49 + t50)) / (s * t1 * (t8 * t8));
+}
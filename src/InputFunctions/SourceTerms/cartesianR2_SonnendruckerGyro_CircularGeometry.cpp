@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_SonnendruckerGyro_CircularGeometry.h"
 
 CartesianR2_SonnendruckerGyro_CircularGeometry::CartesianR2_SonnendruckerGyro_CircularGeometry(const double& Rmax)
@@ -8,50 +9,36 @@ CartesianR2_SonnendruckerGyro_CircularGeometry::CartesianR2_SonnendruckerGyro_Ci
 double CartesianR2_SonnendruckerGyro_CircularGeometry::rhs_f(const double& r, const double& theta,
                                                              const double& sin_theta, const double& cos_theta) const
 {
-    return (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-               cos(2.0 * M_PI * (r / Rmax) * cos_theta) /
-               (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) -
-           ((r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-8.0) * M_PI * (r / Rmax) * sin(theta) * cos(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos(theta)) +
-                 8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     sin(2.0 * M_PI * (r / Rmax) * cos(theta)) * cos(theta) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow(sin(theta), 2.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin(theta)) * cos(2.0 * M_PI * (r / Rmax) * cos(theta)) -
-                 8.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin(theta) *
-                     sin(2.0 * M_PI * (r / Rmax) * cos(theta)) * cos(theta) *
-                     cos(2.0 * M_PI * (r / Rmax) * sin(theta)) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     pow(cos(theta), 2.0) * cos(2.0 * M_PI * (r / Rmax) * cos(theta)) -
-                 2.0 * sin(2.0 * M_PI * (r / Rmax) * sin(theta)) * cos(2.0 * M_PI * (r / Rmax) * cos(theta))) -
-            5.03290747193186 * (r / Rmax) *
-                ((-2.0) * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos(theta)) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(theta) * cos(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos(theta)) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     sin(2.0 * M_PI * (r / Rmax) * cos(theta)) * cos(theta)) /
-                (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-2.0) * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos(theta)) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(theta) * cos(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos(theta)) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     sin(2.0 * M_PI * (r / Rmax) * cos(theta)) * cos(theta)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-4.0) * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * pow(sin(theta), 2.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin(theta)) * cos(2.0 * M_PI * (r / Rmax) * cos(theta)) +
-                 8.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin(theta) *
-                     sin(2.0 * M_PI * (r / Rmax) * cos(theta)) * cos(theta) *
-                     cos(2.0 * M_PI * (r / Rmax) * sin(theta)) -
-                 4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin(theta)) * pow(cos(theta), 2.0) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos(theta)) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(theta) * cos(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos(theta)) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin(theta)) *
-                     sin(2.0 * M_PI * (r / Rmax) * cos(theta)) * cos(theta))) /
-               (r / Rmax);
+    const double s   = r / Rmax;
+    const double t0  = 14.4444444444444 * s - 11.1111111111111;
+    const double t1  = 0.348432055749129 * atan(t0) - 0.452961672473868;
+    const double t2  = s * s - 1.0;
+    const double t3  = M_PI * s;
+    const double t4  = 2.0 * t3;
+    const double t5  = sin_theta * t4;
+    const double t6  = sin(t5);
+    const double t7  = cos_theta * t4;
+    const double t8  = cos(t7);
+    const double t9  = t6 * t8;
+    const double t10 = cos_theta * cos_theta;
+    const double t11 = sin_theta * sin_theta;
+    const double t12 = s * t9;
+    const double t13 = cos_theta * sin(t7);
+    const double t14 = t13 * t6;
+    const double t15 = -t2;
+    const double t16 = M_PI * t15;
+    const double t17 = sin_theta * cos(t5);
+    const double t18 = t17 * t8;
+    const double t19 = t12 + t14 * t16 - t16 * t18;
+    const double t20 = 2.0 * t1;
+    const double t21 = 4.0 * t3;
+    const double t22 = t13 * t17;
+    const double t23 = 2.0 * t10;
+    const double t24 = M_PI * t12;
+    const double t25 = 2.0 * t11;
+    const double t26 = (M_PI * M_PI) * t15;
+    const double t27 = t26 * t9;
+    return t2 * t9 / t1 - (10.065814943863696 * s * t19 / (t0 * t0 + 1.0) + s * t20 * (-t14 * t21 + t18 * t21 + 4.0 *
+           t22 * t26 + t23 * t27 + t25 * t27 + t9) + t16 * t20 * (-t14 + t18 - t21 * t22 + t23 * t24 + t24 * t25) +
+           t19 * t20) / (s * (t10 + t11));
 }
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_SonnendruckerGyro_CzarnyGeometry.h"
 
 void CartesianR2_SonnendruckerGyro_CzarnyGeometry::initializeGeometry()
@@ -17,1097 +18,121 @@ CartesianR2_SonnendruckerGyro_CzarnyGeometry::CartesianR2_SonnendruckerGyro_Czar
 double CartesianR2_SonnendruckerGyro_CzarnyGeometry::rhs_f(const double& r, const double& theta,
                                                            const double& sin_theta, const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return (1.0 - (r / Rmax) * (r / Rmax)) *
-               sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-               cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) /
-               (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) -
-           ((-(r / Rmax)) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp)) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                               sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp))) *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp))) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) -
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (2.0 * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 2.0 * (r / Rmax) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 4.0 * M_PI * (r / Rmax) * sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp)) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp))) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta * cos_theta_pow2 * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp)) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                      ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta_pow2 / pow((temp * temp), (3.0 / 2.0)) -
-                 4.0 * (r / Rmax) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp -
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow((2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                              cos_theta * factor_xi / (temp1 * temp) +
-                          2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                      4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp)) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta_pow2 * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 4.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 2.0 * sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp)) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                               sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp))) *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp))) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            5.03290747193186 * (r / Rmax) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                ((208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) *
-                 sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                  factor_xi / (temp1 * temp) +
-                              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                      factor_xi / (temp1 * temp) +
-                                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                             sin_theta * cos_theta / (temp * temp)),
-                            2.0)) +
-                      (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                (temp1 * temp) +
-                            ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                           2.0) +
-                       sin_theta_pow2 / (temp * temp)) *
-                          (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                               2.0) +
-                           cos_theta_pow2 / (temp * temp)))) -
-            5.03290747193186 * (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) /
-                ((208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) *
-                 sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                  factor_xi / (temp1 * temp) +
-                              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                      factor_xi / (temp1 * temp) +
-                                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                             sin_theta * cos_theta / (temp * temp)),
-                            2.0)) +
-                      (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                (temp1 * temp) +
-                            ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                           2.0) +
-                       sin_theta_pow2 / (temp * temp)) *
-                          (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                               2.0) +
-                           cos_theta_pow2 / (temp * temp)))) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (2.0 * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 2.0 * ((r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 4.0 * M_PI * ((r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                          pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                          pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                      2.0 * sin_theta * cos_theta / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta * cos_theta / (temp * temp))) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                     pow((temp * temp), 2.0) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * sin_theta * cos_theta / (temp * temp)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 cos_theta_pow2 / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                          pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                          pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                      2.0 * sin_theta * cos_theta / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta * cos_theta / (temp * temp))) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 cos_theta_pow2 / (temp * temp)) *
-                ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin_theta_pow2 * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow(((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                              factor_xi / (temp1 * temp) +
-                          2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-                 4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta_pow2 *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) -
-                 4.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                      6.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) -
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                     pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                      3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) -
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                 sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)))) /
-               ((r / Rmax) * sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) *
-                                              sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                             (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                                  cos_theta * factor_xi / (temp1 * temp) +
-                                              ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                         sin_theta * cos_theta / (temp * temp)),
-                                        2.0)) +
-                                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                            factor_xi / (temp1 * temp) +
-                                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                                       2.0) +
-                                   sin_theta_pow2 / (temp * temp)) *
-                                      (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                                cos_theta * factor_xi / (temp1 * temp) +
-                                            ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                           2.0) +
-                                       cos_theta_pow2 / (temp * temp))));
-}
\ No newline at end of file
+    const double s    = r / Rmax;
+    const double t0   = s * s;
+    const double t1   = t0 - 1.0;
+    const double t2   = 14.4444444444444 * s - 11.1111111111111;
+    const double t3   = 0.348432055749129 * atan(t2) - 0.452961672473868;
+    const double t4   = cos_theta * s;
+    const double t5   = inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * t4) + 1.0;
+    const double t6   = sqrt(t5);
+    const double t7   = t6 - 1.0;
+    const double t8   = 2.0 * M_PI;
+    const double t9   = t8 / inverse_aspect_ratio_epsilon;
+    const double t10  = t6 - 2.0;
+    const double t11  = ellipticity_e * factor_xi;
+    const double t12  = s * sin_theta;
+    const double t13  = t12 * t8;
+    const double t14  = ellipticity_e * ellipticity_e;
+    const double t15  = factor_xi * factor_xi;
+    const double t16  = -t10;
+    const double t17  = t16 * t16;
+    const double t18  = sin_theta * sin_theta;
+    const double t19  = inverse_aspect_ratio_epsilon * t4;
+    const double t20  = 1.0 / t6;
+    const double t21  = 1.0 / t16;
+    const double t22  = t20 * t21;
+    const double t23  = t19 * t22;
+    const double t24  = t23 + 1.0;
+    const double t25  = t18 * t24;
+    const double t26  = inverse_aspect_ratio_epsilon * s;
+    const double t27  = t18 * t26;
+    const double t28  = -t22 * t27;
+    const double t29  = cos_theta + t28;
+    const double t30  = cos_theta * t29;
+    const double t31  = t25 + t30;
+    const double t32  = -t1;
+    const double t33  = t11 * t21;
+    const double t34  = t13 * t33;
+    const double t35  = sin(t34);
+    const double t36  = -t7 * t9;
+    const double t37  = sin(t36);
+    const double t38  = t35 * t37;
+    const double t39  = t20 * t38;
+    const double t40  = sin_theta * t39;
+    const double t41  = cos(t34);
+    const double t42  = t29 * t41;
+    const double t43  = cos(t36);
+    const double t44  = t33 * t43;
+    const double t45  = t42 * t44;
+    const double t46  = -t40 + t45;
+    const double t47  = 1.0 / t5;
+    const double t48  = cos_theta * t47;
+    const double t49  = 1.0 / t17;
+    const double t50  = t14 * t15;
+    const double t51  = t49 * t50;
+    const double t52  = t29 * t51;
+    const double t53  = t24 * t52;
+    const double t54  = sin_theta * (t48 - t53);
+    const double t55  = M_PI * t54;
+    const double t56  = t18 * t47;
+    const double t57  = (t29 * t29) * t51;
+    const double t58  = t56 + t57;
+    const double t59  = t35 * t43;
+    const double t60  = s * t59;
+    const double t61  = cos_theta * t39;
+    const double t62  = M_PI * t32;
+    const double t63  = t41 * t44;
+    const double t64  = sin_theta * t24 * t62 * t63 - t60 + t61 * t62;
+    const double t65  = t32 * t46 * t55 + t58 * t64;
+    const double t66  = t26 * t48;
+    const double t67  = cos_theta * cos_theta;
+    const double t68  = t47 * t67;
+    const double t69  = 2.0 * t20;
+    const double t70  = 1.0 / (t5 * sqrt(t5));
+    const double t71  = t19 * t70;
+    const double t72  = 2.0 * t21 * t66 + t69 - t71;
+    const double t73  = t18 * t21;
+    const double t74  = t21 * t69;
+    const double t75  = t26 * t67;
+    const double t76  = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t77  = t0 * t76;
+    const double t78  = t70 * t73 * t77;
+    const double t79  = -2.0 * cos_theta * t49 * t56 * t77 + cos_theta * t78 + t22 * t75;
+    const double t80  = cos_theta - t27 * t74 + t79;
+    const double t81  = -2.0 * t3;
+    const double t82  = t81 / t31;
+    const double t83  = t18 * (t24 * t24) * t51;
+    const double t84  = t62 * (t68 + t83);
+    const double t85  = 2.0 * t0 * t18 * t47 * t49 * t76 - 3.0 * t23 - t78 - 1.0;
+    const double t86  = t26 * t47;
+    const double t87  = 1.0 / (t5 * t5);
+    const double t88  = t75 * t87;
+    const double t89  = t24 * t51 * t80 - t48;
+    const double t90  = sin_theta * t46;
+    const double t91  = t32 * t8;
+    const double t92  = t52 * t80 + t56;
+    const double t93  = t38 * t70;
+    const double t94  = t60 * t8;
+    const double t95  = 4.0 * M_PI;
+    const double t96  = t12 * t95;
+    const double t97  = t11 * t37;
+    const double t98  = sin_theta * t38;
+    const double t99  = sin_theta * t60 * t91;
+    const double t100 = s * t41 * t62 * t74 * t97;
+    const double t101 = t55 * (-2.0 * t0 * t45 + t0 * t69 * t98 - t100 * t25 + t100 * t30 - t32 * t40 + t32 * t63 *
+                        t80 + t32 * t71 * t98 + t48 * t99 - t53 * t99);
+    const double t102 = M_PI * M_PI;
+    const double t103 = 2.0 * t102 * t32 * t59;
+    return -t1 * sin(t11 * t13 / t10) * cos(t7 * t9) / t3 + t17 * t5 * (10.065814943863696 * s * t65 / (t2 * t2 + 1.0) +
+           sin_theta * t82 * (t46 * t84 + t54 * t64) * (cos_theta * t24 + cos_theta * t85 + t25 * t86 + t28 + t30 *
+           t86 + t79) + t65 * t82 * (cos_theta * t80 + t19 * t72 * t73 - t25 * t66 + t25 - t26 * t29 * t68) - t81 *
+           (t101 + t64 * (2.0 * cos_theta * inverse_aspect_ratio_epsilon * s * t18 * t87 - t25 * t51 * t85 + t47 * t67 -
+           t92) + t84 * (ellipticity_e * factor_xi * sin_theta * t21 * t41 * t43 * t85 - t22 * t42 * t96 * t97 - t27 *
+           t93 - t56 * t94 - t57 * t94 - t61) + t90 * t91 * (t88 + t89)) - t81 * (s * t58 * (M_PI * cos_theta *
+           ellipticity_e * factor_xi * inverse_aspect_ratio_epsilon * sin_theta * t32 * t41 * t43 * t49 * t72 + 4.0 *
+           cos_theta * ellipticity_e * factor_xi * sin_theta * t102 * t20 * t21 * t24 * t32 * t37 * t41 -
+           inverse_aspect_ratio_epsilon * t62 * t67 * t93 - t103 * t68 - t103 * t83 - t24 * t63 * t96 - t39 * t4 * t95 -
+           t59) + t101 + t62 * t90 * (-2.0 * t88 - t89 - t26 * t30 * t50 * t72 / (t16 * t16 * t16)) + 2.0 * t64 *
+           (-t18 * t19 * t87 + t92))) / (s * t14 * t15 * (t31 * t31));
+}
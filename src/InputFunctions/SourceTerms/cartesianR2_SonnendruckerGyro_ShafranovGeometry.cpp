@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_SonnendruckerGyro_ShafranovGeometry.h"
 
 CartesianR2_SonnendruckerGyro_ShafranovGeometry::CartesianR2_SonnendruckerGyro_ShafranovGeometry(
@@ -11,517 +12,77 @@ CartesianR2_SonnendruckerGyro_ShafranovGeometry::CartesianR2_SonnendruckerGyro_S
 double CartesianR2_SonnendruckerGyro_ShafranovGeometry::rhs_f(const double& r, const double& theta,
                                                               const double& sin_theta, const double& cos_theta) const
 {
-    return (1.0 - (r / Rmax) * (r / Rmax)) *
-               sin(M_PI * (2.0 * elongation_kappa * (r / Rmax) * sin_theta + 2.0 * (r / Rmax) * sin_theta)) *
-               cos(M_PI * ((-2.0) * shift_delta * ((r / Rmax) * (r / Rmax)) -
-                           2.0 * elongation_kappa * (r / Rmax) * cos_theta + 2.0 * (r / Rmax) * cos_theta)) /
-               (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) -
-           (2.0 * shift_delta * (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (elongation_kappa - 1.0) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                sin_theta /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                (2.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 2.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((elongation_kappa + 1.0), 2.0) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     (2.0 * elongation_kappa + 2.0) * pow(sin_theta, 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                (4.0 * M_PI * shift_delta * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.0 * (r / Rmax) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.0 * M_PI * (r / Rmax) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((elongation_kappa + 1.0), 2.0) *
-                     pow(sin_theta, 2.0) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 2.0 * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta))) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     sin_theta +
-                 2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     sin_theta +
-                 2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0)) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            5.03290747193186 * (r / Rmax) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                (sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                       pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                          (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                           2.0 * elongation_kappa + 1.0) -
-                      pow(((elongation_kappa - 1.0) *
-                               ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                               sin_theta +
-                           1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                          2.0)) *
-                 (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0)) -
-            5.03290747193186 * (r / Rmax) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) /
-                (sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                       pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                          (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                           2.0 * elongation_kappa + 1.0) -
-                      pow(((elongation_kappa - 1.0) *
-                               ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                               sin_theta +
-                           1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                          2.0)) *
-                 (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                 pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                ((-4.0) * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow((elongation_kappa + 1.0), 2.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * pow(cos_theta, 2.0) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((2.0 * elongation_kappa - 2.0), 2.0) *
-                     pow(sin_theta, 2.0) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 2.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                 pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (4.0 * elongation_kappa *
-                     (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     sin_theta * cos_theta -
-                 1.0 / 2.0 *
-                     (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                      (2.0 * elongation_kappa - 2.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) +
-                 1.0 / 2.0 *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      2.0 * (elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                      2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                 (2.0 * elongation_kappa - 2.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                (2.0 * M_PI * ((r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 2.0 * M_PI * ((r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow((elongation_kappa + 1.0), 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     (2.0 * elongation_kappa + 2.0) * pow(sin_theta, 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                 (elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                 pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta)) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (4.0 * elongation_kappa *
-                     (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     sin_theta * cos_theta -
-                 1.0 / 2.0 *
-                     (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                      (2.0 * elongation_kappa - 2.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) +
-                 1.0 / 2.0 *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      2.0 * (elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                      2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0))) /
-               ((r / Rmax) *
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s * s;
+    const double t1  = t0 - 1.0;
+    const double t2  = elongation_kappa + 1.0;
+    const double t3  = 2.0 * M_PI;
+    const double t4  = s * t3;
+    const double t5  = sin_theta * t2 * t4;
+    const double t6  = sin(t5);
+    const double t7  = 14.4444444444444 * s - 11.1111111111111;
+    const double t8  = 0.348432055749129 * atan(t7) - 0.452961672473868;
+    const double t9  = s * shift_delta;
+    const double t10 = elongation_kappa - 1.0;
+    const double t11 = cos_theta * t10;
+    const double t12 = t4 * (t11 + t9);
+    const double t13 = cos(t12);
+    const double t14 = t2 * t2;
+    const double t15 = sin_theta * sin_theta;
+    const double t16 = 2.0 * t9;
+    const double t17 = t11 + t16;
+    const double t18 = cos_theta * t17 + t10 * t15;
+    const double t19 = cos_theta * t14;
+    const double t20 = -t10;
+    const double t21 = cos_theta * t20;
+    const double t22 = -t16 + t21;
+    const double t23 = t20 * t22;
+    const double t24 = t19 - t23;
+    const double t25 = sin_theta * t24;
+    const double t26 = t2 * cos(t5);
+    const double t27 = cos_theta * t13 * t26 + sin_theta * t10 * t6 * sin(t12);
+    const double t28 = t1 * t27;
+    const double t29 = (cos_theta * cos_theta) * t14;
+    const double t30 = (t10 * t10) * t15 + t29;
+    const double t31 = t4 * (t21 - t9);
+    const double t32 = cos(t31);
+    const double t33 = t32 * t6;
+    const double t34 = s * t33;
+    const double t35 = -t1;
+    const double t36 = t26 * t32;
+    const double t37 = sin_theta * t36;
+    const double t38 = M_PI * t37;
+    const double t39 = sin(t31);
+    const double t40 = t39 * t6;
+    const double t41 = t35 * t40;
+    const double t42 = M_PI * t22;
+    const double t43 = t34 - t35 * t38 + t41 * t42;
+    const double t44 = t30 * t43;
+    const double t45 = M_PI * t25 * t28 - t44;
+    const double t46 = 1.0 / t18;
+    const double t47 = t14 * t15;
+    const double t48 = M_PI * (t17 * t17 + t47);
+    const double t49 = 4.0 * sin_theta;
+    const double t50 = t15 * t20;
+    const double t51 = cos_theta * t22;
+    const double t52 = 2.0 * t8;
+    const double t53 = t15 * (t20 * t20);
+    const double t54 = t3 * t34;
+    const double t55 = 4.0 * s;
+    const double t56 = t26 * t39;
+    const double t57 = cos_theta * t36;
+    const double t58 = 2.0 * t0;
+    const double t59 = sin_theta * t20;
+    const double t60 = sin_theta * t35 * t54;
+    const double t61 = t35 * t4 * t56;
+    const double t62 = -M_PI * sin_theta * t24 * (t19 * t60 - t23 * t60 - t35 * t57 + t40 * t58 * t59 - t41 * t59 -
+                       t50 * t61 + t51 * t61 + t57 * t58);
+    const double t63 = (M_PI * M_PI) * t35;
+    const double t64 = 2.0 * t33 * t63;
+    return t1 * t13 * t6 / t8 + (10.065814943863696 * s * t45 / (t7 * t7 + 1.0) + t45 * t46 * t52 * (-cos_theta * t16 +
+           t50 + t51) + t46 * t49 * t8 * t9 * (t25 * t43 - t28 * t48) + t52 * (-s * t30 * (-shift_delta * t3 * t41 +
+           (t22 * t22) * t64 + t22 * t49 * t56 * t63 + t33 + t38 * t55 - t40 * t42 * t55 + t47 * t64) + M_PI *
+           sin_theta * t1 * t27 * (t16 * t20 + t24) - 2.0 * t44 - t62) + t52 * (-sin_theta * t28 * t3 * (-t10 * t17 +
+           t19) - t35 * t48 * (-M_PI * sin_theta * t21 * t55 * t56 - t21 * t40 + t29 * t54 + t37 + t53 * t54) + t43 *
+           (-t21 * t22 + t29 - t47 + t53) - t62)) / (s * t14 * (t18 * t18));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_Sonnendrucker_CircularGeometry.h"
 
 CartesianR2_Sonnendrucker_CircularGeometry::CartesianR2_Sonnendrucker_CircularGeometry(const double& Rmax)
@@ -8,45 +9,34 @@ CartesianR2_Sonnendrucker_CircularGeometry::CartesianR2_Sonnendrucker_CircularGe
 double CartesianR2_Sonnendrucker_CircularGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                          const double& cos_theta) const
 {
-    return (-((r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((-8.0) * M_PI * (r / Rmax) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow(sin_theta, 2.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   8.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       pow(cos_theta, 2.0) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   2.0 * sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) -
-              5.03290747193186 * (r / Rmax) *
-                  ((-2.0) * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta) /
-                  (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((-2.0) * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((-4.0) * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * pow(sin_theta, 2.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   8.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-                   4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta))) /
-           (r / Rmax);
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = cos_theta * cos_theta;
+    const double t1  = sin_theta * sin_theta;
+    const double t2  = M_PI * s;
+    const double t3  = 2.0 * t2;
+    const double t4  = sin_theta * t3;
+    const double t5  = sin(t4);
+    const double t6  = cos_theta * t3;
+    const double t7  = cos(t6);
+    const double t8  = t5 * t7;
+    const double t9  = s * t8;
+    const double t10 = cos_theta * sin(t6);
+    const double t11 = t10 * t5;
+    const double t12 = 1.0 - (s * s);
+    const double t13 = M_PI * t12;
+    const double t14 = sin_theta * cos(t4);
+    const double t15 = t14 * t7;
+    const double t16 = t11 * t13 - t13 * t15 + t9;
+    const double t17 = 14.4444444444444 * s - 11.1111111111111;
+    const double t18 = 0.696864111498258 * atan(t17) - 0.905923344947736;
+    const double t19 = 4.0 * t2;
+    const double t20 = t10 * t14;
+    const double t21 = 2.0 * t0;
+    const double t22 = M_PI * t9;
+    const double t23 = 2.0 * t1;
+    const double t24 = (M_PI * M_PI) * t12;
+    const double t25 = t24 * t8;
+    return -(10.065814943863696 * s * t16 / (t17 * t17 + 1.0) + s * t18 * (-t11 * t19 + t15 * t19 + 4.0 * t20 * t24 +
+           t21 * t25 + t23 * t25 + t8) + t13 * t18 * (-t11 + t15 - t19 * t20 + t21 * t22 + t22 * t23) + t16 * t18) /
+           (s * (t0 + t1));
+}
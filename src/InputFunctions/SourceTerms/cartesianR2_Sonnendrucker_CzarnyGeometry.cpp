@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_Sonnendrucker_CzarnyGeometry.h"
 
 void CartesianR2_Sonnendrucker_CzarnyGeometry::initializeGeometry()
@@ -17,1104 +18,140 @@ CartesianR2_Sonnendrucker_CzarnyGeometry::CartesianR2_Sonnendrucker_CzarnyGeomet
 double CartesianR2_Sonnendrucker_CzarnyGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                        const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return (-((-(r / Rmax)) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp)) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp))) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) -
-              (r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  (2.0 * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / pow((temp * temp), (3.0 / 2.0)) -
-                   2.0 * (r / Rmax) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   4.0 * M_PI * (r / Rmax) * sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                        2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp)) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                   ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp))) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                   ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                            sin_theta * cos_theta_pow2 * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp)) +
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                            sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                        ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                        ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   sin_theta_pow2 / (temp * temp)) *
-                  ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta_pow2 / pow((temp * temp), (3.0 / 2.0)) -
-                   4.0 * (r / Rmax) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp -
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow((2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                cos_theta * factor_xi / (temp1 * temp) +
-                            2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                           2.0) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                        4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp)) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta_pow2 * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                   4.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   2.0 * sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   sin_theta_pow2 / (temp * temp)) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp)) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp))) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) +
-              5.03290747193186 * (r / Rmax) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                  ((208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) *
-                   sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                        factor_xi / (temp1 * temp) +
-                                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                               sin_theta * cos_theta / (temp * temp)),
-                              2.0)) +
-                        (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                  factor_xi / (temp1 * temp) +
-                              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                             2.0) +
-                         sin_theta_pow2 / (temp * temp)) *
-                            (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                      factor_xi / (temp1 * temp) +
-                                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                 2.0) +
-                             cos_theta_pow2 / (temp * temp)))) -
-              5.03290747193186 * (r / Rmax) *
-                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   sin_theta_pow2 / (temp * temp)) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) /
-                  ((208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) *
-                   sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                        factor_xi / (temp1 * temp) +
-                                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                               sin_theta * cos_theta / (temp * temp)),
-                              2.0)) +
-                        (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                  factor_xi / (temp1 * temp) +
-                              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                             2.0) +
-                         sin_theta_pow2 / (temp * temp)) *
-                            (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                      factor_xi / (temp1 * temp) +
-                                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                 2.0) +
-                             cos_theta_pow2 / (temp * temp)))) -
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  (2.0 * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / pow((temp * temp), (3.0 / 2.0)) -
-                   2.0 * ((r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   4.0 * M_PI * ((r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                   2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp2 * (temp * temp)) -
-                        4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                            pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                            pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                        2.0 * sin_theta * cos_theta / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                            pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta * cos_theta / (temp * temp))) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                       pow((temp * temp), 2.0) +
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp2 * (temp * temp)) -
-                        4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * sin_theta * cos_theta / (temp * temp)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   cos_theta_pow2 / (temp * temp)) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                            pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                            pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                        2.0 * sin_theta * cos_theta / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                            pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta * cos_theta / (temp * temp))) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   sin_theta_pow2 / (temp * temp)) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   cos_theta_pow2 / (temp * temp)) *
-                  ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin_theta_pow2 * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) /
-                       pow((temp * temp), (3.0 / 2.0)) -
-                   (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow(((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                factor_xi / (temp1 * temp) +
-                            2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                           2.0) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-                   4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta_pow2 *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) -
-                   4.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                        6.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) -
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                       pow((temp * temp), 2.0) +
-                   ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp2 * (temp * temp)) -
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                        3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) -
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                   sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))))) /
-           ((r / Rmax) * sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                          factor_xi / (temp1 * temp) +
-                                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                              cos_theta * factor_xi / (temp1 * temp) +
-                                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                     sin_theta * cos_theta / (temp * temp)),
-                                    2.0)) +
-                              (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                        factor_xi / (temp1 * temp) +
-                                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                                   2.0) +
-                               sin_theta_pow2 / (temp * temp)) *
-                                  (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                            cos_theta * factor_xi / (temp1 * temp) +
-                                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                       2.0) +
-                                   cos_theta_pow2 / (temp * temp))));
-}
\ No newline at end of file
+    const double s    = r / Rmax;
+    const double t0   = ellipticity_e * ellipticity_e;
+    const double t1   = factor_xi * factor_xi;
+    const double t2   = sin_theta * sin_theta;
+    const double t3   = inverse_aspect_ratio_epsilon * s;
+    const double t4   = t2 * t3;
+    const double t5   = cos_theta * s;
+    const double t6   = 2.0 * t5;
+    const double t7   = inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + t6) + 1.0;
+    const double t8   = sqrt(t7);
+    const double t9   = 1.0 / t8;
+    const double t10  = t8 - 2.0;
+    const double t11  = 1.0 / t10;
+    const double t12  = t11 * t9;
+    const double t13  = cos_theta + t12 * t4;
+    const double t14  = cos_theta * t13;
+    const double t15  = inverse_aspect_ratio_epsilon * t5;
+    const double t16  = t12 * t15 - 1.0;
+    const double t17  = 14.4444444444444 * s - 11.1111111111111;
+    const double t18  = s * s;
+    const double t19  = t18 - 1.0;
+    const double t20  = -t19;
+    const double t21  = t8 - 1.0;
+    const double t22  = 2.0 * M_PI;
+    const double t23  = t22 / inverse_aspect_ratio_epsilon;
+    const double t24  = -t21 * t23;
+    const double t25  = sin(t24);
+    const double t26  = -t10;
+    const double t27  = 1.0 / t26;
+    const double t28  = ellipticity_e * factor_xi;
+    const double t29  = t27 * t28;
+    const double t30  = s * t22;
+    const double t31  = sin_theta * t29 * t30;
+    const double t32  = sin(t31);
+    const double t33  = t27 * t9;
+    const double t34  = cos_theta - t33 * t4;
+    const double t35  = cos(t24);
+    const double t36  = cos(t31);
+    const double t37  = t35 * t36;
+    const double t38  = t29 * t37;
+    const double t39  = sin_theta * t25 * t32 * t9 - t34 * t38;
+    const double t40  = 1.0 / t7;
+    const double t41  = cos_theta * t40;
+    const double t42  = 1.0 / (t10 * t10);
+    const double t43  = t0 * t1;
+    const double t44  = t42 * t43;
+    const double t45  = t16 * t44;
+    const double t46  = t13 * t45;
+    const double t47  = t41 + t46;
+    const double t48  = sin_theta * t47;
+    const double t49  = M_PI * t48;
+    const double t50  = t2 * t40;
+    const double t51  = (t13 * t13) * t44 + t50;
+    const double t52  = t21 * t23;
+    const double t53  = cos(t52);
+    const double t54  = sin_theta * t28;
+    const double t55  = t11 * t54;
+    const double t56  = t30 * t55;
+    const double t57  = sin(t56);
+    const double t58  = cos_theta * t9;
+    const double t59  = sin(t52);
+    const double t60  = t57 * t59;
+    const double t61  = t19 * t60;
+    const double t62  = cos(t56);
+    const double t63  = M_PI * t19 * t62;
+    const double t64  = s * t53 * t57 - t16 * t53 * t55 * t63 - M_PI * t58 * t61;
+    const double t65  = -t20 * t39 * t49 + t51 * t64;
+    const double t66  = t16 * t2;
+    const double t67  = cos_theta * cos_theta;
+    const double t68  = t40 * t67;
+    const double t69  = t3 * t41;
+    const double t70  = 1.0 / (t7 * sqrt(t7));
+    const double t71  = t15 * t70;
+    const double t72  = 2.0 * t69;
+    const double t73  = t3 * t67;
+    const double t74  = 2.0 * t9;
+    const double t75  = t4 * t74;
+    const double t76  = cos_theta * t11;
+    const double t77  = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t78  = t18 * t77;
+    const double t79  = t2 * t70 * t78;
+    const double t80  = 2.0 * t50 * t78;
+    const double t81  = cos_theta * t42 * t80 - cos_theta - t11 * t75 + t12 * t73 + t76 * t79;
+    const double t82  = 0.696864111498258 * atan(t17) - 0.905923344947736;
+    const double t83  = t15 * t33;
+    const double t84  = t83 + 1.0;
+    const double t85  = t2 * t84;
+    const double t86  = cos_theta * t34;
+    const double t87  = t26 / (t85 + t86);
+    const double t88  = t82 * t87;
+    const double t89  = M_PI * t20;
+    const double t90  = t89 * ((t16 * t16) * t2 * t44 + t68);
+    const double t91  = t11 * t13;
+    const double t92  = t11 * t66;
+    const double t93  = t3 * t40;
+    const double t94  = t11 * t14;
+    const double t95  = 1.0 / (t26 * t26);
+    const double t96  = -2.0 * t18 * t2 * t40 * t77 * t95 + t27 * t79 + 3.0 * t83 + 1.0;
+    const double t97  = cos_theta * t27;
+    const double t98  = t11 * t81;
+    const double t99  = -t41;
+    const double t100 = 1.0 / (t7 * t7);
+    const double t101 = t100 * t73;
+    const double t102 = sin_theta * t39;
+    const double t103 = t100 * t2;
+    const double t104 = -t96;
+    const double t105 = t43 * t95;
+    const double t106 = t105 * (-cos_theta * t80 * t95 + cos_theta - t27 * t75 + t33 * t73 + t79 * t97);
+    const double t107 = t25 * t32;
+    const double t108 = t107 * t70;
+    const double t109 = t32 * t35;
+    const double t110 = t109 * t30;
+    const double t111 = 4.0 * M_PI;
+    const double t112 = s * t111;
+    const double t113 = sin_theta * t9;
+    const double t114 = t113 * t25 * t36;
+    const double t115 = sin_theta * t38;
+    const double t116 = s * sin_theta * t19 * t22 * t53 * t57;
+    const double t117 = t28 * t53 * t62;
+    const double t118 = s * t28 * t59 * t63 * t74;
+    const double t119 = sin_theta * t18 * t60 * t74 - sin_theta * t61 * t71 + t113 * t61 + t116 * t41 + t116 * t46 +
+                        2.0 * t117 * t18 * t91 - t117 * t19 * t98 - t118 * t92 - t118 * t94;
+    const double t120 = t27 * t72 - t71 + t74;
+    const double t121 = inverse_aspect_ratio_epsilon * t89;
+    const double t122 = (M_PI * M_PI) * t20;
+    const double t123 = 2.0 * t109 * t122;
+    return t10 * t7 * t87 * (10.065814943863696 * s * t65 / (t17 * t17 + 1.0) - sin_theta * t88 * (-t39 * t90 + t48 *
+           t64) * (t16 * t76 + t91 + t92 * t93 - t93 * t94 - t96 * t97 + t98) - t11 * t65 * t88 * (cos_theta * t81 +
+           t11 * t15 * t2 * (-t11 * t72 - t71 + 2.0 * t9) + t13 * t3 * t68 - t66 * t69 + t66) + t82 * (-s * t51 *
+           (-cos_theta * t120 * t121 * t37 * t54 * t95 + t105 * t123 * t2 * (t84 * t84) + t107 * t111 * t5 * t9 + t108 *
+           t121 * t67 + t109 + t112 * t115 * t84 - 4.0 * t114 * t122 * t28 * t84 * t97 + t123 * t68) + t102 * t89 *
+           (2.0 * t101 + t106 * t84 + t120 * t3 * t43 * t86 / (t26 * t26 * t26) + t99) + t119 * t49 + 2.0 * t64 *
+           (-t103 * t15 - t13 * t44 * t81 + t2 * t40)) + t82 * (M_PI * sin_theta * t119 * t47 - t102 * t20 * t22 *
+           (t101 + t45 * t81 + t99) - t64 * (-inverse_aspect_ratio_epsilon * t103 * t6 + t104 * t105 * t85 + t106 *
+           t34 + t50 - t68) - t90 * (-t104 * t115 + t105 * t110 * (t34 * t34) + t107 * t58 + t108 * t4 + t110 * t50 +
+           t112 * t114 * t29 * t34))) / (s * t0 * t1 * (-t14 + t16 * t2));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_Sonnendrucker_ShafranovGeometry.h"
 
 CartesianR2_Sonnendrucker_ShafranovGeometry::CartesianR2_Sonnendrucker_ShafranovGeometry(const double& Rmax,
@@ -12,515 +13,76 @@ CartesianR2_Sonnendrucker_ShafranovGeometry::CartesianR2_Sonnendrucker_Shafranov
 double CartesianR2_Sonnendrucker_ShafranovGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                           const double& cos_theta) const
 {
-    return (-(2.0 * shift_delta * (r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (elongation_kappa - 1.0) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  sin_theta /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              (r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  (2.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   2.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((elongation_kappa + 1.0), 2.0) *
-                       sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       (2.0 * elongation_kappa + 2.0) * pow(sin_theta, 2.0) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) +
-              (r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                   2.0 * elongation_kappa + 1.0) *
-                  (4.0 * M_PI * shift_delta * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   4.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.0 * (r / Rmax) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.0 * M_PI * (r / Rmax) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((elongation_kappa + 1.0), 2.0) *
-                       pow(sin_theta, 2.0) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   2.0 * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                            2.0 * cos_theta))) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              (r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       sin_theta +
-                   2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0)) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)) +
-              (r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       sin_theta +
-                   2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0)) *
-                  ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                   2.0 * elongation_kappa + 1.0) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)) +
-              5.03290747193186 * (r / Rmax) *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  (sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                         pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                            (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                             2.0 * elongation_kappa + 1.0) -
-                        pow(((elongation_kappa - 1.0) *
-                                 ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                 sin_theta +
-                             1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                            2.0)) *
-                   (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0)) -
-              5.03290747193186 * (r / Rmax) *
-                  ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                   2.0 * elongation_kappa + 1.0) /
-                  (sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                         pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                            (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                             2.0 * elongation_kappa + 1.0) -
-                        pow(((elongation_kappa - 1.0) *
-                                 ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                 sin_theta +
-                             1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                            2.0)) *
-                   (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0)) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                   pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                  ((-4.0) * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow((elongation_kappa + 1.0), 2.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * pow(cos_theta, 2.0) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow((2.0 * elongation_kappa - 2.0), 2.0) * pow(sin_theta, 2.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   2.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                   pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  (4.0 * elongation_kappa *
-                       (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                       sin_theta * cos_theta -
-                   1.0 / 2.0 *
-                       (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                        (2.0 * elongation_kappa - 2.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                            sin_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0) +
-                   1.0 / 2.0 *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        2.0 * (elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                        2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                   (2.0 * elongation_kappa - 2.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  (2.0 * M_PI * ((r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   2.0 * M_PI * ((r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow((elongation_kappa + 1.0), 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       (2.0 * elongation_kappa + 2.0) * pow(sin_theta, 2.0) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                   (elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                   pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta)) *
-                  ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                   2.0 * elongation_kappa + 1.0) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  (4.0 * elongation_kappa *
-                       (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                       sin_theta * cos_theta -
-                   1.0 / 2.0 *
-                       (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                        (2.0 * elongation_kappa - 2.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                            sin_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0) +
-                   1.0 / 2.0 *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        2.0 * (elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                        2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)))) /
-           ((r / Rmax) *
-            sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                  pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) -
-                 pow(((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                     2.0)));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = elongation_kappa + 1.0;
+    const double t1  = t0 * t0;
+    const double t2  = sin_theta * sin_theta;
+    const double t3  = elongation_kappa - 1.0;
+    const double t4  = s * shift_delta;
+    const double t5  = 2.0 * t4;
+    const double t6  = cos_theta * t3;
+    const double t7  = t5 + t6;
+    const double t8  = cos_theta * t7 + t2 * t3;
+    const double t9  = 14.4444444444444 * s - 11.1111111111111;
+    const double t10 = cos_theta * t1;
+    const double t11 = -t3;
+    const double t12 = cos_theta * t11;
+    const double t13 = t12 - t5;
+    const double t14 = t11 * t13;
+    const double t15 = t10 - t14;
+    const double t16 = sin_theta * t15;
+    const double t17 = s * s;
+    const double t18 = t17 - 1.0;
+    const double t19 = 2.0 * M_PI;
+    const double t20 = s * t19;
+    const double t21 = t20 * (t4 + t6);
+    const double t22 = sin_theta * t0 * t20;
+    const double t23 = t0 * cos(t22);
+    const double t24 = sin(t22);
+    const double t25 = cos_theta * t23 * cos(t21) + sin_theta * t24 * t3 * sin(t21);
+    const double t26 = t18 * t25;
+    const double t27 = (cos_theta * cos_theta) * t1;
+    const double t28 = t2 * (t3 * t3) + t27;
+    const double t29 = t20 * (t12 - t4);
+    const double t30 = cos(t29);
+    const double t31 = t24 * t30;
+    const double t32 = s * t31;
+    const double t33 = -t18;
+    const double t34 = t23 * t30;
+    const double t35 = sin_theta * t34;
+    const double t36 = M_PI * t35;
+    const double t37 = sin(t29);
+    const double t38 = t24 * t37;
+    const double t39 = t33 * t38;
+    const double t40 = M_PI * t13;
+    const double t41 = t32 - t33 * t36 + t39 * t40;
+    const double t42 = t28 * t41;
+    const double t43 = M_PI * t16 * t26 - t42;
+    const double t44 = 0.348432055749129 * atan(t9) - 0.452961672473868;
+    const double t45 = 1.0 / t8;
+    const double t46 = t1 * t2;
+    const double t47 = M_PI * (t46 + t7 * t7);
+    const double t48 = 4.0 * sin_theta;
+    const double t49 = t11 * t2;
+    const double t50 = cos_theta * t13;
+    const double t51 = 2.0 * t44;
+    const double t52 = (t11 * t11) * t2;
+    const double t53 = t19 * t32;
+    const double t54 = 4.0 * s;
+    const double t55 = t23 * t37;
+    const double t56 = cos_theta * t34;
+    const double t57 = 2.0 * t17;
+    const double t58 = sin_theta * t11;
+    const double t59 = sin_theta * t33 * t53;
+    const double t60 = t20 * t33 * t55;
+    const double t61 = -M_PI * sin_theta * t15 * (t10 * t59 - t14 * t59 - t33 * t56 + t38 * t57 * t58 - t39 * t58 -
+                       t49 * t60 + t50 * t60 + t56 * t57);
+    const double t62 = (M_PI * M_PI) * t33;
+    const double t63 = 2.0 * t31 * t62;
+    return (10.065814943863696 * s * t43 / (t9 * t9 + 1.0) + t4 * t44 * t45 * t48 * (t16 * t41 - t26 * t47) + t43 *
+           t45 * t51 * (-cos_theta * t5 + t49 + t50) + t51 * (-s * t28 * (-shift_delta * t19 * t39 + (t13 * t13) * t63 +
+           t13 * t48 * t55 * t62 + t31 + t36 * t54 - t38 * t40 * t54 + t46 * t63) + M_PI * sin_theta * t18 * t25 *
+           (t11 * t5 + t15) - 2.0 * t42 - t61) + t51 * (-sin_theta * t19 * t26 * (t10 - t3 * t7) - t33 * t47 * (-M_PI *
+           sin_theta * t12 * t54 * t55 - t12 * t38 + t27 * t53 + t35 + t52 * t53) + t41 * (-t12 * t13 + t27 - t46 +
+           t52) - t61)) / (s * t1 * (t8 * t8));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_ZoniGyro_CzarnyGeometry.h"
 
 void CartesianR2_ZoniGyro_CzarnyGeometry::initializeGeometry()
@@ -18,1097 +19,138 @@ CartesianR2_ZoniGyro_CzarnyGeometry::CartesianR2_ZoniGyro_CzarnyGeometry(const d
 double CartesianR2_ZoniGyro_CzarnyGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                   const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return (1.0 - (r / Rmax) * (r / Rmax)) * exp(tanh(10.0 * (r / Rmax) - 5.0)) *
-               sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-               cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-           ((-(r / Rmax)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) * exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (r / Rmax) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp)) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                               sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp))) *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp))) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) -
-            (r / Rmax) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (2.0 * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 2.0 * (r / Rmax) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 4.0 * M_PI * (r / Rmax) * sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp)) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp))) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (r / Rmax) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta * cos_theta_pow2 * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp)) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                      ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta_pow2 / pow((temp * temp), (3.0 / 2.0)) -
-                 4.0 * (r / Rmax) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp -
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow((2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                              cos_theta * factor_xi / (temp1 * temp) +
-                          2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                      4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp)) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta_pow2 * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 4.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 2.0 * sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp)) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                               sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp))) *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp))) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) -
-            (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                  (temp1 * temp) +
-              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-             sin_theta * cos_theta / (temp * temp)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                  (temp1 * temp) +
-              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-             sin_theta * cos_theta / (temp * temp)) *
-                (2.0 * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 2.0 * ((r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 4.0 * M_PI * ((r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                  (temp1 * temp) +
-              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-             sin_theta * cos_theta / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                          pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                          pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                      2.0 * sin_theta * cos_theta / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta * cos_theta / (temp * temp))) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            ((1.0 - (r / Rmax) * (r / Rmax)) *
-                 ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                      factor_xi / (temp1 * temp) +
-                  2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-             2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                 sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                     pow((temp * temp), 2.0) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * sin_theta * cos_theta / (temp * temp)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            ((1.0 - (r / Rmax) * (r / Rmax)) *
-                 ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                      factor_xi / (temp1 * temp) +
-                  2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-             2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                 sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 cos_theta_pow2 / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                          pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                          pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                      2.0 * sin_theta * cos_theta / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta * cos_theta / (temp * temp))) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                 2.0) +
-             sin_theta_pow2 / (temp * temp)) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                 2.0) +
-             cos_theta_pow2 / (temp * temp)) *
-                ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin_theta_pow2 * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow(((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                              factor_xi / (temp1 * temp) +
-                          2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-                 4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta_pow2 *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) -
-                 4.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                      6.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) -
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            ((-2.0) * (r / Rmax) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-             (1.0 - (r / Rmax) * (r / Rmax)) *
-                 (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                      factor_xi / (temp1 * temp) +
-                  2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-             2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                 sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                 temp) *
-                ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                     pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                      3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) -
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                 sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)))) /
-               ((r / Rmax) * sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) *
-                                              sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                             (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                                  cos_theta * factor_xi / (temp1 * temp) +
-                                              ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                         sin_theta * cos_theta / (temp * temp)),
-                                        2.0)) +
-                                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                            factor_xi / (temp1 * temp) +
-                                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                                       2.0) +
-                                   sin_theta_pow2 / (temp * temp)) *
-                                      (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                                cos_theta * factor_xi / (temp1 * temp) +
-                                            ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                           2.0) +
-                                       cos_theta_pow2 / (temp * temp))));
-}
\ No newline at end of file
+    const double s    = r / Rmax;
+    const double t0   = 2.0 * s;
+    const double t1   = tanh(5.0 * t0 - 5.0);
+    const double t2   = s * s;
+    const double t3   = t2 - 1.0;
+    const double t4   = cos_theta * t0;
+    const double t5   = inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + t4) + 1.0;
+    const double t6   = sqrt(t5);
+    const double t7   = t6 - 1.0;
+    const double t8   = 2.0 * M_PI;
+    const double t9   = t8 / inverse_aspect_ratio_epsilon;
+    const double t10  = t7 * t9;
+    const double t11  = cos(t10);
+    const double t12  = M_PI * t0;
+    const double t13  = t6 - 2.0;
+    const double t14  = 1.0 / t13;
+    const double t15  = ellipticity_e * factor_xi;
+    const double t16  = sin_theta * t15;
+    const double t17  = t14 * t16;
+    const double t18  = t12 * t17;
+    const double t19  = sin(t18);
+    const double t20  = t11 * t19 * t3;
+    const double t21  = ellipticity_e * ellipticity_e;
+    const double t22  = factor_xi * factor_xi;
+    const double t23  = 1.0 / t6;
+    const double t24  = inverse_aspect_ratio_epsilon * s;
+    const double t25  = t23 * t24;
+    const double t26  = sin_theta * sin_theta;
+    const double t27  = t14 * t26;
+    const double t28  = cos_theta + t25 * t27;
+    const double t29  = cos_theta * t28;
+    const double t30  = cos_theta * t14;
+    const double t31  = t25 * t30 - 1.0;
+    const double t32  = -t3;
+    const double t33  = -t7 * t9;
+    const double t34  = sin(t33);
+    const double t35  = -t13;
+    const double t36  = 1.0 / t35;
+    const double t37  = t15 * t36;
+    const double t38  = sin_theta * t12;
+    const double t39  = t37 * t38;
+    const double t40  = sin(t39);
+    const double t41  = t26 * t36;
+    const double t42  = cos_theta - t25 * t41;
+    const double t43  = cos(t33);
+    const double t44  = cos(t39);
+    const double t45  = t43 * t44;
+    const double t46  = t37 * t45;
+    const double t47  = sin_theta * t23 * t34 * t40 - t42 * t46;
+    const double t48  = 1.0 / t5;
+    const double t49  = cos_theta * t48;
+    const double t50  = -t49;
+    const double t51  = 1.0 / (t5 * t5);
+    const double t52  = cos_theta * cos_theta;
+    const double t53  = t24 * t52;
+    const double t54  = t23 * t53;
+    const double t55  = inverse_aspect_ratio_epsilon * t0;
+    const double t56  = t23 * t55;
+    const double t57  = 1.0 / (t5 * sqrt(t5));
+    const double t58  = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t59  = t2 * t58;
+    const double t60  = t57 * t59;
+    const double t61  = t26 * t60;
+    const double t62  = 1.0 / (t13 * t13);
+    const double t63  = t26 * t48;
+    const double t64  = 2.0 * t59 * t63;
+    const double t65  = cos_theta * t62 * t64 - cos_theta + t14 * t54 - t27 * t56 + t30 * t61;
+    const double t66  = t21 * t22;
+    const double t67  = t62 * t66;
+    const double t68  = cos_theta * t23;
+    const double t69  = sin(t10);
+    const double t70  = t19 * t69;
+    const double t71  = t3 * t70;
+    const double t72  = cos(t18);
+    const double t73  = t3 * t72;
+    const double t74  = s * t11 * t19 - M_PI * t11 * t17 * t31 * t73 - M_PI * t68 * t71;
+    const double t75  = cos_theta * t24;
+    const double t76  = t26 * t51;
+    const double t77  = t28 * t67;
+    const double t78  = 2.0 * t23;
+    const double t79  = t57 * t75;
+    const double t80  = t49 * t55;
+    const double t81  = t36 * t80 + t78 - t79;
+    const double t82  = cos_theta * t42;
+    const double t83  = cos_theta * t36;
+    const double t84  = t25 * t83;
+    const double t85  = t84 + 1.0;
+    const double t86  = 1.0 / (t35 * t35);
+    const double t87  = t66 * t86;
+    const double t88  = t87 * (-cos_theta * t64 * t86 + cos_theta + t36 * t54 - t41 * t56 + t61 * t83);
+    const double t89  = M_PI * t32;
+    const double t90  = t47 * t89;
+    const double t91  = t31 * t77;
+    const double t92  = sin_theta * (t49 + t91);
+    const double t93  = (t28 * t28) * t67 + t63;
+    const double t94  = t74 * t93 - t90 * t92;
+    const double t95  = t48 * t52;
+    const double t96  = -2.0 * t2 * t26 * t48 * t58 * t86 + t41 * t60 + 3.0 * t84 + 1.0;
+    const double t97  = -t96;
+    const double t98  = t26 * t85;
+    const double t99  = t34 * t40;
+    const double t100 = t68 * t99;
+    const double t101 = t24 * t26;
+    const double t102 = t57 * t99;
+    const double t103 = t40 * t43;
+    const double t104 = t103 * t12;
+    const double t105 = 4.0 * M_PI * s;
+    const double t106 = sin_theta * t23;
+    const double t107 = t106 * t34 * t44;
+    const double t108 = sin_theta * t46;
+    const double t109 = t89 * (t26 * (t31 * t31) * t67 + t95);
+    const double t110 = inverse_aspect_ratio_epsilon * t89;
+    const double t111 = (M_PI * M_PI) * t32;
+    const double t112 = 2.0 * t103 * t111;
+    const double t113 = t20 * t38;
+    const double t114 = t14 * t28;
+    const double t115 = t11 * t15 * t72;
+    const double t116 = t12 * t14 * t15 * t23 * t69 * t73;
+    const double t117 = t26 * t31;
+    const double t118 = t14 * t65;
+    const double t119 = t117 * t24;
+    const double t120 = t35 / (t82 + t98);
+    const double t121 = t14 * t48;
+    return t20 * exp(t1) + 2.0 * t120 * t13 * t5 * (s * t93 * (-cos_theta * t110 * t16 * t45 * t81 * t86 + t100 * t105 +
+           t102 * t110 * t52 + t103 + t105 * t108 * t85 - 4.0 * t107 * t111 * t15 * t83 * t85 + t112 * t26 * (t85 *
+           t85) * t87 + t112 * t95) - 10.0 * s * t94 * (t1 * t1 - 1.0) + sin_theta * t120 * (-t109 * t47 + t74 * t92) *
+           (t114 + t118 + t119 * t121 - t121 * t24 * t29 + t30 * t31 - t83 * t96) + sin_theta * t32 * t47 * t8 * (t31 *
+           t65 * t67 + t50 + t51 * t53) - sin_theta * t90 * (t24 * t66 * t81 * t82 / (t35 * t35 * t35) + t50 + t51 *
+           t52 * t55 + t85 * t88) + t109 * (t100 + t101 * t102 + t104 * (t42 * t42) * t87 + t104 * t63 + t105 * t107 *
+           t37 * t42 - t108 * t97) + t120 * t14 * t94 * (cos_theta * t65 + t101 * t30 * (-t14 * t80 + 2.0 * t23 - t79) +
+           t117 - t119 * t49 + t24 * t28 * t95) - 2.0 * t74 * (t26 * t48 - t65 * t77 - t75 * t76) + t74 *
+           (-inverse_aspect_ratio_epsilon * t4 * t76 + t42 * t88 + t63 + t87 * t97 * t98 - t95) - t8 * t92 *
+           (sin_theta * t2 * t70 * t78 - sin_theta * t71 * t79 + t106 * t71 + t113 * t49 + t113 * t91 + 2.0 * t114 *
+           t115 * t2 - t115 * t118 * t3 - t116 * t117 - t116 * t29)) * exp(-t1) / (s * t21 * t22 * (t26 * t31 - t29));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_ZoniGyro_ShafranovGeometry.h"
 
 CartesianR2_ZoniGyro_ShafranovGeometry::CartesianR2_ZoniGyro_ShafranovGeometry(const double& Rmax,
@@ -12,514 +13,68 @@ CartesianR2_ZoniGyro_ShafranovGeometry::CartesianR2_ZoniGyro_ShafranovGeometry(c
 double CartesianR2_ZoniGyro_ShafranovGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                      const double& cos_theta) const
 {
-    return (1.0 - (r / Rmax) * (r / Rmax)) * exp(tanh(10.0 * (r / Rmax) - 5.0)) *
-               sin(M_PI * (2.0 * elongation_kappa * (r / Rmax) * sin_theta + 2.0 * (r / Rmax) * sin_theta)) *
-               cos(M_PI * ((-2.0) * shift_delta * ((r / Rmax) * (r / Rmax)) -
-                           2.0 * elongation_kappa * (r / Rmax) * cos_theta + 2.0 * (r / Rmax) * cos_theta)) -
-           (2.0 * shift_delta * (r / Rmax) * (elongation_kappa - 1.0) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin_theta /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (r / Rmax) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) * exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (r / Rmax) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                (2.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 2.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((elongation_kappa + 1.0), 2.0) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     (2.0 * elongation_kappa + 2.0) * pow(sin_theta, 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (r / Rmax) * (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (r / Rmax) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                (4.0 * M_PI * shift_delta * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.0 * (r / Rmax) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.0 * M_PI * (r / Rmax) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((elongation_kappa + 1.0), 2.0) *
-                     pow(sin_theta, 2.0) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 2.0 * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta))) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (r / Rmax) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     sin_theta +
-                 2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            (r / Rmax) *
-                ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     sin_theta +
-                 2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0)) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-             pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                ((-4.0) * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow((elongation_kappa + 1.0), 2.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * pow(cos_theta, 2.0) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((2.0 * elongation_kappa - 2.0), 2.0) *
-                     pow(sin_theta, 2.0) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 2.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-             pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (4.0 * elongation_kappa *
-                     (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     sin_theta * cos_theta -
-                 1.0 / 2.0 *
-                     (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                      (2.0 * elongation_kappa - 2.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) +
-                 1.0 / 2.0 *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      2.0 * (elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                      2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-             (2.0 * elongation_kappa - 2.0) *
-                 ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            ((elongation_kappa - 1.0) * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                 sin_theta +
-             1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            ((elongation_kappa - 1.0) * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                 sin_theta +
-             1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                (2.0 * M_PI * ((r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 2.0 * M_PI * ((r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow((elongation_kappa + 1.0), 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     (2.0 * elongation_kappa + 2.0) * pow(sin_theta, 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-             (elongation_kappa - 1.0) * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                 cos_theta +
-             pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta)) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                 cos(M_PI * (r / Rmax) *
-                     ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-             M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                 cos(M_PI * (r / Rmax) *
-                     ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                 cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-             M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                 ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                 sin(M_PI * (r / Rmax) *
-                     ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                 sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            ((elongation_kappa - 1.0) * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                 sin_theta +
-             1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (4.0 * elongation_kappa *
-                     (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     sin_theta * cos_theta -
-                 1.0 / 2.0 *
-                     (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                      (2.0 * elongation_kappa - 2.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) +
-                 1.0 / 2.0 *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      2.0 * (elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                      2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0))) /
-               ((r / Rmax) *
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s * s;
+    const double t1  = t0 - 1.0;
+    const double t2  = 2.0 * s;
+    const double t3  = tanh(5.0 * t2 - 5.0);
+    const double t4  = elongation_kappa + 1.0;
+    const double t5  = M_PI * t2;
+    const double t6  = sin_theta * t5;
+    const double t7  = t4 * t6;
+    const double t8  = sin(t7);
+    const double t9  = s * shift_delta;
+    const double t10 = elongation_kappa - 1.0;
+    const double t11 = cos_theta * t10;
+    const double t12 = t4 * t4;
+    const double t13 = sin_theta * sin_theta;
+    const double t14 = 2.0 * t9;
+    const double t15 = -t10;
+    const double t16 = cos_theta * t15;
+    const double t17 = -t14 + t16;
+    const double t18 = cos_theta * t17;
+    const double t19 = t13 * t15 + t18;
+    const double t20 = 1.0 / t19;
+    const double t21 = cos_theta * t12;
+    const double t22 = -t15 * t17 + t21;
+    const double t23 = t5 * (t16 - t9);
+    const double t24 = cos(t23);
+    const double t25 = cos(t7);
+    const double t26 = t25 * t4;
+    const double t27 = t24 * t26;
+    const double t28 = cos_theta * t27;
+    const double t29 = sin(t23);
+    const double t30 = t29 * t8;
+    const double t31 = sin_theta * t15 * t30;
+    const double t32 = t28 + t31;
+    const double t33 = -t1;
+    const double t34 = M_PI * t33;
+    const double t35 = t32 * t34;
+    const double t36 = sin_theta * t35;
+    const double t37 = (cos_theta * cos_theta) * t12;
+    const double t38 = t13 * (t15 * t15);
+    const double t39 = t37 + t38;
+    const double t40 = t24 * t8;
+    const double t41 = -s * t40 + M_PI * sin_theta * t24 * t25 * t33 * t4 - t17 * t30 * t34;
+    const double t42 = t39 * t41;
+    const double t43 = sin_theta * t27;
+    const double t44 = t40 * t5;
+    const double t45 = t12 * t13;
+    const double t46 = t17 * t17;
+    const double t47 = t34 * (t45 + t46);
+    const double t48 = -sin_theta * t22;
+    const double t49 = t35 * t48 + t42;
+    const double t50 = (M_PI * M_PI) * t33;
+    const double t51 = 2.0 * t40 * t50;
+    const double t52 = t26 * t29;
+    const double t53 = 2.0 * t0;
+    return -t1 * t8 * exp(t3) * cos(t5 * (t11 + t9)) + 2.0 * t20 * (s * t39 * (4.0 * M_PI * s * t17 * t29 * t8 - 4.0 *
+           M_PI * s * t43 + 2.0 * M_PI * shift_delta * t29 * t33 * t8 - 4.0 * sin_theta * t17 * t50 * t52 - t40 - t45 *
+           t51 - t46 * t51) + 10.0 * s * t49 * (t3 * t3 - 1.0) - sin_theta * t14 * t20 * (t32 * t47 + t41 * t48) + t20 *
+           t49 * (2.0 * cos_theta * s * shift_delta - t19) + 2.0 * t22 * t36 + t36 * (-t14 * t15 - t22) + t41 *
+           (cos_theta * t15 * t17 + t12 * t13 - t39) + 2.0 * t42 + t47 * (4.0 * M_PI * cos_theta * s * sin_theta * t15 *
+           t25 * t29 * t4 + cos_theta * t15 * t29 * t8 - t37 * t44 - t38 * t44 - t43) + 2.0 * M_PI * t48 * (cos_theta *
+           t24 * t25 * t33 * t4 + 2.0 * M_PI * s * sin_theta * t15 * t17 * t24 * t33 * t8 + 2.0 * M_PI * s * t13 * t15 *
+           t25 * t29 * t33 * t4 + sin_theta * t15 * t29 * t33 * t8 - t18 * t33 * t5 * t52 - t21 * t33 * t40 * t6 - t28 *
+           t53 - t31 * t53)) * exp(-t3) / (s * t12 * (cos_theta * (t11 + t14) + t10 * t13));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_ZoniShiftedGyro_CircularGeometry.h"
 
 CartesianR2_ZoniShiftedGyro_CircularGeometry::CartesianR2_ZoniShiftedGyro_CircularGeometry(const double& Rmax)
@@ -8,46 +9,34 @@ CartesianR2_ZoniShiftedGyro_CircularGeometry::CartesianR2_ZoniShiftedGyro_Circul
 double CartesianR2_ZoniShiftedGyro_CircularGeometry::rhs_f(const double& r, const double& theta,
                                                            const double& sin_theta, const double& cos_theta) const
 {
-    return (1.0 - (r / Rmax) * (r / Rmax)) * exp(tanh(20.0 * (r / Rmax) - 14.0)) *
-               sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-           ((r / Rmax) * (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) *
-                ((-2.0) * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                     sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) +
-            (r / Rmax) *
-                ((-8.0) * M_PI * (r / Rmax) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                 8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                     sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow(sin_theta, 2.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                 8.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                     pow(cos_theta, 2.0) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                 2.0 * sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) +
-            ((-2.0) * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-             2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                 cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-             2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                 sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) +
-            ((-4.0) * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * pow(sin_theta, 2.0) *
-                 sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-             8.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                 sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-             4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                 sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                 cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-             2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                 cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-             2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                 sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0))) /
-               (r / Rmax);
+    const double s   = r / Rmax;
+    const double t0  = s * s - 1.0;
+    const double t1  = tanh(2.0 * (10.0 * s - 7.0));
+    const double t2  = M_PI * s;
+    const double t3  = 2.0 * t2;
+    const double t4  = sin_theta * t3;
+    const double t5  = sin(t4);
+    const double t6  = cos_theta * t3;
+    const double t7  = cos(t6);
+    const double t8  = t5 * t7;
+    const double t9  = cos_theta * cos_theta;
+    const double t10 = sin_theta * sin_theta;
+    const double t11 = s * t8;
+    const double t12 = cos(t4);
+    const double t13 = sin_theta * t12;
+    const double t14 = t13 * t7;
+    const double t15 = -t0;
+    const double t16 = M_PI * t15;
+    const double t17 = sin(t6);
+    const double t18 = cos_theta * t17;
+    const double t19 = t16 * t18 * t5;
+    const double t20 = 2.0 * t9;
+    const double t21 = M_PI * t11;
+    const double t22 = 2.0 * t10;
+    const double t23 = (M_PI * M_PI) * t15;
+    const double t24 = t23 * t8;
+    return -t0 * t8 * exp(t1) - 2.0 * (20.0 * s * (t1 * t1 - 1.0) * (M_PI * sin_theta * t12 * t15 * t7 - t11 - t19) +
+           s * (4.0 * M_PI * cos_theta * s * t17 * t5 - 4.0 * t13 * t18 * t23 - 4.0 * t14 * t2 - t20 * t24 - t22 * t24 -
+           t8) - t11 + t14 * t16 + t16 * (4.0 * M_PI * cos_theta * s * sin_theta * t12 * t17 + cos_theta * t17 * t5 -
+           t14 - t20 * t21 - t21 * t22) - t19) * exp(-t1) / (s * (t10 + t9));
 }
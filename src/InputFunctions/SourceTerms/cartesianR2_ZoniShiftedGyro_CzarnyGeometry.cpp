@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_ZoniShiftedGyro_CzarnyGeometry.h"
 
 void CartesianR2_ZoniShiftedGyro_CzarnyGeometry::initializeGeometry()
@@ -17,1097 +18,136 @@ CartesianR2_ZoniShiftedGyro_CzarnyGeometry::CartesianR2_ZoniShiftedGyro_CzarnyGe
 double CartesianR2_ZoniShiftedGyro_CzarnyGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                          const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return (1.0 - (r / Rmax) * (r / Rmax)) * exp(tanh(20.0 * (r / Rmax) - 14.0)) *
-               sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-               cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-           ((-(r / Rmax)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) * exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (r / Rmax) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp)) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                               sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp))) *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp))) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) -
-            (r / Rmax) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (2.0 * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 2.0 * (r / Rmax) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 4.0 * M_PI * (r / Rmax) * sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp)) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp))) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (r / Rmax) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta * cos_theta_pow2 * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp)) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                      ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta_pow2 / pow((temp * temp), (3.0 / 2.0)) -
-                 4.0 * (r / Rmax) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp -
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow((2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                              cos_theta * factor_xi / (temp1 * temp) +
-                          2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                      4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp)) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta_pow2 * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 4.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 2.0 * sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp)) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                               sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp))) *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp))) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) -
-            (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                  (temp1 * temp) +
-              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-             sin_theta * cos_theta / (temp * temp)) *
-                ((1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                  (temp1 * temp) +
-              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-             sin_theta * cos_theta / (temp * temp)) *
-                (2.0 * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 2.0 * ((r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 4.0 * M_PI * ((r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                  (temp1 * temp) +
-              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-             sin_theta * cos_theta / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                          pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                          pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                      2.0 * sin_theta * cos_theta / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta * cos_theta / (temp * temp))) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            ((1.0 - (r / Rmax) * (r / Rmax)) *
-                 ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                      factor_xi / (temp1 * temp) +
-                  2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-             2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                 sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                     pow((temp * temp), 2.0) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * sin_theta * cos_theta / (temp * temp)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            ((1.0 - (r / Rmax) * (r / Rmax)) *
-                 ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                      factor_xi / (temp1 * temp) +
-                  2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-             2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                 sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 cos_theta_pow2 / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                          pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                          pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                      2.0 * sin_theta * cos_theta / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta * cos_theta / (temp * temp))) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                 2.0) +
-             sin_theta_pow2 / (temp * temp)) *
-                ((-2.0) * (r / Rmax) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                 2.0) +
-             cos_theta_pow2 / (temp * temp)) *
-                ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin_theta_pow2 * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow(((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                              factor_xi / (temp1 * temp) +
-                          2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-                 4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta_pow2 *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) -
-                 4.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                      6.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) -
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            ((-2.0) * (r / Rmax) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-             (1.0 - (r / Rmax) * (r / Rmax)) *
-                 (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                      factor_xi / (temp1 * temp) +
-                  2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-             2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                 sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                 temp) *
-                ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                     pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                      3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) -
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                 sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)))) /
-               ((r / Rmax) * sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) *
-                                              sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                             (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                                  cos_theta * factor_xi / (temp1 * temp) +
-                                              ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                         sin_theta * cos_theta / (temp * temp)),
-                                        2.0)) +
-                                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                            factor_xi / (temp1 * temp) +
-                                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                                       2.0) +
-                                   sin_theta_pow2 / (temp * temp)) *
-                                      (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                                cos_theta * factor_xi / (temp1 * temp) +
-                                            ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                           2.0) +
-                                       cos_theta_pow2 / (temp * temp))));
-}
\ No newline at end of file
+    const double s    = r / Rmax;
+    const double t0   = s * s;
+    const double t1   = t0 - 1.0;
+    const double t2   = tanh(2.0 * (10.0 * s - 7.0));
+    const double t3   = cos_theta * s;
+    const double t4   = 2.0 * t3;
+    const double t5   = inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + t4) + 1.0;
+    const double t6   = sqrt(t5);
+    const double t7   = t6 - 1.0;
+    const double t8   = 2.0 * M_PI;
+    const double t9   = t8 / inverse_aspect_ratio_epsilon;
+    const double t10  = t7 * t9;
+    const double t11  = cos(t10);
+    const double t12  = sin_theta * t8;
+    const double t13  = s * t12;
+    const double t14  = t6 - 2.0;
+    const double t15  = 1.0 / t14;
+    const double t16  = ellipticity_e * factor_xi;
+    const double t17  = t15 * t16;
+    const double t18  = t13 * t17;
+    const double t19  = sin(t18);
+    const double t20  = t11 * t19;
+    const double t21  = ellipticity_e * ellipticity_e;
+    const double t22  = factor_xi * factor_xi;
+    const double t23  = sin_theta * sin_theta;
+    const double t24  = inverse_aspect_ratio_epsilon * s;
+    const double t25  = t23 * t24;
+    const double t26  = 1.0 / t6;
+    const double t27  = t15 * t26;
+    const double t28  = cos_theta + t25 * t27;
+    const double t29  = cos_theta * t28;
+    const double t30  = inverse_aspect_ratio_epsilon * t3;
+    const double t31  = t27 * t30 - 1.0;
+    const double t32  = -t1;
+    const double t33  = -t7 * t9;
+    const double t34  = sin(t33);
+    const double t35  = -t14;
+    const double t36  = 1.0 / t35;
+    const double t37  = t16 * t36;
+    const double t38  = t13 * t37;
+    const double t39  = sin(t38);
+    const double t40  = t26 * t36;
+    const double t41  = cos_theta - t25 * t40;
+    const double t42  = cos(t33);
+    const double t43  = cos(t38);
+    const double t44  = t42 * t43;
+    const double t45  = t37 * t44;
+    const double t46  = sin_theta * t26 * t34 * t39 - t41 * t45;
+    const double t47  = 1.0 / t5;
+    const double t48  = cos_theta * t47;
+    const double t49  = -t48;
+    const double t50  = 1.0 / (t5 * t5);
+    const double t51  = cos_theta * cos_theta;
+    const double t52  = t24 * t51;
+    const double t53  = t50 * t52;
+    const double t54  = 2.0 * t26;
+    const double t55  = t25 * t54;
+    const double t56  = cos_theta * t15;
+    const double t57  = 1.0 / (t5 * sqrt(t5));
+    const double t58  = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t59  = t0 * t58;
+    const double t60  = t23 * t57 * t59;
+    const double t61  = 1.0 / (t14 * t14);
+    const double t62  = t23 * t47;
+    const double t63  = 2.0 * t59 * t62;
+    const double t64  = cos_theta * t61 * t63 - cos_theta - t15 * t55 + t27 * t52 + t56 * t60;
+    const double t65  = t21 * t22;
+    const double t66  = t61 * t65;
+    const double t67  = cos_theta * t26;
+    const double t68  = sin(t10);
+    const double t69  = t19 * t68;
+    const double t70  = t1 * t69;
+    const double t71  = cos(t18);
+    const double t72  = M_PI * t1 * t71;
+    const double t73  = s * t11 * t19 - sin_theta * t11 * t17 * t31 * t72 - M_PI * t67 * t70;
+    const double t74  = t23 * t50;
+    const double t75  = t28 * t66;
+    const double t76  = t30 * t57;
+    const double t77  = t24 * t48;
+    const double t78  = 2.0 * t77;
+    const double t79  = t36 * t78 + t54 - t76;
+    const double t80  = cos_theta * t41;
+    const double t81  = t30 * t40;
+    const double t82  = t81 + 1.0;
+    const double t83  = cos_theta * t36;
+    const double t84  = 1.0 / (t35 * t35);
+    const double t85  = t65 * t84;
+    const double t86  = t85 * (-cos_theta * t63 * t84 + cos_theta - t36 * t55 + t40 * t52 + t60 * t83);
+    const double t87  = M_PI * t32;
+    const double t88  = t46 * t87;
+    const double t89  = t31 * t75;
+    const double t90  = sin_theta * (t48 + t89);
+    const double t91  = (t28 * t28) * t66 + t62;
+    const double t92  = t73 * t91 - t88 * t90;
+    const double t93  = t47 * t51;
+    const double t94  = -2.0 * t0 * t23 * t47 * t58 * t84 + t36 * t60 + 3.0 * t81 + 1.0;
+    const double t95  = -t94;
+    const double t96  = t23 * t82;
+    const double t97  = t34 * t39;
+    const double t98  = t57 * t97;
+    const double t99  = t39 * t42;
+    const double t100 = s * t8 * t99;
+    const double t101 = 4.0 * M_PI;
+    const double t102 = s * t101;
+    const double t103 = sin_theta * t26;
+    const double t104 = t103 * t34 * t43;
+    const double t105 = sin_theta * t45;
+    const double t106 = t87 * (t23 * (t31 * t31) * t66 + t93);
+    const double t107 = inverse_aspect_ratio_epsilon * t87;
+    const double t108 = (M_PI * M_PI) * t32;
+    const double t109 = 2.0 * t108 * t99;
+    const double t110 = s * t1 * t12 * t20;
+    const double t111 = t15 * t28;
+    const double t112 = t11 * t16 * t71;
+    const double t113 = t15 * t29;
+    const double t114 = s * t16 * t54 * t68 * t72;
+    const double t115 = t23 * t31;
+    const double t116 = t115 * t15;
+    const double t117 = t15 * t64;
+    const double t118 = t35 / (t80 + t96);
+    const double t119 = t24 * t47;
+    return t1 * t20 * exp(t2) + 2.0 * t118 * t14 * t5 * (s * t91 * (-cos_theta * sin_theta * t107 * t16 * t44 * t79 *
+           t84 + t101 * t26 * t3 * t97 + t102 * t105 * t82 - 4.0 * t104 * t108 * t16 * t82 * t83 + t107 * t51 * t98 +
+           t109 * t23 * (t82 * t82) * t85 + t109 * t93 + t99) - 20.0 * s * t92 * (t2 * t2 - 1.0) + sin_theta * t118 *
+           (-t106 * t46 + t73 * t90) * (t111 - t113 * t119 + t116 * t119 + t117 + t31 * t56 - t83 * t94) - sin_theta *
+           t88 * (t24 * t65 * t79 * t80 / (t35 * t35 * t35) + t49 + 2.0 * t53 + t82 * t86) + t106 * (t100 * (t41 *
+           t41) * t85 + t100 * t62 + t102 * t104 * t37 * t41 - t105 * t95 + t25 * t98 + t67 * t97) + t118 * t15 * t92 *
+           (cos_theta * t64 - t115 * t77 + t115 + t15 * t23 * t30 * (-t15 * t78 + 2.0 * t26 - t76) + t24 * t28 * t93) +
+           t12 * t32 * t46 * (t31 * t64 * t66 + t49 + t53) - 2.0 * t73 * (t23 * t47 - t30 * t74 - t64 * t75) + t73 *
+           (-inverse_aspect_ratio_epsilon * t4 * t74 + t41 * t86 + t62 + t85 * t95 * t96 - t93) - t8 * t90 *
+           (sin_theta * t0 * t54 * t69 - sin_theta * t70 * t76 + 2.0 * t0 * t111 * t112 - t1 * t112 * t117 + t103 *
+           t70 + t110 * t48 + t110 * t89 - t113 * t114 - t114 * t116)) * exp(-t2) / (s * t21 * t22 * (t23 * t31 - t29));
+}
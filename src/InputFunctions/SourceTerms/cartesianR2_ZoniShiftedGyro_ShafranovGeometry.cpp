@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_ZoniShiftedGyro_ShafranovGeometry.h"
 
 CartesianR2_ZoniShiftedGyro_ShafranovGeometry::CartesianR2_ZoniShiftedGyro_ShafranovGeometry(
@@ -11,514 +12,68 @@ CartesianR2_ZoniShiftedGyro_ShafranovGeometry::CartesianR2_ZoniShiftedGyro_Shafr
 double CartesianR2_ZoniShiftedGyro_ShafranovGeometry::rhs_f(const double& r, const double& theta,
                                                             const double& sin_theta, const double& cos_theta) const
 {
-    return (1.0 - (r / Rmax) * (r / Rmax)) * exp(tanh(20.0 * (r / Rmax) - 14.0)) *
-               sin(M_PI * (2.0 * elongation_kappa * (r / Rmax) * sin_theta + 2.0 * (r / Rmax) * sin_theta)) *
-               cos(M_PI * ((-2.0) * shift_delta * ((r / Rmax) * (r / Rmax)) -
-                           2.0 * elongation_kappa * (r / Rmax) * cos_theta + 2.0 * (r / Rmax) * cos_theta)) -
-           (2.0 * shift_delta * (r / Rmax) * (elongation_kappa - 1.0) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) * sin_theta /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (r / Rmax) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) * exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (r / Rmax) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                (2.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 2.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((elongation_kappa + 1.0), 2.0) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     (2.0 * elongation_kappa + 2.0) * pow(sin_theta, 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (r / Rmax) * (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (r / Rmax) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                (4.0 * M_PI * shift_delta * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.0 * (r / Rmax) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.0 * M_PI * (r / Rmax) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((elongation_kappa + 1.0), 2.0) *
-                     pow(sin_theta, 2.0) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 2.0 * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta))) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (r / Rmax) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     sin_theta +
-                 2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            (r / Rmax) *
-                ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     sin_theta +
-                 2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0)) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-             pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                ((-4.0) * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow((elongation_kappa + 1.0), 2.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * pow(cos_theta, 2.0) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * pow((2.0 * elongation_kappa - 2.0), 2.0) *
-                     pow(sin_theta, 2.0) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 2.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-             pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (4.0 * elongation_kappa *
-                     (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     sin_theta * cos_theta -
-                 1.0 / 2.0 *
-                     (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                      (2.0 * elongation_kappa - 2.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) +
-                 1.0 / 2.0 *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      2.0 * (elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                      2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-             (2.0 * elongation_kappa - 2.0) *
-                 ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            ((elongation_kappa - 1.0) * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                 sin_theta +
-             1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            ((elongation_kappa - 1.0) * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                 sin_theta +
-             1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                (2.0 * M_PI * ((r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 2.0 * M_PI * ((r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     pow((elongation_kappa + 1.0), 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     (2.0 * elongation_kappa + 2.0) * pow(sin_theta, 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 M_PI * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa - 2.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-             (elongation_kappa - 1.0) * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                 cos_theta +
-             pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta)) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                 cos(M_PI * (r / Rmax) *
-                     ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-             M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                 cos(M_PI * (r / Rmax) *
-                     ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                 cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-             M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                 ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                 sin(M_PI * (r / Rmax) *
-                     ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                 sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            ((elongation_kappa - 1.0) * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                 sin_theta +
-             1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-2.0) * (r / Rmax) * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * (2.0 * elongation_kappa + 2.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (4.0 * elongation_kappa *
-                     (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     sin_theta * cos_theta -
-                 1.0 / 2.0 *
-                     (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                      (2.0 * elongation_kappa - 2.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) +
-                 1.0 / 2.0 *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      2.0 * (elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                      2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) *
-                exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0))) /
-               ((r / Rmax) *
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s * s;
+    const double t1  = t0 - 1.0;
+    const double t2  = tanh(2.0 * (10.0 * s - 7.0));
+    const double t3  = elongation_kappa + 1.0;
+    const double t4  = 2.0 * M_PI;
+    const double t5  = s * t4;
+    const double t6  = sin_theta * t3 * t5;
+    const double t7  = sin(t6);
+    const double t8  = s * shift_delta;
+    const double t9  = elongation_kappa - 1.0;
+    const double t10 = cos_theta * t9;
+    const double t11 = t3 * t3;
+    const double t12 = sin_theta * sin_theta;
+    const double t13 = 2.0 * t8;
+    const double t14 = -t9;
+    const double t15 = cos_theta * t14;
+    const double t16 = -t13 + t15;
+    const double t17 = cos_theta * t16;
+    const double t18 = t12 * t14 + t17;
+    const double t19 = 1.0 / t18;
+    const double t20 = t5 * (t15 - t8);
+    const double t21 = cos(t20);
+    const double t22 = cos(t6);
+    const double t23 = t22 * t3;
+    const double t24 = t21 * t23;
+    const double t25 = cos_theta * t24;
+    const double t26 = sin(t20);
+    const double t27 = t26 * t7;
+    const double t28 = sin_theta * t14 * t27;
+    const double t29 = t25 + t28;
+    const double t30 = cos_theta * t11;
+    const double t31 = -t14 * t16 + t30;
+    const double t32 = -t1;
+    const double t33 = sin_theta * t32 * t4;
+    const double t34 = M_PI * t32;
+    const double t35 = t29 * t34;
+    const double t36 = (cos_theta * cos_theta) * t11;
+    const double t37 = t12 * (t14 * t14);
+    const double t38 = t36 + t37;
+    const double t39 = t21 * t7;
+    const double t40 = s * t39;
+    const double t41 = M_PI * sin_theta * t21 * t22 * t3 * t32 - t16 * t27 * t34 - t40;
+    const double t42 = t38 * t41;
+    const double t43 = sin_theta * t24;
+    const double t44 = t4 * t40;
+    const double t45 = t11 * t12;
+    const double t46 = t16 * t16;
+    const double t47 = t34 * (t45 + t46);
+    const double t48 = -sin_theta * t31;
+    const double t49 = t35 * t48 + t42;
+    const double t50 = (M_PI * M_PI) * t32;
+    const double t51 = 2.0 * t39 * t50;
+    const double t52 = t23 * t26;
+    const double t53 = 2.0 * t0;
+    return -t1 * t7 * exp(t2) * cos(t5 * (t10 + t8)) + 2.0 * t19 * (s * t38 * (4.0 * M_PI * s * t16 * t26 * t7 - 4.0 *
+           M_PI * s * t43 + 2.0 * M_PI * shift_delta * t26 * t32 * t7 - 4.0 * sin_theta * t16 * t50 * t52 - t39 - t45 *
+           t51 - t46 * t51) + 20.0 * s * t49 * (t2 * t2 - 1.0) - sin_theta * t13 * t19 * (t29 * t47 + t41 * t48) +
+           sin_theta * t35 * (-t13 * t14 - t31) + t19 * t49 * (2.0 * cos_theta * s * shift_delta - t18) + t29 * t31 *
+           t33 + t4 * t48 * (cos_theta * t21 * t22 * t3 * t32 + 2.0 * M_PI * s * sin_theta * t14 * t16 * t21 * t32 *
+           t7 + 2.0 * M_PI * s * t12 * t14 * t22 * t26 * t3 * t32 + sin_theta * t14 * t26 * t32 * t7 - t17 * t32 * t5 *
+           t52 - t25 * t53 - t28 * t53 - t30 * t33 * t40) + t41 * (cos_theta * t14 * t16 + t11 * t12 - t38) + 2.0 *
+           t42 + t47 * (4.0 * M_PI * cos_theta * s * sin_theta * t14 * t22 * t26 * t3 + cos_theta * t14 * t26 * t7 -
+           t36 * t44 - t37 * t44 - t43)) * exp(-t2) / (s * t11 * (cos_theta * (t10 + t13) + t12 * t9));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_ZoniShifted_CircularGeometry.h"
 
 CartesianR2_ZoniShifted_CircularGeometry::CartesianR2_ZoniShifted_CircularGeometry(const double& Rmax)
@@ -8,45 +9,32 @@ CartesianR2_ZoniShifted_CircularGeometry::CartesianR2_ZoniShifted_CircularGeomet
 double CartesianR2_ZoniShifted_CircularGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                        const double& cos_theta) const
 {
-    return (-((r / Rmax) * (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) *
-                  ((-2.0) * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) +
-              (r / Rmax) *
-                  ((-8.0) * M_PI * (r / Rmax) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * pow(sin_theta, 2.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   8.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       pow(cos_theta, 2.0) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   2.0 * sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) +
-              ((-2.0) * (r / Rmax) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                   cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-               2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                   cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-               2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                   sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) +
-              ((-4.0) * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * pow(sin_theta, 2.0) *
-                   sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-               8.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                   sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-               4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                   sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                   cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-               2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                   cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-               2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                   sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)))) /
-           (r / Rmax);
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = cos_theta * cos_theta;
+    const double t1  = sin_theta * sin_theta;
+    const double t2  = tanh(2.0 * (10.0 * s - 7.0));
+    const double t3  = M_PI * s;
+    const double t4  = 2.0 * t3;
+    const double t5  = sin_theta * t4;
+    const double t6  = sin(t5);
+    const double t7  = cos_theta * t4;
+    const double t8  = cos(t7);
+    const double t9  = t6 * t8;
+    const double t10 = cos_theta * sin(t7);
+    const double t11 = t10 * t6;
+    const double t12 = 4.0 * t3;
+    const double t13 = sin_theta * cos(t5);
+    const double t14 = t13 * t8;
+    const double t15 = 1.0 - (s * s);
+    const double t16 = (M_PI * M_PI) * t15;
+    const double t17 = t10 * t13;
+    const double t18 = 2.0 * t0;
+    const double t19 = t16 * t9;
+    const double t20 = 2.0 * t1;
+    const double t21 = s * t9;
+    const double t22 = M_PI * t21;
+    const double t23 = M_PI * t15;
+    const double t24 = t11 * t23 - t14 * t23 + t21;
+    return -2.0 * (-20.0 * s * t24 * (t2 * t2 - 1.0) - s * (-t11 * t12 + t12 * t14 + 4.0 * t16 * t17 + t18 * t19 + t19 *
+           t20 + t9) - t23 * (-t11 - t12 * t17 + t14 + t18 * t22 + t20 * t22) - t24) * exp(-t2) / (s * (t0 + t1));
+}
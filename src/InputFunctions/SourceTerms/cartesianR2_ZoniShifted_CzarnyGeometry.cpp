@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_ZoniShifted_CzarnyGeometry.h"
 
 void CartesianR2_ZoniShifted_CzarnyGeometry::initializeGeometry()
@@ -17,1105 +18,135 @@ CartesianR2_ZoniShifted_CzarnyGeometry::CartesianR2_ZoniShifted_CzarnyGeometry(
 double CartesianR2_ZoniShifted_CzarnyGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                      const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return (-((-(r / Rmax)) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) * exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (r / Rmax) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp)) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp))) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) -
-              (r / Rmax) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  (2.0 * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / pow((temp * temp), (3.0 / 2.0)) -
-                   2.0 * (r / Rmax) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   4.0 * M_PI * (r / Rmax) * sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                        2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp)) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                   ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp))) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (r / Rmax) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                   ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                            sin_theta * cos_theta_pow2 * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp)) +
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                            sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                        ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                        ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   sin_theta_pow2 / (temp * temp)) *
-                  (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   sin_theta_pow2 / (temp * temp)) *
-                  ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta_pow2 / pow((temp * temp), (3.0 / 2.0)) -
-                   4.0 * (r / Rmax) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp -
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow((2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                cos_theta * factor_xi / (temp1 * temp) +
-                            2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                           2.0) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                        4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp)) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta_pow2 * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                   4.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   2.0 * sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   sin_theta_pow2 / (temp * temp)) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp)) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp))) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) -
-              (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                    (temp1 * temp) +
-                ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-               sin_theta * cos_theta / (temp * temp)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                    (temp1 * temp) +
-                ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-               sin_theta * cos_theta / (temp * temp)) *
-                  (2.0 * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / pow((temp * temp), (3.0 / 2.0)) -
-                   2.0 * ((r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   4.0 * M_PI * ((r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                   2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp2 * (temp * temp)) -
-                        4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                    (temp1 * temp) +
-                ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-               sin_theta * cos_theta / (temp * temp)) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                            pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                            pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                        2.0 * sin_theta * cos_theta / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                            pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta * cos_theta / (temp * temp))) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) +
-              ((1.0 - (r / Rmax) * (r / Rmax)) *
-                   ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                        factor_xi / (temp1 * temp) +
-                    2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                   cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-               2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                   sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                       pow((temp * temp), 2.0) +
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp2 * (temp * temp)) -
-                        4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * sin_theta * cos_theta / (temp * temp)) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              ((1.0 - (r / Rmax) * (r / Rmax)) *
-                   ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                        factor_xi / (temp1 * temp) +
-                    2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                   cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-               2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                   sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   cos_theta_pow2 / (temp * temp)) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                            pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                            pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                        2.0 * sin_theta * cos_theta / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                            pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta * cos_theta / (temp * temp))) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) +
-              (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                   2.0) +
-               sin_theta_pow2 / (temp * temp)) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                   2.0) +
-               cos_theta_pow2 / (temp * temp)) *
-                  ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin_theta_pow2 * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) /
-                       pow((temp * temp), (3.0 / 2.0)) -
-                   (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow(((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                factor_xi / (temp1 * temp) +
-                            2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                           2.0) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-                   4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta_pow2 *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) -
-                   4.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                        6.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) -
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              ((-2.0) * (r / Rmax) *
-                   sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                   cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-               (1.0 - (r / Rmax) * (r / Rmax)) *
-                   (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                        factor_xi / (temp1 * temp) +
-                    2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                   cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-               2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                   sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                   temp) *
-                  ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                       pow((temp * temp), 2.0) +
-                   ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp2 * (temp * temp)) -
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                        3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) -
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                   sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) *
-                  exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))))) /
-           ((r / Rmax) * sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                          factor_xi / (temp1 * temp) +
-                                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                              cos_theta * factor_xi / (temp1 * temp) +
-                                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                     sin_theta * cos_theta / (temp * temp)),
-                                    2.0)) +
-                              (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                        factor_xi / (temp1 * temp) +
-                                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                                   2.0) +
-                               sin_theta_pow2 / (temp * temp)) *
-                                  (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                            cos_theta * factor_xi / (temp1 * temp) +
-                                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                       2.0) +
-                                   cos_theta_pow2 / (temp * temp))));
-}
\ No newline at end of file
+    const double s    = r / Rmax;
+    const double t0   = ellipticity_e * ellipticity_e;
+    const double t1   = factor_xi * factor_xi;
+    const double t2   = sin_theta * sin_theta;
+    const double t3   = inverse_aspect_ratio_epsilon * s;
+    const double t4   = t2 * t3;
+    const double t5   = cos_theta * s;
+    const double t6   = 2.0 * t5;
+    const double t7   = inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + t6) + 1.0;
+    const double t8   = sqrt(t7);
+    const double t9   = 1.0 / t8;
+    const double t10  = t8 - 2.0;
+    const double t11  = 1.0 / t10;
+    const double t12  = t11 * t9;
+    const double t13  = cos_theta + t12 * t4;
+    const double t14  = cos_theta * t13;
+    const double t15  = inverse_aspect_ratio_epsilon * t5;
+    const double t16  = t12 * t15 - 1.0;
+    const double t17  = s * s;
+    const double t18  = t17 - 1.0;
+    const double t19  = -t18;
+    const double t20  = t8 - 1.0;
+    const double t21  = 2.0 * M_PI;
+    const double t22  = t21 / inverse_aspect_ratio_epsilon;
+    const double t23  = -t20 * t22;
+    const double t24  = sin(t23);
+    const double t25  = -t10;
+    const double t26  = 1.0 / t25;
+    const double t27  = ellipticity_e * factor_xi;
+    const double t28  = t26 * t27;
+    const double t29  = sin_theta * t21;
+    const double t30  = s * t29;
+    const double t31  = t28 * t30;
+    const double t32  = sin(t31);
+    const double t33  = t26 * t9;
+    const double t34  = cos_theta - t33 * t4;
+    const double t35  = cos(t23);
+    const double t36  = cos(t31);
+    const double t37  = t35 * t36;
+    const double t38  = t28 * t37;
+    const double t39  = sin_theta * t24 * t32 * t9 - t34 * t38;
+    const double t40  = 1.0 / t7;
+    const double t41  = cos_theta * t40;
+    const double t42  = -t41;
+    const double t43  = 1.0 / (t7 * t7);
+    const double t44  = cos_theta * cos_theta;
+    const double t45  = t3 * t44;
+    const double t46  = t43 * t45;
+    const double t47  = 2.0 * t9;
+    const double t48  = t4 * t47;
+    const double t49  = cos_theta * t11;
+    const double t50  = 1.0 / (t7 * sqrt(t7));
+    const double t51  = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t52  = t17 * t51;
+    const double t53  = t2 * t50 * t52;
+    const double t54  = 1.0 / (t10 * t10);
+    const double t55  = t2 * t40;
+    const double t56  = 2.0 * t52 * t55;
+    const double t57  = cos_theta * t54 * t56 - cos_theta - t11 * t48 + t12 * t45 + t49 * t53;
+    const double t58  = t0 * t1;
+    const double t59  = t54 * t58;
+    const double t60  = t20 * t22;
+    const double t61  = cos(t60);
+    const double t62  = t11 * t27;
+    const double t63  = t30 * t62;
+    const double t64  = sin(t63);
+    const double t65  = cos_theta * t9;
+    const double t66  = sin(t60);
+    const double t67  = t64 * t66;
+    const double t68  = t18 * t67;
+    const double t69  = cos(t63);
+    const double t70  = M_PI * t18 * t69;
+    const double t71  = s * t61 * t64 - sin_theta * t16 * t61 * t62 * t70 - M_PI * t65 * t68;
+    const double t72  = t2 * t43;
+    const double t73  = t13 * t59;
+    const double t74  = t15 * t50;
+    const double t75  = t3 * t41;
+    const double t76  = 2.0 * t75;
+    const double t77  = t26 * t76 + t47 - t74;
+    const double t78  = cos_theta * t34;
+    const double t79  = t15 * t33;
+    const double t80  = t79 + 1.0;
+    const double t81  = cos_theta * t26;
+    const double t82  = 1.0 / (t25 * t25);
+    const double t83  = t58 * t82;
+    const double t84  = t83 * (-cos_theta * t56 * t82 + cos_theta - t26 * t48 + t33 * t45 + t53 * t81);
+    const double t85  = M_PI * t19;
+    const double t86  = t39 * t85;
+    const double t87  = tanh(2.0 * (10.0 * s - 7.0));
+    const double t88  = t16 * t73;
+    const double t89  = sin_theta * (t41 + t88);
+    const double t90  = (t13 * t13) * t59 + t55;
+    const double t91  = t71 * t90 - t86 * t89;
+    const double t92  = t40 * t44;
+    const double t93  = -2.0 * t17 * t2 * t40 * t51 * t82 + t26 * t53 + 3.0 * t79 + 1.0;
+    const double t94  = -t93;
+    const double t95  = t2 * t80;
+    const double t96  = t24 * t32;
+    const double t97  = t50 * t96;
+    const double t98  = t32 * t35;
+    const double t99  = s * t21 * t98;
+    const double t100 = 4.0 * M_PI;
+    const double t101 = s * t100;
+    const double t102 = sin_theta * t9;
+    const double t103 = t102 * t24 * t36;
+    const double t104 = sin_theta * t38;
+    const double t105 = t85 * ((t16 * t16) * t2 * t59 + t92);
+    const double t106 = inverse_aspect_ratio_epsilon * t85;
+    const double t107 = (M_PI * M_PI) * t19;
+    const double t108 = 2.0 * t107 * t98;
+    const double t109 = s * t18 * t29 * t61 * t64;
+    const double t110 = t11 * t13;
+    const double t111 = t27 * t61 * t69;
+    const double t112 = t11 * t14;
+    const double t113 = s * t27 * t47 * t66 * t70;
+    const double t114 = t16 * t2;
+    const double t115 = t11 * t114;
+    const double t116 = t11 * t57;
+    const double t117 = t25 / (t78 + t95);
+    const double t118 = t3 * t40;
+    return 2.0 * t10 * t117 * t7 * (s * t90 * (-cos_theta * sin_theta * t106 * t27 * t37 * t77 * t82 + t100 * t5 * t9 *
+           t96 + t101 * t104 * t80 - 4.0 * t103 * t107 * t27 * t80 * t81 + t106 * t44 * t97 + t108 * t2 * (t80 * t80) *
+           t83 + t108 * t92 + t98) - 20.0 * s * t91 * (t87 * t87 - 1.0) + sin_theta * t117 * (-t105 * t39 + t71 * t89) *
+           (t110 - t112 * t118 + t115 * t118 + t116 + t16 * t49 - t81 * t93) - sin_theta * t86 * (t42 + 2.0 * t46 +
+           t80 * t84 + t3 * t58 * t77 * t78 / (t25 * t25 * t25)) + t105 * (t101 * t103 * t28 * t34 - t104 * t94 + (t34 *
+           t34) * t83 * t99 + t4 * t97 + t55 * t99 + t65 * t96) + t11 * t117 * t91 * (cos_theta * t57 + t11 * t15 * t2 *
+           (-t11 * t76 - t74 + 2.0 * t9) - t114 * t75 + t114 + t13 * t3 * t92) + t19 * t29 * t39 * (t16 * t57 * t59 +
+           t42 + t46) - t21 * t89 * (sin_theta * t17 * t47 * t67 - sin_theta * t68 * t74 + t102 * t68 + t109 * t41 +
+           t109 * t88 + 2.0 * t110 * t111 * t17 - t111 * t116 * t18 - t112 * t113 - t113 * t115) - 2.0 * t71 * (-t15 *
+           t72 + t2 * t40 - t57 * t73) + t71 * (-inverse_aspect_ratio_epsilon * t6 * t72 + t34 * t84 + t55 + t83 * t94 *
+           t95 - t92)) * exp(-t87) / (s * t0 * t1 * (-t14 + t16 * t2));
+}
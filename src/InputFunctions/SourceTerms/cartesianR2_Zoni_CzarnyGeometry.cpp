@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR2_Zoni_CzarnyGeometry.h"
 
 void CartesianR2_Zoni_CzarnyGeometry::initializeGeometry()
@@ -18,1105 +19,140 @@ CartesianR2_Zoni_CzarnyGeometry::CartesianR2_Zoni_CzarnyGeometry(const double& R
 double CartesianR2_Zoni_CzarnyGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                               const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return (-((-(r / Rmax)) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) * exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (r / Rmax) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp)) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp))) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) -
-              (r / Rmax) *
-                  (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                   sin_theta * cos_theta / (temp * temp)) *
-                  (2.0 * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / pow((temp * temp), (3.0 / 2.0)) -
-                   2.0 * (r / Rmax) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   4.0 * M_PI * (r / Rmax) * sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                        2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp)) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                   ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp))) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (r / Rmax) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                   ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                            sin_theta * cos_theta_pow2 * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp)) +
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                            sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                        ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                        ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   sin_theta_pow2 / (temp * temp)) *
-                  (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   sin_theta_pow2 / (temp * temp)) *
-                  ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta_pow2 / pow((temp * temp), (3.0 / 2.0)) -
-                   4.0 * (r / Rmax) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   8.0 * M_PI * (r / Rmax) * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp -
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow((2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                cos_theta * factor_xi / (temp1 * temp) +
-                            2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                           2.0) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                        4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp)) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   4.0 * (M_PI * M_PI) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta_pow2 * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                   4.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   2.0 * sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (r / Rmax) *
-                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   sin_theta_pow2 / (temp * temp)) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp)) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp))) *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp))) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) -
-              (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                    (temp1 * temp) +
-                ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-               sin_theta * cos_theta / (temp * temp)) *
-                  ((1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                    (temp1 * temp) +
-                ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-               sin_theta * cos_theta / (temp * temp)) *
-                  (2.0 * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / pow((temp * temp), (3.0 / 2.0)) -
-                   2.0 * ((r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   4.0 * M_PI * ((r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                   2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                   2.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp2 * (temp * temp)) -
-                        4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                    (temp1 * temp) +
-                ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-               sin_theta * cos_theta / (temp * temp)) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                            pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                            pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                        2.0 * sin_theta * cos_theta / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                            pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta * cos_theta / (temp * temp))) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) +
-              ((1.0 - (r / Rmax) * (r / Rmax)) *
-                   ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                        factor_xi / (temp1 * temp) +
-                    2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                   cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-               2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                   sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                       pow((temp * temp), 2.0) +
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp2 * (temp * temp)) -
-                        4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * sin_theta * cos_theta / (temp * temp)) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              ((1.0 - (r / Rmax) * (r / Rmax)) *
-                   ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                        factor_xi / (temp1 * temp) +
-                    2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                   cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-               2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta *
-                   sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                  (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                       2.0) +
-                   cos_theta_pow2 / (temp * temp)) *
-                  (1.0 / 2.0 *
-                       (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                        sin_theta * cos_theta / (temp * temp)) *
-                       ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                            pow((temp * temp), 2.0) +
-                        2.0 *
-                            ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 *
-                            (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                            pow((temp * temp), 2.0) +
-                        (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                            (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                 (temp2 * (temp * temp)) -
-                             4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                 factor_xi / (temp1 * temp) +
-                             2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                        2.0 * sin_theta * cos_theta / (temp * temp)) -
-                   1.0 / 2.0 *
-                       (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) +
-                             ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        cos_theta_pow2 / (temp * temp)) *
-                       (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                            pow((temp * temp), 2.0) +
-                        ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                             (temp1 * temp) +
-                         ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                            ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                 (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                             4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                 ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                             6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                 factor_xi / (temp1 * temp) -
-                             2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                        2.0 * sin_theta * cos_theta / (temp * temp))) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))),
-                      (3.0 / 2.0)) +
-              (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                   2.0) +
-               sin_theta_pow2 / (temp * temp)) *
-                  ((-2.0) * (r / Rmax) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) +
-              (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                   2.0) +
-               cos_theta_pow2 / (temp * temp)) *
-                  ((-2.0) * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin_theta_pow2 * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) /
-                       pow((temp * temp), (3.0 / 2.0)) -
-                   (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       pow(((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                factor_xi / (temp1 * temp) +
-                            2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                           2.0) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-                   4.0 * (M_PI * M_PI) * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) * sin_theta_pow2 *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) -
-                   4.0 * M_PI * (r / Rmax) * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                            factor_xi / (temp1 * temp) +
-                        2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                   (1.0 - (r / Rmax) * (r / Rmax)) *
-                       ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                        6.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) -
-                        2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                   2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                       sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                       sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                       cos_theta / temp) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))) -
-              ((-2.0) * (r / Rmax) *
-                   sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                   cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-               (1.0 - (r / Rmax) * (r / Rmax)) *
-                   (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                        factor_xi / (temp1 * temp) +
-                    2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                   cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-               2.0 * M_PI * (1.0 - (r / Rmax) * (r / Rmax)) *
-                   sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                   sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                   temp) *
-                  ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                       pow((temp * temp), 2.0) +
-                   ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                       (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                            (temp2 * (temp * temp)) -
-                        2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                            (temp1 * temp) +
-                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                   (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                        (temp1 * temp) +
-                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                       ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                            (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                        2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                            ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                        3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                            factor_xi / (temp1 * temp) -
-                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                   sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                  sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                  (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                              sin_theta * cos_theta / (temp * temp)),
-                             2.0)) +
-                       (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                            2.0) +
-                        sin_theta_pow2 / (temp * temp)) *
-                           (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                2.0) +
-                            cos_theta_pow2 / (temp * temp))))) /
-           ((r / Rmax) * sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                          factor_xi / (temp1 * temp) +
-                                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                              cos_theta * factor_xi / (temp1 * temp) +
-                                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                     sin_theta * cos_theta / (temp * temp)),
-                                    2.0)) +
-                              (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                        factor_xi / (temp1 * temp) +
-                                    ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                                   2.0) +
-                               sin_theta_pow2 / (temp * temp)) *
-                                  (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                            cos_theta * factor_xi / (temp1 * temp) +
-                                        ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                       2.0) +
-                                   cos_theta_pow2 / (temp * temp))));
-}
\ No newline at end of file
+    const double s    = r / Rmax;
+    const double t0   = ellipticity_e * ellipticity_e;
+    const double t1   = factor_xi * factor_xi;
+    const double t2   = 2.0 * s;
+    const double t3   = cos_theta * t2;
+    const double t4   = inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + t3) + 1.0;
+    const double t5   = sqrt(t4);
+    const double t6   = 1.0 / t5;
+    const double t7   = inverse_aspect_ratio_epsilon * s;
+    const double t8   = t6 * t7;
+    const double t9   = sin_theta * sin_theta;
+    const double t10  = t5 - 2.0;
+    const double t11  = 1.0 / t10;
+    const double t12  = t11 * t9;
+    const double t13  = cos_theta + t12 * t8;
+    const double t14  = cos_theta * t13;
+    const double t15  = cos_theta * t11;
+    const double t16  = t15 * t8 - 1.0;
+    const double t17  = s * s;
+    const double t18  = t17 - 1.0;
+    const double t19  = -t18;
+    const double t20  = t5 - 1.0;
+    const double t21  = 2.0 * M_PI;
+    const double t22  = t21 / inverse_aspect_ratio_epsilon;
+    const double t23  = -t20 * t22;
+    const double t24  = sin(t23);
+    const double t25  = -t10;
+    const double t26  = 1.0 / t25;
+    const double t27  = ellipticity_e * factor_xi;
+    const double t28  = t26 * t27;
+    const double t29  = M_PI * t2;
+    const double t30  = sin_theta * t29;
+    const double t31  = t28 * t30;
+    const double t32  = sin(t31);
+    const double t33  = t26 * t9;
+    const double t34  = cos_theta - t33 * t8;
+    const double t35  = cos(t23);
+    const double t36  = cos(t31);
+    const double t37  = t35 * t36;
+    const double t38  = t28 * t37;
+    const double t39  = sin_theta * t24 * t32 * t6 - t34 * t38;
+    const double t40  = 1.0 / t4;
+    const double t41  = cos_theta * t40;
+    const double t42  = -t41;
+    const double t43  = 1.0 / (t4 * t4);
+    const double t44  = cos_theta * cos_theta;
+    const double t45  = t44 * t7;
+    const double t46  = t45 * t6;
+    const double t47  = 2.0 * t6;
+    const double t48  = t47 * t7;
+    const double t49  = 1.0 / (t4 * sqrt(t4));
+    const double t50  = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t51  = t17 * t50;
+    const double t52  = t49 * t51;
+    const double t53  = t52 * t9;
+    const double t54  = 1.0 / (t10 * t10);
+    const double t55  = t40 * t9;
+    const double t56  = 2.0 * t51 * t55;
+    const double t57  = cos_theta * t54 * t56 - cos_theta + t11 * t46 - t12 * t48 + t15 * t53;
+    const double t58  = t0 * t1;
+    const double t59  = t54 * t58;
+    const double t60  = t20 * t22;
+    const double t61  = cos(t60);
+    const double t62  = sin_theta * t27;
+    const double t63  = t11 * t62;
+    const double t64  = t29 * t63;
+    const double t65  = sin(t64);
+    const double t66  = cos_theta * t6;
+    const double t67  = sin(t60);
+    const double t68  = t65 * t67;
+    const double t69  = t18 * t68;
+    const double t70  = cos(t64);
+    const double t71  = t18 * t61;
+    const double t72  = s * t61 * t65 - M_PI * t16 * t63 * t70 * t71 - M_PI * t66 * t69;
+    const double t73  = cos_theta * t7;
+    const double t74  = t43 * t9;
+    const double t75  = t13 * t59;
+    const double t76  = inverse_aspect_ratio_epsilon * t2;
+    const double t77  = t49 * t73;
+    const double t78  = t41 * t76;
+    const double t79  = t26 * t78 + t47 - t77;
+    const double t80  = cos_theta * t34;
+    const double t81  = cos_theta * t26;
+    const double t82  = t8 * t81;
+    const double t83  = t82 + 1.0;
+    const double t84  = 1.0 / (t25 * t25);
+    const double t85  = t58 * t84;
+    const double t86  = t85 * (-cos_theta * t56 * t84 + cos_theta + t26 * t46 - t33 * t48 + t53 * t81);
+    const double t87  = M_PI * t19;
+    const double t88  = t39 * t87;
+    const double t89  = tanh(5.0 * t2 - 5.0);
+    const double t90  = t16 * t75;
+    const double t91  = sin_theta * (t41 + t90);
+    const double t92  = (t13 * t13) * t59 + t55;
+    const double t93  = t72 * t92 - t88 * t91;
+    const double t94  = t40 * t44;
+    const double t95  = -2.0 * t17 * t40 * t50 * t84 * t9 + t33 * t52 + 3.0 * t82 + 1.0;
+    const double t96  = -t95;
+    const double t97  = t83 * t9;
+    const double t98  = t24 * t32;
+    const double t99  = t66 * t98;
+    const double t100 = t7 * t9;
+    const double t101 = t49 * t98;
+    const double t102 = t32 * t35;
+    const double t103 = t102 * t29;
+    const double t104 = M_PI * s;
+    const double t105 = 4.0 * t104;
+    const double t106 = sin_theta * t6;
+    const double t107 = t106 * t24 * t36;
+    const double t108 = sin_theta * t38;
+    const double t109 = t87 * ((t16 * t16) * t59 * t9 + t94);
+    const double t110 = inverse_aspect_ratio_epsilon * t87;
+    const double t111 = (M_PI * M_PI) * t19;
+    const double t112 = 2.0 * t102 * t111;
+    const double t113 = t30 * t65 * t71;
+    const double t114 = t18 * t67;
+    const double t115 = t11 * t13;
+    const double t116 = t27 * t70;
+    const double t117 = t104 * t11 * t114 * t116 * t47;
+    const double t118 = t16 * t9;
+    const double t119 = t11 * t57;
+    const double t120 = t118 * t7;
+    const double t121 = t25 / (t80 + t97);
+    const double t122 = t11 * t40;
+    return 2.0 * t10 * t121 * t4 * (s * t92 * (-cos_theta * t110 * t37 * t62 * t79 * t84 + t101 * t110 * t44 + t102 +
+           t105 * t108 * t83 + t105 * t99 - 4.0 * t107 * t111 * t27 * t81 * t83 + t112 * (t83 * t83) * t85 * t9 + t112 *
+           t94) - 10.0 * s * t93 * (t89 * t89 - 1.0) + sin_theta * t121 * (-t109 * t39 + t72 * t91) * (t115 + t119 +
+           t120 * t122 - t122 * t14 * t7 + t15 * t16 - t81 * t95) + sin_theta * t19 * t21 * t39 * (t16 * t57 * t59 +
+           t42 + t43 * t45) - sin_theta * t88 * (t42 + t43 * t44 * t76 + t83 * t86 + t58 * t7 * t79 * t80 / (t25 * t25 *
+           t25)) + t109 * (t100 * t101 + t103 * (t34 * t34) * t85 + t103 * t55 + t105 * t107 * t28 * t34 - t108 * t96 +
+           t99) + t11 * t121 * t93 * (cos_theta * t57 + t100 * t15 * (-t11 * t78 + 2.0 * t6 - t77) + t118 - t120 * t41 +
+           t13 * t7 * t94) - t21 * t91 * (-cos_theta * inverse_aspect_ratio_epsilon * s * sin_theta * t114 * t49 * t65 +
+           sin_theta * t17 * t47 * t68 + t106 * t69 + t113 * t41 + t113 * t90 + 2.0 * t115 * t116 * t17 * t61 - t116 *
+           t119 * t71 - t117 * t118 - t117 * t14) - 2.0 * t72 * (t40 * t9 - t57 * t75 - t73 * t74) + t72 *
+           (-inverse_aspect_ratio_epsilon * t3 * t74 + t34 * t86 + t55 + t85 * t96 * t97 - t94)) * exp(-t89) / (s * t0 *
+           t1 * (-t14 + t16 * t9));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR6_Poisson_CircularGeometry.h"
 
 CartesianR6_Poisson_CircularGeometry::CartesianR6_Poisson_CircularGeometry(const double& Rmax)
@@ -8,41 +9,38 @@ CartesianR6_Poisson_CircularGeometry::CartesianR6_Poisson_CircularGeometry(const
 double CartesianR6_Poisson_CircularGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                    const double& cos_theta) const
 {
-    return (-((-1.6384) * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                  pow(sin_theta, 2.0) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                  cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-              3.2768 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                  sin_theta * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta *
-                  cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-              1.6384 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                  sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                  cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-              1.0 * (r / Rmax) *
-                  ((-1.6384) * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       pow(sin_theta, 2.0) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   3.2768 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-                   1.6384 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                   12.288 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 4.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                   29.4912 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   12.288 * pow(((r / Rmax) - 1.0), 4.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) +
-              2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                  sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-              2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                  sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta))) /
-           (r / Rmax);
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s - 1.0;
+    const double t1  = s + 1.0;
+    const double t2  = cos_theta * cos_theta;
+    const double t3  = sin_theta * sin_theta;
+    const double t4  = M_PI * s;
+    const double t5  = 2.0 * t4;
+    const double t6  = cos_theta * t5;
+    const double t7  = cos(t6);
+    const double t8  = sin_theta * t5;
+    const double t9  = sin(t8);
+    const double t10 = t7 * t9;
+    const double t11 = 3.0 * t10;
+    const double t12 = sin_theta * cos(t8);
+    const double t13 = t12 * t7;
+    const double t14 = t0 * t1;
+    const double t15 = M_PI * t14;
+    const double t16 = cos_theta * sin(t6);
+    const double t17 = t16 * t9;
+    const double t18 = t0 * t0;
+    const double t19 = 4.0 * t12 * t16;
+    const double t20 = t10 * t5;
+    const double t21 = t1 * t1;
+    const double t22 = M_PI * t21;
+    const double t23 = 15.0 * t10;
+    const double t24 = t0 * t22;
+    const double t25 = 12.0 * t17;
+    const double t26 = M_PI * t1 * t18;
+    const double t27 = 12.0 * t13;
+    const double t28 = (M_PI * M_PI) * t18 * t21;
+    const double t29 = 2.0 * t10 * t28;
+    return -0.8192 * (t0 * t0 * t0 * t0) * (t1 * t1 * t1 * t1) * (-s * (-36.0 * t10 * t14 - t18 * t23 + t19 * t28 + t2 *
+           t29 - t21 * t23 + t24 * t25 - t24 * t27 + t25 * t26 - t26 * t27 + t29 * t3) + t0 * t1 * (t0 * t11 + t1 *
+           t11 + t13 * t15 - t15 * t17) - t18 * t22 * (t13 - t17 - t19 * t4 + t2 * t20 + t20 * t3)) / (s * (t2 + t3));
+}
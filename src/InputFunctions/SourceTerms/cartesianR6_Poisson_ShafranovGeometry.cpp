@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR6_Poisson_ShafranovGeometry.h"
 
 CartesianR6_Poisson_ShafranovGeometry::CartesianR6_Poisson_ShafranovGeometry(const double& Rmax,
@@ -12,565 +13,81 @@ CartesianR6_Poisson_ShafranovGeometry::CartesianR6_Poisson_ShafranovGeometry(con
 double CartesianR6_Poisson_ShafranovGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                     const double& cos_theta) const
 {
-    return (-(2.0 * shift_delta * (r / Rmax) * (elongation_kappa - 1.0) *
-                  ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  sin_theta /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 * (r / Rmax) *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-1.6384) * (M_PI * M_PI) * pow((elongation_kappa + 1.0), 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   0.4096 * (M_PI * M_PI) * (2.0 * elongation_kappa - 2.0) * (2.0 * elongation_kappa + 2.0) *
-                       pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * pow(sin_theta, 2.0) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   2.4576 * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   2.4576 * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 5.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.4576 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 5.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.4576 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 5.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) +
-              1.0 * (r / Rmax) *
-                  (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                   2.0 * elongation_kappa + 1.0) *
-                  (1.6384 * M_PI * shift_delta * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   1.6384 * (M_PI * M_PI) * pow((elongation_kappa + 1.0), 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * pow(sin_theta, 2.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * (M_PI * M_PI) * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   4.9152 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   4.9152 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 5.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   2.4576 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   12.288 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 4.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                        M_PI * ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                                2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   2.4576 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   29.4912 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   12.288 * pow(((r / Rmax) - 1.0), 4.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                            2.0 * cos_theta))) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 * (r / Rmax) *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       sin_theta +
-                   2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0)) *
-                  ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)) +
-              1.0 * (r / Rmax) *
-                  ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       sin_theta +
-                   2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0)) *
-                  (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                   2.0 * elongation_kappa + 1.0) *
-                  (0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                            2.0 * cos_theta))) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)) +
-              1.0 *
-                  (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                   pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                  ((-1.6384) * (M_PI * M_PI) * (r / Rmax) * pow((elongation_kappa + 1.0), 2.0) *
-                       pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * pow(cos_theta, 2.0) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   0.4096 * (M_PI * M_PI) * (r / Rmax) * pow((2.0 * elongation_kappa - 2.0), 2.0) *
-                       pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * pow(sin_theta, 2.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   0.8192 * (M_PI * M_PI) * (r / Rmax) * (2.0 * elongation_kappa - 2.0) *
-                       (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta -
-                   0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) +
-              1.0 *
-                  (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                   pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                  ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                  (4.0 * elongation_kappa *
-                       (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                       sin_theta * cos_theta -
-                   1.0 / 2.0 *
-                       (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                        (2.0 * elongation_kappa - 2.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                            sin_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0) +
-                   1.0 / 2.0 *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        2.0 * (elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                        2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)) +
-              1.0 *
-                  (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                   (2.0 * elongation_kappa - 2.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                  ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  ((-1.6384) * (M_PI * M_PI) * (r / Rmax) * pow((elongation_kappa + 1.0), 2.0) *
-                       pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   0.4096 * (M_PI * M_PI) * (r / Rmax) * (2.0 * elongation_kappa - 2.0) *
-                       (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       pow(sin_theta, 2.0) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * (M_PI * M_PI) * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                   2.4576 * M_PI * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   2.4576 * M_PI * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 5.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * (M_PI * M_PI) * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.4576 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 5.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.4576 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 5.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 *
-                  (pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                   (elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                   pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta)) *
-                  (0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                            2.0 * cos_theta))) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) +
-              1.0 *
-                  (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                   2.0 * elongation_kappa + 1.0) *
-                  (0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                            2.0 * cos_theta))) /
-                  sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)) -
-              1.0 *
-                  ((elongation_kappa - 1.0) *
-                       ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                   1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                  (4.0 * elongation_kappa *
-                       (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                       sin_theta * cos_theta -
-                   1.0 / 2.0 *
-                       (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                        (2.0 * elongation_kappa - 2.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                            sin_theta) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0) +
-                   1.0 / 2.0 *
-                       ((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                       (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        2.0 * (elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                        2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) *
-                  (0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                   0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                       sin(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                       cos(M_PI * (r / Rmax) *
-                           ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta +
-                            2.0 * cos_theta))) /
-                  pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                        pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                           (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                            2.0 * elongation_kappa + 1.0) -
-                       pow(((elongation_kappa - 1.0) *
-                                ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                sin_theta +
-                            1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                           2.0)),
-                      (3.0 / 2.0)))) /
-           ((r / Rmax) *
-            sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                  pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) -
-                 pow(((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                     2.0)));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = elongation_kappa + 1.0;
+    const double t1  = t0 * t0;
+    const double t2  = s - 1.0;
+    const double t3  = s + 1.0;
+    const double t4  = sin_theta * sin_theta;
+    const double t5  = elongation_kappa - 1.0;
+    const double t6  = t4 * t5;
+    const double t7  = s * shift_delta;
+    const double t8  = 2.0 * t7;
+    const double t9  = cos_theta * t5;
+    const double t10 = t8 + t9;
+    const double t11 = cos_theta * t10;
+    const double t12 = t11 + t6;
+    const double t13 = t2 * t2;
+    const double t14 = 2.0 * M_PI;
+    const double t15 = s * t14;
+    const double t16 = t15 * (t7 + t9);
+    const double t17 = cos(t16);
+    const double t18 = sin_theta * t15;
+    const double t19 = t0 * t18;
+    const double t20 = cos(t19);
+    const double t21 = t0 * t20;
+    const double t22 = cos_theta * t17 * t21;
+    const double t23 = sin(t19);
+    const double t24 = sin(t16);
+    const double t25 = t23 * t24;
+    const double t26 = sin_theta * t25 * t5;
+    const double t27 = t22 + t26;
+    const double t28 = -t5;
+    const double t29 = cos_theta * t1;
+    const double t30 = cos_theta * t28;
+    const double t31 = t30 - t8;
+    const double t32 = -t28 * t31 + t29;
+    const double t33 = t3 * t3;
+    const double t34 = M_PI * t33;
+    const double t35 = (cos_theta * cos_theta) * t1;
+    const double t36 = t35 + t4 * (t5 * t5);
+    const double t37 = t17 * t23;
+    const double t38 = 3.0 * t37;
+    const double t39 = t2 * t3;
+    const double t40 = M_PI * t39;
+    const double t41 = sin_theta * t21;
+    const double t42 = t10 * t25;
+    const double t43 = t17 * t40 * t41 + t2 * t38 + t3 * t38 - t40 * t42;
+    const double t44 = t1 * t4;
+    const double t45 = t10 * t10;
+    const double t46 = t44 + t45;
+    const double t47 = sin_theta * t32;
+    const double t48 = t39 / t12;
+    const double t49 = M_PI * t47;
+    const double t50 = 6.0 * s;
+    const double t51 = t22 * t50;
+    const double t52 = t26 * t50;
+    const double t53 = t18 * t37 * t39;
+    const double t54 = t15 * t21 * t24 * t39;
+    const double t55 = t10 * t5;
+    const double t56 = t49 * (-t11 * t54 + t2 * t51 + t2 * t52 + t22 * t39 + t26 * t39 - t29 * t53 + t3 * t51 + t3 *
+                       t52 + t53 * t55 + t54 * t6);
+    const double t57 = t13 * t33;
+    const double t58 = 12.0 * t42;
+    const double t59 = (M_PI * M_PI) * t57;
+    const double t60 = 2.0 * t37 * t59;
+    const double t61 = 4.0 * t41;
+    const double t62 = (t28 * t28) * t4;
+    const double t63 = t15 * (t30 - t7);
+    const double t64 = cos(t63);
+    const double t65 = t30 * sin(t63);
+    const double t66 = t15 * t23 * t64;
+    return -0.8192 * (t2 * t2 * t2 * t2) * (t3 * t3 * t3 * t3) * (s * t36 * (-shift_delta * t14 * t25 * t57 + 12.0 *
+           M_PI * sin_theta * t0 * t13 * t17 * t20 * t3 + 12.0 * M_PI * sin_theta * t0 * t17 * t2 * t20 * t33 - t10 *
+           t24 * t59 * t61 + 15.0 * t13 * t17 * t23 - M_PI * t13 * t3 * t58 + 36.0 * t17 * t2 * t23 * t3 + 15.0 * t17 *
+           t23 * t33 - t2 * t34 * t58 - t44 * t60 - t45 * t60) - sin_theta * t13 * t27 * t34 * (t28 * t8 + t32) +
+           sin_theta * t48 * t8 * (M_PI * t2 * t27 * t3 * t46 - t43 * t47) + 2.0 * t36 * t39 * t43 - t39 * t56 + t39 *
+           (2.0 * M_PI * sin_theta * t2 * t27 * t3 * (t29 - t55) - t40 * t46 * (-M_PI * s * t61 * t65 - t23 * t65 +
+           t35 * t66 + t41 * t64 + t62 * t66) - t43 * (-t30 * t31 + t35 - t44 + t62) - t56) + t48 * (-t27 * t39 * t49 +
+           t36 * t43) * (cos_theta * t31 - cos_theta * t8 + t28 * t4)) / (s * t1 * (t12 * t12));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR6_SonnendruckerGyro_CircularGeometry.h"
 
 CartesianR6_SonnendruckerGyro_CircularGeometry::CartesianR6_SonnendruckerGyro_CircularGeometry(const double& Rmax)
@@ -8,65 +9,42 @@ CartesianR6_SonnendruckerGyro_CircularGeometry::CartesianR6_SonnendruckerGyro_Ci
 double CartesianR6_SonnendruckerGyro_CircularGeometry::rhs_f(const double& r, const double& theta,
                                                              const double& sin_theta, const double& cos_theta) const
 {
-    return 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-               sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) /
-               (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) -
-           ((r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-1.6384) * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     pow(sin_theta, 2.0) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                 3.2768 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-                 1.6384 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                 9.8304 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                     cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                 9.8304 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                 12.288 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 4.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                 9.8304 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                 9.8304 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                 29.4912 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                 12.288 * pow(((r / Rmax) - 1.0), 4.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) -
-            5.03290747193186 * (r / Rmax) *
-                (0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) /
-                (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-1.6384) * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     pow(sin_theta, 2.0) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                 3.2768 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin_theta * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta *
-                     cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-                 1.6384 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                     cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta)) /
-               (r / Rmax);
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s - 1.0;
+    const double t1  = s + 1.0;
+    const double t2  = 14.4444444444444 * s - 11.1111111111111;
+    const double t3  = 0.348432055749129 * atan(t2) - 0.452961672473868;
+    const double t4  = 2.0 * M_PI * s;
+    const double t5  = sin_theta * t4;
+    const double t6  = sin(t5);
+    const double t7  = cos_theta * t4;
+    const double t8  = cos(t7);
+    const double t9  = t6 * t8;
+    const double t10 = t1 * t1;
+    const double t11 = t0 * t0;
+    const double t12 = t10 * t11;
+    const double t13 = t12 * t9;
+    const double t14 = cos_theta * cos_theta;
+    const double t15 = sin_theta * sin_theta;
+    const double t16 = -512.0 * t3;
+    const double t17 = 3.0 * t9;
+    const double t18 = cos(t5);
+    const double t19 = sin_theta * t18;
+    const double t20 = t19 * t8;
+    const double t21 = t0 * t1;
+    const double t22 = M_PI * t21;
+    const double t23 = sin(t7);
+    const double t24 = cos_theta * t23;
+    const double t25 = t24 * t6;
+    const double t26 = t21 * (t0 * t17 + t1 * t17 + t20 * t22 - t22 * t25);
+    const double t27 = t4 * t9;
+    const double t28 = 12.0 * M_PI * t25;
+    const double t29 = M_PI * M_PI;
+    const double t30 = 2.0 * t13 * t29;
+    return -0.0016 * (t0 * t0 * t0 * t0) * (t1 * t1 * t1 * t1) * (256.0 * t13 / t3 + (s * t16 * (12.0 * M_PI *
+           sin_theta * t0 * t10 * t18 * t8 + 12.0 * M_PI * sin_theta * t1 * t11 * t18 * t8 + 36.0 * t0 * t1 * t6 * t8 -
+           t0 * t10 * t28 - t1 * t11 * t28 + 15.0 * t10 * t6 * t8 + 15.0 * t11 * t6 * t8 - 4.0 * t12 * t19 * t24 * t29 -
+           t14 * t30 - t15 * t30) - 2576.848625629106 * s * t26 / (t2 * t2 + 1.0) + M_PI * t12 * t16 * (4.0 * M_PI *
+           cos_theta * s * sin_theta * t18 * t23 + cos_theta * t23 * t6 - t14 * t27 - t15 * t27 - t20) + t16 * t26) /
+           (s * (t14 + t15)));
+}
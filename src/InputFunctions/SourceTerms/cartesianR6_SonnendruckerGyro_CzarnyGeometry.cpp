@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR6_SonnendruckerGyro_CzarnyGeometry.h"
 
 void CartesianR6_SonnendruckerGyro_CzarnyGeometry::initializeGeometry()
@@ -17,1156 +18,160 @@ CartesianR6_SonnendruckerGyro_CzarnyGeometry::CartesianR6_SonnendruckerGyro_Czar
 double CartesianR6_SonnendruckerGyro_CzarnyGeometry::rhs_f(const double& r, const double& theta,
                                                            const double& sin_theta, const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-               sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-               cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) /
-               (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) -
-           ((-(r / Rmax)) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp)) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                               sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp))) *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp))) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) -
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (0.8192 * M_PI * inverse_aspect_ratio_epsilon * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp)) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 1.6384 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.9152 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.9152 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp))) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta * cos_theta_pow2 * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp)) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                      ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                ((-0.8192) * M_PI * inverse_aspect_ratio_epsilon * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta_pow2 / pow((temp * temp), (3.0 / 2.0)) -
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     pow((2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                              cos_theta * factor_xi / (temp1 * temp) +
-                          2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                      4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp)) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 1.6384 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta_pow2 * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 1.6384 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 4.9152 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 9.8304 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 12.288 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 4.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 4.9152 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 9.8304 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 29.4912 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 12.288 * pow(((r / Rmax) - 1.0), 4.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp)) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                               sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp))) *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp))) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            5.03290747193186 * (r / Rmax) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                ((208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) *
-                 sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                  factor_xi / (temp1 * temp) +
-                              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                      factor_xi / (temp1 * temp) +
-                                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                             sin_theta * cos_theta / (temp * temp)),
-                            2.0)) +
-                      (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                (temp1 * temp) +
-                            ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                           2.0) +
-                       sin_theta_pow2 / (temp * temp)) *
-                          (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                               2.0) +
-                           cos_theta_pow2 / (temp * temp)))) -
-            5.03290747193186 * (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) /
-                ((208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) *
-                 sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                  factor_xi / (temp1 * temp) +
-                              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                      factor_xi / (temp1 * temp) +
-                                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                             sin_theta * cos_theta / (temp * temp)),
-                            2.0)) +
-                      (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                (temp1 * temp) +
-                            ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                           2.0) +
-                       sin_theta_pow2 / (temp * temp)) *
-                          (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                               2.0) +
-                           cos_theta_pow2 / (temp * temp)))) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (0.8192 * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 0.4096 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 1.6384 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin_theta * sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 0.8192 * M_PI * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 0.8192 * M_PI * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.9152 * M_PI * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.9152 * M_PI * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                          pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                          pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                      2.0 * sin_theta * cos_theta / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta * cos_theta / (temp * temp))) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                     pow((temp * temp), 2.0) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * sin_theta * cos_theta / (temp * temp)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 cos_theta_pow2 / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                          pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                          pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                      2.0 * sin_theta * cos_theta / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta * cos_theta / (temp * temp))) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 cos_theta_pow2 / (temp * temp)) *
-                ((-0.8192) * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta_pow2 *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 0.4096 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     pow(((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                              factor_xi / (temp1 * temp) +
-                          2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-                 1.6384 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin_theta_pow2 *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) -
-                 1.6384 * M_PI * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                      6.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) -
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                     pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                      3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) -
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                 sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)))) /
-               ((r / Rmax) * sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) *
-                                              sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                             (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                                  cos_theta * factor_xi / (temp1 * temp) +
-                                              ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                         sin_theta * cos_theta / (temp * temp)),
-                                        2.0)) +
-                                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                            factor_xi / (temp1 * temp) +
-                                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                                       2.0) +
-                                   sin_theta_pow2 / (temp * temp)) *
-                                      (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                                cos_theta * factor_xi / (temp1 * temp) +
-                                            ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                           2.0) +
-                                       cos_theta_pow2 / (temp * temp))));
-}
\ No newline at end of file
+    const double s    = r / Rmax;
+    const double t0   = s - 1.0;
+    const double t1   = s + 1.0;
+    const double t2   = 14.4444444444444 * s - 11.1111111111111;
+    const double t3   = 0.348432055749129 * atan(t2) - 0.452961672473868;
+    const double t4   = cos_theta * s;
+    const double t5   = 2.0 * t4;
+    const double t6   = inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + t5) + 1.0;
+    const double t7   = sqrt(t6);
+    const double t8   = t7 - 1.0;
+    const double t9   = 2.0 * M_PI;
+    const double t10  = t9 / inverse_aspect_ratio_epsilon;
+    const double t11  = t10 * t8;
+    const double t12  = cos(t11);
+    const double t13  = s * t9;
+    const double t14  = t7 - 2.0;
+    const double t15  = 1.0 / t14;
+    const double t16  = ellipticity_e * factor_xi;
+    const double t17  = sin_theta * t16;
+    const double t18  = t15 * t17;
+    const double t19  = t13 * t18;
+    const double t20  = sin(t19);
+    const double t21  = t12 * t20;
+    const double t22  = t1 * t1;
+    const double t23  = t0 * t0;
+    const double t24  = t22 * t23;
+    const double t25  = t21 * t24;
+    const double t26  = ellipticity_e * ellipticity_e;
+    const double t27  = factor_xi * factor_xi;
+    const double t28  = sin_theta * sin_theta;
+    const double t29  = inverse_aspect_ratio_epsilon * s;
+    const double t30  = t28 * t29;
+    const double t31  = 1.0 / t7;
+    const double t32  = t15 * t31;
+    const double t33  = cos_theta + t30 * t32;
+    const double t34  = cos_theta * t33;
+    const double t35  = inverse_aspect_ratio_epsilon * t4;
+    const double t36  = t32 * t35 - 1.0;
+    const double t37  = -t10 * t8;
+    const double t38  = sin(t37);
+    const double t39  = -t14;
+    const double t40  = 1.0 / t39;
+    const double t41  = t16 * t40;
+    const double t42  = sin_theta * t13;
+    const double t43  = t41 * t42;
+    const double t44  = sin(t43);
+    const double t45  = t31 * t40;
+    const double t46  = cos_theta - t30 * t45;
+    const double t47  = cos(t37);
+    const double t48  = cos(t43);
+    const double t49  = t41 * t47 * t48;
+    const double t50  = sin_theta * t31 * t38 * t44 - t46 * t49;
+    const double t51  = 1.0 / t6;
+    const double t52  = cos_theta * t51;
+    const double t53  = 1.0 / (t14 * t14);
+    const double t54  = t26 * t27;
+    const double t55  = t53 * t54;
+    const double t56  = t33 * t55;
+    const double t57  = t36 * t56;
+    const double t58  = t52 + t57;
+    const double t59  = sin_theta * t58;
+    const double t60  = M_PI * t59;
+    const double t61  = t0 * t1;
+    const double t62  = t28 * t51;
+    const double t63  = (t33 * t33) * t55 + t62;
+    const double t64  = 3.0 * t21;
+    const double t65  = M_PI * t61;
+    const double t66  = cos_theta * t31;
+    const double t67  = sin(t11);
+    const double t68  = t20 * t67;
+    const double t69  = t66 * t68;
+    const double t70  = cos(t19);
+    const double t71  = t12 * t70;
+    const double t72  = t18 * t36 * t71;
+    const double t73  = -t0 * t64 - t1 * t64 + t65 * t69 + t65 * t72;
+    const double t74  = -t50 * t60 * t61 + t63 * t73;
+    const double t75  = t28 * t36;
+    const double t76  = cos_theta * cos_theta;
+    const double t77  = t51 * t76;
+    const double t78  = 1.0 / (t6 * sqrt(t6));
+    const double t79  = t35 * t78;
+    const double t80  = t15 * t29;
+    const double t81  = 2.0 * t52;
+    const double t82  = 2.0 * t31 - t79 - t80 * t81;
+    const double t83  = t29 * t76;
+    const double t84  = 2.0 * t31;
+    const double t85  = t30 * t84;
+    const double t86  = cos_theta * t15;
+    const double t87  = s * s;
+    const double t88  = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t89  = t87 * t88;
+    const double t90  = t28 * t78 * t89;
+    const double t91  = 2.0 * t62 * t89;
+    const double t92  = cos_theta * t53;
+    const double t93  = -cos_theta - t15 * t85 + t32 * t83 + t86 * t90 + t91 * t92;
+    const double t94  = 512.0 * t3;
+    const double t95  = t61 * t94;
+    const double t96  = t35 * t45;
+    const double t97  = t96 + 1.0;
+    const double t98  = t28 * t97;
+    const double t99  = cos_theta * t46;
+    const double t100 = t39 / (t98 + t99);
+    const double t101 = t100 * t95;
+    const double t102 = t28 * (t36 * t36) * t55;
+    const double t103 = t65 * (t102 + t77);
+    const double t104 = t36 * t86;
+    const double t105 = t15 * t33;
+    const double t106 = t51 * t80;
+    const double t107 = 1.0 / (t39 * t39);
+    const double t108 = -2.0 * t107 * t28 * t51 * t87 * t88 + t40 * t90 + 3.0 * t96 + 1.0;
+    const double t109 = cos_theta * t40;
+    const double t110 = -t52;
+    const double t111 = 1.0 / (t6 * t6);
+    const double t112 = t111 * t83;
+    const double t113 = sin_theta * t50;
+    const double t114 = t38 * t44;
+    const double t115 = t13 * t44 * t47;
+    const double t116 = t107 * t54;
+    const double t117 = sin_theta * t31;
+    const double t118 = 4.0 * t117;
+    const double t119 = -t108;
+    const double t120 = t111 * t28;
+    const double t121 = t116 * (-cos_theta * t107 * t91 + cos_theta + t109 * t90 - t40 * t85 + t45 * t83);
+    const double t122 = t117 * t68;
+    const double t123 = 6.0 * s;
+    const double t124 = t122 * t123;
+    const double t125 = t21 * t61;
+    const double t126 = t125 * t42;
+    const double t127 = t105 * t123 * t16 * t71;
+    const double t128 = 2.0 * M_PI * cos_theta * ellipticity_e * factor_xi * s * t0 * t1 * t15 * t31 * t33 * t67 * t70 +
+                        cos_theta * inverse_aspect_ratio_epsilon * s * sin_theta * t0 * t1 * t20 * t67 * t78 + 2.0 *
+                        M_PI * ellipticity_e * factor_xi * s * t0 * t1 * t15 * t28 * t31 * t36 * t67 * t70 +
+                        ellipticity_e * factor_xi * t0 * t1 * t12 * t15 * t70 * t93 - t0 * t124 - t0 * t127 - t1 *
+                        t124 - t1 * t127 - t122 * t61 - t126 * t52 - t126 * t57;
+    const double t129 = M_PI * t24;
+    const double t130 = 15.0 * t21;
+    const double t131 = 12.0 * M_PI;
+    const double t132 = t131 * t69;
+    const double t133 = t0 * t22;
+    const double t134 = t1 * t23;
+    const double t135 = inverse_aspect_ratio_epsilon * t129;
+    const double t136 = M_PI * M_PI;
+    const double t137 = 2.0 * t136 * t25;
+    const double t138 = t131 * t72;
+    return 0.0016 * (t0 * t0 * t0 * t0) * (t1 * t1 * t1 * t1) * (256.0 * t25 / t3 + t100 * t14 * t6 *
+           (2576.848625629106 * s * t61 * t74 / (t2 * t2 + 1.0) - sin_theta * t101 * (-t103 * t50 + t59 * t73) * (t104 +
+           t105 - t106 * t34 + t106 * t75 - t108 * t109 + t15 * t93) - t101 * t15 * t74 * (cos_theta * t93 + t15 * t28 *
+           t35 * t82 + t29 * t33 * t77 - t29 * t52 * t75 + t75) + t94 * (s * t63 * (t102 * t137 - t104 * t118 * t136 *
+           t16 * t24 * t67 * t70 - 36.0 * t125 - t130 * t22 - t130 * t23 + t132 * t133 + t132 * t134 + t133 * t138 +
+           t134 * t138 + t135 * t17 * t71 * t82 * t92 - t135 * t68 * t76 * t78 + t137 * t77) + t113 * t129 * (t110 +
+           2.0 * t112 + t121 * t97 + t29 * t54 * t99 * (t29 * t40 * t81 - t79 + t84) / (t39 * t39 * t39)) + t128 * t60 *
+           t61 + 2.0 * t61 * t73 * (-t120 * t35 + t28 * t51 - t56 * t93)) + t95 * (M_PI * sin_theta * t128 * t58 -
+           t103 * (M_PI * s * t118 * t38 * t41 * t46 * t48 - sin_theta * t119 * t49 + t114 * t30 * t78 + t114 * t66 +
+           t115 * t116 * (t46 * t46) + t115 * t62) - t113 * t61 * t9 * (t110 + t112 + t36 * t55 * t93) - t73 *
+           (-inverse_aspect_ratio_epsilon * t120 * t5 + t116 * t119 * t98 + t121 * t46 + t62 - t77))) / (s * t26 * t27 *
+           (t28 * t36 - t34)));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR6_SonnendruckerGyro_ShafranovGeometry.h"
 
 CartesianR6_SonnendruckerGyro_ShafranovGeometry::CartesianR6_SonnendruckerGyro_ShafranovGeometry(
@@ -11,623 +12,90 @@ CartesianR6_SonnendruckerGyro_ShafranovGeometry::CartesianR6_SonnendruckerGyro_S
 double CartesianR6_SonnendruckerGyro_ShafranovGeometry::rhs_f(const double& r, const double& theta,
                                                               const double& sin_theta, const double& cos_theta) const
 {
-    return 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-               sin(M_PI * (2.0 * elongation_kappa * (r / Rmax) * sin_theta + 2.0 * (r / Rmax) * sin_theta)) *
-               cos(M_PI * ((-2.0) * shift_delta * ((r / Rmax) * (r / Rmax)) -
-                           2.0 * elongation_kappa * (r / Rmax) * cos_theta + 2.0 * (r / Rmax) * cos_theta)) /
-               (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) -
-           (2.0 * shift_delta * (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (elongation_kappa - 1.0) *
-                ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                sin_theta /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-1.6384) * (M_PI * M_PI) * pow((elongation_kappa + 1.0), 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 0.4096 * (M_PI * M_PI) * (2.0 * elongation_kappa - 2.0) * (2.0 * elongation_kappa + 2.0) *
-                     pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * pow(sin_theta, 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 2.4576 * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 2.4576 * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 5.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.4576 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 5.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.4576 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 5.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                (1.6384 * M_PI * shift_delta * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 1.6384 * (M_PI * M_PI) * pow((elongation_kappa + 1.0), 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * pow(sin_theta, 2.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * (M_PI * M_PI) * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 4.9152 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 4.9152 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 5.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 2.4576 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 12.288 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 4.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * shift_delta * (r / Rmax) +
-                      M_PI *
-                          ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 2.4576 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 29.4912 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 12.288 * pow(((r / Rmax) - 1.0), 4.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta))) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     sin_theta +
-                 2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0)) *
-                ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            (r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     sin_theta +
-                 2.0 * shift_delta * ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                (0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta))) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            5.03290747193186 * (r / Rmax) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                (sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                       pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                          (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                           2.0 * elongation_kappa + 1.0) -
-                      pow(((elongation_kappa - 1.0) *
-                               ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                               sin_theta +
-                           1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                          2.0)) *
-                 (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0)) -
-            5.03290747193186 * (r / Rmax) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                (0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta))) /
-                (sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                       pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                          (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                           2.0 * elongation_kappa + 1.0) -
-                      pow(((elongation_kappa - 1.0) *
-                               ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                               sin_theta +
-                           1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                          2.0)) *
-                 (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                 pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                ((-1.6384) * (M_PI * M_PI) * (r / Rmax) * pow((elongation_kappa + 1.0), 2.0) *
-                     pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * pow(cos_theta, 2.0) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 0.4096 * (M_PI * M_PI) * (r / Rmax) * pow((2.0 * elongation_kappa - 2.0), 2.0) *
-                     pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * pow(sin_theta, 2.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 0.8192 * (M_PI * M_PI) * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * (2.0 * elongation_kappa + 2.0) *
-                     pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta -
-                 0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                 pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) *
-                (4.0 * elongation_kappa *
-                     (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     sin_theta * cos_theta -
-                 1.0 / 2.0 *
-                     (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                      (2.0 * elongation_kappa - 2.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) +
-                 1.0 / 2.0 *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      2.0 * (elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                      2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                 (2.0 * elongation_kappa - 2.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-0.4096) * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                ((-1.6384) * (M_PI * M_PI) * (r / Rmax) * pow((elongation_kappa + 1.0), 2.0) *
-                     pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 0.4096 * (M_PI * M_PI) * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * (2.0 * elongation_kappa + 2.0) *
-                     pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * pow(sin_theta, 2.0) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * (M_PI * M_PI) * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin_theta * sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) -
-                 2.4576 * M_PI * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 2.4576 * M_PI * (r / Rmax) * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 5.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * (M_PI * M_PI) * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos_theta * cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.4576 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 5.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.4576 * M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 5.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * M_PI * (2.0 * elongation_kappa - 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * cos_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta)) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                 (elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                 pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta)) *
-                (0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta))) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) +
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                 2.0 * elongation_kappa + 1.0) *
-                (0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta))) /
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)) -
-            (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                ((elongation_kappa - 1.0) *
-                     ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                 1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                (4.0 * elongation_kappa *
-                     (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                     sin_theta * cos_theta -
-                 1.0 / 2.0 *
-                     (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                      (2.0 * elongation_kappa - 2.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                     (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                      2.0 * elongation_kappa + 1.0) +
-                 1.0 / 2.0 *
-                     ((elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                      1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                     (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      2.0 * (elongation_kappa - 1.0) *
-                          ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                      2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) *
-                (0.4096 * M_PI * (2.0 * elongation_kappa + 2.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     cos(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) -
-                 0.4096 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-4.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta) *
-                     sin(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta)) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(M_PI * (r / Rmax) * (2.0 * elongation_kappa + 2.0) * sin_theta) *
-                     cos(M_PI * (r / Rmax) *
-                         ((-2.0) * shift_delta * (r / Rmax) - 2.0 * elongation_kappa * cos_theta + 2.0 * cos_theta))) /
-                pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)),
-                    (3.0 / 2.0))) /
-               ((r / Rmax) *
-                sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                      pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) -
-                     pow(((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                         2.0)));
+    const double s   = r / Rmax;
+    const double t0  = s - 1.0;
+    const double t1  = s + 1.0;
+    const double t2  = elongation_kappa + 1.0;
+    const double t3  = 2.0 * M_PI;
+    const double t4  = s * t3;
+    const double t5  = sin_theta * t4;
+    const double t6  = t2 * t5;
+    const double t7  = sin(t6);
+    const double t8  = 14.4444444444444 * s - 11.1111111111111;
+    const double t9  = 0.348432055749129 * atan(t8) - 0.452961672473868;
+    const double t10 = s * shift_delta;
+    const double t11 = elongation_kappa - 1.0;
+    const double t12 = cos_theta * t11;
+    const double t13 = t1 * t1;
+    const double t14 = t0 * t0;
+    const double t15 = t13 * t14;
+    const double t16 = t2 * t2;
+    const double t17 = sin_theta * sin_theta;
+    const double t18 = 2.0 * t10;
+    const double t19 = -t11;
+    const double t20 = t17 * t19;
+    const double t21 = cos_theta * t19;
+    const double t22 = -t18 + t21;
+    const double t23 = cos_theta * t22;
+    const double t24 = t20 + t23;
+    const double t25 = 1.0 / t24;
+    const double t26 = t4 * (-t10 + t21);
+    const double t27 = cos(t26);
+    const double t28 = cos(t6);
+    const double t29 = t2 * t28;
+    const double t30 = t27 * t29;
+    const double t31 = cos_theta * t30;
+    const double t32 = sin(t26);
+    const double t33 = t32 * t7;
+    const double t34 = sin_theta * t19 * t33;
+    const double t35 = t31 + t34;
+    const double t36 = cos_theta * t16;
+    const double t37 = -t19 * t22 + t36;
+    const double t38 = -sin_theta * t37;
+    const double t39 = M_PI * t38;
+    const double t40 = t0 * t1;
+    const double t41 = (cos_theta * cos_theta) * t16;
+    const double t42 = t17 * (t19 * t19);
+    const double t43 = t41 + t42;
+    const double t44 = t27 * t7;
+    const double t45 = 3.0 * t44;
+    const double t46 = sin_theta * t30;
+    const double t47 = M_PI * t40;
+    const double t48 = t22 * t33;
+    const double t49 = t0 * t45 + t1 * t45 + t46 * t47 - t47 * t48;
+    const double t50 = t43 * t49;
+    const double t51 = t35 * t39 * t40 + t50;
+    const double t52 = -t9;
+    const double t53 = t16 * t17;
+    const double t54 = t22 * t22;
+    const double t55 = t47 * (t53 + t54);
+    const double t56 = 512.0 * t52;
+    const double t57 = t40 * t56;
+    const double t58 = sin_theta * t35;
+    const double t59 = t4 * t44;
+    const double t60 = 6.0 * s;
+    const double t61 = t31 * t60;
+    const double t62 = t34 * t60;
+    const double t63 = t40 * t44;
+    const double t64 = t5 * t63;
+    const double t65 = t29 * t32;
+    const double t66 = t4 * t40 * t65;
+    const double t67 = t39 * (t0 * t61 + t0 * t62 + t1 * t61 + t1 * t62 + t19 * t22 * t64 + t20 * t66 - t23 * t66 +
+                       t31 * t40 + t34 * t40 - t36 * t64);
+    const double t68 = 15.0 * t44;
+    const double t69 = t0 * t13;
+    const double t70 = 12.0 * M_PI;
+    const double t71 = t46 * t70;
+    const double t72 = t1 * t14;
+    const double t73 = t48 * t70;
+    const double t74 = (M_PI * M_PI) * t15;
+    const double t75 = 2.0 * t44 * t74;
+    return 0.0016 * (t0 * t0 * t0 * t0) * (t1 * t1 * t1 * t1) * (-256.0 * t15 * t7 * cos(t4 * (t10 + t12)) / t9 + t25 *
+           (-2576.848625629106 * s * t40 * t51 / (t8 * t8 + 1.0) - 1024.0 * sin_theta * t10 * t25 * t40 * t52 * (t35 *
+           t55 + t38 * t49) + t25 * t51 * t57 * (2.0 * cos_theta * s * shift_delta - t24) + t56 * (s * t43 *
+           (shift_delta * t15 * t3 * t33 - 4.0 * sin_theta * t22 * t65 * t74 + t13 * t68 + t14 * t68 - t53 * t75 - t54 *
+           t75 + 36.0 * t63 + t69 * t71 - t69 * t73 + t71 * t72 - t72 * t73) + M_PI * t15 * t58 * (-t18 * t19 - t37) +
+           2.0 * t40 * t50 + t40 * t67) + t57 * (t3 * t37 * t40 * t58 + t49 * (cos_theta * t19 * t22 + t16 * t17 -
+           t43) + t55 * (4.0 * M_PI * cos_theta * s * sin_theta * t19 * t2 * t28 * t32 + cos_theta * t19 * t32 * t7 -
+           t41 * t59 - t42 * t59 - t46) + t67)) / (s * t16 * (cos_theta * (t12 + t18) + t11 * t17)));
 }
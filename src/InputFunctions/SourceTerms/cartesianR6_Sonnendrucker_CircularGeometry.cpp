@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR6_Sonnendrucker_CircularGeometry.h"
 
 CartesianR6_Sonnendrucker_CircularGeometry::CartesianR6_Sonnendrucker_CircularGeometry(const double& Rmax)
@@ -8,63 +9,41 @@ CartesianR6_Sonnendrucker_CircularGeometry::CartesianR6_Sonnendrucker_CircularGe
 double CartesianR6_Sonnendrucker_CircularGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                          const double& cos_theta) const
 {
-    return (-((r / Rmax) *
-                  (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((-1.6384) * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       pow(sin_theta, 2.0) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   3.2768 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-                   1.6384 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                   12.288 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 4.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                   29.4912 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   12.288 * pow(((r / Rmax) - 1.0), 4.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) -
-              5.03290747193186 * (r / Rmax) *
-                  (0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                   2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) /
-                  (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  (0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                   2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) +
-              (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                  ((-1.6384) * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                       pow(((r / Rmax) + 1.0), 6.0) * pow(sin_theta, 2.0) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   3.2768 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin_theta * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-                   1.6384 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) *
-                       cos_theta))) /
-           (r / Rmax);
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s - 1.0;
+    const double t1  = s + 1.0;
+    const double t2  = cos_theta * cos_theta;
+    const double t3  = sin_theta * sin_theta;
+    const double t4  = 14.4444444444444 * s - 11.1111111111111;
+    const double t5  = 0.348432055749129 * atan(t4) - 0.452961672473868;
+    const double t6  = M_PI * s;
+    const double t7  = 2.0 * t6;
+    const double t8  = cos_theta * t7;
+    const double t9  = cos(t8);
+    const double t10 = sin_theta * t7;
+    const double t11 = sin(t10);
+    const double t12 = t11 * t9;
+    const double t13 = 3.0 * t12;
+    const double t14 = sin_theta * cos(t10);
+    const double t15 = t14 * t9;
+    const double t16 = t0 * t1;
+    const double t17 = M_PI * t16;
+    const double t18 = cos_theta * sin(t8);
+    const double t19 = t11 * t18;
+    const double t20 = t16 * (t0 * t13 + t1 * t13 + t15 * t17 - t17 * t19);
+    const double t21 = t0 * t0;
+    const double t22 = t1 * t1;
+    const double t23 = 4.0 * t14 * t18;
+    const double t24 = t12 * t7;
+    const double t25 = 15.0 * t12;
+    const double t26 = M_PI * t0 * t22;
+    const double t27 = 12.0 * t19;
+    const double t28 = M_PI * t1 * t21;
+    const double t29 = 12.0 * t15;
+    const double t30 = (M_PI * M_PI) * t21 * t22;
+    const double t31 = 2.0 * t12 * t30;
+    return -0.0016 * (t0 * t0 * t0 * t0) * (t1 * t1 * t1 * t1) * (-2576.848625629106 * s * t20 / (t4 * t4 + 1.0) +
+           512.0 * s * t5 * (-36.0 * t12 * t16 + t2 * t31 - t21 * t25 - t22 * t25 + t23 * t30 + t26 * t27 - t26 * t29 +
+           t27 * t28 - t28 * t29 + t3 * t31) - 512.0 * t20 * t5 + 512.0 * M_PI * t21 * t22 * t5 * (t15 - t19 + t2 *
+           t24 - t23 * t6 + t24 * t3)) / (s * (t2 + t3));
+}
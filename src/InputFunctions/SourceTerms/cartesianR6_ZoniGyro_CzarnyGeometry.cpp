@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR6_ZoniGyro_CzarnyGeometry.h"
 
 void CartesianR6_ZoniGyro_CzarnyGeometry::initializeGeometry()
@@ -18,1156 +19,132 @@ CartesianR6_ZoniGyro_CzarnyGeometry::CartesianR6_ZoniGyro_CzarnyGeometry(const d
 double CartesianR6_ZoniGyro_CzarnyGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                   const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * exp(tanh(10.0 * (r / Rmax) - 5.0)) *
-               sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-               cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-           ((-(r / Rmax)) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) * exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (r / Rmax) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp)) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                               sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp))) *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp))) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) -
-            (r / Rmax) *
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                (0.8192 * M_PI * inverse_aspect_ratio_epsilon * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp)) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 1.6384 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.9152 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.9152 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp))) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (r / Rmax) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta * cos_theta_pow2 * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp)) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                          sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                      ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                ((-0.8192) * M_PI * inverse_aspect_ratio_epsilon * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta_pow2 / pow((temp * temp), (3.0 / 2.0)) -
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     pow((2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                              cos_theta * factor_xi / (temp1 * temp) +
-                          2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                      4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp)) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 1.6384 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta_pow2 * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 1.6384 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 4.9152 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 9.8304 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 12.288 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 4.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 4.9152 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 9.8304 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 29.4912 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 12.288 * pow(((r / Rmax) - 1.0), 4.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (r / Rmax) *
-                (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 sin_theta_pow2 / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp)) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                               sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                               (temp1 * temp))) *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp))) *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp))) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) -
-            (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                  (temp1 * temp) +
-              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-             sin_theta * cos_theta / (temp * temp)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                  (temp1 * temp) +
-              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-             sin_theta * cos_theta / (temp * temp)) *
-                (0.8192 * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 0.4096 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 1.6384 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin_theta * sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos_theta * cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) +
-                 0.8192 * M_PI * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) * cos_theta *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp -
-                 0.8192 * M_PI * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.9152 * M_PI * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 4.9152 * M_PI * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      4.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                  (temp1 * temp) +
-              ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-             sin_theta * cos_theta / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                          pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                          pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                      2.0 * sin_theta * cos_theta / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta * cos_theta / (temp * temp))) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                 ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                      factor_xi / (temp1 * temp) +
-                  2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-             0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                 sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                     pow((temp * temp), 2.0) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                 2.0 * sin_theta * cos_theta / (temp * temp)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                 ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                      factor_xi / (temp1 * temp) +
-                  2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-             0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                 sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp) *
-                (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                     2.0) +
-                 cos_theta_pow2 / (temp * temp)) *
-                (1.0 / 2.0 *
-                     (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                      sin_theta * cos_theta / (temp * temp)) *
-                     ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                          pow((temp * temp), 2.0) +
-                      2.0 *
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 *
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                          pow((temp * temp), 2.0) +
-                      (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                          (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                               (temp2 * (temp * temp)) -
-                           4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                               factor_xi / (temp1 * temp) +
-                           2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                      2.0 * sin_theta * cos_theta / (temp * temp)) -
-                 1.0 / 2.0 *
-                     (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      cos_theta_pow2 / (temp * temp)) *
-                     (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) / pow((temp * temp), 2.0) +
-                      ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                           (temp1 * temp) +
-                       ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                          ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                               (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                           4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                               ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                           6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) -
-                           2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                      2.0 * sin_theta * cos_theta / (temp * temp))) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))),
-                    (3.0 / 2.0)) +
-            (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                 2.0) +
-             sin_theta_pow2 / (temp * temp)) *
-                (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) +
-            (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                 2.0) +
-             cos_theta_pow2 / (temp * temp)) *
-                ((-0.8192) * M_PI * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                     pow(((r / Rmax) + 1.0), 6.0) * sin_theta_pow2 *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) /
-                     pow((temp * temp), (3.0 / 2.0)) -
-                 0.4096 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     pow(((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                              factor_xi / (temp1 * temp) +
-                          2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) -
-                 1.6384 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin_theta_pow2 *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) / (temp * temp) -
-                 1.6384 * M_PI * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                          factor_xi / (temp1 * temp) +
-                      2.0 * M_PI * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     sin_theta * sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) / temp +
-                 0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     ((-2.0) * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      4.0 * M_PI * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                      6.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) -
-                      2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) -
-                 0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                     sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                     sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                     temp) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) -
-            (0.4096 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                 (2.0 * M_PI * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                      factor_xi / (temp1 * temp) +
-                  2.0 * M_PI * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 cos(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) +
-             0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                 sin(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) * cos_theta /
-                 temp +
-             2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon) +
-             2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                 sin(2.0 * M_PI * ellipticity_e * (r / Rmax) * sin_theta * factor_xi / ((2.0 - temp))) *
-                 cos(2.0 * M_PI * (1.0 - temp) / inverse_aspect_ratio_epsilon)) *
-                ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                     pow((temp * temp), 2.0) +
-                 ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                      2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                 (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                     ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                          (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                      2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                          ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                      3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                          factor_xi / (temp1 * temp) -
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                 sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) *
-                exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                 (temp1 * temp) +
-                             ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                            sin_theta * cos_theta / (temp * temp)),
-                           2.0)) +
-                     (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                          2.0) +
-                      sin_theta_pow2 / (temp * temp)) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)))) /
-               ((r / Rmax) * sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) *
-                                              sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                             (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                                  cos_theta * factor_xi / (temp1 * temp) +
-                                              ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                         sin_theta * cos_theta / (temp * temp)),
-                                        2.0)) +
-                                  (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                            factor_xi / (temp1 * temp) +
-                                        ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                                       2.0) +
-                                   sin_theta_pow2 / (temp * temp)) *
-                                      (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                                cos_theta * factor_xi / (temp1 * temp) +
-                                            ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                           2.0) +
-                                       cos_theta_pow2 / (temp * temp))));
-}
\ No newline at end of file
+    const double s    = r / Rmax;
+    const double t0   = s - 1.0;
+    const double t1   = s + 1.0;
+    const double t2   = 2.0 * s;
+    const double t3   = inverse_aspect_ratio_epsilon * (cos_theta * t2 + inverse_aspect_ratio_epsilon) + 1.0;
+    const double t4   = sqrt(t3);
+    const double t5   = t4 - 1.0;
+    const double t6   = 2.0 * M_PI;
+    const double t7   = t6 / inverse_aspect_ratio_epsilon;
+    const double t8   = tanh(5.0 * t2 - 5.0);
+    const double t9   = t4 - 2.0;
+    const double t10  = ellipticity_e * factor_xi;
+    const double t11  = M_PI * sin_theta;
+    const double t12  = t11 * t2;
+    const double t13  = t1 * t1;
+    const double t14  = t0 * t0;
+    const double t15  = t13 * t14;
+    const double t16  = ellipticity_e * ellipticity_e;
+    const double t17  = factor_xi * factor_xi;
+    const double t18  = -t9;
+    const double t19  = t18 * t18;
+    const double t20  = sin_theta * sin_theta;
+    const double t21  = 1.0 / t4;
+    const double t22  = cos_theta * t21;
+    const double t23  = 1.0 / t18;
+    const double t24  = inverse_aspect_ratio_epsilon * s;
+    const double t25  = t23 * t24;
+    const double t26  = t22 * t25;
+    const double t27  = t26 + 1.0;
+    const double t28  = t20 * t27;
+    const double t29  = t20 * t21;
+    const double t30  = -t25 * t29;
+    const double t31  = cos_theta + t30;
+    const double t32  = cos_theta * t31;
+    const double t33  = t28 + t32;
+    const double t34  = -t5 * t7;
+    const double t35  = cos(t34);
+    const double t36  = t10 * t23;
+    const double t37  = t12 * t36;
+    const double t38  = sin(t37);
+    const double t39  = t35 * t38;
+    const double t40  = 3.0 * t39;
+    const double t41  = sin(t34);
+    const double t42  = t38 * t41;
+    const double t43  = t22 * t42;
+    const double t44  = t0 * t1;
+    const double t45  = M_PI * t44;
+    const double t46  = cos(t37);
+    const double t47  = t35 * t36;
+    const double t48  = t46 * t47;
+    const double t49  = sin_theta * t27 * t45 * t48 + t0 * t40 + t1 * t40 + t43 * t45;
+    const double t50  = 1.0 / (t3 * t3);
+    const double t51  = 1.0 / t3;
+    const double t52  = t20 * t51;
+    const double t53  = inverse_aspect_ratio_epsilon * t2;
+    const double t54  = t23 * t53;
+    const double t55  = cos_theta * cos_theta;
+    const double t56  = t24 * t55;
+    const double t57  = t21 * t23;
+    const double t58  = 1.0 / (t3 * sqrt(t3));
+    const double t59  = cos_theta * t58;
+    const double t60  = s * s;
+    const double t61  = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t62  = t60 * t61;
+    const double t63  = t23 * t62;
+    const double t64  = 1.0 / t19;
+    const double t65  = -2.0 * cos_theta * t52 * t62 * t64 + t20 * t59 * t63 + t56 * t57;
+    const double t66  = cos_theta - t29 * t54 + t65;
+    const double t67  = t16 * t17;
+    const double t68  = t64 * t67;
+    const double t69  = t31 * t68;
+    const double t70  = t52 + t66 * t69;
+    const double t71  = sin_theta * t42;
+    const double t72  = t21 * t71;
+    const double t73  = t31 * t46;
+    const double t74  = t47 * t73;
+    const double t75  = -t72 + t74;
+    const double t76  = t24 * t59;
+    const double t77  = cos_theta * t51;
+    const double t78  = 2.0 * t21 + t54 * t77 - t76;
+    const double t79  = t27 * t66 * t68 - t77;
+    const double t80  = t11 * t15;
+    const double t81  = t27 * t69;
+    const double t82  = sin_theta * (t77 - t81);
+    const double t83  = M_PI * t82;
+    const double t84  = t44 * t75;
+    const double t85  = (t31 * t31) * t68;
+    const double t86  = t52 + t85;
+    const double t87  = t49 * t86 + t83 * t84;
+    const double t88  = 1.0 / t33;
+    const double t89  = t51 * t55;
+    const double t90  = cos_theta * t78;
+    const double t91  = cos_theta * t27;
+    const double t92  = t20 * t58;
+    const double t93  = 2.0 * t20 * t51 * t60 * t61 * t64 - 3.0 * t26 - t63 * t92 - 1.0;
+    const double t94  = t24 * t51;
+    const double t95  = t20 * (t27 * t27) * t68;
+    const double t96  = t45 * (t89 + t95);
+    const double t97  = 15.0 * t39;
+    const double t98  = t39 * t44;
+    const double t99  = 12.0 * M_PI * t43;
+    const double t100 = t0 * t13;
+    const double t101 = t1 * t14;
+    const double t102 = (M_PI * M_PI) * t15;
+    const double t103 = 2.0 * t102 * t39;
+    const double t104 = 12.0 * t11 * t27 * t48;
+    const double t105 = t10 * t41 * t57;
+    const double t106 = 4.0 * t105;
+    const double t107 = 6.0 * s;
+    const double t108 = t107 * t72;
+    const double t109 = t12 * t98;
+    const double t110 = t107 * t74;
+    const double t111 = t105 * t2 * t45 * t46;
+    const double t112 = t83 * (-t0 * t108 + t0 * t110 - t1 * t108 + t1 * t110 + t109 * t77 - t109 * t81 - t111 * t28 +
+                        t111 * t32 + t44 * t48 * t66 + t44 * t71 * t76 - t44 * t72);
+    const double t113 = M_PI * t2 * t39;
+    return 0.4096 * (t0 * t0 * t0 * t0) * (t1 * t1 * t1 * t1) * (-t15 * exp(t8) * sin(t10 * t12 / t9) * cos(t5 * t7) +
+           2.0 * t19 * t3 * (-10.0 * s * t44 * t87 * (t8 * t8 - 1.0) - s * t86 * (inverse_aspect_ratio_epsilon * t10 *
+           t35 * t46 * t64 * t80 * t90 - M_PI * inverse_aspect_ratio_epsilon * t15 * t42 * t55 * t58 + sin_theta *
+           t102 * t106 * t46 * t91 + t100 * t104 + t100 * t99 + t101 * t104 + t101 * t99 - t103 * t89 - t103 * t95 +
+           t13 * t97 + t14 * t97 + 36.0 * t98) + sin_theta * t0 * t1 * t88 * (t49 * t82 + t75 * t96) * (cos_theta *
+           t93 + t28 * t94 + t30 + t32 * t94 + t65 + t91) + t0 * t1 * t87 * t88 * (cos_theta * t66 + t20 * t25 * t90 -
+           t24 * t28 * t77 - t24 * t31 * t89 + t28) - t112 * t44 - 2.0 * t44 * t49 * (-cos_theta * t20 * t24 * t50 +
+           t70) - t44 * (sin_theta * t6 * t84 * (t50 * t56 + t79) + t112 + t49 * (2.0 * cos_theta *
+           inverse_aspect_ratio_epsilon * s * t20 * t50 - t28 * t68 * t93 + t51 * t55 - t70) + t96 * (ellipticity_e *
+           factor_xi * sin_theta * t23 * t35 * t46 * t93 - s * t106 * t11 * t73 - t113 * t52 - t113 * t85 - t24 * t42 *
+           t92 - t43)) - t75 * t80 * (-t50 * t53 * t55 - t79 - t24 * t32 * t67 * t78 / (t18 * t18 * t18))) * exp(-t8) /
+           (s * t16 * t17 * (t33 * t33)));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/cartesianR6_Zoni_CircularGeometry.h"
 
 CartesianR6_Zoni_CircularGeometry::CartesianR6_Zoni_CircularGeometry(const double& Rmax)
@@ -8,62 +9,40 @@ CartesianR6_Zoni_CircularGeometry::CartesianR6_Zoni_CircularGeometry(const doubl
 double CartesianR6_Zoni_CircularGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                 const double& cos_theta) const
 {
-    return (-((r / Rmax) * (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) *
-                  (0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                   2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) +
-              (r / Rmax) *
-                  ((-1.6384) * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       pow(sin_theta, 2.0) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   3.2768 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta * cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-                   1.6384 * (M_PI * M_PI) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                       cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) * sin_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                   12.288 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 4.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                       cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-                   9.8304 * M_PI * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-                   29.4912 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-                   12.288 * pow(((r / Rmax) - 1.0), 4.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                       sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) +
-              (0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                   cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-               0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                   sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta +
-               2.4576 * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 5.0) *
-                   sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-               2.4576 * pow(((r / Rmax) - 1.0), 5.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                   sin(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta)) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)) +
-              ((-1.6384) * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                   pow(sin_theta, 2.0) * sin(2.0 * M_PI * (r / Rmax) * sin_theta) *
-                   cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-               3.2768 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                   sin_theta * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta *
-                   cos(2.0 * M_PI * (r / Rmax) * sin_theta) -
-               1.6384 * (M_PI * M_PI) * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                   sin(2.0 * M_PI * (r / Rmax) * sin_theta) * pow(cos_theta, 2.0) *
-                   cos(2.0 * M_PI * (r / Rmax) * cos_theta) -
-               0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) * sin_theta *
-                   cos(2.0 * M_PI * (r / Rmax) * sin_theta) * cos(2.0 * M_PI * (r / Rmax) * cos_theta) +
-               0.8192 * M_PI * pow(((r / Rmax) - 1.0), 6.0) * pow(((r / Rmax) + 1.0), 6.0) *
-                   sin(2.0 * M_PI * (r / Rmax) * sin_theta) * sin(2.0 * M_PI * (r / Rmax) * cos_theta) * cos_theta) *
-                  exp(-tanh(10.0 * (r / Rmax) - 5.0)))) /
-           (r / Rmax);
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s - 1.0;
+    const double t1  = s + 1.0;
+    const double t2  = cos_theta * cos_theta;
+    const double t3  = sin_theta * sin_theta;
+    const double t4  = 2.0 * s;
+    const double t5  = tanh(5.0 * t4 - 5.0);
+    const double t6  = M_PI * t4;
+    const double t7  = cos_theta * t6;
+    const double t8  = cos(t7);
+    const double t9  = sin_theta * t6;
+    const double t10 = sin(t9);
+    const double t11 = t10 * t8;
+    const double t12 = 3.0 * t11;
+    const double t13 = sin_theta * cos(t9);
+    const double t14 = t13 * t8;
+    const double t15 = t0 * t1;
+    const double t16 = M_PI * t15;
+    const double t17 = cos_theta * sin(t7);
+    const double t18 = t10 * t17;
+    const double t19 = t15 * (t0 * t12 + t1 * t12 + t14 * t16 - t16 * t18);
+    const double t20 = t0 * t0;
+    const double t21 = 4.0 * t13 * t17;
+    const double t22 = t11 * t6;
+    const double t23 = t1 * t1;
+    const double t24 = M_PI * t23;
+    const double t25 = 15.0 * t11;
+    const double t26 = t0 * t24;
+    const double t27 = 12.0 * t18;
+    const double t28 = M_PI * t1 * t20;
+    const double t29 = 12.0 * t14;
+    const double t30 = (M_PI * M_PI) * t20 * t23;
+    const double t31 = 2.0 * t11 * t30;
+    return -0.8192 * (t0 * t0 * t0 * t0) * (t1 * t1 * t1 * t1) * (10.0 * s * t19 * (t5 * t5 - 1.0) - s * (-36.0 * t11 *
+           t15 + t2 * t31 - t20 * t25 + t21 * t30 - t23 * t25 + t26 * t27 - t26 * t29 + t27 * t28 - t28 * t29 + t3 *
+           t31) + t19 - t20 * t24 * (-M_PI * s * t21 + t14 - t18 + t2 * t22 + t22 * t3)) * exp(-t5) / (s * (t2 + t3));
+}
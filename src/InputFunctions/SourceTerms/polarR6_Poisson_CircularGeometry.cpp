@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/polarR6_Poisson_CircularGeometry.h"
 
 PolarR6_Poisson_CircularGeometry::PolarR6_Poisson_CircularGeometry(const double& Rmax)
@@ -8,9 +9,8 @@ PolarR6_Poisson_CircularGeometry::PolarR6_Poisson_CircularGeometry(const double&
 double PolarR6_Poisson_CircularGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                const double& cos_theta) const
 {
-    return (-pow((r / Rmax), 4.0)) * (14.7456 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                                      1.0 * (r / Rmax) *
-                                          (12.288 * (r / Rmax) * pow(((r / Rmax) - 1.0), 4.0) * cos(11.0 * theta) +
-                                           17.2032 * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta)) -
-                                      34.816 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta));
-}
\ No newline at end of file
+    const double s  = r / Rmax;
+    const double t0 = s - 1.0;
+    return -0.4096 * (s * s * s * s) * (t0 * t0 * t0 * t0) * (30.0 * (s * s) + 72.0 * s * t0 - 91.0 * (t0 * t0) + 6.0 *
+           t0 * (2.0 * s - 1.0)) * cos(11.0 * theta) / (cos_theta * cos_theta + sin_theta * sin_theta);
+}
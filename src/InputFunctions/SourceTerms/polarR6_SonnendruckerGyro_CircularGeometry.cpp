@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/polarR6_SonnendruckerGyro_CircularGeometry.h"
 
 PolarR6_SonnendruckerGyro_CircularGeometry::PolarR6_SonnendruckerGyro_CircularGeometry(const double& Rmax)
@@ -8,21 +9,16 @@ PolarR6_SonnendruckerGyro_CircularGeometry::PolarR6_SonnendruckerGyro_CircularGe
 double PolarR6_SonnendruckerGyro_CircularGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                          const double& cos_theta) const
 {
-    return 0.4096 * pow((r / Rmax), 6.0) * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta) /
-               (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) -
-           pow((r / Rmax), 4.0) *
-               ((r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (12.288 * (r / Rmax) * pow(((r / Rmax) - 1.0), 4.0) * cos(11.0 * theta) +
-                     17.2032 * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta)) -
-                5.03290747193186 * (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) /
-                    (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) -
-                49.5616 *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta) +
-                6.0 * (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)));
+    const double s  = r / Rmax;
+    const double t0 = s - 1.0;
+    const double t1 = s * s;
+    const double t2 = t0 * t0;
+    const double t3 = 14.4444444444444 * s - 11.1111111111111;
+    const double t4 = 0.348432055749129 * atan(t3) - 0.452961672473868;
+    const double t5 = -t4;
+    const double t6 = 2.0 * s - 1.0;
+    const double t7 = s * t0;
+    return -0.0016 * (s * s * s * s) * (t0 * t0 * t0 * t0) * (256.0 * t1 * t2 / t4 + (1536.0 * t0 * t5 * t6 - 30976.0 *
+           t2 * t5 + 1536.0 * t5 * (5.0 * t1 + 5.0 * t2 + 12.0 * t7) - 7730.545876887318 * t6 * t7 / (t3 * t3 + 1.0)) /
+           (cos_theta * cos_theta + sin_theta * sin_theta)) * cos(11.0 * theta);
 }
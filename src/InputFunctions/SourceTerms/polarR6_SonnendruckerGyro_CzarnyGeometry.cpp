@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/polarR6_SonnendruckerGyro_CzarnyGeometry.h"
 
 void PolarR6_SonnendruckerGyro_CzarnyGeometry::initializeGeometry()
@@ -17,837 +18,82 @@ PolarR6_SonnendruckerGyro_CzarnyGeometry::PolarR6_SonnendruckerGyro_CzarnyGeomet
 double PolarR6_SonnendruckerGyro_CzarnyGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                        const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return 0.4096 * pow((r / Rmax), 6.0) * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta) /
-               (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) -
-           pow((r / Rmax), 4.0) *
-               (4.5056 * (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp)) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) *
-                    sin(11.0 * theta) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) +
-                4.5056 * (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                     ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                              (temp1 * temp)) +
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                              sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                          ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                          ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) *
-                    sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                27.0336 * (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 5.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (12.288 * (r / Rmax) * pow(((r / Rmax) - 1.0), 4.0) * cos(11.0 * theta) +
-                     17.2032 * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                     ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                              (temp1 * temp))) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp)) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) -
-                22.6762679055362 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    sin(11.0 * theta) /
-                    ((208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) *
-                     sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                      factor_xi / (temp1 * temp) +
-                                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                          cos_theta * factor_xi / (temp1 * temp) +
-                                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                 sin_theta * cos_theta / (temp * temp)),
-                                2.0)) +
-                          (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                               2.0) +
-                           sin_theta_pow2 / (temp * temp)) *
-                              (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                        factor_xi / (temp1 * temp) +
-                                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                   2.0) +
-                               cos_theta_pow2 / (temp * temp)))) -
-                5.03290747193186 * (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) /
-                    ((208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) *
-                     sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                      factor_xi / (temp1 * temp) +
-                                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta *
-                                          cos_theta * factor_xi / (temp1 * temp) +
-                                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                 sin_theta * cos_theta / (temp * temp)),
-                                2.0)) +
-                          (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                               2.0) +
-                           sin_theta_pow2 / (temp * temp)) *
-                              (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                        factor_xi / (temp1 * temp) +
-                                    ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                   2.0) +
-                               cos_theta_pow2 / (temp * temp)))) +
-                27.0336 *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                49.5616 *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     cos_theta_pow2 / (temp * temp)) *
-                    cos(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                4.5056 *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                         pow((temp * temp), 2.0) +
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                         (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp2 * (temp * temp)) -
-                          4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                     2.0 * sin_theta * cos_theta / (temp * temp)) *
-                    sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                4.5056 *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     cos_theta_pow2 / (temp * temp)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                              pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                              pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                          2.0 * sin_theta * cos_theta / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                              pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta * cos_theta / (temp * temp))) *
-                    sin(11.0 * theta) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) -
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    ((-27.0336) * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * sin(11.0 * theta) -
-                     27.0336 * pow(((r / Rmax) - 1.0), 6.0) * sin(11.0 * theta)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                              pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                              pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                          2.0 * sin_theta * cos_theta / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                              pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta * cos_theta / (temp * temp))) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) +
-                6.0 * (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                         pow((temp * temp), 2.0) +
-                     ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp2 * (temp * temp)) -
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                         ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                          3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) -
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                     sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp)))) /
-               sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                (temp1 * temp) +
-                            ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                               (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                           sin_theta * cos_theta / (temp * temp)),
-                          2.0)) +
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                        (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                  factor_xi / (temp1 * temp) +
-                              ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                             2.0) +
-                         cos_theta_pow2 / (temp * temp)));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s - 1.0;
+    const double t1  = s * s;
+    const double t2  = 11.0 * theta;
+    const double t3  = cos(t2);
+    const double t4  = t0 * t0;
+    const double t5  = 14.4444444444444 * s - 11.1111111111111;
+    const double t6  = 0.348432055749129 * atan(t5) - 0.452961672473868;
+    const double t7  = ellipticity_e * ellipticity_e;
+    const double t8  = factor_xi * factor_xi;
+    const double t9  = 2.0 * s;
+    const double t10 = inverse_aspect_ratio_epsilon * (cos_theta * t9 + inverse_aspect_ratio_epsilon) + 1.0;
+    const double t11 = sqrt(t10);
+    const double t12 = 2.0 - t11;
+    const double t13 = t12 * t12;
+    const double t14 = sin_theta * sin_theta;
+    const double t15 = inverse_aspect_ratio_epsilon * s;
+    const double t16 = 1.0 / t11;
+    const double t17 = 1.0 / t12;
+    const double t18 = t16 * t17;
+    const double t19 = t15 * t18;
+    const double t20 = cos_theta * t19;
+    const double t21 = t20 + 1.0;
+    const double t22 = t14 * t21;
+    const double t23 = t14 * t15;
+    const double t24 = -t18 * t23;
+    const double t25 = cos_theta + t24;
+    const double t26 = cos_theta * t25;
+    const double t27 = t22 + t26;
+    const double t28 = t9 - 1.0;
+    const double t29 = 1.0 / t10;
+    const double t30 = t14 * t29;
+    const double t31 = 1.0 / t13;
+    const double t32 = t7 * t8;
+    const double t33 = t31 * t32;
+    const double t34 = (t25 * t25) * t33 + t30;
+    const double t35 = cos_theta * t29;
+    const double t36 = t21 * t33;
+    const double t37 = -t25 * t36 + t35;
+    const double t38 = sin(t2);
+    const double t39 = 11.0 * t38;
+    const double t40 = sin_theta * t0;
+    const double t41 = 6.0 * t28 * t3 * t34 - t37 * t39 * t40;
+    const double t42 = s * t0;
+    const double t43 = cos_theta * cos_theta;
+    const double t44 = t29 * t43;
+    const double t45 = 2.0 * t16;
+    const double t46 = 1.0 / (t10 * sqrt(t10));
+    const double t47 = cos_theta * t46;
+    const double t48 = inverse_aspect_ratio_epsilon * t9;
+    const double t49 = -t15 * t47 + t17 * t35 * t48 + t45;
+    const double t50 = cos_theta * t23;
+    const double t51 = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t52 = t1 * t51;
+    const double t53 = t14 * t17 * t52;
+    const double t54 = -2.0 * cos_theta * t30 * t31 * t52 + t19 * t43 + t47 * t53;
+    const double t55 = cos_theta - t17 * t23 * t45 + t54;
+    const double t56 = -256.0 * t6;
+    const double t57 = t0 * t56;
+    const double t58 = t57 / t27;
+    const double t59 = t0 * (t14 * (t21 * t21) * t33 + t44);
+    const double t60 = 2.0 * t1 * t14 * t29 * t31 * t51 - 3.0 * t20 - t46 * t53 - 1.0;
+    const double t61 = t15 * t29;
+    const double t62 = 66.0 * t37 * t38;
+    const double t63 = sin_theta * t62;
+    const double t64 = 1.0 / (t10 * t10);
+    const double t65 = t43 * t64;
+    const double t66 = -t35 + t36 * t55;
+    const double t67 = t25 * t33 * t55 + t30;
+    const double t68 = sin_theta * t4;
+    return 0.0016 * (s * s * s * s) * (t0 * t0 * t0 * t0) * (-256.0 * t1 * t3 * t4 / t6 + t10 * t13 * (sin_theta * t58 *
+           (6.0 * sin_theta * t28 * t3 * t37 - t39 * t59) * (cos_theta * t21 + cos_theta * t60 + t22 * t61 + t24 + t26 *
+           t61 + t54) + 1288.424312814553 * t41 * t42 / (t5 * t5 + 1.0) + t41 * t58 * (cos_theta * t55 - t15 * t22 *
+           t35 - t15 * t25 * t44 + t17 * t49 * t50 + t22) - t56 * (12.0 * t0 * t28 * t3 * (-t50 * t64 + t67) + 6.0 *
+           t3 * t34 * (12.0 * s * t0 + 5.0 * t1 + 5.0 * t4) - t39 * t68 * (-t48 * t65 - t66 - t15 * t26 * t32 * t49 /
+           (t12 * t12 * t12)) - t42 * t63 - t62 * t68) - t57 * (6.0 * t28 * t3 * (2.0 * cos_theta *
+           inverse_aspect_ratio_epsilon * s * t14 * t64 - t22 * t33 * t60 + t29 * t43 - t67) - t28 * t63 - 121.0 * t3 *
+           t59 - 22.0 * t38 * t40 * (t15 * t65 + t66))) / ((t27 * t27) * t7 * t8));
+}
@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/polarR6_SonnendruckerGyro_ShafranovGeometry.h"
 
 PolarR6_SonnendruckerGyro_ShafranovGeometry::PolarR6_SonnendruckerGyro_ShafranovGeometry(const double& Rmax,
@@ -12,308 +13,44 @@ PolarR6_SonnendruckerGyro_ShafranovGeometry::PolarR6_SonnendruckerGyro_Shafranov
 double PolarR6_SonnendruckerGyro_ShafranovGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                           const double& cos_theta) const
 {
-    return 0.4096 * pow((r / Rmax), 6.0) * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta) /
-               (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) -
-           pow((r / Rmax), 4.0) *
-               ((-9.0112) * shift_delta * (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (elongation_kappa - 1.0) * pow(((r / Rmax) - 1.0), 6.0) * sin_theta * sin(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                4.5056 * (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                         ((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                         sin_theta +
-                     2.0 * shift_delta *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0)) *
-                    sin(11.0 * theta) /
-                    pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)),
-                        (3.0 / 2.0)) +
-                27.0336 * (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 5.0) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    sin(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (12.288 * (r / Rmax) * pow(((r / Rmax) - 1.0), 4.0) * cos(11.0 * theta) +
-                     17.2032 * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta)) *
-                    (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                     2.0 * elongation_kappa + 1.0) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                (r / Rmax) *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                         ((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                         sin_theta +
-                     2.0 * shift_delta *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0)) *
-                    (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                     2.0 * elongation_kappa + 1.0) /
-                    pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)),
-                        (3.0 / 2.0)) -
-                22.6762679055362 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    sin(11.0 * theta) /
-                    (sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                           pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                              (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                               2.0 * elongation_kappa + 1.0) -
-                          pow(((elongation_kappa - 1.0) *
-                                   ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                   sin_theta +
-                               1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                              2.0)) *
-                     (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0)) -
-                5.03290747193186 * (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                     2.0 * elongation_kappa + 1.0) /
-                    (sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                           pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                              (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                               2.0 * elongation_kappa + 1.0) -
-                          pow(((elongation_kappa - 1.0) *
-                                   ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                   sin_theta +
-                               1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                              2.0)) *
-                     (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0)) -
-                49.5616 *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                     pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                    cos(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) -
-                4.5056 *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                     pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                    (4.0 * elongation_kappa *
-                         (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         sin_theta * cos_theta -
-                     1.0 / 2.0 *
-                         (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                          (2.0 * elongation_kappa - 2.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) +
-                     1.0 / 2.0 *
-                         ((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                         (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          2.0 * (elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              cos_theta +
-                          2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) *
-                    sin(11.0 * theta) /
-                    pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)),
-                        (3.0 / 2.0)) -
-                4.5056 *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                     (2.0 * elongation_kappa - 2.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                    sin(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                27.0336 *
-                    (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    pow(((r / Rmax) - 1.0), 6.0) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    sin(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) -
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    ((-27.0336) * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * sin(11.0 * theta) -
-                     27.0336 * pow(((r / Rmax) - 1.0), 6.0) * sin(11.0 * theta)) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) -
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                     (elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                     pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta)) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                6.0 * (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                     2.0 * elongation_kappa + 1.0) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) -
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    (4.0 * elongation_kappa *
-                         (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         sin_theta * cos_theta -
-                     1.0 / 2.0 *
-                         (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                          (2.0 * elongation_kappa - 2.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) +
-                     1.0 / 2.0 *
-                         ((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                         (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          2.0 * (elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              cos_theta +
-                          2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) /
-                    pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)),
-                        (3.0 / 2.0))) /
-               sqrt(
-                   (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                    pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0) -
-                   pow(((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                       2.0));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s - 1.0;
+    const double t1  = s * s;
+    const double t2  = 11.0 * theta;
+    const double t3  = cos(t2);
+    const double t4  = t0 * t0;
+    const double t5  = 14.4444444444444 * s - 11.1111111111111;
+    const double t6  = 0.348432055749129 * atan(t5) - 0.452961672473868;
+    const double p0  = elongation_kappa + 1.0;
+    const double t7  = p0 * p0;
+    const double t8  = sin_theta * sin_theta;
+    const double t9  = elongation_kappa - 1.0;
+    const double t10 = 2.0 * s;
+    const double t11 = shift_delta * t10;
+    const double t12 = -t9;
+    const double t13 = cos_theta * t12 - t11;
+    const double t14 = cos_theta * t13 + t12 * t8;
+    const double t15 = 1.0 / t14;
+    const double t16 = t10 - 1.0;
+    const double t17 = (cos_theta * cos_theta) * t7 + (t12 * t12) * t8;
+    const double t18 = cos_theta * t7 - t12 * t13;
+    const double t19 = -t18;
+    const double t20 = sin(t2);
+    const double t21 = 11.0 * t20;
+    const double t22 = sin_theta * t0;
+    const double t23 = 6.0 * t16 * t17 * t3 - t19 * t21 * t22;
+    const double t24 = s * t0;
+    const double t25 = -t6;
+    const double t26 = t0 * (t13 * t13 + t7 * t8);
+    const double t27 = 256.0 * t25;
+    const double t28 = t0 * t27;
+    const double t29 = 66.0 * t19 * t20;
+    const double t30 = sin_theta * t29;
+    const double t31 = sin_theta * t4;
+    return 0.0016 * (s * s * s * s) * (t0 * t0 * t0 * t0) * (-256.0 * t1 * t3 * t4 / t6 + t15 * (-512.0 * s *
+           shift_delta * t15 * t22 * t25 * (6.0 * sin_theta * t16 * t19 * t3 - t21 * t26) + t15 * t23 * t28 * (2.0 *
+           cos_theta * s * shift_delta - t14) - 1288.424312814553 * t23 * t24 / (t5 * t5 + 1.0) + t27 * (12.0 * t0 *
+           t16 * t17 * t3 + 6.0 * t17 * t3 * (12.0 * s * t0 + 5.0 * t1 + 5.0 * t4) - t21 * t31 * (-t11 * t12 - t18) -
+           t24 * t30 - t29 * t31) + t28 * (6.0 * t16 * t3 * (cos_theta * t12 * t13 - t17 + t7 * t8) - t16 * t30 - 22.0 *
+           t18 * t20 * t22 - 121.0 * t26 * t3)) / (t7 * (cos_theta * (cos_theta * t9 + t11) + t8 * t9)));
+}
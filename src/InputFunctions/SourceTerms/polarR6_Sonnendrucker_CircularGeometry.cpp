@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/polarR6_Sonnendrucker_CircularGeometry.h"
 
 PolarR6_Sonnendrucker_CircularGeometry::PolarR6_Sonnendrucker_CircularGeometry(const double& Rmax)
@@ -8,18 +9,15 @@ PolarR6_Sonnendrucker_CircularGeometry::PolarR6_Sonnendrucker_CircularGeometry(c
 double PolarR6_Sonnendrucker_CircularGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                      const double& cos_theta) const
 {
-    return (-pow((r / Rmax), 4.0)) *
-           ((r / Rmax) *
-                (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (12.288 * (r / Rmax) * pow(((r / Rmax) - 1.0), 4.0) * cos(11.0 * theta) +
-                 17.2032 * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta)) -
-            5.03290747193186 * (r / Rmax) *
-                (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) /
-                (208.641975308642 * pow(((r / Rmax) - 0.769230769230769), 2.0) + 1.0) -
-            49.5616 * (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta) +
-            6.0 * (0.452961672473868 - 0.348432055749129 * atan(14.4444444444444 * (r / Rmax) - 11.1111111111111)) *
-                (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)));
-}
\ No newline at end of file
+    const double s  = r / Rmax;
+    const double t0 = s - 1.0;
+    const double t1 = t0 * t0;
+    const double t2 = 14.4444444444444 * s - 11.1111111111111;
+    const double t3 = 0.348432055749129 * atan(t2) - 0.452961672473868;
+    const double t4 = 2.0 * s - 1.0;
+    const double t5 = 1536.0 * t3;
+    const double t6 = s * t0;
+    return -0.0016 * (s * s * s * s) * (t0 * t0 * t0 * t0) * (-t0 * t4 * t5 + 30976.0 * t1 * t3 - 7730.545876887318 *
+           t4 * t6 / (t2 * t2 + 1.0) - t5 * (5.0 * (s * s) + 5.0 * t1 + 12.0 * t6)) * cos(11.0 * theta) / (cos_theta *
+           cos_theta + sin_theta * sin_theta);
+}
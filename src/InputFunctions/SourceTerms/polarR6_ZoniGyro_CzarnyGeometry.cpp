@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/polarR6_ZoniGyro_CzarnyGeometry.h"
 
 void PolarR6_ZoniGyro_CzarnyGeometry::initializeGeometry()
@@ -18,824 +19,89 @@ PolarR6_ZoniGyro_CzarnyGeometry::PolarR6_ZoniGyro_CzarnyGeometry(const double& R
 double PolarR6_ZoniGyro_CzarnyGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                               const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return 0.4096 * pow((r / Rmax), 6.0) * pow(((r / Rmax) - 1.0), 6.0) * exp(tanh(10.0 * (r / Rmax) - 5.0)) *
-               cos(11.0 * theta) -
-           pow((r / Rmax), 4.0) *
-               (4.5056 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) * exp(-tanh(10.0 * (r / Rmax) - 5.0)) *
-                    sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                4.5056 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp)) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) +
-                4.5056 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                    (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                     ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                              (temp1 * temp)) +
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                              sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                          ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                          ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                27.0336 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (12.288 * (r / Rmax) * pow(((r / Rmax) - 1.0), 4.0) * cos(11.0 * theta) +
-                     17.2032 * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                     ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                              (temp1 * temp))) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                    (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) * exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp)) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) +
-                27.0336 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                49.5616 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     cos_theta_pow2 / (temp * temp)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * cos(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                4.5056 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                         pow((temp * temp), 2.0) +
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                         (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp2 * (temp * temp)) -
-                          4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                     2.0 * sin_theta * cos_theta / (temp * temp)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                4.5056 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     cos_theta_pow2 / (temp * temp)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                              pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                              pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                          2.0 * sin_theta * cos_theta / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                              pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta * cos_theta / (temp * temp))) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) -
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                    ((-27.0336) * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * sin(11.0 * theta) -
-                     27.0336 * pow(((r / Rmax) - 1.0), 6.0) * sin(11.0 * theta)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                              pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                              pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                          2.0 * sin_theta * cos_theta / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                              pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta * cos_theta / (temp * temp))) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) +
-                6.0 *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                         pow((temp * temp), 2.0) +
-                     ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp2 * (temp * temp)) -
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                         ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                          3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) -
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                     sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp)))) /
-               sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                (temp1 * temp) +
-                            ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                               (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                           sin_theta * cos_theta / (temp * temp)),
-                          2.0)) +
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                        (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                  factor_xi / (temp1 * temp) +
-                              ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                             2.0) +
-                         cos_theta_pow2 / (temp * temp)));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s - 1.0;
+    const double t1  = s * s;
+    const double t2  = 11.0 * theta;
+    const double t3  = cos(t2);
+    const double t4  = t0 * t0;
+    const double t5  = 2.0 * s;
+    const double t6  = t5 - 1.0;
+    const double t7  = tanh(5.0 * t6);
+    const double t8  = ellipticity_e * ellipticity_e;
+    const double t9  = factor_xi * factor_xi;
+    const double t10 = inverse_aspect_ratio_epsilon * (cos_theta * t5 + inverse_aspect_ratio_epsilon) + 1.0;
+    const double t11 = sqrt(t10);
+    const double t12 = 1.0 / t11;
+    const double t13 = inverse_aspect_ratio_epsilon * s;
+    const double t14 = t12 * t13;
+    const double t15 = sin_theta * sin_theta;
+    const double t16 = t11 - 2.0;
+    const double t17 = 1.0 / t16;
+    const double t18 = t15 * t17;
+    const double t19 = cos_theta + t14 * t18;
+    const double t20 = cos_theta * t19;
+    const double t21 = cos_theta * t17;
+    const double t22 = t14 * t21 - 1.0;
+    const double t23 = 1.0 / t10;
+    const double t24 = t15 * t23;
+    const double t25 = -t16;
+    const double t26 = 1.0 / t25;
+    const double t27 = t15 * t26;
+    const double t28 = cos_theta - t14 * t27;
+    const double t29 = 1.0 / (t25 * t25);
+    const double t30 = t8 * t9;
+    const double t31 = t29 * t30;
+    const double t32 = t24 + (t28 * t28) * t31;
+    const double t33 = 12.0 * t0;
+    const double t34 = 6.0 * t3;
+    const double t35 = sin(t2);
+    const double t36 = sin_theta * t35;
+    const double t37 = t0 * t36;
+    const double t38 = cos_theta * t23;
+    const double t39 = cos_theta * t26;
+    const double t40 = t14 * t39;
+    const double t41 = t40 + 1.0;
+    const double t42 = -t28 * t31 * t41 + t38;
+    const double t43 = 66.0 * t42;
+    const double t44 = t36 * t43;
+    const double t45 = t34 * t6;
+    const double t46 = 11.0 * sin_theta * t35;
+    const double t47 = t0 * (t0 * t42 * t46 - t32 * t45);
+    const double t48 = cos_theta * t13;
+    const double t49 = 1.0 / (t10 * t10);
+    const double t50 = cos_theta * cos_theta;
+    const double t51 = t13 * t50;
+    const double t52 = t12 * t51;
+    const double t53 = inverse_aspect_ratio_epsilon * t5;
+    const double t54 = t12 * t53;
+    const double t55 = 1.0 / (t10 * sqrt(t10));
+    const double t56 = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t57 = t1 * t56;
+    const double t58 = t55 * t57;
+    const double t59 = t15 * t58;
+    const double t60 = 2.0 * t24 * t57;
+    const double t61 = t31 * (-cos_theta * t29 * t60 + cos_theta + t26 * t52 - t27 * t54 + t39 * t59);
+    const double t62 = t24 + t28 * t61;
+    const double t63 = t48 * t55;
+    const double t64 = t38 * t53;
+    const double t65 = cos_theta * t28;
+    const double t66 = -t38 + t41 * t61;
+    const double t67 = t15 * t22;
+    const double t68 = t23 * t50;
+    const double t69 = t13 * t67;
+    const double t70 = -cos_theta + cos_theta * t60 / (t16 * t16) + t17 * t52 - t18 * t54 + t21 * t59;
+    const double t71 = t15 * t41;
+    const double t72 = t25 / (t65 + t71);
+    const double t73 = t15 * t31 * (t41 * t41) + t68;
+    const double t74 = t17 * t23;
+    const double t75 = -2.0 * t1 * t15 * t23 * t29 * t56 + t27 * t58 + 3.0 * t40 + 1.0;
+    return 0.4096 * (s * s * s * s) * (t0 * t0 * t0 * t0) * (t1 * t3 * t4 * exp(t7) + t10 * t16 * t72 * (s * t37 * t43 +
+           10.0 * s * t47 * (t7 * t7 - 1.0) - sin_theta * t0 * t72 * (-sin_theta * t42 * t45 + 11.0 * t0 * t35 * t73) *
+           (-t13 * t20 * t74 + t17 * t19 + t17 * t70 + t21 * t22 - t39 * t75 + t69 * t74) + t0 * (121.0 * t0 * t3 *
+           t73 + 22.0 * t37 * (t49 * t51 + t66) + t44 * t6 - t45 * (2.0 * cos_theta * inverse_aspect_ratio_epsilon * s *
+           t15 * t49 + t23 * t50 + t31 * t71 * t75 - t62)) - t17 * t47 * t72 * (cos_theta * t70 + t13 * t15 * t21 *
+           (2.0 * t12 - t17 * t64 - t63) + t13 * t19 * t68 - t38 * t69 + t67) - t3 * t33 * t6 * (-t15 * t48 * t49 +
+           t62) - t32 * t34 * (s * t33 + 5.0 * t1 + 5.0 * t4) + t4 * t44 + t4 * t46 * (-t13 * t30 * t65 * (2.0 * t12 +
+           t26 * t64 - t63) / (t25 * t25 * t25) - t49 * t50 * t53 - t66)) * exp(-t7) / (t8 * t9 * (t15 * t22 - t20)));
+}
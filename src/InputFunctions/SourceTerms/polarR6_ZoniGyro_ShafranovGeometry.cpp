@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/polarR6_ZoniGyro_ShafranovGeometry.h"
 
 PolarR6_ZoniGyro_ShafranovGeometry::PolarR6_ZoniGyro_ShafranovGeometry(const double& Rmax,
@@ -12,297 +13,41 @@ PolarR6_ZoniGyro_ShafranovGeometry::PolarR6_ZoniGyro_ShafranovGeometry(const dou
 double PolarR6_ZoniGyro_ShafranovGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                  const double& cos_theta) const
 {
-    return 0.4096 * pow((r / Rmax), 6.0) * pow(((r / Rmax) - 1.0), 6.0) * exp(tanh(10.0 * (r / Rmax) - 5.0)) *
-               cos(11.0 * theta) -
-           pow((r / Rmax), 4.0) *
-               ((-9.0112) * shift_delta * (r / Rmax) * (elongation_kappa - 1.0) * pow(((r / Rmax) - 1.0), 6.0) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin_theta * sin(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                4.5056 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) * exp(-tanh(10.0 * (r / Rmax) - 5.0)) *
-                    sin(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                4.5056 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                         ((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                         sin_theta +
-                     2.0 * shift_delta *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)),
-                        (3.0 / 2.0)) +
-                27.0336 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                (r / Rmax) *
-                    (12.288 * (r / Rmax) * pow(((r / Rmax) - 1.0), 4.0) * cos(11.0 * theta) +
-                     17.2032 * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta)) *
-                    (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                     2.0 * elongation_kappa + 1.0) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (10.0 * pow(tanh(10.0 * (r / Rmax) - 5.0), 2.0) - 10.0) *
-                    (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                     2.0 * elongation_kappa + 1.0) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    ((-2.0) * shift_delta * (elongation_kappa - 1.0) *
-                         ((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                         sin_theta +
-                     2.0 * shift_delta *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0)) *
-                    (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                     2.0 * elongation_kappa + 1.0) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)),
-                        (3.0 / 2.0)) -
-                49.5616 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                     pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * cos(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) -
-                4.5056 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                     pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                    (4.0 * elongation_kappa *
-                         (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         sin_theta * cos_theta -
-                     1.0 / 2.0 *
-                         (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                          (2.0 * elongation_kappa - 2.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) +
-                     1.0 / 2.0 *
-                         ((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                         (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          2.0 * (elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              cos_theta +
-                          2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)),
-                        (3.0 / 2.0)) -
-                4.5056 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                     (2.0 * elongation_kappa - 2.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                27.0336 * pow(((r / Rmax) - 1.0), 6.0) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) * sin(11.0 * theta) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) -
-                ((-27.0336) * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * sin(11.0 * theta) -
-                 27.0336 * pow(((r / Rmax) - 1.0), 6.0) * sin(11.0 * theta)) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) -
-                (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                     (elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * cos_theta +
-                     pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta)) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) +
-                6.0 *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                     2.0 * elongation_kappa + 1.0) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    sqrt((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)) -
-                (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    ((elongation_kappa - 1.0) *
-                         ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                     1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                    (4.0 * elongation_kappa *
-                         (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                         sin_theta * cos_theta -
-                     1.0 / 2.0 *
-                         (pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta) +
-                          (2.0 * elongation_kappa - 2.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta) *
-                         (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                          2.0 * elongation_kappa + 1.0) +
-                     1.0 / 2.0 *
-                         ((elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              sin_theta +
-                          1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)) *
-                         (2.0 * pow((elongation_kappa - 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          2.0 * (elongation_kappa - 1.0) *
-                              ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                              cos_theta +
-                          2.0 * pow((elongation_kappa + 1.0), 2.0) * cos(2.0 * theta))) *
-                    exp(-tanh(10.0 * (r / Rmax) - 5.0)) /
-                    pow(((pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                          pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                             (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                              2.0 * elongation_kappa + 1.0) -
-                         pow(((elongation_kappa - 1.0) *
-                                  ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) *
-                                  sin_theta +
-                              1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                             2.0)),
-                        (3.0 / 2.0))) /
-               sqrt(
-                   (pow((elongation_kappa + 1.0), 2.0) * pow(sin_theta, 2.0) +
-                    pow(((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta), 2.0)) *
-                       (elongation_kappa * elongation_kappa - 4.0 * elongation_kappa * pow(sin_theta, 2.0) +
-                        2.0 * elongation_kappa + 1.0) -
-                   pow(((elongation_kappa - 1.0) *
-                            ((-2.0) * shift_delta * (r / Rmax) - elongation_kappa * cos_theta + cos_theta) * sin_theta +
-                        1.0 / 2.0 * pow((elongation_kappa + 1.0), 2.0) * sin(2.0 * theta)),
-                       2.0));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s - 1.0;
+    const double t1  = s * s;
+    const double t2  = 11.0 * theta;
+    const double t3  = cos(t2);
+    const double t4  = t0 * t0;
+    const double t5  = 2.0 * s;
+    const double t6  = t5 - 1.0;
+    const double t7  = tanh(5.0 * t6);
+    const double p0  = elongation_kappa + 1.0;
+    const double t8  = p0 * p0;
+    const double t9  = sin_theta * sin_theta;
+    const double t10 = elongation_kappa - 1.0;
+    const double t11 = shift_delta * t5;
+    const double t12 = cos_theta * (cos_theta * t10 + t11) + t10 * t9;
+    const double t13 = -t10;
+    const double t14 = (cos_theta * cos_theta) * t8 + (t13 * t13) * t9;
+    const double t15 = 12.0 * t0;
+    const double t16 = sin(t2);
+    const double t17 = sin_theta * t16;
+    const double t18 = t0 * t17;
+    const double t19 = cos_theta * t13 - t11;
+    const double t20 = cos_theta * t8 - t13 * t19;
+    const double t21 = -t20;
+    const double t22 = 66.0 * t21;
+    const double t23 = t17 * t22;
+    const double t24 = 6.0 * t3;
+    const double t25 = 11.0 * sin_theta * t16;
+    const double t26 = t24 * t6;
+    const double t27 = t0 * (t0 * t21 * t25 - t14 * t26);
+    const double t28 = 1.0 / t12;
+    const double t29 = t19 * t19 + t8 * t9;
+    return 0.4096 * (s * s * s * s) * (t0 * t0 * t0 * t0) * (t1 * t3 * t4 * exp(t7) + (s * t18 * t22 + 10.0 * s * t27 *
+           (t7 * t7 - 1.0) + sin_theta * t0 * t11 * t28 * (-sin_theta * t21 * t26 + 11.0 * t0 * t16 * t29) + t0 *
+           (121.0 * t0 * t29 * t3 + 22.0 * t18 * t20 + t23 * t6 - t26 * (cos_theta * t13 * t19 - t14 + t8 * t9)) - t14 *
+           t15 * t3 * t6 - t14 * t24 * (s * t15 + 5.0 * t1 + 5.0 * t4) + t23 * t4 + t25 * t4 * (-t11 * t13 - t20) +
+           t27 * t28 * (-cos_theta * t11 + cos_theta * t19 + t13 * t9)) * exp(-t7) / ((t12 * t12) * t8));
+}
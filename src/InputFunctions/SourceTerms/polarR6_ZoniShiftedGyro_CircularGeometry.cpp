@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/polarR6_ZoniShiftedGyro_CircularGeometry.h"
 
 PolarR6_ZoniShiftedGyro_CircularGeometry::PolarR6_ZoniShiftedGyro_CircularGeometry(const double& Rmax)
@@ -8,20 +9,13 @@ PolarR6_ZoniShiftedGyro_CircularGeometry::PolarR6_ZoniShiftedGyro_CircularGeomet
 double PolarR6_ZoniShiftedGyro_CircularGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                        const double& cos_theta) const
 {
-    return 0.4096 * pow((r / Rmax), 6.0) * pow(((r / Rmax) - 1.0), 6.0) * exp(tanh(20.0 * (r / Rmax) - 14.0)) *
-               cos(11.0 * theta) -
-           pow((r / Rmax), 4.0) *
-               ((r / Rmax) *
-                    (12.288 * (r / Rmax) * pow(((r / Rmax) - 1.0), 4.0) * cos(11.0 * theta) +
-                     17.2032 * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta)) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) +
-                (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) * exp(-tanh(20.0 * (r / Rmax) - 14.0)) -
-                49.5616 * pow(((r / Rmax) - 1.0), 6.0) * exp(-tanh(20.0 * (r / Rmax) - 14.0)) * cos(11.0 * theta) +
-                6.0 *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)));
-}
\ No newline at end of file
+    const double s  = r / Rmax;
+    const double t0 = s - 1.0;
+    const double t1 = s * s;
+    const double t2 = t0 * t0;
+    const double t3 = tanh(2.0 * (10.0 * s - 7.0));
+    const double t4 = t0 * (2.0 * s - 1.0);
+    return 0.4096 * (s * s * s * s) * (t0 * t0 * t0 * t0) * (t1 * t2 * exp(t3) - (72.0 * s * t0 + 120.0 * s * t4 * (t3 *
+           t3 - 1.0) + 30.0 * t1 - 91.0 * t2 + 6.0 * t4) * exp(-t3) / (cos_theta * cos_theta + sin_theta * sin_theta)) *
+           cos(11.0 * theta);
+}
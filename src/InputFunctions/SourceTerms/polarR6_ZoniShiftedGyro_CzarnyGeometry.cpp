@@ -1,3 +1,4 @@
+// Generated by scripts/input_functions/generate_input_functions.py, do not edit.
 #include "../include/InputFunctions/SourceTerms/polarR6_ZoniShiftedGyro_CzarnyGeometry.h"
 
 void PolarR6_ZoniShiftedGyro_CzarnyGeometry::initializeGeometry()
@@ -17,824 +18,89 @@ PolarR6_ZoniShiftedGyro_CzarnyGeometry::PolarR6_ZoniShiftedGyro_CzarnyGeometry(
 double PolarR6_ZoniShiftedGyro_CzarnyGeometry::rhs_f(const double& r, const double& theta, const double& sin_theta,
                                                      const double& cos_theta) const
 {
-    double temp =
-        sqrt(inverse_aspect_ratio_epsilon * (inverse_aspect_ratio_epsilon + 2.0 * (r / Rmax) * cos_theta) + 1.0);
-    double sin_theta_pow2 = pow(sin_theta, 2.0);
-    double cos_theta_pow2 = pow(cos_theta, 2.0);
-    double temp1          = pow((2.0 - temp), 2.0);
-    double temp2          = pow((2.0 - temp), 3.0);
-
-    return 0.4096 * pow((r / Rmax), 6.0) * pow(((r / Rmax) - 1.0), 6.0) * exp(tanh(20.0 * (r / Rmax) - 14.0)) *
-               cos(11.0 * theta) -
-           pow((r / Rmax), 4.0) *
-               (4.5056 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) * exp(-tanh(20.0 * (r / Rmax) - 14.0)) *
-                    sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                4.5056 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp)) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) * sin(11.0 * theta) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) +
-                4.5056 * (r / Rmax) * pow(((r / Rmax) - 1.0), 6.0) *
-                    (2.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                     ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                              (temp1 * temp)) +
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) * (r / Rmax) *
-                              sin_theta_pow2 * cos_theta * factor_xi / (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                          ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi / (temp1 * temp) +
-                          ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi / (temp1 * temp))) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) * sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                27.0336 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) * sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (12.288 * (r / Rmax) * pow(((r / Rmax) - 1.0), 4.0) * cos(11.0 * theta) +
-                     17.2032 * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                     ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                              (temp1 * temp))) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                    (20.0 * pow(tanh(20.0 * (r / Rmax) - 14.0), 2.0) - 20.0) * exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) +
-                (r / Rmax) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         (4.0 * inverse_aspect_ratio_epsilon * sin_theta * cos_theta_pow2 / pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp)) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * pow(cos_theta, 3.0) / pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta * cos_theta_pow2 * factor_xi / (temp2 * (temp * temp)) +
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta * cos_theta * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         ((-2.0) * inverse_aspect_ratio_epsilon * sin_theta_pow2 * cos_theta / pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   (r / Rmax) * sin_theta_pow2 * cos_theta * factor_xi / (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * sin_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp))) *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp))) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) +
-                27.0336 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                     sin_theta * cos_theta / (temp * temp)) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) * sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                49.5616 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     cos_theta_pow2 / (temp * temp)) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) * cos(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                4.5056 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                         pow((temp * temp), 2.0) +
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                         (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp2 * (temp * temp)) -
-                          4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                     2.0 * sin_theta * cos_theta / (temp * temp)) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) * sin(11.0 * theta) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                4.5056 * pow(((r / Rmax) - 1.0), 6.0) *
-                    (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) +
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     cos_theta_pow2 / (temp * temp)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                              pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                              pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                          2.0 * sin_theta * cos_theta / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                              pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta * cos_theta / (temp * temp))) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) * sin(11.0 * theta) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) -
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                    ((-27.0336) * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * sin(11.0 * theta) -
-                     27.0336 * pow(((r / Rmax) - 1.0), 6.0) * sin(11.0 * theta)) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                      (temp1 * temp) +
-                  ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                 sin_theta * cos_theta / (temp * temp)) *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (1.0 / 2.0 *
-                         (((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                          sin_theta * cos_theta / (temp * temp)) *
-                         ((-4.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                              pow((temp * temp), 2.0) +
-                          2.0 *
-                              ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                                   (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 *
-                              (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta_pow2 / (temp * temp) - 2.0 * cos_theta_pow2 / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta_pow2 /
-                              pow((temp * temp), 2.0) +
-                          (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                               factor_xi / (temp1 * temp) +
-                           ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                              (2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               4.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               2.0 * ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) -
-                          2.0 * sin_theta * cos_theta / (temp * temp)) -
-                     1.0 / 2.0 *
-                         (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          cos_theta_pow2 / (temp * temp)) *
-                         (2.0 * inverse_aspect_ratio_epsilon * (r / Rmax) * pow(sin_theta, 3.0) /
-                              pow((temp * temp), 2.0) +
-                          ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                               (temp1 * temp) +
-                           ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                              ((-2.0) * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                               4.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                                   ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                                   (temp2 * (temp * temp)) -
-                               6.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                   factor_xi / (temp1 * temp) -
-                               2.0 * ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                          2.0 * sin_theta * cos_theta / (temp * temp))) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                    pow(((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))),
-                        (3.0 / 2.0)) +
-                6.0 *
-                    (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                     2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp))) -
-                (2.4576 * (r / Rmax) * pow(((r / Rmax) - 1.0), 5.0) * cos(11.0 * theta) +
-                 2.4576 * pow(((r / Rmax) - 1.0), 6.0) * cos(11.0 * theta)) *
-                    ((-2.0) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * cos_theta /
-                         pow((temp * temp), 2.0) +
-                     ((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                         (ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) -
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * sin_theta_pow2 * cos_theta * factor_xi /
-                              (temp2 * (temp * temp)) -
-                          2.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * cos_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) +
-                     (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta * factor_xi /
-                          (temp1 * temp) +
-                      ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) *
-                         ((-ellipticity_e) * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi /
-                              (temp1 * pow((temp * temp), (3.0 / 2.0))) +
-                          2.0 * ellipticity_e * (inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon) *
-                              ((r / Rmax) * (r / Rmax)) * pow(sin_theta, 3.0) * factor_xi / (temp2 * (temp * temp)) -
-                          3.0 * ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                              factor_xi / (temp1 * temp) -
-                          ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) +
-                     sin_theta_pow2 / (temp * temp) - cos_theta_pow2 / (temp * temp)) *
-                    exp(-tanh(20.0 * (r / Rmax) - 14.0)) /
-                    sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                     factor_xi / (temp1 * temp) +
-                                 ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                                    (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                         factor_xi / (temp1 * temp) +
-                                     ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                                sin_theta * cos_theta / (temp * temp)),
-                               2.0)) +
-                         (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 *
-                                   factor_xi / (temp1 * temp) +
-                               ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                              2.0) +
-                          sin_theta_pow2 / (temp * temp)) *
-                             (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                       factor_xi / (temp1 * temp) +
-                                   ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                                  2.0) +
-                              cos_theta_pow2 / (temp * temp)))) /
-               sqrt((-pow((((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                                (temp1 * temp) +
-                            ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))) *
-                               (ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                    factor_xi / (temp1 * temp) +
-                                ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))) -
-                           sin_theta * cos_theta / (temp * temp)),
-                          2.0)) +
-                    (pow(((-ellipticity_e) * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta_pow2 * factor_xi /
-                              (temp1 * temp) +
-                          ellipticity_e * cos_theta * factor_xi / ((2.0 - temp))),
-                         2.0) +
-                     sin_theta_pow2 / (temp * temp)) *
-                        (pow((ellipticity_e * inverse_aspect_ratio_epsilon * (r / Rmax) * sin_theta * cos_theta *
-                                  factor_xi / (temp1 * temp) +
-                              ellipticity_e * sin_theta * factor_xi / ((2.0 - temp))),
-                             2.0) +
-                         cos_theta_pow2 / (temp * temp)));
-}
\ No newline at end of file
+    const double s   = r / Rmax;
+    const double t0  = s - 1.0;
+    const double t1  = s * s;
+    const double t2  = 11.0 * theta;
+    const double t3  = cos(t2);
+    const double t4  = t0 * t0;
+    const double t5  = tanh(2.0 * (10.0 * s - 7.0));
+    const double t6  = ellipticity_e * ellipticity_e;
+    const double t7  = factor_xi * factor_xi;
+    const double t8  = 2.0 * s;
+    const double t9  = inverse_aspect_ratio_epsilon * (cos_theta * t8 + inverse_aspect_ratio_epsilon) + 1.0;
+    const double t10 = sqrt(t9);
+    const double t11 = 1.0 / t10;
+    const double t12 = inverse_aspect_ratio_epsilon * s;
+    const double t13 = t11 * t12;
+    const double t14 = sin_theta * sin_theta;
+    const double t15 = t10 - 2.0;
+    const double t16 = 1.0 / t15;
+    const double t17 = t14 * t16;
+    const double t18 = cos_theta + t13 * t17;
+    const double t19 = cos_theta * t18;
+    const double t20 = cos_theta * t16;
+    const double t21 = t13 * t20 - 1.0;
+    const double t22 = 1.0 / t9;
+    const double t23 = t14 * t22;
+    const double t24 = -t15;
+    const double t25 = 1.0 / t24;
+    const double t26 = t14 * t25;
+    const double t27 = cos_theta - t13 * t26;
+    const double t28 = 1.0 / (t24 * t24);
+    const double t29 = t6 * t7;
+    const double t30 = t28 * t29;
+    const double t31 = t23 + (t27 * t27) * t30;
+    const double t32 = 12.0 * t0;
+    const double t33 = 6.0 * t3;
+    const double t34 = sin(t2);
+    const double t35 = sin_theta * t34;
+    const double t36 = t0 * t35;
+    const double t37 = cos_theta * t22;
+    const double t38 = cos_theta * t25;
+    const double t39 = t13 * t38;
+    const double t40 = t39 + 1.0;
+    const double t41 = -t27 * t30 * t40 + t37;
+    const double t42 = 66.0 * t41;
+    const double t43 = t35 * t42;
+    const double t44 = t8 - 1.0;
+    const double t45 = t33 * t44;
+    const double t46 = 11.0 * sin_theta * t34;
+    const double t47 = t0 * (t0 * t41 * t46 - t31 * t45);
+    const double t48 = cos_theta * t12;
+    const double t49 = 1.0 / (t9 * t9);
+    const double t50 = cos_theta * cos_theta;
+    const double t51 = t12 * t50;
+    const double t52 = t11 * t51;
+    const double t53 = inverse_aspect_ratio_epsilon * t8;
+    const double t54 = t11 * t53;
+    const double t55 = 1.0 / (t9 * sqrt(t9));
+    const double t56 = inverse_aspect_ratio_epsilon * inverse_aspect_ratio_epsilon;
+    const double t57 = t1 * t56;
+    const double t58 = t55 * t57;
+    const double t59 = t14 * t58;
+    const double t60 = 2.0 * t23 * t57;
+    const double t61 = t30 * (-cos_theta * t28 * t60 + cos_theta + t25 * t52 - t26 * t54 + t38 * t59);
+    const double t62 = t23 + t27 * t61;
+    const double t63 = t48 * t55;
+    const double t64 = t37 * t53;
+    const double t65 = cos_theta * t27;
+    const double t66 = -t37 + t40 * t61;
+    const double t67 = t14 * t21;
+    const double t68 = t22 * t50;
+    const double t69 = t12 * t67;
+    const double t70 = -cos_theta + cos_theta * t60 / (t15 * t15) + t16 * t52 - t17 * t54 + t20 * t59;
+    const double t71 = t14 * t40;
+    const double t72 = t24 / (t65 + t71);
+    const double t73 = t14 * t30 * (t40 * t40) + t68;
+    const double t74 = t16 * t22;
+    const double t75 = -2.0 * t1 * t14 * t22 * t28 * t56 + t26 * t58 + 3.0 * t39 + 1.0;
+    return 0.4096 * (s * s * s * s) * (t0 * t0 * t0 * t0) * (t1 * t3 * t4 * exp(t5) + t15 * t72 * t9 * (s * t36 * t42 +
+           20.0 * s * t47 * (t5 * t5 - 1.0) - sin_theta * t0 * t72 * (-sin_theta * t41 * t45 + 11.0 * t0 * t34 * t73) *
+           (-t12 * t19 * t74 + t16 * t18 + t16 * t70 + t20 * t21 - t38 * t75 + t69 * t74) + t0 * (121.0 * t0 * t3 *
+           t73 + 22.0 * t36 * (t49 * t51 + t66) + t43 * t44 - t45 * (2.0 * cos_theta * inverse_aspect_ratio_epsilon *
+           s * t14 * t49 + t22 * t50 + t30 * t71 * t75 - t62)) - t16 * t47 * t72 * (cos_theta * t70 + t12 * t14 * t20 *
+           (2.0 * t11 - t16 * t64 - t63) + t12 * t18 * t68 - t37 * t69 + t67) - t3 * t32 * t44 * (-t14 * t48 * t49 +
+           t62) - t31 * t33 * (s * t32 + 5.0 * t1 + 5.0 * t4) + t4 * t43 + t4 * t46 * (-t12 * t29 * t65 * (2.0 * t11 +
+           t25 * t64 - t63) / (t24 * t24 * t24) - t49 * t50 * t53 - t66)) * exp(-t5) / (t6 * t7 * (t14 * t21 - t19)));
+}
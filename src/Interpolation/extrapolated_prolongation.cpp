@@ -64,13 +64,13 @@ void Interpolation::applyExtrapolatedProlongation0(const Level& fromLevel, const
 // Optimized version of applyProlongation0 //
 // --------------------------------------- //
 
-#define FINE_NODE_EXTRAPOLATED_PROLONGATION()                                                                          \
+#define FINE_NODE_EXTRAPOLATED_PROLONGATION(ASSIGN)                                                                    \
     do {                                                                                                               \
         if (i_r & 1) {                                                                                                 \
             if (i_theta & 1) {                                                                                         \
                 /* i_r % 2 == 1, i_theta % 2 == 1 */                                                                   \
                 /* Fine node in the center of four coarse nodes */                                                     \
-                result[fineGrid.index(i_r, i_theta)] =                                                                 \
+                result[fineGrid.index(i_r, i_theta)] ASSIGN                                                            \
                     0.5 * (x[coarseGrid.index(i_r_coarse + 1, i_theta_coarse)] + /* Bottom right */                    \
                            x[coarseGrid.index(i_r_coarse, i_theta_coarse + 1)] /* Top left */                          \
                           );                                                                                           \
@@ -78,7 +78,7 @@ void Interpolation::applyExtrapolatedProlongation0(const Level& fromLevel, const
             else {                                                                                                     \
                 /* i_r % 2 == 1, i_theta % 2 == 0 */                                                                   \
                 /* Fine node between coarse nodes in radial direction */                                               \
-                result[fineGrid.index(i_r, i_theta)] =                                                                 \
+                result[fineGrid.index(i_r, i_theta)] ASSIGN                                                            \
                     0.5 * (x[coarseGrid.index(i_r_coarse, i_theta_coarse)] + /* left */                                \
                            x[coarseGrid.index(i_r_coarse + 1, i_theta_coarse)] /* right */                             \
                           );                                                                                           \
@@ -88,7 +88,7 @@ void Interpolation::applyExtrapolatedProlongation0(const Level& fromLevel, const
             if (i_theta & 1) {                                                                                         \
                 /* i_r % 2 == 0, i_theta % 2 == 1 */                                                                   \
                 /* Fine node between coarse nodes in theta direction */                                                \
-                result[fineGrid.index(i_r, i_theta)] =                                                                 \
+                result[fineGrid.index(i_r, i_theta)] ASSIGN                                                            \
                     0.5 * (x[coarseGrid.index(i_r_coarse, i_theta_coarse)] + /* bottom */                              \
                            x[coarseGrid.index(i_r_coarse, i_theta_coarse + 1)] /* top */                               \
                           );                                                                                           \
@@ -96,7 +96,8 @@ void Interpolation::applyExtrapolatedProlongation0(const Level& fromLevel, const
             else {                                                                                                     \
                 /* i_r % 2 == 0, i_theta % 2 == 0 */                                                                   \
                 /* Fine node appears in coarse grid */                                                                 \
-                result[fineGrid.index(i_r, i_theta)] = x[coarseGrid.index(i_r_coarse, i_theta_coarse)]; /* center */   \
+                result[fineGrid.index(i_r, i_theta)] ASSIGN                                                            \
+                    x[coarseGrid.index(i_r_coarse, i_theta_coarse)]; /* center */                                      \
             }                                                                                                          \
         }                                                                                                              \
     } while (0)
@@ -112,28 +113,59 @@ void Interpolation::applyExtrapolatedProlongation(const Level& fromLevel, const
     assert(x.size() == coarseGrid.numberOfNodes());
     assert(result.size() == fineGrid.numberOfNodes());
 
-#pragma omp parallel num_threads(threads_per_level_[toLevel.level_depth()]) if (fineGrid.numberOfNodes() > 10'000)
-    {
-/* Circluar Indexing Section */
-/* For loop matches circular access pattern */
-#pragma omp for nowait
-        for (int i_r = 0; i_r < fineGrid.numberSmootherCircles(); i_r++) {
+    const int num_threads = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
+
+    /* Circluar Indexing Section */
+    /* For loop matches circular access pattern */
+    parallelFor(0, fineGrid.numberSmootherCircles(), num_threads, [&](int i_r) {
+        int i_r_coarse = i_r / 2;
+        for (int i_theta = 0; i_theta < fineGrid.ntheta(); i_theta++) {
+            int i_theta_coarse = i_theta / 2;
+            FINE_NODE_EXTRAPOLATED_PROLONGATION(=);
+        }
+    });
+
+    /* Radial Indexing Section */
+    /* For loop matches radial access pattern */
+    parallelFor(0, fineGrid.ntheta(), num_threads, [&](int i_theta) {
+        int i_theta_coarse = i_theta / 2;
+        for (int i_r = fineGrid.numberSmootherCircles(); i_r < fineGrid.nr(); i_r++) {
             int i_r_coarse = i_r / 2;
-            for (int i_theta = 0; i_theta < fineGrid.ntheta(); i_theta++) {
-                int i_theta_coarse = i_theta / 2;
-                FINE_NODE_EXTRAPOLATED_PROLONGATION();
-            }
+            FINE_NODE_EXTRAPOLATED_PROLONGATION(=);
         }
+    });
+}
+
+void Interpolation::applyExtrapolatedProlongationAdd(const Level& fromLevel, const Level& toLevel,
+                                                     Vector<double> result, ConstVector<double> x) const
+{
+    assert(toLevel.level_depth() == fromLevel.level_depth() - 1);
+
+    const PolarGrid& coarseGrid = fromLevel.grid();
+    const PolarGrid& fineGrid   = toLevel.grid();
+
+    assert(x.size() == coarseGrid.numberOfNodes());
+    assert(result.size() == fineGrid.numberOfNodes());
 
-/* Radial Indexing Section */
-/* For loop matches radial access pattern */
-#pragma omp for nowait
+    const int num_threads = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
+
+    /* Circluar Indexing Section */
+    /* For loop matches circular access pattern */
+    parallelFor(0, fineGrid.numberSmootherCircles(), num_threads, [&](int i_r) {
+        int i_r_coarse = i_r / 2;
         for (int i_theta = 0; i_theta < fineGrid.ntheta(); i_theta++) {
             int i_theta_coarse = i_theta / 2;
-            for (int i_r = fineGrid.numberSmootherCircles(); i_r < fineGrid.nr(); i_r++) {
-                int i_r_coarse = i_r / 2;
-                FINE_NODE_EXTRAPOLATED_PROLONGATION();
-            }
+            FINE_NODE_EXTRAPOLATED_PROLONGATION(+=);
         }
-    }
+    });
+
+    /* Radial Indexing Section */
+    /* For loop matches radial access pattern */
+    parallelFor(0, fineGrid.ntheta(), num_threads, [&](int i_theta) {
+        int i_theta_coarse = i_theta / 2;
+        for (int i_r = fineGrid.numberSmootherCircles(); i_r < fineGrid.nr(); i_r++) {
+            int i_r_coarse = i_r / 2;
+            FINE_NODE_EXTRAPOLATED_PROLONGATION(+=);
+        }
+    });
 }
@@ -1,4 +1,5 @@
 #include "../../include/Interpolation/interpolation.h"
+#include "../../include/Interpolation/restriction_stencil.h"
 
 /* For the restriction we use R_ex = P_ex^T */
 
@@ -78,91 +79,23 @@ void Interpolation::applyExtrapolatedRestriction(const Level& fromLevel, const L
 
     const int coarseNumberSmootherCircles = coarseGrid.numberSmootherCircles();
 
-#pragma omp parallel num_threads(threads_per_level_[toLevel.level_depth()]) if (fineGrid.numberOfNodes() > 10'000)
-    {
-/* For loop matches circular access pattern */
-#pragma omp for nowait
-        for (int i_r_coarse = 0; i_r_coarse < coarseNumberSmootherCircles; i_r_coarse++) {
-            int i_r = i_r_coarse * 2;
-            for (int i_theta_coarse = 0; i_theta_coarse < coarseGrid.ntheta(); i_theta_coarse++) {
-                int i_theta = i_theta_coarse * 2;
-
-                if (0 < i_r_coarse && i_r_coarse < coarseNumberSmootherCircles - 1) {
-                    int i_theta_M1 = fineGrid.wrapThetaIndex(i_theta - 1);
-                    int i_theta_P1 = fineGrid.wrapThetaIndex(i_theta + 1);
-
-                    result[coarseGrid.index(i_r_coarse, i_theta_coarse)] =
-                        // Center
-                        x[fineGrid.index(i_r, i_theta)] +
-                        // Left, Right, Bottom, Top
-                        0.5 * x[fineGrid.index(i_r - 1, i_theta)] + 0.5 * x[fineGrid.index(i_r + 1, i_theta)] +
-                        0.5 * x[fineGrid.index(i_r, i_theta_M1)] + 0.5 * x[fineGrid.index(i_r, i_theta_P1)] +
-                        // Bottom Right, Top Left
-                        0.5 * x[fineGrid.index(i_r + 1, i_theta_M1)] + 0.5 * x[fineGrid.index(i_r - 1, i_theta_P1)];
-                }
-                else {
-                    /* First and Last Circle have to be checked for domain boundary */
-                    int i_theta_M1 = fineGrid.wrapThetaIndex(i_theta - 1);
-                    int i_theta_P1 = fineGrid.wrapThetaIndex(i_theta + 1);
-                    // Center, Bottom, Top
-                    double value = x[fineGrid.index(i_r, i_theta)] + 0.5 * x[fineGrid.index(i_r, i_theta_M1)] +
-                                   0.5 * x[fineGrid.index(i_r, i_theta_P1)];
-
-                    if (i_r_coarse > 0) {
-                        // Left, Top Left
-                        value +=
-                            0.5 * x[fineGrid.index(i_r - 1, i_theta)] + 0.5 * x[fineGrid.index(i_r - 1, i_theta_P1)];
-                    }
-                    if (i_r_coarse < coarseGrid.nr() - 1) {
-                        // Right, Bottom Right
-                        value +=
-                            0.5 * x[fineGrid.index(i_r + 1, i_theta)] + 0.5 * x[fineGrid.index(i_r + 1, i_theta_M1)];
-                    }
-                    result[coarseGrid.index(i_r_coarse, i_theta_coarse)] = value;
-                }
-            }
-        }
+    const auto fine_values = [&x, &fineGrid](int i_r, int i_theta) { return x[fineGrid.index(i_r, i_theta)]; };
+
+    const int num_threads = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
 
-/* For loop matches circular access pattern */
-#pragma omp for nowait
+    /* For loop matches circular access pattern */
+    parallelFor(0, coarseNumberSmootherCircles, num_threads, [&](int i_r_coarse) {
         for (int i_theta_coarse = 0; i_theta_coarse < coarseGrid.ntheta(); i_theta_coarse++) {
-            int i_theta = i_theta_coarse * 2;
-            for (int i_r_coarse = coarseNumberSmootherCircles; i_r_coarse < coarseGrid.nr(); i_r_coarse++) {
-                int i_r = i_r_coarse * 2;
-
-                if (coarseGrid.numberSmootherCircles() < i_r_coarse && i_r_coarse < coarseGrid.nr() - 1) {
-                    int i_theta_M1 = fineGrid.wrapThetaIndex(i_theta - 1);
-                    int i_theta_P1 = fineGrid.wrapThetaIndex(i_theta + 1);
-
-                    result[coarseGrid.index(i_r_coarse, i_theta_coarse)] =
-                        // Center
-                        x[fineGrid.index(i_r, i_theta)] +
-                        // Left, Right, Bottom, Top
-                        0.5 * x[fineGrid.index(i_r - 1, i_theta)] + 0.5 * x[fineGrid.index(i_r + 1, i_theta)] +
-                        0.5 * x[fineGrid.index(i_r, i_theta_M1)] + 0.5 * x[fineGrid.index(i_r, i_theta_P1)] +
-                        // Bottom Right, Top Left
-                        0.5 * x[fineGrid.index(i_r + 1, i_theta_M1)] + 0.5 * x[fineGrid.index(i_r - 1, i_theta_P1)];
-                }
-                else {
-                    /* First and Last radial nodes have to be checked for domain boundary */
-                    int i_theta_M1 = fineGrid.wrapThetaIndex(i_theta - 1);
-                    int i_theta_P1 = fineGrid.wrapThetaIndex(i_theta + 1);
-                    // Center, Bottom, Top
-                    double value = x[fineGrid.index(i_r, i_theta)] + 0.5 * x[fineGrid.index(i_r, i_theta_M1)] +
-                                   0.5 * x[fineGrid.index(i_r, i_theta_P1)];
-                    if (i_r_coarse > 0) {
-                        // Left, Top Left
-                        value +=
-                            0.5 * x[fineGrid.index(i_r - 1, i_theta)] + 0.5 * x[fineGrid.index(i_r - 1, i_theta_P1)];
-                    }
-                    if (i_r_coarse < coarseGrid.nr() - 1) {
-                        // Right, Bottom Right
-                        value +=
-                            0.5 * x[fineGrid.index(i_r + 1, i_theta)] + 0.5 * x[fineGrid.index(i_r + 1, i_theta_M1)];
-                    }
-                    result[coarseGrid.index(i_r_coarse, i_theta_coarse)] = value;
-                }
-            }
+            result[coarseGrid.index(i_r_coarse, i_theta_coarse)] =
+                extrapolatedRestrictNode(fineGrid, coarseGrid, i_r_coarse, i_theta_coarse, fine_values);
         }
-    }
+    });
+
+    /* For loop matches radial access pattern */
+    parallelFor(0, coarseGrid.ntheta(), num_threads, [&](int i_theta_coarse) {
+        for (int i_r_coarse = coarseNumberSmootherCircles; i_r_coarse < coarseGrid.nr(); i_r_coarse++) {
+            result[coarseGrid.index(i_r_coarse, i_theta_coarse)] =
+                extrapolatedRestrictNode(fineGrid, coarseGrid, i_r_coarse, i_theta_coarse, fine_values);
+        }
+    });
 }
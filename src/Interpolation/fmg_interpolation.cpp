@@ -227,28 +227,25 @@ void Interpolation::applyFMGInterpolation(const Level& fromLevel, const Level& t
     assert(x.size() == coarseGrid.numberOfNodes());
     assert(result.size() == fineGrid.numberOfNodes());
 
-#pragma omp parallel num_threads(threads_per_level_[toLevel.level_depth()]) if (fineGrid.numberOfNodes() > 10'000)
-    {
-/* Circluar Indexing Section */
-/* For loop matches circular access pattern */
-#pragma omp for nowait
-        for (int i_r = 0; i_r < fineGrid.numberSmootherCircles(); i_r++) {
-            int i_r_coarse = i_r / 2;
-            for (int i_theta = 0; i_theta < fineGrid.ntheta(); i_theta++) {
-                int i_theta_coarse = i_theta / 2;
-                FINE_NODE_FMG_INTERPOLATION();
-            }
-        }
+    const int num_threads = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
 
-/* Radial Indexing Section */
-/* For loop matches radial access pattern */
-#pragma omp for nowait
+    /* Circluar Indexing Section */
+    /* For loop matches circular access pattern */
+    parallelFor(0, fineGrid.numberSmootherCircles(), num_threads, [&](int i_r) {
+        int i_r_coarse = i_r / 2;
         for (int i_theta = 0; i_theta < fineGrid.ntheta(); i_theta++) {
             int i_theta_coarse = i_theta / 2;
-            for (int i_r = fineGrid.numberSmootherCircles(); i_r < fineGrid.nr(); i_r++) {
-                int i_r_coarse = i_r / 2;
-                FINE_NODE_FMG_INTERPOLATION();
-            }
+            FINE_NODE_FMG_INTERPOLATION();
+        }
+    });
+
+    /* Radial Indexing Section */
+    /* For loop matches radial access pattern */
+    parallelFor(0, fineGrid.ntheta(), num_threads, [&](int i_theta) {
+        int i_theta_coarse = i_theta / 2;
+        for (int i_r = fineGrid.numberSmootherCircles(); i_r < fineGrid.nr(); i_r++) {
+            int i_r_coarse = i_r / 2;
+            FINE_NODE_FMG_INTERPOLATION();
         }
-    }
+    });
 }
@@ -13,26 +13,23 @@ void Interpolation::applyInjection(const Level& fromLevel, const Level& toLevel,
     assert(x.size() == fineGrid.numberOfNodes());
     assert(result.size() == coarseGrid.numberOfNodes());
 
-#pragma omp parallel num_threads(threads_per_level_[toLevel.level_depth()]) if (fineGrid.numberOfNodes() > 10'000)
-    {
-/* For loop matches circular access pattern */
-#pragma omp for nowait
-        for (int i_r_coarse = 0; i_r_coarse < coarseGrid.numberSmootherCircles(); i_r_coarse++) {
-            int i_r = i_r_coarse * 2;
-            for (int i_theta_coarse = 0; i_theta_coarse < coarseGrid.ntheta(); i_theta_coarse++) {
-                int i_theta                                          = i_theta_coarse * 2;
-                result[coarseGrid.index(i_r_coarse, i_theta_coarse)] = x[fineGrid.index(i_r, i_theta)];
-            }
-        }
+    const int num_threads = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
 
-/* For loop matches circular access pattern */
-#pragma omp for nowait
+    /* For loop matches circular access pattern */
+    parallelFor(0, coarseGrid.numberSmootherCircles(), num_threads, [&](int i_r_coarse) {
+        int i_r = i_r_coarse * 2;
         for (int i_theta_coarse = 0; i_theta_coarse < coarseGrid.ntheta(); i_theta_coarse++) {
-            int i_theta = i_theta_coarse * 2;
-            for (int i_r_coarse = coarseGrid.numberSmootherCircles(); i_r_coarse < coarseGrid.nr(); i_r_coarse++) {
-                int i_r                                              = i_r_coarse * 2;
-                result[coarseGrid.index(i_r_coarse, i_theta_coarse)] = x[fineGrid.index(i_r, i_theta)];
-            }
+            int i_theta                                          = i_theta_coarse * 2;
+            result[coarseGrid.index(i_r_coarse, i_theta_coarse)] = x[fineGrid.index(i_r, i_theta)];
+        }
+    });
+
+    /* For loop matches circular access pattern */
+    parallelFor(0, coarseGrid.ntheta(), num_threads, [&](int i_theta_coarse) {
+        int i_theta = i_theta_coarse * 2;
+        for (int i_r_coarse = coarseGrid.numberSmootherCircles(); i_r_coarse < coarseGrid.nr(); i_r_coarse++) {
+            int i_r                                              = i_r_coarse * 2;
+            result[coarseGrid.index(i_r_coarse, i_theta_coarse)] = x[fineGrid.index(i_r, i_theta)];
         }
-    }
+    });
 }
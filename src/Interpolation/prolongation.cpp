@@ -98,7 +98,7 @@ void Interpolation::applyProlongation0(const Level& fromLevel, const Level& toLe
 // Optimized version of applyProlongation0 //
 // --------------------------------------- //
 
-#define FINE_NODE_PROLONGATION()                                                                                            \
+#define FINE_NODE_PROLONGATION(ASSIGN)                                                                                      \
     do {                                                                                                                    \
         if (i_r & 1) {                                                                                                      \
             if (i_theta & 1) {                                                                                              \
@@ -115,7 +115,7 @@ void Interpolation::applyProlongation0(const Level& fromLevel, const Level& toLe
                                 h1 * k2 * x[coarseGrid.index(i_r_coarse, i_theta_coarse_P1)] + /* Top left */      \
                                 h2 * k2 * x[coarseGrid.index(i_r_coarse + 1, i_theta_coarse_P1)] /* Top right */   \
                 );                                                                                                 \
-                result[fineGrid.index(i_r, i_theta)] = value / divisor;                                                     \
+                result[fineGrid.index(i_r, i_theta)] ASSIGN value / divisor;                                                \
             }                                                                                                               \
             else {                                                                                                          \
                 /* i_r % 2 == 1, i_theta % 2 == 0 */                                                                        \
@@ -126,7 +126,7 @@ void Interpolation::applyProlongation0(const Level& fromLevel, const Level& toLe
                 double value   = (h1 * x[coarseGrid.index(i_r_coarse, i_theta_coarse)] + /* left */                         \
                                 h2 * x[coarseGrid.index(i_r_coarse + 1, i_theta_coarse)] /* right */                      \
                 );                                                                                                        \
-                result[fineGrid.index(i_r, i_theta)] = value / divisor;                                                     \
+                result[fineGrid.index(i_r, i_theta)] ASSIGN value / divisor;                                                \
             }                                                                                                               \
         }                                                                                                                   \
         else {                                                                                                              \
@@ -140,12 +140,12 @@ void Interpolation::applyProlongation0(const Level& fromLevel, const Level& toLe
                 double value          = (k1 * x[coarseGrid.index(i_r_coarse, i_theta_coarse)] + /* bottom */                \
                                 k2 * x[coarseGrid.index(i_r_coarse, i_theta_coarse_P1)] /* top */                  \
                 );                                                                                                 \
-                result[fineGrid.index(i_r, i_theta)] = value / divisor;                                                     \
+                result[fineGrid.index(i_r, i_theta)] ASSIGN value / divisor;                                                \
             }                                                                                                               \
             else {                                                                                                          \
                 /* i_r % 2 == 0, i_theta % 2 == 0 */                                                                        \
                 /* Fine node appears in coarse grid */                                                                      \
-                result[fineGrid.index(i_r, i_theta)] = x[coarseGrid.index(i_r_coarse, i_theta_coarse)]; /* center */        \
+                result[fineGrid.index(i_r, i_theta)] ASSIGN x[coarseGrid.index(i_r_coarse, i_theta_coarse)]; /* center */   \
             }                                                                                                               \
         }                                                                                                                   \
     } while (0)
@@ -161,28 +161,134 @@ void Interpolation::applyProlongation(const Level& fromLevel, const Level& toLev
     assert(x.size() == coarseGrid.numberOfNodes());
     assert(result.size() == fineGrid.numberOfNodes());
 
-#pragma omp parallel num_threads(threads_per_level_[toLevel.level_depth()]) if (fineGrid.numberOfNodes() > 10'000)
-    {
-/* Circluar Indexing Section */
-/* For loop matches circular access pattern */
-#pragma omp for nowait
-        for (int i_r = 0; i_r < fineGrid.numberSmootherCircles(); i_r++) {
+    const int num_threads = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
+
+    /* Circluar Indexing Section */
+    /* For loop matches circular access pattern */
+    parallelFor(0, fineGrid.numberSmootherCircles(), num_threads, [&](int i_r) {
+        int i_r_coarse = i_r / 2;
+        for (int i_theta = 0; i_theta < fineGrid.ntheta(); i_theta++) {
+            int i_theta_coarse = i_theta / 2;
+            FINE_NODE_PROLONGATION(=);
+        }
+    });
+
+    /* Radial Indexing Section */
+    /* For loop matches radial access pattern */
+    parallelFor(0, fineGrid.ntheta(), num_threads, [&](int i_theta) {
+        int i_theta_coarse = i_theta / 2;
+        for (int i_r = fineGrid.numberSmootherCircles(); i_r < fineGrid.nr(); i_r++) {
             int i_r_coarse = i_r / 2;
+            FINE_NODE_PROLONGATION(=);
+        }
+    });
+}
+
+namespace
+{
+// The stencil is evaluated in double precision, the single precision cycle adds float corrections.
+template <typename R, typename X>
+void prolongateAddToFineGrid(const PolarGrid& coarseGrid, const PolarGrid& fineGrid, const int num_threads,
+                             Vector<R> result, ConstVector<X> x)
+{
+    assert(x.size() == coarseGrid.numberOfNodes());
+    assert(result.size() == fineGrid.numberOfNodes());
+
+    /* Circluar Indexing Section */
+    /* For loop matches circular access pattern */
+    parallelFor(0, fineGrid.numberSmootherCircles(), num_threads, [&](int i_r) {
+        int i_r_coarse = i_r / 2;
+        for (int i_theta = 0; i_theta < fineGrid.ntheta(); i_theta++) {
+            int i_theta_coarse = i_theta / 2;
+            FINE_NODE_PROLONGATION(+=);
+        }
+    });
+
+    /* Radial Indexing Section */
+    /* For loop matches radial access pattern */
+    parallelFor(0, fineGrid.ntheta(), num_threads, [&](int i_theta) {
+        int i_theta_coarse = i_theta / 2;
+        for (int i_r = fineGrid.numberSmootherCircles(); i_r < fineGrid.nr(); i_r++) {
+            int i_r_coarse = i_r / 2;
+            FINE_NODE_PROLONGATION(+=);
+        }
+    });
+}
+} // namespace
+
+void Interpolation::applyProlongationAdd(const Level& fromLevel, const Level& toLevel, Vector<double> result,
+                                         ConstVector<double> x) const
+{
+    assert(toLevel.level_depth() == fromLevel.level_depth() - 1);
+
+    const PolarGrid& fineGrid = toLevel.grid();
+    const int num_threads     = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
+
+    prolongateAddToFineGrid(fromLevel.grid(), fineGrid, num_threads, result, x);
+}
+
+void Interpolation::applyProlongationAdd(const Level& fromLevel, const Level& toLevel, Vector<double> result,
+                                         ConstVector<float> x) const
+{
+    assert(toLevel.level_depth() == fromLevel.level_depth() - 1);
+
+    const PolarGrid& fineGrid = toLevel.grid();
+    const int num_threads     = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
+
+    prolongateAddToFineGrid(fromLevel.grid(), fineGrid, num_threads, result, x);
+}
+
+void Interpolation::applyProlongationAdd(const Level& fromLevel, const Level& toLevel, Vector<float> result,
+                                         ConstVector<float> x) const
+{
+    assert(toLevel.level_depth() == fromLevel.level_depth() - 1);
+
+    const PolarGrid& fineGrid = toLevel.grid();
+    const int num_threads     = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
+
+    prolongateAddToFineGrid(fromLevel.grid(), fineGrid, num_threads, result, x);
+}
+
+void Interpolation::applyProlongationAddBatch(const Level& fromLevel, const Level& toLevel, Vector<double> result_batch,
+                                              ConstVector<double> x_batch, const int number_of_columns) const
+{
+    assert(toLevel.level_depth() == fromLevel.level_depth() - 1);
+
+    const PolarGrid& coarseGrid = fromLevel.grid();
+    const PolarGrid& fineGrid   = toLevel.grid();
+    const std::size_t coarse_n  = coarseGrid.numberOfNodes();
+    const std::size_t fine_n    = fineGrid.numberOfNodes();
+
+    assert(x_batch.size() >= number_of_columns * coarse_n);
+    assert(result_batch.size() >= number_of_columns * fine_n);
+
+    const int num_threads = number_of_columns * fine_n > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
+
+    /* Circluar Indexing Section */
+    /* For loop matches circular access pattern */
+    parallelFor(0, fineGrid.numberSmootherCircles(), num_threads, [&](int i_r) {
+        int i_r_coarse = i_r / 2;
+        for (int column = 0; column < number_of_columns; column++) {
+            const double* x = x_batch.data() + column * coarse_n;
+            double* result  = result_batch.data() + column * fine_n;
             for (int i_theta = 0; i_theta < fineGrid.ntheta(); i_theta++) {
                 int i_theta_coarse = i_theta / 2;
-                FINE_NODE_PROLONGATION();
+                FINE_NODE_PROLONGATION(+=);
             }
         }
+    });
 
-/* Radial Indexing Section */
-/* For loop matches radial access pattern */
-#pragma omp for nowait
-        for (int i_theta = 0; i_theta < fineGrid.ntheta(); i_theta++) {
-            int i_theta_coarse = i_theta / 2;
+    /* Radial Indexing Section */
+    /* For loop matches radial access pattern */
+    parallelFor(0, fineGrid.ntheta(), num_threads, [&](int i_theta) {
+        int i_theta_coarse = i_theta / 2;
+        for (int column = 0; column < number_of_columns; column++) {
+            const double* x = x_batch.data() + column * coarse_n;
+            double* result  = result_batch.data() + column * fine_n;
             for (int i_r = fineGrid.numberSmootherCircles(); i_r < fineGrid.nr(); i_r++) {
                 int i_r_coarse = i_r / 2;
-                FINE_NODE_PROLONGATION();
+                FINE_NODE_PROLONGATION(+=);
             }
         }
-    }
+    });
 }
@@ -1,4 +1,5 @@
 #include "../../include/Interpolation/interpolation.h"
+#include "../../include/Interpolation/restriction_stencil.h"
 
 // For the restriction we use R = P^T.
 // The restriction for an siotropic mesh reduces to
@@ -100,166 +101,102 @@ void Interpolation::applyRestriction0(const Level& fromLevel, const Level& toLev
 // Optimized version of applyRestriction0 //
 // -------------------------------------- //
 
+namespace
+{
+// The stencil is evaluated in double precision for both the double and the single precision result.
+template <typename R, typename X>
+void restrictToCoarseGrid(const PolarGrid& fineGrid, const PolarGrid& coarseGrid, const int num_threads,
+                          Vector<R> result, ConstVector<X> x)
+{
+    assert(x.size() == fineGrid.numberOfNodes());
+    assert(result.size() == coarseGrid.numberOfNodes());
+
+    const int coarseNumberSmootherCircles = coarseGrid.numberSmootherCircles();
+
+    const auto fine_values = [&x, &fineGrid](int i_r, int i_theta) { return x[fineGrid.index(i_r, i_theta)]; };
+
+    /* For loop matches circular access pattern */
+    parallelFor(0, coarseNumberSmootherCircles, num_threads, [&](int i_r_coarse) {
+        for (int i_theta_coarse = 0; i_theta_coarse < coarseGrid.ntheta(); i_theta_coarse++) {
+            result[coarseGrid.index(i_r_coarse, i_theta_coarse)] =
+                restrictNode(fineGrid, coarseGrid, i_r_coarse, i_theta_coarse, fine_values);
+        }
+    });
+
+    /* For loop matches radial access pattern */
+    parallelFor(0, coarseGrid.ntheta(), num_threads, [&](int i_theta_coarse) {
+        for (int i_r_coarse = coarseNumberSmootherCircles; i_r_coarse < coarseGrid.nr(); i_r_coarse++) {
+            result[coarseGrid.index(i_r_coarse, i_theta_coarse)] =
+                restrictNode(fineGrid, coarseGrid, i_r_coarse, i_theta_coarse, fine_values);
+        }
+    });
+}
+} // namespace
+
 void Interpolation::applyRestriction(const Level& fromLevel, const Level& toLevel, Vector<double> result,
                                      ConstVector<double> x) const
 {
     assert(toLevel.level_depth() == fromLevel.level_depth() + 1);
 
+    const PolarGrid& fineGrid = fromLevel.grid();
+    const int num_threads     = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
+
+    restrictToCoarseGrid(fineGrid, toLevel.grid(), num_threads, result, x);
+}
+
+void Interpolation::applyRestriction(const Level& fromLevel, const Level& toLevel, Vector<float> result,
+                                     ConstVector<double> x) const
+{
+    assert(toLevel.level_depth() == fromLevel.level_depth() + 1);
+
+    const PolarGrid& fineGrid = fromLevel.grid();
+    const int num_threads     = fineGrid.numberOfNodes() > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
+
+    restrictToCoarseGrid(fineGrid, toLevel.grid(), num_threads, result, x);
+}
+
+void Interpolation::applyRestrictionBatch(const Level& fromLevel, const Level& toLevel, Vector<double> result,
+                                          ConstVector<double> x, const int number_of_columns) const
+{
+    assert(toLevel.level_depth() == fromLevel.level_depth() + 1);
+
     const PolarGrid& fineGrid   = fromLevel.grid();
     const PolarGrid& coarseGrid = toLevel.grid();
+    const std::size_t fine_n    = fineGrid.numberOfNodes();
+    const std::size_t coarse_n  = coarseGrid.numberOfNodes();
 
-    assert(x.size() == fineGrid.numberOfNodes());
-    assert(result.size() == coarseGrid.numberOfNodes());
+    assert(x.size() >= number_of_columns * fine_n);
+    assert(result.size() >= number_of_columns * coarse_n);
 
+    const int num_threads = number_of_columns * fine_n > 10'000 ? threads_per_level_[toLevel.level_depth()] : 1;
     const int coarseNumberSmootherCircles = coarseGrid.numberSmootherCircles();
 
-#pragma omp parallel num_threads(threads_per_level_[toLevel.level_depth()]) if (fineGrid.numberOfNodes() > 10'000)
-    {
-/* For loop matches circular access pattern */
-#pragma omp for nowait
-        for (int i_r_coarse = 0; i_r_coarse < coarseNumberSmootherCircles; i_r_coarse++) {
-            int i_r = i_r_coarse * 2;
+    /* For loop matches circular access pattern */
+    parallelFor(0, coarseNumberSmootherCircles, num_threads, [&](int i_r_coarse) {
+        for (int column = 0; column < number_of_columns; column++) {
+            const double* x_column = x.data() + column * fine_n;
+            const auto fine_values = [x_column, &fineGrid](int i_r, int i_theta) {
+                return x_column[fineGrid.index(i_r, i_theta)];
+            };
             for (int i_theta_coarse = 0; i_theta_coarse < coarseGrid.ntheta(); i_theta_coarse++) {
-                int i_theta = i_theta_coarse * 2;
-
-                if (0 < i_r_coarse && i_r_coarse < coarseNumberSmootherCircles - 1) {
-                    double h1 = fineGrid.radialSpacing(i_r - 2);
-                    double h2 = fineGrid.radialSpacing(i_r - 1);
-                    double h3 = fineGrid.radialSpacing(i_r);
-                    double h4 = fineGrid.radialSpacing(i_r + 1);
-
-                    int i_theta_M2 = fineGrid.wrapThetaIndex(i_theta - 2);
-                    int i_theta_M1 = fineGrid.wrapThetaIndex(i_theta - 1);
-                    int i_theta_P1 = fineGrid.wrapThetaIndex(i_theta + 1);
-
-                    double k1 = fineGrid.angularSpacing(i_theta_M2);
-                    double k2 = fineGrid.angularSpacing(i_theta_M1);
-                    double k3 = fineGrid.angularSpacing(i_theta);
-                    double k4 = fineGrid.angularSpacing(i_theta_P1);
-
-                    result[coarseGrid.index(i_r_coarse, i_theta_coarse)] =
-                        // Center
-                        x[fineGrid.index(i_r, i_theta)] +
-                        // Left, Right, Bottom, Top
-                        h2 * x[fineGrid.index(i_r - 1, i_theta)] / (h1 + h2) +
-                        h3 * x[fineGrid.index(i_r + 1, i_theta)] / (h3 + h4) +
-                        k2 * x[fineGrid.index(i_r, i_theta_M1)] / (k1 + k2) +
-                        k3 * x[fineGrid.index(i_r, i_theta_P1)] / (k3 + k4) +
-                        // Bottom Left, Bottom Right, Top Left, Top Right
-                        h2 * k2 * x[fineGrid.index(i_r - 1, i_theta_M1)] / ((h1 + h2) * (k1 + k2)) +
-                        h3 * k2 * x[fineGrid.index(i_r + 1, i_theta_M1)] / ((h3 + h4) * (k1 + k2)) +
-                        h2 * k3 * x[fineGrid.index(i_r - 1, i_theta_P1)] / ((h1 + h2) * (k3 + k4)) +
-                        h3 * k3 * x[fineGrid.index(i_r + 1, i_theta_P1)] / ((h3 + h4) * (k3 + k4));
-                }
-                else {
-                    /* First and Last Circle have to be checked for domain boundary */
-                    // Middle Part
-                    int i_theta_M2 = fineGrid.wrapThetaIndex(i_theta - 2);
-                    int i_theta_M1 = fineGrid.wrapThetaIndex(i_theta - 1);
-                    int i_theta_P1 = fineGrid.wrapThetaIndex(i_theta + 1);
-                    double k1      = fineGrid.angularSpacing(i_theta_M2);
-                    double k2      = fineGrid.angularSpacing(i_theta_M1);
-                    double k3      = fineGrid.angularSpacing(i_theta);
-                    double k4      = fineGrid.angularSpacing(i_theta_P1);
-                    // Center, Bottom, Top
-                    double value = x[fineGrid.index(i_r, i_theta)] +
-                                   k2 * x[fineGrid.index(i_r, i_theta_M1)] / (k1 + k2) +
-                                   k3 * x[fineGrid.index(i_r, i_theta_P1)] / (k3 + k4);
-
-                    if (i_r_coarse > 0) {
-                        // Left Part
-                        double h1 = fineGrid.radialSpacing(i_r - 2);
-                        double h2 = fineGrid.radialSpacing(i_r - 1);
-                        // Left, Bottom Left, Top Left
-                        value += h2 * x[fineGrid.index(i_r - 1, i_theta)] / (h1 + h2) +
-                                 h2 * k2 * x[fineGrid.index(i_r - 1, i_theta_M1)] / ((h1 + h2) * (k1 + k2)) +
-                                 h2 * k3 * x[fineGrid.index(i_r - 1, i_theta_P1)] / ((h1 + h2) * (k3 + k4));
-                    }
-                    if (i_r_coarse < coarseGrid.nr() - 1) {
-                        // Right Part
-                        double h3 = fineGrid.radialSpacing(i_r);
-                        double h4 = fineGrid.radialSpacing(i_r + 1);
-                        // Right, Bottom Right, Top Right
-                        value += h3 * x[fineGrid.index(i_r + 1, i_theta)] / (h3 + h4) +
-                                 h3 * k2 * x[fineGrid.index(i_r + 1, i_theta_M1)] / ((h3 + h4) * (k1 + k2)) +
-                                 h3 * k3 * x[fineGrid.index(i_r + 1, i_theta_P1)] / ((h3 + h4) * (k3 + k4));
-                    }
-                    result[coarseGrid.index(i_r_coarse, i_theta_coarse)] = value;
-                }
+                result[column * coarse_n + coarseGrid.index(i_r_coarse, i_theta_coarse)] =
+                    restrictNode(fineGrid, coarseGrid, i_r_coarse, i_theta_coarse, fine_values);
             }
         }
-
-/* For loop matches circular access pattern */
-#pragma omp for nowait
-        for (int i_theta_coarse = 0; i_theta_coarse < coarseGrid.ntheta(); i_theta_coarse++) {
-            int i_theta = i_theta_coarse * 2;
+    });
+
+    /* For loop matches radial access pattern */
+    parallelFor(0, coarseGrid.ntheta(), num_threads, [&](int i_theta_coarse) {
+        for (int column = 0; column < number_of_columns; column++) {
+            const double* x_column = x.data() + column * fine_n;
+            const auto fine_values = [x_column, &fineGrid](int i_r, int i_theta) {
+                return x_column[fineGrid.index(i_r, i_theta)];
+            };
             for (int i_r_coarse = coarseNumberSmootherCircles; i_r_coarse < coarseGrid.nr(); i_r_coarse++) {
-                int i_r = i_r_coarse * 2;
-
-                if (coarseGrid.numberSmootherCircles() < i_r_coarse && i_r_coarse < coarseGrid.nr() - 1) {
-                    double h1 = fineGrid.radialSpacing(i_r - 2);
-                    double h2 = fineGrid.radialSpacing(i_r - 1);
-                    double h3 = fineGrid.radialSpacing(i_r);
-                    double h4 = fineGrid.radialSpacing(i_r + 1);
-
-                    int i_theta_M2 = fineGrid.wrapThetaIndex(i_theta - 2);
-                    int i_theta_M1 = fineGrid.wrapThetaIndex(i_theta - 1);
-                    int i_theta_P1 = fineGrid.wrapThetaIndex(i_theta + 1);
-                    double k1      = fineGrid.angularSpacing(i_theta_M2);
-                    double k2      = fineGrid.angularSpacing(i_theta_M1);
-                    double k3      = fineGrid.angularSpacing(i_theta);
-                    double k4      = fineGrid.angularSpacing(i_theta_P1);
-
-                    result[coarseGrid.index(i_r_coarse, i_theta_coarse)] =
-                        // Center
-                        x[fineGrid.index(i_r, i_theta)] +
-                        // Left, Right, Bottom, Top
-                        h2 * x[fineGrid.index(i_r - 1, i_theta)] / (h1 + h2) +
-                        h3 * x[fineGrid.index(i_r + 1, i_theta)] / (h3 + h4) +
-                        k2 * x[fineGrid.index(i_r, i_theta_M1)] / (k1 + k2) +
-                        k3 * x[fineGrid.index(i_r, i_theta_P1)] / (k3 + k4) +
-                        // Bottom Left, Bottom Right, Top Left, Top Right
-                        h2 * k2 * x[fineGrid.index(i_r - 1, i_theta_M1)] / ((h1 + h2) * (k1 + k2)) +
-                        h3 * k2 * x[fineGrid.index(i_r + 1, i_theta_M1)] / ((h3 + h4) * (k1 + k2)) +
-                        h2 * k3 * x[fineGrid.index(i_r - 1, i_theta_P1)] / ((h1 + h2) * (k3 + k4)) +
-                        h3 * k3 * x[fineGrid.index(i_r + 1, i_theta_P1)] / ((h3 + h4) * (k3 + k4));
-                }
-                else {
-                    /* First and Last radial nodes have to be checked for domain boundary */
-                    // Middle Part
-                    int i_theta_M2 = fineGrid.wrapThetaIndex(i_theta - 2);
-                    int i_theta_M1 = fineGrid.wrapThetaIndex(i_theta - 1);
-                    int i_theta_P1 = fineGrid.wrapThetaIndex(i_theta + 1);
-                    double k1      = fineGrid.angularSpacing(i_theta_M2);
-                    double k2      = fineGrid.angularSpacing(i_theta_M1);
-                    double k3      = fineGrid.angularSpacing(i_theta);
-                    double k4      = fineGrid.angularSpacing(i_theta_P1);
-                    // Center, Bottom, Top
-                    double value = x[fineGrid.index(i_r, i_theta)] +
-                                   k2 * x[fineGrid.index(i_r, i_theta_M1)] / (k1 + k2) +
-                                   k3 * x[fineGrid.index(i_r, i_theta_P1)] / (k3 + k4);
-                    if (i_r_coarse > 0) {
-                        // Left Part
-                        double h1 = fineGrid.radialSpacing(i_r - 2);
-                        double h2 = fineGrid.radialSpacing(i_r - 1);
-                        // Left, Bottom Left, Top Left
-                        value += h2 * x[fineGrid.index(i_r - 1, i_theta)] / (h1 + h2) +
-                                 h2 * k2 * x[fineGrid.index(i_r - 1, i_theta_M1)] / ((h1 + h2) * (k1 + k2)) +
-                                 h2 * k3 * x[fineGrid.index(i_r - 1, i_theta_P1)] / ((h1 + h2) * (k3 + k4));
-                    }
-                    if (i_r_coarse < coarseGrid.nr() - 1) {
-                        // Right Part
-                        double h3 = fineGrid.radialSpacing(i_r);
-                        double h4 = fineGrid.radialSpacing(i_r + 1);
-                        // Right, Bottom Right, Top Right
-                        value += h3 * x[fineGrid.index(i_r + 1, i_theta)] / (h3 + h4) +
-                                 h3 * k2 * x[fineGrid.index(i_r + 1, i_theta_M1)] / ((h3 + h4) * (k1 + k2)) +
-                                 h3 * k3 * x[fineGrid.index(i_r + 1, i_theta_P1)] / ((h3 + h4) * (k3 + k4));
-                    }
-                    result[coarseGrid.index(i_r_coarse, i_theta_coarse)] = value;
-                }
+                result[column * coarse_n + coarseGrid.index(i_r_coarse, i_theta_coarse)] =
+                    restrictNode(fineGrid, coarseGrid, i_r_coarse, i_theta_coarse, fine_values);
             }
         }
-    }
+    });
 }
 //clang-format on
@@ -1,5 +1,8 @@
 #include "../../include/Level/level.h"
 
+#include "../../include/Stencil/assembledStencil.h"
+
+#include "../../include/Residual/ResidualAssembled/residualAssembled.h"
 #include "../../include/Residual/ResidualGive/residualGive.h"
 #include "../../include/Residual/ResidualTake/residualTake.h"
 
@@ -8,25 +11,54 @@
 #include "../../include/DirectSolver/DirectSolver-CSR-LU-Give/directSolverGiveCustomLU.h"
 #include "../../include/DirectSolver/DirectSolver-CSR-LU-Take/directSolverTakeCustomLU.h"
 
+#include "../../include/Smoother/SmootherAssembled/smootherAssembled.h"
 #include "../../include/Smoother/SmootherGive/smootherGive.h"
 #include "../../include/Smoother/SmootherTake/smootherTake.h"
 
+#include "../../include/ExtrapolatedSmoother/ExtrapolatedSmootherAssembled/extrapolatedSmootherAssembled.h"
 #include "../../include/ExtrapolatedSmoother/ExtrapolatedSmootherGive/extrapolatedSmootherGive.h"
 #include "../../include/ExtrapolatedSmoother/ExtrapolatedSmootherTake/extrapolatedSmootherTake.h"
 
 // ----------- //
 // Constructor //
 Level::Level(const int level_depth, std::unique_ptr<const PolarGrid> grid,
-             std::unique_ptr<const LevelCache> level_cache, const ExtrapolationType extrapolation, const bool FMG)
+             std::unique_ptr<LevelCache> level_cache, const ExtrapolationType extrapolation, const bool FMG,
+             Profiler* profiler, Vector<double> shared_solution)
     : level_depth_(level_depth)
     , grid_(std::move(grid))
     , level_cache_(std::move(level_cache))
+    , profiler_(profiler)
     , rhs_("rhs", (FMG || level_depth == 0 || (level_depth == 1 && extrapolation != ExtrapolationType::NONE))
                       ? grid_->numberOfNodes()
                       : 0)
-    , solution_("solution", grid_->numberOfNodes())
+    , shares_solution_(shared_solution.size() > 0)
+    , solution_(shares_solution_ ? Kokkos::subview(shared_solution, Kokkos::make_pair(0, grid_->numberOfNodes()))
+                                 : Vector<double>("solution", grid_->numberOfNodes()))
     , residual_("residual", grid_->numberOfNodes())
     , error_correction_("err_correction", (level_depth > 0) ? grid_->numberOfNodes() : 0)
+{
+    assert(!shares_solution_ || shared_solution.size() >= static_cast<std::size_t>(grid_->numberOfNodes()));
+}
+
+Level::Level(const Level& setup_level, Profiler* profiler, Vector<double> shared_solution)
+    : level_depth_(setup_level.level_depth_)
+    , grid_(setup_level.grid_)
+    , level_cache_(setup_level.level_cache_)
+    , profiler_(profiler)
+    , op_directSolver_(setup_level.op_directSolver_)
+    , op_residual_(setup_level.op_residual_)
+    , op_smoother_(setup_level.op_smoother_)
+    , op_extrapolated_smoother_(setup_level.op_extrapolated_smoother_)
+    , assembled_stencil_(setup_level.assembled_stencil_)
+    , rhs_("rhs", setup_level.rhs_.size())
+    , shares_solution_(shared_solution.size() > 0)
+    , solution_(shares_solution_ ? Kokkos::subview(shared_solution, Kokkos::make_pair(0, grid_->numberOfNodes()))
+                                 : Vector<double>("solution", setup_level.solution_.size()))
+    , residual_("residual", setup_level.residual_.size())
+    , error_correction_("err_correction", setup_level.error_correction_.size())
+    , single_precision_solution_("single_precision_solution", setup_level.single_precision_solution_.size())
+    , single_precision_rhs_("single_precision_rhs", setup_level.single_precision_rhs_.size())
+    , single_precision_residual_("single_precision_residual", setup_level.single_precision_residual_.size())
 {
 }
 
@@ -80,6 +112,64 @@ ConstVector<double> Level::error_correction() const
     return error_correction_;
 }
 
+// ------------- //
+// Batched Solve //
+void Level::allocateBatch(const int number_of_columns)
+{
+    if (batch_columns_ == number_of_columns)
+        return;
+    batch_columns_ = number_of_columns;
+
+    const std::size_t size = static_cast<std::size_t>(number_of_columns) * grid_->numberOfNodes();
+    batch_rhs_             = Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace>("batch_rhs", size);
+    batch_solution_        = Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace>("batch_solution", size);
+    batch_residual_        = Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace>("batch_residual", size);
+}
+int Level::batchColumns() const
+{
+    return batch_columns_;
+}
+Vector<double> Level::batchRhs()
+{
+    return batch_rhs_;
+}
+Vector<double> Level::batchSolution()
+{
+    return batch_solution_;
+}
+Vector<double> Level::batchResidual()
+{
+    return batch_residual_;
+}
+
+// --------------------------- //
+// Single Precision Correction //
+void Level::allocateSinglePrecision()
+{
+    const std::size_t size = grid_->numberOfNodes();
+    if (single_precision_solution_.size() == size)
+        return;
+    single_precision_solution_ = decltype(single_precision_solution_)("single_precision_solution", size);
+    single_precision_rhs_      = decltype(single_precision_rhs_)("single_precision_rhs", size);
+    single_precision_residual_ = decltype(single_precision_residual_)("single_precision_residual", size);
+}
+Vector<float> Level::singlePrecisionSolution()
+{
+    return single_precision_solution_;
+}
+Vector<float> Level::singlePrecisionRhs()
+{
+    return single_precision_rhs_;
+}
+Vector<float> Level::singlePrecisionResidual()
+{
+    return single_precision_residual_;
+}
+bool Level::hasSinglePrecision() const
+{
+    return op_residual_ && op_residual_->hasSinglePrecision() && op_smoother_ && op_smoother_->hasSinglePrecision();
+}
+
 // -------------- //
 // Apply Residual //
 void Level::initializeResidual(const DomainGeometry& domain_geometry,
@@ -95,6 +185,11 @@ void Level::initializeResidual(const DomainGeometry& domain_geometry,
         op_residual_ = std::make_unique<ResidualGive>(*grid_, *level_cache_, domain_geometry,
                                                       density_profile_coefficients, DirBC_Interior, num_omp_threads);
     }
+    else if (usesAssembledStencil(stencil_distribution_method)) {
+        op_residual_ = std::make_unique<ResidualAssembled>(
+            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads,
+            assembledStencil(DirBC_Interior, num_omp_threads, stencil_distribution_method));
+    }
     if (!op_residual_)
         throw std::runtime_error("Failed to initialize Residual.");
 }
@@ -102,33 +197,77 @@ void Level::computeResidual(Vector<double> result, ConstVector<double> rhs, Cons
 {
     if (!op_residual_)
         throw std::runtime_error("Residual not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::RESIDUAL);
     op_residual_->computeResidual(result, rhs, x);
 }
+void Level::computeResidualBatch(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x,
+                                 const int number_of_columns) const
+{
+    if (!op_residual_)
+        throw std::runtime_error("Residual not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::RESIDUAL);
+    op_residual_->computeResidualBatch(result, rhs, x, number_of_columns);
+}
+bool Level::hasRestrictedResidual() const
+{
+    return op_residual_ && op_residual_->hasRestrictedResidual();
+}
+void Level::computeRestrictedResidual(const Level& next_level, Vector<double> result, ConstVector<double> rhs,
+                                      ConstVector<double> x, const bool extrapolated) const
+{
+    if (!op_residual_)
+        throw std::runtime_error("Residual not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::RESIDUAL);
+    op_residual_->computeRestrictedResidual(next_level.grid(), result, rhs, x, extrapolated);
+}
+void Level::computeRestrictedResidualSinglePrecision(const Level& next_level, Vector<float> result,
+                                                     ConstVector<double> rhs, ConstVector<double> x) const
+{
+    if (!op_residual_)
+        throw std::runtime_error("Residual not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::RESIDUAL);
+    op_residual_->computeRestrictedResidualSinglePrecision(next_level.grid(), result, rhs, x);
+}
+void Level::computeRestrictedResidualSinglePrecision(const Level& next_level, Vector<float> result,
+                                                     ConstVector<float> rhs, ConstVector<float> x) const
+{
+    if (!op_residual_)
+        throw std::runtime_error("Residual not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::RESIDUAL);
+    op_residual_->computeRestrictedResidualSinglePrecision(next_level.grid(), result, rhs, x);
+}
 
 // ------------------- //
 // Solve coarse System //
 void Level::initializeDirectSolver(const DomainGeometry& domain_geometry,
                                    const DensityProfileCoefficients& density_profile_coefficients,
                                    const bool DirBC_Interior, const int num_omp_threads,
-                                   const StencilDistributionMethod stencil_distribution_method)
+                                   const StencilDistributionMethod stencil_distribution_method,
+                                   const bool single_precision, SetupReader* setup_reader)
 {
 #ifdef GMGPOLAR_USE_MUMPS
-    if (stencil_distribution_method == StencilDistributionMethod::CPU_TAKE) {
+    if (stencil_distribution_method == StencilDistributionMethod::CPU_TAKE ||
+        usesAssembledStencil(stencil_distribution_method)) {
         op_directSolver_ = std::make_unique<DirectSolverTake>(
-            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads);
+            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads,
+            single_precision, setup_reader);
     }
     else if (stencil_distribution_method == StencilDistributionMethod::CPU_GIVE) {
         op_directSolver_ = std::make_unique<DirectSolverGive>(
-            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads);
+            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads,
+            setup_reader);
     }
 #else
-    if (stencil_distribution_method == StencilDistributionMethod::CPU_TAKE) {
+    if (stencil_distribution_method == StencilDistributionMethod::CPU_TAKE ||
+        usesAssembledStencil(stencil_distribution_method)) {
         op_directSolver_ = std::make_unique<DirectSolverTakeCustomLU>(
-            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads);
+            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads,
+            single_precision, setup_reader);
     }
     else if (stencil_distribution_method == StencilDistributionMethod::CPU_GIVE) {
         op_directSolver_ = std::make_unique<DirectSolverGiveCustomLU>(
-            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads);
+            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads,
+            setup_reader);
     }
 #endif
     if (!op_directSolver_)
@@ -139,23 +278,47 @@ void Level::directSolveInPlace(Vector<double> x) const
 {
     if (!op_directSolver_)
         throw std::runtime_error("Coarse Solver not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::DIRECT_SOLVE);
     op_directSolver_->solveInPlace(x);
 }
+void Level::directSolveInPlaceBatch(Vector<double> x, const int number_of_columns) const
+{
+    if (!op_directSolver_)
+        throw std::runtime_error("Coarse Solver not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::DIRECT_SOLVE);
+    op_directSolver_->solveInPlaceBatch(x, number_of_columns);
+}
+void Level::directSolveInPlaceSinglePrecision(Vector<float> x) const
+{
+    if (!op_directSolver_)
+        throw std::runtime_error("Coarse Solver not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::DIRECT_SOLVE);
+    op_directSolver_->solveInPlaceSinglePrecision(x);
+}
 
 // --------------- //
 // Apply Smoothing //
 void Level::initializeSmoothing(const DomainGeometry& domain_geometry,
                                 const DensityProfileCoefficients& density_profile_coefficients,
                                 const bool DirBC_Interior, const int num_omp_threads,
-                                const StencilDistributionMethod stencil_distribution_method)
+                                const StencilDistributionMethod stencil_distribution_method,
+                                const bool single_precision_factors, SetupReader* setup_reader)
 {
     if (stencil_distribution_method == StencilDistributionMethod::CPU_TAKE) {
         op_smoother_ = std::make_unique<SmootherTake>(*grid_, *level_cache_, domain_geometry,
-                                                      density_profile_coefficients, DirBC_Interior, num_omp_threads);
+                                                      density_profile_coefficients, DirBC_Interior, num_omp_threads,
+                                                      single_precision_factors, setup_reader);
     }
     else if (stencil_distribution_method == StencilDistributionMethod::CPU_GIVE) {
         op_smoother_ = std::make_unique<SmootherGive>(*grid_, *level_cache_, domain_geometry,
-                                                      density_profile_coefficients, DirBC_Interior, num_omp_threads);
+                                                      density_profile_coefficients, DirBC_Interior, num_omp_threads,
+                                                      single_precision_factors, setup_reader);
+    }
+    else if (usesAssembledStencil(stencil_distribution_method)) {
+        op_smoother_ = std::make_unique<SmootherAssembled>(
+            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads,
+            assembledStencil(DirBC_Interior, num_omp_threads, stencil_distribution_method), single_precision_factors,
+            setup_reader);
     }
     if (!op_smoother_)
         throw std::runtime_error("Failed to initialize Smoother.");
@@ -164,23 +327,47 @@ void Level::smoothing(Vector<double> x, ConstVector<double> rhs, Vector<double>
 {
     if (!op_smoother_)
         throw std::runtime_error("Smoother not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::SMOOTHING);
     op_smoother_->smoothing(x, rhs, temp);
 }
+void Level::smoothingBatch(Vector<double> x, ConstVector<double> rhs, Vector<double> temp,
+                           const int number_of_columns) const
+{
+    if (!op_smoother_)
+        throw std::runtime_error("Smoother not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::SMOOTHING);
+    op_smoother_->smoothingBatch(x, rhs, temp, number_of_columns);
+}
+void Level::smoothingSinglePrecision(Vector<float> x, ConstVector<float> rhs, Vector<float> temp) const
+{
+    if (!op_smoother_)
+        throw std::runtime_error("Smoother not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::SMOOTHING);
+    op_smoother_->smoothingSinglePrecision(x, rhs, temp);
+}
 
 // ---------------------------- //
 // Apply Extrapolated Smoothing //
 void Level::initializeExtrapolatedSmoothing(const DomainGeometry& domain_geometry,
                                             const DensityProfileCoefficients& density_profile_coefficients,
                                             const bool DirBC_Interior, const int num_omp_threads,
-                                            const StencilDistributionMethod stencil_distribution_method)
+                                            const StencilDistributionMethod stencil_distribution_method,
+                                            SetupReader* setup_reader)
 {
     if (stencil_distribution_method == StencilDistributionMethod::CPU_TAKE) {
         op_extrapolated_smoother_ = std::make_unique<ExtrapolatedSmootherTake>(
-            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads);
+            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads,
+            setup_reader);
     }
     else if (stencil_distribution_method == StencilDistributionMethod::CPU_GIVE) {
         op_extrapolated_smoother_ = std::make_unique<ExtrapolatedSmootherGive>(
-            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads);
+            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads,
+            setup_reader);
+    }
+    else if (usesAssembledStencil(stencil_distribution_method)) {
+        op_extrapolated_smoother_ = std::make_unique<ExtrapolatedSmootherAssembled>(
+            *grid_, *level_cache_, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads,
+            assembledStencil(DirBC_Interior, num_omp_threads, stencil_distribution_method), setup_reader);
     }
     if (!op_extrapolated_smoother_)
         throw std::runtime_error("Failed to initialize Extrapolated Smoother.");
@@ -189,5 +376,121 @@ void Level::extrapolatedSmoothing(Vector<double> x, ConstVector<double> rhs, Vec
 {
     if (!op_extrapolated_smoother_)
         throw std::runtime_error("Extrapolated Smoother not initialized.");
+    ProfileScope profile(profiler_, level_depth_, ProfiledOperation::EXTRAPOLATED_SMOOTHING);
     op_extrapolated_smoother_->extrapolatedSmoothing(x, rhs, temp);
 }
+
+bool Level::hasSmoother() const
+{
+    return op_smoother_ != nullptr;
+}
+bool Level::hasExtrapolatedSmoother() const
+{
+    return op_extrapolated_smoother_ != nullptr;
+}
+
+// ------------------------ //
+// Number of OpenMP threads //
+void Level::numOmpThreads(const int num_omp_threads)
+{
+    if (op_residual_)
+        op_residual_->numOmpThreads(num_omp_threads);
+    if (op_smoother_)
+        op_smoother_->numOmpThreads(num_omp_threads);
+    if (op_extrapolated_smoother_)
+        op_extrapolated_smoother_->numOmpThreads(num_omp_threads);
+}
+
+// ----------------- //
+// Memory Accounting //
+LevelMemory Level::memoryUsage() const
+{
+    LevelMemory memory;
+    memory.vectors =
+        (rhs_.size() + (shares_solution_ ? 0 : solution_.size()) + residual_.size() + error_correction_.size() +
+         batch_rhs_.size() + batch_solution_.size() + batch_residual_.size()) *
+            sizeof(double) +
+        (single_precision_solution_.size() + single_precision_rhs_.size() + single_precision_residual_.size()) *
+            sizeof(float);
+    memory.level_cache = {
+        {"sin_theta", level_cache_->sin_theta().size() * sizeof(double)},
+        {"cos_theta", level_cache_->cos_theta().size() * sizeof(double)},
+        {"coeff_alpha", level_cache_->coeff_alpha().size() * sizeof(double)},
+        {"coeff_beta", level_cache_->coeff_beta().size() * sizeof(double)},
+        {"arr", level_cache_->arr().size() * sizeof(double)},
+        {"att", level_cache_->att().size() * sizeof(double)},
+        {"art", level_cache_->art().size() * sizeof(double)},
+        {"detDF", level_cache_->detDF().size() * sizeof(double)},
+    };
+    if (op_smoother_)
+        memory.smoother = op_smoother_->memoryUsage();
+    if (op_extrapolated_smoother_)
+        memory.extrapolated_smoother = op_extrapolated_smoother_->memoryUsage();
+    if (op_directSolver_)
+        memory.direct_solver = op_directSolver_->memoryUsage();
+    if (assembled_stencil_)
+        memory.assembled_stencil = assembled_stencil_->memoryUsage();
+    return memory;
+}
+
+// ----------------- //
+// Assembled Stencil //
+const AssembledStencil& Level::assembledStencil(const bool DirBC_Interior, const int num_omp_threads,
+                                                const StencilDistributionMethod stencil_distribution_method)
+{
+    const bool symmetric = stencil_distribution_method == StencilDistributionMethod::CPU_ASSEMBLED_SYMMETRIC;
+    if (!assembled_stencil_) {
+        assembled_stencil_ =
+            std::make_shared<AssembledStencil>(*grid_, *level_cache_, DirBC_Interior, symmetric, num_omp_threads);
+    }
+    else if (assembled_stencil_->symmetric() != symmetric) {
+        throw std::runtime_error("The assembled operators of a level have to use the same stencil storage.");
+    }
+    return *assembled_stencil_;
+}
+
+// ----------------------------------- //
+// Update Density Profile Coefficients //
+void Level::updateDensityProfileCoefficients(const DensityProfileCoefficients& density_profile_coefficients)
+{
+    level_cache_->updateDensityProfileCoefficients(*grid_, density_profile_coefficients);
+    refactorizeOperators();
+}
+void Level::updateDensityProfileCoefficients(const Level& previous_level)
+{
+    level_cache_->updateDensityProfileCoefficients(previous_level, *grid_);
+    refactorizeOperators();
+}
+
+void Level::refactorizeOperators()
+{
+    // The Take and Give residual operators evaluate the level cache on the fly and need no update.
+    if (assembled_stencil_)
+        assembled_stencil_->assemble();
+    if (op_directSolver_)
+        op_directSolver_->refactorize();
+    if (op_smoother_)
+        op_smoother_->refactorize();
+    if (op_extrapolated_smoother_)
+        op_extrapolated_smoother_->refactorize();
+}
+
+// ----------------- //
+// Setup Persistence //
+void Level::saveSetup(SetupWriter& writer) const
+{
+    writer.writeTag("LEVEL");
+    writer.writeValue(level_depth_);
+    writer.writeVector(grid_->radii());
+    writer.writeVector(grid_->angles());
+    writer.writeValue(grid_->smootherSplittingRadius());
+    level_cache_->saveSetup(writer);
+
+    // The operators are restored in the same order by GMGPolar::loadSetup.
+    if (op_smoother_)
+        op_smoother_->saveSetup(writer);
+    if (op_extrapolated_smoother_)
+        op_extrapolated_smoother_->saveSetup(writer);
+    if (op_directSolver_)
+        op_directSolver_->saveSetup(writer);
+}
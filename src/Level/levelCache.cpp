@@ -1,23 +1,54 @@
 #include "../../include/Level/level.h"
 
+// Length of a cached array: one value per node, one per circle for radial profiles or none.
+static int cachedSize(const PolarGrid& grid, const bool cached, const bool radial_profiles)
+{
+    if (radial_profiles)
+        return grid.nr();
+    return cached ? grid.numberOfNodes() : 0;
+}
+
+// Wraps the next array of the setup file as an unmanaged View instead of copying it, see SetupReader::mapArray().
+// 'section' is the tag which precedes the first array of the section.
+static Vector<double> mappedArray(SetupReader& setup_reader, const int size, const char* section = nullptr)
+{
+    if (section != nullptr)
+        setup_reader.readTag(section);
+    return Vector<double>(setup_reader.mapArray<double>(size), size);
+}
+
+static void checkRadialProfiles(const bool radial_profiles, const DomainGeometry& domain_geometry,
+                                const DensityProfileCoefficients& density_profile_coefficients)
+{
+    if (radial_profiles &&
+        !(domain_geometry.isAngleIndependent() && density_profile_coefficients.isAngleIndependent())) {
+        throw std::runtime_error("Error: Radial profiles require an angle independent domain geometry and density "
+                                 "profile coefficients.");
+    }
+}
+
 LevelCache::LevelCache(const PolarGrid& grid, const DensityProfileCoefficients& density_profile_coefficients,
                        const DomainGeometry& domain_geometry, const bool cache_density_profile_coefficients,
-                       const bool cache_domain_geometry)
+                       const bool cache_domain_geometry, const bool radial_profiles)
     : domain_geometry_(domain_geometry)
-    , density_profile_coefficients_(density_profile_coefficients)
+    , density_profile_coefficients_(&density_profile_coefficients)
     , sin_theta_("sin_theta", grid.ntheta())
     , cos_theta_("cos_theta", grid.ntheta())
-    , cache_density_profile_coefficients_(cache_density_profile_coefficients)
+    , cache_density_profile_coefficients_(cache_density_profile_coefficients && !radial_profiles)
     // If the domain geometry is cached, we don't need to cache the alpha coefficient
     , coeff_alpha_("coeff_alpha",
-                   (cache_density_profile_coefficients && !cache_domain_geometry) ? grid.numberOfNodes() : 0)
-    , coeff_beta_("coeff_beta", cache_density_profile_coefficients ? grid.numberOfNodes() : 0)
-    , cache_domain_geometry_(cache_domain_geometry)
-    , arr_("arr", cache_domain_geometry ? grid.numberOfNodes() : 0)
-    , att_("att", cache_domain_geometry ? grid.numberOfNodes() : 0)
-    , art_("art", cache_domain_geometry ? grid.numberOfNodes() : 0)
-    , detDF_("detDF", cache_domain_geometry ? grid.numberOfNodes() : 0)
+                   cachedSize(grid, cache_density_profile_coefficients && !cache_domain_geometry && !radial_profiles,
+                              false))
+    , coeff_beta_("coeff_beta", cachedSize(grid, cache_density_profile_coefficients, radial_profiles))
+    , cache_domain_geometry_(cache_domain_geometry && !radial_profiles)
+    , arr_("arr", cachedSize(grid, cache_domain_geometry, radial_profiles))
+    , att_("att", cachedSize(grid, cache_domain_geometry, radial_profiles))
+    , art_("art", cachedSize(grid, cache_domain_geometry, radial_profiles))
+    , detDF_("detDF", cachedSize(grid, cache_domain_geometry, radial_profiles))
+    , radial_profiles_(radial_profiles)
 {
+    checkRadialProfiles(radial_profiles, domain_geometry, density_profile_coefficients);
+
 #pragma omp parallel for
     for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
         const double theta  = grid.theta(i_theta);
@@ -25,103 +56,178 @@ LevelCache::LevelCache(const PolarGrid& grid, const DensityProfileCoefficients&
         cos_theta_(i_theta) = cos(theta);
     }
 
-    if (cache_density_profile_coefficients_) {
+    computeCachedValues(grid);
+}
+
+LevelCache::LevelCache(const Level& previous_level, const PolarGrid& current_grid)
+    : domain_geometry_(previous_level.levelCache().domainGeometry())
+    , density_profile_coefficients_(&previous_level.levelCache().densityProfileCoefficients())
+    , sin_theta_("sin_theta", current_grid.ntheta())
+    , cos_theta_("cos_theta", current_grid.ntheta())
+    , cache_density_profile_coefficients_(previous_level.levelCache().cacheDensityProfileCoefficients())
+    , coeff_alpha_("coeff_alpha", cachedSize(current_grid, previous_level.levelCache().coeff_alpha().size() > 0, false))
+    , coeff_beta_("coeff_beta", cachedSize(current_grid, previous_level.levelCache().coeff_beta().size() > 0,
+                                           previous_level.levelCache().radialProfiles()))
+    , cache_domain_geometry_(previous_level.levelCache().cacheDomainGeometry())
+    , arr_("arr", cachedSize(current_grid, previous_level.levelCache().arr().size() > 0,
+                             previous_level.levelCache().radialProfiles()))
+    , att_("att", cachedSize(current_grid, previous_level.levelCache().att().size() > 0,
+                             previous_level.levelCache().radialProfiles()))
+    , art_("art", cachedSize(current_grid, previous_level.levelCache().art().size() > 0,
+                             previous_level.levelCache().radialProfiles()))
+    , detDF_("detDF", cachedSize(current_grid, previous_level.levelCache().detDF().size() > 0,
+                                 previous_level.levelCache().radialProfiles()))
+    , radial_profiles_(previous_level.levelCache().radialProfiles())
+{
+    const auto& previous_level_cache = previous_level.levelCache();
+
+    for (int i_theta = 0; i_theta < current_grid.ntheta(); i_theta++) {
+        const double theta  = current_grid.theta(i_theta);
+        sin_theta_(i_theta) = previous_level_cache.sin_theta()[2 * i_theta];
+        cos_theta_(i_theta) = previous_level_cache.cos_theta()[2 * i_theta];
+    }
+
+    injectCachedValues(previous_level, current_grid);
+}
+
+LevelCache::LevelCache(const PolarGrid& grid, const DensityProfileCoefficients& density_profile_coefficients,
+                       const DomainGeometry& domain_geometry, const bool cache_density_profile_coefficients,
+                       const bool cache_domain_geometry, const bool radial_profiles, SetupReader& setup_reader)
+    : domain_geometry_(domain_geometry)
+    , density_profile_coefficients_(&density_profile_coefficients)
+    , sin_theta_(mappedArray(setup_reader, grid.ntheta(), "CACHE"))
+    , cos_theta_(mappedArray(setup_reader, grid.ntheta()))
+    , cache_density_profile_coefficients_(cache_density_profile_coefficients && !radial_profiles)
+    , coeff_alpha_(mappedArray(
+          setup_reader,
+          cachedSize(grid, cache_density_profile_coefficients && !cache_domain_geometry && !radial_profiles, false)))
+    , coeff_beta_(mappedArray(setup_reader, cachedSize(grid, cache_density_profile_coefficients, radial_profiles)))
+    , cache_domain_geometry_(cache_domain_geometry && !radial_profiles)
+    , arr_(mappedArray(setup_reader, cachedSize(grid, cache_domain_geometry, radial_profiles)))
+    , att_(mappedArray(setup_reader, cachedSize(grid, cache_domain_geometry, radial_profiles)))
+    , art_(mappedArray(setup_reader, cachedSize(grid, cache_domain_geometry, radial_profiles)))
+    , detDF_(mappedArray(setup_reader, cachedSize(grid, cache_domain_geometry, radial_profiles)))
+    , radial_profiles_(radial_profiles)
+    , setup_mapping_(setup_reader.mapping())
+{
+    checkRadialProfiles(radial_profiles, domain_geometry, density_profile_coefficients);
+}
+
+void LevelCache::saveSetup(SetupWriter& writer) const
+{
+    writer.writeTag("CACHE");
+    for (ConstVector<double> values : {sin_theta_, cos_theta_, coeff_alpha_, coeff_beta_, arr_, att_, art_, detDF_}) {
+        writer.writeArray(values.data(), values.size());
+    }
+}
+
+void LevelCache::updateDensityProfileCoefficients(const PolarGrid& grid,
+                                                  const DensityProfileCoefficients& density_profile_coefficients)
+{
+    checkRadialProfiles(radial_profiles_, domain_geometry_, density_profile_coefficients);
+    density_profile_coefficients_ = &density_profile_coefficients;
+    computeCachedValues(grid);
+}
+
+void LevelCache::updateDensityProfileCoefficients(const Level& previous_level, const PolarGrid& current_grid)
+{
+    density_profile_coefficients_ = &previous_level.levelCache().densityProfileCoefficients();
+    injectCachedValues(previous_level, current_grid);
+}
+
+void LevelCache::computeCachedValues(const PolarGrid& grid)
+{
+    if (radial_profiles_) {
+        // The values are the same on the whole circle, so they are evaluated at theta = 0.
 #pragma omp parallel for
         for (int i_r = 0; i_r < grid.nr(); i_r++) {
-            const double r = grid.radius(i_r);
-            for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
-                const double theta = grid.theta(i_theta);
-                const int index    = grid.index(i_r, i_theta);
-                if (!cache_domain_geometry_) {
-                    coeff_alpha_(index) = density_profile_coefficients.alpha(r, theta);
-                }
-                coeff_beta_(index) = density_profile_coefficients.beta(r, theta);
-            }
+            const double r           = grid.radius(i_r);
+            const double coeff_alpha = density_profile_coefficients_->alpha(r, 0.0);
+            coeff_beta_(i_r)         = density_profile_coefficients_->beta(r, 0.0);
+
+            double arr, att, art, detDF;
+            compute_jacobian_elements(domain_geometry_, r, 0.0, 0.0, 1.0, coeff_alpha, arr, att, art, detDF);
+            detDF_(i_r) = detDF;
+            arr_(i_r)   = arr;
+            att_(i_r)   = att;
+            art_(i_r)   = art;
         }
+        return;
     }
 
-    if (cache_domain_geometry_) {
+    if (cache_density_profile_coefficients_) {
+        // alpha is only needed if the geometry is not cached, see obtainValues().
 #pragma omp parallel for
         for (int i_r = 0; i_r < grid.numberSmootherCircles(); i_r++) {
-            const double r = grid.radius(i_r);
-            for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
-                const double theta     = grid.theta(i_theta);
-                const double sin_theta = sin_theta_(i_theta);
-                const double cos_theta = cos_theta_(i_theta);
-                const int index        = grid.index(i_r, i_theta);
-
-                double coeff_alpha = density_profile_coefficients.alpha(r, theta);
-
-                double arr, att, art, detDF;
-                compute_jacobian_elements(domain_geometry_, r, theta, sin_theta, cos_theta, coeff_alpha, arr, att, art,
-                                          detDF);
-                detDF_(index) = detDF;
-                arr_(index)   = arr;
-                att_(index)   = att;
-                art_(index)   = art;
-            }
+            const int start = grid.index(i_r, 0);
+            density_profile_coefficients_->evaluateCircle(
+                grid.radius(i_r), grid.ntheta(), grid.angles().data(),
+                cache_domain_geometry_ ? nullptr : coeff_alpha_.data() + start, coeff_beta_.data() + start);
         }
 
 #pragma omp parallel for
         for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
-            const double theta     = grid.theta(i_theta);
-            const double sin_theta = sin_theta_(i_theta);
-            const double cos_theta = cos_theta_(i_theta);
-            for (int i_r = grid.numberSmootherCircles(); i_r < grid.nr(); i_r++) {
-                const double r  = grid.radius(i_r);
-                const int index = grid.index(i_r, i_theta);
-
-                double coeff_alpha;
-                if (cache_density_profile_coefficients_ && !cache_domain_geometry_) {
-                    coeff_alpha = coeff_alpha_(index);
-                }
-                else {
-                    coeff_alpha = density_profile_coefficients.alpha(r, theta);
-                }
+            const int start = grid.index(grid.numberSmootherCircles(), i_theta);
+            density_profile_coefficients_->evaluateRadialLine(
+                grid.lengthSmootherRadial(), grid.radii().data() + grid.numberSmootherCircles(), grid.theta(i_theta),
+                cache_domain_geometry_ ? nullptr : coeff_alpha_.data() + start, coeff_beta_.data() + start);
+        }
+    }
 
-                double arr, att, art, detDF;
-                compute_jacobian_elements(domain_geometry_, r, theta, sin_theta, cos_theta, coeff_alpha, arr, att, art,
-                                          detDF);
-                detDF_(index) = detDF;
-                arr_(index)   = arr;
-                att_(index)   = att;
-                art_(index)   = art;
-            }
+    if (cache_domain_geometry_) {
+        // The Jacobian of a whole circle or radial line is evaluated by one batched call of the domain geometry.
+#pragma omp parallel for
+        for (int i_r = 0; i_r < grid.numberSmootherCircles(); i_r++) {
+            const double r  = grid.radius(i_r);
+            const int start = grid.index(i_r, 0);
+            std::vector<double> coeff_alpha(grid.ntheta());
+            density_profile_coefficients_->evaluateCircle(r, grid.ntheta(), grid.angles().data(), coeff_alpha.data(),
+                                                          nullptr);
+            compute_jacobian_elements_circle(domain_geometry_, r, grid.ntheta(), grid.angles().data(),
+                                             sin_theta_.data(), cos_theta_.data(), coeff_alpha.data(),
+                                             arr_.data() + start, att_.data() + start, art_.data() + start,
+                                             detDF_.data() + start);
+        }
+
+#pragma omp parallel for
+        for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+            const double theta = grid.theta(i_theta);
+            const int count    = grid.lengthSmootherRadial();
+            const int start    = grid.index(grid.numberSmootherCircles(), i_theta);
+            const double* r    = grid.radii().data() + grid.numberSmootherCircles();
+            std::vector<double> coeff_alpha(count);
+            density_profile_coefficients_->evaluateRadialLine(count, r, theta, coeff_alpha.data(), nullptr);
+            compute_jacobian_elements_radial_line(domain_geometry_, count, r, theta, sin_theta_(i_theta),
+                                                  cos_theta_(i_theta), coeff_alpha.data(), arr_.data() + start,
+                                                  att_.data() + start, art_.data() + start, detDF_.data() + start);
         }
     }
 }
 
-LevelCache::LevelCache(const Level& previous_level, const PolarGrid& current_grid)
-    : domain_geometry_(previous_level.levelCache().domainGeometry())
-    , density_profile_coefficients_(previous_level.levelCache().densityProfileCoefficients())
-    , sin_theta_("sin_theta", current_grid.ntheta())
-    , cos_theta_("cos_theta", current_grid.ntheta())
-    , cache_density_profile_coefficients_(previous_level.levelCache().cacheDensityProfileCoefficients())
-    , coeff_alpha_("coeff_alpha",
-                   previous_level.levelCache().coeff_alpha().size() > 0 ? current_grid.numberOfNodes() : 0)
-    , coeff_beta_("coeff_beta", previous_level.levelCache().coeff_beta().size() > 0 ? current_grid.numberOfNodes() : 0)
-    , cache_domain_geometry_(previous_level.levelCache().cacheDomainGeometry())
-    , arr_("arr", previous_level.levelCache().arr().size() > 0 ? current_grid.numberOfNodes() : 0)
-    , att_("att", previous_level.levelCache().att().size() > 0 ? current_grid.numberOfNodes() : 0)
-    , art_("art", previous_level.levelCache().art().size() > 0 ? current_grid.numberOfNodes() : 0)
-    , detDF_("detDF", previous_level.levelCache().detDF().size() > 0 ? current_grid.numberOfNodes() : 0)
+// A level only caches values which the previous level caches as well, see GMGPolar::memoryLean().
+void LevelCache::injectCachedValues(const Level& previous_level, const PolarGrid& current_grid)
 {
     const auto& previous_level_cache = previous_level.levelCache();
 
-    for (int i_theta = 0; i_theta < current_grid.ntheta(); i_theta++) {
-        const double theta  = current_grid.theta(i_theta);
-        sin_theta_(i_theta) = previous_level_cache.sin_theta()[2 * i_theta];
-        cos_theta_(i_theta) = previous_level_cache.cos_theta()[2 * i_theta];
+    if (radial_profiles_) {
+        for (int i_r = 0; i_r < current_grid.nr(); i_r++) {
+            coeff_beta_[i_r] = previous_level_cache.coeff_beta()[2 * i_r];
+            arr_[i_r]        = previous_level_cache.arr()[2 * i_r];
+            att_[i_r]        = previous_level_cache.att()[2 * i_r];
+            art_[i_r]        = previous_level_cache.art()[2 * i_r];
+            detDF_[i_r]      = previous_level_cache.detDF()[2 * i_r];
+        }
+        return;
     }
 
-    if (previous_level_cache.cacheDensityProfileCoefficients()) {
+    if (cache_density_profile_coefficients_) {
 #pragma omp parallel for
         for (int i_r = 0; i_r < current_grid.nr(); i_r++) {
             for (int i_theta = 0; i_theta < current_grid.ntheta(); i_theta++) {
                 const int current_index  = current_grid.index(i_r, i_theta);
                 const int previous_index = previous_level.grid().index(2 * i_r, 2 * i_theta);
 
-                if (!previous_level_cache.cacheDomainGeometry()) {
+                if (!cache_domain_geometry_) {
                     coeff_alpha_[current_index] = previous_level_cache.coeff_alpha()[previous_index];
                 }
                 coeff_beta_[current_index] = previous_level_cache.coeff_beta()[previous_index];
@@ -129,7 +235,7 @@ LevelCache::LevelCache(const Level& previous_level, const PolarGrid& current_gri
         }
     }
 
-    if (previous_level_cache.cacheDomainGeometry()) {
+    if (cache_domain_geometry_) {
 #pragma omp parallel for
         for (int i_r = 0; i_r < current_grid.numberSmootherCircles(); i_r++) {
             for (int i_theta = 0; i_theta < current_grid.ntheta(); i_theta++) {
@@ -157,7 +263,7 @@ LevelCache::LevelCache(const Level& previous_level, const PolarGrid& current_gri
 
 const DensityProfileCoefficients& LevelCache::densityProfileCoefficients() const
 {
-    return density_profile_coefficients_;
+    return *density_profile_coefficients_;
 }
 const DomainGeometry& LevelCache::domainGeometry() const
 {
@@ -206,3 +312,120 @@ ConstVector<double> LevelCache::detDF() const
 {
     return detDF_;
 }
+
+bool LevelCache::radialProfiles() const
+{
+    return radial_profiles_;
+}
+
+LevelCacheLine::LevelCacheLine(const LevelCache& level_cache, const bool circle, const int i_r_start,
+                               const int count)
+    : level_cache_(level_cache)
+    , sin_theta_(level_cache.sin_theta().data())
+    , cos_theta_(level_cache.cos_theta().data())
+    , circle_(circle)
+    , i_r_start_(i_r_start)
+    , count_(level_cache.radialProfiles() ||
+                     (level_cache.cacheDomainGeometry() && level_cache.cacheDensityProfileCoefficients())
+                 ? 0
+                 : count)
+    , values_(6 * count_)
+{
+}
+
+LevelCacheLine LevelCacheLine::circle(const LevelCache& level_cache, const PolarGrid& grid, const int i_r)
+{
+    LevelCacheLine line(level_cache, true, i_r, grid.ntheta());
+    if (line.count_ == 0)
+        return line;
+
+    const int n          = line.count_;
+    const double r       = grid.radius(i_r);
+    const bool cache_geo = level_cache.cacheDomainGeometry();
+    double* coeff_beta   = line.values_.data();
+    double* coeff_alpha  = line.values_.data() + 5 * n;
+
+    // Not contiguous, the smoothers also use the first circle of the radial section.
+    if (level_cache.cacheDensityProfileCoefficients()) {
+        const ConstVector<double> cached_beta  = level_cache.coeff_beta();
+        const ConstVector<double> cached_alpha = level_cache.coeff_alpha();
+        for (int i_theta = 0; i_theta < n; i_theta++) {
+            const int index      = grid.index(i_r, i_theta);
+            coeff_beta[i_theta]  = cached_beta[index];
+            coeff_alpha[i_theta] = cached_alpha[index];
+        }
+    }
+    else {
+        level_cache.densityProfileCoefficients().evaluateCircle(r, n, grid.angles().data(),
+                                                                cache_geo ? nullptr : coeff_alpha, coeff_beta);
+    }
+
+    if (cache_geo) {
+        const ConstVector<double> cached_arr   = level_cache.arr();
+        const ConstVector<double> cached_att   = level_cache.att();
+        const ConstVector<double> cached_art   = level_cache.art();
+        const ConstVector<double> cached_detDF = level_cache.detDF();
+        for (int i_theta = 0; i_theta < n; i_theta++) {
+            const int index             = grid.index(i_r, i_theta);
+            coeff_beta[n + i_theta]     = cached_arr[index];
+            coeff_beta[2 * n + i_theta] = cached_att[index];
+            coeff_beta[3 * n + i_theta] = cached_art[index];
+            coeff_beta[4 * n + i_theta] = cached_detDF[index];
+        }
+    }
+    else {
+        compute_jacobian_elements_circle(level_cache.domainGeometry(), r, n, grid.angles().data(), line.sin_theta_,
+                                         line.cos_theta_, coeff_alpha, coeff_beta + n, coeff_beta + 2 * n,
+                                         coeff_beta + 3 * n, coeff_beta + 4 * n);
+    }
+    return line;
+}
+
+LevelCacheLine LevelCacheLine::radialLine(const LevelCache& level_cache, const PolarGrid& grid, const int i_theta,
+                                          const int i_r_start)
+{
+    LevelCacheLine line(level_cache, false, i_r_start, grid.nr() - i_r_start);
+    if (line.count_ == 0)
+        return line;
+
+    const int n          = line.count_;
+    const double theta   = grid.theta(i_theta);
+    const double* r      = grid.radii().data() + i_r_start;
+    const bool cache_geo = level_cache.cacheDomainGeometry();
+    double* coeff_beta   = line.values_.data();
+    double* coeff_alpha  = line.values_.data() + 5 * n;
+    if (level_cache.cacheDensityProfileCoefficients()) {
+        // Not contiguous, the line may start on the last circle.
+        const ConstVector<double> cached_beta  = level_cache.coeff_beta();
+        const ConstVector<double> cached_alpha = level_cache.coeff_alpha();
+        for (int k = 0; k < n; k++) {
+            const int index = grid.index(i_r_start + k, i_theta);
+            coeff_beta[k]   = cached_beta[index];
+            coeff_alpha[k]  = cached_alpha[index];
+        }
+    }
+    else {
+        level_cache.densityProfileCoefficients().evaluateRadialLine(n, r, theta, cache_geo ? nullptr : coeff_alpha,
+                                                                    coeff_beta);
+    }
+
+    if (cache_geo) {
+        const ConstVector<double> cached_arr   = level_cache.arr();
+        const ConstVector<double> cached_att   = level_cache.att();
+        const ConstVector<double> cached_art   = level_cache.art();
+        const ConstVector<double> cached_detDF = level_cache.detDF();
+        for (int k = 0; k < n; k++) {
+            const int index       = grid.index(i_r_start + k, i_theta);
+            coeff_beta[n + k]     = cached_arr[index];
+            coeff_beta[2 * n + k] = cached_att[index];
+            coeff_beta[3 * n + k] = cached_art[index];
+            coeff_beta[4 * n + k] = cached_detDF[index];
+        }
+    }
+    else {
+        compute_jacobian_elements_radial_line(level_cache.domainGeometry(), n, r, theta, line.sin_theta_[i_theta],
+                                              line.cos_theta_[i_theta], coeff_alpha, coeff_beta + n,
+                                              coeff_beta + 2 * n, coeff_beta + 3 * n, coeff_beta + 4 * n);
+    }
+    return line;
+}
@@ -0,0 +1,50 @@
+#include "../../../include/Residual/ResidualAssembled/residualAssembled.h"
+
+ResidualAssembled::ResidualAssembled(const PolarGrid& grid, const LevelCache& level_cache,
+                                     const DomainGeometry& domain_geometry,
+                                     const DensityProfileCoefficients& density_profile_coefficients,
+                                     const bool DirBC_Interior, const int num_omp_threads,
+                                     const AssembledStencil& stencil)
+    : Residual(grid, level_cache, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads)
+    , stencil_(stencil)
+{
+}
+
+/* ------------------ */
+/* result = rhs - A*x */
+
+void ResidualAssembled::applyNode(const int i_r, const int i_theta, Vector<double> result, ConstVector<double> rhs,
+                                  ConstVector<double> x) const
+{
+    const int index = grid_.index(i_r, i_theta);
+    if (stencil_.isDirichletRow(i_r)) {
+        result[index] = rhs[index] - x[index];
+    }
+    else if (i_r == 0) {
+        /* Across-origin discretization: 7-point stencil without the diagonal couplings to the left. */
+        constexpr unsigned positions = ALL_STENCIL_POSITIONS & ~stencilPositions({StencilPosition::BottomLeft,
+                                                                                   StencilPosition::TopLeft});
+        result[index] = rhs[index] - stencil_.apply<positions>(i_r, i_theta, x);
+    }
+    else {
+        result[index] = rhs[index] - stencil_.apply<ALL_STENCIL_POSITIONS>(i_r, i_theta, x);
+    }
+}
+
+void ResidualAssembled::computeResidual(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x) const
+{
+    assert(result.size() == x.size());
+
+    /* Circle Section */
+    parallelFor(0, grid_.numberSmootherCircles(), num_omp_threads_, [&](int i_r) {
+        for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta++) {
+            applyNode(i_r, i_theta, result, rhs, x);
+        }
+    });
+    /* Radial Section */
+    parallelFor(0, grid_.ntheta(), num_omp_threads_, [&](int i_theta) {
+        for (int i_r = grid_.numberSmootherCircles(); i_r < grid_.nr(); i_r++) {
+            applyNode(i_r, i_theta, result, rhs, x);
+        }
+    });
+}
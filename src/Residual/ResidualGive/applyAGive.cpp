@@ -245,15 +245,15 @@
 
 void ResidualGive::applyCircleSection(const int i_r, Vector<double> result, ConstVector<double> x) const
 {
-    const double r = grid_.radius(i_r);
+    const double r            = grid_.radius(i_r);
+    const LevelCacheLine line = LevelCacheLine::circle(level_cache_, grid_, i_r);
     for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta++) {
         const int global_index = grid_.index(i_r, i_theta);
         const double theta     = grid_.theta(i_theta);
 
         double sin_theta, cos_theta;
         double coeff_beta, arr, att, art, detDF;
-        level_cache_.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art,
-                                  detDF);
+        line.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
 
         NODE_APPLY_A_GIVE(i_r, i_theta, r, theta, sin_theta, cos_theta, grid_, DirBC_Interior_, result, x, arr, att,
                           art, detDF, coeff_beta);
@@ -262,15 +262,15 @@ void ResidualGive::applyCircleSection(const int i_r, Vector<double> result, Cons
 
 void ResidualGive::applyRadialSection(const int i_theta, Vector<double> result, ConstVector<double> x) const
 {
-    const double theta = grid_.theta(i_theta);
+    const double theta        = grid_.theta(i_theta);
+    const LevelCacheLine line = LevelCacheLine::radialLine(level_cache_, grid_, i_theta, grid_.numberSmootherCircles());
     for (int i_r = grid_.numberSmootherCircles(); i_r < grid_.nr(); i_r++) {
         const int global_index = grid_.index(i_r, i_theta);
         const double r         = grid_.radius(i_r);
 
         double sin_theta, cos_theta;
         double coeff_beta, arr, att, art, detDF;
-        level_cache_.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art,
-                                  detDF);
+        line.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
 
         NODE_APPLY_A_GIVE(i_r, i_theta, r, theta, sin_theta, cos_theta, grid_, DirBC_Interior_, result, x, arr, att,
                           art, detDF, coeff_beta);
@@ -11,7 +11,6 @@ ResidualGive::ResidualGive(const PolarGrid& grid, const LevelCache& level_cache,
 /* ------------------ */
 /* result = rhs - A*x */
 
-// clang-format off
 void ResidualGive::computeResidual(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x) const
 {
     assert(result.size() == x.size());
@@ -29,75 +28,52 @@ void ResidualGive::computeResidual(Vector<double> result, ConstVector<double> rh
     }
     else {
         /* Multi-threaded execution */
+        /* The lines give their stencil to the neighboring lines, so lines of the same section are at least */
+        /* three lines apart. The circle sections 0, 1 and 2 are the colors 0, 1 and 2, */
+        /* the radial sections 0, 1 and 2 the colors 3, 4 and 5. */
         const int num_circle_tasks        = grid_.numberSmootherCircles();
         const int additional_radial_tasks = grid_.ntheta() % 3;
         const int num_radial_tasks        = grid_.ntheta() - additional_radial_tasks;
 
-        #pragma omp parallel num_threads(num_omp_threads_)
-        {
-            /* Circle Section 0 */
-            #pragma omp for
-            for (int circle_task = 0; circle_task < num_circle_tasks; circle_task += 3) {
-                int i_r = grid_.numberSmootherCircles() - circle_task - 1;
-                applyCircleSection(i_r, result, x);
-            }
-            /* Circle Section 1 */
-            #pragma omp for
-            for (int circle_task = 1; circle_task < num_circle_tasks; circle_task += 3) {
-                int i_r = grid_.numberSmootherCircles() - circle_task - 1;
-                applyCircleSection(i_r, result, x);
-            }
-            /* Circle Section 2 */
-            #pragma omp for nowait
-            for (int circle_task = 2; circle_task < num_circle_tasks; circle_task += 3) {
-                int i_r = grid_.numberSmootherCircles() - circle_task - 1;
+        std::vector<int> num_section_tasks;
+        for (int section = 0; section < 3; section++) {
+            num_section_tasks.push_back(std::max(0, (num_circle_tasks - section + 2) / 3));
+        }
+        for (int section = 0; section < 3; section++) {
+            num_section_tasks.push_back(std::max(0, (num_radial_tasks - section + 2) / 3));
+        }
+
+        parallelForColors(num_section_tasks, num_omp_threads_, [&](const int color, const int task) {
+            if (color < 3) {
+                const int circle_task = color + 3 * task;
+                const int i_r         = grid_.numberSmootherCircles() - circle_task - 1;
                 applyCircleSection(i_r, result, x);
+                return;
             }
-
-            /* Radial Section 0 */
-            #pragma omp for
-            for (int radial_task = 0; radial_task < num_radial_tasks; radial_task += 3) {
-                if (radial_task > 0) {
-                    int i_theta = radial_task + additional_radial_tasks;
-                    applyRadialSection(i_theta, result, x);
-                }
-                else {
-                    if (additional_radial_tasks == 0) {
-                        applyRadialSection(0, result, x);
-                    }
-                    else if (additional_radial_tasks >= 1) {
-                        applyRadialSection(0, result, x);
-                        applyRadialSection(1, result, x);
-                    }
+            /* The first two tasks take the additional lines if ntheta isn't divisible by 3. */
+            const int radial_task = (color - 3) + 3 * task;
+            if (radial_task == 0) {
+                applyRadialSection(0, result, x);
+                if (additional_radial_tasks >= 1) {
+                    applyRadialSection(1, result, x);
                 }
             }
-            /* Radial Section 1 */
-            #pragma omp for
-            for (int radial_task = 1; radial_task < num_radial_tasks; radial_task += 3) {
-                if (radial_task > 1) {
-                    int i_theta = radial_task + additional_radial_tasks;
-                    applyRadialSection(i_theta, result, x);
+            else if (radial_task == 1) {
+                if (additional_radial_tasks == 0) {
+                    applyRadialSection(1, result, x);
                 }
-                else {
-                    if (additional_radial_tasks == 0) {
-                        applyRadialSection(1, result, x);
-                    }
-                    else if (additional_radial_tasks == 1) {
-                        applyRadialSection(2, result, x);
-                    }
-                    else if (additional_radial_tasks == 2) {
-                        applyRadialSection(2, result, x);
-                        applyRadialSection(3, result, x);
-                    }
+                else if (additional_radial_tasks == 1) {
+                    applyRadialSection(2, result, x);
+                }
+                else if (additional_radial_tasks == 2) {
+                    applyRadialSection(2, result, x);
+                    applyRadialSection(3, result, x);
                 }
             }
-            /* Radial Section 2 */
-            #pragma omp for
-            for (int radial_task = 2; radial_task < num_radial_tasks; radial_task += 3) {
-                int i_theta = radial_task + additional_radial_tasks;
+            else {
+                const int i_theta = radial_task + additional_radial_tasks;
                 applyRadialSection(i_theta, result, x);
             }
-        }
+        });
     }
 }
-// clang-format on
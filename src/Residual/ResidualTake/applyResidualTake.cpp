@@ -1,4 +1,5 @@
 #include "../../../include/Residual/ResidualTake/residualTake.h"
+#include "../../../include/Interpolation/restriction_stencil.h"
 
 #define NODE_APPLY_RESIDUAL_TAKE(i_r, i_theta, grid, DirBC_Interior, result, rhs, x, arr, att, art, detDF, coeff_beta)                  \
     do {                                                                                                                                \
@@ -124,12 +125,81 @@ void ResidualTake::applyCircleSection(const int i_r, Vector<double> result, Cons
     const auto& detDF      = level_cache_.detDF();
     const auto& coeff_beta = level_cache_.coeff_beta();
 
+    if (0 < i_r && i_r < grid_.numberSmootherCircles() - 1) {
+        /* Peel the periodic wrap at theta = 0 and theta = 2pi off the vectorized row. */
+        const int last_i_theta = grid_.ntheta() - 1;
+        NODE_APPLY_RESIDUAL_TAKE(i_r, 0, grid_, DirBC_Interior_, result, rhs, x, arr, att, art, detDF, coeff_beta);
+        applyInteriorCircleRow(i_r, result.data() + grid_.index(i_r, 0), rhs, x);
+        NODE_APPLY_RESIDUAL_TAKE(i_r, last_i_theta, grid_, DirBC_Interior_, result, rhs, x, arr, att, art, detDF,
+                                 coeff_beta);
+        return;
+    }
+
     for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta++) {
         NODE_APPLY_RESIDUAL_TAKE(i_r, i_theta, grid_, DirBC_Interior_, result, rhs, x, arr, att, art, detDF,
                                  coeff_beta);
     }
 }
 
+/* Interior nodes 1 <= i_theta < ntheta() - 1 of a circle 0 < i_r < numberSmootherCircles() - 1. */
+/* All neighbors lie on the circles i_r - 1, i_r and i_r + 1, which are stored one after another, so the */
+/* stencil of NODE_APPLY_RESIDUAL_TAKE reduces to unit-stride loads without index wrapping or branches. */
+/* row[i_theta] receives the residual of the node (i_r, i_theta). */
+template <typename X>
+void ResidualTake::applyInteriorCircleRow(const int i_r, double* row, ConstVector<X> rhs, ConstVector<X> x,
+                                          const LineLanes& lanes) const
+{
+    assert(0 < i_r && i_r < grid_.numberSmootherCircles() - 1);
+
+    const int ntheta = grid_.ntheta();
+    const int start  = grid_.index(i_r, 0);
+
+    const double h1 = grid_.radialSpacing(i_r - 1);
+    const double h2 = grid_.radialSpacing(i_r);
+    const double* k = &grid_.angularSpacing(0);
+
+    const X* x_center        = x.data() + start;
+    const X* x_left          = x_center - ntheta;
+    const X* x_right         = x_center + ntheta;
+    const double* arr_center = level_cache_.arr().data() + start;
+    const double* arr_left   = arr_center - ntheta;
+    const double* arr_right  = arr_center + ntheta;
+    const double* att_center = level_cache_.att().data() + start;
+    const double* art_center = level_cache_.art().data() + start;
+    const double* art_left   = art_center - ntheta;
+    const double* art_right  = art_center + ntheta;
+    const double* detDF      = level_cache_.detDF().data() + start;
+    const double* coeff_beta = level_cache_.coeff_beta().data() + start;
+    const X* rhs_center      = rhs.data() + start;
+
+    lanes.vectorFor(1, ntheta - 1, [&](const int i_theta) {
+        const double k1 = k[i_theta - 1];
+        const double k2 = k[i_theta];
+
+        const double coeff1 = 0.5 * (k1 + k2) / h1;
+        const double coeff2 = 0.5 * (k1 + k2) / h2;
+        const double coeff3 = 0.5 * (h1 + h2) / k1;
+        const double coeff4 = 0.5 * (h1 + h2) / k2;
+
+        const double x_c = x_center[i_theta];
+
+        row[i_theta] =
+            rhs_center[i_theta] -
+            (0.25 * (h1 + h2) * (k1 + k2) * coeff_beta[i_theta] * std::fabs(detDF[i_theta]) * x_c /* beta_{i,j} */
+
+             - coeff1 * (arr_center[i_theta] + arr_left[i_theta]) * (x_left[i_theta] - x_c) /* Left */
+             - coeff2 * (arr_center[i_theta] + arr_right[i_theta]) * (x_right[i_theta] - x_c) /* Right */
+             - coeff3 * (att_center[i_theta] + att_center[i_theta - 1]) * (x_center[i_theta - 1] - x_c) /* Bottom */
+             - coeff4 * (att_center[i_theta] + att_center[i_theta + 1]) * (x_center[i_theta + 1] - x_c) /* Top */
+
+             - 0.25 * (art_left[i_theta] + art_center[i_theta - 1]) * x_left[i_theta - 1] /* Bottom Left */
+             + 0.25 * (art_right[i_theta] + art_center[i_theta - 1]) * x_right[i_theta - 1] /* Bottom Right */
+             + 0.25 * (art_left[i_theta] + art_center[i_theta + 1]) * x_left[i_theta + 1] /* Top Left */
+             - 0.25 * (art_right[i_theta] + art_center[i_theta + 1]) * x_right[i_theta + 1] /* Top Right */
+            );
+    });
+}
+
 void ResidualTake::applyRadialSection(const int i_theta, Vector<double> result, ConstVector<double> rhs,
                                       ConstVector<double> x) const
 {
@@ -146,4 +216,241 @@ void ResidualTake::applyRadialSection(const int i_theta, Vector<double> result,
         NODE_APPLY_RESIDUAL_TAKE(i_r, i_theta, grid_, DirBC_Interior_, result, rhs, x, arr, att, art, detDF,
                                  coeff_beta);
     }
-}
\ No newline at end of file
+}
+
+/* NODE_APPLY_RESIDUAL_TAKE for the columns of a batch, which are stored one after another. */
+/* The stencil weights of the node are evaluated once and applied to every column. The terms are */
+/* summed in the order of NODE_APPLY_RESIDUAL_TAKE, so every column matches computeResidual exactly. */
+void ResidualTake::applyBatchNode(const int i_r, const int i_theta, double* result, const double* rhs,
+                                  const double* x, const int number_of_columns) const
+{
+    const std::size_t n = grid_.numberOfNodes();
+    const int center    = grid_.index(i_r, i_theta);
+
+    /* Dirichlet boundary nodes */
+    if (i_r == grid_.nr() - 1 || (i_r == 0 && DirBC_Interior_)) {
+        for (int column = 0; column < number_of_columns; column++) {
+            const std::size_t offset = column * n;
+            result[offset + center]  = rhs[offset + center] - x[offset + center];
+        }
+        return;
+    }
+
+    const auto& arr        = level_cache_.arr();
+    const auto& att        = level_cache_.att();
+    const auto& art        = level_cache_.art();
+    const auto& detDF      = level_cache_.detDF();
+    const auto& coeff_beta = level_cache_.coeff_beta();
+
+    /* Across the origin, h1 is replaced with 2 * R0 and (i_r-1,i_theta) with (i_r, i_theta + (grid.ntheta()/2)). */
+    const bool across_origin = i_r == 0;
+
+    const double h1 = across_origin ? 2.0 * grid_.radius(0) : grid_.radialSpacing(i_r - 1);
+    const double h2 = grid_.radialSpacing(i_r);
+    const double k1 = grid_.angularSpacing(i_theta - 1);
+    const double k2 = grid_.angularSpacing(i_theta);
+
+    const double coeff1 = 0.5 * (k1 + k2) / h1;
+    const double coeff2 = 0.5 * (k1 + k2) / h2;
+    const double coeff3 = 0.5 * (h1 + h2) / k1;
+    const double coeff4 = 0.5 * (h1 + h2) / k2;
+
+    const int i_theta_M1 = grid_.wrapThetaIndex(i_theta - 1);
+    const int i_theta_P1 = grid_.wrapThetaIndex(i_theta + 1);
+
+    const int left   = across_origin ? grid_.index(i_r, grid_.wrapThetaIndex(i_theta + grid_.ntheta() / 2))
+                                     : grid_.index(i_r - 1, i_theta);
+    const int bottom = grid_.index(i_r, i_theta_M1);
+    const int top    = grid_.index(i_r, i_theta_P1);
+    const int right  = grid_.index(i_r + 1, i_theta);
+    /* Not part of the artificial 7-point stencil across the origin. */
+    const int bottom_left  = across_origin ? center : grid_.index(i_r - 1, i_theta_M1);
+    const int top_left     = across_origin ? center : grid_.index(i_r - 1, i_theta_P1);
+    const int bottom_right = grid_.index(i_r + 1, i_theta_M1);
+    const int top_right    = grid_.index(i_r + 1, i_theta_P1);
+
+    const double w_center       = 0.25 * (h1 + h2) * (k1 + k2) * coeff_beta[center] * fabs(detDF[center]);
+    const double w_left         = coeff1 * (arr[center] + arr[left]);
+    const double w_right        = coeff2 * (arr[center] + arr[right]);
+    const double w_bottom       = coeff3 * (att[center] + att[bottom]);
+    const double w_top          = coeff4 * (att[center] + att[top]);
+    const double w_bottom_left  = 0.25 * (art[left] + art[bottom]);
+    const double w_bottom_right = 0.25 * (art[right] + art[bottom]);
+    const double w_top_left     = 0.25 * (art[left] + art[top]);
+    const double w_top_right    = 0.25 * (art[right] + art[top]);
+
+    for (int column = 0; column < number_of_columns; column++) {
+        const double* x_column = x + column * n;
+        const double x_c       = x_column[center];
+
+        double stencil = w_center * x_c /* beta_{i,j} */
+
+                         - w_left * (x_column[left] - x_c) /* Left - Center: (Left) */
+                         - w_right * (x_column[right] - x_c) /* Right - Center: (Right) */
+                         - w_bottom * (x_column[bottom] - x_c) /* Bottom - Center: (Bottom) */
+                         - w_top * (x_column[top] - x_c); /* Top - Center: (Top) */
+        if (across_origin) {
+            stencil = stencil + w_bottom_right * x_column[bottom_right] /* Bottom Right */
+                      - w_top_right * x_column[top_right]; /* Top Right */
+        }
+        else {
+            stencil = stencil - w_bottom_left * x_column[bottom_left] /* Bottom Left */
+                      + w_bottom_right * x_column[bottom_right] /* Bottom Right */
+                      + w_top_left * x_column[top_left] /* Top Left */
+                      - w_top_right * x_column[top_right]; /* Top Right */
+        }
+        result[column * n + center] = rhs[column * n + center] - stencil;
+    }
+}
+/* ------------------------------------------------- */
+/* result = R * (rhs - A*x), R the restriction to coarse_grid */
+
+namespace
+{
+// Receives the value the residual stencil assigns to result[center].
+struct NodeResidual {
+    double& value;
+    double& operator[](int) const
+    {
+        return value;
+    }
+};
+} // namespace
+
+template <typename R, typename X>
+void ResidualTake::restrictedResidual(const PolarGrid& coarse_grid, Vector<R> result, ConstVector<X> rhs,
+                                      ConstVector<X> x, const bool extrapolated) const
+{
+    assert(rhs.size() == x.size() && x.size() == grid_.numberOfNodes());
+    assert(result.size() == coarse_grid.numberOfNodes());
+    assert(grid_.nr() == 2 * coarse_grid.nr() - 1 && grid_.ntheta() == 2 * coarse_grid.ntheta());
+
+    assert(level_cache_.cacheDensityProfileCoefficients());
+    assert(level_cache_.cacheDomainGeometry());
+
+    const auto& arr        = level_cache_.arr();
+    const auto& att        = level_cache_.att();
+    const auto& art        = level_cache_.art();
+    const auto& detDF      = level_cache_.detDF();
+    const auto& coeff_beta = level_cache_.coeff_beta();
+
+    const int coarseNumberSmootherCircles = coarse_grid.numberSmootherCircles();
+    /* The radial section also needs the fine circle between the coarse circle and radial sections. */
+    const int radial_start_i_r = 2 * coarseNumberSmootherCircles - 1;
+    const int radial_length    = grid_.nr() - radial_start_i_r;
+
+    auto computeNode = [&](const int i_r, const int i_theta, double& value) {
+        const NodeResidual node_result{value};
+        NODE_APPLY_RESIDUAL_TAKE(i_r, i_theta, grid_, DirBC_Interior_, node_result, rhs, x, arr, att, art, detDF,
+                                 coeff_beta);
+    };
+    auto restrictCoarseNode = [&](const int i_r_coarse, const int i_theta_coarse, const auto& fine) {
+        return extrapolated ? extrapolatedRestrictNode(grid_, coarse_grid, i_r_coarse, i_theta_coarse, fine)
+                            : restrictNode(grid_, coarse_grid, i_r_coarse, i_theta_coarse, fine);
+    };
+
+    /* Every task restricts a contiguous chunk of coarse circles/radial lines and keeps the fine residuals of the */
+    /* three fine circles/radial lines around its current coarse line in its scratch. Consecutive coarse lines */
+    /* share one fine line, which is moved instead of recomputed. The circle and radial chunks write different */
+    /* coarse nodes, so they are one parallel loop. */
+    const int ntheta     = grid_.ntheta();
+    const auto numChunks = [this](const int count) {
+        return std::max(1, std::min(num_omp_threads_, count));
+    };
+
+    /* Circle Section */
+    const int num_circle_chunks    = numChunks(coarseNumberSmootherCircles);
+    const auto restrictCircleChunk = [&](const int chunk, double* scratch, const LineLanes& lanes) {
+        double* circles[3]    = {scratch, scratch + ntheta, scratch + 2 * ntheta};
+        const int chunk_begin = coarseNumberSmootherCircles * chunk / num_circle_chunks;
+        const int chunk_end   = coarseNumberSmootherCircles * (chunk + 1) / num_circle_chunks;
+        for (int i_r_coarse = chunk_begin; i_r_coarse < chunk_end; i_r_coarse++) {
+            const int first_i_r = 2 * i_r_coarse - 1;
+            const bool reuse    = i_r_coarse > chunk_begin;
+            if (reuse)
+                std::swap(circles[0], circles[2]);
+            for (int slot = reuse ? 1 : 0; slot < 3; slot++) {
+                const int i_r = first_i_r + slot;
+                if (i_r < 0 || i_r >= grid_.nr())
+                    continue;
+                if (0 < i_r && i_r < grid_.numberSmootherCircles() - 1) {
+                    const int last_i_theta = ntheta - 1;
+                    computeNode(i_r, 0, circles[slot][0]);
+                    applyInteriorCircleRow(i_r, circles[slot], rhs, x, lanes);
+                    computeNode(i_r, last_i_theta, circles[slot][last_i_theta]);
+                    continue;
+                }
+                for (int i_theta = 0; i_theta < ntheta; i_theta++) {
+                    computeNode(i_r, i_theta, circles[slot][i_theta]);
+                }
+            }
+
+            const auto fine = [&circles, first_i_r](int i_r, int i_theta) {
+                return circles[i_r - first_i_r][i_theta];
+            };
+            for (int i_theta_coarse = 0; i_theta_coarse < coarse_grid.ntheta(); i_theta_coarse++) {
+                result[coarse_grid.index(i_r_coarse, i_theta_coarse)] =
+                    restrictCoarseNode(i_r_coarse, i_theta_coarse, fine);
+            }
+        }
+    };
+
+    /* Radial Section */
+    const int num_radial_chunks    = numChunks(coarse_grid.ntheta());
+    const auto restrictRadialChunk = [&](const int chunk, double* scratch) {
+        double* lines[3]      = {scratch, scratch + radial_length, scratch + 2 * radial_length};
+        const int chunk_begin = coarse_grid.ntheta() * chunk / num_radial_chunks;
+        const int chunk_end   = coarse_grid.ntheta() * (chunk + 1) / num_radial_chunks;
+        for (int i_theta_coarse = chunk_begin; i_theta_coarse < chunk_end; i_theta_coarse++) {
+            const int i_theta    = 2 * i_theta_coarse;
+            const int i_theta_P1 = grid_.wrapThetaIndex(i_theta + 1);
+            const bool reuse     = i_theta_coarse > chunk_begin;
+            if (reuse)
+                std::swap(lines[0], lines[2]);
+            for (int slot = reuse ? 1 : 0; slot < 3; slot++) {
+                const int line_i_theta = grid_.wrapThetaIndex(i_theta - 1 + slot);
+                for (int i_r = radial_start_i_r; i_r < grid_.nr(); i_r++) {
+                    computeNode(i_r, line_i_theta, lines[slot][i_r - radial_start_i_r]);
+                }
+            }
+
+            const auto fine = [&lines, i_theta, i_theta_P1, radial_start_i_r](int i_r, int line_i_theta) {
+                const int slot = line_i_theta == i_theta ? 1 : (line_i_theta == i_theta_P1 ? 2 : 0);
+                return lines[slot][i_r - radial_start_i_r];
+            };
+            for (int i_r_coarse = coarseNumberSmootherCircles; i_r_coarse < coarse_grid.nr(); i_r_coarse++) {
+                result[coarse_grid.index(i_r_coarse, i_theta_coarse)] =
+                    restrictCoarseNode(i_r_coarse, i_theta_coarse, fine);
+            }
+        }
+    };
+
+    const std::size_t scratch_size = 3 * static_cast<std::size_t>(std::max(ntheta, radial_length));
+    parallelForColorsWithScratch<double>(
+        {num_circle_chunks + num_radial_chunks}, num_omp_threads_, scratch_size,
+        [&](const int, const int task, double* scratch, const LineLanes& lanes) {
+            if (task < num_circle_chunks)
+                restrictCircleChunk(task, scratch, lanes);
+            else
+                restrictRadialChunk(task - num_circle_chunks, scratch);
+        });
+}
+
+void ResidualTake::computeRestrictedResidual(const PolarGrid& coarse_grid, Vector<double> result,
+                                             ConstVector<double> rhs, ConstVector<double> x,
+                                             const bool extrapolated) const
+{
+    restrictedResidual(coarse_grid, result, rhs, x, extrapolated);
+}
+
+void ResidualTake::computeRestrictedResidualSinglePrecision(const PolarGrid& coarse_grid, Vector<float> result,
+                                                            ConstVector<double> rhs, ConstVector<double> x) const
+{
+    restrictedResidual(coarse_grid, result, rhs, x, false);
+}
+
+void ResidualTake::computeRestrictedResidualSinglePrecision(const PolarGrid& coarse_grid, Vector<float> result,
+                                                            ConstVector<float> rhs, ConstVector<float> x) const
+{
+    restrictedResidual(coarse_grid, result, rhs, x, false);
+}
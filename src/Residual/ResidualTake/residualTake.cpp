@@ -18,30 +18,41 @@ void ResidualTake::computeResidual(Vector<double> result, ConstVector<double> rh
     assert(level_cache_.cacheDensityProfileCoefficients());
     assert(level_cache_.cacheDomainGeometry());
 
-    if (num_omp_threads_ == 1) {
-        /* Single-threaded execution */
-        for (int i_r = 0; i_r < grid_.numberSmootherCircles(); i_r++) {
-            applyCircleSection(i_r, result, rhs, x);
-        }
+    /* Circle Section */
+    parallelFor(0, grid_.numberSmootherCircles(), num_omp_threads_, [&](int i_r) {
+        applyCircleSection(i_r, result, rhs, x);
+    });
+    /* Radial Section */
+    parallelFor(0, grid_.ntheta(), num_omp_threads_, [&](int i_theta) {
+        applyRadialSection(i_theta, result, rhs, x);
+    });
+}
+// clang-format on
+
+/* ------------------------------------------------------------------- */
+/* result = rhs - A*x for the columns of a batch, see applyBatchNode */
+
+// clang-format off
+void ResidualTake::computeResidualBatch(Vector<double> result, ConstVector<double> rhs, ConstVector<double> x,
+                                        const int number_of_columns) const
+{
+    const std::size_t batch_size = static_cast<std::size_t>(number_of_columns) * grid_.numberOfNodes();
+    assert(result.size() >= batch_size && rhs.size() >= batch_size && x.size() >= batch_size);
+
+    assert(level_cache_.cacheDensityProfileCoefficients());
+    assert(level_cache_.cacheDomainGeometry());
+
+    /* Circle Section */
+    parallelFor(0, grid_.numberSmootherCircles(), num_omp_threads_, [&](int i_r) {
         for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta++) {
-            applyRadialSection(i_theta, result, rhs, x);
+            applyBatchNode(i_r, i_theta, result.data(), rhs.data(), x.data(), number_of_columns);
         }
-    }
-    else {
-        /* Multi-threaded execution */
-        #pragma omp parallel num_threads(num_omp_threads_)
-        {
-            /* Circle Section */
-            #pragma omp for nowait
-            for (int i_r = 0; i_r < grid_.numberSmootherCircles(); i_r++) {
-                applyCircleSection(i_r, result, rhs, x);
-            }
-            /* Radial Section */
-            #pragma omp for nowait
-            for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta++) {
-                applyRadialSection(i_theta, result, rhs, x);
-            }
+    });
+    /* Radial Section */
+    parallelFor(0, grid_.ntheta(), num_omp_threads_, [&](int i_theta) {
+        for (int i_r = grid_.numberSmootherCircles(); i_r < grid_.nr(); i_r++) {
+            applyBatchNode(i_r, i_theta, result.data(), rhs.data(), x.data(), number_of_columns);
         }
-    }
+    });
 }
 // clang-format on
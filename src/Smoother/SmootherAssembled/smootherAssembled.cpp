@@ -0,0 +1,76 @@
+#include "../../../include/Smoother/SmootherAssembled/smootherAssembled.h"
+
+SmootherAssembled::SmootherAssembled(const PolarGrid& grid, const LevelCache& level_cache,
+                                     const DomainGeometry& domain_geometry,
+                                     const DensityProfileCoefficients& density_profile_coefficients,
+                                     bool DirBC_Interior, int num_omp_threads, const AssembledStencil& stencil,
+                                     bool single_precision_factors, SetupReader* setup_reader)
+    : SmootherTake(grid, level_cache, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads,
+                   single_precision_factors, setup_reader)
+    , stencil_(stencil)
+{
+}
+
+namespace
+{
+using Position = StencilPosition;
+
+constexpr unsigned DIAGONAL_POSITIONS =
+    stencilPositions({Position::BottomLeft, Position::BottomRight, Position::TopLeft, Position::TopRight});
+} // namespace
+
+/* Same node cases as NODE_APPLY_ASC_ORTHO_CIRCLE_TAKE. */
+void SmootherAssembled::applyAscOrthoCircleSection(const int i_r, const SmootherColor smoother_color,
+                                                   ConstVector<double> x, ConstVector<double> rhs,
+                                                   Vector<double> temp, const LineLanes& lanes)
+{
+    assert(i_r >= 0 && i_r < grid_.numberSmootherCircles());
+
+    lanes.vectorFor(0, grid_.ntheta(), [&](const int i_theta) {
+        const int center = grid_.index(i_r, i_theta);
+        if (i_r > 0) {
+            constexpr unsigned positions = stencilPositions({Position::Left, Position::Right}) | DIAGONAL_POSITIONS;
+            temp[center]                 = rhs[center] - stencil_.apply<positions>(i_r, i_theta, x);
+        }
+        else if (DirBC_Interior_) {
+            temp[center] = rhs[center];
+        }
+        else {
+            /* Across-origin discretization: the node across the origin is part of A_sc. */
+            constexpr unsigned positions =
+                stencilPositions({Position::Right, Position::BottomRight, Position::TopRight});
+            temp[center]                 = rhs[center] - stencil_.apply<positions>(i_r, i_theta, x);
+        }
+    });
+}
+
+/* Same node cases as NODE_APPLY_ASC_ORTHO_RADIAL_TAKE. */
+void SmootherAssembled::applyAscOrthoRadialSection(const int i_theta, const SmootherColor smoother_color,
+                                                   ConstVector<double> x, ConstVector<double> rhs,
+                                                   Vector<double> temp)
+{
+    assert(i_theta >= 0 && i_theta < grid_.ntheta());
+
+    constexpr unsigned interior_positions = stencilPositions({Position::Bottom, Position::Top}) | DIAGONAL_POSITIONS;
+
+    for (int i_r = grid_.numberSmootherCircles(); i_r < grid_.nr(); i_r++) {
+        const int center = grid_.index(i_r, i_theta);
+        if (i_r > grid_.numberSmootherCircles() && i_r < grid_.nr() - 2) {
+            temp[center] = rhs[center] - stencil_.apply<interior_positions>(i_r, i_theta, x);
+        }
+        else if (i_r == grid_.numberSmootherCircles()) {
+            constexpr unsigned positions = interior_positions | stencilPositions({Position::Left});
+            temp[center]                 = rhs[center] - stencil_.apply<positions>(i_r, i_theta, x);
+        }
+        else if (i_r == grid_.nr() - 2) {
+            /* "Right" is shifted over to the rhs to keep the radial Asc smoother matrices symmetric. */
+            const int right            = grid_.index(i_r + 1, i_theta);
+            const double shifted_right = stencil_.coefficient(i_r, i_theta, Position::Right) * rhs[right];
+            const double ortho         = stencil_.apply<interior_positions>(i_r, i_theta, x);
+            temp[center]               = rhs[center] - (shifted_right + ortho);
+        }
+        else {
+            temp[center] = rhs[center];
+        }
+    }
+}
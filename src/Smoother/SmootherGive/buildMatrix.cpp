@@ -611,15 +611,15 @@
 
 void SmootherGive::buildAscCircleSection(const int i_r)
 {
-    const double r = grid_.radius(i_r);
+    const double r            = grid_.radius(i_r);
+    const LevelCacheLine line = LevelCacheLine::circle(level_cache_, grid_, i_r);
     for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta++) {
         const int global_index = grid_.index(i_r, i_theta);
         const double theta     = grid_.theta(i_theta);
 
         double sin_theta, cos_theta;
         double coeff_beta, arr, att, art, detDF;
-        level_cache_.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art,
-                                  detDF);
+        line.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
 
         // Build Asc at the current node
         NODE_BUILD_SMOOTHER_GIVE(i_r, i_theta, grid_, DirBC_Interior_, inner_boundary_circle_matrix_,
@@ -629,15 +629,15 @@ void SmootherGive::buildAscCircleSection(const int i_r)
 
 void SmootherGive::buildAscRadialSection(const int i_theta)
 {
-    const double theta = grid_.theta(i_theta);
+    const double theta        = grid_.theta(i_theta);
+    const LevelCacheLine line = LevelCacheLine::radialLine(level_cache_, grid_, i_theta, grid_.numberSmootherCircles());
     for (int i_r = grid_.numberSmootherCircles(); i_r < grid_.nr(); i_r++) {
         const int global_index = grid_.index(i_r, i_theta);
         const double r         = grid_.radius(i_r);
 
         double sin_theta, cos_theta;
         double coeff_beta, arr, att, art, detDF;
-        level_cache_.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art,
-                                  detDF);
+        line.obtainValues(i_r, i_theta, global_index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
 
         // Build Asc at the current node
         NODE_BUILD_SMOOTHER_GIVE(i_r, i_theta, grid_, DirBC_Interior_, inner_boundary_circle_matrix_,
@@ -697,6 +697,7 @@ void SmootherGive::buildAscMatrices()
 
                 solverMatrix = SymmetricTridiagonalSolver<double>(num_circle_nodes);
                 solverMatrix.is_cyclic(true);
+                solverMatrix.single_precision_factors(single_precision_factors_);
                 solverMatrix.cyclic_corner_element() = 0.0;
 
                 for (int i = 0; i < num_circle_nodes; i++) {
@@ -716,6 +717,7 @@ void SmootherGive::buildAscMatrices()
 
             solverMatrix = SymmetricTridiagonalSolver<double>(num_radial_nodes);
             solverMatrix.is_cyclic(false);
+            solverMatrix.single_precision_factors(single_precision_factors_);
 
             for (int i = 0; i < num_radial_nodes; i++) {
                 solverMatrix.main_diagonal(i) = 0.0;
@@ -102,6 +102,30 @@ void SmootherGive::initializeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMat
     }
 }
 
+void SmootherGive::refactorizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver, SparseMatrixCOO<double>& solver_matrix)
+{
+    /* The sparsity pattern is unchanged, so the analysis from 'initializeMumpsSolver' is reused */
+    /* and only the numerical factorization is repeated. */
+    for (int i = 0; i < solver_matrix.non_zero_size(); i++) {
+        solver_matrix.row_index(i) += 1;
+        solver_matrix.col_index(i) += 1;
+    }
+
+    mumps_solver.job = JOB_FACTORIZATION_PHASE;
+    assert(mumps_solver.n == solver_matrix.rows());
+    assert(mumps_solver.nz == solver_matrix.non_zero_size());
+    mumps_solver.irn = solver_matrix.row_indices_data();
+    mumps_solver.jcn = solver_matrix.column_indices_data();
+    mumps_solver.a   = solver_matrix.values_data();
+    dmumps_c(&mumps_solver);
+
+    if (mumps_solver.sym == SYM_POSITIVE_DEFINITE && mumps_solver.INFOG(12) != 0) {
+        std::cout << "Warning: Smoother inner boundary matrix is not positive definite: Negative pivots in the "
+                     "factorization phase."
+                  << std::endl;
+    }
+}
+
 void SmootherGive::finalizeMumpsSolver(DMUMPS_STRUC_C& mumps_solver)
 {
     mumps_solver.job = JOB_END;
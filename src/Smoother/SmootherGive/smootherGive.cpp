@@ -2,15 +2,97 @@
 
 SmootherGive::SmootherGive(const PolarGrid& grid, const LevelCache& level_cache, const DomainGeometry& domain_geometry,
                            const DensityProfileCoefficients& density_profile_coefficients, bool DirBC_Interior,
-                           int num_omp_threads)
+                           int num_omp_threads, bool single_precision_factors, SetupReader* setup_reader)
     : Smoother(grid, level_cache, domain_geometry, density_profile_coefficients, DirBC_Interior, num_omp_threads)
+    , single_precision_factors_(single_precision_factors)
+{
+    if (setup_reader) {
+        loadSetup(*setup_reader);
+    }
+    else {
+        buildAscMatrices();
+#ifdef GMGPOLAR_USE_MUMPS
+        initializeMumpsSolver(inner_boundary_mumps_solver_, inner_boundary_circle_matrix_);
+#else
+        inner_boundary_lu_solver_ = SparseLUSolver<double>(inner_boundary_circle_matrix_);
+#endif
+    }
+    factorizeTridiagonalSolvers();
+}
+
+void SmootherGive::refactorize()
 {
     buildAscMatrices();
 #ifdef GMGPOLAR_USE_MUMPS
-    initializeMumpsSolver(inner_boundary_mumps_solver_, inner_boundary_circle_matrix_);
+    refactorizeMumpsSolver(inner_boundary_mumps_solver_, inner_boundary_circle_matrix_);
 #else
     inner_boundary_lu_solver_ = SparseLUSolver<double>(inner_boundary_circle_matrix_);
 #endif
+    factorizeTridiagonalSolvers();
+}
+
+std::size_t SmootherGive::memoryUsage() const
+{
+    std::size_t bytes = inner_boundary_circle_matrix_.memoryUsage();
+#ifdef GMGPOLAR_USE_MUMPS
+    bytes += mumpsMemoryUsage(inner_boundary_mumps_solver_);
+#else
+    bytes += inner_boundary_lu_solver_.memoryUsage();
+#endif
+    for (const auto& solver : circle_tridiagonal_solver_)
+        bytes += solver.memoryUsage();
+    for (const auto& solver : radial_tridiagonal_solver_)
+        bytes += solver.memoryUsage();
+    return bytes;
+}
+
+// Factorizing ahead of the first smoothing keeps the smoother read-only during the solve,
+// so that several SolveContexts can share it.
+void SmootherGive::factorizeTridiagonalSolvers()
+{
+#pragma omp parallel num_threads(num_omp_threads_)
+    {
+#pragma omp for nowait
+        for (std::size_t i = 0; i < circle_tridiagonal_solver_.size(); i++) {
+            circle_tridiagonal_solver_[i].factorize();
+        }
+#pragma omp for nowait
+        for (std::size_t i = 0; i < radial_tridiagonal_solver_.size(); i++) {
+            radial_tridiagonal_solver_[i].factorize();
+        }
+    }
+}
+
+void SmootherGive::saveSetup(SetupWriter& writer)
+{
+    writer.writeTag("SMOOTHER");
+#ifdef GMGPOLAR_USE_MUMPS
+    saveMumpsSolver(writer, inner_boundary_mumps_solver_);
+#else
+    inner_boundary_lu_solver_.save(writer);
+#endif
+    writer.writeValue(circle_tridiagonal_solver_.size());
+    for (const auto& solver : circle_tridiagonal_solver_)
+        solver.save(writer);
+    writer.writeValue(radial_tridiagonal_solver_.size());
+    for (const auto& solver : radial_tridiagonal_solver_)
+        solver.save(writer);
+}
+
+void SmootherGive::loadSetup(SetupReader& reader)
+{
+    reader.readTag("SMOOTHER");
+#ifdef GMGPOLAR_USE_MUMPS
+    restoreMumpsSolver(reader, inner_boundary_mumps_solver_);
+#else
+    inner_boundary_lu_solver_.load(reader);
+#endif
+    circle_tridiagonal_solver_.resize(reader.readValue<std::size_t>());
+    for (auto& solver : circle_tridiagonal_solver_)
+        solver.load(reader);
+    radial_tridiagonal_solver_.resize(reader.readValue<std::size_t>());
+    for (auto& solver : radial_tridiagonal_solver_)
+        solver.load(reader);
 }
 
 SmootherGive::~SmootherGive()
@@ -425,6 +425,7 @@ void SmootherTake::buildAscMatrices()
                 auto& solverMatrix = circle_tridiagonal_solver_[circle_Asc_index];
                 solverMatrix       = SymmetricTridiagonalSolver<double>(num_circle_nodes);
                 solverMatrix.is_cyclic(true);
+                solverMatrix.single_precision_factors(single_precision_factors_);
             }
         }
 
@@ -435,6 +436,7 @@ void SmootherTake::buildAscMatrices()
             auto& solverMatrix = radial_tridiagonal_solver_[radial_Asc_index];
             solverMatrix       = SymmetricTridiagonalSolver<double>(num_radial_nodes);
             solverMatrix.is_cyclic(false);
+            solverMatrix.single_precision_factors(single_precision_factors_);
         }
     }
 
@@ -203,7 +203,14 @@
     } while (0)
 
 void SmootherTake::applyAscOrthoCircleSection(const int i_r, const SmootherColor smoother_color, ConstVector<double> x,
-                                              ConstVector<double> rhs, Vector<double> temp)
+                                              ConstVector<double> rhs, Vector<double> temp, const LineLanes& lanes)
+{
+    applyAscOrthoCircleTake(i_r, smoother_color, x, rhs, temp, lanes);
+}
+
+template <typename T>
+void SmootherTake::applyAscOrthoCircleTake(const int i_r, const SmootherColor smoother_color, ConstVector<T> x,
+                                           ConstVector<T> rhs, Vector<T> temp, const LineLanes& lanes)
 {
     assert(i_r >= 0 && i_r < grid_.numberSmootherCircles());
 
@@ -216,14 +223,76 @@ void SmootherTake::applyAscOrthoCircleSection(const int i_r, const SmootherColor
     const auto& detDF      = level_cache_.detDF();
     const auto& coeff_beta = level_cache_.coeff_beta();
 
+    if (0 < i_r && i_r < grid_.numberSmootherCircles() - 1) {
+        /* Peel the periodic wrap at theta = 0 and theta = 2pi off the vectorized row. */
+        const int last_i_theta = grid_.ntheta() - 1;
+        NODE_APPLY_ASC_ORTHO_CIRCLE_TAKE(i_r, 0, grid_, DirBC_Interior_, smoother_color, x, rhs, temp, arr, att, art,
+                                         detDF, coeff_beta);
+        applyAscOrthoInteriorCircleRow(i_r, x, rhs, temp, lanes);
+        NODE_APPLY_ASC_ORTHO_CIRCLE_TAKE(i_r, last_i_theta, grid_, DirBC_Interior_, smoother_color, x, rhs, temp, arr,
+                                         att, art, detDF, coeff_beta);
+        return;
+    }
+
     for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta++) {
         NODE_APPLY_ASC_ORTHO_CIRCLE_TAKE(i_r, i_theta, grid_, DirBC_Interior_, smoother_color, x, rhs, temp, arr, att,
                                          art, detDF, coeff_beta);
     }
 }
 
+/* NODE_APPLY_ASC_ORTHO_CIRCLE_TAKE for the nodes 1 <= i_theta < ntheta() - 1 of a circle */
+/* 0 < i_r < numberSmootherCircles() - 1, whose neighboring circles are stored contiguously */
+/* before and after it. This lets the compiler vectorize the loop with unit-stride loads. */
+template <typename T>
+void SmootherTake::applyAscOrthoInteriorCircleRow(const int i_r, ConstVector<T> x, ConstVector<T> rhs, Vector<T> temp,
+                                                  const LineLanes& lanes)
+{
+    assert(0 < i_r && i_r < grid_.numberSmootherCircles() - 1);
+
+    const int ntheta = grid_.ntheta();
+    const int start  = grid_.index(i_r, 0);
+
+    const double h1 = grid_.radialSpacing(i_r - 1);
+    const double h2 = grid_.radialSpacing(i_r);
+    const double* k = &grid_.angularSpacing(0);
+
+    const T* x_left          = x.data() + start - ntheta;
+    const T* x_right         = x.data() + start + ntheta;
+    const double* arr_center = level_cache_.arr().data() + start;
+    const double* arr_left   = arr_center - ntheta;
+    const double* arr_right  = arr_center + ntheta;
+    const double* art_center = level_cache_.art().data() + start;
+    const double* art_left   = art_center - ntheta;
+    const double* art_right  = art_center + ntheta;
+    const T* rhs_center      = rhs.data() + start;
+    T* temp_center           = temp.data() + start;
+
+    lanes.vectorFor(1, ntheta - 1, [&](const int i_theta) {
+        const double coeff1 = 0.5 * (k[i_theta - 1] + k[i_theta]) / h1;
+        const double coeff2 = 0.5 * (k[i_theta - 1] + k[i_theta]) / h2;
+
+        temp_center[i_theta] =
+            rhs_center[i_theta] -
+            (-coeff1 * (arr_center[i_theta] + arr_left[i_theta]) * x_left[i_theta] /* Left */
+             - coeff2 * (arr_center[i_theta] + arr_right[i_theta]) * x_right[i_theta] /* Right */
+
+             - 0.25 * (art_left[i_theta] + art_center[i_theta - 1]) * x_left[i_theta - 1] /* Bottom Left */
+             + 0.25 * (art_right[i_theta] + art_center[i_theta - 1]) * x_right[i_theta - 1] /* Bottom Right */
+             + 0.25 * (art_left[i_theta] + art_center[i_theta + 1]) * x_left[i_theta + 1] /* Top Left */
+             - 0.25 * (art_right[i_theta] + art_center[i_theta + 1]) * x_right[i_theta + 1] /* Top Right */
+            );
+    });
+}
+
 void SmootherTake::applyAscOrthoRadialSection(const int i_theta, const SmootherColor smoother_color,
                                               ConstVector<double> x, ConstVector<double> rhs, Vector<double> temp)
+{
+    applyAscOrthoRadialTake(i_theta, smoother_color, x, rhs, temp);
+}
+
+template <typename T>
+void SmootherTake::applyAscOrthoRadialTake(const int i_theta, const SmootherColor smoother_color, ConstVector<T> x,
+                                           ConstVector<T> rhs, Vector<T> temp)
 {
     assert(i_theta >= 0 && i_theta < grid_.ntheta());
 
@@ -242,96 +311,204 @@ void SmootherTake::applyAscOrthoRadialSection(const int i_theta, const SmootherC
     }
 }
 
-void SmootherTake::solveCircleSection(const int i_r, Vector<double> x, Vector<double> temp,
-                                      Vector<double> solver_storage_1, Vector<double> solver_storage_2)
+// Solves A_sc on the circle i_r = 0 in place, whose across-origin matrix isn't tridiagonal.
+// The circles of the columns of a batch are n entries apart.
+void SmootherTake::solveInnerBoundaryCircle(double* circle, const int number_of_columns)
 {
-    const int start = grid_.index(i_r, 0);
-    const int end   = start + grid_.ntheta();
-    if (i_r == 0) {
 #ifdef GMGPOLAR_USE_MUMPS
+    // MUMPS keeps the right-hand side in the shared solver instance, see SolveContext.
+    // The columns of a batch are solved by one call.
+#pragma omp critical(gmgpolar_mumps_solve)
+    {
+        const int n                         = grid_.numberOfNodes();
         inner_boundary_mumps_solver_.job    = JOB_COMPUTE_SOLUTION;
-        inner_boundary_mumps_solver_.nrhs   = 1; // single rhs vector
-        inner_boundary_mumps_solver_.nz_rhs = grid_.ntheta(); // non-zeros in rhs
-        inner_boundary_mumps_solver_.rhs    = temp.data() + start;
-        inner_boundary_mumps_solver_.lrhs   = grid_.ntheta(); // leading dimension of rhs
+        inner_boundary_mumps_solver_.nrhs   = number_of_columns; // rhs vectors
+        inner_boundary_mumps_solver_.nz_rhs = number_of_columns * grid_.ntheta(); // non-zeros in rhs
+        inner_boundary_mumps_solver_.rhs    = circle;
+        inner_boundary_mumps_solver_.lrhs   = number_of_columns == 1 ? grid_.ntheta() : n; // leading dimension
         dmumps_c(&inner_boundary_mumps_solver_);
         if (inner_boundary_mumps_solver_.info[0] != 0) {
             std::cerr << "Error solving the system: " << inner_boundary_mumps_solver_.info[0] << std::endl;
         }
+    }
 #else
-        inner_boundary_lu_solver_.solveInPlace(temp.data() + start);
+    for (int column = 0; column < number_of_columns; column++) {
+        inner_boundary_lu_solver_.solveInPlace(circle + static_cast<std::size_t>(column) * grid_.numberOfNodes());
+    }
 #endif
+}
+
+template <typename T>
+void SmootherTake::solveCircleSection(const int i_r, Vector<T> x, Vector<T> temp, T* solver_storage_1,
+                                      T* solver_storage_2, const int number_of_columns)
+{
+    const std::size_t n     = grid_.numberOfNodes();
+    const std::size_t start = grid_.index(i_r, 0);
+    const std::size_t end   = start + grid_.ntheta();
+    if (i_r == 0) {
+        if constexpr (std::is_same_v<T, double>) {
+            solveInnerBoundaryCircle(temp.data() + start, number_of_columns);
+        }
+        else {
+            // The inner boundary circle is only factorized in double precision,
+            // so its single precision values are solved in a double precision copy.
+            assert(number_of_columns == 1);
+            std::vector<double> circle(temp.data() + start, temp.data() + end);
+            solveInnerBoundaryCircle(circle.data(), 1);
+            std::copy(circle.begin(), circle.end(), temp.data() + start);
+        }
     }
     else {
-        circle_tridiagonal_solver_[i_r].solveInPlace(temp.data() + start, solver_storage_1.data(),
-                                                     solver_storage_2.data());
+        // The factorization of the circle is reused for every column.
+        for (int column = 0; column < number_of_columns; column++) {
+            circle_tridiagonal_solver_[i_r].solveInPlace(temp.data() + column * n + start, solver_storage_1,
+                                                         solver_storage_2);
+        }
     }
     // Move updated values to x
-    Kokkos::deep_copy(Kokkos::subview(x, Kokkos::make_pair(start, end)),
-                      Kokkos::subview(temp, Kokkos::make_pair(start, end)));
+    for (int column = 0; column < number_of_columns; column++) {
+        const auto circle = Kokkos::make_pair(column * n + start, column * n + end);
+        Kokkos::deep_copy(Kokkos::subview(x, circle), Kokkos::subview(temp, circle));
+    }
 }
 
-void SmootherTake::solveRadialSection(const int i_theta, Vector<double> x, Vector<double> temp,
-                                      Vector<double> solver_storage)
+template <typename T>
+void SmootherTake::solveRadialSection(const int i_theta, Vector<T> x, Vector<T> temp, T* solver_storage,
+                                      const int number_of_columns)
 {
-    const int start = grid_.index(grid_.numberSmootherCircles(), i_theta);
-    const int end   = start + grid_.lengthSmootherRadial();
+    const std::size_t n     = grid_.numberOfNodes();
+    const std::size_t start = grid_.index(grid_.numberSmootherCircles(), i_theta);
+    const std::size_t end   = start + grid_.lengthSmootherRadial();
 
-    radial_tridiagonal_solver_[i_theta].solveInPlace(temp.data() + start, solver_storage.data());
-    // Move updated values to x
-    Kokkos::deep_copy(Kokkos::subview(x, Kokkos::make_pair(start, end)),
-                      Kokkos::subview(temp, Kokkos::make_pair(start, end)));
+    for (int column = 0; column < number_of_columns; column++) {
+        radial_tridiagonal_solver_[i_theta].solveInPlace(temp.data() + column * n + start, solver_storage);
+        // Move updated values to x
+        const auto line = Kokkos::make_pair(column * n + start, column * n + end);
+        Kokkos::deep_copy(Kokkos::subview(x, line), Kokkos::subview(temp, line));
+    }
 }
 
-// clang-format off
-
 // In temp we store the vector 'rhs - A_sc^ortho u_sc^ortho' and then we solve the system
 // Asc * u_sc = temp in place and move the updated values into 'x'.
+template <typename T>
+void SmootherTake::smoothingLines(Vector<T> x, ConstVector<T> rhs, Vector<T> temp)
+{
+    assert(x.size() == rhs.size());
+    assert(temp.size() == rhs.size());
+
+    assert(level_cache_.cacheDensityProfileCoefficients());
+    assert(level_cache_.cacheDomainGeometry());
+
+    /* The double precision products are virtual, see SmootherAssembled. */
+    const auto applyAscOrthoCircle = [this](int i_r, SmootherColor color, ConstVector<T> x, ConstVector<T> rhs,
+                                            Vector<T> temp, const LineLanes& lanes) {
+        if constexpr (std::is_same_v<T, double>)
+            applyAscOrthoCircleSection(i_r, color, x, rhs, temp, lanes);
+        else
+            applyAscOrthoCircleTake(i_r, color, x, rhs, temp, lanes);
+    };
+    const auto applyAscOrthoRadial = [this](int i_theta, SmootherColor color, ConstVector<T> x, ConstVector<T> rhs,
+                                            Vector<T> temp) {
+        if constexpr (std::is_same_v<T, double>)
+            applyAscOrthoRadialSection(i_theta, color, x, rhs, temp);
+        else
+            applyAscOrthoRadialTake(i_theta, color, x, rhs, temp);
+    };
+
+    /* The outer most circle next to the radial section is defined to be black. */
+    /* Priority: Black -> White. */
+    const int start_black_circles = (grid_.numberSmootherCircles() % 2 == 0) ? 1 : 0;
+    const int start_white_circles = (grid_.numberSmootherCircles() % 2 == 0) ? 0 : 1;
+
+    /* Every line is solved with the tridiagonal work arrays in the scratch of its thread. */
+    const int ntheta            = grid_.ntheta();
+    const int num_black_circles = (grid_.numberSmootherCircles() - start_black_circles + 1) / 2;
+    const int num_white_circles = (grid_.numberSmootherCircles() - start_white_circles + 1) / 2;
+
+    const std::size_t scratch_size = std::max<std::size_t>(2 * ntheta, grid_.lengthSmootherRadial());
+
+    /* Colors: Black Circle Section, White Circle Section, Black Radial Section, White Radial Section */
+    parallelForColorsWithScratch<T>(
+        {num_black_circles, num_white_circles, (ntheta + 1) / 2, ntheta / 2}, num_omp_threads_, scratch_size,
+        [&](const int color, const int task, T* scratch, const LineLanes& lanes) {
+            const SmootherColor smoother_color = (color % 2 == 0) ? SmootherColor::Black : SmootherColor::White;
+            if (color < 2) {
+                const int i_r = (color == 0 ? start_black_circles : start_white_circles) + 2 * task;
+                applyAscOrthoCircle(i_r, smoother_color, x, rhs, temp, lanes);
+                solveCircleSection(i_r, x, temp, scratch, scratch + ntheta);
+            }
+            else {
+                const int i_theta = 2 * task + (color - 2);
+                applyAscOrthoRadial(i_theta, smoother_color, x, rhs, temp);
+                solveRadialSection(i_theta, x, temp, scratch);
+            }
+        });
+}
+
 void SmootherTake::smoothing(Vector<double> x, ConstVector<double> rhs, Vector<double> temp)
+{
+    smoothingLines(x, rhs, temp);
+}
+
+void SmootherTake::smoothingSinglePrecision(Vector<float> x, ConstVector<float> rhs, Vector<float> temp)
+{
+    smoothingLines(x, rhs, temp);
+}
+
+// smoothing() for the columns of a batch, which are stored one after another. Every line is relaxed for all
+// columns before the next line, so the level cache entries and the factorization of the line are loaded once
+// for the whole batch, and the colors are separated by one barrier for all columns.
+void SmootherTake::smoothingBatch(Vector<double> x, ConstVector<double> rhs, Vector<double> temp,
+                                  const int number_of_columns)
 {
     assert(x.size() == rhs.size());
     assert(temp.size() == rhs.size());
+    assert(x.size() >= static_cast<std::size_t>(number_of_columns) * grid_.numberOfNodes());
 
     assert(level_cache_.cacheDensityProfileCoefficients());
     assert(level_cache_.cacheDomainGeometry());
 
-    #pragma omp parallel
-    {
-        Vector<double> circle_solver_storage_1("circle_solver_storage_1",grid_.ntheta());
-        Vector<double> circle_solver_storage_2("circle_solver_storage_2",grid_.ntheta());
-        Vector<double> radial_solver_storage("circle_solver_storage",grid_.lengthSmootherRadial());
-
-        /* The outer most circle next to the radial section is defined to be black. */
-        /* Priority: Black -> White. */
-        const int start_black_circles = (grid_.numberSmootherCircles() % 2 == 0) ? 1 : 0;
-        const int start_white_circles = (grid_.numberSmootherCircles() % 2 == 0) ? 0 : 1;
-
-        /* Black Circle Section */
-        #pragma omp for
-        for (int i_r = start_black_circles; i_r < grid_.numberSmootherCircles(); i_r += 2) {
-            applyAscOrthoCircleSection(i_r, SmootherColor::Black, x, rhs, temp);
-            solveCircleSection(i_r, x, temp, circle_solver_storage_1, circle_solver_storage_2);
-        } /* Implicit barrier */
-
-        /* White Circle Section */
-        #pragma omp for nowait
-        for (int i_r = start_white_circles; i_r < grid_.numberSmootherCircles(); i_r += 2) {
-            applyAscOrthoCircleSection(i_r, SmootherColor::White, x, rhs, temp);
-            solveCircleSection(i_r, x, temp, circle_solver_storage_1, circle_solver_storage_2);
-        }
-        /* Black Radial Section */
-        #pragma omp for
-        for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta += 2) {
-            applyAscOrthoRadialSection(i_theta, SmootherColor::Black, x, rhs, temp);
-            solveRadialSection(i_theta, x, temp, radial_solver_storage);
-        } /* Implicit barrier */
-
-        /* White Radial Section*/
-        #pragma omp for
-        for (int i_theta = 1; i_theta < grid_.ntheta(); i_theta += 2) {
-            applyAscOrthoRadialSection(i_theta, SmootherColor::White, x, rhs, temp);
-            solveRadialSection(i_theta, x, temp, radial_solver_storage);
-        } /* Implicit barrier */
+    const std::size_t n = grid_.numberOfNodes();
+    std::vector<Kokkos::View<double*, Kokkos::LayoutRight, Kokkos::HostSpace>> x_columns, temp_columns;
+    std::vector<Kokkos::View<const double*, Kokkos::LayoutRight, Kokkos::HostSpace>> rhs_columns;
+    for (int column = 0; column < number_of_columns; column++) {
+        x_columns.push_back(batchColumn(x, column, n));
+        rhs_columns.push_back(batchColumn(rhs, column, n));
+        temp_columns.push_back(batchColumn(temp, column, n));
     }
+
+    /* The outer most circle next to the radial section is defined to be black. */
+    /* Priority: Black -> White. */
+    const int start_black_circles = (grid_.numberSmootherCircles() % 2 == 0) ? 1 : 0;
+    const int start_white_circles = (grid_.numberSmootherCircles() % 2 == 0) ? 0 : 1;
+
+    /* Every line is solved with the tridiagonal work arrays in the scratch of its thread. */
+    const int ntheta            = grid_.ntheta();
+    const int num_black_circles = (grid_.numberSmootherCircles() - start_black_circles + 1) / 2;
+    const int num_white_circles = (grid_.numberSmootherCircles() - start_white_circles + 1) / 2;
+
+    const std::size_t scratch_size = std::max<std::size_t>(2 * ntheta, grid_.lengthSmootherRadial());
+
+    /* Colors: Black Circle Section, White Circle Section, Black Radial Section, White Radial Section */
+    parallelForColorsWithScratch<double>(
+        {num_black_circles, num_white_circles, (ntheta + 1) / 2, ntheta / 2}, num_omp_threads_, scratch_size,
+        [&](const int color, const int task, double* scratch, const LineLanes& lanes) {
+            const SmootherColor smoother_color = (color % 2 == 0) ? SmootherColor::Black : SmootherColor::White;
+            if (color < 2) {
+                const int i_r = (color == 0 ? start_black_circles : start_white_circles) + 2 * task;
+                for (int column = 0; column < number_of_columns; column++) {
+                    applyAscOrthoCircleSection(i_r, smoother_color, x_columns[column], rhs_columns[column],
+                                               temp_columns[column], lanes);
+                }
+                solveCircleSection(i_r, x, temp, scratch, scratch + ntheta, number_of_columns);
+            }
+            else {
+                const int i_theta = 2 * task + (color - 2);
+                for (int column = 0; column < number_of_columns; column++) {
+                    applyAscOrthoRadialSection(i_theta, smoother_color, x_columns[column], rhs_columns[column],
+                                               temp_columns[column]);
+                }
+                solveRadialSection(i_theta, x, temp, scratch, number_of_columns);
+            }
+        });
 }
-// clang-format on
@@ -0,0 +1,161 @@
+#include "../../include/Stencil/assembledStencil.h"
+
+AssembledStencil::AssembledStencil(const PolarGrid& grid, const LevelCache& level_cache, const bool DirBC_Interior,
+                                   const bool symmetric, const int num_omp_threads)
+    : grid_(grid)
+    , level_cache_(level_cache)
+    , DirBC_Interior_(DirBC_Interior)
+    , symmetric_(symmetric)
+    , num_omp_threads_(num_omp_threads)
+    , values_("assembled_stencil", (symmetric ? NUMBER_OF_SYMMETRIC_SLOTS : 9) * grid.numberOfNodes())
+    , across_origin_("assembled_stencil_across_origin", symmetric && !DirBC_Interior ? grid.ntheta() : 0)
+{
+    if (!level_cache_.cacheDensityProfileCoefficients() || !level_cache_.cacheDomainGeometry()) {
+        throw std::runtime_error("Error: The assembled stencil requires cached density profile coefficients and "
+                                 "domain geometry.");
+    }
+    assemble();
+}
+
+bool AssembledStencil::symmetric() const
+{
+    return symmetric_;
+}
+
+std::size_t AssembledStencil::memoryUsage() const
+{
+    return (values_.size() + across_origin_.size()) * sizeof(double);
+}
+
+void AssembledStencil::assemble()
+{
+    parallelFor(0, grid_.nr(), num_omp_threads_, [&](int i_r) {
+        for (int i_theta = 0; i_theta < grid_.ntheta(); i_theta++) {
+            assembleNode(i_r, i_theta);
+        }
+    });
+}
+
+/* The coefficients are the ones ResidualTake applies, see NODE_APPLY_RESIDUAL_TAKE. */
+void AssembledStencil::assembleNode(const int i_r, const int i_theta)
+{
+    const auto& arr        = level_cache_.arr();
+    const auto& att        = level_cache_.att();
+    const auto& art        = level_cache_.art();
+    const auto& detDF      = level_cache_.detDF();
+    const auto& coeff_beta = level_cache_.coeff_beta();
+
+    const int n = grid_.numberOfNodes();
+
+    const int i_theta_M1 = grid_.wrapThetaIndex(i_theta - 1);
+    const int i_theta_P1 = grid_.wrapThetaIndex(i_theta + 1);
+
+    const int center = grid_.index(i_r, i_theta);
+    const int bottom = grid_.index(i_r, i_theta_M1);
+    const int top    = grid_.index(i_r, i_theta_P1);
+
+    /* On the innermost circle h1 gets replaced with 2 * R0 (across-origin discretization). */
+    const bool has_left  = i_r > 0;
+    const bool has_right = i_r < grid_.nr() - 1;
+    const double h1      = has_left ? grid_.radialSpacing(i_r - 1) : 2.0 * grid_.radius(0);
+    const double h2      = has_right ? grid_.radialSpacing(i_r) : 0.0;
+    const double k1      = grid_.angularSpacing(i_theta - 1);
+    const double k2      = grid_.angularSpacing(i_theta);
+
+    /* Couplings to the nodes at larger radius and angle. */
+    double right = 0.0, bottom_right = 0.0, top_right = 0.0, upper = 0.0;
+    if (has_right) {
+        const int right_index = grid_.index(i_r + 1, i_theta);
+        right                 = -(0.5 * (k1 + k2) / h2) * (arr[center] + arr[right_index]);
+        bottom_right          = 0.25 * (art[right_index] + art[bottom]);
+        top_right             = -0.25 * (art[right_index] + art[top]);
+    }
+    if (!isDirichletRow(i_r)) {
+        upper = -(0.5 * (h1 + h2) / k2) * (att[center] + att[top]);
+    }
+
+    if (symmetric_) {
+        values_[SYMMETRIC_RIGHT * n + center]        = right;
+        values_[SYMMETRIC_TOP * n + center]          = upper;
+        values_[SYMMETRIC_TOP_RIGHT * n + center]    = top_right;
+        values_[SYMMETRIC_BOTTOM_RIGHT * n + center] = bottom_right;
+    }
+
+    auto setFull = [&](const StencilPosition position, const double value) {
+        values_[static_cast<int>(position) * n + center] = value;
+    };
+
+    if (isDirichletRow(i_r)) {
+        if (symmetric_) {
+            values_[SYMMETRIC_CENTER * n + center] = 1.0;
+        }
+        else {
+            for (int position = 0; position < 9; position++) {
+                values_[position * n + center] = 0.0;
+            }
+            setFull(StencilPosition::Center, 1.0);
+        }
+        return;
+    }
+
+    /* Couplings to the nodes at smaller radius and angle. */
+    const int left_index = has_left ? grid_.index(i_r - 1, i_theta) : grid_.index(0, i_theta + grid_.ntheta() / 2);
+    const double left    = -(0.5 * (k1 + k2) / h1) * (arr[center] + arr[left_index]);
+    const double lower   = -(0.5 * (h1 + h2) / k1) * (att[center] + att[bottom]);
+    /* The diagonal couplings to the left are removed due to the artificial 7-point stencil across the origin. */
+    const double bottom_left = has_left ? -0.25 * (art[left_index] + art[bottom]) : 0.0;
+    const double top_left    = has_left ? 0.25 * (art[left_index] + art[top]) : 0.0;
+
+    const double center_value =
+        0.25 * (h1 + h2) * (k1 + k2) * coeff_beta[center] * std::fabs(detDF[center]) - left - right - lower - upper;
+
+    if (symmetric_) {
+        values_[SYMMETRIC_CENTER * n + center] = center_value;
+        if (!has_left)
+            across_origin_[i_theta] = left;
+        return;
+    }
+
+    setFull(StencilPosition::Center, center_value);
+    setFull(StencilPosition::Left, left);
+    setFull(StencilPosition::Right, right);
+    setFull(StencilPosition::Bottom, lower);
+    setFull(StencilPosition::Top, upper);
+    setFull(StencilPosition::BottomLeft, bottom_left);
+    setFull(StencilPosition::BottomRight, bottom_right);
+    setFull(StencilPosition::TopLeft, top_left);
+    setFull(StencilPosition::TopRight, top_right);
+}
+
+double AssembledStencil::coefficient(const int i_r, const int i_theta, const StencilPosition position) const
+{
+    assert(0 <= i_r && i_r < grid_.nr());
+
+    if (isDirichletRow(i_r))
+        return position == StencilPosition::Center ? 1.0 : 0.0;
+
+    if (!symmetric_)
+        return stored(static_cast<int>(position), grid_.index(i_r, i_theta));
+
+    switch (position) {
+    case StencilPosition::Center:
+        return stored(SYMMETRIC_CENTER, grid_.index(i_r, i_theta));
+    case StencilPosition::Right:
+        return stored(SYMMETRIC_RIGHT, grid_.index(i_r, i_theta));
+    case StencilPosition::Top:
+        return stored(SYMMETRIC_TOP, grid_.index(i_r, i_theta));
+    case StencilPosition::TopRight:
+        return stored(SYMMETRIC_TOP_RIGHT, grid_.index(i_r, i_theta));
+    case StencilPosition::BottomRight:
+        return stored(SYMMETRIC_BOTTOM_RIGHT, grid_.index(i_r, i_theta));
+    case StencilPosition::Left:
+        return i_r > 0 ? stored(SYMMETRIC_RIGHT, grid_.index(i_r - 1, i_theta)) : across_origin_[i_theta];
+    case StencilPosition::Bottom:
+        return stored(SYMMETRIC_TOP, grid_.index(i_r, i_theta - 1));
+    case StencilPosition::BottomLeft:
+        return i_r > 0 ? stored(SYMMETRIC_TOP_RIGHT, grid_.index(i_r - 1, i_theta - 1)) : 0.0;
+    case StencilPosition::TopLeft:
+        return i_r > 0 ? stored(SYMMETRIC_BOTTOM_RIGHT, grid_.index(i_r - 1, i_theta + 1)) : 0.0;
+    }
+    return 0.0;
+}
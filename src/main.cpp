@@ -19,19 +19,25 @@ int main(int argc, char* argv[])
     // --- General solver output and visualization settings --- //
     solver.verbose(parser.verbose()); // Enable/disable verbose output
     solver.paraview(parser.paraview()); // Enable/disable ParaView output
+    solver.paraviewFormat(parser.paraviewFormat()); // ASCII, binary, compressed or structured VTK files
 
     // --- Parallelization and threading settings --- //
     solver.maxOpenMPThreads(parser.maxOpenMPThreads()); // Maximum OpenMP threads to use
     solver.threadReductionFactor(parser.threadReductionFactor()); // Reduce threads on coarser grids
+    solver.autotuneThreads(parser.autotuneThreads()); // Time candidate thread counts per level during setup
+    solver.threadTuningCache(parser.threadTuningCache()); // Reuse autotuned thread counts from this file
 
     omp_set_num_threads(parser.maxOpenMPThreads()); // Global OpenMP thread limit
 
     // --- Numerical method setup --- //
     solver.DirBC_Interior(parser.DirBC_Interior()); // Interior boundary conditions: Dirichlet, Across-the-origin,
-    solver.stencilDistributionMethod(parser.stencilDistributionMethod()); // Stencil distribution strategy: Take, Give
+    solver.stencilDistributionMethod(
+        parser.stencilDistributionMethod()); // Stencil distribution strategy: Take, Give, Assembled
     solver.cacheDensityProfileCoefficients(
         parser.cacheDensityProfileCoefficients()); // Cache density profile coefficients: alpha, beta
     solver.cacheDomainGeometry(parser.cacheDomainGeometry()); // Cache domain geometry data: arr, att, art, detDF
+    solver.mixedPrecision(parser.mixedPrecision()); // Single precision smoother factorizations
+    solver.memoryLean(parser.memoryLean()); // Levels evaluate on the fly and share solution storage
 
     // --- Multigrid settings --- //
     solver.extrapolation(parser.extrapolation()); // Enable/disable extrapolation
@@ -43,11 +49,16 @@ int main(int argc, char* argv[])
     solver.FMG_iterations(parser.FMG_iterations()); // FMG iteration count
     solver.FMG_cycle(parser.FMG_cycle()); // FMG cycle type
 
+    // --- Outer solver settings --- //
+    solver.outerSolver(parser.outerSolver()); // Multigrid iteration or multigrid-preconditioned PCG/FGMRES
+    solver.FGMRES_restart(parser.FGMRES_restart()); // Restart length of FGMRES
+
     // --- Iterative solver controls --- //
     solver.maxIterations(parser.maxIterations()); // Max number of iterations
     solver.residualNormType(parser.residualNormType()); // Residual norm type (L2, weighted-L2, L∞)
     solver.absoluteTolerance(parser.absoluteTolerance()); // Absolute residual tolerance
     solver.relativeTolerance(parser.relativeTolerance()); // Relative residual tolerance
+    solver.fusedConvergenceCheck(parser.fusedConvergenceCheck()); // Reuse the residual of the multigrid cycle
 
     // --- Finalize solver setup --- //
     solver.setup(); // (allocates internal data, prepares operators, etc.)
@@ -67,5 +78,9 @@ int main(int argc, char* argv[])
     // Print timing statistics for each solver phase
     solver.printTimings();
 
+    // Write settings, convergence history and timings in machine-readable form
+    if (!parser.report().empty())
+        solver.writeReport(parser.report(), parser.problemSettings());
+
     return 0;
 }
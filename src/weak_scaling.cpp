@@ -133,6 +133,12 @@ void runTest(int maxOpenMPThreads, int divideBy2, std::ofstream& outfile)
     else if (solver.stencilDistributionMethod() == StencilDistributionMethod::CPU_GIVE) {
         stencil_string = "Give";
     }
+    else if (solver.stencilDistributionMethod() == StencilDistributionMethod::CPU_ASSEMBLED) {
+        stencil_string = "Assembled";
+    }
+    else if (solver.stencilDistributionMethod() == StencilDistributionMethod::CPU_ASSEMBLED_SYMMETRIC) {
+        stencil_string = "AssembledSymmetric";
+    }
 
     int extrapolation_int = static_cast<int>(solver.extrapolation());
 
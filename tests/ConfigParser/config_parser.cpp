@@ -1,4 +1,7 @@
 #include <gtest/gtest.h>
+
+#include <algorithm>
+
 #include "../../include/ConfigParser/config_parser.h"
 
 struct TestParams {
@@ -35,12 +38,18 @@ TEST_P(ConfigParserTest, ParseAllGeometryAndProblemCombinations)
 {
     const int verbose                          = (params.case_id > 0 ? 0 : 1);
     const bool paraview                        = false;
+    const int paraviewFormat                   = params.case_id % 4;
+    const std::string report                   = "report_" + std::to_string(params.case_id) + ".json";
     const int maxOpenMPThreads                 = 4;
     const double threadReductionFactor         = 1.0;
+    const bool autotuneThreads                 = params.case_id % 2 == 0;
+    const std::string threadTuningCache        = "threads_" + std::to_string(params.case_id) + ".txt";
     const bool DirBC_Interior                  = false;
-    const int stencilDistributionMethod        = params.case_id % 2;
+    const int stencilDistributionMethod        = params.case_id % 4;
     const bool cacheDensityProfileCoefficients = true;
     const bool cacheDomainGeometry             = false;
+    const bool mixedPrecision                  = params.case_id % 2 == 1;
+    const bool memoryLean                      = params.case_id % 2 == 0;
     const double R0                            = 1e-8;
     const double Rmax                          = 1.3;
     const int nr_exp                           = 4;
@@ -55,10 +64,13 @@ TEST_P(ConfigParserTest, ParseAllGeometryAndProblemCombinations)
     const int preSmoothingSteps                = 1;
     const int postSmoothingSteps               = 1;
     const int multigridCycle                   = params.case_id % 3;
+    const int outerSolver                      = params.case_id % 3;
+    const int FGMRES_restart                   = 20;
     const int maxIterations                    = 150;
     const int residualNormType                 = params.case_id % 3;
     const double absoluteTolerance             = 1e-8;
     const double relativeTolerance             = 1e-8;
+    const bool fusedConvergenceCheck           = params.case_id % 2 == 0;
 
     // Calculate alpha_jump based on alpha_coeff
     double alpha_jump;
@@ -91,10 +103,18 @@ TEST_P(ConfigParserTest, ParseAllGeometryAndProblemCombinations)
                                      std::to_string(verbose),
                                      "--paraview",
                                      paraview ? "1" : "0",
+                                     "--paraviewFormat",
+                                     std::to_string(paraviewFormat),
+                                     "--report",
+                                     report,
                                      "--maxOpenMPThreads",
                                      std::to_string(maxOpenMPThreads),
                                      "--threadReductionFactor",
                                      double_to_string(threadReductionFactor),
+                                     "--autotuneThreads",
+                                     autotuneThreads ? "1" : "0",
+                                     "--threadTuningCache",
+                                     threadTuningCache,
                                      "--DirBC_Interior",
                                      DirBC_Interior ? "1" : "0",
                                      "--stencilDistributionMethod",
@@ -103,6 +123,10 @@ TEST_P(ConfigParserTest, ParseAllGeometryAndProblemCombinations)
                                      cacheDensityProfileCoefficients ? "1" : "0",
                                      "--cacheDomainGeometry",
                                      cacheDomainGeometry ? "1" : "0",
+                                     "--mixedPrecision",
+                                     mixedPrecision ? "1" : "0",
+                                     "--memoryLean",
+                                     memoryLean ? "1" : "0",
                                      "--R0",
                                      double_to_string(R0),
                                      "--Rmax",
@@ -145,6 +169,10 @@ TEST_P(ConfigParserTest, ParseAllGeometryAndProblemCombinations)
                                      std::to_string(postSmoothingSteps),
                                      "--multigridCycle",
                                      std::to_string(multigridCycle),
+                                     "--outerSolver",
+                                     std::to_string(outerSolver),
+                                     "--FGMRES_restart",
+                                     std::to_string(FGMRES_restart),
                                      "--maxIterations",
                                      std::to_string(maxIterations),
                                      "--residualNormType",
@@ -152,7 +180,9 @@ TEST_P(ConfigParserTest, ParseAllGeometryAndProblemCombinations)
                                      "--absoluteTolerance",
                                      double_to_string(absoluteTolerance),
                                      "--relativeTolerance",
-                                     double_to_string(relativeTolerance)};
+                                     double_to_string(relativeTolerance),
+                                     "--fusedConvergenceCheck",
+                                     fusedConvergenceCheck ? "1" : "0"};
 
     std::vector<char*> argv = make_argv(args);
     int argc                = argv.size();
@@ -170,12 +200,41 @@ TEST_P(ConfigParserTest, ParseAllGeometryAndProblemCombinations)
     // Control parameters
     EXPECT_EQ(parser.verbose(), verbose);
     EXPECT_EQ(parser.paraview(), paraview);
+    EXPECT_EQ(parser.paraviewFormat(), static_cast<ParaviewFormat>(paraviewFormat));
+    EXPECT_EQ(parser.report(), report);
     EXPECT_EQ(parser.maxOpenMPThreads(), maxOpenMPThreads);
     EXPECT_DOUBLE_EQ(parser.threadReductionFactor(), threadReductionFactor);
+    EXPECT_EQ(parser.autotuneThreads(), autotuneThreads);
+    EXPECT_EQ(parser.threadTuningCache(), threadTuningCache);
     EXPECT_EQ(parser.DirBC_Interior(), DirBC_Interior);
     EXPECT_EQ(parser.stencilDistributionMethod(), static_cast<StencilDistributionMethod>(stencilDistributionMethod));
     EXPECT_EQ(parser.cacheDensityProfileCoefficients(), cacheDensityProfileCoefficients);
     EXPECT_EQ(parser.cacheDomainGeometry(), cacheDomainGeometry);
+    EXPECT_EQ(parser.mixedPrecision(), mixedPrecision);
+    EXPECT_EQ(parser.memoryLean(), memoryLean);
+
+    // Problem settings of the report
+    const std::vector<ReportSetting>& problem = parser.problemSettings();
+    auto problemSetting = [&](const std::string& key) {
+        const auto it = std::find_if(problem.begin(), problem.end(), [&](const ReportSetting& s) {
+            return s.first == key;
+        });
+        EXPECT_NE(it, problem.end()) << key;
+        return it != problem.end() ? it->second : ReportSetting::second_type{};
+    };
+    EXPECT_EQ(std::get<int>(problemSetting("geometry")), params.geometry);
+    EXPECT_EQ(std::get<int>(problemSetting("problem")), params.problem);
+    EXPECT_EQ(std::get<int>(problemSetting("alpha_coeff")), params.alpha_coeff);
+    EXPECT_EQ(std::get<int>(problemSetting("beta_coeff")), params.beta_coeff);
+    EXPECT_EQ(std::get<std::string>(problemSetting("geometryTable")), "");
+    EXPECT_DOUBLE_EQ(std::get<double>(problemSetting("Rmax")), Rmax);
+    EXPECT_DOUBLE_EQ(std::get<double>(problemSetting("kappa_eps")), params.kappa_eps);
+    EXPECT_DOUBLE_EQ(std::get<double>(problemSetting("delta_e")), params.delta_e);
+    EXPECT_DOUBLE_EQ(std::get<double>(problemSetting("alpha_jump")), alpha_jump);
+    EXPECT_EQ(std::get<int>(problemSetting("nr_exp")), nr_exp);
+    EXPECT_EQ(std::get<int>(problemSetting("ntheta_exp")), ntheta_exp);
+    EXPECT_EQ(std::get<int>(problemSetting("anisotropic_factor")), anisotropic_factor);
+    EXPECT_EQ(std::get<int>(problemSetting("divideBy2")), divideBy2);
 
     // Grid
     const PolarGrid& grid = parser.grid();
@@ -192,12 +251,15 @@ TEST_P(ConfigParserTest, ParseAllGeometryAndProblemCombinations)
     EXPECT_EQ(parser.preSmoothingSteps(), preSmoothingSteps);
     EXPECT_EQ(parser.postSmoothingSteps(), postSmoothingSteps);
     EXPECT_EQ(parser.multigridCycle(), static_cast<MultigridCycleType>(multigridCycle));
+    EXPECT_EQ(parser.outerSolver(), static_cast<OuterSolverType>(outerSolver));
+    EXPECT_EQ(parser.FGMRES_restart(), FGMRES_restart);
     EXPECT_EQ(parser.maxIterations(), maxIterations);
     EXPECT_EQ(parser.residualNormType(), static_cast<ResidualNormType>(residualNormType));
     ASSERT_TRUE(parser.absoluteTolerance().has_value());
     EXPECT_DOUBLE_EQ(parser.absoluteTolerance().value(), absoluteTolerance);
     ASSERT_TRUE(parser.relativeTolerance().has_value());
     EXPECT_DOUBLE_EQ(parser.relativeTolerance().value(), relativeTolerance);
+    EXPECT_EQ(parser.fusedConvergenceCheck(), fusedConvergenceCheck);
 }
 
 // Define test cases covering all combinations
@@ -173,6 +173,58 @@ TEST(DirectSolverTestNoMumps, directSolver_AcrossOrigin)
     }
 }
 
+/* The batched solve treats every column like solveInPlace. */
+TEST(DirectSolverTestNoMumps, directSolver_Batch)
+{
+    std::vector<double> radii  = {1e-5, 0.2, 0.25, 0.5, 0.8, 0.9, 0.95, 1.2, 1.3};
+    std::vector<double> angles = {
+        0, M_PI / 16, M_PI / 8, M_PI / 2, M_PI, M_PI + M_PI / 16, M_PI + M_PI / 8, M_PI + M_PI / 2, M_PI + M_PI};
+
+    double Rmax      = radii.back();
+    double kappa_eps = 0.3;
+    double delta_e   = 1.4;
+
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+
+    double alpha_jump = 0.678 * Rmax;
+    std::unique_ptr<DensityProfileCoefficients> coefficients =
+        std::make_unique<ZoniShiftedCoefficients>(Rmax, alpha_jump);
+
+    bool DirBC_Interior  = false;
+    int maxOpenMPThreads = 16;
+
+    auto grid       = std::make_unique<PolarGrid>(radii, angles);
+    auto levelCache = std::make_unique<LevelCache>(*grid, *coefficients, domain_geometry, true, true);
+    Level level(0, std::move(grid), std::move(levelCache), ExtrapolationType::NONE, 0);
+
+    DirectSolverGiveCustomLU directSolverGive_operator(level.grid(), level.levelCache(), domain_geometry, *coefficients,
+                                                       DirBC_Interior, maxOpenMPThreads);
+    DirectSolverTakeCustomLU directSolverTake_operator(level.grid(), level.levelCache(), domain_geometry, *coefficients,
+                                                       DirBC_Interior, maxOpenMPThreads);
+
+    const int number_of_columns = 3;
+    const std::size_t n         = level.grid().numberOfNodes();
+
+    for (DirectSolver* direct_solver :
+         std::vector<DirectSolver*>{&directSolverGive_operator, &directSolverTake_operator}) {
+        Vector<double> batch("batch", number_of_columns * n);
+        Vector<double> expected("expected", number_of_columns * n);
+        for (int column = 0; column < number_of_columns; column++) {
+            Vector<double> rhs = generate_random_sample_data(level.grid(), 42 + column);
+            for (std::size_t index = 0; index < n; index++) {
+                batch[column * n + index]    = rhs[index];
+                expected[column * n + index] = rhs[index];
+            }
+            direct_solver->solveInPlace(batchColumn(expected, column, n));
+        }
+
+        direct_solver->solveInPlaceBatch(batch, number_of_columns);
+        for (std::size_t index = 0; index < number_of_columns * n; index++) {
+            EXPECT_DOUBLE_EQ(batch[index], expected[index]);
+        }
+    }
+}
+
 /* Test 2/2: */
 /* Are the DirectSolver and Residual are compatible with each other? */
 
@@ -0,0 +1,172 @@
+#include <gtest/gtest.h>
+
+#include <filesystem>
+#include <fstream>
+#include <sstream>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+struct AutotuneProblem {
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid{1e-8, Rmax, 4, -1, alpha_jump, 3, 1};
+    CzarnyGeometry domain_geometry{Rmax, kappa_eps, delta_e};
+    ZoniShiftedGyroCoefficients coefficients{Rmax, alpha_jump};
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions{Rmax, kappa_eps, delta_e};
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term{Rmax, kappa_eps, delta_e};
+    PolarR6_CzarnyGeometry exact_solution{Rmax, kappa_eps, delta_e};
+};
+
+void configureSolver(GMGPolar& solver, bool autotune_threads, const std::string& thread_tuning_cache = "")
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(4);
+    solver.threadReductionFactor(1.0);
+    solver.autotuneThreads(autotune_threads);
+    solver.threadTuningCache(thread_tuning_cache);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(StencilDistributionMethod::CPU_GIVE);
+    solver.extrapolation(ExtrapolationType::IMPLICIT_EXTRAPOLATION);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-10);
+    solver.relativeTolerance(1e-8);
+}
+
+std::vector<std::string> readLines(const std::string& path)
+{
+    std::ifstream file(path);
+    std::vector<std::string> lines;
+    std::string line;
+    while (std::getline(file, line)) {
+        lines.push_back(line);
+    }
+    return lines;
+}
+} // namespace
+
+TEST(AutotuneThreadsTest, TunesEveryLevelWithoutChangingTheSolution)
+{
+    AutotuneProblem problem;
+
+    GMGPolar reference(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(reference, false);
+    reference.setup();
+    reference.setSolution(&problem.exact_solution);
+    reference.solve(problem.boundary_conditions, problem.source_term);
+
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, true);
+    solver.setup();
+    solver.setSolution(&problem.exact_solution);
+    solver.solve(problem.boundary_conditions, problem.source_term);
+
+    ASSERT_EQ(solver.threadsPerLevel().size(), reference.threadsPerLevel().size());
+    for (int threads : solver.threadsPerLevel()) {
+        EXPECT_TRUE(threads == 1 || threads == 2 || threads == 4) << threads;
+    }
+    EXPECT_EQ(solver.numberOfIterations(), reference.numberOfIterations());
+    EXPECT_NEAR(solver.exactErrorWeightedEuclidean().value(), reference.exactErrorWeightedEuclidean().value(),
+                1e-12);
+}
+
+TEST(AutotuneThreadsTest, ReusesCachedThreads)
+{
+    AutotuneProblem problem;
+    const std::string path = (std::filesystem::temp_directory_path() / "gmgpolar_thread_tuning.txt").string();
+    std::filesystem::remove(path);
+
+    GMGPolar tuned(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(tuned, true, path);
+    tuned.setup();
+
+    std::vector<std::string> lines = readLines(path);
+    ASSERT_EQ(lines.size(), tuned.threadsPerLevel().size());
+
+    // Replace the tuned counts by a value the timing never produces.
+    std::ofstream file(path);
+    for (const std::string& line : lines) {
+        file << line.substr(0, line.find_last_of(' ')) << " 3\n";
+    }
+    file.close();
+
+    GMGPolar cached(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(cached, true, path);
+    cached.setup();
+    for (int threads : cached.threadsPerLevel()) {
+        EXPECT_EQ(threads, 3);
+    }
+    EXPECT_EQ(readLines(path).size(), lines.size());
+
+    cached.solve(problem.boundary_conditions, problem.source_term);
+    EXPECT_LT(cached.numberOfIterations(), 150);
+
+    std::filesystem::remove(path);
+}
+
+// The coarse levels of memoryLean() and mixedPrecision() run other kernels than the full levels,
+// so their tuned counts must not be taken from a run without these settings.
+TEST(AutotuneThreadsTest, CacheSeparatesLevelKernels)
+{
+    AutotuneProblem problem;
+    const std::string path = (std::filesystem::temp_directory_path() / "gmgpolar_level_tuning.txt").string();
+    std::filesystem::remove(path);
+
+    auto configure = [&](GMGPolar& solver) {
+        configureSolver(solver, true, path);
+        solver.stencilDistributionMethod(StencilDistributionMethod::CPU_TAKE);
+        solver.cacheDensityProfileCoefficients(true);
+        solver.cacheDomainGeometry(true);
+        solver.extrapolation(ExtrapolationType::NONE);
+    };
+
+    GMGPolar tuned(problem.grid, problem.domain_geometry, problem.coefficients);
+    configure(tuned);
+    tuned.setup();
+
+    std::vector<std::string> lines = readLines(path);
+    ASSERT_EQ(lines.size(), tuned.threadsPerLevel().size());
+    ASSERT_GT(lines.size(), 1u);
+    std::ofstream file(path);
+    for (const std::string& line : lines) {
+        file << line.substr(0, line.find_last_of(' ')) << " 3\n";
+    }
+    file.close();
+
+    for (const bool memory_lean : {true, false}) {
+        GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+        configure(solver);
+        solver.memoryLean(memory_lean);
+        solver.mixedPrecision(!memory_lean);
+        solver.setup();
+
+        // The finest level runs the same kernels and reuses the cached count, the coarse levels are tuned again.
+        const std::vector<int>& threads = solver.threadsPerLevel();
+        EXPECT_EQ(threads[0], 3);
+        for (std::size_t level_depth = 1; level_depth < threads.size(); level_depth++) {
+            EXPECT_NE(threads[level_depth], 3) << "level " << level_depth;
+        }
+    }
+    EXPECT_EQ(readLines(path).size(), 3 * lines.size() - 2);
+
+    std::filesystem::remove(path);
+}
+
+TEST(AutotuneThreadsTest, RejectsCorruptedCache)
+{
+    AutotuneProblem problem;
+    const std::string path = (std::filesystem::temp_directory_path() / "gmgpolar_corrupted_tuning.txt").string();
+    std::ofstream(path) << "corrupted\n";
+
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, true, path);
+    EXPECT_THROW(solver.setup(), std::runtime_error);
+
+    std::filesystem::remove(path);
+}
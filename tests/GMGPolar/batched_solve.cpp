@@ -0,0 +1,287 @@
+#include <gtest/gtest.h>
+
+#include <cmath>
+#include <vector>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+void configureSolver(GMGPolar& solver)
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(1);
+    solver.threadReductionFactor(1.0);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(StencilDistributionMethod::CPU_GIVE);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(true);
+    solver.extrapolation(ExtrapolationType::IMPLICIT_EXTRAPOLATION);
+    solver.maxLevels(-1);
+    solver.preSmoothingSteps(1);
+    solver.postSmoothingSteps(1);
+    solver.multigridCycle(MultigridCycleType::V_CYCLE);
+    solver.FMG(false);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-10);
+    solver.relativeTolerance(1e-8);
+}
+} // namespace
+
+TEST(BatchedSolveTest, ColumnsMatchIndividualSolves)
+{
+    const double R0         = 1e-8;
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.66;
+    const int nr_exp        = 4;
+    const int ntheta_exp    = -1;
+    const int anisotropy    = 0;
+    const int divide_by_2   = 1;
+    const double refinement = 0.66;
+
+    PolarGrid grid(R0, Rmax, nr_exp, ntheta_exp, refinement, anisotropy, divide_by_2);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+
+    PolarR6_Boundary_CzarnyGeometry polar_boundary(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry polar_source(Rmax, kappa_eps, delta_e);
+    CartesianR6_Boundary_CzarnyGeometry cartesian_boundary(Rmax, kappa_eps, delta_e);
+    CartesianR6_ZoniShiftedGyro_CzarnyGeometry cartesian_source(Rmax, kappa_eps, delta_e);
+
+    std::vector<const BoundaryConditions*> boundary_conditions = {&polar_boundary, &cartesian_boundary};
+    std::vector<const SourceTerm*> source_terms                = {&polar_source, &cartesian_source};
+
+    GMGPolar batched_solver(grid, domain_geometry, coefficients);
+    configureSolver(batched_solver);
+    batched_solver.setup();
+    batched_solver.solve(boundary_conditions, source_terms);
+
+    ASSERT_EQ(batched_solver.numberOfRightHandSides(), 2);
+    ASSERT_EQ(batched_solver.batchNumberOfIterations().size(), 2u);
+
+    for (int i = 0; i < 2; i++) {
+        GMGPolar solver(grid, domain_geometry, coefficients);
+        configureSolver(solver);
+        solver.setup();
+        solver.solve(*boundary_conditions[i], *source_terms[i]);
+
+        ConstVector<double> reference = solver.solution();
+        ConstVector<double> column    = batched_solver.solution(i);
+        ASSERT_EQ(column.size(), reference.size());
+        EXPECT_EQ(batched_solver.batchNumberOfIterations()[i], solver.numberOfIterations());
+        for (std::size_t j = 0; j < reference.size(); j++) {
+            EXPECT_DOUBLE_EQ(column[j], reference[j]);
+        }
+    }
+}
+
+TEST(BatchedSolveTest, SharedBoundaryConditions)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.66;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, 0.66, 0, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+
+    PolarR6_Boundary_CzarnyGeometry boundary(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source(Rmax, kappa_eps, delta_e);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    configureSolver(solver);
+    solver.setup();
+    solver.solve({&boundary}, {&source, &source, &source});
+
+    ASSERT_EQ(solver.numberOfRightHandSides(), 3);
+    for (int i = 1; i < 3; i++) {
+        ConstVector<double> first  = solver.solution(0);
+        ConstVector<double> column = solver.solution(i);
+        for (std::size_t j = 0; j < first.size(); j++) {
+            EXPECT_DOUBLE_EQ(column[j], first[j]);
+        }
+    }
+
+    EXPECT_THROW(solver.solution(3), std::out_of_range);
+    EXPECT_THROW(solver.solve({&boundary, &boundary}, {&source, &source, &source}), std::invalid_argument);
+}
+
+// Without extrapolation the multigrid iteration runs on all columns at once. The columns converge after
+// different numbers of iterations and have to match the individual solves.
+TEST(BatchedSolveTest, MultigridIterationOnAllColumns)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.66;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, 0.66, 0, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+
+    PolarR6_Boundary_CzarnyGeometry polar_boundary(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry polar_source(Rmax, kappa_eps, delta_e);
+    CartesianR6_Boundary_CzarnyGeometry cartesian_boundary(Rmax, kappa_eps, delta_e);
+    CartesianR6_ZoniShiftedGyro_CzarnyGeometry cartesian_source(Rmax, kappa_eps, delta_e);
+
+    std::vector<const BoundaryConditions*> boundary_conditions = {&polar_boundary, &cartesian_boundary,
+                                                                  &polar_boundary};
+    std::vector<const SourceTerm*> source_terms = {&polar_source, &cartesian_source, &polar_source};
+
+    auto configure = [](GMGPolar& solver, const double relative_tolerance) {
+        configureSolver(solver);
+        solver.maxOpenMPThreads(2);
+        solver.stencilDistributionMethod(StencilDistributionMethod::CPU_TAKE);
+        solver.extrapolation(ExtrapolationType::NONE);
+        solver.relativeTolerance(relative_tolerance);
+    };
+
+    for (const double relative_tolerance : {1e-8, 1e-4}) {
+        GMGPolar batched_solver(grid, domain_geometry, coefficients);
+        configure(batched_solver, relative_tolerance);
+        batched_solver.setup();
+        batched_solver.solve(boundary_conditions, source_terms);
+        ASSERT_EQ(batched_solver.numberOfRightHandSides(), 3);
+
+        for (int i = 0; i < 3; i++) {
+            GMGPolar solver(grid, domain_geometry, coefficients);
+            configure(solver, relative_tolerance);
+            solver.setup();
+            solver.solve(*boundary_conditions[i], *source_terms[i]);
+
+            ConstVector<double> reference = solver.solution();
+            ConstVector<double> column    = batched_solver.solution(i);
+            EXPECT_EQ(batched_solver.batchNumberOfIterations()[i], solver.numberOfIterations());
+            for (std::size_t j = 0; j < reference.size(); j++) {
+                EXPECT_DOUBLE_EQ(column[j], reference[j]);
+            }
+        }
+    }
+}
+
+TEST(BatchedSolveTest, RejectsNullInputs)
+{
+    const double Rmax = 1.3;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, 0.66, 0, 1);
+    CzarnyGeometry domain_geometry(Rmax, 0.3, 1.4);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, 0.66);
+
+    PolarR6_Boundary_CzarnyGeometry boundary(Rmax, 0.3, 1.4);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source(Rmax, 0.3, 1.4);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    configureSolver(solver);
+    solver.setup();
+
+    // The inputs are checked before the first column is solved.
+    EXPECT_THROW(solver.solve({&boundary, nullptr}, {&source, &source}), std::invalid_argument);
+    EXPECT_THROW(solver.solve({&boundary}, {&source, nullptr}), std::invalid_argument);
+    EXPECT_EQ(solver.numberOfRightHandSides(), 0);
+}
+
+// With mixedPrecision() the columns are corrected in single precision like the individual solves.
+TEST(BatchedSolveTest, MixedPrecisionMatchesIndividualSolves)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.66;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, 0.66, 0, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+
+    PolarR6_Boundary_CzarnyGeometry polar_boundary(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry polar_source(Rmax, kappa_eps, delta_e);
+    CartesianR6_Boundary_CzarnyGeometry cartesian_boundary(Rmax, kappa_eps, delta_e);
+    CartesianR6_ZoniShiftedGyro_CzarnyGeometry cartesian_source(Rmax, kappa_eps, delta_e);
+
+    std::vector<const BoundaryConditions*> boundary_conditions = {&polar_boundary, &cartesian_boundary};
+    std::vector<const SourceTerm*> source_terms                = {&polar_source, &cartesian_source};
+
+    auto configure = [](GMGPolar& solver) {
+        configureSolver(solver);
+        solver.stencilDistributionMethod(StencilDistributionMethod::CPU_TAKE);
+        solver.extrapolation(ExtrapolationType::NONE);
+        solver.mixedPrecision(true);
+    };
+
+    GMGPolar batched_solver(grid, domain_geometry, coefficients);
+    configure(batched_solver);
+    batched_solver.setup();
+    batched_solver.solve(boundary_conditions, source_terms);
+    ASSERT_EQ(batched_solver.numberOfRightHandSides(), 2);
+
+    for (int i = 0; i < 2; i++) {
+        GMGPolar solver(grid, domain_geometry, coefficients);
+        configure(solver);
+        solver.setup();
+        solver.solve(*boundary_conditions[i], *source_terms[i]);
+
+        ConstVector<double> reference = solver.solution();
+        ConstVector<double> column    = batched_solver.solution(i);
+        EXPECT_EQ(batched_solver.batchNumberOfIterations()[i], solver.numberOfIterations());
+        for (std::size_t j = 0; j < reference.size(); j++) {
+            EXPECT_EQ(column[j], reference[j]);
+        }
+    }
+}
+
+// The W- and F-cycles recurse on all columns at once, with one coarse solve for all columns per visit.
+TEST(BatchedSolveTest, WAndFCyclesMatchIndividualSolves)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.66;
+
+    PolarGrid grid(1e-8, Rmax, 5, -1, 0.66, 0, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+
+    PolarR6_Boundary_CzarnyGeometry polar_boundary(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry polar_source(Rmax, kappa_eps, delta_e);
+    CartesianR6_Boundary_CzarnyGeometry cartesian_boundary(Rmax, kappa_eps, delta_e);
+    CartesianR6_ZoniShiftedGyro_CzarnyGeometry cartesian_source(Rmax, kappa_eps, delta_e);
+
+    std::vector<const BoundaryConditions*> boundary_conditions = {&polar_boundary, &cartesian_boundary};
+    std::vector<const SourceTerm*> source_terms                = {&polar_source, &cartesian_source};
+
+    for (const MultigridCycleType cycle : {MultigridCycleType::W_CYCLE, MultigridCycleType::F_CYCLE}) {
+        for (const StencilDistributionMethod method :
+             {StencilDistributionMethod::CPU_GIVE, StencilDistributionMethod::CPU_TAKE}) {
+            auto configure = [cycle, method](GMGPolar& solver) {
+                configureSolver(solver);
+                solver.stencilDistributionMethod(method);
+                solver.extrapolation(ExtrapolationType::NONE);
+                solver.multigridCycle(cycle);
+            };
+
+            GMGPolar batched_solver(grid, domain_geometry, coefficients);
+            configure(batched_solver);
+            batched_solver.setup();
+            batched_solver.solve(boundary_conditions, source_terms);
+            ASSERT_EQ(batched_solver.numberOfRightHandSides(), 2);
+
+            for (int i = 0; i < 2; i++) {
+                GMGPolar solver(grid, domain_geometry, coefficients);
+                configure(solver);
+                solver.setup();
+                solver.solve(*boundary_conditions[i], *source_terms[i]);
+
+                ConstVector<double> reference = solver.solution();
+                ConstVector<double> column    = batched_solver.solution(i);
+                EXPECT_EQ(batched_solver.batchNumberOfIterations()[i], solver.numberOfIterations());
+                for (std::size_t j = 0; j < reference.size(); j++) {
+                    EXPECT_DOUBLE_EQ(column[j], reference[j]);
+                }
+            }
+        }
+    }
+}
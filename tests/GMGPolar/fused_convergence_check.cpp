@@ -0,0 +1,164 @@
+#include <gtest/gtest.h>
+
+#include <cstdlib>
+#include <optional>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+struct FusedCheckResult {
+    int iterations;
+    double l2_error;
+    std::vector<double> residual_norms;
+};
+
+FusedCheckResult solveWithConvergenceCheck(bool fused_convergence_check, ExtrapolationType extrapolation,
+                                           StencilDistributionMethod stencil, MultigridCycleType cycle,
+                                           int pre_smoothing_steps, int max_iterations = 150,
+                                           std::optional<double> absolute_tolerance = 1e-12,
+                                           std::optional<double> relative_tolerance = 1e-10)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, alpha_jump, 3, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term(Rmax, kappa_eps, delta_e);
+    PolarR6_CzarnyGeometry exact_solution(Rmax, kappa_eps, delta_e);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(1);
+    solver.threadReductionFactor(1.0);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(stencil);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(true);
+    solver.extrapolation(extrapolation);
+    solver.maxLevels(-1);
+    solver.preSmoothingSteps(pre_smoothing_steps);
+    solver.postSmoothingSteps(2 - pre_smoothing_steps);
+    solver.multigridCycle(cycle);
+    solver.FMG(false);
+    solver.maxIterations(max_iterations);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(absolute_tolerance);
+    solver.relativeTolerance(relative_tolerance);
+    solver.fusedConvergenceCheck(fused_convergence_check);
+
+    solver.setup();
+    solver.setSolution(&exact_solution);
+    solver.solve(boundary_conditions, source_term);
+
+    return {solver.numberOfIterations(), solver.exactErrorWeightedEuclidean().value(), solver.residualNorms()};
+}
+} // namespace
+
+// Without presmoothing the cycle computes the residual of the iterate it starts from. The fused check then
+// reports exactly the residual norms of the standard check, delayed by one iteration, except for the last norm,
+// which belongs to the returned solution.
+TEST(FusedConvergenceCheckTest, MatchesDelayedStandardCheckWithoutPresmoothing)
+{
+    FusedCheckResult standard = solveWithConvergenceCheck(false, ExtrapolationType::NONE,
+                                                          StencilDistributionMethod::CPU_GIVE,
+                                                          MultigridCycleType::V_CYCLE, 0);
+    FusedCheckResult fused = solveWithConvergenceCheck(true, ExtrapolationType::NONE,
+                                                       StencilDistributionMethod::CPU_GIVE,
+                                                       MultigridCycleType::V_CYCLE, 0);
+
+    EXPECT_EQ(fused.iterations, standard.iterations + 1);
+    ASSERT_EQ(fused.residual_norms.size(), standard.residual_norms.size() + 1);
+    EXPECT_DOUBLE_EQ(fused.residual_norms[0], standard.residual_norms[0]);
+    for (std::size_t i = 0; i + 1 < standard.residual_norms.size(); i++) {
+        EXPECT_DOUBLE_EQ(fused.residual_norms[i + 1], standard.residual_norms[i]);
+    }
+    EXPECT_LT(fused.residual_norms.back(), standard.residual_norms.back());
+}
+
+TEST(FusedConvergenceCheckTest, ConvergesWithPresmoothing)
+{
+    FusedCheckResult standard = solveWithConvergenceCheck(false, ExtrapolationType::NONE,
+                                                          StencilDistributionMethod::CPU_TAKE,
+                                                          MultigridCycleType::W_CYCLE, 1);
+    FusedCheckResult fused = solveWithConvergenceCheck(true, ExtrapolationType::NONE,
+                                                       StencilDistributionMethod::CPU_TAKE,
+                                                       MultigridCycleType::W_CYCLE, 1);
+
+    EXPECT_LE(std::abs(fused.iterations - standard.iterations), 1);
+    EXPECT_NEAR(fused.l2_error, standard.l2_error, 1e-10);
+    EXPECT_DOUBLE_EQ(fused.residual_norms.front(), standard.residual_norms.front());
+}
+
+TEST(FusedConvergenceCheckTest, ConvergesWithImplicitExtrapolation)
+{
+    FusedCheckResult standard = solveWithConvergenceCheck(false, ExtrapolationType::IMPLICIT_EXTRAPOLATION,
+                                                          StencilDistributionMethod::CPU_GIVE,
+                                                          MultigridCycleType::V_CYCLE, 1);
+    FusedCheckResult fused = solveWithConvergenceCheck(true, ExtrapolationType::IMPLICIT_EXTRAPOLATION,
+                                                       StencilDistributionMethod::CPU_GIVE,
+                                                       MultigridCycleType::V_CYCLE, 1);
+
+    EXPECT_LE(std::abs(fused.iterations - standard.iterations), 1);
+    EXPECT_NEAR(fused.l2_error, standard.l2_error, 1e-10);
+    EXPECT_DOUBLE_EQ(fused.residual_norms.front(), standard.residual_norms.front());
+}
+
+// The extrapolated residual of the cycle matches the one of the standard check as well.
+TEST(FusedConvergenceCheckTest, MatchesDelayedExtrapolatedResidualWithoutPresmoothing)
+{
+    FusedCheckResult standard = solveWithConvergenceCheck(false, ExtrapolationType::IMPLICIT_EXTRAPOLATION,
+                                                          StencilDistributionMethod::CPU_TAKE,
+                                                          MultigridCycleType::F_CYCLE, 0);
+    FusedCheckResult fused = solveWithConvergenceCheck(true, ExtrapolationType::IMPLICIT_EXTRAPOLATION,
+                                                       StencilDistributionMethod::CPU_TAKE,
+                                                       MultigridCycleType::F_CYCLE, 0);
+
+    EXPECT_EQ(fused.iterations, standard.iterations + 1);
+    ASSERT_EQ(fused.residual_norms.size(), standard.residual_norms.size() + 1);
+    EXPECT_DOUBLE_EQ(fused.residual_norms[0], standard.residual_norms[0]);
+    for (std::size_t i = 0; i + 1 < standard.residual_norms.size(); i++) {
+        EXPECT_DOUBLE_EQ(fused.residual_norms[i + 1], standard.residual_norms[i]);
+    }
+    EXPECT_LT(fused.residual_norms.back(), standard.residual_norms.back());
+}
+
+// The last norm of the fused check is the residual of the returned solution, which the standard check computes
+// when it runs one more iteration without converging.
+TEST(FusedConvergenceCheckTest, FinalResidualNormBelongsToReturnedSolution)
+{
+    FusedCheckResult fused = solveWithConvergenceCheck(true, ExtrapolationType::NONE,
+                                                       StencilDistributionMethod::CPU_TAKE,
+                                                       MultigridCycleType::W_CYCLE, 1);
+    FusedCheckResult reference = solveWithConvergenceCheck(false, ExtrapolationType::NONE,
+                                                           StencilDistributionMethod::CPU_TAKE,
+                                                           MultigridCycleType::W_CYCLE, 1, fused.iterations + 1,
+                                                           0.0, std::nullopt);
+
+    ASSERT_EQ(fused.residual_norms.size(), static_cast<std::size_t>(fused.iterations) + 1);
+    ASSERT_GT(reference.residual_norms.size(), static_cast<std::size_t>(fused.iterations));
+    EXPECT_DOUBLE_EQ(fused.residual_norms.back(), reference.residual_norms[fused.iterations]);
+    EXPECT_LE(fused.residual_norms.back(), 1e-12);
+}
+
+// Without convergence the residual of the solution after the last iteration is recorded as well.
+TEST(FusedConvergenceCheckTest, FinalResidualNormAfterMaxIterations)
+{
+    const int max_iterations = 3;
+    FusedCheckResult fused   = solveWithConvergenceCheck(true, ExtrapolationType::IMPLICIT_EXTRAPOLATION,
+                                                         StencilDistributionMethod::CPU_GIVE,
+                                                         MultigridCycleType::V_CYCLE, 1, max_iterations);
+    FusedCheckResult reference = solveWithConvergenceCheck(false, ExtrapolationType::IMPLICIT_EXTRAPOLATION,
+                                                           StencilDistributionMethod::CPU_GIVE,
+                                                           MultigridCycleType::V_CYCLE, 1, max_iterations + 1);
+
+    EXPECT_EQ(fused.iterations, max_iterations);
+    ASSERT_EQ(fused.residual_norms.size(), static_cast<std::size_t>(max_iterations) + 1);
+    ASSERT_EQ(reference.residual_norms.size(), static_cast<std::size_t>(max_iterations) + 1);
+    EXPECT_DOUBLE_EQ(fused.residual_norms.back(), reference.residual_norms.back());
+}
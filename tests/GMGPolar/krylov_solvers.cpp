@@ -0,0 +1,110 @@
+#include <gtest/gtest.h>
+
+#include <cmath>
+#include <vector>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+struct KrylovResult {
+    int iterations;
+    double l2_error;
+    double residual_reduction;
+};
+
+KrylovResult solveWithOuterSolver(OuterSolverType outer_solver, MultigridCycleType cycle,
+                                  StencilDistributionMethod stencil)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, alpha_jump, 3, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term(Rmax, kappa_eps, delta_e);
+    PolarR6_CzarnyGeometry exact_solution(Rmax, kappa_eps, delta_e);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(1);
+    solver.threadReductionFactor(1.0);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(stencil);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(true);
+    solver.extrapolation(ExtrapolationType::NONE);
+    solver.maxLevels(-1);
+    solver.preSmoothingSteps(1);
+    solver.postSmoothingSteps(1);
+    solver.multigridCycle(cycle);
+    solver.FMG(false);
+    solver.outerSolver(outer_solver);
+    solver.FGMRES_restart(10);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-12);
+    solver.relativeTolerance(1e-10);
+
+    solver.setup();
+    solver.setSolution(&exact_solution);
+    solver.solve(boundary_conditions, source_term);
+
+    EXPECT_EQ(solver.outerSolver(), outer_solver);
+    EXPECT_EQ(solver.residualNorms().size(), static_cast<std::size_t>(solver.numberOfIterations() + 1));
+    EXPECT_GE(solver.timeAvgMGCKrylov(), 0.0);
+
+    return {solver.numberOfIterations(), solver.exactErrorWeightedEuclidean().value(),
+            solver.meanResidualReductionFactor()};
+}
+} // namespace
+
+TEST(KrylovSolverTest, PCGAcceleratesMultigrid)
+{
+    KrylovResult multigrid =
+        solveWithOuterSolver(OuterSolverType::MULTIGRID_ITERATION, MultigridCycleType::V_CYCLE,
+                             StencilDistributionMethod::CPU_TAKE);
+    KrylovResult pcg =
+        solveWithOuterSolver(OuterSolverType::PCG, MultigridCycleType::V_CYCLE, StencilDistributionMethod::CPU_TAKE);
+
+    EXPECT_LT(pcg.iterations, multigrid.iterations);
+    EXPECT_LT(pcg.residual_reduction, multigrid.residual_reduction);
+    EXPECT_NEAR(pcg.l2_error, multigrid.l2_error, 1e-8);
+}
+
+TEST(KrylovSolverTest, FGMRESAcceleratesMultigrid)
+{
+    KrylovResult multigrid =
+        solveWithOuterSolver(OuterSolverType::MULTIGRID_ITERATION, MultigridCycleType::W_CYCLE,
+                             StencilDistributionMethod::CPU_GIVE);
+    KrylovResult fgmres =
+        solveWithOuterSolver(OuterSolverType::FGMRES, MultigridCycleType::W_CYCLE, StencilDistributionMethod::CPU_GIVE);
+
+    EXPECT_LT(fgmres.iterations, multigrid.iterations);
+    EXPECT_LT(fgmres.residual_reduction, multigrid.residual_reduction);
+    EXPECT_NEAR(fgmres.l2_error, multigrid.l2_error, 1e-8);
+}
+
+TEST(KrylovSolverTest, RequiresNoExtrapolation)
+{
+    const double Rmax = 1.3;
+    PolarGrid grid(1e-8, Rmax, 3, -1, 0.66, 0, 1);
+    CzarnyGeometry domain_geometry(Rmax, 0.3, 1.4);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, 0.66);
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions(Rmax, 0.3, 1.4);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term(Rmax, 0.3, 1.4);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    solver.verbose(0);
+    solver.maxOpenMPThreads(1);
+    solver.extrapolation(ExtrapolationType::IMPLICIT_EXTRAPOLATION);
+    solver.outerSolver(OuterSolverType::FGMRES);
+    solver.setup();
+
+    EXPECT_THROW(solver.solve(boundary_conditions, source_term), std::invalid_argument);
+    EXPECT_THROW(solver.FGMRES_restart(0), std::invalid_argument);
+}
@@ -0,0 +1,185 @@
+#include <gtest/gtest.h>
+
+#include <filesystem>
+
+#include "../../include/GMGPolar/solve_context.h"
+
+namespace
+{
+struct MemoryLeanProblem {
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid{1e-8, Rmax, 5, -1, alpha_jump, 3, 1};
+    CzarnyGeometry domain_geometry{Rmax, kappa_eps, delta_e};
+    ZoniShiftedGyroCoefficients coefficients{Rmax, alpha_jump};
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions{Rmax, kappa_eps, delta_e};
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term{Rmax, kappa_eps, delta_e};
+    PolarR6_CzarnyGeometry exact_solution{Rmax, kappa_eps, delta_e};
+};
+
+void configureSolver(GMGPolar& solver, bool memory_lean, ExtrapolationType extrapolation,
+                     StencilDistributionMethod stencil, MultigridCycleType cycle, bool FMG)
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(2);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(stencil);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(true);
+    solver.memoryLean(memory_lean);
+    solver.extrapolation(extrapolation);
+    solver.multigridCycle(cycle);
+    solver.FMG(FMG);
+    solver.FMG_iterations(2);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-12);
+    solver.relativeTolerance(1e-10);
+}
+
+// The memory-lean hierarchy only changes where values are stored, so both solvers converge alike.
+void compareWithCachedHierarchy(ExtrapolationType extrapolation, StencilDistributionMethod stencil,
+                                MultigridCycleType cycle, bool FMG)
+{
+    MemoryLeanProblem problem;
+
+    GMGPolar cached(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(cached, false, extrapolation, stencil, cycle, FMG);
+    cached.setup();
+    cached.setSolution(&problem.exact_solution);
+    cached.solve(problem.boundary_conditions, problem.source_term);
+
+    GMGPolar lean(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(lean, true, extrapolation, stencil, cycle, FMG);
+    lean.setup();
+    lean.setSolution(&problem.exact_solution);
+    lean.solve(problem.boundary_conditions, problem.source_term);
+
+    EXPECT_LE(std::abs(lean.numberOfIterations() - cached.numberOfIterations()), 1);
+    EXPECT_NEAR(lean.exactErrorWeightedEuclidean().value(), cached.exactErrorWeightedEuclidean().value(), 1e-10);
+    EXPECT_LT(lean.memoryReport().total(), cached.memoryReport().total());
+}
+} // namespace
+
+TEST(MemoryLeanTest, GiveVCycle)
+{
+    compareWithCachedHierarchy(ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE,
+                               MultigridCycleType::V_CYCLE, false);
+}
+
+TEST(MemoryLeanTest, TakeWCycle)
+{
+    compareWithCachedHierarchy(ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE,
+                               MultigridCycleType::W_CYCLE, false);
+}
+
+TEST(MemoryLeanTest, GiveImplicitExtrapolationFCycle)
+{
+    compareWithCachedHierarchy(ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_GIVE,
+                               MultigridCycleType::F_CYCLE, false);
+}
+
+TEST(MemoryLeanTest, TakeImplicitExtrapolationVCycle)
+{
+    compareWithCachedHierarchy(ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_TAKE,
+                               MultigridCycleType::V_CYCLE, false);
+}
+
+TEST(MemoryLeanTest, FMGKeepsSolutionVectors)
+{
+    compareWithCachedHierarchy(ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_GIVE,
+                               MultigridCycleType::W_CYCLE, true);
+}
+
+TEST(MemoryLeanTest, CoarseLevelsEvaluateOnTheFlyAndShareSolutions)
+{
+    MemoryLeanProblem problem;
+    GMGPolar cached(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(cached, false, ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE,
+                    MultigridCycleType::V_CYCLE, false);
+    cached.setup();
+    GMGPolar lean(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(lean, true, ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE,
+                    MultigridCycleType::V_CYCLE, false);
+    lean.setup();
+
+    const MemoryReport cached_report = cached.memoryReport();
+    const MemoryReport lean_report   = lean.memoryReport();
+    ASSERT_EQ(lean_report.levels.size(), cached_report.levels.size());
+    ASSERT_GE(lean_report.levels.size(), 3u);
+
+    // The Take operators of the finest level keep its level cache.
+    EXPECT_EQ(lean_report.levels[0].total(), cached_report.levels[0].total());
+    for (std::size_t level_depth = 1; level_depth < lean_report.levels.size(); level_depth++) {
+        const LevelMemory& level = lean_report.levels[level_depth];
+        // Only sin_theta and cos_theta remain.
+        EXPECT_EQ(level.levelCache(), 2 * level.level_cache[0].second);
+        EXPECT_LT(level.levelCache(), cached_report.levels[level_depth].levelCache());
+        // Without extrapolation the coarse levels use the residual of the finest level as solution vector.
+        EXPECT_EQ(3 * level.vectors, 2 * cached_report.levels[level_depth].vectors);
+    }
+}
+
+// With the Give operators the finest level evaluates on the fly as well. For nr_exp = 6 and the default
+// caching the hierarchy shrinks from 2,504,148 to 1,707,924 bytes without extrapolation (-31.8%) and from
+// 2,440,820 to 1,711,156 bytes with implicit extrapolation (-29.9%).
+TEST(MemoryLeanTest, GiveHierarchySavings)
+{
+    MemoryLeanProblem problem;
+    PolarGrid grid(1e-8, problem.Rmax, 6, -1, problem.alpha_jump, 0, 1);
+
+    for (const ExtrapolationType extrapolation :
+         {ExtrapolationType::NONE, ExtrapolationType::IMPLICIT_EXTRAPOLATION}) {
+        std::size_t total_bytes[2];
+        for (const bool memory_lean : {false, true}) {
+            GMGPolar solver(grid, problem.domain_geometry, problem.coefficients);
+            configureSolver(solver, memory_lean, extrapolation, StencilDistributionMethod::CPU_GIVE,
+                            MultigridCycleType::V_CYCLE, false);
+            solver.cacheDomainGeometry(false);
+            solver.setup();
+            const MemoryReport report = solver.memoryReport();
+            total_bytes[memory_lean]  = report.total();
+
+            if (memory_lean)
+                EXPECT_EQ(report.levels[0].levelCache(), 2 * report.levels[0].level_cache[0].second);
+        }
+        EXPECT_LE(total_bytes[1], 0.71 * total_bytes[0]);
+    }
+}
+
+TEST(MemoryLeanTest, SolveContextsAndSetupFiles)
+{
+    MemoryLeanProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, true, ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_TAKE,
+                    MultigridCycleType::V_CYCLE, false);
+    solver.setup();
+    solver.solve(problem.boundary_conditions, problem.source_term);
+
+    SolveContext context(solver);
+    context.solve(problem.boundary_conditions, problem.source_term);
+    EXPECT_EQ(context.numberOfIterations(), solver.numberOfIterations());
+    EXPECT_TRUE(equals<double>(context.solution(), solver.solution()));
+
+    const std::string path = (std::filesystem::temp_directory_path() / "gmgpolar_memory_lean.setup").string();
+    solver.saveSetup(path);
+
+    GMGPolar loaded(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(loaded, true, ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_TAKE,
+                    MultigridCycleType::V_CYCLE, false);
+    loaded.loadSetup(path);
+    loaded.solve(problem.boundary_conditions, problem.source_term);
+    EXPECT_EQ(loaded.numberOfIterations(), solver.numberOfIterations());
+    EXPECT_TRUE(equals<double>(loaded.solution(), solver.solution()));
+
+    GMGPolar not_lean(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(not_lean, false, ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_TAKE,
+                    MultigridCycleType::V_CYCLE, false);
+    EXPECT_THROW(not_lean.loadSetup(path), std::runtime_error);
+
+    std::filesystem::remove(path);
+}
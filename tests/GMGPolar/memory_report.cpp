@@ -0,0 +1,132 @@
+#include <gtest/gtest.h>
+
+#include <algorithm>
+#include <sstream>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+struct MemoryProblem {
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid{1e-8, Rmax, 4, -1, alpha_jump, 3, 1};
+    CzarnyGeometry domain_geometry{Rmax, kappa_eps, delta_e};
+    ZoniShiftedGyroCoefficients coefficients{Rmax, alpha_jump};
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions{Rmax, kappa_eps, delta_e};
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term{Rmax, kappa_eps, delta_e};
+};
+
+void configureSolver(GMGPolar& solver, ExtrapolationType extrapolation, bool cache_domain_geometry)
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(1);
+    solver.stencilDistributionMethod(StencilDistributionMethod::CPU_GIVE);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(cache_domain_geometry);
+    solver.extrapolation(extrapolation);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-10);
+    solver.relativeTolerance(1e-8);
+}
+
+std::size_t cachedArrayBytes(const LevelMemory& level, const std::string& name)
+{
+    auto array = std::find_if(level.level_cache.begin(), level.level_cache.end(), [&](const auto& entry) {
+        return entry.first == name;
+    });
+    return array == level.level_cache.end() ? 0 : array->second;
+}
+} // namespace
+
+TEST(MemoryReportTest, AccountsForEveryLevel)
+{
+    MemoryProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, ExtrapolationType::NONE, true);
+    solver.setup();
+
+    const MemoryReport report = solver.memoryReport();
+    ASSERT_EQ(report.levels.size(), solver.threadsPerLevel().size());
+    const int coarsest_level = report.levels.size() - 1;
+    ASSERT_GE(coarsest_level, 1);
+
+    // The finest level holds rhs, solution and residual, but no error correction.
+    const PolarGrid& finest_grid = solver.grid();
+    const std::size_t nodes      = finest_grid.numberOfNodes();
+    EXPECT_EQ(report.levels[0].vectors, 3 * nodes * sizeof(double));
+    EXPECT_EQ(cachedArrayBytes(report.levels[0], "sin_theta"), finest_grid.ntheta() * sizeof(double));
+    // alpha is folded into the cached geometry terms.
+    EXPECT_EQ(cachedArrayBytes(report.levels[0], "coeff_alpha"), 0u);
+    EXPECT_EQ(cachedArrayBytes(report.levels[0], "coeff_beta"), nodes * sizeof(double));
+    EXPECT_EQ(cachedArrayBytes(report.levels[0], "arr"), nodes * sizeof(double));
+    EXPECT_EQ(cachedArrayBytes(report.levels[0], "detDF"), nodes * sizeof(double));
+
+    std::size_t total = 0;
+    for (int level_depth = 0; level_depth <= coarsest_level; level_depth++) {
+        const LevelMemory& level = report.levels[level_depth];
+        EXPECT_GT(level.vectors, 0u);
+        EXPECT_EQ(level.extrapolated_smoother, 0u);
+        if (level_depth < coarsest_level) {
+            EXPECT_GT(level.smoother, 0u);
+            EXPECT_EQ(level.direct_solver, 0u);
+        }
+        else {
+            EXPECT_EQ(level.smoother, 0u);
+            EXPECT_GT(level.direct_solver, 0u);
+        }
+        total += level.total();
+    }
+    EXPECT_EQ(report.total(), total);
+}
+
+TEST(MemoryReportTest, AccountsForExtrapolatedSmootherAndUncachedGeometry)
+{
+    MemoryProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, ExtrapolationType::IMPLICIT_EXTRAPOLATION, false);
+    solver.setup();
+
+    const MemoryReport report = solver.memoryReport();
+    EXPECT_GT(report.levels[0].extrapolated_smoother, 0u);
+    EXPECT_EQ(report.levels[0].smoother, 0u);
+    EXPECT_GT(report.levels[1].smoother, 0u);
+    for (const LevelMemory& level : report.levels) {
+        EXPECT_EQ(cachedArrayBytes(level, "arr"), 0u);
+        EXPECT_EQ(cachedArrayBytes(level, "detDF"), 0u);
+    }
+}
+
+TEST(MemoryReportTest, TracksHighWaterMarks)
+{
+    MemoryProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, ExtrapolationType::NONE, true);
+
+    EXPECT_EQ(solver.memoryReport().setup_high_water_mark, -1);
+    solver.setup();
+    MemoryReport report = solver.memoryReport();
+    EXPECT_GT(report.setup_resident_set_size, 0);
+    EXPECT_GT(report.setup_high_water_mark, 0);
+    EXPECT_EQ(report.solve_high_water_mark, -1);
+
+    solver.solve(problem.boundary_conditions, problem.source_term);
+    report = solver.memoryReport();
+    EXPECT_GT(report.solve_resident_set_size, 0);
+    EXPECT_GE(report.solve_high_water_mark, report.setup_high_water_mark);
+
+    std::ostringstream stream;
+    report.writeJSON(stream);
+    const std::string json = stream.str();
+    EXPECT_NE(json.find("\"totalBytes\": " + std::to_string(report.total())), std::string::npos);
+    EXPECT_NE(json.find("\"solveHighWaterMark\""), std::string::npos);
+    EXPECT_NE(json.find("\"level\": 0"), std::string::npos);
+    EXPECT_NE(json.find("\"levelCache\": {\"sin_theta\""), std::string::npos);
+    EXPECT_EQ(std::count(json.begin(), json.end(), '{'), std::count(json.begin(), json.end(), '}'));
+    EXPECT_EQ(std::count(json.begin(), json.end(), '['), std::count(json.begin(), json.end(), ']'));
+}
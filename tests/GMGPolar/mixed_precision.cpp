@@ -0,0 +1,94 @@
+#include <gtest/gtest.h>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+struct PrecisionResult {
+    int iterations;
+    double l2_error;
+    double residual;
+};
+
+PrecisionResult solveWithPrecision(bool mixed_precision, ExtrapolationType extrapolation,
+                                   StencilDistributionMethod stencil, MultigridCycleType cycle)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, alpha_jump, 3, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term(Rmax, kappa_eps, delta_e);
+    PolarR6_CzarnyGeometry exact_solution(Rmax, kappa_eps, delta_e);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(1);
+    solver.threadReductionFactor(1.0);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(stencil);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(true);
+    solver.mixedPrecision(mixed_precision);
+    solver.extrapolation(extrapolation);
+    solver.maxLevels(-1);
+    solver.preSmoothingSteps(1);
+    solver.postSmoothingSteps(1);
+    solver.multigridCycle(cycle);
+    solver.FMG(false);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-12);
+    solver.relativeTolerance(1e-10);
+
+    solver.setup();
+    solver.setSolution(&exact_solution);
+    solver.solve(boundary_conditions, source_term);
+
+    EXPECT_EQ(solver.mixedPrecision(), mixed_precision);
+
+    return {solver.numberOfIterations(), solver.exactErrorWeightedEuclidean().value(),
+            solver.residualNorms().back()};
+}
+
+void compareWithDoublePrecision(ExtrapolationType extrapolation, StencilDistributionMethod stencil,
+                                MultigridCycleType cycle = MultigridCycleType::V_CYCLE)
+{
+    PrecisionResult double_precision = solveWithPrecision(false, extrapolation, stencil, cycle);
+    PrecisionResult mixed_precision  = solveWithPrecision(true, extrapolation, stencil, cycle);
+
+    // The rounded factors and, with Take and no extrapolation, the single precision correction cycle only
+    // perturb the coarse grid correction, the outer iteration converges to the same solution.
+    EXPECT_LE(mixed_precision.iterations, double_precision.iterations + 2);
+    EXPECT_NEAR(mixed_precision.l2_error, double_precision.l2_error, 1e-8);
+    EXPECT_LT(mixed_precision.residual, 1e-8);
+}
+} // namespace
+
+TEST(MixedPrecisionTest, TakeNoExtrapolation)
+{
+    compareWithDoublePrecision(ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE);
+}
+
+// The correction cycles below the finest level run on single precision vectors.
+TEST(MixedPrecisionTest, TakeNoExtrapolationWCycle)
+{
+    compareWithDoublePrecision(ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE,
+                               MultigridCycleType::W_CYCLE);
+}
+
+TEST(MixedPrecisionTest, TakeNoExtrapolationFCycle)
+{
+    compareWithDoublePrecision(ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE,
+                               MultigridCycleType::F_CYCLE);
+}
+
+TEST(MixedPrecisionTest, GiveImplicitExtrapolation)
+{
+    compareWithDoublePrecision(ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_GIVE);
+}
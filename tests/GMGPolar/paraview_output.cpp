@@ -0,0 +1,185 @@
+#include <gtest/gtest.h>
+
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <map>
+#include <sstream>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+#ifdef GMGPOLAR_USE_ZLIB
+    #include <zlib.h>
+#endif
+
+namespace
+{
+std::string attribute(const std::string& element, const std::string& key)
+{
+    const std::size_t start = element.find(" " + key + "=\"");
+    if (start == std::string::npos)
+        return "";
+    const std::size_t begin = start + key.size() + 3;
+    return element.substr(begin, element.find('"', begin) - begin);
+}
+
+template <typename T>
+void appendValues(const std::vector<char>& bytes, std::vector<double>& values)
+{
+    for (std::size_t i = 0; i < bytes.size() / sizeof(T); i++) {
+        T value;
+        std::memcpy(&value, bytes.data() + i * sizeof(T), sizeof(T));
+        values.push_back(static_cast<double>(value));
+    }
+}
+
+// Decodes the data arrays of a VTK XML file, independently of VTKWriter.
+std::map<std::string, std::vector<double>> readDataArrays(const std::filesystem::path& path)
+{
+    std::ifstream file(path, std::ios::binary);
+    EXPECT_TRUE(file.is_open()) << path;
+    const std::string content((std::istreambuf_iterator<char>(file)), std::istreambuf_iterator<char>());
+
+    const bool compressed    = content.find("compressor=\"vtkZLibDataCompressor\"") != std::string::npos;
+    const std::string marker = "<AppendedData encoding=\"raw\">\n_";
+    const std::size_t appended =
+        content.find(marker) == std::string::npos ? content.size() : content.find(marker) + marker.size();
+
+    std::map<std::string, std::vector<double>> arrays;
+    for (std::size_t start = content.find("<DataArray "); start != std::string::npos && start < appended;
+         start = content.find("<DataArray ", start + 1)) {
+        const std::string element   = content.substr(start, content.find('>', start) - start);
+        const std::string type      = attribute(element, "type");
+        std::vector<double>& values = arrays[attribute(element, "Name")];
+
+        if (attribute(element, "format") == "ascii") {
+            const std::size_t begin = content.find('>', start) + 1;
+            std::istringstream text(content.substr(begin, content.find("</DataArray>", begin) - begin));
+            double value;
+            while (text >> value)
+                values.push_back(value);
+            continue;
+        }
+
+        const char* data = content.data() + appended + std::stoull(attribute(element, "offset"));
+        std::vector<char> bytes;
+        if (!compressed) {
+            std::uint64_t size;
+            std::memcpy(&size, data, sizeof(size));
+            bytes.assign(data + sizeof(size), data + sizeof(size) + size);
+        }
+        else {
+#ifdef GMGPOLAR_USE_ZLIB
+            std::uint64_t header[3];
+            std::memcpy(header, data, sizeof(header));
+            std::vector<std::uint64_t> compressed_sizes(header[0]);
+            std::memcpy(compressed_sizes.data(), data + sizeof(header), sizeof(std::uint64_t) * header[0]);
+            const char* block = data + sizeof(header) + sizeof(std::uint64_t) * header[0];
+            for (std::uint64_t i = 0; i < header[0]; i++) {
+                uLongf size = (i + 1 == header[0] && header[2] > 0) ? header[2] : header[1];
+                std::vector<char> decompressed(size);
+                EXPECT_EQ(uncompress(reinterpret_cast<Bytef*>(decompressed.data()), &size,
+                                     reinterpret_cast<const Bytef*>(block), compressed_sizes[i]),
+                          Z_OK);
+                bytes.insert(bytes.end(), decompressed.begin(), decompressed.begin() + size);
+                block += compressed_sizes[i];
+            }
+#endif
+        }
+        if (type == "Float64")
+            appendValues<double>(bytes, values);
+        else if (type == "Int32")
+            appendValues<std::int32_t>(bytes, values);
+        else
+            appendValues<std::uint8_t>(bytes, values);
+    }
+    return arrays;
+}
+
+// Solves a small problem with ParaView output of the given format inside 'directory'.
+void solveWithParaviewOutput(const ParaviewFormat format, const std::filesystem::path& directory)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, alpha_jump, 3, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term(Rmax, kappa_eps, delta_e);
+    PolarR6_CzarnyGeometry exact_solution(Rmax, kappa_eps, delta_e);
+
+    std::filesystem::create_directories(directory);
+    const std::filesystem::path working_directory = std::filesystem::current_path();
+    std::filesystem::current_path(directory);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    solver.verbose(0);
+    solver.paraview(true);
+    solver.paraviewFormat(format);
+    solver.maxOpenMPThreads(2);
+    solver.maxIterations(10);
+    solver.setup();
+    solver.setSolution(&exact_solution);
+    solver.solve(boundary_conditions, source_term);
+
+    std::filesystem::current_path(working_directory);
+}
+} // namespace
+
+TEST(ParaviewOutputTest, BinaryFormatsMatchASCII)
+{
+    const std::filesystem::path root = std::filesystem::path(testing::TempDir()) / "gmgpolar_paraview";
+    solveWithParaviewOutput(ParaviewFormat::ASCII, root / "ascii");
+    solveWithParaviewOutput(ParaviewFormat::BINARY, root / "binary");
+#ifdef GMGPOLAR_USE_ZLIB
+    solveWithParaviewOutput(ParaviewFormat::COMPRESSED, root / "compressed");
+#endif
+
+    for (const std::string name : {"output_finest_grid", "output_coarsest_grid", "output_solution", "output_error"}) {
+        const auto ascii  = readDataArrays(root / "ascii" / (name + ".vtu"));
+        const auto binary = readDataArrays(root / "binary" / (name + ".vtu"));
+        ASSERT_FALSE(ascii.at("Points").empty()) << name;
+        EXPECT_EQ(ascii.at("connectivity").size(), ascii.at("offsets").size() * 4) << name;
+        EXPECT_EQ(ascii.count("FunctionValues"), name == "output_solution" || name == "output_error") << name;
+        // ASCII values are written with the shortest representation that reads back exactly.
+        EXPECT_EQ(ascii, binary) << name;
+#ifdef GMGPOLAR_USE_ZLIB
+        EXPECT_EQ(readDataArrays(root / "compressed" / (name + ".vtu")), binary) << name;
+#endif
+    }
+    std::filesystem::remove_all(root);
+}
+
+TEST(ParaviewOutputTest, StructuredGridClosesTheAnnulus)
+{
+    const std::filesystem::path root = std::filesystem::path(testing::TempDir()) / "gmgpolar_paraview_structured";
+    solveWithParaviewOutput(ParaviewFormat::BINARY, root / "unstructured");
+    solveWithParaviewOutput(ParaviewFormat::STRUCTURED, root / "structured");
+
+    const auto unstructured = readDataArrays(root / "unstructured" / "output_solution.vtu");
+    const auto structured   = readDataArrays(root / "structured" / "output_solution.vts");
+    EXPECT_EQ(structured.count("connectivity"), 0);
+
+    // The structured grid repeats one node per circle. The unstructured grid numbers the nodes like the
+    // PolarGrid, cell i_r * ntheta + i_theta starts at the node (i_r, i_theta).
+    const std::vector<double>& connectivity = unstructured.at("connectivity");
+    const std::size_t number_of_points      = unstructured.at("FunctionValues").size();
+    const std::size_t nr                    = structured.at("FunctionValues").size() - number_of_points;
+    const std::size_t ntheta                = number_of_points / nr;
+    ASSERT_EQ(nr * ntheta, number_of_points);
+
+    for (std::size_t i_r = 0; i_r + 1 < nr; i_r++) {
+        for (std::size_t i_theta = 0; i_theta <= ntheta; i_theta++) {
+            const std::size_t cell  = i_r * ntheta + i_theta % ntheta;
+            const std::size_t node  = static_cast<std::size_t>(connectivity[4 * cell]);
+            const std::size_t point = i_r * (ntheta + 1) + i_theta;
+            ASSERT_EQ(structured.at("FunctionValues")[point], unstructured.at("FunctionValues")[node]);
+            for (int c = 0; c < 3; c++)
+                ASSERT_EQ(structured.at("Points")[3 * point + c], unstructured.at("Points")[3 * node + c]);
+        }
+    }
+    std::filesystem::remove_all(root);
+}
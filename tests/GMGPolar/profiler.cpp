@@ -0,0 +1,151 @@
+#include <gtest/gtest.h>
+
+#include <filesystem>
+#include <fstream>
+#include <sstream>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+struct ProfilerProblem {
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid{1e-8, Rmax, 4, -1, alpha_jump, 3, 1};
+    CzarnyGeometry domain_geometry{Rmax, kappa_eps, delta_e};
+    ZoniShiftedGyroCoefficients coefficients{Rmax, alpha_jump};
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions{Rmax, kappa_eps, delta_e};
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term{Rmax, kappa_eps, delta_e};
+};
+
+void configureSolver(GMGPolar& solver, ExtrapolationType extrapolation)
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(1);
+    solver.threadReductionFactor(1.0);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(StencilDistributionMethod::CPU_GIVE);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(false);
+    solver.extrapolation(extrapolation);
+    solver.maxLevels(-1);
+    solver.preSmoothingSteps(1);
+    solver.postSmoothingSteps(1);
+    solver.multigridCycle(MultigridCycleType::V_CYCLE);
+    solver.FMG(false);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-10);
+    solver.relativeTolerance(1e-8);
+}
+} // namespace
+
+TEST(ProfilerTest, CountsOperationsPerLevel)
+{
+    ProfilerProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, ExtrapolationType::NONE);
+    solver.setup();
+    solver.solve(problem.boundary_conditions, problem.source_term);
+
+    const Profiler& profiler = solver.profiler();
+    const int iterations     = solver.numberOfIterations();
+    const int coarsest_level = profiler.numberOfLevels() - 1;
+    ASSERT_GE(coarsest_level, 1);
+
+    EXPECT_EQ(profiler.entry(0, ProfiledOperation::SMOOTHING).calls, 2 * iterations);
+    EXPECT_EQ(profiler.entry(0, ProfiledOperation::EXTRAPOLATED_SMOOTHING).calls, 0);
+    // One residual per cycle and one per convergence check.
+    EXPECT_EQ(profiler.entry(0, ProfiledOperation::RESIDUAL).calls, 2 * iterations + 1);
+    EXPECT_EQ(profiler.entry(0, ProfiledOperation::NORM).calls, iterations + 1);
+    EXPECT_EQ(profiler.entry(0, ProfiledOperation::PROLONGATION).calls, iterations);
+    EXPECT_EQ(profiler.entry(1, ProfiledOperation::RESTRICTION).calls, iterations);
+    EXPECT_EQ(profiler.entry(coarsest_level, ProfiledOperation::DIRECT_SOLVE).calls, iterations);
+    EXPECT_EQ(profiler.entry(coarsest_level, ProfiledOperation::SMOOTHING).calls, 0);
+
+    for (int level_depth = 0; level_depth < coarsest_level; level_depth++) {
+        const ProfileEntry& smoothing = profiler.entry(level_depth, ProfiledOperation::SMOOTHING);
+        EXPECT_EQ(smoothing.calls, 2 * iterations);
+        EXPECT_EQ(smoothing.threads, 1);
+        EXPECT_GT(smoothing.time, 0.0);
+    }
+}
+
+TEST(ProfilerTest, RecordsExtrapolatedSmoothingAndInjection)
+{
+    ProfilerProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, ExtrapolationType::IMPLICIT_EXTRAPOLATION);
+    solver.setup();
+    solver.solve(problem.boundary_conditions, problem.source_term);
+
+    const Profiler& profiler = solver.profiler();
+    const int iterations     = solver.numberOfIterations();
+
+    EXPECT_EQ(profiler.entry(0, ProfiledOperation::EXTRAPOLATED_SMOOTHING).calls, 2 * iterations);
+    EXPECT_EQ(profiler.entry(0, ProfiledOperation::SMOOTHING).calls, 0);
+    // One injection per cycle and one per convergence check.
+    EXPECT_EQ(profiler.entry(1, ProfiledOperation::INJECTION).calls, 2 * iterations + 1);
+}
+
+TEST(ProfilerTest, ResetsForEverySolveAndAccumulatesBatches)
+{
+    ProfilerProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, ExtrapolationType::NONE);
+    solver.setup();
+
+    solver.solve(problem.boundary_conditions, problem.source_term);
+    const long single_calls = solver.profiler().entry(0, ProfiledOperation::SMOOTHING).calls;
+    solver.solve(problem.boundary_conditions, problem.source_term);
+    EXPECT_EQ(solver.profiler().entry(0, ProfiledOperation::SMOOTHING).calls, single_calls);
+
+    // The batched multigrid iteration smooths both columns by one call per smoothing step.
+    solver.solve({&problem.boundary_conditions}, {&problem.source_term, &problem.source_term});
+    EXPECT_EQ(solver.profiler().entry(0, ProfiledOperation::SMOOTHING).calls, single_calls);
+
+    // With extrapolation the columns are solved one after another and their profiles are accumulated.
+    solver.extrapolation(ExtrapolationType::IMPLICIT_EXTRAPOLATION);
+    solver.setup();
+    solver.solve(problem.boundary_conditions, problem.source_term);
+    const long extrapolated_calls = solver.profiler().entry(0, ProfiledOperation::EXTRAPOLATED_SMOOTHING).calls;
+    solver.solve({&problem.boundary_conditions}, {&problem.source_term, &problem.source_term});
+    EXPECT_EQ(solver.profiler().entry(0, ProfiledOperation::EXTRAPOLATED_SMOOTHING).calls, 2 * extrapolated_calls);
+}
+
+TEST(ProfilerTest, WritesJSON)
+{
+    Profiler profiler;
+    profiler.reset({4, 2});
+    profiler.record(0, ProfiledOperation::SMOOTHING, 4, 0.5);
+    profiler.record(0, ProfiledOperation::SMOOTHING, 4, 0.25);
+    profiler.record(1, ProfiledOperation::DIRECT_SOLVE, 1, 0.125);
+
+    std::ostringstream stream;
+    profiler.writeJSON(stream);
+    const std::string json = stream.str();
+
+    EXPECT_NE(json.find("\"level\": 0"), std::string::npos);
+    EXPECT_NE(json.find("\"threads\": 2"), std::string::npos);
+    EXPECT_NE(json.find("\"smoothing\": {\"time\": 0.75, \"calls\": 2, \"threads\": 4}"), std::string::npos);
+    EXPECT_NE(json.find("\"direct_solve\": {\"time\": 0.125, \"calls\": 1, \"threads\": 1}"), std::string::npos);
+    EXPECT_EQ(json.find("residual"), std::string::npos);
+
+    ProfilerProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, ExtrapolationType::NONE);
+    solver.setup();
+    solver.solve(problem.boundary_conditions, problem.source_term);
+
+    const std::string path = (std::filesystem::temp_directory_path() / "gmgpolar_profile.json").string();
+    solver.writeProfileJSON(path);
+    std::ifstream file(path);
+    std::stringstream contents;
+    contents << file.rdbuf();
+    EXPECT_NE(contents.str().find("\"direct_solve\""), std::string::npos);
+    std::filesystem::remove(path);
+}
@@ -0,0 +1,140 @@
+#include <gtest/gtest.h>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace RadialProfilesTest
+{
+struct RadialProblem {
+    const double Rmax       = 1.3;
+    const double alpha_jump = 0.66 * Rmax;
+
+    CircularGeometry domain_geometry{Rmax};
+    SonnendruckerGyroCoefficients coefficients{Rmax, alpha_jump};
+    PolarR6_Boundary_CircularGeometry boundary_conditions{Rmax};
+    PolarR6_SonnendruckerGyro_CircularGeometry source_term{Rmax};
+    PolarR6_CircularGeometry exact_solution{Rmax};
+};
+
+// Compares the values obtained from the radial profiles with the ones of the per-node cache.
+void expectSameValues(const PolarGrid& grid, const LevelCache& radial, const LevelCache& per_node)
+{
+    for (int i_r = 0; i_r < grid.nr(); i_r++) {
+        const double r = grid.radius(i_r);
+        for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+            const double theta = grid.theta(i_theta);
+            const int index    = grid.index(i_r, i_theta);
+
+            double sin_theta, cos_theta, coeff_beta, arr, att, art, detDF;
+            radial.obtainValues(i_r, i_theta, index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
+            double expected_sin_theta, expected_cos_theta, expected_coeff_beta, expected_arr, expected_att,
+                expected_art, expected_detDF;
+            per_node.obtainValues(i_r, i_theta, index, r, theta, expected_sin_theta, expected_cos_theta,
+                                  expected_coeff_beta, expected_arr, expected_att, expected_art, expected_detDF);
+
+            ASSERT_DOUBLE_EQ(coeff_beta, expected_coeff_beta) << "at (" << i_r << ", " << i_theta << ")";
+            ASSERT_NEAR(arr, expected_arr, 1e-12 * std::abs(expected_arr)) << "at (" << i_r << ", " << i_theta << ")";
+            ASSERT_NEAR(att, expected_att, 1e-12 * std::abs(expected_att)) << "at (" << i_r << ", " << i_theta << ")";
+            // art vanishes analytically, only rounding errors of the metric terms remain.
+            ASSERT_NEAR(art, expected_art, 1e-12 * (std::abs(expected_arr) + std::abs(expected_att)))
+                << "at (" << i_r << ", " << i_theta << ")";
+            ASSERT_NEAR(detDF, expected_detDF, 1e-12 * std::abs(expected_detDF))
+                << "at (" << i_r << ", " << i_theta << ")";
+        }
+    }
+}
+
+void configureSolver(GMGPolar& solver, const StencilDistributionMethod stencil, const ExtrapolationType extrapolation)
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(2);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(stencil);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(true);
+    solver.extrapolation(extrapolation);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-12);
+    solver.relativeTolerance(1e-10);
+}
+
+// "Take" keeps the per-node cache, so both solvers apply the same operator up to rounding.
+void compareSolveWithTake(const ExtrapolationType extrapolation)
+{
+    RadialProblem problem;
+    const PolarGrid grid(1e-8, problem.Rmax, 5, -1, problem.alpha_jump, 3, 1);
+
+    GMGPolar take(grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(take, StencilDistributionMethod::CPU_TAKE, extrapolation);
+    take.setup();
+    take.setSolution(&problem.exact_solution);
+    take.solve(problem.boundary_conditions, problem.source_term);
+
+    GMGPolar give(grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(give, StencilDistributionMethod::CPU_GIVE, extrapolation);
+    give.setup();
+    give.setSolution(&problem.exact_solution);
+    give.solve(problem.boundary_conditions, problem.source_term);
+
+    EXPECT_LE(std::abs(give.numberOfIterations() - take.numberOfIterations()), 1);
+    EXPECT_NEAR(give.exactErrorWeightedEuclidean().value(), take.exactErrorWeightedEuclidean().value(), 1e-10);
+
+    // Every level stores one value per circle instead of one per node.
+    const MemoryReport report = give.memoryReport();
+    for (const LevelMemory& level : report.levels) {
+        for (const auto& [name, bytes] : level.level_cache) {
+            if (name == "sin_theta" || name == "cos_theta")
+                continue;
+            EXPECT_LE(bytes, grid.nr() * sizeof(double)) << name;
+        }
+    }
+}
+} // namespace RadialProfilesTest
+
+using namespace RadialProfilesTest;
+
+TEST(RadialProfilesTest, MatchPerNodeCache)
+{
+    RadialProblem problem;
+    auto fine_grid = std::make_unique<PolarGrid>(1e-5, problem.Rmax, 5, -1, problem.alpha_jump, 3, 1);
+    const PolarGrid coarse_grid = coarseningGrid(*fine_grid);
+
+    for (const bool cache : {true, false}) {
+        auto radial = std::make_unique<LevelCache>(*fine_grid, problem.coefficients, problem.domain_geometry, cache,
+                                                   cache, true);
+        LevelCache per_node(*fine_grid, problem.coefficients, problem.domain_geometry, true, true);
+        EXPECT_TRUE(radial->radialProfiles());
+        EXPECT_FALSE(radial->cacheDomainGeometry());
+        EXPECT_EQ(radial->arr().size(), fine_grid->nr());
+        EXPECT_EQ(radial->coeff_alpha().size(), 0);
+        expectSameValues(*fine_grid, *radial, per_node);
+
+        // Coarser levels inject the profiles of the next finer level.
+        Level fine_level(0, std::make_unique<PolarGrid>(*fine_grid), std::move(radial), ExtrapolationType::NONE, false);
+        LevelCache injected(fine_level, coarse_grid);
+        LevelCache coarse_per_node(coarse_grid, problem.coefficients, problem.domain_geometry, true, true);
+        EXPECT_EQ(injected.arr().size(), coarse_grid.nr());
+        expectSameValues(coarse_grid, injected, coarse_per_node);
+    }
+}
+
+TEST(RadialProfilesTest, RequireAngleIndependentInput)
+{
+    const double Rmax = 1.3;
+    const PolarGrid grid(1e-5, Rmax, 4, -1, 0.66 * Rmax, 2, 1);
+    CzarnyGeometry czarny(Rmax, 0.3, 1.4);
+    CircularGeometry circular(Rmax);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, 0.66 * Rmax);
+
+    EXPECT_TRUE(circular.isAngleIndependent());
+    EXPECT_FALSE(czarny.isAngleIndependent());
+    EXPECT_THROW(LevelCache(grid, coefficients, czarny, true, true, true), std::runtime_error);
+    EXPECT_NO_THROW(LevelCache(grid, coefficients, circular, true, true, true));
+}
+
+TEST(RadialProfilesTest, SolveMatchesTake)
+{
+    compareSolveWithTake(ExtrapolationType::NONE);
+    compareSolveWithTake(ExtrapolationType::IMPLICIT_EXTRAPOLATION);
+}
@@ -0,0 +1,119 @@
+#include <gtest/gtest.h>
+
+#include <algorithm>
+#include <filesystem>
+#include <fstream>
+#include <sstream>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+std::string extractArray(const std::string& report, const std::string& key)
+{
+    const std::size_t start = report.find("\"" + key + "\": [");
+    if (start == std::string::npos)
+        return "";
+    const std::size_t begin = report.find('[', start) + 1;
+    return report.substr(begin, report.find(']', begin) - begin);
+}
+
+std::string solveAndReport(ExtrapolationType extrapolation, bool with_exact_solution)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, alpha_jump, 3, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term(Rmax, kappa_eps, delta_e);
+    PolarR6_CzarnyGeometry exact_solution(Rmax, kappa_eps, delta_e);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(1);
+    solver.stencilDistributionMethod(StencilDistributionMethod::CPU_GIVE);
+    solver.extrapolation(extrapolation);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(std::nullopt);
+    solver.relativeTolerance(1e-8);
+    solver.setup();
+    if (with_exact_solution)
+        solver.setSolution(&exact_solution);
+    solver.solve(boundary_conditions, source_term);
+
+    const std::vector<ReportSetting> problem = {{"geometry", static_cast<int>(GeometryType::CZARNY)},
+                                                {"geometryTable", "equilibrium \"v2\".gmgtab"},
+                                                {"Rmax", Rmax},
+                                                {"kappa_eps", kappa_eps}};
+    std::ostringstream stream;
+    solver.writeReport(stream, problem);
+
+    const std::string report = stream.str();
+    EXPECT_NE(report.find("\"iterations\": " + std::to_string(solver.numberOfIterations()) + ","),
+              std::string::npos);
+    const std::string residual_norms = extractArray(report, "residualNorms");
+    EXPECT_EQ(std::count(residual_norms.begin(), residual_norms.end(), ','), solver.numberOfIterations());
+    return report;
+}
+} // namespace
+
+TEST(ReportTest, ContainsAllSections)
+{
+    const std::string report = solveAndReport(ExtrapolationType::IMPLICIT_EXTRAPOLATION, true);
+
+    for (const char* key : {"\"problem\"", "\"geometry\": 2", "\"geometryTable\": \"equilibrium \\\"v2\\\".gmgtab\"",
+                            "\"Rmax\": 1.3", "\"kappa_eps\": 0.29999999999999999", "\"settings\"", "\"levels\"",
+                            "\"convergence\"", "\"timings\"", "\"memory\"",
+                            "\"extrapolation\": 1", "\"absoluteTolerance\": null", "\"relativeTolerance\": 1e-08",
+                            "\"stencilDistributionMethod\": 1", "\"meanResidualReductionFactor\"", "\"solveTotal\"",
+                            "\"avgMGCPreSmoothing\"", "\"peakResidentSetSize\"", "\"level\": 0"}) {
+        EXPECT_NE(report.find(key), std::string::npos) << key;
+    }
+
+    EXPECT_EQ(std::count(report.begin(), report.end(), '{'), std::count(report.begin(), report.end(), '}'));
+    EXPECT_EQ(std::count(report.begin(), report.end(), '['), std::count(report.begin(), report.end(), ']'));
+    EXPECT_EQ(report.find("nan"), std::string::npos);
+    EXPECT_EQ(report.find("inf"), std::string::npos);
+
+    // One error entry per iteration, including the initial approximation.
+    const std::string residual_norms = extractArray(report, "residualNorms");
+    const std::string errors         = extractArray(report, "exactErrorsWeightedEuclidean");
+    EXPECT_EQ(std::count(errors.begin(), errors.end(), ','),
+              std::count(residual_norms.begin(), residual_norms.end(), ','));
+}
+
+TEST(ReportTest, OmitsErrorsWithoutExactSolution)
+{
+    const std::string report = solveAndReport(ExtrapolationType::NONE, false);
+    EXPECT_TRUE(extractArray(report, "exactErrorsWeightedEuclidean").empty());
+    EXPECT_TRUE(extractArray(report, "exactErrorsInfinity").empty());
+}
+
+TEST(ReportTest, WritesFile)
+{
+    const double Rmax = 1.3;
+    PolarGrid grid(1e-8, Rmax, 3, -1, 0.66, 0, 1);
+    CzarnyGeometry domain_geometry(Rmax, 0.3, 1.4);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, 0.66);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    solver.verbose(0);
+    solver.setup();
+
+    const std::string path = (std::filesystem::temp_directory_path() / "gmgpolar_report.json").string();
+    solver.writeReport(path);
+    std::ifstream file(path);
+    std::stringstream contents;
+    contents << file.rdbuf();
+    EXPECT_NE(contents.str().find("\"problem\": {},"), std::string::npos);
+    EXPECT_NE(contents.str().find("\"settings\""), std::string::npos);
+    std::filesystem::remove(path);
+
+    EXPECT_THROW(solver.writeReport("/nonexistent_directory/report.json"), std::runtime_error);
+}
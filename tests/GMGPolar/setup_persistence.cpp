@@ -0,0 +1,185 @@
+#include <gtest/gtest.h>
+
+#include <filesystem>
+#include <fstream>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+struct PersistenceProblem {
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid{1e-8, Rmax, 4, -1, alpha_jump, 3, 1};
+    CzarnyGeometry domain_geometry{Rmax, kappa_eps, delta_e};
+    ZoniShiftedGyroCoefficients coefficients{Rmax, alpha_jump};
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions{Rmax, kappa_eps, delta_e};
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term{Rmax, kappa_eps, delta_e};
+    PolarR6_CzarnyGeometry exact_solution{Rmax, kappa_eps, delta_e};
+};
+
+void configureSolver(GMGPolar& solver, ExtrapolationType extrapolation, StencilDistributionMethod stencil,
+                     bool mixed_precision)
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(1);
+    solver.threadReductionFactor(1.0);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(stencil);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(true);
+    solver.mixedPrecision(mixed_precision);
+    solver.extrapolation(extrapolation);
+    solver.maxLevels(-1);
+    solver.preSmoothingSteps(1);
+    solver.postSmoothingSteps(1);
+    solver.multigridCycle(MultigridCycleType::V_CYCLE);
+    solver.FMG(false);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-12);
+    solver.relativeTolerance(1e-10);
+}
+
+std::string setupFilePath(const std::string& name)
+{
+    return (std::filesystem::temp_directory_path() / ("gmgpolar_" + name + ".setup")).string();
+}
+
+// Saves the setup of one solver and loads it into a second one. Both solvers have to produce the same iterates.
+void compareLoadedSetup(const std::string& name, ExtrapolationType extrapolation, StencilDistributionMethod stencil,
+                        bool mixed_precision, bool save_after_solve)
+{
+    PersistenceProblem problem;
+    const std::string path = setupFilePath(name);
+
+    GMGPolar original(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(original, extrapolation, stencil, mixed_precision);
+    original.setup();
+    original.setSolution(&problem.exact_solution);
+    if (save_after_solve) {
+        // The tridiagonal solvers are factorized lazily in the first solve.
+        original.solve(problem.boundary_conditions, problem.source_term);
+    }
+    original.saveSetup(path);
+    original.solve(problem.boundary_conditions, problem.source_term);
+
+    GMGPolar loaded(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(loaded, extrapolation, stencil, mixed_precision);
+    loaded.loadSetup(path);
+    loaded.setSolution(&problem.exact_solution);
+    loaded.solve(problem.boundary_conditions, problem.source_term);
+
+    EXPECT_EQ(loaded.numberOfIterations(), original.numberOfIterations());
+    EXPECT_DOUBLE_EQ(loaded.exactErrorWeightedEuclidean().value(), original.exactErrorWeightedEuclidean().value());
+
+    ConstVector<double> original_solution = original.solution();
+    ConstVector<double> loaded_solution   = loaded.solution();
+    ASSERT_EQ(loaded_solution.size(), original_solution.size());
+    for (std::size_t i = 0; i < original_solution.size(); i++) {
+        ASSERT_DOUBLE_EQ(loaded_solution[i], original_solution[i]);
+    }
+
+    std::filesystem::remove(path);
+}
+} // namespace
+
+TEST(SetupPersistenceTest, TakeNoExtrapolation)
+{
+    compareLoadedSetup("take_none", ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE, false, false);
+}
+
+TEST(SetupPersistenceTest, GiveImplicitExtrapolation)
+{
+    compareLoadedSetup("give_implicit", ExtrapolationType::IMPLICIT_EXTRAPOLATION,
+                       StencilDistributionMethod::CPU_GIVE, false, false);
+}
+
+TEST(SetupPersistenceTest, TakeImplicitExtrapolationFactorized)
+{
+    compareLoadedSetup("take_implicit", ExtrapolationType::IMPLICIT_EXTRAPOLATION,
+                       StencilDistributionMethod::CPU_TAKE, false, true);
+}
+
+TEST(SetupPersistenceTest, MixedPrecisionFactorized)
+{
+    compareLoadedSetup("give_mixed", ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE, true, true);
+}
+
+TEST(SetupPersistenceTest, RejectsMismatchingConfiguration)
+{
+    PersistenceProblem problem;
+    const std::string path = setupFilePath("mismatch");
+
+    GMGPolar original(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(original, ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE, false);
+    EXPECT_THROW(original.saveSetup(path), std::runtime_error);
+    original.setup();
+    original.saveSetup(path);
+
+    GMGPolar other_extrapolation(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(other_extrapolation, ExtrapolationType::IMPLICIT_EXTRAPOLATION,
+                    StencilDistributionMethod::CPU_GIVE, false);
+    EXPECT_THROW(other_extrapolation.loadSetup(path), std::runtime_error);
+
+    GMGPolar other_stencil(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(other_stencil, ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE, false);
+    EXPECT_THROW(other_stencil.loadSetup(path), std::runtime_error);
+
+    PolarGrid coarser_grid(1e-8, problem.Rmax, 4, -1, problem.alpha_jump, 3, 0);
+    GMGPolar other_grid(coarser_grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(other_grid, ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE, false);
+    EXPECT_THROW(other_grid.loadSetup(path), std::runtime_error);
+
+    // Same types, different parameters
+    CzarnyGeometry other_geometry(problem.Rmax, 0.25, problem.delta_e);
+    GMGPolar other_domain(problem.grid, other_geometry, problem.coefficients);
+    configureSolver(other_domain, ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE, false);
+    EXPECT_THROW(other_domain.loadSetup(path), std::runtime_error);
+
+    ZoniShiftedGyroCoefficients stretched_coefficients(1.2 * problem.Rmax, problem.alpha_jump);
+    GMGPolar other_profile(problem.grid, problem.domain_geometry, stretched_coefficients);
+    configureSolver(other_profile, ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE, false);
+    EXPECT_THROW(other_profile.loadSetup(path), std::runtime_error);
+
+    // Different types
+    ShafranovGeometry shafranov(problem.Rmax, problem.kappa_eps, problem.delta_e);
+    GMGPolar other_geometry_type(problem.grid, shafranov, problem.coefficients);
+    configureSolver(other_geometry_type, ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE, false);
+    EXPECT_THROW(other_geometry_type.loadSetup(path), std::runtime_error);
+
+    ZoniGyroCoefficients zoni(problem.Rmax, problem.alpha_jump);
+    GMGPolar other_coefficients_type(problem.grid, problem.domain_geometry, zoni);
+    configureSolver(other_coefficients_type, ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE, false);
+    EXPECT_THROW(other_coefficients_type.loadSetup(path), std::runtime_error);
+
+    // Equal input functions
+    CzarnyGeometry equal_geometry(problem.Rmax, problem.kappa_eps, problem.delta_e);
+    ZoniShiftedGyroCoefficients equal_coefficients(problem.Rmax, problem.alpha_jump);
+    GMGPolar equal_problem(problem.grid, equal_geometry, equal_coefficients);
+    configureSolver(equal_problem, ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE, false);
+    EXPECT_NO_THROW(equal_problem.loadSetup(path));
+
+    std::filesystem::remove(path);
+}
+
+TEST(SetupPersistenceTest, RejectsInvalidFile)
+{
+    PersistenceProblem problem;
+    const std::string path = setupFilePath("invalid");
+    {
+        std::ofstream file(path);
+        file << "not a setup file";
+    }
+
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE, false);
+    EXPECT_THROW(solver.loadSetup(path), std::runtime_error);
+    EXPECT_THROW(solver.loadSetup(setupFilePath("does_not_exist")), std::runtime_error);
+
+    std::filesystem::remove(path);
+}
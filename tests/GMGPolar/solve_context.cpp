@@ -0,0 +1,110 @@
+#include <gtest/gtest.h>
+
+#include <memory>
+
+#include "../../include/GMGPolar/solve_context.h"
+
+namespace
+{
+struct SolveContextProblem {
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid{1e-8, Rmax, 4, -1, alpha_jump, 3, 1};
+    CzarnyGeometry domain_geometry{Rmax, kappa_eps, delta_e};
+    ZoniShiftedGyroCoefficients coefficients{Rmax, alpha_jump};
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions{Rmax, kappa_eps, delta_e};
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term{Rmax, kappa_eps, delta_e};
+    PolarR6_CzarnyGeometry exact_solution{Rmax, kappa_eps, delta_e};
+};
+
+void configureSolver(GMGPolar& solver, ExtrapolationType extrapolation, StencilDistributionMethod stencil)
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(2);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(stencil);
+    solver.extrapolation(extrapolation);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-10);
+    solver.relativeTolerance(1e-8);
+}
+} // namespace
+
+TEST(SolveContextTest, MatchesSolveOfTheSetupSolver)
+{
+    SolveContextProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_GIVE);
+    solver.setup();
+    solver.solve(problem.boundary_conditions, problem.source_term);
+
+    SolveContext context(solver);
+    context.setSolution(&problem.exact_solution);
+    context.solve(problem.boundary_conditions, problem.source_term);
+
+    EXPECT_EQ(context.numberOfIterations(), solver.numberOfIterations());
+    EXPECT_TRUE(equals<double>(context.solution(), solver.solution()));
+    EXPECT_TRUE(context.exactErrorWeightedEuclidean().has_value());
+    EXPECT_FALSE(solver.exactErrorWeightedEuclidean().has_value());
+    // The context has its own vectors.
+    EXPECT_NE(context.solution().data(), solver.solution().data());
+}
+
+TEST(SolveContextTest, ConcurrentSolvesShareOneSetup)
+{
+    SolveContextProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(solver, ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE);
+    solver.cacheDomainGeometry(true);
+    solver.setup();
+
+    GMGPolar reference(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(reference, ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE);
+    reference.cacheDomainGeometry(true);
+    reference.setup();
+    reference.solve(problem.boundary_conditions, problem.source_term);
+
+    const int number_of_contexts = 4;
+    std::vector<std::unique_ptr<SolveContext>> contexts;
+    for (int i = 0; i < number_of_contexts; i++) {
+        contexts.push_back(std::make_unique<SolveContext>(solver));
+    }
+
+#pragma omp parallel for num_threads(number_of_contexts)
+    for (int i = 0; i < number_of_contexts; i++) {
+        contexts[i]->solve(problem.boundary_conditions, problem.source_term);
+    }
+
+    for (const auto& context : contexts) {
+        EXPECT_EQ(context->numberOfIterations(), reference.numberOfIterations());
+        EXPECT_TRUE(equals<double>(context->solution(), reference.solution()));
+    }
+}
+
+TEST(SolveContextTest, OutlivesTheSetupSolver)
+{
+    SolveContextProblem problem;
+    auto solver = std::make_unique<GMGPolar>(problem.grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(*solver, ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_TAKE);
+    solver->cacheDomainGeometry(true);
+    solver->setup();
+    solver->solve(problem.boundary_conditions, problem.source_term);
+    const int iterations = solver->numberOfIterations();
+
+    SolveContext context(*solver);
+    solver.reset();
+    context.solve(problem.boundary_conditions, problem.source_term);
+    EXPECT_EQ(context.numberOfIterations(), iterations);
+}
+
+TEST(SolveContextTest, RequiresSetup)
+{
+    SolveContextProblem problem;
+    GMGPolar solver(problem.grid, problem.domain_geometry, problem.coefficients);
+    EXPECT_THROW(SolveContext context(solver), std::runtime_error);
+}
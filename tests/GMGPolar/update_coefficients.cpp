@@ -0,0 +1,114 @@
+#include <gtest/gtest.h>
+
+#include <memory>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+struct UpdateResult {
+    int iterations;
+    double l2_error;
+    Vector<double> solution;
+};
+
+void configureSolver(GMGPolar& solver, ExtrapolationType extrapolation, StencilDistributionMethod stencil)
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(1);
+    solver.threadReductionFactor(1.0);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(stencil);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(true);
+    solver.extrapolation(extrapolation);
+    solver.maxLevels(-1);
+    solver.preSmoothingSteps(1);
+    solver.postSmoothingSteps(1);
+    solver.multigridCycle(MultigridCycleType::V_CYCLE);
+    solver.FMG(false);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-12);
+    solver.relativeTolerance(1e-10);
+}
+
+UpdateResult solveAfterUpdate(bool update_coefficients, ExtrapolationType extrapolation,
+                              StencilDistributionMethod stencil)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, alpha_jump, 3, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    SonnendruckerGyroCoefficients initial_coefficients(Rmax, alpha_jump);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term(Rmax, kappa_eps, delta_e);
+    PolarR6_CzarnyGeometry exact_solution(Rmax, kappa_eps, delta_e);
+
+    const DensityProfileCoefficients& setup_coefficients =
+        update_coefficients ? static_cast<const DensityProfileCoefficients&>(initial_coefficients) : coefficients;
+
+    GMGPolar solver(grid, domain_geometry, setup_coefficients);
+    configureSolver(solver, extrapolation, stencil);
+
+    solver.setup();
+    if (update_coefficients) {
+        solver.updateDensityProfileCoefficients(coefficients);
+    }
+    solver.setSolution(&exact_solution);
+    solver.solve(boundary_conditions, source_term);
+
+    return {solver.numberOfIterations(), solver.exactErrorWeightedEuclidean().value(), solver.solution()};
+}
+
+void compareWithFreshSetup(ExtrapolationType extrapolation, StencilDistributionMethod stencil)
+{
+    UpdateResult fresh   = solveAfterUpdate(false, extrapolation, stencil);
+    UpdateResult updated = solveAfterUpdate(true, extrapolation, stencil);
+
+    ASSERT_EQ(fresh.solution.size(), updated.solution.size());
+    EXPECT_EQ(updated.iterations, fresh.iterations);
+    EXPECT_NEAR(updated.l2_error, fresh.l2_error, 1e-12);
+    for (std::size_t i = 0; i < fresh.solution.size(); i++) {
+        ASSERT_NEAR(updated.solution[i], fresh.solution[i], 1e-10);
+    }
+}
+} // namespace
+
+TEST(UpdateDensityProfileCoefficientsTest, TakeNoExtrapolation)
+{
+    compareWithFreshSetup(ExtrapolationType::NONE, StencilDistributionMethod::CPU_TAKE);
+}
+
+TEST(UpdateDensityProfileCoefficientsTest, GiveNoExtrapolation)
+{
+    compareWithFreshSetup(ExtrapolationType::NONE, StencilDistributionMethod::CPU_GIVE);
+}
+
+TEST(UpdateDensityProfileCoefficientsTest, TakeImplicitExtrapolation)
+{
+    compareWithFreshSetup(ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_TAKE);
+}
+
+TEST(UpdateDensityProfileCoefficientsTest, GiveImplicitExtrapolation)
+{
+    compareWithFreshSetup(ExtrapolationType::IMPLICIT_EXTRAPOLATION, StencilDistributionMethod::CPU_GIVE);
+}
+
+TEST(UpdateDensityProfileCoefficientsTest, RequiresSetup)
+{
+    const double Rmax = 1.3;
+    PolarGrid grid(1e-8, Rmax, 3, -1, 0.66, 0, 1);
+    CzarnyGeometry domain_geometry(Rmax, 0.3, 1.4);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, 0.66);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    solver.verbose(0);
+
+    EXPECT_THROW(solver.updateDensityProfileCoefficients(coefficients), std::runtime_error);
+}
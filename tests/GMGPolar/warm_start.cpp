@@ -0,0 +1,100 @@
+#include <gtest/gtest.h>
+
+#include <cmath>
+#include <vector>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace
+{
+void configureSolver(GMGPolar& solver, ExtrapolationType extrapolation)
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(1);
+    solver.threadReductionFactor(1.0);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(StencilDistributionMethod::CPU_TAKE);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(true);
+    solver.extrapolation(extrapolation);
+    solver.maxLevels(-1);
+    solver.preSmoothingSteps(1);
+    solver.postSmoothingSteps(1);
+    solver.multigridCycle(MultigridCycleType::V_CYCLE);
+    solver.FMG(false);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::WEIGHTED_EUCLIDEAN);
+    solver.absoluteTolerance(1e-10);
+    solver.relativeTolerance(1e-8);
+}
+
+void testWarmStart(ExtrapolationType extrapolation)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.66;
+
+    PolarGrid grid(1e-8, Rmax, 4, -1, 0.66, 0, 1);
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions(Rmax, kappa_eps, delta_e);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term(Rmax, kappa_eps, delta_e);
+    PolarR6_CzarnyGeometry exact_solution(Rmax, kappa_eps, delta_e);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    configureSolver(solver, extrapolation);
+    solver.setup();
+    solver.setSolution(&exact_solution);
+
+    solver.solve(boundary_conditions, source_term);
+    const int cold_iterations = solver.numberOfIterations();
+    const double cold_error   = solver.exactErrorWeightedEuclidean().value();
+    ASSERT_GT(cold_iterations, 2);
+
+    // Restarting from the converged solution must not need any further cycles.
+    solver.solve(boundary_conditions, source_term, solver.solution());
+    EXPECT_LE(solver.numberOfIterations(), 1);
+    EXPECT_NEAR(solver.exactErrorWeightedEuclidean().value(), cold_error, 1e-8);
+
+    // Restarting from a perturbed solution converges faster than from zero.
+    Vector<double> perturbed("perturbed", grid.numberOfNodes());
+    ConstVector<double> converged = solver.solution();
+    for (int i = 0; i < grid.numberOfNodes(); i++) {
+        int i_r, i_theta;
+        grid.multiIndex(i, i_r, i_theta);
+        perturbed[i] = converged[i] * (1.0 + 1e-4 * std::sin(grid.theta(i_theta)));
+    }
+    solver.solve(boundary_conditions, source_term, perturbed);
+    EXPECT_LT(solver.numberOfIterations(), cold_iterations);
+    EXPECT_NEAR(solver.exactErrorWeightedEuclidean().value(), cold_error, 1e-6);
+}
+} // namespace
+
+TEST(WarmStartTest, NoExtrapolation)
+{
+    testWarmStart(ExtrapolationType::NONE);
+}
+
+TEST(WarmStartTest, ImplicitExtrapolation)
+{
+    testWarmStart(ExtrapolationType::IMPLICIT_EXTRAPOLATION);
+}
+
+TEST(WarmStartTest, InvalidInitialGuessSize)
+{
+    const double Rmax = 1.3;
+    PolarGrid grid(1e-8, Rmax, 3, -1, 0.66, 0, 1);
+    CzarnyGeometry domain_geometry(Rmax, 0.3, 1.4);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, 0.66);
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions(Rmax, 0.3, 1.4);
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term(Rmax, 0.3, 1.4);
+
+    GMGPolar solver(grid, domain_geometry, coefficients);
+    configureSolver(solver, ExtrapolationType::NONE);
+    solver.setup();
+
+    Vector<double> wrong_size("wrong_size", grid.numberOfNodes() + 1);
+    EXPECT_THROW(solver.solve(boundary_conditions, source_term, wrong_size), std::invalid_argument);
+}
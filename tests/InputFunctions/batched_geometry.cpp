@@ -0,0 +1,127 @@
+#include <gtest/gtest.h>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace BatchedGeometryTest
+{
+// The batched evaluation along every circle and every radial line has to reproduce the pointwise functions.
+void expectSameAsPointwise(const DomainGeometry& geometry, const PolarGrid& grid)
+{
+    const int ntheta = grid.ntheta();
+    const int nr     = grid.nr();
+    std::vector<double> sin_theta(ntheta), cos_theta(ntheta);
+    for (int i_theta = 0; i_theta < ntheta; i_theta++) {
+        sin_theta[i_theta] = std::sin(grid.theta(i_theta));
+        cos_theta[i_theta] = std::cos(grid.theta(i_theta));
+    }
+
+    const int count = std::max(nr, ntheta);
+    std::vector<double> Fx(count), Fy(count), dFx_dr(count), dFy_dr(count), dFx_dt(count), dFy_dt(count);
+
+    auto expectNode = [&](const int k, const double r, const double theta, const double sin, const double cos) {
+        const double tolerance = 1e-13;
+        ASSERT_NEAR(Fx[k], geometry.Fx(r, theta, sin, cos), tolerance) << "at r = " << r << ", theta = " << theta;
+        ASSERT_NEAR(Fy[k], geometry.Fy(r, theta, sin, cos), tolerance) << "at r = " << r << ", theta = " << theta;
+        ASSERT_NEAR(dFx_dr[k], geometry.dFx_dr(r, theta, sin, cos), tolerance)
+            << "at r = " << r << ", theta = " << theta;
+        ASSERT_NEAR(dFy_dr[k], geometry.dFy_dr(r, theta, sin, cos), tolerance)
+            << "at r = " << r << ", theta = " << theta;
+        ASSERT_NEAR(dFx_dt[k], geometry.dFx_dt(r, theta, sin, cos), tolerance)
+            << "at r = " << r << ", theta = " << theta;
+        ASSERT_NEAR(dFy_dt[k], geometry.dFy_dt(r, theta, sin, cos), tolerance)
+            << "at r = " << r << ", theta = " << theta;
+    };
+
+    for (int i_r = 0; i_r < nr; i_r++) {
+        const double r = grid.radius(i_r);
+        geometry.evaluateCircle(r, ntheta, grid.angles().data(), sin_theta.data(), cos_theta.data(), Fx.data(),
+                                Fy.data(), dFx_dr.data(), dFy_dr.data(), dFx_dt.data(), dFy_dt.data());
+        for (int i_theta = 0; i_theta < ntheta; i_theta++) {
+            expectNode(i_theta, r, grid.theta(i_theta), sin_theta[i_theta], cos_theta[i_theta]);
+        }
+    }
+
+    for (int i_theta = 0; i_theta < ntheta; i_theta++) {
+        const double theta = grid.theta(i_theta);
+        geometry.evaluateRadialLine(nr, grid.radii().data(), theta, sin_theta[i_theta], cos_theta[i_theta],
+                                    Fx.data(), Fy.data(), dFx_dr.data(), dFy_dr.data(), dFx_dt.data(), dFy_dt.data());
+        for (int i_r = 0; i_r < nr; i_r++) {
+            expectNode(i_r, grid.radius(i_r), theta, sin_theta[i_theta], cos_theta[i_theta]);
+        }
+    }
+
+    // Fx and Fy are optional.
+    geometry.evaluateCircle(grid.radius(nr - 1), ntheta, grid.angles().data(), sin_theta.data(), cos_theta.data(),
+                            nullptr, nullptr, dFx_dr.data(), dFy_dr.data(), dFx_dt.data(), dFy_dt.data());
+    EXPECT_NEAR(dFy_dt[1], geometry.dFy_dt(grid.radius(nr - 1), grid.theta(1), sin_theta[1], cos_theta[1]), 1e-13);
+}
+
+// Reading a line through LevelCacheLine yields the values of the per-node cache.
+void expectLineMatchesCache(const DomainGeometry& geometry, const DensityProfileCoefficients& coefficients,
+                            const PolarGrid& grid)
+{
+    const LevelCache on_the_fly(grid, coefficients, geometry, false, false);
+    const LevelCache cached(grid, coefficients, geometry, true, true);
+
+    auto expectSame = [&](const LevelCacheLine& line, const int i_r, const int i_theta) {
+        const double r     = grid.radius(i_r);
+        const double theta = grid.theta(i_theta);
+        const int index    = grid.index(i_r, i_theta);
+
+        double sin_theta, cos_theta, coeff_beta, arr, att, art, detDF;
+        line.obtainValues(i_r, i_theta, index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
+        double expected_sin_theta, expected_cos_theta, expected_coeff_beta, expected_arr, expected_att,
+            expected_art, expected_detDF;
+        cached.obtainValues(i_r, i_theta, index, r, theta, expected_sin_theta, expected_cos_theta,
+                            expected_coeff_beta, expected_arr, expected_att, expected_art, expected_detDF);
+
+        ASSERT_DOUBLE_EQ(sin_theta, expected_sin_theta);
+        ASSERT_DOUBLE_EQ(cos_theta, expected_cos_theta);
+        ASSERT_DOUBLE_EQ(coeff_beta, expected_coeff_beta) << "at (" << i_r << ", " << i_theta << ")";
+        ASSERT_NEAR(arr, expected_arr, 1e-12 * std::abs(expected_arr)) << "at (" << i_r << ", " << i_theta << ")";
+        ASSERT_NEAR(att, expected_att, 1e-12 * std::abs(expected_att)) << "at (" << i_r << ", " << i_theta << ")";
+        ASSERT_NEAR(art, expected_art, 1e-12 * (std::abs(expected_arr) + std::abs(expected_att)))
+            << "at (" << i_r << ", " << i_theta << ")";
+        ASSERT_NEAR(detDF, expected_detDF, 1e-12 * std::abs(expected_detDF))
+            << "at (" << i_r << ", " << i_theta << ")";
+    };
+
+    for (int i_r = 0; i_r < grid.numberSmootherCircles(); i_r++) {
+        const LevelCacheLine line = LevelCacheLine::circle(on_the_fly, grid, i_r);
+        for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+            expectSame(line, i_r, i_theta);
+        }
+    }
+    const int i_r_start = grid.numberSmootherCircles() - 1;
+    for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+        const LevelCacheLine line = LevelCacheLine::radialLine(on_the_fly, grid, i_theta, i_r_start);
+        for (int i_r = i_r_start; i_r < grid.nr(); i_r++) {
+            expectSame(line, i_r, i_theta);
+        }
+    }
+}
+} // namespace BatchedGeometryTest
+
+using namespace BatchedGeometryTest;
+
+TEST(BatchedGeometryTest, MatchesPointwiseEvaluation)
+{
+    const double Rmax = 1.3;
+    const PolarGrid grid(1e-5, Rmax, 4, -1, 0.66 * Rmax, 2, 1);
+
+    expectSameAsPointwise(CircularGeometry(Rmax), grid);
+    expectSameAsPointwise(ShafranovGeometry(Rmax, 0.3, 0.2), grid);
+    expectSameAsPointwise(CzarnyGeometry(Rmax, 0.3, 1.4), grid);
+    expectSameAsPointwise(CulhamGeometry(Rmax), grid);
+    expectSameAsPointwise(CulhamGeometry(Rmax, 0), grid);
+}
+
+TEST(BatchedGeometryTest, LevelCacheLineMatchesCache)
+{
+    const double Rmax = 1.3;
+    const PolarGrid grid(1e-5, Rmax, 5, -1, 0.66 * Rmax, 3, 1);
+    const ZoniShiftedGyroCoefficients coefficients(Rmax, 0.66 * Rmax);
+
+    expectLineMatchesCache(CzarnyGeometry(Rmax, 0.3, 1.4), coefficients, grid);
+    expectLineMatchesCache(CulhamGeometry(Rmax), coefficients, grid);
+}
@@ -0,0 +1,139 @@
+#include <gtest/gtest.h>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace BatchedSourceTermTest
+{
+struct Line {
+    std::vector<double> theta, sin_theta, cos_theta;
+
+    explicit Line(const PolarGrid& grid)
+    {
+        for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+            theta.push_back(grid.theta(i_theta));
+            sin_theta.push_back(std::sin(grid.theta(i_theta)));
+            cos_theta.push_back(std::cos(grid.theta(i_theta)));
+        }
+    }
+};
+
+void expectSameAsPointwise(const DensityProfileCoefficients& coefficients, const PolarGrid& grid)
+{
+    const int count = std::max(grid.nr(), grid.ntheta());
+    std::vector<double> alpha(count), beta(count);
+
+    for (int i_r = 0; i_r < grid.nr(); i_r++) {
+        const double r = grid.radius(i_r);
+        coefficients.evaluateCircle(r, grid.ntheta(), grid.angles().data(), alpha.data(), beta.data());
+        for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+            ASSERT_DOUBLE_EQ(alpha[i_theta], coefficients.alpha(r, grid.theta(i_theta)));
+            ASSERT_DOUBLE_EQ(beta[i_theta], coefficients.beta(r, grid.theta(i_theta)));
+        }
+    }
+
+    for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+        const double theta = grid.theta(i_theta);
+        coefficients.evaluateRadialLine(grid.nr(), grid.radii().data(), theta, alpha.data(), nullptr);
+        coefficients.evaluateRadialLine(grid.nr(), grid.radii().data(), theta, nullptr, beta.data());
+        for (int i_r = 0; i_r < grid.nr(); i_r++) {
+            ASSERT_DOUBLE_EQ(alpha[i_r], coefficients.alpha(grid.radius(i_r), theta));
+            ASSERT_DOUBLE_EQ(beta[i_r], coefficients.beta(grid.radius(i_r), theta));
+        }
+    }
+}
+
+void expectSameAsPointwise(const SourceTerm& source_term, const PolarGrid& grid)
+{
+    const Line line(grid);
+    std::vector<double> rhs_f(std::max(grid.nr(), grid.ntheta()));
+
+    for (int i_r = 0; i_r < grid.nr(); i_r++) {
+        const double r = grid.radius(i_r);
+        source_term.evaluateCircle(r, grid.ntheta(), line.theta.data(), line.sin_theta.data(), line.cos_theta.data(),
+                                   rhs_f.data());
+        for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+            const double expected = source_term.rhs_f(r, line.theta[i_theta], line.sin_theta[i_theta],
+                                                      line.cos_theta[i_theta]);
+            ASSERT_NEAR(rhs_f[i_theta], expected, 1e-12 * (1.0 + std::abs(expected)));
+        }
+    }
+
+    for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+        source_term.evaluateRadialLine(grid.nr(), grid.radii().data(), line.theta[i_theta], line.sin_theta[i_theta],
+                                       line.cos_theta[i_theta], rhs_f.data());
+        for (int i_r = 0; i_r < grid.nr(); i_r++) {
+            const double expected = source_term.rhs_f(grid.radius(i_r), line.theta[i_theta], line.sin_theta[i_theta],
+                                                      line.cos_theta[i_theta]);
+            ASSERT_NEAR(rhs_f[i_r], expected, 1e-12 * (1.0 + std::abs(expected)));
+        }
+    }
+}
+} // namespace BatchedSourceTermTest
+
+using namespace BatchedSourceTermTest;
+
+TEST(BatchedSourceTermTest, CoefficientsMatchPointwiseEvaluation)
+{
+    const double Rmax       = 1.3;
+    const double alpha_jump = 0.66 * Rmax;
+    const PolarGrid grid(1e-5, Rmax, 4, -1, alpha_jump, 2, 1);
+
+    expectSameAsPointwise(PoissonCoefficients(Rmax, alpha_jump), grid);
+    expectSameAsPointwise(SonnendruckerCoefficients(Rmax, alpha_jump), grid);
+    expectSameAsPointwise(SonnendruckerGyroCoefficients(Rmax, alpha_jump), grid);
+    expectSameAsPointwise(ZoniCoefficients(Rmax, alpha_jump), grid);
+    expectSameAsPointwise(ZoniGyroCoefficients(Rmax, alpha_jump), grid);
+    expectSameAsPointwise(ZoniShiftedCoefficients(Rmax, alpha_jump), grid);
+    expectSameAsPointwise(ZoniShiftedGyroCoefficients(Rmax, alpha_jump), grid);
+}
+
+TEST(BatchedSourceTermTest, SourceTermsMatchPointwiseEvaluation)
+{
+    const double Rmax = 1.3;
+    const PolarGrid grid(1e-5, Rmax, 4, -1, 0.66 * Rmax, 2, 1);
+
+    expectSameAsPointwise(CartesianR6_ZoniShiftedGyro_CzarnyGeometry(Rmax, 0.3, 1.4), grid);
+    expectSameAsPointwise(CartesianR2_Poisson_ShafranovGeometry(Rmax, 0.3, 0.2), grid);
+    expectSameAsPointwise(PolarR6_SonnendruckerGyro_CircularGeometry(Rmax), grid);
+    expectSameAsPointwise(PolarR6_ZoniShiftedGyro_CulhamGeometry(Rmax), grid);
+}
+
+// With cached geometry but uncached coefficients, LevelCacheLine evaluates beta by the batched calls.
+TEST(BatchedSourceTermTest, LevelCacheLineWithUncachedCoefficients)
+{
+    const double Rmax = 1.3;
+    const PolarGrid grid(1e-5, Rmax, 5, -1, 0.66 * Rmax, 3, 1);
+    CzarnyGeometry domain_geometry(Rmax, 0.3, 1.4);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, 0.66 * Rmax);
+
+    const LevelCache level_cache(grid, coefficients, domain_geometry, false, true);
+
+    auto expectSame = [&](const LevelCacheLine& line, const int i_r, const int i_theta) {
+        const double r     = grid.radius(i_r);
+        const double theta = grid.theta(i_theta);
+        const int index    = grid.index(i_r, i_theta);
+
+        double sin_theta, cos_theta, coeff_beta, arr, att, art, detDF;
+        line.obtainValues(i_r, i_theta, index, r, theta, sin_theta, cos_theta, coeff_beta, arr, att, art, detDF);
+        ASSERT_DOUBLE_EQ(coeff_beta, coefficients.beta(r, theta)) << "at (" << i_r << ", " << i_theta << ")";
+        ASSERT_EQ(arr, level_cache.arr()[index]) << "at (" << i_r << ", " << i_theta << ")";
+        ASSERT_EQ(att, level_cache.att()[index]) << "at (" << i_r << ", " << i_theta << ")";
+        ASSERT_EQ(art, level_cache.art()[index]) << "at (" << i_r << ", " << i_theta << ")";
+        ASSERT_EQ(detDF, level_cache.detDF()[index]) << "at (" << i_r << ", " << i_theta << ")";
+    };
+
+    // The smoothers also request the first circle of the radial section.
+    for (int i_r = 0; i_r <= grid.numberSmootherCircles(); i_r++) {
+        const LevelCacheLine line = LevelCacheLine::circle(level_cache, grid, i_r);
+        for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+            expectSame(line, i_r, i_theta);
+        }
+    }
+    const int i_r_start = grid.numberSmootherCircles() - 1;
+    for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+        const LevelCacheLine line = LevelCacheLine::radialLine(level_cache, grid, i_theta, i_r_start);
+        for (int i_r = i_r_start; i_r < grid.nr(); i_r++) {
+            expectSame(line, i_r, i_theta);
+        }
+    }
+}
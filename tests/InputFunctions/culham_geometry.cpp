@@ -0,0 +1,43 @@
+#include <gtest/gtest.h>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+TEST(CulhamGeometryTest, TabulatedProfilesMatchReference)
+{
+    const double Rmax = 1.3;
+    const CulhamGeometry reference(Rmax, 0);
+    const CulhamGeometry tabulated(Rmax);
+
+    EXPECT_EQ(reference.profileTableError(), 0.0);
+    EXPECT_LT(tabulated.profileTableError(), 5e-5);
+
+    // Away from the start of the ODE solution the table only differs by the interpolation error of the reference.
+    for (int i = 1; i <= 400; i++) {
+        const double r = Rmax * i / 400.0;
+        for (int j = 0; j < 16; j++) {
+            const double theta     = 2.0 * M_PI * j / 16.0 + 0.1;
+            const double sin_theta = std::sin(theta), cos_theta = std::cos(theta);
+            const double tolerance = r < 0.01 * Rmax ? 1e-4 : 1e-6;
+            EXPECT_NEAR(tabulated.Fx(r, theta, sin_theta, cos_theta), reference.Fx(r, theta, sin_theta, cos_theta),
+                        tolerance);
+            EXPECT_NEAR(tabulated.Fy(r, theta, sin_theta, cos_theta), reference.Fy(r, theta, sin_theta, cos_theta),
+                        tolerance);
+            EXPECT_NEAR(tabulated.dFx_dr(r, theta, sin_theta, cos_theta),
+                        reference.dFx_dr(r, theta, sin_theta, cos_theta), tolerance);
+            EXPECT_NEAR(tabulated.dFy_dr(r, theta, sin_theta, cos_theta),
+                        reference.dFy_dr(r, theta, sin_theta, cos_theta), tolerance);
+            EXPECT_NEAR(tabulated.dFx_dt(r, theta, sin_theta, cos_theta),
+                        reference.dFx_dt(r, theta, sin_theta, cos_theta), tolerance);
+            EXPECT_NEAR(tabulated.dFy_dt(r, theta, sin_theta, cos_theta),
+                        reference.dFy_dt(r, theta, sin_theta, cos_theta), tolerance);
+        }
+    }
+}
+
+TEST(CulhamGeometryTest, ProfileIntervals)
+{
+    const double Rmax = 1.3;
+    EXPECT_LT(CulhamGeometry(Rmax, 500).profileTableError(), 1e-3);
+    EXPECT_THROW(CulhamGeometry(Rmax, 3), std::runtime_error);
+    EXPECT_THROW(CulhamGeometry(Rmax, -1), std::runtime_error);
+}
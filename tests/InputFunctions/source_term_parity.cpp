@@ -0,0 +1,172 @@
+#include <gtest/gtest.h>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace SourceTermParityTest
+{
+struct Parameters {
+    const double Rmax                         = 1.3;
+    const double alpha_jump                   = 0.66 * Rmax;
+    const double elongation_kappa             = 0.3;
+    const double shift_delta                  = 0.2;
+    const double inverse_aspect_ratio_epsilon = 0.3;
+    const double ellipticity_e                = 1.4;
+};
+
+template <typename T>
+T make(const Parameters& parameters, const CircularGeometry*)
+{
+    return T(parameters.Rmax);
+}
+
+template <typename T>
+T make(const Parameters& parameters, const ShafranovGeometry*)
+{
+    return T(parameters.Rmax, parameters.elongation_kappa, parameters.shift_delta);
+}
+
+template <typename T>
+T make(const Parameters& parameters, const CzarnyGeometry*)
+{
+    return T(parameters.Rmax, parameters.inverse_aspect_ratio_epsilon, parameters.ellipticity_e);
+}
+
+// -div(alpha grad u) + beta u in the polar coordinates of the mapping, with the divergence of the flux and the
+// gradient of u approximated by central differences.
+double finiteDifferenceSource(const DomainGeometry& geometry, const DensityProfileCoefficients& coefficients,
+                              const ExactSolution& exact_solution, const double r, const double theta)
+{
+    const double h = 1e-4;
+
+    auto u = [&](const double r, const double theta) {
+        return exact_solution.exact_solution(r, theta, std::sin(theta), std::cos(theta));
+    };
+    auto jacobian = [&](const double r, const double theta, double& Jrr, double& Jtr, double& Jrt, double& Jtt) {
+        const double sin_theta = std::sin(theta), cos_theta = std::cos(theta);
+        Jrr = geometry.dFx_dr(r, theta, sin_theta, cos_theta);
+        Jtr = geometry.dFy_dr(r, theta, sin_theta, cos_theta);
+        Jrt = geometry.dFx_dt(r, theta, sin_theta, cos_theta);
+        Jtt = geometry.dFy_dt(r, theta, sin_theta, cos_theta);
+        return Jrr * Jtt - Jrt * Jtr;
+    };
+    auto flux = [&](const double r, const double theta, double& flux_r, double& flux_theta) {
+        double Jrr, Jtr, Jrt, Jtt;
+        const double detDF = jacobian(r, theta, Jrr, Jtr, Jrt, Jtt);
+        const double alpha = coefficients.alpha(r, theta);
+        const double u_r   = (u(r + h, theta) - u(r - h, theta)) / (2.0 * h);
+        const double u_t   = (u(r, theta + h) - u(r, theta - h)) / (2.0 * h);
+        flux_r     = alpha / detDF * ((Jrt * Jrt + Jtt * Jtt) * u_r - (Jrr * Jrt + Jtr * Jtt) * u_t);
+        flux_theta = alpha / detDF * ((Jrr * Jrr + Jtr * Jtr) * u_t - (Jrr * Jrt + Jtr * Jtt) * u_r);
+    };
+
+    double flux_r_plus, flux_r_minus, flux_t_plus, flux_t_minus, unused, Jrr, Jtr, Jrt, Jtt;
+    flux(r + h, theta, flux_r_plus, unused);
+    flux(r - h, theta, flux_r_minus, unused);
+    flux(r, theta + h, unused, flux_t_plus);
+    flux(r, theta - h, unused, flux_t_minus);
+
+    const double detDF      = jacobian(r, theta, Jrr, Jtr, Jrt, Jtt);
+    const double divergence = (flux_r_plus - flux_r_minus + flux_t_plus - flux_t_minus) / (2.0 * h);
+    return -divergence / detDF + coefficients.beta(r, theta) * u(r, theta);
+}
+
+template <typename Source, typename Coefficients, typename Exact, typename Geometry>
+void expectConsistent()
+{
+    const Parameters parameters;
+    const Geometry* tag           = nullptr;
+    const Geometry geometry       = make<Geometry>(parameters, tag);
+    const Exact exact_solution    = make<Exact>(parameters, tag);
+    const Source source_term      = make<Source>(parameters, tag);
+    const Coefficients coefficients(parameters.Rmax, parameters.alpha_jump);
+
+    std::vector<double> expected, actual;
+    double max_value = 0.0;
+    for (int i = 1; i <= 12; i++) {
+        for (int j = 0; j < 16; j++) {
+            const double r     = parameters.Rmax * (0.05 + 0.9 * i / 12.0);
+            const double theta = 2.0 * M_PI * j / 16.0 + 0.1;
+            expected.push_back(finiteDifferenceSource(geometry, coefficients, exact_solution, r, theta));
+            actual.push_back(source_term.rhs_f(r, theta, std::sin(theta), std::cos(theta)));
+            max_value = std::max(max_value, std::abs(expected.back()));
+        }
+    }
+    for (size_t i = 0; i < expected.size(); i++) {
+        ASSERT_NEAR(actual[i], expected[i], 1e-5 * max_value) << typeid(Source).name() << " at sample " << i;
+    }
+}
+
+template <typename Geometry, typename Exact, typename Poisson, typename Sonnendrucker, typename SonnendruckerGyro,
+          typename Zoni, typename ZoniGyro, typename ZoniShifted, typename ZoniShiftedGyro>
+void expectConsistentForAllCoefficients()
+{
+    expectConsistent<Poisson, PoissonCoefficients, Exact, Geometry>();
+    expectConsistent<Sonnendrucker, SonnendruckerCoefficients, Exact, Geometry>();
+    expectConsistent<SonnendruckerGyro, SonnendruckerGyroCoefficients, Exact, Geometry>();
+    expectConsistent<Zoni, ZoniCoefficients, Exact, Geometry>();
+    expectConsistent<ZoniGyro, ZoniGyroCoefficients, Exact, Geometry>();
+    expectConsistent<ZoniShifted, ZoniShiftedCoefficients, Exact, Geometry>();
+    expectConsistent<ZoniShiftedGyro, ZoniShiftedGyroCoefficients, Exact, Geometry>();
+}
+} // namespace SourceTermParityTest
+
+using namespace SourceTermParityTest;
+
+// The source terms are generated by scripts/input_functions/generate_input_functions.py. These tests recompute
+// them independently from the geometry, the coefficients and the exact solution.
+
+TEST(SourceTermParityTest, CircularGeometry)
+{
+    expectConsistentForAllCoefficients<
+        CircularGeometry, CartesianR2_CircularGeometry, CartesianR2_Poisson_CircularGeometry,
+        CartesianR2_Sonnendrucker_CircularGeometry, CartesianR2_SonnendruckerGyro_CircularGeometry,
+        CartesianR2_Zoni_CircularGeometry, CartesianR2_ZoniGyro_CircularGeometry,
+        CartesianR2_ZoniShifted_CircularGeometry, CartesianR2_ZoniShiftedGyro_CircularGeometry>();
+    expectConsistentForAllCoefficients<
+        CircularGeometry, CartesianR6_CircularGeometry, CartesianR6_Poisson_CircularGeometry,
+        CartesianR6_Sonnendrucker_CircularGeometry, CartesianR6_SonnendruckerGyro_CircularGeometry,
+        CartesianR6_Zoni_CircularGeometry, CartesianR6_ZoniGyro_CircularGeometry,
+        CartesianR6_ZoniShifted_CircularGeometry, CartesianR6_ZoniShiftedGyro_CircularGeometry>();
+    expectConsistentForAllCoefficients<
+        CircularGeometry, PolarR6_CircularGeometry, PolarR6_Poisson_CircularGeometry,
+        PolarR6_Sonnendrucker_CircularGeometry, PolarR6_SonnendruckerGyro_CircularGeometry,
+        PolarR6_Zoni_CircularGeometry, PolarR6_ZoniGyro_CircularGeometry, PolarR6_ZoniShifted_CircularGeometry,
+        PolarR6_ZoniShiftedGyro_CircularGeometry>();
+}
+
+TEST(SourceTermParityTest, ShafranovGeometry)
+{
+    expectConsistentForAllCoefficients<
+        ShafranovGeometry, CartesianR2_ShafranovGeometry, CartesianR2_Poisson_ShafranovGeometry,
+        CartesianR2_Sonnendrucker_ShafranovGeometry, CartesianR2_SonnendruckerGyro_ShafranovGeometry,
+        CartesianR2_Zoni_ShafranovGeometry, CartesianR2_ZoniGyro_ShafranovGeometry,
+        CartesianR2_ZoniShifted_ShafranovGeometry, CartesianR2_ZoniShiftedGyro_ShafranovGeometry>();
+    expectConsistentForAllCoefficients<
+        ShafranovGeometry, CartesianR6_ShafranovGeometry, CartesianR6_Poisson_ShafranovGeometry,
+        CartesianR6_Sonnendrucker_ShafranovGeometry, CartesianR6_SonnendruckerGyro_ShafranovGeometry,
+        CartesianR6_Zoni_ShafranovGeometry, CartesianR6_ZoniGyro_ShafranovGeometry,
+        CartesianR6_ZoniShifted_ShafranovGeometry, CartesianR6_ZoniShiftedGyro_ShafranovGeometry>();
+    expectConsistentForAllCoefficients<
+        ShafranovGeometry, PolarR6_ShafranovGeometry, PolarR6_Poisson_ShafranovGeometry,
+        PolarR6_Sonnendrucker_ShafranovGeometry, PolarR6_SonnendruckerGyro_ShafranovGeometry,
+        PolarR6_Zoni_ShafranovGeometry, PolarR6_ZoniGyro_ShafranovGeometry, PolarR6_ZoniShifted_ShafranovGeometry,
+        PolarR6_ZoniShiftedGyro_ShafranovGeometry>();
+}
+
+TEST(SourceTermParityTest, CzarnyGeometry)
+{
+    expectConsistentForAllCoefficients<
+        CzarnyGeometry, CartesianR2_CzarnyGeometry, CartesianR2_Poisson_CzarnyGeometry,
+        CartesianR2_Sonnendrucker_CzarnyGeometry, CartesianR2_SonnendruckerGyro_CzarnyGeometry,
+        CartesianR2_Zoni_CzarnyGeometry, CartesianR2_ZoniGyro_CzarnyGeometry, CartesianR2_ZoniShifted_CzarnyGeometry,
+        CartesianR2_ZoniShiftedGyro_CzarnyGeometry>();
+    expectConsistentForAllCoefficients<
+        CzarnyGeometry, CartesianR6_CzarnyGeometry, CartesianR6_Poisson_CzarnyGeometry,
+        CartesianR6_Sonnendrucker_CzarnyGeometry, CartesianR6_SonnendruckerGyro_CzarnyGeometry,
+        CartesianR6_Zoni_CzarnyGeometry, CartesianR6_ZoniGyro_CzarnyGeometry, CartesianR6_ZoniShifted_CzarnyGeometry,
+        CartesianR6_ZoniShiftedGyro_CzarnyGeometry>();
+    expectConsistentForAllCoefficients<
+        CzarnyGeometry, PolarR6_CzarnyGeometry, PolarR6_Poisson_CzarnyGeometry, PolarR6_Sonnendrucker_CzarnyGeometry,
+        PolarR6_SonnendruckerGyro_CzarnyGeometry, PolarR6_Zoni_CzarnyGeometry, PolarR6_ZoniGyro_CzarnyGeometry,
+        PolarR6_ZoniShifted_CzarnyGeometry, PolarR6_ZoniShiftedGyro_CzarnyGeometry>();
+}
@@ -0,0 +1,158 @@
+#include <gtest/gtest.h>
+
+#include <cstdio>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+
+namespace TabulatedGeometryTest
+{
+// Tabulates Fx and Fy of 'geometry' on nr uniform radii in [0, Rmax] and ntheta uniform angles.
+std::string writeGeometryTable(const DomainGeometry& geometry, const double Rmax, const int nr, const int ntheta,
+                               const std::string& name)
+{
+    std::vector<double> radii(nr), values(2 * nr * ntheta);
+    for (int i = 0; i < nr; i++) {
+        radii[i] = Rmax * i / (nr - 1);
+        for (int j = 0; j < ntheta; j++) {
+            const double theta             = 2.0 * M_PI * j / ntheta;
+            values[i * ntheta + j]        = geometry.Fx(radii[i], theta, std::sin(theta), std::cos(theta));
+            values[(nr + i) * ntheta + j] = geometry.Fy(radii[i], theta, std::sin(theta), std::cos(theta));
+        }
+    }
+    const std::string path = testing::TempDir() + name;
+    TabulatedTable::write(path, radii, ntheta, 2, values);
+    return path;
+}
+} // namespace TabulatedGeometryTest
+
+using namespace TabulatedGeometryTest;
+
+TEST(TabulatedGeometryTest, InterpolatesAnalyticGeometry)
+// The interpolation is third order accurate in the values and second order accurate in the derivatives.
+{
+    const double Rmax = 1.3;
+    const CzarnyGeometry czarny(Rmax, 0.3, 1.4);
+    const std::string path = writeGeometryTable(czarny, Rmax, 257, 512, "czarny_table.bin");
+    const TabulatedGeometry tabulated(path);
+
+    EXPECT_EQ(tabulated.table().nr(), 257);
+    EXPECT_EQ(tabulated.table().ntheta(), 512);
+    for (int i = 0; i <= 50; i++) {
+        const double r = Rmax * (0.02 + 0.98 * i / 50.0) - 1e-3;
+        for (int j = 0; j < 37; j++) {
+            const double theta     = 2.0 * M_PI * j / 37.0 + 0.01;
+            const double sin_theta = std::sin(theta), cos_theta = std::cos(theta);
+            EXPECT_NEAR(tabulated.Fx(r, theta, sin_theta, cos_theta), czarny.Fx(r, theta, sin_theta, cos_theta), 1e-6);
+            EXPECT_NEAR(tabulated.Fy(r, theta, sin_theta, cos_theta), czarny.Fy(r, theta, sin_theta, cos_theta), 1e-6);
+            EXPECT_NEAR(tabulated.dFx_dr(r, theta, sin_theta, cos_theta),
+                        czarny.dFx_dr(r, theta, sin_theta, cos_theta), 1e-3);
+            EXPECT_NEAR(tabulated.dFy_dr(r, theta, sin_theta, cos_theta),
+                        czarny.dFy_dr(r, theta, sin_theta, cos_theta), 1e-3);
+            EXPECT_NEAR(tabulated.dFx_dt(r, theta, sin_theta, cos_theta),
+                        czarny.dFx_dt(r, theta, sin_theta, cos_theta), 1e-3);
+            EXPECT_NEAR(tabulated.dFy_dt(r, theta, sin_theta, cos_theta),
+                        czarny.dFy_dt(r, theta, sin_theta, cos_theta), 1e-3);
+        }
+    }
+    std::remove(path.c_str());
+}
+
+TEST(TabulatedGeometryTest, BatchedEvaluationMatchesPointwise)
+{
+    const double Rmax      = 1.3;
+    const std::string path = writeGeometryTable(ShafranovGeometry(Rmax, 0.3, 0.2), Rmax, 33, 64, "shafranov_table.bin");
+    const TabulatedGeometry geometry(path);
+    const PolarGrid grid(1e-5, Rmax, 4, -1, 0.66 * Rmax, 2, 1);
+
+    const int count = std::max(grid.nr(), grid.ntheta());
+    std::vector<double> sin_theta(grid.ntheta()), cos_theta(grid.ntheta());
+    for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+        sin_theta[i_theta] = std::sin(grid.theta(i_theta));
+        cos_theta[i_theta] = std::cos(grid.theta(i_theta));
+    }
+    std::vector<double> Fx(count), Fy(count), dFx_dr(count), dFy_dr(count), dFx_dt(count), dFy_dt(count);
+
+    for (int i_r = 0; i_r < grid.nr(); i_r++) {
+        const double r = grid.radius(i_r);
+        geometry.evaluateCircle(r, grid.ntheta(), grid.angles().data(), sin_theta.data(), cos_theta.data(), Fx.data(),
+                                Fy.data(), dFx_dr.data(), dFy_dr.data(), dFx_dt.data(), dFy_dt.data());
+        for (int i = 0; i < grid.ntheta(); i++) {
+            const double theta = grid.theta(i);
+            ASSERT_DOUBLE_EQ(Fx[i], geometry.Fx(r, theta, sin_theta[i], cos_theta[i]));
+            ASSERT_DOUBLE_EQ(Fy[i], geometry.Fy(r, theta, sin_theta[i], cos_theta[i]));
+            ASSERT_DOUBLE_EQ(dFx_dr[i], geometry.dFx_dr(r, theta, sin_theta[i], cos_theta[i]));
+            ASSERT_DOUBLE_EQ(dFy_dr[i], geometry.dFy_dr(r, theta, sin_theta[i], cos_theta[i]));
+            ASSERT_DOUBLE_EQ(dFx_dt[i], geometry.dFx_dt(r, theta, sin_theta[i], cos_theta[i]));
+            ASSERT_DOUBLE_EQ(dFy_dt[i], geometry.dFy_dt(r, theta, sin_theta[i], cos_theta[i]));
+        }
+    }
+
+    for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+        const double theta = grid.theta(i_theta);
+        geometry.evaluateRadialLine(grid.nr(), grid.radii().data(), theta, sin_theta[i_theta], cos_theta[i_theta],
+                                    nullptr, nullptr, dFx_dr.data(), dFy_dr.data(), dFx_dt.data(), dFy_dt.data());
+        for (int i = 0; i < grid.nr(); i++) {
+            const double r = grid.radius(i);
+            ASSERT_DOUBLE_EQ(dFx_dr[i], geometry.dFx_dr(r, theta, sin_theta[i_theta], cos_theta[i_theta]));
+            ASSERT_DOUBLE_EQ(dFy_dr[i], geometry.dFy_dr(r, theta, sin_theta[i_theta], cos_theta[i_theta]));
+            ASSERT_DOUBLE_EQ(dFx_dt[i], geometry.dFx_dt(r, theta, sin_theta[i_theta], cos_theta[i_theta]));
+            ASSERT_DOUBLE_EQ(dFy_dt[i], geometry.dFy_dt(r, theta, sin_theta[i_theta], cos_theta[i_theta]));
+        }
+    }
+    std::remove(path.c_str());
+}
+
+TEST(TabulatedGeometryTest, RadialCoefficientTable)
+{
+    const double Rmax       = 1.3;
+    const double alpha_jump = 0.66 * Rmax;
+    const ZoniGyroCoefficients zoni(Rmax, alpha_jump);
+
+    const int nr = 513;
+    std::vector<double> radii(nr), values(2 * nr);
+    for (int i = 0; i < nr; i++) {
+        radii[i]      = Rmax * i / (nr - 1);
+        values[i]      = zoni.alpha(radii[i], 0.0);
+        values[nr + i] = zoni.beta(radii[i], 0.0);
+    }
+    const std::string path = testing::TempDir() + "zoni_table.bin";
+    TabulatedTable::write(path, radii, 1, 2, values);
+    const TabulatedDensityProfileCoefficients tabulated(path, alpha_jump);
+
+    EXPECT_TRUE(tabulated.isAngleIndependent());
+    EXPECT_EQ(tabulated.getAlphaJump(), alpha_jump);
+    for (int i = 0; i <= 200; i++) {
+        const double r = Rmax * i / 200.0;
+        EXPECT_NEAR(tabulated.alpha(r, 1.0), zoni.alpha(r, 1.0), 1e-5 * zoni.alpha(r, 1.0));
+        EXPECT_NEAR(tabulated.beta(r, 2.0), zoni.beta(r, 2.0), 1e-5 * zoni.beta(r, 2.0));
+    }
+
+    // The radial profiles of the level cache accept the table.
+    const PolarGrid grid(1e-5, Rmax, 4, -1, alpha_jump, 2, 1);
+    const CircularGeometry circular(Rmax);
+    EXPECT_NO_THROW(LevelCache(grid, tabulated, circular, true, true, true));
+    std::remove(path.c_str());
+}
+
+TEST(TabulatedGeometryTest, RejectInvalidTables)
+{
+    EXPECT_THROW(TabulatedGeometry(testing::TempDir() + "does_not_exist.bin"), std::runtime_error);
+
+    // Three fields instead of Fx and Fy.
+    const std::string path = testing::TempDir() + "three_fields.bin";
+    TabulatedTable::write(path, {0.0, 0.5, 1.0}, 4, 3, std::vector<double>(3 * 3 * 4, 1.0));
+    EXPECT_THROW(TabulatedGeometry{path}, std::runtime_error);
+    EXPECT_NO_THROW(TabulatedTable{path});
+
+    // Radii not increasing.
+    TabulatedTable::write(path, {0.0, 1.0, 0.5}, 4, 2, std::vector<double>(2 * 3 * 4, 1.0));
+    EXPECT_THROW(TabulatedGeometry{path}, std::runtime_error);
+
+    // Truncated file.
+    {
+        std::ofstream file(path, std::ios::binary);
+        file.write("GMGPTAB1", 8);
+    }
+    EXPECT_THROW(TabulatedTable{path}, std::runtime_error);
+    std::remove(path.c_str());
+}
@@ -73,3 +73,50 @@ TEST(ExtrapolatedProlongationTest, ExtrapolatedProlongationSmoothingRadius)
         ASSERT_DOUBLE_EQ(result1[i], result2[i]);
     }
 }
+
+TEST(ExtrapolatedProlongationTest, ExtrapolatedProlongationAdd)
+{
+    std::vector<double> fine_radii  = {0.1, 0.2, 0.25, 0.5, 0.8, 0.9, 1.3, 1.4, 2.0};
+    std::vector<double> fine_angles = {
+        0, M_PI / 16, M_PI / 8, M_PI / 2, M_PI, M_PI + M_PI / 16, M_PI + M_PI / 8, M_PI + M_PI / 2, M_PI + M_PI};
+
+    double Rmax = fine_radii.back();
+    CircularGeometry domain_geometry(Rmax);
+    bool DirBC_Interior                     = true;
+    bool cache_density_rpofile_coefficients = true;
+    bool cache_domain_geometry              = false;
+
+    auto finest_grid = std::make_unique<PolarGrid>(fine_radii, fine_angles);
+    auto coarse_grid = std::make_unique<PolarGrid>(coarseningGrid(*finest_grid));
+
+    std::unique_ptr<DensityProfileCoefficients> coefficients = std::make_unique<PoissonCoefficients>();
+    auto finest_levelCache = std::make_unique<LevelCache>(*finest_grid, *coefficients, domain_geometry,
+                                                          cache_density_rpofile_coefficients, cache_domain_geometry);
+    auto coarse_levelCache = std::make_unique<LevelCache>(*coarse_grid, *coefficients, domain_geometry,
+                                                          cache_density_rpofile_coefficients, cache_domain_geometry);
+
+    Level finest_level(0, std::move(finest_grid), std::move(finest_levelCache),
+                       ExtrapolationType::IMPLICIT_EXTRAPOLATION, 0);
+    Level coarse_level(1, std::move(coarse_grid), std::move(coarse_levelCache),
+                       ExtrapolationType::IMPLICIT_EXTRAPOLATION, 0);
+
+    const int maxOpenMPThreads               = 16;
+    const std::vector<int> threads_per_level = {maxOpenMPThreads, maxOpenMPThreads};
+
+    Interpolation interpolation_operator(threads_per_level, DirBC_Interior);
+
+    Vector<double> x = generate_random_sample_data(coarse_level.grid(), 42);
+    Vector<double> y = generate_random_sample_data(finest_level.grid(), 69);
+
+    // y + P_ex * x
+    Vector<double> expected("expected", finest_level.grid().numberOfNodes());
+    interpolation_operator.applyExtrapolatedProlongation(coarse_level, finest_level, expected, x);
+    add(expected, ConstVector<double>(y));
+
+    interpolation_operator.applyExtrapolatedProlongationAdd(coarse_level, finest_level, y, x);
+
+    ASSERT_EQ(expected.size(), y.size());
+    for (int i = 0; i < expected.size(); ++i) {
+        ASSERT_DOUBLE_EQ(expected[i], y[i]);
+    }
+}
@@ -805,3 +805,36 @@ TEST(SparseLUSolver, 5x5SPD)
     solver.solveInPlace(b);
     expectVectorNear(b, x_true, 1e-8);
 }
+
+// 41. Test several right-hand sides in one solve, every column matches its single solve
+TEST(SparseLUSolver, MultipleRightHandSides)
+{
+    std::vector<SparseMatrixCSR<double>::triplet_type> entries = {{0, 0, 4.0}, {0, 2, 1.0}, {1, 1, 5.0}, {1, 4, -1.0},
+                                                                  {2, 0, 1.0}, {2, 2, 6.0}, {3, 1, 2.0}, {3, 3, 7.0},
+                                                                  {4, 3, 1.0}, {4, 4, 8.0}};
+    const int n                 = 5;
+    const int number_of_columns = 3;
+    const int leading_dimension = 6;
+    SparseMatrixCSR<double> A(n, n, sort_entries(entries));
+    SparseLUSolver<double> solver(A);
+
+    std::vector<double> batch(number_of_columns * leading_dimension, -1.0);
+    for (int column = 0; column < number_of_columns; column++) {
+        for (int i = 0; i < n; i++) {
+            batch[column * leading_dimension + i] = std::sin(1.0 + i + 7.0 * column);
+        }
+    }
+    std::vector<double> expected = batch;
+    for (int column = 0; column < number_of_columns; column++) {
+        solver.solveInPlace(expected.data() + column * leading_dimension);
+    }
+
+    solver.solveInPlace(batch.data(), number_of_columns, leading_dimension);
+    for (int column = 0; column < number_of_columns; column++) {
+        for (int i = 0; i < n; i++) {
+            EXPECT_DOUBLE_EQ(batch[column * leading_dimension + i], expected[column * leading_dimension + i]);
+        }
+        // Entries between the columns are left untouched.
+        EXPECT_EQ(batch[column * leading_dimension + n], -1.0);
+    }
+}
@@ -366,3 +366,56 @@ TEST(SymmetricTridiagonalSolver, random_tridiagonal_boosted_subdiagonal_LOW_PREC
     EXPECT_NEAR(copy_solver.sub_diagonal(n - 2) * rhs[n - 2] + copy_solver.main_diagonal(n - 1) * rhs[n - 1],
                 copy_rhs[n - 1], precision);
 }
+
+TEST(SymmetricTridiagonalSolver, single_precision_factors_n_1000)
+{
+    const int n            = 1000;
+    const double precision = 1e-5;
+
+    SymmetricTridiagonalSolver<double> solver(n);
+    solver.is_cyclic(false);
+    solver.single_precision_factors(true);
+
+    std::mt19937 gen(42);
+    std::uniform_real_distribution<> dis(-1.0, 1.0);
+
+    // Diagonally dominant, so that the rounded factors remain a good approximation
+    for (int i = 0; i < n; ++i) {
+        solver.main_diagonal(i) = 4.0 + dis(gen);
+    }
+    for (int i = 0; i < n - 1; ++i) {
+        solver.sub_diagonal(i) = dis(gen);
+    }
+
+    const SymmetricTridiagonalSolver<double> copy_solver = solver;
+    EXPECT_TRUE(copy_solver.single_precision_factors());
+
+    Vector<double> rhs("rhs", n);
+    for (int i = 0; i < n; ++i) {
+        rhs[i] = dis(gen);
+    }
+
+    Vector<double> copy_rhs("copy_rhs", rhs.size());
+    Kokkos::deep_copy(copy_rhs, rhs);
+
+    Vector<double> temp("temp", n);
+    solver.solveInPlace(rhs.data(), temp.data());
+
+    EXPECT_NEAR(copy_solver.main_diagonal(0) * rhs[0] + copy_solver.sub_diagonal(0) * rhs[1], copy_rhs[0], precision);
+    for (int i = 1; i < n - 1; ++i) {
+        EXPECT_NEAR(copy_solver.sub_diagonal(i - 1) * rhs[i - 1] + copy_solver.main_diagonal(i) * rhs[i] +
+                        copy_solver.sub_diagonal(i) * rhs[i + 1],
+                    copy_rhs[i], precision);
+    }
+    EXPECT_NEAR(copy_solver.sub_diagonal(n - 2) * rhs[n - 2] + copy_solver.main_diagonal(n - 1) * rhs[n - 1],
+                copy_rhs[n - 1], precision);
+
+    // A copy of the factorized solver reuses the rounded factors.
+    SymmetricTridiagonalSolver<double> factorized_copy = solver;
+    Vector<double> second_rhs("second_rhs", n);
+    Kokkos::deep_copy(second_rhs, copy_rhs);
+    factorized_copy.solveInPlace(second_rhs.data(), temp.data());
+    for (int i = 0; i < n; ++i) {
+        EXPECT_DOUBLE_EQ(second_rhs[i], rhs[i]);
+    }
+}
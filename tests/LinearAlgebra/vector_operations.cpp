@@ -198,3 +198,31 @@ TEST(VectorOperations, infinity_vector_norm)
     ConstVector<double> const_v(v);
     EXPECT_DOUBLE_EQ(infinity_norm(ConstVector<double>(const_v)), 5.0);
 }
+
+/* Vectors above 10'000 entries run through the parallel loops of common/parallel.h. */
+
+TEST(VectorOperations, long_vectors)
+{
+    const int n = 100'000;
+    Vector<double> v("v", n);
+    Vector<double> w("w", n);
+    assign(v, 2.0);
+    assign(w, -1.0);
+    w(n / 2) = -7.0;
+
+    add(v, ConstVector<double>(w));
+    subtract(w, ConstVector<double>(v));
+    linear_combination(v, 2.0, ConstVector<double>(w), 1.0);
+    multiply(w, 0.5);
+
+    // w = -1 everywhere, v = 2 * 1 - 2 = 0 except v(n / 2) = 2 * (-5) - 2 = -12
+    EXPECT_DOUBLE_EQ(v(0), 0.0);
+    EXPECT_DOUBLE_EQ(v(n / 2), -12.0);
+    EXPECT_DOUBLE_EQ(w(n / 2), -1.0);
+
+    EXPECT_DOUBLE_EQ(dot_product(ConstVector<double>(v), ConstVector<double>(w)), 12.0);
+    EXPECT_DOUBLE_EQ(l1_norm(ConstVector<double>(w)), n);
+    EXPECT_DOUBLE_EQ(l2_norm_squared(ConstVector<double>(w)), n);
+    EXPECT_DOUBLE_EQ(l2_norm(ConstVector<double>(v)), 12.0);
+    EXPECT_DOUBLE_EQ(infinity_norm(ConstVector<double>(v)), 12.0);
+}
@@ -150,3 +150,111 @@ TEST(OperatorATest, applyA_AcrossOrigin)
             ASSERT_NEAR(result_Give[index], result_Take[index], 1e-11);
     }
 }
+
+/* Mostly circles and a number of angles that is not a power of two, so that */
+/* the vectorized interior circle rows and the peeled nodes at theta = 0 are covered. */
+TEST(OperatorATest, applyA_CircleSection)
+{
+    std::vector<double> radii  = {1e-5, 0.1, 0.15, 0.3, 0.4, 0.55, 0.6, 0.8, 0.9, 1.0, 1.15, 1.3};
+    std::vector<double> angles = {0,
+                                  M_PI / 10,
+                                  M_PI / 4,
+                                  M_PI / 2,
+                                  3 * M_PI / 4,
+                                  M_PI,
+                                  M_PI + M_PI / 10,
+                                  M_PI + M_PI / 4,
+                                  M_PI + M_PI / 2,
+                                  M_PI + 3 * M_PI / 4,
+                                  M_PI + M_PI};
+
+    double Rmax      = radii.back();
+    double kappa_eps = 0.3;
+    double delta_e   = 1.4;
+
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+
+    double alpha_jump = 0.678 * Rmax;
+    std::unique_ptr<DensityProfileCoefficients> coefficients =
+        std::make_unique<ZoniShiftedCoefficients>(Rmax, alpha_jump);
+
+    int maxOpenMPThreads = 4;
+
+    for (bool DirBC_Interior : {true, false}) {
+        auto grid       = std::make_unique<PolarGrid>(radii, angles, 0.95);
+        auto levelCache = std::make_unique<LevelCache>(*grid, *coefficients, domain_geometry, true, true);
+        Level level(0, std::move(grid), std::move(levelCache), ExtrapolationType::NONE, false);
+        ASSERT_GT(level.grid().numberSmootherCircles(), 3);
+
+        ResidualGive residualGive_operator(level.grid(), level.levelCache(), domain_geometry, *coefficients,
+                                           DirBC_Interior, maxOpenMPThreads);
+        ResidualTake residualTake_operator(level.grid(), level.levelCache(), domain_geometry, *coefficients,
+                                           DirBC_Interior, maxOpenMPThreads);
+
+        Vector<double> x   = generate_random_sample_data(level.grid(), 42);
+        Vector<double> rhs = generate_random_sample_data(level.grid(), 69);
+
+        Vector<double> result_Give("result_Give", level.grid().numberOfNodes());
+        residualGive_operator.computeResidual(result_Give, rhs, x);
+
+        Vector<double> result_Take("result_Take", level.grid().numberOfNodes());
+        residualTake_operator.computeResidual(result_Take, rhs, x);
+
+        for (int index = 0; index < result_Give.size(); index++) {
+            MultiIndex alpha = level.grid().multiIndex(index);
+            if (alpha[0] == 0 && !DirBC_Interior)
+                ASSERT_NEAR(result_Give[index], result_Take[index], 1e-8);
+            else
+                ASSERT_NEAR(result_Give[index], result_Take[index], 1e-11);
+        }
+    }
+}
+
+/* The batched residual evaluates the stencil once for all columns, */
+/* every column has to match computeResidual exactly. */
+TEST(OperatorATest, applyA_Batch)
+{
+    std::vector<double> radii  = {1e-5, 0.2, 0.25, 0.5, 0.8, 0.9, 0.95, 1.2, 1.3};
+    std::vector<double> angles = {
+        0, M_PI / 16, M_PI / 8, M_PI / 2, M_PI, M_PI + M_PI / 16, M_PI + M_PI / 8, M_PI + M_PI / 2, M_PI + M_PI};
+
+    double Rmax      = radii.back();
+    double kappa_eps = 0.3;
+    double delta_e   = 1.4;
+
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+
+    double alpha_jump = 0.678 * Rmax;
+    std::unique_ptr<DensityProfileCoefficients> coefficients =
+        std::make_unique<ZoniShiftedCoefficients>(Rmax, alpha_jump);
+
+    auto grid       = std::make_unique<PolarGrid>(radii, angles);
+    auto levelCache = std::make_unique<LevelCache>(*grid, *coefficients, domain_geometry, true, true);
+    Level level(0, std::move(grid), std::move(levelCache), ExtrapolationType::NONE, false);
+
+    const int n                 = level.grid().numberOfNodes();
+    const int number_of_columns = 3;
+
+    for (const bool DirBC_Interior : {true, false}) {
+        ResidualTake residual_operator(level.grid(), level.levelCache(), domain_geometry, *coefficients,
+                                       DirBC_Interior, 4);
+
+        Vector<double> x("x", number_of_columns * n);
+        Vector<double> rhs("rhs", number_of_columns * n);
+        for (int column = 0; column < number_of_columns; column++) {
+            Kokkos::deep_copy(batchColumn(x, column, n), generate_random_sample_data(level.grid(), 42 + column));
+            Kokkos::deep_copy(batchColumn(rhs, column, n), generate_random_sample_data(level.grid(), 69 + column));
+        }
+
+        Vector<double> result("result", number_of_columns * n);
+        residual_operator.computeResidualBatch(result, rhs, x, number_of_columns);
+
+        for (int column = 0; column < number_of_columns; column++) {
+            Vector<double> expected("expected", n);
+            residual_operator.computeResidual(expected, batchColumn(rhs, column, n), batchColumn(x, column, n));
+            for (int index = 0; index < n; index++) {
+                ASSERT_EQ(result[column * n + index], expected[index]) << "column " << column << ", node " << index;
+            }
+        }
+    }
+}
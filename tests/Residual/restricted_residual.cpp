@@ -0,0 +1,167 @@
+#include <gtest/gtest.h>
+
+#include <random>
+
+#include "../../include/GMGPolar/gmgpolar.h"
+#include "../../include/Interpolation/interpolation.h"
+#include "../../include/InputFunctions/DensityProfileCoefficients/poissonCoefficients.h"
+
+#include "../../include/Residual/ResidualGive/residualGive.h"
+#include "../../include/Residual/ResidualTake/residualTake.h"
+
+namespace RestrictedResidualTest
+{
+Vector<double> generate_random_sample_data(const PolarGrid& grid, unsigned int seed)
+{
+    Vector<double> x("x", grid.numberOfNodes());
+    std::mt19937 gen(seed);
+    std::uniform_real_distribution<double> dist(-100.0, 100.0);
+    for (int i = 0; i < x.size(); ++i) {
+        x(i) = dist(gen);
+    }
+    return x;
+}
+
+/* The fused operator has to match computeResidual followed by the restriction of Interpolation. */
+void compareWithUnfused(const bool DirBC_Interior, const bool extrapolated, const int num_omp_threads)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+
+    auto fine_grid   = std::make_unique<PolarGrid>(1e-5, Rmax, 5, -1, alpha_jump, 3, 1);
+    auto coarse_grid = std::make_unique<PolarGrid>(coarseningGrid(*fine_grid));
+
+    // "Take" requires cached values
+    auto fine_levelCache   = std::make_unique<LevelCache>(*fine_grid, coefficients, domain_geometry, true, true);
+    auto coarse_levelCache = std::make_unique<LevelCache>(*coarse_grid, coefficients, domain_geometry, true, true);
+
+    Level fine_level(0, std::move(fine_grid), std::move(fine_levelCache), ExtrapolationType::NONE, false);
+    Level coarse_level(1, std::move(coarse_grid), std::move(coarse_levelCache), ExtrapolationType::NONE, false);
+
+    ResidualTake residual_operator(fine_level.grid(), fine_level.levelCache(), domain_geometry, coefficients,
+                                   DirBC_Interior, num_omp_threads);
+    Interpolation interpolation_operator({num_omp_threads, num_omp_threads}, DirBC_Interior);
+
+    Vector<double> x   = generate_random_sample_data(fine_level.grid(), 42);
+    Vector<double> rhs = generate_random_sample_data(fine_level.grid(), 69);
+
+    Vector<double> residual("residual", fine_level.grid().numberOfNodes());
+    Vector<double> expected("expected", coarse_level.grid().numberOfNodes());
+    residual_operator.computeResidual(residual, rhs, x);
+    if (extrapolated)
+        interpolation_operator.applyExtrapolatedRestriction(fine_level, coarse_level, expected, residual);
+    else
+        interpolation_operator.applyRestriction(fine_level, coarse_level, expected, residual);
+
+    Vector<double> result("result", coarse_level.grid().numberOfNodes());
+    ASSERT_TRUE(residual_operator.hasRestrictedResidual());
+    residual_operator.computeRestrictedResidual(coarse_level.grid(), result, rhs, x, extrapolated);
+
+    for (int index = 0; index < result.size(); index++) {
+        MultiIndex alpha = coarse_level.grid().multiIndex(index);
+        ASSERT_DOUBLE_EQ(result[index], expected[index]) << "at (" << alpha[0] << ", " << alpha[1] << ")";
+    }
+}
+} // namespace RestrictedResidualTest
+
+using namespace RestrictedResidualTest;
+
+TEST(RestrictedResidualTest, MatchesRestriction_DirBC_Interior)
+{
+    compareWithUnfused(true, false, 1);
+    compareWithUnfused(true, false, 3);
+}
+
+TEST(RestrictedResidualTest, MatchesRestriction_AcrossOrigin)
+{
+    compareWithUnfused(false, false, 1);
+    compareWithUnfused(false, false, 4);
+}
+
+TEST(RestrictedResidualTest, MatchesExtrapolatedRestriction)
+{
+    compareWithUnfused(true, true, 2);
+    compareWithUnfused(false, true, 1);
+    compareWithUnfused(false, true, 5);
+}
+
+TEST(RestrictedResidualTest, GiveHasNoFusedRestriction)
+{
+    const double Rmax = 1.3;
+    CircularGeometry domain_geometry(Rmax);
+    PoissonCoefficients coefficients;
+
+    auto grid       = std::make_unique<PolarGrid>(1e-5, Rmax, 3, -1, 0.66, 0, 1);
+    auto levelCache = std::make_unique<LevelCache>(*grid, coefficients, domain_geometry, true, false);
+    Level level(0, std::move(grid), std::move(levelCache), ExtrapolationType::NONE, false);
+
+    ResidualGive residual_operator(level.grid(), level.levelCache(), domain_geometry, coefficients, true, 1);
+    EXPECT_FALSE(residual_operator.hasRestrictedResidual());
+
+    Vector<double> x("x", level.grid().numberOfNodes());
+    Vector<double> result("result", level.grid().numberOfNodes());
+    EXPECT_THROW(residual_operator.computeRestrictedResidual(level.grid(), result, x, x, false), std::runtime_error);
+}
+
+/* The single precision variants evaluate the stencil in double precision and only round the vectors. */
+TEST(RestrictedResidualTest, SinglePrecisionMatchesDoublePrecision)
+{
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+    ZoniShiftedGyroCoefficients coefficients(Rmax, alpha_jump);
+
+    auto fine_grid   = std::make_unique<PolarGrid>(1e-5, Rmax, 5, -1, alpha_jump, 3, 1);
+    auto coarse_grid = std::make_unique<PolarGrid>(coarseningGrid(*fine_grid));
+    auto fine_levelCache   = std::make_unique<LevelCache>(*fine_grid, coefficients, domain_geometry, true, true);
+    auto coarse_levelCache = std::make_unique<LevelCache>(*coarse_grid, coefficients, domain_geometry, true, true);
+    Level fine_level(0, std::move(fine_grid), std::move(fine_levelCache), ExtrapolationType::NONE, false);
+    Level coarse_level(1, std::move(coarse_grid), std::move(coarse_levelCache), ExtrapolationType::NONE, false);
+
+    ResidualTake residual_operator(fine_level.grid(), fine_level.levelCache(), domain_geometry, coefficients, false,
+                                   3);
+    ASSERT_TRUE(residual_operator.hasSinglePrecision());
+
+    const int fine_nodes   = fine_level.grid().numberOfNodes();
+    const int coarse_nodes = coarse_level.grid().numberOfNodes();
+
+    // Round the inputs first, so the float and double inputs describe the same vectors.
+    Vector<double> x   = generate_random_sample_data(fine_level.grid(), 42);
+    Vector<double> rhs = generate_random_sample_data(fine_level.grid(), 69);
+    Vector<float> x_float("x_float", fine_nodes);
+    Vector<float> rhs_float("rhs_float", fine_nodes);
+    for (int index = 0; index < fine_nodes; index++) {
+        x_float[index]   = static_cast<float>(x[index]);
+        rhs_float[index] = static_cast<float>(rhs[index]);
+        x[index]         = x_float[index];
+        rhs[index]       = rhs_float[index];
+    }
+
+    Vector<double> expected("expected", coarse_nodes);
+    Vector<float> result_double_input("result_double_input", coarse_nodes);
+    Vector<float> result_float_input("result_float_input", coarse_nodes);
+    residual_operator.computeRestrictedResidual(coarse_level.grid(), expected, rhs, x, false);
+    residual_operator.computeRestrictedResidualSinglePrecision(coarse_level.grid(), result_double_input, rhs, x);
+    residual_operator.computeRestrictedResidualSinglePrecision(coarse_level.grid(), result_float_input, rhs_float,
+                                                               x_float);
+
+    // With float inputs the differences of neighbouring values are rounded as well, which cancels in the sum.
+    double max_expected = 0.0;
+    for (int index = 0; index < coarse_nodes; index++)
+        max_expected = std::max(max_expected, std::abs(expected[index]));
+    for (int index = 0; index < coarse_nodes; index++) {
+        MultiIndex alpha = coarse_level.grid().multiIndex(index);
+        ASSERT_FLOAT_EQ(result_double_input[index], static_cast<float>(expected[index]))
+            << "at (" << alpha[0] << ", " << alpha[1] << ")";
+        ASSERT_NEAR(result_float_input[index], expected[index], 1e-6 * max_expected)
+            << "at (" << alpha[0] << ", " << alpha[1] << ")";
+    }
+}
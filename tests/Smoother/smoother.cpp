@@ -161,6 +161,63 @@ TEST(SmootherTest, smoother_AcrossOrigin)
     }
 }
 
+/* Mostly circles and a number of angles that is not a power of two, so that */
+/* the vectorized interior circle rows and the peeled nodes at theta = 0 are covered. */
+TEST(SmootherTest, smoother_CircleSection)
+{
+    std::vector<double> radii  = {1e-5, 0.1, 0.15, 0.3, 0.4, 0.55, 0.6, 0.8, 0.9, 1.0, 1.15, 1.3};
+    std::vector<double> angles = {0,
+                                  M_PI / 10,
+                                  M_PI / 4,
+                                  M_PI / 2,
+                                  3 * M_PI / 4,
+                                  M_PI,
+                                  M_PI + M_PI / 10,
+                                  M_PI + M_PI / 4,
+                                  M_PI + M_PI / 2,
+                                  M_PI + 3 * M_PI / 4,
+                                  M_PI + M_PI};
+
+    double Rmax      = radii.back();
+    double kappa_eps = 0.3;
+    double delta_e   = 1.4;
+
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+
+    double alpha_jump = 0.678 * Rmax;
+    std::unique_ptr<DensityProfileCoefficients> coefficients =
+        std::make_unique<ZoniShiftedCoefficients>(Rmax, alpha_jump);
+
+    bool DirBC_Interior  = true;
+    int maxOpenMPThreads = 4;
+
+    auto grid       = std::make_unique<PolarGrid>(radii, angles, 0.95);
+    auto levelCache = std::make_unique<LevelCache>(*grid, *coefficients, domain_geometry, true, true);
+    Level level(0, std::move(grid), std::move(levelCache), ExtrapolationType::NONE, 0);
+    ASSERT_GT(level.grid().numberSmootherCircles(), 3);
+
+    SmootherGive smootherGive_operator(level.grid(), level.levelCache(), domain_geometry, *coefficients, DirBC_Interior,
+                                       maxOpenMPThreads);
+    SmootherTake smootherTake_operator(level.grid(), level.levelCache(), domain_geometry, *coefficients, DirBC_Interior,
+                                       maxOpenMPThreads);
+
+    Vector<double> rhs   = generate_random_sample_data(level.grid(), 69);
+    Vector<double> start = generate_random_sample_data(level.grid(), 24);
+    Vector<double> temp  = generate_random_sample_data(level.grid(), 8);
+
+    Vector<double> solution_Give("solution_Give", start.size());
+    Kokkos::deep_copy(solution_Give, start);
+    smootherGive_operator.smoothing(solution_Give, rhs, temp);
+
+    Vector<double> solution_Take("solution_Take", start.size());
+    Kokkos::deep_copy(solution_Take, start);
+    smootherTake_operator.smoothing(solution_Take, rhs, temp);
+
+    for (int index = 0; index < solution_Give.size(); index++) {
+        ASSERT_NEAR(solution_Give[index], solution_Take[index], 1e-10);
+    }
+}
+
 /* Test 2/2: */
 /* Does the smoother converge to the directSolver solution? */
 
@@ -1421,3 +1478,111 @@ TEST(SmootherTest, ParallelSmootherTakeAcrossOrigin_SmallestGrid)
     ASSERT_LT(iterations, 80);
     ASSERT_NEAR(infinity_norm(ConstVector<double>(error)), 0.0, precision);
 }
+
+/* The batched smoother relaxes every line for all columns, */
+/* every column has to match smoothing() exactly. */
+TEST(SmootherTest, SmootherTakeBatch)
+{
+    std::vector<double> radii  = {1e-5, 0.2, 0.25, 0.5, 0.8, 0.9, 0.95, 1.2, 1.3};
+    std::vector<double> angles = {
+        0, M_PI / 16, M_PI / 8, M_PI / 2, M_PI, M_PI + M_PI / 16, M_PI + M_PI / 8, M_PI + M_PI / 2, M_PI + M_PI};
+
+    double Rmax      = radii.back();
+    double kappa_eps = 0.3;
+    double delta_e   = 1.4;
+
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+
+    double alpha_jump = 0.678 * Rmax;
+    std::unique_ptr<DensityProfileCoefficients> coefficients =
+        std::make_unique<ZoniShiftedCoefficients>(Rmax, alpha_jump);
+
+    auto grid       = std::make_unique<PolarGrid>(radii, angles);
+    auto levelCache = std::make_unique<LevelCache>(*grid, *coefficients, domain_geometry, true, true);
+    Level level(0, std::move(grid), std::move(levelCache), ExtrapolationType::NONE, 0);
+
+    const int n                 = level.grid().numberOfNodes();
+    const int number_of_columns = 3;
+
+    for (const bool DirBC_Interior : {true, false}) {
+        SmootherTake smoother_op(level.grid(), level.levelCache(), domain_geometry, *coefficients, DirBC_Interior, 4);
+
+        Vector<double> x("x", number_of_columns * n);
+        Vector<double> rhs("rhs", number_of_columns * n);
+        Vector<double> temp("temp", number_of_columns * n);
+        for (int column = 0; column < number_of_columns; column++) {
+            Kokkos::deep_copy(batchColumn(x, column, n), generate_random_sample_data(level.grid(), 42 + column));
+            Kokkos::deep_copy(batchColumn(rhs, column, n), generate_random_sample_data(level.grid(), 69 + column));
+        }
+
+        Vector<double> expected("expected", number_of_columns * n);
+        Kokkos::deep_copy(expected, x);
+        Vector<double> column_temp("column_temp", n);
+        for (int column = 0; column < number_of_columns; column++) {
+            smoother_op.smoothing(batchColumn(expected, column, n), batchColumn(rhs, column, n), column_temp);
+        }
+
+        smoother_op.smoothingBatch(x, rhs, temp, number_of_columns);
+
+        for (int index = 0; index < number_of_columns * n; index++) {
+            ASSERT_EQ(x[index], expected[index]) << "entry " << index;
+        }
+    }
+}
+
+/* The lines of one color are independent, so a smoothing step doesn't depend on the number of threads. */
+TEST(SmootherTest, SmootherTakeThreadCounts)
+{
+    std::vector<double> radii  = {1e-5, 0.2, 0.25, 0.5, 0.8, 0.9, 0.95, 1.2, 1.3};
+    std::vector<double> angles = {
+        0, M_PI / 16, M_PI / 8, M_PI / 2, M_PI, M_PI + M_PI / 16, M_PI + M_PI / 8, M_PI + M_PI / 2, M_PI + M_PI};
+
+    double Rmax      = radii.back();
+    double kappa_eps = 0.3;
+    double delta_e   = 1.4;
+
+    CzarnyGeometry domain_geometry(Rmax, kappa_eps, delta_e);
+
+    double alpha_jump = 0.678 * Rmax;
+    std::unique_ptr<DensityProfileCoefficients> coefficients =
+        std::make_unique<ZoniShiftedCoefficients>(Rmax, alpha_jump);
+
+    auto grid       = std::make_unique<PolarGrid>(radii, angles);
+    auto levelCache = std::make_unique<LevelCache>(*grid, *coefficients, domain_geometry, true, true);
+    Level level(0, std::move(grid), std::move(levelCache), ExtrapolationType::NONE, 0);
+
+    const int n                 = level.grid().numberOfNodes();
+    const int number_of_columns = 2;
+
+    for (const bool DirBC_Interior : {true, false}) {
+        SmootherTake smoother_op(level.grid(), level.levelCache(), domain_geometry, *coefficients, DirBC_Interior, 1);
+        ConstVector<double> rhs = generate_random_sample_data(level.grid(), 69);
+
+        Vector<double> expected = generate_random_sample_data(level.grid(), 42);
+        Vector<double> temp("temp", n);
+        smoother_op.smoothing(expected, rhs, temp);
+
+        for (const int num_omp_threads : {2, 3, 16}) {
+            smoother_op.numOmpThreads(num_omp_threads);
+
+            Vector<double> x = generate_random_sample_data(level.grid(), 42);
+            smoother_op.smoothing(x, rhs, temp);
+            for (int index = 0; index < n; index++) {
+                ASSERT_EQ(x[index], expected[index]) << "entry " << index << ", " << num_omp_threads << " threads";
+            }
+
+            Vector<double> x_batch("x_batch", number_of_columns * n);
+            Vector<double> rhs_batch("rhs_batch", number_of_columns * n);
+            Vector<double> temp_batch("temp_batch", number_of_columns * n);
+            for (int column = 0; column < number_of_columns; column++) {
+                Kokkos::deep_copy(batchColumn(x_batch, column, n), generate_random_sample_data(level.grid(), 42));
+                Kokkos::deep_copy(batchColumn(rhs_batch, column, n), rhs);
+            }
+            smoother_op.smoothingBatch(x_batch, rhs_batch, temp_batch, number_of_columns);
+            for (int index = 0; index < number_of_columns * n; index++) {
+                ASSERT_EQ(x_batch[index], expected[index % n])
+                    << "entry " << index << ", " << num_omp_threads << " threads";
+            }
+        }
+    }
+}
@@ -0,0 +1,227 @@
+#include <gtest/gtest.h>
+
+#include <random>
+
+#include "../../include/GMGPolar/solve_context.h"
+#include "../../include/Stencil/assembledStencil.h"
+
+#include "../../include/ExtrapolatedSmoother/ExtrapolatedSmootherAssembled/extrapolatedSmootherAssembled.h"
+#include "../../include/Residual/ResidualAssembled/residualAssembled.h"
+#include "../../include/Residual/ResidualTake/residualTake.h"
+#include "../../include/Smoother/SmootherAssembled/smootherAssembled.h"
+
+namespace AssembledStencilTest
+{
+Vector<double> generate_random_sample_data(const PolarGrid& grid, unsigned int seed)
+{
+    Vector<double> x("x", grid.numberOfNodes());
+    std::mt19937 gen(seed);
+    std::uniform_real_distribution<double> dist(-100.0, 100.0);
+    for (int i = 0; i < x.size(); ++i) {
+        x(i) = dist(gen);
+    }
+    return x;
+}
+
+struct AssembledProblem {
+    const double Rmax       = 1.3;
+    const double kappa_eps  = 0.3;
+    const double delta_e    = 1.4;
+    const double alpha_jump = 0.678 * Rmax;
+
+    CzarnyGeometry domain_geometry{Rmax, kappa_eps, delta_e};
+    ZoniShiftedGyroCoefficients coefficients{Rmax, alpha_jump};
+    PolarR6_Boundary_CzarnyGeometry boundary_conditions{Rmax, kappa_eps, delta_e};
+    PolarR6_ZoniShiftedGyro_CzarnyGeometry source_term{Rmax, kappa_eps, delta_e};
+    PolarR6_CzarnyGeometry exact_solution{Rmax, kappa_eps, delta_e};
+
+    // "Take" and "Assembled" require cached values
+    Level makeLevel() const
+    {
+        auto grid       = std::make_unique<PolarGrid>(1e-5, Rmax, 5, -1, alpha_jump, 3, 1);
+        auto levelCache = std::make_unique<LevelCache>(*grid, coefficients, domain_geometry, true, true);
+        return Level(0, std::move(grid), std::move(levelCache), ExtrapolationType::NONE, false);
+    }
+};
+
+void expectNear(ConstVector<double> expected, ConstVector<double> result, const double tolerance)
+{
+    ASSERT_EQ(expected.size(), result.size());
+    for (std::size_t index = 0; index < result.size(); index++) {
+        ASSERT_NEAR(expected[index], result[index], tolerance) << "at index " << index;
+    }
+}
+
+void compareResidual(const bool DirBC_Interior, const bool symmetric)
+{
+    AssembledProblem problem;
+    Level level = problem.makeLevel();
+
+    AssembledStencil stencil(level.grid(), level.levelCache(), DirBC_Interior, symmetric, 3);
+    ResidualTake residualTake(level.grid(), level.levelCache(), problem.domain_geometry, problem.coefficients,
+                              DirBC_Interior, 3);
+    ResidualAssembled residualAssembled(level.grid(), level.levelCache(), problem.domain_geometry,
+                                        problem.coefficients, DirBC_Interior, 3, stencil);
+
+    Vector<double> x   = generate_random_sample_data(level.grid(), 42);
+    Vector<double> rhs = generate_random_sample_data(level.grid(), 69);
+
+    Vector<double> expected("expected", level.grid().numberOfNodes());
+    Vector<double> result("result", level.grid().numberOfNodes());
+    residualTake.computeResidual(expected, rhs, x);
+    residualAssembled.computeResidual(result, rhs, x);
+    expectNear(expected, result, 1e-8);
+}
+
+void compareSmoother(const bool DirBC_Interior, const bool symmetric)
+{
+    AssembledProblem problem;
+    Level level = problem.makeLevel();
+
+    AssembledStencil stencil(level.grid(), level.levelCache(), DirBC_Interior, symmetric, 2);
+    SmootherTake smootherTake(level.grid(), level.levelCache(), problem.domain_geometry, problem.coefficients,
+                              DirBC_Interior, 2);
+    SmootherAssembled smootherAssembled(level.grid(), level.levelCache(), problem.domain_geometry,
+                                        problem.coefficients, DirBC_Interior, 2, stencil);
+
+    Vector<double> rhs   = generate_random_sample_data(level.grid(), 69);
+    Vector<double> start = generate_random_sample_data(level.grid(), 24);
+    Vector<double> temp("temp", level.grid().numberOfNodes());
+
+    Vector<double> expected("expected", start.size());
+    Kokkos::deep_copy(expected, start);
+    smootherTake.smoothing(expected, rhs, temp);
+
+    Vector<double> result("result", start.size());
+    Kokkos::deep_copy(result, start);
+    smootherAssembled.smoothing(result, rhs, temp);
+    expectNear(expected, result, 1e-10);
+}
+
+void compareExtrapolatedSmoother(const bool DirBC_Interior, const bool symmetric)
+{
+    AssembledProblem problem;
+    Level level = problem.makeLevel();
+
+    AssembledStencil stencil(level.grid(), level.levelCache(), DirBC_Interior, symmetric, 2);
+    ExtrapolatedSmootherTake smootherTake(level.grid(), level.levelCache(), problem.domain_geometry,
+                                          problem.coefficients, DirBC_Interior, 2);
+    ExtrapolatedSmootherAssembled smootherAssembled(level.grid(), level.levelCache(), problem.domain_geometry,
+                                                    problem.coefficients, DirBC_Interior, 2, stencil);
+
+    Vector<double> rhs   = generate_random_sample_data(level.grid(), 69);
+    Vector<double> start = generate_random_sample_data(level.grid(), 24);
+    Vector<double> temp("temp", level.grid().numberOfNodes());
+
+    Vector<double> expected("expected", start.size());
+    Kokkos::deep_copy(expected, start);
+    smootherTake.extrapolatedSmoothing(expected, rhs, temp);
+
+    Vector<double> result("result", start.size());
+    Kokkos::deep_copy(result, start);
+    smootherAssembled.extrapolatedSmoothing(result, rhs, temp);
+    expectNear(expected, result, 1e-10);
+}
+
+void configureSolver(GMGPolar& solver, const StencilDistributionMethod stencil, const bool memory_lean)
+{
+    solver.verbose(0);
+    solver.paraview(false);
+    solver.maxOpenMPThreads(2);
+    solver.DirBC_Interior(false);
+    solver.stencilDistributionMethod(stencil);
+    solver.cacheDensityProfileCoefficients(true);
+    solver.cacheDomainGeometry(true);
+    solver.memoryLean(memory_lean);
+    solver.extrapolation(ExtrapolationType::IMPLICIT_EXTRAPOLATION);
+    solver.maxIterations(150);
+    solver.residualNormType(ResidualNormType::EUCLIDEAN);
+    solver.absoluteTolerance(1e-12);
+    solver.relativeTolerance(1e-10);
+}
+
+// The assembled operators apply the same matrix as "Take", so both solvers converge alike.
+void compareSolveWithTake(const StencilDistributionMethod stencil, const bool memory_lean)
+{
+    AssembledProblem problem;
+    const PolarGrid grid(1e-8, problem.Rmax, 5, -1, problem.alpha_jump, 3, 1);
+
+    GMGPolar take(grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(take, StencilDistributionMethod::CPU_TAKE, memory_lean);
+    take.setup();
+    take.setSolution(&problem.exact_solution);
+    take.solve(problem.boundary_conditions, problem.source_term);
+
+    GMGPolar assembled(grid, problem.domain_geometry, problem.coefficients);
+    configureSolver(assembled, stencil, memory_lean);
+    assembled.setup();
+    assembled.setSolution(&problem.exact_solution);
+    assembled.solve(problem.boundary_conditions, problem.source_term);
+
+    EXPECT_LE(std::abs(assembled.numberOfIterations() - take.numberOfIterations()), 1);
+    EXPECT_NEAR(assembled.exactErrorWeightedEuclidean().value(), take.exactErrorWeightedEuclidean().value(), 1e-10);
+
+    const MemoryReport report = assembled.memoryReport();
+    EXPECT_GT(report.levels[0].assembled_stencil, 0u);
+    // Memory-lean coarse levels do not cache the coefficients and fall back to "Give".
+    if (memory_lean)
+        EXPECT_EQ(report.levels[1].assembled_stencil, 0u);
+}
+} // namespace AssembledStencilTest
+
+using namespace AssembledStencilTest;
+
+TEST(AssembledStencilTest, SymmetricStorageMatchesFullStorage)
+{
+    AssembledProblem problem;
+    Level level = problem.makeLevel();
+    const PolarGrid& grid = level.grid();
+
+    for (const bool DirBC_Interior : {true, false}) {
+        AssembledStencil full(grid, level.levelCache(), DirBC_Interior, false, 1);
+        AssembledStencil symmetric(grid, level.levelCache(), DirBC_Interior, true, 4);
+        EXPECT_LT(symmetric.memoryUsage(), full.memoryUsage());
+
+        for (int i_r = 0; i_r < grid.nr(); i_r++) {
+            for (int i_theta = 0; i_theta < grid.ntheta(); i_theta++) {
+                for (int position = 0; position < 9; position++) {
+                    const StencilPosition stencil_position = static_cast<StencilPosition>(position);
+                    ASSERT_DOUBLE_EQ(full.coefficient(i_r, i_theta, stencil_position),
+                                     symmetric.coefficient(i_r, i_theta, stencil_position))
+                        << "at (" << i_r << ", " << i_theta << "), position " << position;
+                }
+            }
+        }
+    }
+}
+
+TEST(AssembledStencilTest, ResidualMatchesTake)
+{
+    compareResidual(true, false);
+    compareResidual(true, true);
+    compareResidual(false, false);
+    compareResidual(false, true);
+}
+
+TEST(AssembledStencilTest, SmootherMatchesTake)
+{
+    compareSmoother(true, false);
+    compareSmoother(true, true);
+    compareSmoother(false, false);
+    compareSmoother(false, true);
+}
+
+TEST(AssembledStencilTest, ExtrapolatedSmootherMatchesTake)
+{
+    compareExtrapolatedSmoother(true, false);
+    compareExtrapolatedSmoother(true, true);
+    compareExtrapolatedSmoother(false, false);
+    compareExtrapolatedSmoother(false, true);
+}
+
+TEST(AssembledStencilTest, SolveMatchesTake)
+{
+    compareSolveWithTake(StencilDistributionMethod::CPU_ASSEMBLED, false);
+    compareSolveWithTake(StencilDistributionMethod::CPU_ASSEMBLED_SYMMETRIC, false);
+    compareSolveWithTake(StencilDistributionMethod::CPU_ASSEMBLED_SYMMETRIC, true);
+}